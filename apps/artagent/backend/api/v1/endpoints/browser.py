@@ -272,6 +272,9 @@ async def browser_conversation_endpoint(
                     websocket,
                     metadata=metadata,
                 )
+                redis_mgr = getattr(websocket.app.state, "redis", None)
+                if redis_mgr:
+                    await redis_mgr.record_session_activity_async(session_id, active=True)
                 # Emit agent inventory to dashboards for this session
                 try:
                     await send_agent_inventory(websocket.app.state, session_id=session_id)
@@ -728,9 +731,12 @@ async def _cleanup_conversation(
             if conn_id:
                 await websocket.app.state.conn_manager.unregister(conn_id)
 
-            # Remove from session manager
+            # Remove from session manager and the active-session index
             if session_id:
                 await websocket.app.state.session_manager.remove_session(session_id)
+                redis_mgr = getattr(websocket.app.state, "redis", None)
+                if redis_mgr:
+                    await redis_mgr.record_session_activity_async(session_id, active=False)
 
             # Track disconnect metrics
             if hasattr(websocket.app.state, "session_metrics"):
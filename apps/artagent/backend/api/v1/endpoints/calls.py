@@ -25,11 +25,10 @@ from config import ACS_STREAMING_MODE
 from fastapi import APIRouter, HTTPException, Query, Request, status
 from fastapi.responses import JSONResponse
 from opentelemetry import trace
+from src.cosmosdb.manager import CosmosDBMongoCoreManager
 from src.enums.stream_modes import StreamMode
 from utils.ml_logging import get_logger
 
-from ..events import CallEventProcessor
-
 # V1 imports
 from ..handlers.acs_call_lifecycle import ACSLifecycleHandler
 
@@ -61,6 +60,29 @@ def _coerce_optional_bool(value: Any) -> bool | None:
     return None
 
 
+# Call listing: newest first on an indexed timestamp, capped server-side count
+_CALL_SORT_FIELD = "timestamp"
+_CALL_LIST_PROJECTION = {
+    "call_id": 1,
+    "status": 1,
+    "duration": 1,
+    "participants": 1,
+    "events": 1,
+}
+_CALL_LIST_INDEXES = (
+    [(_CALL_SORT_FIELD, -1), ("_id", -1)],
+    [("status", 1), (_CALL_SORT_FIELD, -1), ("_id", -1)],
+)
+_CALL_COUNT_CAP = 10_000
+_CALL_COUNT_TIMEOUT_MS = 500
+
+
+async def _ensure_call_list_indexes(cosmos_manager) -> None:
+    """Create the listing indexes once per manager (no-op afterwards)."""
+    for keys in _CALL_LIST_INDEXES:
+        await cosmos_manager.ensure_index_async(keys)
+
+
 def create_call_event(event_type: str, call_id: str, data: dict) -> CloudEvent:
     """
     Create a CloudEvent for call-related operations using the V1 event system.
@@ -396,6 +418,10 @@ async def list_calls(
         ],
         examples={"default": {"summary": "status filter", "value": "connected"}},
     ),
+    cursor: str | None = Query(
+        None,
+        description="next_cursor from the previous response; takes precedence over page",
+    ),
 ) -> CallListResponse:
     """
     List calls with pagination and filtering.
@@ -408,10 +434,18 @@ async def list_calls(
     :type limit: int
     :param status_filter: Filter calls by status
     :type status_filter: Optional[str]
+    :param cursor: Keyset cursor from a previous page (overrides page)
+    :type cursor: Optional[str]
     :return: Paginated list of calls with filtering results
     :rtype: CallListResponse
     :raises HTTPException: When database query fails or invalid parameters provided
     """
+    if cursor:
+        try:
+            CosmosDBMongoCoreManager.decode_page_cursor(cursor)
+        except ValueError as exc:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
     with trace_acs_operation(tracer, logger, "list_calls") as op:
         try:
             op.log_info(f"Listing calls: page {page}, limit {limit}, filter: {status_filter}")
@@ -419,25 +453,29 @@ async def list_calls(
             # Get cosmos DB manager from app state
             cosmos_manager = request.app.state.cosmos
 
-            # Build query filter
-            query_filter = {}
+            # Only call documents (those with call_id); filtering happens server-side
+            query_filter: dict[str, Any] = {"call_id": {"$exists": True}}
             if status_filter:
                 query_filter["status"] = status_filter
 
-            # Query calls from database
-            all_calls = cosmos_manager.query_documents(query_filter)
-
-            # Filter to only call documents (those with call_id field)
-            call_docs = [doc for doc in all_calls if "call_id" in doc]
-
-            # Apply pagination
-            start = (page - 1) * limit
-            end = start + limit
-            paginated_calls = call_docs[start:end]
+            await _ensure_call_list_indexes(cosmos_manager)
+            (docs, next_cursor), total = await asyncio.gather(
+                cosmos_manager.query_page_async(
+                    query_filter,
+                    sort_field=_CALL_SORT_FIELD,
+                    projection=_CALL_LIST_PROJECTION,
+                    limit=limit,
+                    skip=None if cursor else (page - 1) * limit,
+                    cursor=cursor,
+                ),
+                cosmos_manager.count_documents_async(
+                    query_filter, limit=_CALL_COUNT_CAP, max_time_ms=_CALL_COUNT_TIMEOUT_MS
+                ),
+            )
 
             # Convert database documents to response models
             calls = []
-            for doc in paginated_calls:
+            for doc in docs:
                 call_response = CallStatusResponse(
                     call_id=doc.get("call_id", doc.get("_id", "unknown")),
                     status=doc.get("status", "unknown"),
@@ -447,35 +485,13 @@ async def list_calls(
                 )
                 calls.append(call_response)
 
-            op.log_info(f"Found {len(call_docs)} total calls, returning {len(calls)}")
+            if total < 0:
+                total = (page - 1) * limit + len(calls) + (1 if next_cursor else 0)
+            op.log_info(f"Found {total} total calls, returning {len(calls)}")
 
-            # Optional: Emit event for call list operations (for monitoring/analytics)
-            if call_docs:  # Only emit if we actually found calls
-                try:
-                    event_processor = CallEventProcessor()
-                    list_event = create_call_event(
-                        event_type="CallListRequested",
-                        call_id="api-operation",  # Use generic ID for API operations
-                        data={
-                            "total_calls": len(call_docs),
-                            "returned_calls": len(calls),
-                            "page": page,
-                            "limit": limit,
-                            "status_filter": status_filter,
-                            "api_version": "v1",
-                        },
-                    )
-                    # Fire and forget - don't await to avoid adding latency
-                    import asyncio
-
-                    asyncio.create_task(
-                        event_processor.process_events([list_event], request.app.state)
-                    )
-                except Exception as e:
-                    # Log but don't fail the main operation
-                    op.log_info(f"Failed to emit list event: {e}")
-
-            return CallListResponse(calls=calls, total=len(call_docs), page=page, limit=limit)
+            return CallListResponse(
+                calls=calls, total=total, page=page, limit=limit, next_cursor=next_cursor
+            )
 
         except Exception as e:
             op.set_error(str(e))
@@ -768,47 +784,47 @@ async def handle_acs_callbacks(
         if not call_connection_id:
             call_connection_id = http_request.headers.get("x-ms-call-connection-id")
 
+        # One span per webhook: rate-limited per call, failures always traced
         with trace_acs_operation(
-            tracer, logger, "process_callbacks", call_connection_id=call_connection_id
+            tracer,
+            logger,
+            "process_callbacks",
+            call_connection_id=call_connection_id,
+            high_frequency=True,
         ) as op:
             op.log_info(
                 f"Processing ACS callbacks: {len(events_data) if isinstance(events_data, list) else 1} events"
             )
 
             # Import here to avoid circular imports
-            from azure.core.messaging import CloudEvent
-
             from ..events import get_call_event_processor, register_default_handlers
 
+            # Hand the callback to the worker serving this call's media, if another one is
+            affinity = getattr(http_request.app.state, "session_affinity", None)
+            if affinity and call_connection_id:
+                owner = await affinity.route(call_connection_id)
+                if owner and await affinity.forward(
+                    owner, call_connection_id, "acs_callback", events_data
+                ):
+                    op.log_info(f"Forwarded ACS callbacks to owning worker {owner}")
+                    return JSONResponse(
+                        {
+                            "status": "forwarded",
+                            "processed_events": 0,
+                            "failed_events": 0,
+                            "call_connection_id": call_connection_id,
+                            "forwarded_to": owner,
+                            "processing_system": "events_v1",
+                        },
+                        status_code=200,
+                    )
+
             # Ensure handlers are registered
             register_default_handlers()
 
-            # Convert to CloudEvent objects
-            cloud_events = []
-            if isinstance(events_data, list):
-                for event_item in events_data:
-                    if isinstance(event_item, dict):
-                        event_type = event_item.get("eventType") or event_item.get(
-                            "type", "Unknown"
-                        )
-                        cloud_event = CloudEvent(
-                            source="azure.communication.callautomation",
-                            type=event_type,
-                            data=event_item.get("data", event_item),
-                        )
-                        cloud_events.append(cloud_event)
-            elif isinstance(events_data, dict):
-                event_type = events_data.get("eventType") or events_data.get("type", "Unknown")
-                cloud_event = CloudEvent(
-                    source="azure.communication.callautomation",
-                    type=event_type,
-                    data=events_data.get("data", events_data),
-                )
-                cloud_events.append(cloud_event)
-
             # Process through V1 event system
             processor = get_call_event_processor()
-            result = await processor.process_events(cloud_events, http_request.app.state)
+            result = await processor.process_payload(events_data, http_request.app.state)
 
             op.log_info(f"Processed {result.get('processed', 0)} events successfully")
 
@@ -768,9 +768,11 @@ async def appconfig_status(request: Request, refresh: bool = False):
     description="""
     Force refresh the App Configuration cache.
     
-    This endpoint triggers a cache refresh to pull the latest configuration
+    This endpoint starts a background reload of the latest configuration
     values from Azure App Configuration. Use this after updating configuration
     values in App Configuration to apply changes without restarting the application.
+    Reads keep serving the current values until the reload completes; the
+    returned status reports whether it is still running.
     """,
     tags=["Health"],
 )
@@ -796,7 +798,7 @@ async def appconfig_refresh(request: Request):
             "status": "success",
             "timestamp": time.time(),
             "response_time_ms": response_time,
-            "message": "App Configuration cache refreshed",
+            "message": "App Configuration refresh started",
             "provider": status,
         }
     except Exception as e:
@@ -8,12 +8,13 @@ WebSocket Flow:
 1. Accept connection and extract call_connection_id
 2. Resolve session ID (browser session or ACS-only)
 3. Create VoiceHandler (handles STT/TTS pool acquisition)
-4. Process streaming messages
-5. Clean up resources on disconnect (handler releases pools)
+4. Claim the call for this worker (session affinity), so ACS callbacks are
+   served from the handler's live MemoManager
+5. Process streaming messages
+6. Clean up resources on disconnect (handler releases pools, call released)
 """
 
 import asyncio
-import json
 import uuid
 
 from apps.artagent.backend.src.ws_helpers.shared_ws import send_agent_inventory
@@ -29,6 +30,7 @@ from fastapi.websockets import WebSocketState
 from opentelemetry import trace
 from opentelemetry.trace import SpanKind, Status, StatusCode
 from src.enums.stream_modes import StreamMode
+from src.pools.session_affinity import SessionAffinityRegistry
 from src.pools.session_manager import SessionContext
 from src.stateful.state_managment import MemoManager
 from utils.ml_logging import get_logger
@@ -224,8 +226,11 @@ async def acs_media_stream(websocket: WebSocket) -> None:
                     conn_meta.handler = conn_meta.handler or {}
                     conn_meta.handler["media_handler"] = handler
 
+                await _claim_call(websocket, call_connection_id)
                 await handler.start()
                 await websocket.app.state.session_metrics.increment_connected()
+                if redis_mgr:
+                    await redis_mgr.record_session_activity_async(session_id, active=True)
 
             # Process media messages
             await _process_media_stream(websocket, handler, call_connection_id, stream_mode)
@@ -242,6 +247,53 @@ async def acs_media_stream(websocket: WebSocket) -> None:
             await _cleanup_websocket_resources(websocket, handler, call_connection_id, session_id)
 
 
+# ============================================================================
+# Session Affinity
+# ============================================================================
+
+
+def _call_affinity(
+    websocket: WebSocket, call_connection_id: str | None
+) -> tuple[SessionAffinityRegistry, MemoManager] | None:
+    """The affinity registry and the media handler's live memo, when both apply."""
+    affinity = getattr(websocket.app.state, "session_affinity", None)
+    # Cascade handlers expose ``memo_manager``; VoiceLive sessions ``cm``
+    memo = getattr(websocket.state, "memo_manager", None) or getattr(websocket.state, "cm", None)
+    if (
+        not call_connection_id
+        or not isinstance(affinity, SessionAffinityRegistry)
+        or not isinstance(memo, MemoManager)
+    ):
+        return None
+    return affinity, memo
+
+
+async def _claim_call(websocket: WebSocket, call_connection_id: str | None) -> None:
+    """Own the call on this worker, serving its ACS callbacks from the live memo."""
+    resolved = _call_affinity(websocket, call_connection_id)
+    if resolved is None:
+        return
+    affinity, memo = resolved
+    try:
+        # The media stream is where the call's state lives: take over any
+        # lease a previous stream (or a crashed worker) left behind
+        await affinity.claim(call_connection_id, memo, take_over=True)
+    except Exception as e:
+        logger.warning("Session affinity claim failed for %s: %s", call_connection_id, e)
+
+
+async def _release_call(websocket: WebSocket, call_connection_id: str | None) -> None:
+    """Give up the call, unless a newer stream on this worker re-claimed it."""
+    resolved = _call_affinity(websocket, call_connection_id)
+    if resolved is None:
+        return
+    affinity, memo = resolved
+    try:
+        await affinity.release(call_connection_id, memo)
+    except Exception as e:
+        logger.debug("Session affinity release failed for %s: %s", call_connection_id, e)
+
+
 # ============================================================================
 # Handler Factory
 # ============================================================================
@@ -259,6 +311,7 @@ async def _create_media_handler(
             websocket=websocket,
             session_id=session_id,
             transport=TransportType.ACS,
+            conn_id=getattr(websocket.state, "conn_id", None),
             call_connection_id=call_connection_id,
             stream_mode=stream_mode,
         )
@@ -373,14 +426,8 @@ async def _process_media_stream(
 
                 # Handle message based on streaming mode
                 if stream_mode == StreamMode.MEDIA:
-                    try:
-                        parsed_msg = json.loads(msg_text)
-                    except json.JSONDecodeError:
-                        logger.warning(
-                            f"[{call_connection_id}] Failed to parse message as JSON"
-                        )
-                        continue
-                    await handler.handle_media_message(parsed_msg)
+                    # Parsed once inside the handler; AudioData skips json.loads
+                    await handler.handle_media_text(msg_text)
                 elif stream_mode == StreamMode.TRANSCRIPTION:
                     await handler.handle_transcription_message(msg_text)
                 elif stream_mode == StreamMode.VOICE_LIVE:
@@ -468,6 +515,8 @@ async def _cleanup_websocket_resources(
                 except Exception as e:
                     logger.error("Error stopping media handler: %s", e)
 
+            await _release_call(websocket, call_connection_id)
+
             # Unregister connection
             conn_id = getattr(websocket.state, "conn_id", None)
             if conn_id:
@@ -487,6 +536,10 @@ async def _cleanup_websocket_resources(
             if hasattr(websocket.app.state, "session_metrics"):
                 await websocket.app.state.session_metrics.increment_disconnected()
 
+            redis_mgr = getattr(websocket.app.state, "redis", None)
+            if redis_mgr and session_id:
+                await redis_mgr.record_session_activity_async(session_id, active=False)
+
             span.set_status(Status(StatusCode.OK))
 
         except Exception as e:
@@ -8,12 +8,15 @@ Supports Phase 3 Dashboard Integration for the telemetry plan.
 Endpoints:
 - GET /api/v1/metrics/sessions - List active sessions with basic metrics
 - GET /api/v1/metrics/session/{session_id} - Get detailed metrics for a session
+- GET /api/v1/metrics/turn-budget - Critical-path latency budget breakdown of recent turns
 """
 
 import json
 from typing import Any
 
+from apps.artagent.backend.voice.shared.turn_profiler import get_turn_profiler
 from fastapi import APIRouter, HTTPException, Query, Request
+from src.agenticmemory.types import ChatHistory
 from utils.ml_logging import get_logger
 
 from ..schemas.metrics import (
@@ -90,7 +93,9 @@ async def _get_session_metrics_from_redis(
                 try:
                     ch_data = session_data["chat_history"]
                     if isinstance(ch_data, str):
-                        result["chat_history"] = json.loads(ch_data)
+                        result["chat_history"] = ChatHistory.threads_from_redis_fields(
+                            session_data
+                        )
                     else:
                         result["chat_history"] = ch_data
                 except (json.JSONDecodeError, TypeError) as e:
@@ -424,3 +429,23 @@ async def get_metrics_summary(
         "session_ids": list(manager_data["sessions"].keys()),
         "note": "For detailed latency analysis, use Application Insights KQL queries from TELEMETRY_PLAN.md",
     }
+
+
+@router.get(
+    "/turn-budget",
+    summary="Get turn latency budget breakdown",
+    description=(
+        "Aggregate critical-path breakdown (final transcript or VAD speech end to first "
+        "response audio) of turns completed by this instance, with turns over budget."
+    ),
+    tags=["Session Metrics"],
+)
+async def get_turn_budget() -> dict[str, Any]:
+    """
+    Get the per-segment latency budget breakdown of recent turns.
+
+    Segments are STT finalization, queue wait, turn setup, LLM TTFT and
+    streaming, tool time, TTS queueing and TTFB, and pacing to the first
+    audio frame. Values are local to this process.
+    """
+    return get_turn_profiler().breakdown()
@@ -6,11 +6,12 @@ REST API endpoints for managing and retrieving session information from Redis ca
 Provides comprehensive session history and metadata management.
 
 Endpoints:
-- GET /api/v1/sessions - List all sessions with metadata
+- GET /api/v1/sessions - List sessions with metadata (cursor-paginated, newest first)
 - GET /api/v1/sessions/{session_id} - Get detailed session information
 - DELETE /api/v1/sessions/{session_id} - Delete a specific session
 """
 
+import asyncio
 import json
 import time
 from datetime import datetime, timezone
@@ -18,6 +19,8 @@ from typing import Any, Dict, List
 
 from fastapi import APIRouter, HTTPException, Query, Request
 from pydantic import BaseModel
+from src.agenticmemory.types import ChatHistory
+from src.redis.session_index import TURN_COUNT_FIELD, SessionIndexEntry, decode_cursor
 from utils.ml_logging import get_logger
 
 logger = get_logger(__name__)
@@ -81,6 +84,7 @@ class SessionListResponse(BaseModel):
     sessions: List[SessionMetadata]
     total_count: int
     active_count: int
+    next_cursor: str | None = None  # Pass back as ?cursor= for the next page
 
 
 class SessionDetailResponse(BaseModel):
@@ -135,136 +139,27 @@ async def _get_redis_manager(request: Request):
     return redis_manager
 
 
-async def _scan_session_keys(redis_manager) -> List[str]:
-    """Scan for all session keys in Redis using pattern matching."""
-    try:
-        session_keys = []
+_session_index_backfilled = False
 
-        # First try the most reliable method: scan_iter
-        try:
-            if hasattr(redis_manager.redis_client, 'scan_iter'):
-                logger.debug("Using scan_iter method for key scanning")
-                for key in redis_manager.redis_client.scan_iter(match="session:session_*", count=100):
-                    if isinstance(key, bytes):
-                        session_keys.append(key.decode('utf-8'))
-                    elif isinstance(key, str):
-                        session_keys.append(key)
-                    else:
-                        # Handle any other format by converting to string
-                        session_keys.append(str(key))
-
-                if session_keys:
-                    logger.debug(f"scan_iter found {len(session_keys)} session keys")
-                    return session_keys
-        except Exception as scan_iter_error:
-            logger.warning(f"scan_iter failed: {scan_iter_error}")
-
-        # Fallback to manual SCAN with improved cluster handling
-        logger.debug("Falling back to manual SCAN operation")
-        cursor = 0
-        scan_attempts = 0
-        max_scan_attempts = 1000  # Prevent infinite loops
-
-        while scan_attempts < max_scan_attempts:
-            try:
-                scan_attempts += 1
-                result = redis_manager.redis_client.scan(
-                    cursor=cursor,
-                    match="session:session_*",
-                    count=100
-                )
-
-                # Handle different response formats
-                if isinstance(result, tuple) and len(result) == 2:
-                    next_cursor, keys = result
-                    # Convert cursor to int if needed
-                    try:
-                        cursor = int(next_cursor) if next_cursor is not None else 0
-                    except (ValueError, TypeError):
-                        logger.warning(f"Failed to convert cursor to int: {next_cursor}, type: {type(next_cursor)}")
-                        cursor = 0
-
-                elif isinstance(result, dict):
-                    # Handle cluster mode response
-                    next_cursor = result.get('cursor', 0)
-                    keys = result.get('keys', [])
-
-                    # Ensure cursor is an integer for Redis cluster
-                    try:
-                        cursor = int(next_cursor) if next_cursor is not None else 0
-                    except (ValueError, TypeError):
-                        logger.warning(f"Failed to convert dict cursor to int: {next_cursor}, type: {type(next_cursor)}")
-                        cursor = 0
 
-                else:
-                    logger.warning(f"Unexpected SCAN result format: {type(result)}, value: {result}")
-                    break
-
-                # Process keys with robust type handling
-                if keys:
-                    for key in keys:
-                        try:
-                            if isinstance(key, bytes):
-                                session_keys.append(key.decode('utf-8'))
-                            elif isinstance(key, str):
-                                session_keys.append(key)
-                            else:
-                                # Handle any other format by converting to string
-                                key_str = str(key)
-                                if key_str and key_str != 'None':
-                                    session_keys.append(key_str)
-                        except Exception as key_error:
-                            logger.warning(f"Failed to process key {key}: {key_error}")
-                            continue
-
-                # Check if we're done scanning
-                if cursor == 0:
-                    break
-
-            except Exception as scan_error:
-                logger.warning(f"SCAN operation attempt {scan_attempts} failed: {scan_error}")
-                # Try to continue with next cursor or break if too many failures
-                if scan_attempts > 10:
-                    break
-                cursor = cursor + 1 if cursor < 100 else 0
-
-        if session_keys:
-            logger.debug(f"Manual SCAN found {len(session_keys)} session keys")
-            return session_keys
-
-        # Last resort: KEYS command fallback (less efficient but reliable)
-        try:
-            logger.info("No keys found with SCAN, trying KEYS fallback")
-            keys_result = redis_manager.redis_client.keys("session:session_*")
-
-            if keys_result:
-                for key in keys_result:
-                    try:
-                        if isinstance(key, bytes):
-                            session_keys.append(key.decode('utf-8'))
-                        elif isinstance(key, str):
-                            session_keys.append(key)
-                        else:
-                            key_str = str(key)
-                            if key_str and key_str != 'None':
-                                session_keys.append(key_str)
-                    except Exception as key_error:
-                        logger.warning(f"Failed to process KEYS result {key}: {key_error}")
-                        continue
-
-                logger.info(f"Found {len(session_keys)} session keys using KEYS fallback")
-            else:
-                logger.info("No session keys found in Redis")
-
-        except Exception as keys_error:
-            logger.warning(f"KEYS fallback also failed: {keys_error}")
-
-        logger.debug(f"Final result: Found {len(session_keys)} session keys in Redis")
-        return session_keys
+async def _backfill_session_index(redis_manager, limit: int, active_only: bool):
+    """Index sessions persisted before the activity index existed (once per process)."""
+    global _session_index_backfilled
+    if _session_index_backfilled:
+        return None
+    _session_index_backfilled = True
+    indexed = await asyncio.to_thread(redis_manager.rebuild_session_index)
+    if not indexed:
+        return None
+    logger.info(f"Backfilled session activity index with {indexed} sessions")
+    return await redis_manager.list_sessions_page_async(limit, None, active_only)
 
-    except Exception as e:
-        logger.error(f"Failed to scan session keys: {e}")
-        return []
+
+async def _summary_fields(redis_manager, entry: SessionIndexEntry) -> Dict[str, Any]:
+    """Summary fields for a listed session; sessions not yet re-persisted need a full read."""
+    if TURN_COUNT_FIELD in entry.fields:
+        return entry.fields
+    return await redis_manager.get_session_data_async(entry.session_key) or entry.fields
 
 
 async def _parse_session_data(session_key: str, redis_data: Dict[str, Any]) -> SessionMetadata | None:
@@ -568,6 +463,15 @@ async def _parse_session_data(session_key: str, redis_data: Dict[str, Any]) -> S
             except (json.JSONDecodeError, TypeError) as e:
                 logger.warning(f"Failed to parse chat_history for {session_id}: {e}")
 
+        # Listing pages carry summary fields instead of the full chat history
+        elif "turn_count" in redis_data:
+            try:
+                metadata["turn_count"] = int(redis_data["turn_count"])
+                if redis_data.get("last_activity"):
+                    metadata["last_activity"] = float(redis_data["last_activity"])
+            except (TypeError, ValueError) as e:
+                logger.warning(f"Failed to parse summary fields for {session_id}: {e}")
+
         # Format last activity timestamp
         metadata["last_activity_readable"] = _format_timestamp(metadata["last_activity"])
 
@@ -599,66 +503,54 @@ async def list_sessions(
     request: Request,
     limit: int = Query(50, ge=1, le=200, description="Maximum number of sessions to return"),
     active_only: bool = Query(False, description="Return only active sessions"),
+    cursor: str | None = Query(None, description="next_cursor from the previous page"),
 ) -> SessionListResponse:
     """
-    List all sessions with their metadata.
+    List sessions with their metadata, most recent activity first.
 
     Returns session information including:
     - Session ID and activity timestamps
     - Custom agents and scenarios
     - Connection status and turn counts
     - User email and streaming mode if available
+
+    Sessions are read from the Redis activity index (src/redis/session_index.py),
+    so the cost is proportional to ``limit``, not to the number of stored sessions.
     """
     redis_manager = await _get_redis_manager(request)
 
+    if cursor:
+        try:
+            decode_cursor(cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
+
     try:
-        # Scan for session keys
-        session_keys = await _scan_session_keys(redis_manager)
+        page = await redis_manager.list_sessions_page_async(limit, cursor, active_only)
+        if page.total_count == 0 and not cursor:
+            page = await _backfill_session_index(redis_manager, limit, active_only) or page
 
         sessions = []
-        active_count = 0
-
-        for session_key in session_keys[:limit]:  # Apply limit during processing
+        for entry in page.entries:
             try:
-                # Get session data from Redis
-                session_data = redis_manager.get_session_data(session_key)
-
-                if not session_data:
-                    logger.debug(f"No data found for session key: {session_key}")
-                    continue
-
-                # Ensure session_data is a dictionary
-                if not isinstance(session_data, dict):
-                    logger.warning(f"Unexpected session data format for {session_key}: {type(session_data)}")
-                    continue
-
-                # Parse into metadata
-                session_metadata = await _parse_session_data(session_key, session_data)
-
+                session_data = await _summary_fields(redis_manager, entry)
+                session_metadata = await _parse_session_data(entry.session_key, session_data)
                 if session_metadata:
-                    # Count active sessions
-                    if session_metadata.connection_status == "active":
-                        active_count += 1
-
-                    # Apply active filter
-                    if active_only and session_metadata.connection_status != "active":
-                        continue
-
                     sessions.append(session_metadata)
-
             except Exception as e:
-                logger.warning(f"Failed to process session {session_key}: {e}")
+                logger.warning(f"Failed to process session {entry.session_id}: {e}")
                 continue
 
-        # Sort by last activity (most recent first)
-        sessions.sort(key=lambda s: s.last_activity, reverse=True)
-
-        logger.info(f"Retrieved {len(sessions)} sessions (active: {active_count})")
+        logger.info(
+            f"Retrieved {len(sessions)} sessions "
+            f"(indexed: {page.total_count}, active: {page.active_count})"
+        )
 
         return SessionListResponse(
             sessions=sessions,
-            total_count=len(sessions),
-            active_count=active_count,
+            total_count=page.total_count,
+            active_count=page.active_count,
+            next_cursor=page.next_cursor,
         )
 
     except Exception as e:
@@ -729,7 +621,8 @@ async def get_session_details(
             try:
                 chat_history = session_data["chat_history"]
                 if isinstance(chat_history, str):
-                    chat_history = json.loads(chat_history)
+                    # Snapshot plus any append-only log entries
+                    chat_history = ChatHistory.threads_from_redis_fields(session_data)
 
                 # Handle agent-specific chat history structure
                 if isinstance(chat_history, dict):
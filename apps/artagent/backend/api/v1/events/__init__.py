@@ -9,6 +9,7 @@ Provides clean call event handling without complex middleware.
 from .handlers import CallEventHandlers
 from .processor import (
     CallEventProcessor,
+    cloud_events_from_payload,
     get_call_event_processor,
     reset_call_event_processor,
 )
@@ -25,6 +26,7 @@ from .types import ACSEventTypes, CallEventContext
 __all__ = [
     # Core processor
     "CallEventProcessor",
+    "cloud_events_from_payload",
     "get_call_event_processor",
     "reset_call_event_processor",
     # Handlers and types
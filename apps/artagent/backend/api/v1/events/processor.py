@@ -15,6 +15,7 @@ from azure.core.messaging import CloudEvent
 from config import AZURE_STORAGE_CONTAINER_URL, ENABLE_ACS_CALL_RECORDING
 from opentelemetry import trace
 from opentelemetry.trace import SpanKind
+from src.pools.session_affinity import SessionAffinityRegistry
 from utils.ml_logging import get_logger
 
 from .types import ACSEventTypes, CallEventContext, CallEventHandler, RecordingPreferences
@@ -134,6 +135,19 @@ class CallEventProcessor:
                 "timestamp": time.time(),
             }
 
+    async def process_payload(self, events_data: Any, request_state: Any) -> dict[str, Any]:
+        """
+        Process a raw ACS webhook payload (a single event dict or a list of them).
+
+        :param events_data: Decoded JSON body of the ACS callback
+        :type events_data: Any
+        :param request_state: FastAPI request app state for dependencies
+        :type request_state: Any
+        :return: Processing result summary
+        :rtype: Dict[str, Any]
+        """
+        return await self.process_events(cloud_events_from_payload(events_data), request_state)
+
     async def _process_single_event(self, event: CloudEvent, request_state: Any) -> None:
         """
         Process a single CloudEvent.
@@ -205,9 +219,11 @@ class CallEventProcessor:
         :return: Event context for handlers
         :rtype: CallEventContext
         """
-        # Extract dependencies from request state
-        memo_manager = None
-        if hasattr(request_state, "redis") and request_state.redis:
+        # Extract dependencies from request state. On the worker owning the call,
+        # handlers share the media handler's live memo; elsewhere it is reloaded.
+        affinity = _session_affinity(request_state)
+        memo_manager = affinity.local_state(call_connection_id) if affinity else None
+        if memo_manager is None and hasattr(request_state, "redis") and request_state.redis:
             try:
                 from src.stateful.state_managment import MemoManager
 
@@ -417,6 +433,33 @@ class CallEventProcessor:
             self._recordings_started.discard(call_connection_id)
 
 
+def _session_affinity(request_state: Any) -> SessionAffinityRegistry | None:
+    """The app's affinity registry, when session affinity is enabled."""
+    affinity = getattr(request_state, "session_affinity", None)
+    return affinity if isinstance(affinity, SessionAffinityRegistry) else None
+
+
+def cloud_events_from_payload(events_data: Any) -> list[CloudEvent]:
+    """
+    Convert an ACS webhook payload into CloudEvent objects.
+
+    :param events_data: A single event dict or a list of event dicts
+    :type events_data: Any
+    :return: CloudEvents in payload order (non-dict items are skipped)
+    :rtype: List[CloudEvent]
+    """
+    items = events_data if isinstance(events_data, list) else [events_data]
+    return [
+        CloudEvent(
+            source="azure.communication.callautomation",
+            type=item.get("eventType") or item.get("type", "Unknown"),
+            data=item.get("data", item),
+        )
+        for item in items
+        if isinstance(item, dict)
+    ]
+
+
 # Global processor instance
 _global_processor: CallEventProcessor | None = None
 
@@ -38,13 +38,12 @@ from __future__ import annotations
 
 import asyncio
 import base64
-import json
 import struct
 import time
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 # Personalized greeting generation
 from apps.artagent.backend.registries.toolstore.personalized_greeting import (
@@ -77,9 +76,21 @@ from apps.artagent.backend.voice import (  # Browser barge-in controller; Speech
     send_user_transcript,
 )
 
+from apps.artagent.backend.voice.speech_cascade.acs_inbound import acs_timestamp_ms
+
 # Unified TTS Playback - single source of truth for voice synthesis
 from apps.artagent.backend.voice.tts import TTSPlayback
-from config import ACS_STREAMING_MODE, GREETING, STOP_WORDS
+from config import (
+    ACS_INBOUND_COALESCE_MS,
+    ACS_JITTER_BUFFER,
+    ACS_JITTER_MAX_DEPTH_MS,
+    ACS_JITTER_MIN_DEPTH_MS,
+    ACS_STREAMING_MODE,
+    CASCADE_VAD_BARGE_IN,
+    CASCADE_VAD_MIN_SPEECH_MS,
+    GREETING,
+    STOP_WORDS,
+)
 from fastapi import WebSocket, WebSocketDisconnect
 from fastapi.websockets import WebSocketState
 from opentelemetry import trace
@@ -87,8 +98,13 @@ from opentelemetry.trace import SpanKind, Status, StatusCode
 from src.enums.stream_modes import StreamMode
 from src.pools.session_manager import SessionContext
 from src.stateful.state_managment import MemoManager
+from utils import json_codec
 from utils.ml_logging import get_logger
 
+if TYPE_CHECKING:
+    from apps.artagent.backend.voice.speech_cascade.jitter_buffer import InboundJitterBuffer
+    from apps.artagent.backend.voice.speech_cascade.vad import StreamingVAD
+
 logger = get_logger("api.v1.handlers.media_handler")
 tracer = trace.get_tracer(__name__)
 
@@ -231,6 +247,9 @@ class MediaHandler:
 
         # Speech cascade
         self.speech_cascade: SpeechCascadeHandler | None = None
+        self._jitter_buffer: InboundJitterBuffer | None = (
+            self._create_jitter_buffer() if self._transport == TransportType.ACS else None
+        )
         self._greeting_text: str = ""
         self._greeting_queued = False
 
@@ -404,6 +423,7 @@ class MediaHandler:
             on_user_transcript=handler._on_user_transcript,
             on_tts_request=handler._on_tts_request,
             redis_mgr=redis_mgr,
+            vad=handler._create_barge_in_vad(),
         )
 
         # Expose speech_cascade on websocket.state for orchestrator TTS callbacks
@@ -661,6 +681,38 @@ class MediaHandler:
     # Speech Cascade Callbacks - Barge-In
     # =========================================================================
 
+    def _create_barge_in_vad(self) -> StreamingVAD | None:
+        """Create the local barge-in VAD for the speech cascade (None when disabled)."""
+        if not CASCADE_VAD_BARGE_IN:
+            return None
+        from apps.artagent.backend.voice.speech_cascade.vad import StreamingVAD
+
+        def playback_active() -> bool:
+            return self._tts_playback is not None and self._tts_playback.is_playing
+
+        return StreamingVAD(
+            playback_active=playback_active, min_speech_ms=CASCADE_VAD_MIN_SPEECH_MS
+        )
+
+    def _create_jitter_buffer(self) -> InboundJitterBuffer | None:
+        """Create the ACS inbound jitter buffer (None when disabled)."""
+        if not ACS_JITTER_BUFFER:
+            return None
+        from apps.artagent.backend.voice.speech_cascade.jitter_buffer import (
+            InboundJitterBuffer,
+        )
+
+        def write_audio(pcm: bytes) -> None:
+            if self.speech_cascade:
+                self.speech_cascade.write_audio(pcm)
+
+        return InboundJitterBuffer(
+            write_audio,
+            release_ms=ACS_INBOUND_COALESCE_MS,
+            min_depth_ms=ACS_JITTER_MIN_DEPTH_MS,
+            max_depth_ms=ACS_JITTER_MAX_DEPTH_MS,
+        )
+
     async def _on_barge_in(self) -> None:
         """
         Handle barge-in interruption.
@@ -779,7 +831,7 @@ class MediaHandler:
 
         try:
             stop_audio = {"Kind": "StopAudio", "AudioData": None, "StopAudio": {}}
-            await ws.send_text(json.dumps(stop_audio))
+            await ws.send_text(json_codec.dumps(stop_audio))
             logger.debug("[%s] StopAudio sent to ACS", self._session_short)
             return True
         except Exception as e:
@@ -1140,10 +1192,10 @@ class MediaHandler:
             return
 
         try:
-            data = json.loads(raw_message)
+            data = json_codec.loads(raw_message)
             if not isinstance(data, dict):
                 return
-        except json.JSONDecodeError:
+        except json_codec.JSONDecodeError:
             return
 
         kind = data.get("kind")
@@ -1176,6 +1228,9 @@ class MediaHandler:
     def _handle_audio_data(self, data: dict[str, Any]) -> None:
         """Handle ACS AudioData."""
         section = data.get("audioData") or data.get("AudioData") or {}
+        if self._jitter_buffer is not None:
+            self._buffer_audio_data(section)
+            return
         if section.get("silent", True):
             return
 
@@ -1189,6 +1244,22 @@ class MediaHandler:
         except Exception as e:
             logger.error("[%s] Audio decode error: %s", self._session_short, e)
 
+    def _buffer_audio_data(self, section: dict[str, Any]) -> None:
+        """Queue ACS AudioData (silent frames included) in the jitter buffer by timestamp."""
+        b64 = section.get("data")
+        if not b64:
+            return
+        silent = bool(section.get("silent", False))
+        if not silent:
+            self._touch_activity()
+
+        try:
+            pcm = base64.b64decode(b64)
+        except Exception as e:
+            logger.error("[%s] Audio decode error: %s", self._session_short, e)
+            return
+        self._jitter_buffer.push(acs_timestamp_ms(section.get("timestamp")), pcm, silent)
+
     def _handle_dtmf(self, data: dict[str, Any]) -> None:
         """Handle ACS DTMF."""
         section = data.get("dtmfData") or data.get("DtmfData") or {}
@@ -1302,6 +1373,17 @@ class MediaHandler:
                 self._running = False
                 await self._cancel_idle_monitor()
 
+                if self._jitter_buffer is not None:
+                    try:
+                        self._jitter_buffer.close()
+                        logger.info(
+                            "[%s] ACS jitter buffer: %s",
+                            self._session_short,
+                            self._jitter_buffer.stats.to_dict(),
+                        )
+                    except Exception as e:
+                        logger.debug("[%s] Jitter buffer flush error: %s", self._session_short, e)
+
                 if self.speech_cascade:
                     try:
                         await self.speech_cascade.stop()
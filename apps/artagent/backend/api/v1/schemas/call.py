@@ -271,7 +271,7 @@ class CallListResponse(BaseModel):
     calls: list[CallStatusResponse] = Field(..., description="List of calls")
     total: int = Field(
         ...,
-        description="Total number of calls matching criteria",
+        description="Total number of calls matching criteria (capped for large collections)",
         json_schema_extra={"example": 25},
     )
     page: int = Field(1, description="Current page number (1-based)", example=1)
@@ -283,6 +283,10 @@ class CallListResponse(BaseModel):
     limit: int = Field(
         10, description="Number of items per page", json_schema_extra={"example": 10}
     )
+    next_cursor: str | None = Field(
+        None,
+        description="Opaque cursor for the next page (None on the last page)",
+    )
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -35,12 +35,14 @@ from .appconfig_provider import (  # Initialization; Core functions; Status and
     get_appconfig_status,  # Alias
     get_config_float,
     get_config_int,
+    get_config_snapshot,
     get_config_value,
     get_feature_flag,
     get_provider_status,
     initialize_appconfig,  # Alias for bootstrap_appconfig
     refresh_appconfig_cache,  # Alias
     refresh_cache,
+    subscribe_config_changes,
 )
 
 # =============================================================================
@@ -66,7 +68,11 @@ from .settings import (  # Azure Communication Services; Security; Azure Identit
     ACS_AUDIENCE,
     ACS_CONNECTION_STRING,
     ACS_ENDPOINT,
+    ACS_INBOUND_COALESCE_MS,
     ACS_ISSUER,
+    ACS_JITTER_BUFFER,
+    ACS_JITTER_MAX_DEPTH_MS,
+    ACS_JITTER_MIN_DEPTH_MS,
     ACS_JWKS_URL,
     ACS_SOURCE_PHONE_NUMBER,
     ACS_STREAMING_MODE,
@@ -92,6 +98,10 @@ from .settings import (  # Azure Communication Services; Security; Azure Identit
     AZURE_VOICE_LIVE_MODEL,
     BACKEND_AUTH_CLIENT_ID,
     BASE_URL,
+    CASCADE_SPECULATION_STABLE_MS,
+    CASCADE_SPECULATIVE_LLM,
+    CASCADE_VAD_BARGE_IN,
+    CASCADE_VAD_MIN_SPEECH_MS,
     CONNECTION_CRITICAL_THRESHOLD,
     CONNECTION_QUEUE_SIZE,
     CONNECTION_TIMEOUT_SECONDS,
@@ -131,6 +141,8 @@ from .settings import (  # Azure Communication Services; Security; Azure Identit
     RECOGNIZED_LANGUAGE,
     REDOC_URL,
     SECURE_DOCS_URL,
+    SESSION_AFFINITY_ENABLED,
+    SESSION_AFFINITY_LEASE_S,
     SESSION_CLEANUP_INTERVAL,
     SESSION_STATE_TTL,
     SESSION_TTL_SECONDS,
@@ -140,14 +152,20 @@ from .settings import (  # Azure Communication Services; Security; Azure Identit
     TTS_PROCESSING_TIMEOUT,
     TTS_SAMPLE_RATE_ACS,
     TTS_SAMPLE_RATE_UI,
+    UI_COALESCED_EVENTS,
+    UI_ENVELOPE_FRAME_MS,
     VAD_SEMANTIC_SEGMENTATION,
     WARM_POOL_BACKGROUND_REFRESH,
     WARM_POOL_ENABLED,
+    WARM_POOL_IDLE_EVICT_SEC,
+    WARM_POOL_MAX_CONCURRENT_WARMUPS,
     WARM_POOL_MAX_RETRIES,
     WARM_POOL_REFRESH_INTERVAL,
     WARM_POOL_RESTART_ON_FAILURE,
     WARM_POOL_SESSION_MAX_AGE,
+    WARM_POOL_STT_MAX_SIZE,
     WARM_POOL_STT_SIZE,
+    WARM_POOL_TTS_MAX_SIZE,
     WARM_POOL_TTS_SIZE,
     WARM_POOL_WARMUP_TIMEOUT,
     validate_app_settings,  # Backward compat alias
@@ -215,6 +233,8 @@ __all__ = [
     "get_config_int",
     "get_config_float",
     "get_feature_flag",
+    "get_config_snapshot",
+    "subscribe_config_changes",
     "refresh_cache",
     "refresh_appconfig_cache",
     "get_provider_status",
@@ -23,13 +23,23 @@ Architecture:
     1. On startup, uses azure-appconfiguration-provider's load() to fetch all config
     2. Syncs fetched values to environment variables for compatibility
     3. Falls back to environment variables if App Config unavailable
+    4. Reads are served lock-free from an immutable snapshot. A snapshot older
+       than AZURE_APPCONFIG_REFRESH_INTERVAL seconds (or refresh_cache()) starts
+       a background reload; reads keep the stale snapshot until the new one is
+       swapped in (stale-while-revalidate). Failed reloads back off.
+    5. Subscribers registered with subscribe_config_changes() are told which
+       keys changed after each swap.
 """
 
 import logging
 import os
 import sys
 import threading
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 logger = logging.getLogger(__name__)
@@ -48,9 +58,34 @@ APPCONFIG_ENDPOINT = os.getenv("AZURE_APPCONFIG_ENDPOINT", "")
 APPCONFIG_LABEL = os.getenv("AZURE_APPCONFIG_LABEL", os.getenv("ENVIRONMENT", "dev"))
 APPCONFIG_ENABLED = bool(APPCONFIG_ENDPOINT)
 
-# Global configuration dictionary (loaded from App Config)
-_config: dict[str, Any] | None = None
+# Seconds before a loaded snapshot is revalidated in the background (0 disables)
+APPCONFIG_REFRESH_INTERVAL_S = float(os.getenv("AZURE_APPCONFIG_REFRESH_INTERVAL", "300"))
+# Backoff between failed background reloads: 15 s doubling up to 10 minutes
+_REFRESH_BACKOFF_BASE_S = 15.0
+_REFRESH_BACKOFF_MAX_S = 600.0
+
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """One App Configuration load; replaced as a whole, never mutated."""
+
+    values: Mapping[str, Any]
+    version: int
+    loaded_at: float  # time.monotonic()
+
+
+ConfigListener = Callable[[frozenset[str], ConfigSnapshot], None]
+
+# Current snapshot (loaded from App Config); reads take a reference, no lock
+_snapshot: ConfigSnapshot | None = None
+# Serializes snapshot swaps and refresh bookkeeping; never held by reads or during I/O
 _config_lock = threading.Lock()
+_refresh_thread: threading.Thread | None = None
+_retry_at = 0.0
+_consecutive_failures = 0
+_last_refresh_error: str | None = None
+# Copy-on-write so notification iterates without the lock
+_listeners: tuple[ConfigListener, ...] = ()
 
 _dotenv_local_keys_cache: set[str] | None = None
 
@@ -216,15 +251,86 @@ FEATURE_FLAG_MAP: dict[str, str] = {
 # ==============================================================================
 
 
+def _get_credential():
+    """Managed identity when AZURE_CLIENT_ID is set, otherwise the default chain."""
+    from azure.identity import DefaultAzureCredential, ManagedIdentityCredential
+
+    azure_client_id = os.getenv("AZURE_CLIENT_ID")
+    if azure_client_id:
+        return ManagedIdentityCredential(client_id=azure_client_id)
+    return DefaultAzureCredential()
+
+
+def _fetch_appconfig() -> dict[str, Any]:
+    """Load every setting for APPCONFIG_LABEL in one call (raises on failure)."""
+    from azure.appconfiguration.provider import SettingSelector, load
+
+    credential = _get_credential()
+    config = load(
+        endpoint=APPCONFIG_ENDPOINT,
+        credential=credential,
+        selects=[SettingSelector(key_filter="*", label_filter=APPCONFIG_LABEL)],
+        keyvault_credential=credential,
+        replica_discovery_enabled=False,  # Avoid DNS SRV lookup issues
+    )
+    return dict(config)
+
+
+_MISSING = object()
+
+
+def _publish(values: dict[str, Any]) -> ConfigSnapshot:
+    """Swap in a new snapshot and notify subscribers of the keys that changed."""
+    global _snapshot, _consecutive_failures, _last_refresh_error
+    with _config_lock:
+        previous = _snapshot
+        snapshot = ConfigSnapshot(
+            values=MappingProxyType(dict(values)),
+            version=previous.version + 1 if previous else 1,
+            loaded_at=time.monotonic(),
+        )
+        _snapshot = snapshot
+        _consecutive_failures = 0
+        _last_refresh_error = None
+
+    old = previous.values if previous else {}
+    changed = frozenset(
+        key
+        for key in old.keys() | snapshot.values.keys()
+        if old.get(key, _MISSING) != snapshot.values.get(key, _MISSING)
+    )
+    if changed:
+        for listener in _listeners:
+            try:
+                listener(changed, snapshot)
+            except Exception as e:
+                logger.warning(f"App Config change listener failed: {e}")
+    return snapshot
+
+
+def _record_failure(error: Exception) -> float:
+    """Back off further reloads after a failure; returns the delay in seconds."""
+    global _retry_at, _consecutive_failures, _last_refresh_error
+    with _config_lock:
+        _consecutive_failures += 1
+        delay = min(
+            _REFRESH_BACKOFF_BASE_S * 2 ** (_consecutive_failures - 1), _REFRESH_BACKOFF_MAX_S
+        )
+        _retry_at = time.monotonic() + delay
+        _last_refresh_error = str(error)
+    return delay
+
+
 def _load_config_from_appconfig() -> dict[str, Any] | None:
     """
     Load all configuration from Azure App Configuration using the provider package.
 
+    Retries with exponential backoff (no lock is held while loading or waiting)
+    and publishes the result as the current snapshot.
+
     Returns:
         Dictionary of all configuration values, or None if loading fails
     """
-    global _config
-
     if not APPCONFIG_ENABLED:
         return None
 
@@ -234,40 +340,21 @@ def _load_config_from_appconfig() -> dict[str, Any] | None:
         return None
 
     try:
-        from azure.appconfiguration.provider import SettingSelector, load
-        from azure.identity import DefaultAzureCredential, ManagedIdentityCredential
-
-        # Choose credential based on AZURE_CLIENT_ID
-        azure_client_id = os.getenv("AZURE_CLIENT_ID")
-        if azure_client_id:
-            credential = ManagedIdentityCredential(client_id=azure_client_id)
-        else:
-            credential = DefaultAzureCredential()
-
         # Load with retry (exponential backoff)
-        import time
         last_error = None
 
         for attempt in range(1, 4):
             try:
-                config = load(
-                    endpoint=APPCONFIG_ENDPOINT,
-                    credential=credential,
-                    selects=[SettingSelector(key_filter="*", label_filter=APPCONFIG_LABEL)],
-                    keyvault_credential=credential,
-                    replica_discovery_enabled=False,  # Avoid DNS SRV lookup issues
-                )
-
-                config_dict = dict(config)
-
-                with _config_lock:
-                    _config = config_dict
+                config_dict = _fetch_appconfig()
+                _publish(config_dict)
                 return config_dict
 
+            except ImportError:
+                raise
             except Exception as e:
                 last_error = e
                 if attempt < 3:
-                    time.sleep(2 ** attempt)  # 2, 4 seconds
+                    time.sleep(2**attempt)  # 2, 4 seconds
 
         raise last_error
 
@@ -275,10 +362,56 @@ def _load_config_from_appconfig() -> dict[str, Any] | None:
         _log("❌ azure-appconfiguration-provider not installed")
         return None
     except Exception as e:
+        _record_failure(e)
         _log(f"❌ App Config load failed: {e}")
         return None
 
 
+def _refresh_worker() -> None:
+    """Background reload: one attempt, then back off on failure."""
+    global _refresh_thread
+    try:
+        snapshot = _publish(_fetch_appconfig())
+        logger.info(f"App Configuration refreshed (version {snapshot.version})")
+    except Exception as e:
+        delay = _record_failure(e)
+        logger.warning(f"App Configuration refresh failed, retrying in {delay:.0f}s: {e}")
+    finally:
+        with _config_lock:
+            _refresh_thread = None
+
+
+def _start_refresh(force: bool = False) -> bool:
+    """Start a background reload unless one is running (or, unless forced, backing off)."""
+    global _refresh_thread
+    if not APPCONFIG_ENABLED:
+        return False
+    with _config_lock:
+        if _refresh_thread is not None:
+            return False
+        if not force and time.monotonic() < _retry_at:
+            return False
+        thread = _refresh_thread = threading.Thread(
+            target=_refresh_worker, name="appconfig-refresh", daemon=True
+        )
+    thread.start()
+    return True
+
+
+def _current_snapshot() -> ConfigSnapshot | None:
+    """The snapshot reads are served from; starts a revalidation when it is stale."""
+    snapshot = _snapshot
+    if APPCONFIG_ENABLED and _refresh_thread is None:
+        now = time.monotonic()
+        stale = snapshot is None or (
+            APPCONFIG_REFRESH_INTERVAL_S > 0
+            and now - snapshot.loaded_at > APPCONFIG_REFRESH_INTERVAL_S
+        )
+        if stale and now >= _retry_at:
+            _start_refresh()
+    return snapshot
+
+
 def sync_appconfig_to_env(config_dict: dict[str, Any] | None = None) -> dict[str, str]:
     """
     Sync App Configuration values to environment variables.
@@ -290,8 +423,8 @@ def sync_appconfig_to_env(config_dict: dict[str, Any] | None = None) -> dict[str
         Dict of synced key-value pairs (env_var_name -> value)
     """
     if config_dict is None:
-        with _config_lock:
-            config_dict = _config
+        snapshot = _snapshot
+        config_dict = snapshot.values if snapshot else None
 
     if not config_dict:
         return {}
@@ -370,10 +503,10 @@ def get_config_value(
         env_var_name = APPCONFIG_KEY_MAP.get(appconfig_key)
 
     # Check loaded config first
-    with _config_lock:
-        config_loaded = _config is not None
-        if _config and appconfig_key in _config:
-            return str(_config[appconfig_key])
+    snapshot = _current_snapshot()
+    config_loaded = snapshot is not None
+    if snapshot and appconfig_key in snapshot.values:
+        return str(snapshot.values[appconfig_key])
 
     # Fall back to environment variable
     if env_var_name:
@@ -417,13 +550,13 @@ def get_feature_flag(
     feature_key = f".appconfig.featureflag/{name}"
 
     # Check loaded config
-    with _config_lock:
-        config_loaded = _config is not None
-        if _config and feature_key in _config:
-            flag_data = _config[feature_key]
-            if isinstance(flag_data, dict):
-                return flag_data.get("enabled", default)
-            return bool(flag_data)
+    snapshot = _current_snapshot()
+    config_loaded = snapshot is not None
+    if snapshot and feature_key in snapshot.values:
+        flag_data = snapshot.values[feature_key]
+        if isinstance(flag_data, dict):
+            return flag_data.get("enabled", default)
+        return bool(flag_data)
 
     # Fall back to environment variable
     if env_var_name:
@@ -477,25 +610,67 @@ def get_provider_status() -> dict[str, Any]:
     Returns:
         Dict with status information
     """
-    with _config_lock:
-        config_loaded = _config is not None
-        config_count = len(_config) if _config else 0
+    snapshot = _snapshot
 
     return {
         "enabled": APPCONFIG_ENABLED,
         "endpoint": APPCONFIG_ENDPOINT if APPCONFIG_ENABLED else None,
         "label": APPCONFIG_LABEL,
-        "loaded": config_loaded,
-        "key_count": config_count,
+        "loaded": snapshot is not None,
+        "key_count": len(snapshot.values) if snapshot else 0,
+        "version": snapshot.version if snapshot else 0,
+        "age_seconds": round(time.monotonic() - snapshot.loaded_at, 1) if snapshot else None,
+        "refresh_interval_seconds": APPCONFIG_REFRESH_INTERVAL_S,
+        "refreshing": _refresh_thread is not None,
+        "consecutive_failures": _consecutive_failures,
+        "last_refresh_error": _last_refresh_error,
     }
 
 
-def refresh_cache() -> None:
-    """Clear the configuration and force reload."""
-    global _config
+def get_config_snapshot() -> ConfigSnapshot | None:
+    """Current snapshot, for reading several keys from the same load."""
+    return _current_snapshot()
+
+
+def subscribe_config_changes(listener: ConfigListener) -> Callable[[], None]:
+    """
+    Call ``listener(changed_keys, snapshot)`` after each load that changes values.
+
+    Listeners run on the refresh thread; hand work to an event loop with
+    ``loop.call_soon_threadsafe``. Returns a function that unsubscribes.
+    """
+    global _listeners
     with _config_lock:
-        _config = None
-    logger.info("App Configuration cleared")
+        _listeners = (*_listeners, listener)
+
+    def unsubscribe() -> None:
+        global _listeners
+        with _config_lock:
+            _listeners = tuple(item for item in _listeners if item is not listener)
+
+    return unsubscribe
+
+
+def refresh_cache(wait_seconds: float | None = None) -> bool:
+    """
+    Reload the configuration in the background (stale-while-revalidate).
+
+    Reads keep returning the current snapshot until the reload completes.
+    Backoff from earlier failures is bypassed; a reload already in flight is reused.
+
+    Args:
+        wait_seconds: Optionally wait this long for the reload to finish.
+
+    Returns:
+        True if a reload is running or was started.
+    """
+    started = _start_refresh(force=True)
+    thread = _refresh_thread
+    if thread is not None and wait_seconds:
+        thread.join(wait_seconds)
+    if started:
+        logger.info("App Configuration refresh started")
+    return started or thread is not None
 
 
 # ==============================================================================
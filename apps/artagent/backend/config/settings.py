@@ -225,6 +225,18 @@ VAD_SEMANTIC_SEGMENTATION: bool = _env_bool("VAD_SEMANTIC_SEGMENTATION", False)
 SILENCE_DURATION_MS: int = _env_int("SILENCE_DURATION_MS", 1300)
 AUDIO_FORMAT: str = os.getenv("AUDIO_FORMAT", "pcm")
 STT_PROCESSING_TIMEOUT: float = _env_float("STT_PROCESSING_TIMEOUT", 10.0)
+# ACS inbound audio is pushed to the recognizer in windows of this size (20 = every frame)
+ACS_INBOUND_COALESCE_MS: int = _env_int("ACS_INBOUND_COALESCE_MS", 40)
+# ACS inbound audio: reorder by timestamp and release at a steady cadence (adaptive depth)
+ACS_JITTER_BUFFER: bool = _env_bool("ACS_JITTER_BUFFER", False)
+ACS_JITTER_MIN_DEPTH_MS: int = _env_int("ACS_JITTER_MIN_DEPTH_MS", 40)
+ACS_JITTER_MAX_DEPTH_MS: int = _env_int("ACS_JITTER_MAX_DEPTH_MS", 200)
+# Cascade: start the LLM request once the partial transcript is stable for this long
+CASCADE_SPECULATIVE_LLM: bool = _env_bool("CASCADE_SPECULATIVE_LLM", False)
+CASCADE_SPECULATION_STABLE_MS: int = _env_int("CASCADE_SPECULATION_STABLE_MS", 300)
+# Cascade: barge in on local VAD speech onset instead of waiting for the first partial
+CASCADE_VAD_BARGE_IN: bool = _env_bool("CASCADE_VAD_BARGE_IN", False)
+CASCADE_VAD_MIN_SPEECH_MS: int = _env_int("CASCADE_VAD_MIN_SPEECH_MS", 120)
 RECOGNIZED_LANGUAGE: list[str] = _env_list(
     "RECOGNIZED_LANGUAGE", "en-US,es-ES,fr-FR,ko-KR,it-IT,pt-PT,pt-BR"
 )
@@ -238,6 +250,11 @@ RECOGNIZED_LANGUAGE: list[str] = _env_list(
 MAX_WEBSOCKET_CONNECTIONS: int = _env_int("MAX_WEBSOCKET_CONNECTIONS", 200)
 CONNECTION_QUEUE_SIZE: int = _env_int("CONNECTION_QUEUE_SIZE", 50)
 ENABLE_CONNECTION_LIMITS: bool = _env_bool("ENABLE_CONNECTION_LIMITS", True)
+# UI envelopes with these event labels are sent at most once per frame per session (0 = off)
+UI_ENVELOPE_FRAME_MS: int = _env_int("UI_ENVELOPE_FRAME_MS", 150)
+UI_COALESCED_EVENTS: list[str] = _env_list(
+    "UI_COALESCED_EVENTS", "user_transcript_partial,voicelive_session_updated"
+)
 
 # Connection thresholds
 CONNECTION_WARNING_THRESHOLD: int = _env_int("CONNECTION_WARNING_THRESHOLD", 150)
@@ -251,6 +268,9 @@ SESSION_CLEANUP_INTERVAL: int = _env_int("SESSION_CLEANUP_INTERVAL", 300)
 MAX_CONCURRENT_SESSIONS: int = _env_int("MAX_CONCURRENT_SESSIONS", 1000)
 ENABLE_SESSION_PERSISTENCE: bool = _env_bool("ENABLE_SESSION_PERSISTENCE", True)
 SESSION_STATE_TTL: int = _env_int("SESSION_STATE_TTL", 86400)
+# Pin each call to one worker via Redis leases; other workers forward its callbacks
+SESSION_AFFINITY_ENABLED: bool = _env_bool("SESSION_AFFINITY_ENABLED", False)
+SESSION_AFFINITY_LEASE_S: int = _env_int("SESSION_AFFINITY_LEASE_S", 30)
 
 # Speech service pools
 POOL_SIZE_TTS: int = _env_int("POOL_SIZE_TTS", 50)
@@ -269,6 +289,11 @@ WARM_POOL_SESSION_MAX_AGE: float = _env_float("WARM_POOL_SESSION_MAX_AGE", 1800.
 WARM_POOL_RESTART_ON_FAILURE: bool = _env_bool("WARM_POOL_RESTART_ON_FAILURE", False)  # Changed to False for graceful degradation
 WARM_POOL_WARMUP_TIMEOUT: float = _env_float("WARM_POOL_WARMUP_TIMEOUT", 10.0)
 WARM_POOL_MAX_RETRIES: int = _env_int("WARM_POOL_MAX_RETRIES", 2)
+# Autoscaling: warm targets float between *_SIZE and *_MAX_SIZE with call arrivals
+WARM_POOL_TTS_MAX_SIZE: int = _env_int("WARM_POOL_TTS_MAX_SIZE", 10)
+WARM_POOL_STT_MAX_SIZE: int = _env_int("WARM_POOL_STT_MAX_SIZE", 8)
+WARM_POOL_MAX_CONCURRENT_WARMUPS: int = _env_int("WARM_POOL_MAX_CONCURRENT_WARMUPS", 4)
+WARM_POOL_IDLE_EVICT_SEC: float = _env_float("WARM_POOL_IDLE_EVICT_SEC", 300.0)
 
 
 # ==============================================================================
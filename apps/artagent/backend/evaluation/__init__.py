@@ -88,6 +88,7 @@ from apps.artagent.backend.evaluation.scenario_runner import (
     ComparisonRunner,
     ScenarioRunner,
 )
+from apps.artagent.backend.evaluation.scheduler import EvaluationScheduler
 from apps.artagent.backend.evaluation.schemas import (
     EvalModelConfig,
     EvidenceBlob,
@@ -111,6 +112,7 @@ __all__ = [
     # Scenario runners
     "ScenarioRunner",
     "ComparisonRunner",
+    "EvaluationScheduler",
     # Mocks
     "MockMemoManager",
     "MockOrchestratorContext",
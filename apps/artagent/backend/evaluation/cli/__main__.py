@@ -178,6 +178,7 @@ def cmd_compare(args: argparse.Namespace) -> int:
         runner = ComparisonRunner(
             comparison_path=args.input,
             output_dir=args.output,
+            max_concurrency=args.max_concurrency,
         )
 
         # Run comparison (async)
@@ -296,6 +297,12 @@ def main():
         type=Path,
         help="Output directory (default: runs/)",
     )
+    compare_parser.add_argument(
+        "--max-concurrency",
+        "-j",
+        type=int,
+        help="Variants to run at once (default: all, 1 = serial)",
+    )
     compare_parser.set_defaults(func=cmd_compare)
 
     # Parse and execute
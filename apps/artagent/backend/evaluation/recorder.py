@@ -13,9 +13,11 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
 import subprocess
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from apps.artagent.backend.evaluation.schemas import (
     EvalModelConfig,
@@ -29,6 +31,24 @@ from utils.ml_logging import get_logger
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _git_commit_sha() -> Optional[str]:
+    """Short SHA of HEAD, resolved once per process (runs share it)."""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            timeout=2,
+            check=False,
+        )
+        if result.returncode == 0:
+            return result.stdout.strip()[:12]  # Short SHA
+    except Exception:
+        pass
+    return None
+
+
 class EventRecorder:
     """
     Records orchestration events to JSONL.
@@ -65,19 +85,7 @@ class EventRecorder:
 
     def _get_git_commit_sha(self) -> Optional[str]:
         """Get current git commit SHA for versioning."""
-        try:
-            result = subprocess.run(
-                ["git", "rev-parse", "HEAD"],
-                capture_output=True,
-                text=True,
-                timeout=2,
-                check=False,
-            )
-            if result.returncode == 0:
-                return result.stdout.strip()[:12]  # Short SHA
-        except Exception:
-            pass
-        return None
+        return _git_commit_sha()
 
     def record_turn_start(
         self,
@@ -329,5 +337,39 @@ class EventRecorder:
 
         return events
 
+    @staticmethod
+    def merge_shards(shard_paths: Iterable[Path], output_path: Path) -> int:
+        """
+        Merge per-run JSONL shards into one events file.
+
+        Shards are concatenated in the order given, each already in turn
+        order, so the result does not depend on which run finished first.
+        Missing shards (runs that recorded nothing) are skipped.
+
+        Args:
+            shard_paths: Shard files, in submission order
+            output_path: Merged events.jsonl to write
+
+        Returns:
+            Number of events written
+        """
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = output_path.with_name(output_path.name + ".tmp")
+        count = 0
+
+        with open(tmp_path, "w") as out:
+            for shard_path in shard_paths:
+                if not shard_path.exists():
+                    continue
+                with open(shard_path) as f:
+                    for line in f:
+                        if line.strip():
+                            out.write(line if line.endswith("\n") else line + "\n")
+                            count += 1
+
+        os.replace(tmp_path, output_path)
+        logger.info(f"Merged {count} events into {output_path}")
+        return count
+
 
 __all__ = ["EventRecorder"]
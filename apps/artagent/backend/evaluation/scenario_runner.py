@@ -9,11 +9,15 @@ Design principles:
 - Delegates to existing components (EventRecorder, Wrapper, Scorer)
 - No duplication of orchestrator logic
 - Supports both single scenarios and A/B comparisons
+- Turns within a scenario run in order; variants run concurrently
+  (see EvaluationScheduler)
 """
 
 from __future__ import annotations
 
 import time
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager, nullcontext
 from pathlib import Path
 from typing import Any
 
@@ -21,6 +25,7 @@ import yaml
 
 from apps.artagent.backend.evaluation.mocks import MockMemoManager, build_context
 from apps.artagent.backend.evaluation.recorder import EventRecorder
+from apps.artagent.backend.evaluation.scheduler import EvaluationScheduler
 from apps.artagent.backend.evaluation.schemas import RunSummary
 from apps.artagent.backend.evaluation.scorer import MetricsScorer
 from apps.artagent.backend.evaluation.wrappers import EvaluationOrchestratorWrapper
@@ -45,6 +50,9 @@ class ScenarioRunner:
         self,
         scenario_path: Path,
         output_dir: Path | None = None,
+        orchestrator_factory: Callable[[str, dict[str, Any] | None], Any] | None = None,
+        run_id: str | None = None,
+        turn_gate: Callable[[str], AbstractAsyncContextManager[None]] | None = None,
     ):
         """
         Initialize scenario runner.
@@ -52,11 +60,19 @@ class ScenarioRunner:
         Args:
             scenario_path: Path to YAML scenario file
             output_dir: Output directory for results (default: runs/)
+            orchestrator_factory: Builds the orchestrator from (agent_name, model_override)
+            run_id: Run identifier (default: <scenario_name>_<unix time>)
+            turn_gate: Returns a context manager held around each turn, keyed by
+                model deployment (set by EvaluationScheduler for rate limits)
         """
         self.scenario_path = scenario_path
         self.scenario = self._load_scenario(scenario_path)
         self.output_dir = output_dir or Path("runs")
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.orchestrator_factory = orchestrator_factory or self._create_orchestrator
+        self.run_id = run_id
+        self.turn_gate = turn_gate
+        self.events_path: Path | None = None
 
     def _load_scenario(self, path: Path) -> dict[str, Any]:
         """Load and validate scenario YAML."""
@@ -105,6 +121,16 @@ class ScenarioRunner:
             "This requires integration with the agent registry and orchestrator."
         )
 
+    def model_key(self) -> str:
+        """Model deployment the scenario's turns run against (for per-model limits)."""
+        override = self.scenario.get("model_override") or {}
+        return (
+            override.get("deployment_id")
+            or override.get("model_name")
+            or self.scenario.get("agent")
+            or "unknown"
+        )
+
     async def run(self) -> RunSummary:
         """
         Run the scenario and return summary.
@@ -123,19 +149,22 @@ class ScenarioRunner:
         memo_manager = MockMemoManager(session_id, context_vars)
 
         # Create recorder
-        run_id = f"{scenario_name}_{int(time.time())}"
+        run_id = self.run_id or f"{scenario_name}_{int(time.time())}"
         recorder = EventRecorder(run_id=run_id, output_dir=self.output_dir)
+        self.events_path = recorder.output_path
 
         # Create orchestrator (wrapped for recording)
         # NOTE: This will be implemented when we integrate with real orchestrator
         model_override = self.scenario.get("model_override")
-        orchestrator = self._create_orchestrator(agent_name, model_override)
+        orchestrator = self.orchestrator_factory(agent_name, model_override)
         eval_orchestrator = EvaluationOrchestratorWrapper(
             orchestrator=orchestrator,
             recorder=recorder,
         )
 
-        # Run turns
+        model_key = self.model_key()
+
+        # Run turns (in order - each turn sees the previous turns' history)
         for turn_data in self.scenario["turns"]:
             turn_id = turn_data["turn_id"]
             user_input = turn_data["user_input"]
@@ -155,7 +184,8 @@ class ScenarioRunner:
             )
 
             # Run turn (this will be recorded automatically)
-            result = await eval_orchestrator.process_turn(context)
+            async with self.turn_gate(model_key) if self.turn_gate else nullcontext():
+                result = await eval_orchestrator.process_turn(context)
 
             # Update conversation history
             memo_manager.append_to_history(agent_name, "user", user_input)
@@ -165,7 +195,7 @@ class ScenarioRunner:
 
         # Score the results
         scorer = MetricsScorer()
-        events = scorer.load_events(self.output_dir / f"{run_id}_events.jsonl")
+        events = scorer.load_events(self.events_path)
 
         summary = scorer.generate_summary(
             events,
@@ -189,12 +219,17 @@ class ComparisonRunner:
     Runs A/B comparison scenarios.
 
     Handles scenarios with multiple variants (e.g., comparing GPT-4o vs o1).
+    Variants run concurrently; each variant's turns stay in order.
     """
 
     def __init__(
         self,
         comparison_path: Path,
         output_dir: Path | None = None,
+        orchestrator_factory: Callable[[str, dict[str, Any] | None], Any] | None = None,
+        max_concurrency: int | None = None,
+        model_limits: dict[str, int] | None = None,
+        model_rpm: dict[str, float] | None = None,
     ):
         """
         Initialize comparison runner.
@@ -202,10 +237,18 @@ class ComparisonRunner:
         Args:
             comparison_path: Path to comparison YAML file
             output_dir: Output directory for results
+            orchestrator_factory: Builds the orchestrator from (agent_name, model_override)
+            max_concurrency: Variants in flight at once (default: all; 1 = serial)
+            model_limits: Max turns in flight per model deployment
+            model_rpm: Max turns started per minute per model deployment
         """
         self.comparison_path = comparison_path
         self.comparison = self._load_comparison(comparison_path)
         self.output_dir = output_dir or Path("runs")
+        self.orchestrator_factory = orchestrator_factory
+        self.max_concurrency = max_concurrency
+        self.model_limits = model_limits
+        self.model_rpm = model_rpm
 
     def _load_comparison(self, path: Path) -> dict[str, Any]:
         """Load and validate comparison YAML."""
@@ -241,12 +284,11 @@ class ComparisonRunner:
         comparison_dir = self.output_dir / comparison_name
         comparison_dir.mkdir(parents=True, exist_ok=True)
 
-        results = {}
+        runners: dict[str, ScenarioRunner] = {}
 
-        # Run each variant
+        # Build a runner per variant
         for variant in self.comparison["variants"]:
             variant_id = variant["variant_id"]
-            logger.info(f"Running variant: {variant_id}")
 
             # Build scenario for this variant
             scenario = {
@@ -262,16 +304,19 @@ class ComparisonRunner:
             with open(scenario_path, "w") as f:
                 yaml.dump(scenario, f)
 
-            # Run scenario
-            runner = ScenarioRunner(
+            runners[variant_id] = ScenarioRunner(
                 scenario_path=scenario_path,
                 output_dir=comparison_dir / variant_id,
+                orchestrator_factory=self.orchestrator_factory,
             )
 
-            summary = await runner.run()
-            results[variant_id] = summary
-
-            logger.info(f"Variant {variant_id} complete")
+        # Run variants concurrently; shards merge in variant order
+        scheduler = EvaluationScheduler(
+            max_concurrency=self.max_concurrency or len(runners),
+            model_limits=self.model_limits,
+            model_rpm=self.model_rpm,
+        )
+        results = await scheduler.run(runners, merged_path=comparison_dir / "events.jsonl")
 
         # Compare results
         logger.info("Comparing variants...")
@@ -0,0 +1,165 @@
+"""
+Evaluation Scheduler
+====================
+
+Runs independent scenario runs concurrently.
+
+A scenario run is one conversation: its turns stay strictly ordered, since
+every turn is built from the history of the previous ones. Separate
+scenarios and A/B variants share nothing, so a sweep of N variants x M
+scenarios can take about as long as its longest conversation instead of the
+sum of every LLM round-trip.
+
+Limits:
+- max_concurrency: scenario runs (conversations) in flight at once
+- model_limits: turns in flight per model deployment
+- model_rpm: turns started per minute per model deployment
+
+Every run records to its own JSONL shard (one EventRecorder per run).
+Shards are merged in submission order, so the merged events file has the
+same turns, in the same order, as the equivalent serial sweep.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Mapping
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from apps.artagent.backend.evaluation.recorder import EventRecorder
+from utils.ml_logging import get_logger
+
+if TYPE_CHECKING:
+    from apps.artagent.backend.evaluation.scenario_runner import ScenarioRunner
+    from apps.artagent.backend.evaluation.schemas import RunSummary
+
+logger = get_logger(__name__)
+
+
+class _ModelGate:
+    """In-flight and start-rate limits for one model deployment."""
+
+    def __init__(self, concurrency: int | None, rpm: float | None):
+        self._semaphore = asyncio.Semaphore(concurrency) if concurrency else None
+        self._interval = 60.0 / rpm if rpm else 0.0
+        self._next_start = 0.0
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        if self._semaphore is not None:
+            await self._semaphore.acquire()
+        try:
+            if self._interval:
+                # Reserve the next start time before sleeping so waiters queue in order
+                now = time.monotonic()
+                start = max(now, self._next_start)
+                self._next_start = start + self._interval
+                if start > now:
+                    await asyncio.sleep(start - now)
+            yield
+        finally:
+            if self._semaphore is not None:
+                self._semaphore.release()
+
+
+class EvaluationScheduler:
+    """
+    Runs ScenarioRunners concurrently under a global cap and per-model limits.
+
+    Usage:
+        scheduler = EvaluationScheduler(max_concurrency=8, model_limits={"gpt-4o": 4})
+        summaries = await scheduler.run(
+            {"fraud_gpt4o": runner_a, "fraud_o3": runner_b},
+            merged_path=Path("runs/sweep_events.jsonl"),
+        )
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 4,
+        model_limits: dict[str, int] | None = None,
+        model_rpm: dict[str, float] | None = None,
+        default_model_limit: int | None = None,
+    ):
+        """
+        Initialize scheduler.
+
+        Args:
+            max_concurrency: Scenario runs in flight at once (1 = serial)
+            model_limits: Max turns in flight per model deployment
+            model_rpm: Max turns started per minute per model deployment
+            default_model_limit: Turns in flight for models not in model_limits
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        self.max_concurrency = max_concurrency
+        self.model_limits = dict(model_limits or {})
+        self.model_rpm = dict(model_rpm or {})
+        self.default_model_limit = default_model_limit
+        self._gates: dict[str, _ModelGate] = {}
+
+    def turn_slot(self, model: str) -> AbstractAsyncContextManager[None]:
+        """Context manager held around one turn against ``model``."""
+        gate = self._gates.get(model)
+        if gate is None:
+            gate = self._gates[model] = _ModelGate(
+                self.model_limits.get(model, self.default_model_limit),
+                self.model_rpm.get(model),
+            )
+        return gate.slot()
+
+    async def run(
+        self,
+        runners: Mapping[str, ScenarioRunner],
+        merged_path: Path | None = None,
+    ) -> dict[str, RunSummary]:
+        """
+        Run every scenario runner and return summaries in submission order.
+
+        Args:
+            runners: Dict mapping run key (e.g. variant_id) -> ScenarioRunner
+            merged_path: Optional path for the merged events JSONL
+
+        Returns:
+            Dict mapping run key -> RunSummary, in the order of ``runners``
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run_one(key: str, runner: ScenarioRunner) -> RunSummary:
+            async with semaphore:
+                logger.info(f"Running {key}")
+                summary = await runner.run()
+                logger.info(f"{key} complete")
+                return summary
+
+        for runner in runners.values():
+            if runner.turn_gate is None:
+                runner.turn_gate = self.turn_slot
+
+        tasks = [
+            asyncio.create_task(run_one(key, runner), name=f"eval:{key}")
+            for key, runner in runners.items()
+        ]
+        try:
+            summaries = await asyncio.gather(*tasks)
+        except BaseException:
+            # Same as a serial sweep: the first failure stops the sweep
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        if merged_path is not None:
+            EventRecorder.merge_shards(
+                [runner.events_path for runner in runners.values()],
+                merged_path,
+            )
+
+        return dict(zip(runners, summaries, strict=True))
+
+
+__all__ = ["EvaluationScheduler"]
@@ -585,6 +585,48 @@ class MetricsScorer:
         logger.info(f"Loaded {len(events)} events from {events_path}")
         return events
 
+    def load_shards(self, shard_paths: List[Path]) -> List[TurnEvent]:
+        """
+        Load events from per-run JSONL shards (see EventRecorder.merge_shards).
+
+        Shards are read in the order given, so aggregating over them matches
+        scoring the merged events file.
+
+        Args:
+            shard_paths: Shard files, in submission order
+
+        Returns:
+            List of TurnEvent objects across all shards
+        """
+        events: List[TurnEvent] = []
+        for shard_path in shard_paths:
+            if shard_path.exists():
+                events.extend(self.load_events(shard_path))
+        return events
+
+    def aggregate_shards(
+        self,
+        shard_paths: List[Path],
+        scenario_name: Optional[str] = None,
+        expectations: Optional[Dict[str, Any]] = None,
+    ) -> RunSummary:
+        """
+        Generate one summary across several runs (e.g. a scenario sweep per model).
+
+        Args:
+            shard_paths: Shard files, in submission order
+            scenario_name: Optional name for the aggregate
+            expectations: Optional scenario expectations dict
+
+        Returns:
+            RunSummary over every turn in every shard
+        """
+        return self.generate_summary(
+            self.load_shards(shard_paths),
+            scenario_name=scenario_name,
+            expectations=expectations,
+        )
+
     # =========================================================================
     # COMPARISON UTILITIES
     # =========================================================================
@@ -99,7 +99,9 @@ class EvaluationOrchestratorWrapper:
             OrchestratorResult from real orchestrator (unchanged)
         """
         turn_start = time.perf_counter()
-        turn_id = context.metadata.get("run_id", f"turn_{int(time.time())}")
+        turn_id = getattr(context, "turn_id", None) or context.metadata.get(
+            "run_id", f"turn_{int(time.time())}"
+        )
 
         # Get active agent from orchestrator
         active_agent = getattr(self._orchestrator, "_active_agent", None) or "unknown"
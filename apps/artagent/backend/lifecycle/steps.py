@@ -31,7 +31,9 @@ def register_core_state_step(manager: LifecycleManager, app: FastAPI) -> None:
     """Register the core state initialization step."""
     from apps.artagent.backend.config import AppConfig
     from apps.artagent.backend.src.services import AzureRedisManager
+    from config import SESSION_AFFINITY_ENABLED, SESSION_AFFINITY_LEASE_S
     from src.pools.connection_manager import ThreadSafeConnectionManager
+    from src.pools.session_affinity import SessionAffinityRegistry
     from src.pools.session_manager import ThreadSafeSessionManager
     from src.pools.session_metrics import ThreadSafeSessionMetrics
 
@@ -68,7 +70,19 @@ def register_core_state_step(manager: LifecycleManager, app: FastAPI) -> None:
         app.state.session_metrics = ThreadSafeSessionMetrics()
         app.state.greeted_call_ids = set()
 
+        # Optional call ownership across workers (callbacks forwarded to the owner)
+        app.state.session_affinity = None
+        if SESSION_AFFINITY_ENABLED:
+            app.state.session_affinity = SessionAffinityRegistry(
+                app.state.redis,
+                node_id=app.state.conn_manager._node_id,
+                lease_ttl_s=SESSION_AFFINITY_LEASE_S,
+            )
+            await app.state.session_affinity.start()
+
     async def stop() -> None:
+        if getattr(app.state, "session_affinity", None):
+            await app.state.session_affinity.stop()
         if hasattr(app.state, "conn_manager"):
             await app.state.conn_manager.stop()
 
@@ -96,11 +110,15 @@ def register_speech_pools_step(manager: LifecycleManager, app: FastAPI) -> None:
             VAD_SEMANTIC_SEGMENTATION,
             WARM_POOL_BACKGROUND_REFRESH,
             WARM_POOL_ENABLED,
+            WARM_POOL_IDLE_EVICT_SEC,
+            WARM_POOL_MAX_CONCURRENT_WARMUPS,
             WARM_POOL_MAX_RETRIES,
             WARM_POOL_REFRESH_INTERVAL,
             WARM_POOL_RESTART_ON_FAILURE,
             WARM_POOL_SESSION_MAX_AGE,
+            WARM_POOL_STT_MAX_SIZE,
             WARM_POOL_STT_SIZE,
+            WARM_POOL_TTS_MAX_SIZE,
             WARM_POOL_TTS_SIZE,
             WARM_POOL_WARMUP_TIMEOUT,
         )
@@ -155,6 +173,9 @@ def register_speech_pools_step(manager: LifecycleManager, app: FastAPI) -> None:
             warm_fn=warm_stt if pool_enabled else None,
             warmup_timeout_sec=WARM_POOL_WARMUP_TIMEOUT,
             max_warmup_retries=WARM_POOL_MAX_RETRIES,
+            max_warm_size=WARM_POOL_STT_MAX_SIZE if pool_enabled else 0,
+            max_concurrent_warmups=WARM_POOL_MAX_CONCURRENT_WARMUPS,
+            idle_evict_sec=WARM_POOL_IDLE_EVICT_SEC,
         )
 
         app.state.tts_pool = WarmableResourcePool(
@@ -168,6 +189,9 @@ def register_speech_pools_step(manager: LifecycleManager, app: FastAPI) -> None:
             warm_fn=warm_tts if pool_enabled else None,
             warmup_timeout_sec=WARM_POOL_WARMUP_TIMEOUT,
             max_warmup_retries=WARM_POOL_MAX_RETRIES,
+            max_warm_size=WARM_POOL_TTS_MAX_SIZE if pool_enabled else 0,
+            max_concurrent_warmups=WARM_POOL_MAX_CONCURRENT_WARMUPS,
+            idle_evict_sec=WARM_POOL_IDLE_EVICT_SEC,
         )
 
         # Prepare pools in parallel
@@ -228,7 +252,12 @@ def register_aoai_step(manager: LifecycleManager, app: FastAPI) -> None:
         app.state.aoai_client_manager = aoai_manager
         app.state.aoai_client = await aoai_manager.get_client()
 
-    manager.add_step("aoai", start)
+    async def stop() -> None:
+        from src.aoai.client import close_async_client
+
+        await close_async_client()
+
+    manager.add_step("aoai", start, stop)
 
 
 # ============================================================================
@@ -308,6 +337,7 @@ def register_external_services_step(manager: LifecycleManager, app: FastAPI) ->
     )
     from apps.artagent.backend.src.services import CosmosDBMongoCoreManager
     from apps.artagent.backend.src.services.acs.acs_caller import initialize_acs_caller_instance
+    from src.acs.notification_dispatcher import get_notification_dispatcher
     from src.speech.phrase_list_manager import (
         PhraseListManager,
         load_default_phrases_from_env,
@@ -325,6 +355,10 @@ def register_external_services_step(manager: LifecycleManager, app: FastAPI) ->
         # Initialize ACS caller
         app.state.acs_caller = initialize_acs_caller_instance()
 
+        # Start the shared email / SMS dispatcher on the application loop
+        app.state.notification_dispatcher = get_notification_dispatcher()
+        await app.state.notification_dispatcher.start()
+
         # Initialize phrase manager for speech recognition bias
         initial_bias = load_default_phrases_from_env()
         app.state.speech_phrase_manager = PhraseListManager(initial_phrases=initial_bias)
@@ -333,7 +367,11 @@ def register_external_services_step(manager: LifecycleManager, app: FastAPI) ->
         # Hydrate phrase list from Cosmos (non-blocking)
         await _hydrate_phrases_from_cosmos(app)
 
-    manager.add_step("services", start)
+    async def stop() -> None:
+        if hasattr(app.state, "notification_dispatcher"):
+            await app.state.notification_dispatcher.shutdown()
+
+    manager.add_step("services", start, stop)
 
 
 async def _hydrate_phrases_from_cosmos(app: FastAPI) -> None:
@@ -433,6 +471,7 @@ def register_agents_step(manager: LifecycleManager, app: FastAPI) -> None:
 
 def register_event_handlers_step(manager: LifecycleManager, app: FastAPI) -> None:
     """Register the event handler initialization step."""
+    from apps.artagent.backend.api.v1.events.processor import get_call_event_processor
     from apps.artagent.backend.api.v1.events.registration import register_default_handlers
     from apps.artagent.backend.registries.toolstore.registry import (
         initialize_tools as initialize_unified_tools,
@@ -451,4 +490,14 @@ def register_event_handlers_step(manager: LifecycleManager, app: FastAPI) -> Non
         except Exception as exc:
             logger.debug(f"Event handler registration skipped: {exc}")
 
+        # Process ACS callbacks forwarded by workers that do not own the call
+        affinity = getattr(app.state, "session_affinity", None)
+        if affinity:
+            processor = get_call_event_processor()
+
+            async def process_forwarded_callback(call_connection_id: str, events_data) -> None:
+                await processor.process_payload(events_data, app.state)
+
+            affinity.register_handler("acs_callback", process_forwarded_callback)
+
     manager.add_step("events", start)
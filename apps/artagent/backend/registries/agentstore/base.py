@@ -504,12 +504,18 @@ class UnifiedAgent:
         self._load_custom_tools()
         return get_tool_executor(tool_name)
 
-    async def execute_tool(self, tool_name: str, args: dict[str, Any]) -> dict[str, Any]:
-        """Execute a tool by name with the given arguments."""
+    async def execute_tool(
+        self, tool_name: str, args: dict[str, Any], *, session_id: str | None = None
+    ) -> dict[str, Any]:
+        """
+        Execute a tool by name with the given arguments.
+
+        Pass ``session_id`` to reuse cached results of cacheable tools within the session.
+        """
         from apps.artagent.backend.registries.toolstore import execute_tool, initialize_tools
 
         initialize_tools()
-        return await execute_tool(tool_name, args)
+        return await execute_tool(tool_name, args, session_id=session_id)
 
     # ═══════════════════════════════════════════════════════════════════
     # PROMPT RENDERING
@@ -44,6 +44,10 @@ from apps.artagent.backend.registries.toolstore.registry import (  # Types; Core
     list_tools,
     register_tool,
 )
+from apps.artagent.backend.registries.toolstore.result_cache import (
+    ToolCacheStats,
+    get_tool_result_cache,
+)
 
 __all__ = [
     # Core registration
@@ -56,6 +60,9 @@ __all__ = [
     "get_tools_for_agent",
     "execute_tool",
     "initialize_tools",
+    # Per-session result cache
+    "get_tool_result_cache",
+    "ToolCacheStats",
     # Types
     "ToolDefinition",
     "ToolExecutor",
@@ -38,9 +38,11 @@ except Exception:  # pragma: no cover - handled at runtime
 # Email service for sending card agreements
 try:
     from src.acs.email_service import send_email as send_email_async, is_email_configured
+    from src.acs.notification_dispatcher import NotificationPriority
 except ImportError:
     send_email_async = None
     is_email_configured = lambda: False
+    NotificationPriority = None
 
 # Redis for MFA code storage
 try:
@@ -929,7 +931,10 @@ Contoso Bank
     email_error = None
     if send_email_async and is_email_configured():
         try:
-            result = await send_email_async(email, subject, plain_text_body, html_body)
+            # The caller is waiting on the line for this code: send it ahead of confirmations
+            result = await send_email_async(
+                email, subject, plain_text_body, html_body, priority=NotificationPriority.HIGH
+            )
             email_sent = result.get("success", False)
             if not email_sent:
                 email_error = result.get("error")
@@ -1418,13 +1423,18 @@ async def evaluate_card_eligibility(args: dict[str, Any]) -> dict[str, Any]:
 # ═══════════════════════════════════════════════════════════════════════════════
 
 register_tool(
-    "get_user_profile", get_user_profile_schema, get_user_profile, tags={"banking", "profile"}
+    "get_user_profile",
+    get_user_profile_schema,
+    get_user_profile,
+    tags={"banking", "profile"},
+    cache_ttl=300,
 )
 register_tool(
     "get_account_summary",
     get_account_summary_schema,
     get_account_summary,
     tags={"banking", "account"},
+    cache_ttl=120,
 )
 register_tool(
     "get_recent_transactions",
@@ -1439,7 +1449,11 @@ register_tool(
     tags={"banking", "cards"},
 )
 register_tool(
-    "get_card_details", get_card_details_schema, get_card_details, tags={"banking", "cards"}
+    "get_card_details",
+    get_card_details_schema,
+    get_card_details,
+    tags={"banking", "cards"},
+    cache_ttl=600,
 )
 register_tool("refund_fee", refund_fee_schema, refund_fee, tags={"banking", "fees"})
 register_tool(
@@ -433,7 +433,11 @@ async def apply_account_restriction(args: dict[str, Any]) -> dict[str, Any]:
 # ═══════════════════════════════════════════════════════════════════════════════
 
 register_tool(
-    "get_client_data", get_client_data_schema, get_client_data, tags={"compliance", "data"}
+    "get_client_data",
+    get_client_data_schema,
+    get_client_data,
+    tags={"compliance", "data"},
+    cache_ttl=120,
 )
 register_tool(
     "check_compliance_status",
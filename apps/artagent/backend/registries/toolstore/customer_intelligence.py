@@ -142,6 +142,7 @@ register_tool(
     executor=_execute_customer_intelligence,
     is_handoff=False,
     tags={"banking", "customer_data", "personalization"},
+    cache_ttl=300,
 )
 
 
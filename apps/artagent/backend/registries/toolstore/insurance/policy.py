@@ -830,6 +830,7 @@ register_tool(
     schema=get_policy_details_schema,
     executor=get_policy_details,
     tags={"scenario": "insurance", "category": "policy"},
+    cache_ttl=300,
 )
 
 register_tool(
@@ -837,6 +838,7 @@ register_tool(
     schema=list_user_policies_schema,
     executor=list_user_policies,
     tags={"scenario": "insurance", "category": "policy"},
+    cache_ttl=300,
 )
 
 register_tool(
@@ -844,6 +846,7 @@ register_tool(
     schema=check_coverage_schema,
     executor=check_coverage,
     tags={"scenario": "insurance", "category": "policy"},
+    cache_ttl=300,
 )
 
 register_tool(
@@ -851,4 +854,5 @@ register_tool(
     schema=get_claims_summary_schema,
     executor=get_claims_summary,
     tags={"scenario": "insurance", "category": "policy"},
+    cache_ttl=120,
 )
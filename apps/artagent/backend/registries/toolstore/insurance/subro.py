@@ -1653,6 +1653,7 @@ register_tool(
     schema=get_claim_summary_schema,
     executor=get_claim_summary,
     tags={"scenario": "insurance", "category": "subro"},
+    cache_ttl=300,
 )
 
 register_tool(
@@ -1660,6 +1661,7 @@ register_tool(
     schema=get_subro_demand_status_schema,
     executor=get_subro_demand_status,
     tags={"scenario": "insurance", "category": "subro"},
+    cache_ttl=60,
 )
 
 register_tool(
@@ -1667,6 +1669,7 @@ register_tool(
     schema=get_coverage_status_schema,
     executor=get_coverage_status,
     tags={"scenario": "insurance", "category": "subro"},
+    cache_ttl=300,
 )
 
 register_tool(
@@ -1674,6 +1677,7 @@ register_tool(
     schema=get_liability_decision_schema,
     executor=get_liability_decision,
     tags={"scenario": "insurance", "category": "subro"},
+    cache_ttl=60,
 )
 
 register_tool(
@@ -1681,6 +1685,7 @@ register_tool(
     schema=get_pd_policy_limits_schema,
     executor=get_pd_policy_limits,
     tags={"scenario": "insurance", "category": "subro"},
+    cache_ttl=300,
 )
 
 register_tool(
@@ -1688,6 +1693,7 @@ register_tool(
     schema=get_pd_payments_schema,
     executor=get_pd_payments,
     tags={"scenario": "insurance", "category": "subro"},
+    cache_ttl=60,
 )
 
 register_tool(
@@ -1730,6 +1736,7 @@ register_tool(
     schema=get_subro_contact_info_schema,
     executor=get_subro_contact_info,
     tags={"scenario": "insurance", "category": "subro"},
+    cache_ttl=300,
 )
 
 register_tool(
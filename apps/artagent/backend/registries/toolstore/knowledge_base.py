@@ -3,14 +3,18 @@ Knowledge Base & RAG Search Tools
 ==================================
 
 Vector search and knowledge retrieval tools for agent use.
-Integrates with Cosmos DB for vector search (RAG pattern).
+Integrates with Cosmos DB for vector search (RAG pattern), then an in-process
+local vector index, then keyword matching as a last resort.
 """
 
 from __future__ import annotations
 
+import os
+import threading
 from typing import Any
 
 from apps.artagent.backend.registries.toolstore.registry import register_tool
+from apps.artagent.backend.registries.toolstore.vector_index import LocalVectorIndex
 from utils.ml_logging import get_logger
 
 logger = get_logger("agents.tools.knowledge_base")
@@ -54,6 +58,11 @@ search_knowledge_base_schema: dict[str, Any] = {
 # ═══════════════════════════════════════════════════════════════════════════════
 
 _retriever_cache: dict[str, Any] = {}
+_local_index: LocalVectorIndex | None = None
+_local_index_lock = threading.Lock()
+
+# Hash embeddings give small non-zero scores to unrelated text; ignore those.
+_LOCAL_MIN_SCORE = 0.1
 
 
 def _get_retriever(collection: str = "general"):
@@ -64,8 +73,7 @@ def _get_retriever(collection: str = "general"):
         return _retriever_cache[cache_key]
 
     try:
-        # Import the shared RAG retrieval module
-        from apps.artagent.backend.src.agents.shared.rag_retrieval import (
+        from apps.artagent.backend.registries.toolstore.rag_retrieval import (
             CosmosVectorRetriever,
         )
 
@@ -84,6 +92,50 @@ def _get_retriever(collection: str = "general"):
         return None
 
 
+def _get_local_index() -> LocalVectorIndex | None:
+    """
+    Get the process-wide local vector index.
+
+    Opens the persisted index at ``KB_VECTOR_INDEX_PATH`` when set, otherwise
+    builds a small in-memory index from the mock knowledge base on first use.
+    """
+    global _local_index
+
+    if _local_index is not None:
+        return _local_index
+
+    with _local_index_lock:
+        if _local_index is not None:
+            return _local_index
+        try:
+            index_path = os.getenv("KB_VECTOR_INDEX_PATH")
+            if index_path and os.path.isdir(index_path):
+                _local_index = LocalVectorIndex.open(index_path)
+                logger.info(
+                    "Loaded local vector index from %s (%d chunks)", index_path, len(_local_index)
+                )
+            else:
+                _local_index = _build_index_from_mock_kb()
+        except Exception as e:
+            logger.warning("Failed to initialize local vector index: %s", e)
+            return None
+    return _local_index
+
+
+def _build_index_from_mock_kb() -> LocalVectorIndex:
+    """Index the bundled mock knowledge base, tagging each doc with its collection."""
+    texts: list[str] = []
+    metadata: list[dict[str, Any]] = []
+    for collection, docs in _MOCK_KB.items():
+        for doc in docs:
+            texts.append(f"{doc['title']}. {doc['content']}")
+            metadata.append({"collection": collection, "title": doc["title"], "url": doc["url"]})
+
+    index = LocalVectorIndex(initial_capacity=max(len(texts), 1))
+    index.add(texts, metadata=metadata)
+    return index
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # MOCK KNOWLEDGE BASE (fallback when Cosmos not available)
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -215,17 +267,51 @@ async def search_knowledge_base(args: dict[str, Any]) -> dict[str, Any]:
                     }
                 )
 
-            logger.info("✓ Found %d results from Cosmos vector search", len(formatted_results))
+            if formatted_results:
+                logger.info("✓ Found %d results from Cosmos vector search", len(formatted_results))
 
-            return {
-                "success": True,
-                "message": f"Found {len(formatted_results)} relevant results.",
-                "results": formatted_results,
-                "source": "cosmos_vector",
-            }
+                return {
+                    "success": True,
+                    "message": f"Found {len(formatted_results)} relevant results.",
+                    "results": formatted_results,
+                    "source": "cosmos_vector",
+                }
+
+        except Exception as e:
+            logger.warning("Cosmos search failed, falling back to local index: %s", e)
 
+    # Then the in-process vector index
+    index = _get_local_index()
+
+    if index is not None:
+        try:
+            hits = index.search_text(
+                query,
+                top_k=top_k,
+                filters={"collection": collection},
+                min_score=_LOCAL_MIN_SCORE,
+            )
+            if hits:
+                local_results = [
+                    {
+                        "title": hit.record.metadata.get("title", "Document"),
+                        "content": hit.record.content[:500],
+                        "url": hit.record.metadata.get("url"),
+                        "score": round(hit.score, 4),
+                    }
+                    for hit in hits
+                ]
+
+                logger.info("✓ Found %d results from local vector index", len(local_results))
+
+                return {
+                    "success": True,
+                    "message": f"Found {len(local_results)} relevant results.",
+                    "results": local_results,
+                    "source": "local_vector",
+                }
         except Exception as e:
-            logger.warning("Cosmos search failed, falling back to mock: %s", e)
+            logger.warning("Local vector search failed, falling back to mock: %s", e)
 
     # Fallback to mock search
     results = _mock_search(query, collection, top_k)
@@ -6,13 +6,20 @@ Lightweight placeholder that mirrors the staging RAG retrieval API without
 pulling in legacy vlagent/artagent dependencies. If Cosmos configuration is
 missing, the retriever will simply return no results, allowing callers to
 fall back to their own mock logic.
+
+``LocalVectorRetriever`` exposes the same ``search`` interface on top of the
+in-process :class:`~.vector_index.LocalVectorIndex`, so agents get real
+top-k retrieval without any network hop.
 """
 
 from __future__ import annotations
 
 import os
+from collections.abc import Mapping
 from dataclasses import dataclass
+from typing import Any
 
+from apps.artagent.backend.registries.toolstore.vector_index import LocalVectorIndex
 from utils.ml_logging import get_logger
 
 logger = get_logger("agents.shared.rag_retrieval")
@@ -70,4 +77,61 @@ class CosmosVectorRetriever:
         return []
 
 
-__all__ = ["CosmosVectorRetriever", "RetrievalResult"]
+class LocalVectorRetriever:
+    """Retriever backed by an in-process memory-mapped vector index."""
+
+    def __init__(
+        self,
+        index: LocalVectorIndex,
+        *,
+        collection: str | None = None,
+        min_score: float | None = None,
+    ) -> None:
+        self.index = index
+        self.collection = collection
+        self.min_score = min_score
+
+    @classmethod
+    def from_path(
+        cls,
+        path: str | os.PathLike[str],
+        *,
+        collection: str | None = None,
+        min_score: float | None = None,
+    ) -> LocalVectorRetriever:
+        """Open a persisted index directory."""
+        return cls(LocalVectorIndex.open(path), collection=collection, min_score=min_score)
+
+    def search(
+        self,
+        query: str,
+        *,
+        top_k: int = 5,
+        filters: Mapping[str, Any] | None = None,
+    ) -> list[RetrievalResult]:
+        """
+        Execute a top-k similarity search.
+
+        The retriever's ``collection`` (if any) is applied as a metadata filter
+        in addition to ``filters``.
+        """
+        effective = dict(filters or {})
+        if self.collection is not None:
+            effective.setdefault("collection", self.collection)
+
+        hits = self.index.search_text(
+            query, top_k=top_k, filters=effective or None, min_score=self.min_score
+        )
+        return [
+            RetrievalResult(
+                content=hit.record.content,
+                snippet=hit.record.metadata.get("title"),
+                url=hit.record.metadata.get("url"),
+                score=hit.score,
+                doc_type=hit.record.metadata.get("doc_type"),
+            )
+            for hit in hits
+        ]
+
+
+__all__ = ["CosmosVectorRetriever", "LocalVectorRetriever", "RetrievalResult"]
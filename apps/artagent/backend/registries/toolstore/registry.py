@@ -12,6 +12,9 @@ Usage:
         execute_tool,
         initialize_tools,
     )
+
+Read-only lookups can be memoized per session by registering them with
+``cache_ttl`` (seconds) and passing ``session_id`` to ``execute_tool``.
 """
 
 from __future__ import annotations
@@ -22,6 +25,7 @@ from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from typing import Any, TypeAlias
 
+from apps.artagent.backend.registries.toolstore.result_cache import get_tool_result_cache
 from pydantic import BaseModel
 from utils.ml_logging import get_logger
 
@@ -42,6 +46,12 @@ class ToolDefinition:
     is_handoff: bool = False
     description: str = ""
     tags: set[str] = field(default_factory=set)
+    cache_ttl: float | None = None
+
+    @property
+    def cacheable(self) -> bool:
+        """True if results may be memoized per session."""
+        return bool(self.cache_ttl) and not self.is_handoff
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -60,6 +70,7 @@ def register_tool(
     is_handoff: bool = False,
     tags: set[str] | None = None,
     override: bool = False,
+    cache_ttl: float | None = None,
 ) -> None:
     """
     Register a tool with schema and executor.
@@ -70,6 +81,7 @@ def register_tool(
     :param is_handoff: True if tool triggers agent handoff
     :param tags: Optional categorization tags (e.g., {'banking', 'auth'})
     :param override: If True, allow overriding existing registration
+    :param cache_ttl: Seconds a result may be reused within a session (read-only tools only)
     """
     if name in _TOOL_DEFINITIONS and not override:
         logger.debug("Tool '%s' already registered, skipping", name)
@@ -82,6 +94,7 @@ def register_tool(
         is_handoff=is_handoff,
         description=schema.get("description", ""),
         tags=tags or set(),
+        cache_ttl=cache_ttl,
     )
     logger.debug("Registered tool: %s (handoff=%s)", name, is_handoff)
 
@@ -172,11 +185,15 @@ def _prepare_args(
     return [], raw_args
 
 
-async def execute_tool(name: str, arguments: dict[str, Any]) -> dict[str, Any]:
+async def execute_tool(
+    name: str, arguments: dict[str, Any], *, session_id: str | None = None
+) -> dict[str, Any]:
     """
     Execute a registered tool with the given arguments.
 
-    Handles both sync and async executors.
+    Handles both sync and async executors. With a ``session_id``, cacheable
+    tools are memoized for that session, and any other non-handoff tool
+    invalidates the session's cached results once it has run.
     """
     defn = _TOOL_DEFINITIONS.get(name)
     if not defn:
@@ -186,6 +203,24 @@ async def execute_tool(name: str, arguments: dict[str, Any]) -> dict[str, Any]:
             "message": f"Tool '{name}' is not registered.",
         }
 
+    if not session_id:
+        return await _run_tool(defn, arguments)
+
+    cache = get_tool_result_cache()
+    if defn.cacheable:
+        return await cache.run(
+            session_id, name, arguments, defn.cache_ttl, lambda: _run_tool(defn, arguments)
+        )
+    try:
+        return await _run_tool(defn, arguments)
+    finally:
+        if not defn.is_handoff:
+            cache.invalidate(session_id)
+
+
+async def _run_tool(defn: ToolDefinition, arguments: dict[str, Any]) -> dict[str, Any]:
+    """Run a tool's executor and normalize its result to a dict."""
+    name = defn.name
     fn = defn.executor
     positional, keyword = _prepare_args(fn, arguments)
 
@@ -255,6 +290,7 @@ def reset_registry() -> None:
     """Reset the registry (for testing)."""
     global _INITIALIZED
     _TOOL_DEFINITIONS.clear()
+    get_tool_result_cache().clear()
     _INITIALIZED = False
 
 
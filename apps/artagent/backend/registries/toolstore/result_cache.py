@@ -0,0 +1,240 @@
+"""
+Tool Result Cache
+=================
+
+Per-session memoization for read-only tools.
+
+Tools opt in by registering with ``cache_ttl`` (seconds). Within one session,
+a repeated call with the same canonicalized arguments returns the stored
+result until the TTL elapses, and concurrent identical calls share a single
+execution. Any other (non-handoff) tool is treated as potentially mutating:
+when it runs, the session's cached results are dropped so later lookups see
+fresh data.
+
+Usage:
+    from apps.artagent.backend.registries.toolstore.result_cache import (
+        get_tool_result_cache,
+    )
+
+    stats = get_tool_result_cache().stats(session_id)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from utils.ml_logging import get_logger
+
+logger = get_logger("agents.tools.result_cache")
+
+# Bounds on memory held for sessions that never call clear_session()
+DEFAULT_MAX_SESSIONS = 1024
+DEFAULT_MAX_ENTRIES_PER_SESSION = 128
+
+
+def canonical_arguments(arguments: dict[str, Any]) -> str:
+    """Stable digest of tool arguments (key order and whitespace insensitive)."""
+    payload = json.dumps(arguments, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _is_cacheable_result(result: Any) -> bool:
+    """Failed lookups are not memoized so the next call retries."""
+    return not (isinstance(result, dict) and result.get("success") is False)
+
+
+@dataclass
+class ToolCacheStats:
+    """Cache counters for one session (or all sessions combined)."""
+
+    hits: int = 0
+    misses: int = 0
+    inflight_joins: int = 0
+    invalidations: int = 0
+    saved_ms: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of cacheable calls served without running the tool."""
+        served = self.hits + self.inflight_joins
+        total = served + self.misses
+        return served / total if total else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "inflight_joins": self.inflight_joins,
+            "invalidations": self.invalidations,
+            "saved_ms": round(self.saved_ms, 2),
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+
+@dataclass
+class _Entry:
+    result: Any
+    expires_at: float
+    latency_ms: float
+
+
+@dataclass
+class _SessionMemo:
+    entries: OrderedDict[tuple[str, str], _Entry] = field(default_factory=OrderedDict)
+    inflight: dict[tuple[str, str], asyncio.Future] = field(default_factory=dict)
+    generation: int = 0
+    stats: ToolCacheStats = field(default_factory=ToolCacheStats)
+
+
+class ToolResultCache:
+    """
+    Session-scoped memo of tool results with in-flight deduplication.
+
+    Args:
+        max_sessions: Least recently used sessions beyond this are evicted.
+        max_entries_per_session: Oldest entries beyond this are evicted.
+        clock: Monotonic time source (seconds).
+    """
+
+    def __init__(
+        self,
+        *,
+        max_sessions: int = DEFAULT_MAX_SESSIONS,
+        max_entries_per_session: int = DEFAULT_MAX_ENTRIES_PER_SESSION,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_sessions = max_sessions
+        self._max_entries = max_entries_per_session
+        self._clock = clock
+        self._sessions: OrderedDict[str, _SessionMemo] = OrderedDict()
+        self._totals = ToolCacheStats()
+
+    def _session(self, session_id: str) -> _SessionMemo:
+        memo = self._sessions.get(session_id)
+        if memo is None:
+            memo = self._sessions[session_id] = _SessionMemo()
+            while len(self._sessions) > self._max_sessions:
+                self._sessions.popitem(last=False)
+        else:
+            self._sessions.move_to_end(session_id)
+        return memo
+
+    async def run(
+        self,
+        session_id: str,
+        name: str,
+        arguments: dict[str, Any],
+        ttl: float,
+        call: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Return a cached result for ``name(arguments)`` or run ``call`` once to get it."""
+        memo = self._session(session_id)
+        key = (name, canonical_arguments(arguments))
+        now = self._clock()
+
+        entry = memo.entries.get(key)
+        if entry is not None:
+            if entry.expires_at > now:
+                memo.entries.move_to_end(key)
+                self._record(memo, "hits", entry.latency_ms)
+                logger.debug("Tool cache hit | session=%s tool=%s", session_id, name)
+                return copy.deepcopy(entry.result)
+            del memo.entries[key]
+
+        pending = memo.inflight.get(key)
+        if pending is not None:
+            try:
+                result, latency_ms = await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+                # The executing caller was cancelled; run the tool for this caller instead
+                return await self.run(session_id, name, arguments, ttl, call)
+            self._record(memo, "inflight_joins", latency_ms)
+            logger.debug("Tool call deduplicated | session=%s tool=%s", session_id, name)
+            return copy.deepcopy(result)
+
+        self._record(memo, "misses")
+        generation = memo.generation
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        memo.inflight[key] = future
+        started = time.perf_counter()
+        try:
+            result = await call()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            # Joiners re-raise; retrieving here keeps an unjoined future quiet
+            future.exception()
+            raise
+        finally:
+            if memo.inflight.get(key) is future:
+                del memo.inflight[key]
+
+        latency_ms = (time.perf_counter() - started) * 1000
+        future.set_result((result, latency_ms))
+        # An invalidation while the call ran means the result may predate a write
+        if generation == memo.generation and _is_cacheable_result(result):
+            memo.entries[key] = _Entry(copy.deepcopy(result), self._clock() + ttl, latency_ms)
+            while len(memo.entries) > self._max_entries:
+                memo.entries.popitem(last=False)
+        return result
+
+    def invalidate(self, session_id: str) -> None:
+        """Drop a session's cached results (called after a mutating tool)."""
+        memo = self._sessions.get(session_id)
+        if memo is None:
+            return
+        memo.generation += 1
+        memo.inflight.clear()
+        if memo.entries:
+            memo.entries.clear()
+            self._record(memo, "invalidations")
+            logger.debug("Tool cache invalidated | session=%s", session_id)
+
+    def clear_session(self, session_id: str) -> None:
+        """Forget everything held for a finished session."""
+        self._sessions.pop(session_id, None)
+
+    def stats(self, session_id: str | None = None) -> ToolCacheStats:
+        """Counters for one session, or totals across all sessions."""
+        if session_id is None:
+            return self._totals
+        memo = self._sessions.get(session_id)
+        return memo.stats if memo else ToolCacheStats()
+
+    def clear(self) -> None:
+        """Reset all sessions and counters (for testing)."""
+        self._sessions.clear()
+        self._totals = ToolCacheStats()
+
+    def _record(self, memo: _SessionMemo, counter: str, saved_ms: float = 0.0) -> None:
+        for stats in (memo.stats, self._totals):
+            setattr(stats, counter, getattr(stats, counter) + 1)
+            stats.saved_ms += saved_ms
+
+
+_cache = ToolResultCache()
+
+
+def get_tool_result_cache() -> ToolResultCache:
+    """Return the process-wide tool result cache."""
+    return _cache
+
+
+__all__ = [
+    "ToolCacheStats",
+    "ToolResultCache",
+    "canonical_arguments",
+    "get_tool_result_cache",
+]
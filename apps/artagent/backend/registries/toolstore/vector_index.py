@@ -0,0 +1,468 @@
+"""
+Local Vector Index
+==================
+
+In-process vector index for knowledge-base retrieval.
+
+Embeddings live in a float32 NumPy matrix that is persisted as a memory-mapped
+file, so a large index is paged in by the OS on demand instead of being read
+eagerly at startup. Rows are L2-normalized on insert, which turns cosine
+similarity into a single matrix-vector product at query time.
+
+On-disk layout (one directory per index)::
+
+    <path>/
+        header.json    # {"dim": 256, "count": 1234, "capacity": 2048}
+        vectors.f32    # capacity x dim float32 matrix (memory-mapped)
+        records.jsonl  # one JSON record per row: {"id", "content", "metadata"}
+
+Usage:
+    from apps.artagent.backend.registries.toolstore.vector_index import (
+        LocalVectorIndex,
+        hash_embedding,
+    )
+
+    index = LocalVectorIndex(dim=256)
+    index.add(["Zero liability for fraud"], metadata=[{"collection": "policies"}])
+    hits = index.search(hash_embedding("fraud liability"), top_k=3,
+                        filters={"collection": "policies"})
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import threading
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from utils.ml_logging import get_logger
+
+logger = get_logger("agents.tools.vector_index")
+
+DEFAULT_EMBEDDING_DIM = 256
+
+_HEADER_FILE = "header.json"
+_VECTORS_FILE = "vectors.f32"
+_RECORDS_FILE = "records.jsonl"
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+EmbeddingFn = Callable[[str], np.ndarray]
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# OFFLINE EMBEDDING
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+def _bucket(feature: str, dim: int) -> tuple[int, float]:
+    """Map a feature to a (column, sign) pair using a process-stable hash."""
+    digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+    value = int.from_bytes(digest, "little")
+    return value % dim, 1.0 if (value >> 63) & 1 else -1.0
+
+
+def hash_embedding(text: str, *, dim: int = DEFAULT_EMBEDDING_DIM) -> np.ndarray:
+    """
+    Deterministic, dependency-free text embedding.
+
+    Uses the signed feature-hashing trick over unigrams and bigrams. It has no
+    semantic understanding, but it is stable across processes and platforms,
+    which makes it suitable for offline tests and as a fallback when no hosted
+    embedding model is configured.
+
+    :param text: Input text
+    :param dim: Output dimensionality
+    :return: L2-normalized float32 vector (all zeros for empty input)
+    """
+    vector = np.zeros(dim, dtype=np.float32)
+    tokens = _TOKEN_RE.findall(text.lower())
+    for token in tokens:
+        col, sign = _bucket(token, dim)
+        vector[col] += sign
+    for left, right in zip(tokens, tokens[1:], strict=False):
+        col, sign = _bucket(f"{left} {right}", dim)
+        vector[col] += 0.5 * sign
+
+    norm = float(np.linalg.norm(vector))
+    if norm > 0.0:
+        vector /= norm
+    return vector
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# INDEX
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+@dataclass
+class VectorRecord:
+    """Payload stored alongside each embedding row."""
+
+    id: str
+    content: str
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class VectorHit:
+    """Single search result."""
+
+    record: VectorRecord
+    score: float
+    row: int
+
+
+class LocalVectorIndex:
+    """
+    Memory-mapped, normalized dot-product vector index.
+
+    Thread-safe for concurrent readers and a single writer. Writes append rows
+    and grow the backing matrix geometrically, so building an index of N rows
+    costs amortized O(N) copies. When ``path`` is set, every :meth:`add` is
+    durable on return and other processes can pick up new rows via
+    :meth:`refresh` without reloading existing ones.
+    """
+
+    def __init__(
+        self,
+        *,
+        dim: int = DEFAULT_EMBEDDING_DIM,
+        path: str | os.PathLike[str] | None = None,
+        embedding_fn: EmbeddingFn | None = None,
+        initial_capacity: int = 1024,
+    ) -> None:
+        """
+        Create an empty index, or open an existing one at ``path``.
+
+        :param dim: Embedding dimensionality (ignored when opening an existing index)
+        :param path: Directory for persistence; ``None`` keeps the index in memory
+        :param embedding_fn: Text -> vector function used by :meth:`add` and
+            :meth:`search_text`; defaults to :func:`hash_embedding`
+        :param initial_capacity: Rows to preallocate for a new index
+        """
+        self.path = Path(path) if path is not None else None
+        self._embedding_fn = embedding_fn or (lambda text: hash_embedding(text, dim=self.dim))
+        self._lock = threading.RLock()
+        self._records: list[VectorRecord] = []
+        self._records_offset = 0
+        # metadata key -> value -> row ids, for cheap pre-filtering
+        self._postings: dict[str, dict[Any, list[int]]] = {}
+        self._posting_arrays: dict[tuple[str, Any], np.ndarray] = {}
+
+        if self.path is not None and (self.path / _HEADER_FILE).exists():
+            header = json.loads((self.path / _HEADER_FILE).read_text())
+            self.dim = int(header["dim"])
+            self._capacity = int(header["capacity"])
+            self._count = 0
+            self._matrix = self._open_memmap(self._capacity, mode="r+")
+            self.refresh()
+        else:
+            self.dim = dim
+            self._capacity = max(1, initial_capacity)
+            self._count = 0
+            if self.path is not None:
+                self.path.mkdir(parents=True, exist_ok=True)
+                (self.path / _RECORDS_FILE).touch()
+                self._matrix = self._open_memmap(self._capacity, mode="w+")
+                self._write_header()
+            else:
+                self._matrix = np.zeros((self._capacity, dim), dtype=np.float32)
+
+    @classmethod
+    def open(
+        cls,
+        path: str | os.PathLike[str],
+        *,
+        embedding_fn: EmbeddingFn | None = None,
+    ) -> LocalVectorIndex:
+        """Open a persisted index. Raises FileNotFoundError if none exists."""
+        if not (Path(path) / _HEADER_FILE).exists():
+            raise FileNotFoundError(f"No vector index found at {path}")
+        return cls(path=path, embedding_fn=embedding_fn)
+
+    def __len__(self) -> int:
+        return self._count
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Persistence helpers
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def _open_memmap(self, capacity: int, *, mode: str) -> np.memmap:
+        assert self.path is not None
+        return np.memmap(
+            self.path / _VECTORS_FILE,
+            dtype=np.float32,
+            mode=mode,
+            shape=(capacity, self.dim),
+        )
+
+    def _write_header(self) -> None:
+        assert self.path is not None
+        header = {"dim": self.dim, "count": self._count, "capacity": self._capacity}
+        tmp = self.path / f"{_HEADER_FILE}.tmp"
+        tmp.write_text(json.dumps(header))
+        os.replace(tmp, self.path / _HEADER_FILE)
+
+    def _grow(self, needed: int) -> None:
+        if needed <= self._capacity:
+            return
+        capacity = self._capacity
+        while capacity < needed:
+            capacity *= 2
+
+        if self.path is None:
+            grown = np.zeros((capacity, self.dim), dtype=np.float32)
+            grown[: self._count] = self._matrix[: self._count]
+            self._matrix = grown
+        else:
+            self._matrix.flush()
+            del self._matrix
+            with open(self.path / _VECTORS_FILE, "r+b") as fh:
+                fh.truncate(capacity * self.dim * 4)
+            self._matrix = self._open_memmap(capacity, mode="r+")
+        self._capacity = capacity
+
+    def refresh(self) -> int:
+        """
+        Load rows appended by another writer since the last load.
+
+        Only new records are parsed; existing rows are left untouched.
+
+        :return: Number of newly visible rows
+        """
+        if self.path is None:
+            return 0
+        with self._lock:
+            header = json.loads((self.path / _HEADER_FILE).read_text())
+            count = int(header["count"])
+            if count <= self._count:
+                return 0
+            if int(header["capacity"]) != self._capacity:
+                del self._matrix
+                self._capacity = int(header["capacity"])
+                self._matrix = self._open_memmap(self._capacity, mode="r+")
+
+            start = self._count
+            with open(self.path / _RECORDS_FILE, encoding="utf-8") as fh:
+                fh.seek(self._records_offset)
+                while self._count < count:
+                    line = fh.readline()
+                    if not line:
+                        break
+                    raw = json.loads(line)
+                    self._append_record(
+                        VectorRecord(
+                            id=raw["id"],
+                            content=raw["content"],
+                            metadata=raw.get("metadata") or {},
+                        )
+                    )
+                self._records_offset = fh.tell()
+            return self._count - start
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Writes
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def _append_record(self, record: VectorRecord) -> None:
+        row = self._count
+        self._records.append(record)
+        for key, value in record.metadata.items():
+            if isinstance(value, (str, int, float, bool)) or value is None:
+                self._postings.setdefault(key, {}).setdefault(value, []).append(row)
+                self._posting_arrays.pop((key, value), None)
+        self._count += 1
+
+    def add(
+        self,
+        texts: Sequence[str],
+        *,
+        metadata: Sequence[Mapping[str, Any]] | None = None,
+        ids: Sequence[str] | None = None,
+        embeddings: np.ndarray | None = None,
+    ) -> list[int]:
+        """
+        Append documents to the index.
+
+        :param texts: Document contents
+        :param metadata: Optional per-document metadata used for filtering
+        :param ids: Optional stable document ids (defaults to the row number)
+        :param embeddings: Optional precomputed (len(texts), dim) matrix
+        :return: Row numbers assigned to the new documents
+        """
+        if metadata is not None and len(metadata) != len(texts):
+            raise ValueError("metadata must match texts in length")
+        if ids is not None and len(ids) != len(texts):
+            raise ValueError("ids must match texts in length")
+        if not texts:
+            return []
+
+        if embeddings is None:
+            vectors = np.stack([self._embedding_fn(text) for text in texts]).astype(np.float32)
+        else:
+            vectors = np.array(embeddings, dtype=np.float32)
+        if vectors.shape != (len(texts), self.dim):
+            raise ValueError(f"embeddings must have shape ({len(texts)}, {self.dim})")
+
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        np.divide(vectors, norms, out=vectors, where=norms > 0)
+
+        with self._lock:
+            start = self._count
+            self._grow(start + len(texts))
+            self._matrix[start : start + len(texts)] = vectors
+
+            records = [
+                VectorRecord(
+                    id=str(ids[i]) if ids is not None else str(start + i),
+                    content=texts[i],
+                    metadata=dict(metadata[i]) if metadata is not None else {},
+                )
+                for i in range(len(texts))
+            ]
+
+            if self.path is not None:
+                self._matrix.flush()
+                with open(self.path / _RECORDS_FILE, "a", encoding="utf-8") as fh:
+                    for record in records:
+                        fh.write(
+                            json.dumps(
+                                {
+                                    "id": record.id,
+                                    "content": record.content,
+                                    "metadata": record.metadata,
+                                },
+                                ensure_ascii=False,
+                            )
+                        )
+                        fh.write("\n")
+                    self._records_offset = fh.tell()
+
+            for record in records:
+                self._append_record(record)
+
+            if self.path is not None:
+                self._write_header()
+
+            return list(range(start, self._count))
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Reads
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def _candidate_rows(self, filters: Mapping[str, Any]) -> np.ndarray | None:
+        """Intersect posting lists for equality filters (list values mean "any of")."""
+        candidates: np.ndarray | None = None
+        for key, wanted in filters.items():
+            values: Iterable[Any] = (
+                wanted if isinstance(wanted, (list, tuple, set, frozenset)) else (wanted,)
+            )
+            parts = []
+            for value in values:
+                cached = self._posting_arrays.get((key, value))
+                if cached is None:
+                    rows = self._postings.get(key, {}).get(value)
+                    if not rows:
+                        continue
+                    cached = np.asarray(rows, dtype=np.int64)
+                    self._posting_arrays[(key, value)] = cached
+                parts.append(cached)
+            if not parts:
+                return np.empty(0, dtype=np.int64)
+            rows_for_key = parts[0] if len(parts) == 1 else np.unique(np.concatenate(parts))
+            candidates = (
+                rows_for_key
+                if candidates is None
+                else np.intersect1d(candidates, rows_for_key, assume_unique=True)
+            )
+        return candidates
+
+    def search(
+        self,
+        query: np.ndarray,
+        *,
+        top_k: int = 5,
+        filters: Mapping[str, Any] | None = None,
+        min_score: float | None = None,
+    ) -> list[VectorHit]:
+        """
+        Return the ``top_k`` rows with the highest cosine similarity to ``query``.
+
+        :param query: Query vector of shape (dim,); need not be normalized
+        :param top_k: Maximum number of hits
+        :param filters: Optional metadata equality filters
+        :param min_score: Drop hits scoring below this threshold
+        :return: Hits sorted by descending score
+        """
+        if top_k <= 0:
+            return []
+        q = np.asarray(query, dtype=np.float32)
+        norm = float(np.linalg.norm(q))
+        if norm == 0.0:
+            return []
+        q = q / norm
+
+        with self._lock:
+            count = self._count
+            if count == 0:
+                return []
+            rows = self._candidate_rows(filters) if filters else None
+            if rows is not None:
+                if rows.size == 0:
+                    return []
+                # Gathering rows copies them; for broad filters a full pass is cheaper.
+                if rows.size * 4 > count:
+                    scores = (self._matrix[:count] @ q)[rows]
+                else:
+                    scores = self._matrix[rows] @ q
+            else:
+                scores = self._matrix[:count] @ q
+
+            k = min(top_k, scores.shape[0])
+            if k < scores.shape[0]:
+                top = np.argpartition(scores, -k)[-k:]
+            else:
+                top = np.arange(scores.shape[0])
+            top = top[np.argsort(-scores[top], kind="stable")]
+
+            hits = []
+            for idx in top:
+                score = float(scores[idx])
+                if min_score is not None and score < min_score:
+                    break
+                row = int(rows[idx]) if rows is not None else int(idx)
+                hits.append(VectorHit(record=self._records[row], score=score, row=row))
+            return hits
+
+    def search_text(
+        self,
+        text: str,
+        *,
+        top_k: int = 5,
+        filters: Mapping[str, Any] | None = None,
+        min_score: float | None = None,
+    ) -> list[VectorHit]:
+        """Embed ``text`` with the index embedding function and search."""
+        return self.search(
+            self._embedding_fn(text), top_k=top_k, filters=filters, min_score=min_score
+        )
+
+    def memory_bytes(self) -> int:
+        """Bytes reserved by the embedding matrix (resident or mapped)."""
+        return int(self._capacity * self.dim * 4)
+
+
+__all__ = [
+    "DEFAULT_EMBEDDING_DIM",
+    "EmbeddingFn",
+    "LocalVectorIndex",
+    "VectorHit",
+    "VectorRecord",
+    "hash_embedding",
+]
@@ -30,6 +30,7 @@ import uuid
 from collections import deque
 from typing import TYPE_CHECKING, Dict, Optional, Tuple
 
+from apps.artagent.backend.registries.toolstore.result_cache import get_tool_result_cache
 from apps.artagent.backend.src.orchestration.session_agents import (
     get_session_agent,
     register_adapter_update_callback,
@@ -41,6 +42,7 @@ from apps.artagent.backend.src.utils.tracing import (
     create_service_handler_attrs,
 )
 from apps.artagent.backend.voice.shared.config_resolver import resolve_orchestrator_config
+from apps.artagent.backend.voice.shared.turn_profiler import get_turn_profiler
 from src.stateful.state_managment import MemoManager
 from apps.artagent.backend.voice import (
     CascadeOrchestratorAdapter,
@@ -182,6 +184,8 @@ def _get_or_create_adapter(
 
 def cleanup_adapter(session_id: str) -> None:
     """Remove adapter for a completed session."""
+    get_tool_result_cache().clear_session(session_id)
+    get_turn_profiler().discard(session_id)
     if session_id in _adapters:
         del _adapters[session_id]
         logger.debug("Cleaned up adapter for session: %s", session_id)
@@ -372,6 +376,89 @@ def update_session_scenario(session_id: str, scenario) -> bool:
 register_scenario_update_callback(update_session_scenario)
 
 
+def _build_turn_context(
+    cm: MemoManager,
+    transcript: str,
+    ws: WebSocket,
+    adapter: CascadeOrchestratorAdapter,
+    *,
+    is_acs: bool,
+    run_id: str | None,
+    session_id: str,
+    call_connection_id: str,
+) -> OrchestratorContext:
+    """Build the OrchestratorContext for one user turn from MemoManager state."""
+    # Build session context from MemoManager for prompt rendering
+    active_agent = cm.get_value_from_corememory("active_agent") or adapter.current_agent
+    session_context = {
+        "is_acs": is_acs,
+        "run_id": run_id,
+        "memo_manager": cm,
+        # Session profile and context for Jinja templates
+        "session_profile": cm.get_value_from_corememory("session_profile"),
+        "caller_name": cm.get_value_from_corememory("caller_name"),
+        "client_id": cm.get_value_from_corememory("client_id"),
+        "customer_intelligence": cm.get_value_from_corememory("customer_intelligence"),
+        "institution_name": cm.get_value_from_corememory("institution_name"),
+        "active_agent": active_agent,
+        "previous_agent": cm.get_value_from_corememory("previous_agent"),
+        "visited_agents": cm.get_value_from_corememory("visited_agents"),
+        "handoff_context": cm.get_value_from_corememory("handoff_context"),
+        # Add agent_name for prompt templates - use current adapter agent
+        "agent_name": adapter.current_agent,
+    }
+
+    return OrchestratorContext(
+        session_id=session_id,
+        websocket=ws,
+        call_connection_id=call_connection_id,
+        user_text=transcript,
+        conversation_history=_get_conversation_history(cm, adapter),
+        metadata=session_context,
+    )
+
+
+class RouteTurnSpeculator:
+    """
+    Speculative LLM starter for :func:`route_turn` (see ``TurnSpeculator``).
+
+    Builds the same context a committed turn would for a stable partial
+    transcript and lets the session's adapter open the LLM stream early. The
+    next ``route_turn`` adopts the stream only if the final transcript and the
+    prompt match; nothing is spoken or executed before that.
+    """
+
+    def __init__(self, ws: WebSocket, *, is_acs: bool) -> None:
+        self._ws = ws
+        self._is_acs = is_acs
+        self._adapter: CascadeOrchestratorAdapter | None = None
+
+    async def start(self, cm: MemoManager, transcript: str) -> bool:
+        """Open the LLM request for ``transcript`` on the session's adapter."""
+        call_connection_id, session_id = _get_correlation_context(self._ws, cm)
+        adapter = _get_or_create_adapter(
+            session_id, call_connection_id, self._ws.app.state, memo_manager=cm
+        )
+        adapter.sync_from_memo_manager(cm)
+        self._adapter = adapter
+        context = _build_turn_context(
+            cm,
+            transcript,
+            self._ws,
+            adapter,
+            is_acs=self._is_acs,
+            run_id=cm.get_value_from_corememory("current_run_id"),
+            session_id=session_id,
+            call_connection_id=call_connection_id,
+        )
+        return await adapter.speculate(context)
+
+    def cancel(self) -> None:
+        """Cancel the adapter's pending speculative request."""
+        if self._adapter is not None:
+            self._adapter.cancel_speculation()
+
+
 async def route_turn(
     cm: MemoManager,
     transcript: str,
@@ -437,34 +524,16 @@ async def route_turn(
         redis_mgr = app_state.redis
 
         try:
-            # Build session context from MemoManager for prompt rendering
-            active_agent = cm.get_value_from_corememory("active_agent") or adapter.current_agent
-            session_context = {
-                "is_acs": is_acs,
-                "run_id": run_id,
-                "memo_manager": cm,
-                # Session profile and context for Jinja templates
-                "session_profile": cm.get_value_from_corememory("session_profile"),
-                "caller_name": cm.get_value_from_corememory("caller_name"),
-                "client_id": cm.get_value_from_corememory("client_id"),
-                "customer_intelligence": cm.get_value_from_corememory("customer_intelligence"),
-                "institution_name": cm.get_value_from_corememory("institution_name"),
-                "active_agent": active_agent,
-                "previous_agent": cm.get_value_from_corememory("previous_agent"),
-                "visited_agents": cm.get_value_from_corememory("visited_agents"),
-                "handoff_context": cm.get_value_from_corememory("handoff_context"),
-                # Add agent_name for prompt templates - use current adapter agent
-                "agent_name": adapter.current_agent,
-            }
-
             # Build context for the orchestrator
-            context = OrchestratorContext(
+            context = _build_turn_context(
+                cm,
+                transcript,
+                ws,
+                adapter,
+                is_acs=is_acs,
+                run_id=run_id,
                 session_id=session_id,
-                websocket=ws,
                 call_connection_id=call_connection_id,
-                user_text=transcript,
-                conversation_history=_get_conversation_history(cm),
-                metadata=session_context,
             )
 
             tool_invocations: dict[str, dict[str, float]] = {}
@@ -751,8 +820,14 @@ async def route_turn(
                 )
 
 
-def _get_conversation_history(cm: MemoManager) -> list[dict]:
-    """Extract conversation history from MemoManager."""
+def _get_conversation_history(
+    cm: MemoManager, adapter: CascadeOrchestratorAdapter | None = None
+) -> list[dict]:
+    """Extract conversation history from MemoManager.
+
+    With an adapter, the active agent's thread is read through the adapter's
+    bounded conversation window instead of being copied in full.
+    """
     history = []
 
     # Get the active agent to retrieve its history
@@ -765,7 +840,10 @@ def _get_conversation_history(cm: MemoManager) -> list[dict]:
     # Try to get history from the MemoManager's history for the active agent
     if active_agent and hasattr(cm, "get_history"):
         try:
-            agent_history = cm.get_history(active_agent)
+            if adapter is not None:
+                agent_history = adapter.windowed_history(cm, active_agent)
+            else:
+                agent_history = cm.get_history(active_agent)
             if agent_history:
                 history.extend(agent_history)
         except Exception:
@@ -847,4 +925,5 @@ async def _emit_orchestrator_error_status(
 __all__ = [
     "route_turn",
     "cleanup_adapter",
+    "RouteTurnSpeculator",
 ]
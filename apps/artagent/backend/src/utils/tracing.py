@@ -11,10 +11,12 @@ The helpers also prefer semantic attributes for edges (e.g., `peer.service`,
 """
 
 import os
+import time
 from typing import Any
 
 from opentelemetry.trace import SpanKind, Status, StatusCode
 from utils.ml_logging import get_logger
+from utils.telemetry_config import get_span_sampler
 
 # Default logger for fallback usage
 _default_logger = get_logger(__name__)
@@ -162,6 +164,7 @@ class TracedOperation:
         span_kind: Any = SpanKind.INTERNAL,
         call_connection_id: str | None = None,
         session_id: str | None = None,
+        high_frequency: bool = False,
         **extra_attrs,
     ):
         self.tracer = tracer
@@ -172,10 +175,23 @@ class TracedOperation:
         self.span_kind = span_kind
         self.call_connection_id = call_connection_id
         self.session_id = session_id
+        self.high_frequency = high_frequency
         self.extra_attrs = extra_attrs
         self.span = None
+        self._start_time_ns: int | None = None
 
     def __enter__(self):
+        if self.high_frequency and not get_span_sampler().should_sample(
+            self.session_id or self.call_connection_id, self.span_name
+        ):
+            # Sampled out; an error still opens the span in __exit__
+            self._start_time_ns = time.time_ns()
+            return self
+
+        self._start_span()
+        return self
+
+    def _start_span(self, start_time: int | None = None) -> None:
         attrs = create_service_handler_attrs(
             service_name=self.service_name,
             operation=self.operation,
@@ -184,10 +200,21 @@ class TracedOperation:
             **self.extra_attrs,
         )
 
-        self.span = self.tracer.start_span(self.span_name, kind=self.span_kind, attributes=attrs)
-        return self
+        self.span = self.tracer.start_span(
+            self.span_name, kind=self.span_kind, attributes=attrs, start_time=start_time
+        )
+        if self.high_frequency:
+            # Operations sampled out since the last kept span (a late error span
+            # was counted as sampled out itself)
+            suppressed = get_span_sampler().take_suppressed(
+                self.session_id or self.call_connection_id, self.span_name
+            ) - (start_time is not None)
+            if suppressed > 0:
+                self.span.set_attribute("telemetry.sampling.suppressed", suppressed)
 
     def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type and self.span is None and self._start_time_ns is not None:
+            self._start_span(start_time=self._start_time_ns)
         if self.span and hasattr(self.span, "set_status"):
             if exc_type:
                 try:
@@ -259,11 +286,16 @@ def trace_acs_operation(
     call_connection_id: str | None = None,
     session_id: str | None = None,
     span_kind: Any = SpanKind.INTERNAL,
+    high_frequency: bool = False,
     **extra_attrs,
 ) -> TracedOperation:
     """
     Create a traced ACS operation with consistent naming and attributes.
 
+    Pass ``high_frequency=True`` for per-message handlers: spans are then
+    rate-limited per session (see ``utils.telemetry_config.AdaptiveSampler``),
+    while failures are always traced.
+
     Usage:
         with trace_acs_operation(tracer, logger, "handle_call_connected", call_id) as op:
             op.log_info("Processing call connected event")
@@ -278,6 +310,7 @@ def trace_acs_operation(
         span_kind=span_kind,
         call_connection_id=call_connection_id,
         session_id=session_id,
+        high_frequency=high_frequency,
         **extra_attrs,
     )
 
@@ -11,7 +11,7 @@ SENDING TO UI (Dashboard/Frontend):
     # Final user transcript (broadcast to all session connections)
     await send_user_transcript(ws, text, session_id=sid, broadcast_only=True)
 
-    # Partial/interim transcript
+    # Partial/interim transcript (at most one per UI_ENVELOPE_FRAME_MS per session)
     await send_user_partial_transcript(ws, text, session_id=sid)
 
     # Generic session envelope
@@ -0,0 +1,173 @@
+"""
+Envelope Coalescer
+==================
+
+Rate limits high-frequency UI envelopes per session.
+
+Speech SDK partial results and session-status snapshots can fire many times
+per second per caller. Each envelope is serialized, sent to every dashboard
+connection and published to Redis, although the UI only renders the latest
+one. For coalesced event labels the coalescer sends at most one envelope per
+``frame_ms`` window per session and label:
+
+- the first envelope after an idle window is sent immediately
+- later envelopes inside the window replace each other; the latest is sent
+  when the window closes
+
+Every other envelope acts as a barrier: ``flush(session_id)`` sends anything
+still pending for the session first, so finals, tool and control envelopes
+are never dropped or overtaken by an older partial.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+from utils.ml_logging import get_logger
+
+logger = get_logger("ws_helpers.coalescer")
+
+SendFn = Callable[[], Awaitable[Any]]
+
+
+@dataclass
+class CoalescerStats:
+    """Envelope counters across all sessions."""
+
+    submitted: int = 0
+    sent: int = 0
+    replaced: int = 0
+    barrier_flushes: int = 0
+
+
+@dataclass
+class _Slot:
+    pending: SendFn | None = None
+    seq: int = 0
+    timer: asyncio.TimerHandle | None = None
+
+
+@dataclass
+class _SessionFrames:
+    loop: asyncio.AbstractEventLoop
+    slots: dict[str, _Slot] = field(default_factory=dict)
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    # Strong references to frame-close tasks; the loop only keeps weak ones
+    tasks: set[asyncio.Task] = field(default_factory=set)
+
+
+class EnvelopeCoalescer:
+    """
+    Per-session, per-label throttle that keeps only the latest envelope.
+
+    Args:
+        frame_ms: Window length; ``0`` disables coalescing.
+        labels: Event labels that may be coalesced.
+    """
+
+    def __init__(self, frame_ms: int, labels: Iterable[str]) -> None:
+        self.frame_s = max(frame_ms, 0) / 1000.0
+        self.labels = frozenset(labels)
+        self.stats = CoalescerStats()
+        self._sessions: dict[str, _SessionFrames] = {}
+        self._seq = itertools.count()
+
+    def coalesces(self, event_label: str) -> bool:
+        """Whether envelopes with ``event_label`` are rate limited."""
+        return self.frame_s > 0 and event_label in self.labels
+
+    async def submit(self, session_id: str, event_label: str, send: SendFn) -> Any | None:
+        """
+        Send now if the label's window is idle, otherwise hold as the latest.
+
+        Returns the result of ``send`` when it ran immediately, else ``None``.
+        """
+        self.stats.submitted += 1
+        loop = asyncio.get_running_loop()
+        frames = self._sessions.get(session_id)
+        if frames is None or frames.loop is not loop:
+            frames = self._sessions[session_id] = _SessionFrames(loop)
+        slot = frames.slots.get(event_label)
+        if slot is not None:
+            if slot.pending is not None:
+                self.stats.replaced += 1
+            slot.pending = send
+            slot.seq = next(self._seq)
+            return None
+
+        slot = frames.slots[event_label] = _Slot()
+        slot.timer = loop.call_later(self.frame_s, self._on_frame, session_id, event_label)
+        async with frames.lock:
+            self.stats.sent += 1
+            return await send()
+
+    async def flush(self, session_id: str) -> int:
+        """Send everything pending for a session, oldest first."""
+        frames = self._sessions.get(session_id)
+        if frames is None or frames.loop is not asyncio.get_running_loop():
+            return 0
+        async with frames.lock:
+            ready = sorted(
+                (slot for slot in frames.slots.values() if slot.pending is not None),
+                key=lambda slot: slot.seq,
+            )
+            for slot in ready:
+                send, slot.pending = slot.pending, None
+                await self._send(send)
+        if ready:
+            self.stats.barrier_flushes += 1
+        return len(ready)
+
+    def discard(self, session_id: str) -> None:
+        """Drop a session's pending envelopes, timers and frame-close tasks."""
+        frames = self._sessions.pop(session_id, None)
+        if frames is None:
+            return
+        for slot in frames.slots.values():
+            if slot.timer is not None:
+                slot.timer.cancel()
+        for task in frames.tasks:
+            task.cancel()
+
+    def _on_frame(self, session_id: str, event_label: str) -> None:
+        frames = self._sessions.get(session_id)
+        if frames is None:
+            return
+        task = frames.loop.create_task(
+            self._close_frame(session_id, event_label), name=f"coalescer_{event_label}"
+        )
+        frames.tasks.add(task)
+        task.add_done_callback(frames.tasks.discard)
+
+    async def _close_frame(self, session_id: str, event_label: str) -> None:
+        frames = self._sessions.get(session_id)
+        slot = frames.slots.get(event_label) if frames else None
+        if slot is None:
+            return
+        async with frames.lock:
+            send, slot.pending = slot.pending, None
+            if send is not None:
+                await self._send(send)
+        if send is None:
+            # Idle for a whole window: the next envelope goes out immediately
+            del frames.slots[event_label]
+            if not frames.slots and self._sessions.get(session_id) is frames:
+                del self._sessions[session_id]
+            return
+        slot.timer = asyncio.get_running_loop().call_later(
+            self.frame_s, self._on_frame, session_id, event_label
+        )
+
+    async def _send(self, send: SendFn) -> None:
+        self.stats.sent += 1
+        try:
+            await send()
+        except Exception:  # noqa: BLE001
+            logger.debug("Coalesced envelope delivery failed", exc_info=True)
+
+
+__all__ = ["CoalescerStats", "EnvelopeCoalescer"]
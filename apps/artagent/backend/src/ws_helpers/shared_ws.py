@@ -31,6 +31,7 @@ from typing import Any
 from apps.artagent.backend.registries.agentstore.loader import build_agent_summaries
 from apps.artagent.backend.src.services.acs.acs_helpers import play_response_with_queue
 from apps.artagent.backend.src.services.speech_services import SpeechSynthesizer
+from apps.artagent.backend.src.ws_helpers.coalescer import EnvelopeCoalescer
 from apps.artagent.backend.src.ws_helpers.envelopes import (
     make_envelope,
     make_event_envelope,
@@ -43,6 +44,8 @@ from config import (
     GREETING_VOICE_TTS,
     TTS_SAMPLE_RATE_ACS,
     TTS_SAMPLE_RATE_UI,
+    UI_COALESCED_EVENTS,
+    UI_ENVELOPE_FRAME_MS,
 )
 from fastapi import WebSocket, WebSocketDisconnect
 from fastapi.websockets import WebSocketState
@@ -52,6 +55,14 @@ from utils.telemetry_decorators import trace_speech, add_speech_tts_metrics
 
 logger = get_logger("shared_ws")
 
+# Partial transcripts and status snapshots: at most one per session per UI frame
+_envelope_coalescer = EnvelopeCoalescer(UI_ENVELOPE_FRAME_MS, UI_COALESCED_EVENTS)
+
+
+def get_envelope_coalescer() -> EnvelopeCoalescer:
+    """Return the process-wide UI envelope coalescer."""
+    return _envelope_coalescer
+
 
 def _mirror_ws_state(ws: WebSocket, key: str, value) -> None:
     """Store a copy of connection metadata on websocket.state for barge-in fallbacks."""
@@ -126,6 +137,7 @@ async def send_user_transcript(
     Aligns ACS transcripts with the realtime conversation flow so dashboards
     and the UI render user bubbles consistently.
     """
+    _mirror_ws_state(ws, "last_partial_transcript", None)
     payload_session_id = session_id or getattr(ws.state, "session_id", None)
     resolved_conn = conn_id or getattr(ws.state, "conn_id", None)
 
@@ -170,6 +182,10 @@ async def send_user_partial_transcript(
     session_id: str | None = None,
 ) -> None:
     """Emit partial user speech updates for ACS parity with realtime."""
+    # A revision that repeats the previous hypothesis changes nothing on screen
+    if getattr(ws.state, "last_partial_transcript", None) == text:
+        return
+    _mirror_ws_state(ws, "last_partial_transcript", text)
     payload_session_id = session_id or getattr(ws.state, "session_id", None)
 
     partial_payload = {
@@ -278,15 +294,48 @@ async def send_session_envelope(
     a session-scoped broadcast when the targeted connection is unavailable.
     As a final safeguard it falls back to sending directly on the websocket
     if the connection manager is inaccessible.
+
+    Envelopes whose ``event_label`` is coalesced (partial transcripts, status
+    snapshots) may be held until the end of the current UI frame and replaced
+    by a newer one; they count as delivered. Any other envelope first flushes
+    what is held for the session so ordering is preserved.
     """
+    resolved_session_id = session_id or getattr(ws.state, "session_id", None)
+    send = partial(
+        _send_session_envelope_now,
+        ws,
+        envelope,
+        session_id=resolved_session_id,
+        conn_id=conn_id,
+        event_label=event_label,
+        broadcast_only=broadcast_only,
+    )
+    if not resolved_session_id:
+        return await send()
+    if _envelope_coalescer.coalesces(event_label):
+        sent = await _envelope_coalescer.submit(resolved_session_id, event_label, send)
+        return True if sent is None else sent
+    await _envelope_coalescer.flush(resolved_session_id)
+    return await send()
+
 
+async def _send_session_envelope_now(
+    ws: WebSocket,
+    envelope: dict[str, Any],
+    *,
+    session_id: str | None,
+    conn_id: str | None,
+    event_label: str,
+    broadcast_only: bool,
+) -> bool:
+    """Deliver an envelope immediately (see ``send_session_envelope``)."""
     manager = getattr(ws.app.state, "conn_manager", None)
     resolved_conn_id = conn_id or getattr(ws.state, "conn_id", None)
-    resolved_session_id = session_id or getattr(ws.state, "session_id", None)
+    resolved_session_id = session_id
 
     if manager and resolved_session_id and broadcast_only:
         try:
-            sent = await broadcast_session_envelope(
+            sent = await _broadcast_session_envelope_now(
                 ws.app.state,
                 envelope,
                 session_id=resolved_session_id,
@@ -352,7 +401,7 @@ async def send_session_envelope(
             )
             if manager and resolved_session_id:
                 try:
-                    await broadcast_session_envelope(
+                    await _broadcast_session_envelope_now(
                         ws.app.state,
                         envelope,
                         session_id=resolved_session_id,
@@ -1102,7 +1151,8 @@ async def broadcast_session_envelope(
         event_label: Log-friendly label describing the envelope.
 
     Returns:
-        int: Number of connections the envelope was delivered to.
+        int: Number of connections the envelope was delivered to (0 when a
+        coalesced envelope is held for the end of the current UI frame).
     """
     if not app_state or not hasattr(app_state, "conn_manager"):
         raise ValueError("broadcast_session_envelope requires app_state with conn_manager")
@@ -1111,6 +1161,28 @@ async def broadcast_session_envelope(
     if not target_session:
         raise ValueError("session_id must be provided for envelope broadcasts")
 
+    send = partial(
+        _broadcast_session_envelope_now,
+        app_state,
+        envelope,
+        session_id=target_session,
+        event_label=event_label,
+    )
+    if _envelope_coalescer.coalesces(event_label):
+        return await _envelope_coalescer.submit(target_session, event_label, send) or 0
+    await _envelope_coalescer.flush(target_session)
+    return await send()
+
+
+async def _broadcast_session_envelope_now(
+    app_state,
+    envelope: dict[str, Any],
+    *,
+    session_id: str,
+    event_label: str,
+) -> int:
+    """Send to local session connections and publish to other replicas."""
+    target_session = session_id
     sent_count = await app_state.conn_manager.broadcast_session(
         target_session,
         envelope,
@@ -1272,6 +1344,7 @@ __all__ = [
     "broadcast_message",
     "broadcast_session_envelope",
     "send_session_envelope",
+    "get_envelope_coalescer",
     "get_connection_metadata",
     "send_agent_inventory",
 ]
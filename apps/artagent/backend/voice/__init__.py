@@ -97,6 +97,7 @@ _SPEECH_CASCADE_HANDLER_EXPORTS = {
     "SpeechSDKThread",
     "ThreadBridge",
     "TranscriptEmitter",
+    "TurnSpeculator",
 }
 
 _TTS_EXPORTS = {
@@ -181,6 +182,7 @@ __all__ = [
     "BargeInController",
     "ResponseSender",
     "TranscriptEmitter",
+    "TurnSpeculator",
     # Speech Cascade Metrics - direct import
     "record_stt_recognition",
     "record_turn_processing",
@@ -58,6 +58,9 @@ from opentelemetry.trace import SpanKind, Status, StatusCode
 # Core dependencies - use direct module imports to avoid circular imports
 from apps.artagent.backend.voice.shared import TransportType, VoiceSessionContext
 from apps.artagent.backend.voice.tts import TTSPlayback
+from apps.artagent.backend.voice.speech_cascade.acs_inbound import ACSInboundDecoder
+from apps.artagent.backend.voice.speech_cascade.jitter_buffer import InboundJitterBuffer
+from apps.artagent.backend.voice.shared.turn_profiler import TurnStage, get_turn_profiler
 from apps.artagent.backend.voice.speech_cascade.handler import (
     ThreadBridge,
     RouteTurnThread,
@@ -65,6 +68,7 @@ from apps.artagent.backend.voice.speech_cascade.handler import (
     BargeInController,
     SpeechEvent,
     SpeechEventType,
+    TurnSpeculator,
 )
 from apps.artagent.backend.voice.messaging import (
     BrowserBargeInController,
@@ -85,13 +89,26 @@ from src.pools.session_manager import SessionContext
 from src.stateful.state_managment import MemoManager
 from src.speech.speech_recognizer import StreamingSpeechRecognizerFromBytes
 from src.enums.stream_modes import StreamMode
-from config import ACS_STREAMING_MODE, GREETING, STOP_WORDS
+from config import (
+    ACS_INBOUND_COALESCE_MS,
+    ACS_JITTER_BUFFER,
+    ACS_JITTER_MAX_DEPTH_MS,
+    ACS_JITTER_MIN_DEPTH_MS,
+    ACS_STREAMING_MODE,
+    CASCADE_SPECULATION_STABLE_MS,
+    CASCADE_SPECULATIVE_LLM,
+    CASCADE_VAD_BARGE_IN,
+    CASCADE_VAD_MIN_SPEECH_MS,
+    GREETING,
+    STOP_WORDS,
+)
 from fastapi import WebSocket, WebSocketDisconnect
 from fastapi.websockets import WebSocketState
 from utils.ml_logging import get_logger
 
 if TYPE_CHECKING:
     from apps.artagent.backend.voice.speech_cascade.orchestrator import CascadeOrchestratorAdapter
+    from apps.artagent.backend.voice.speech_cascade.vad import StreamingVAD
 
 logger = get_logger("voice.handler")
 tracer = trace.get_tracer(__name__)
@@ -152,7 +169,7 @@ class VoiceHandlerConfig:
     websocket: WebSocket
     session_id: str
     transport: TransportType = TransportType.BROWSER
-    conn_id: str | None = None  # Browser only
+    conn_id: str | None = None  # Connection manager ID of the socket
     call_connection_id: str | None = None  # ACS only
     stream_mode: StreamMode = field(default_factory=lambda: ACS_STREAMING_MODE)
     user_email: str | None = None
@@ -229,6 +246,17 @@ class VoiceHandler:
         # Browser-specific barge-in (for WebSocket message handling)
         self._browser_barge_in: BrowserBargeInController | None = None
 
+        # ACS inbound audio: parse-once decoding + frame coalescing (or jitter buffering)
+        self._acs_inbound: ACSInboundDecoder | None = (
+            ACSInboundDecoder(
+                self.write_audio,
+                coalesce_ms=ACS_INBOUND_COALESCE_MS,
+                jitter_buffer=self._create_jitter_buffer(),
+            )
+            if self._transport == TransportType.ACS
+            else None
+        )
+
         # Greeting
         self._greeting_text: str = ""
         self._greeting_queued = False
@@ -381,6 +409,9 @@ class VoiceHandler:
             on_barge_in=handler._on_barge_in,
         )
 
+        # Per-turn latency budget marks (final transcript → first response audio)
+        turn_profile = get_turn_profiler().session(context.session_id)
+
         handler._route_turn_thread = RouteTurnThread(
             connection_id=session_key,
             speech_queue=handler._speech_queue,
@@ -390,6 +421,9 @@ class VoiceHandler:
             on_announcement=handler._on_announcement,
             on_user_transcript=handler._on_user_transcript,
             on_tts_request=handler._on_tts_request,
+            speculator=handler._create_turn_speculator(),
+            speculation_stable_ms=CASCADE_SPECULATION_STABLE_MS,
+            turn_profile=turn_profile,
         )
 
         handler._thread_bridge.set_main_loop(event_loop, session_key)
@@ -402,6 +436,8 @@ class VoiceHandler:
             speech_queue=handler._speech_queue,
             thread_bridge=handler._thread_bridge,
             barge_in_handler=handler._barge_in_controller.handle_barge_in,
+            turn_profile=turn_profile,
+            vad=handler._create_barge_in_vad(),
         )
 
         # Store reference in context for external access
@@ -647,6 +683,19 @@ class VoiceHandler:
             if not task.done():
                 task.cancel()
 
+        # Deliver any coalesced / jitter-buffered caller audio before the recognizer stops
+        if self._acs_inbound:
+            try:
+                self._acs_inbound.close()
+                if self._acs_inbound.jitter_buffer is not None:
+                    logger.info(
+                        "[%s] ACS jitter buffer: %s",
+                        self._session_short,
+                        self._acs_inbound.jitter_buffer.stats.to_dict(),
+                    )
+            except Exception as e:
+                logger.debug("[%s] ACS inbound flush error: %s", self._session_short, e)
+
         # Stop threads
         if self._stt_thread:
             try:
@@ -748,6 +797,8 @@ class VoiceHandler:
         logger.info("[%s] Text barge-in triggered", self._session_short)
         await self.handle_barge_in()
         
+        get_turn_profiler().session(self._session_id).begin(TurnStage.STT_FINAL, from_speech=False)
+
         # Send user transcript envelope to UI
         await self._on_user_transcript(text)
         
@@ -762,6 +813,36 @@ class VoiceHandler:
         except Exception as e:
             logger.error("[%s] Text message orchestration error: %s", self._session_short, e, exc_info=True)
 
+    async def handle_media_text(self, text: str) -> None:
+        """
+        ACS mode: process one raw ACS WebSocket text frame.
+
+        Preferred entry point for the media endpoint: the frame is parsed
+        exactly once, and AudioData frames go straight to the recognizer via
+        the inbound decoder without building a message dict.
+
+        Args:
+            text: Raw JSON text frame from the ACS media WebSocket.
+        """
+        if self._acs_inbound is None:
+            try:
+                message = json.loads(text)
+            except json.JSONDecodeError:
+                logger.warning("[%s] Failed to parse message as JSON", self._session_short)
+                return
+            await self.handle_media_message(message)
+            return
+
+        result = self._acs_inbound.feed(text)
+        if result.kind == ACSMessageKind.AUDIO_DATA:
+            if not result.silent:
+                self._touch_activity()
+            return
+        if result.message is None:
+            logger.warning("[%s] Failed to parse message as JSON", self._session_short)
+            return
+        await self._dispatch_media_message(result.message)
+
     async def handle_media_message(self, message: dict) -> None:
         """
         ACS mode: process one ACS JSON message.
@@ -771,18 +852,29 @@ class VoiceHandler:
         """
         kind = message.get("kind")
 
-        if kind == ACSMessageKind.AUDIO_METADATA:
-            self._metadata_received = True
-            logger.info("[%s] ACS metadata received", self._session_short)
-
-        elif kind == ACSMessageKind.AUDIO_DATA:
+        if kind == ACSMessageKind.AUDIO_DATA:
             audio_section = message.get("audioData", {}) or {}
             audio_b64 = audio_section.get("data")
             if audio_b64:
                 if not audio_section.get("silent", False):
                     self._touch_activity()
-                audio_bytes = base64.b64decode(audio_b64)
-                self.write_audio(audio_bytes)
+                if self._acs_inbound:
+                    self._acs_inbound.feed_message(message)
+                else:
+                    self.write_audio(base64.b64decode(audio_b64))
+            return
+
+        if self._acs_inbound:
+            self._acs_inbound.feed_message(message)
+        await self._dispatch_media_message(message)
+
+    async def _dispatch_media_message(self, message: dict) -> None:
+        """Handle non-audio ACS messages (metadata, StopAudio, DTMF)."""
+        kind = message.get("kind")
+
+        if kind == ACSMessageKind.AUDIO_METADATA:
+            self._metadata_received = True
+            logger.info("[%s] ACS metadata received", self._session_short)
 
         elif kind == ACSMessageKind.STOP_AUDIO:
             logger.info("[%s] ACS StopAudio received", self._session_short)
@@ -1059,6 +1151,38 @@ class VoiceHandler:
 
         return wrapped
 
+    def _create_turn_speculator(self) -> TurnSpeculator | None:
+        """Create the speculative LLM starter for route_turn (None when disabled)."""
+        if not CASCADE_SPECULATIVE_LLM:
+            return None
+        from apps.artagent.backend.src.orchestration.unified import RouteTurnSpeculator
+
+        return RouteTurnSpeculator(
+            self._context.websocket, is_acs=self._transport in (TransportType.ACS,)
+        )
+
+    def _create_barge_in_vad(self) -> StreamingVAD | None:
+        """Create the local barge-in VAD for the STT thread (None when disabled)."""
+        if not CASCADE_VAD_BARGE_IN:
+            return None
+        from apps.artagent.backend.voice.speech_cascade.vad import StreamingVAD
+
+        return StreamingVAD(
+            playback_active=lambda: self._tts is not None and self._tts.is_playing,
+            min_speech_ms=CASCADE_VAD_MIN_SPEECH_MS,
+        )
+
+    def _create_jitter_buffer(self) -> InboundJitterBuffer | None:
+        """Create the ACS inbound jitter buffer (None when disabled)."""
+        if not ACS_JITTER_BUFFER:
+            return None
+        return InboundJitterBuffer(
+            self.write_audio,
+            release_ms=ACS_INBOUND_COALESCE_MS,
+            min_depth_ms=ACS_JITTER_MIN_DEPTH_MS,
+            max_depth_ms=ACS_JITTER_MAX_DEPTH_MS,
+        )
+
     # =========================================================================
     # Helpers
     # =========================================================================
@@ -15,6 +15,8 @@ Contents:
     - OrchestratorMetrics: Token tracking and TTFT metrics
     - GreetingService: Centralized greeting resolution
     - resolve_start_agent: Unified start agent resolution
+    - ConversationWindow: Token-bounded, incremental per-agent history window
+    - get_turn_profiler: Per-turn latency budget and critical-path breakdown
 
 Usage:
     from apps.artagent.backend.voice.shared import (
@@ -83,6 +85,20 @@ from .start_agent_resolver import (
     resolve_start_agent,
 )
 
+# Bounded conversation history
+from .context_window import (
+    ConversationWindow,
+    estimate_tokens,
+)
+
+# Turn latency budget profiler
+from .turn_profiler import (
+    LatencyBudgetProfiler,
+    TurnBreakdown,
+    TurnStage,
+    get_turn_profiler,
+)
+
 # Voice session context (Phase 3)
 from .context import (
     TransportType,
@@ -122,6 +138,14 @@ __all__ = [
     "resolve_start_agent",
     "StartAgentResult",
     "StartAgentSource",
+    # Conversation Window
+    "ConversationWindow",
+    "estimate_tokens",
+    # Turn Latency Profiler
+    "LatencyBudgetProfiler",
+    "TurnBreakdown",
+    "TurnStage",
+    "get_turn_profiler",
     # Voice Session Context (Phase 3)
     "TransportType",
     "VoiceSessionContext",
@@ -156,7 +156,7 @@ class VoiceSessionContext:
     session_id: str
     call_connection_id: str | None = None
     transport: TransportType = TransportType.ACS
-    conn_id: str | None = None  # Browser connection ID
+    conn_id: str | None = None  # Connection manager ID of the socket
 
     # ─── Pool Resources (acquired from pools) ───
     tts_client: Any = None  # SpeechSynthesizer
@@ -0,0 +1,318 @@
+"""
+Conversation Window
+===================
+
+Bounded, incrementally maintained view of an agent's chat history for LLM
+requests.
+
+Without a window every turn re-sends the whole history, so prompt tokens,
+serialization time and time-to-first-token all grow with call length. A
+:class:`ConversationWindow` follows one agent thread in ``MemoManager`` and
+only looks at messages appended since the previous turn, so per-turn cost is
+proportional to the window rather than the call.
+
+Layout of the history returned by :meth:`ConversationWindow.history`::
+
+    [summary]        optional system note folding evicted turns
+    [pinned tools]   most recent evicted tool exchanges (grounding)
+    [window]         newest whole turns that fit the token budget
+
+Eviction works on whole turns (a user message and everything up to the next
+user message), so assistant ``tool_calls`` messages always travel with their
+``tool`` results. When the budget is exceeded the window drops to a low-water
+mark instead of evicting one turn per request, which keeps the prompt prefix
+stable for several turns (friendlier to prompt caching).
+
+Messages are returned exactly as stored (tool exchanges stay JSON-encoded);
+the orchestrator's message builder expands them as before.
+
+Usage:
+    window = ConversationWindow(max_tokens=6000)
+    history = window.history(cm.get_history(agent_name))
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+try:
+    import tiktoken
+
+    _ENCODING = tiktoken.get_encoding("o200k_base")
+except Exception:  # pragma: no cover - optional dependency / offline cache
+    _ENCODING = None
+
+DEFAULT_MAX_TOKENS = int(os.getenv("CASCADE_HISTORY_MAX_TOKENS", "6000"))
+DEFAULT_PINNED_TOOL_TOKENS = int(os.getenv("CASCADE_HISTORY_PINNED_TOOL_TOKENS", "1200"))
+DEFAULT_SUMMARY_TOKENS = int(os.getenv("CASCADE_HISTORY_SUMMARY_TOKENS", "400"))
+DEFAULT_SUMMARIZE = os.getenv("CASCADE_HISTORY_SUMMARY", "true").lower() in ("1", "true", "yes")
+
+# Per-message framing overhead in the chat format (role, separators)
+MESSAGE_OVERHEAD_TOKENS = 4
+SUMMARY_PREFIX = "Summary of earlier conversation (older turns omitted):"
+_SUMMARY_LINE_CHARS = 160
+
+Summarizer = Callable[[str | None, list[dict[str, Any]]], str | None]
+
+
+def estimate_tokens(text: str | None) -> int:
+    """Token count for ``text``: tiktoken when available, else ~4 bytes per token."""
+    if not text:
+        return 0
+    if _ENCODING is not None:
+        return len(_ENCODING.encode(text, disallowed_special=()))
+    return (len(text.encode("utf-8")) + 3) // 4
+
+
+def message_tokens(message: dict[str, Any]) -> int:
+    """Estimated prompt tokens for one stored history message."""
+    content = message.get("content")
+    if content is not None and not isinstance(content, str):
+        content = json.dumps(content, ensure_ascii=False)
+    return estimate_tokens(content) + MESSAGE_OVERHEAD_TOKENS
+
+
+def _tool_call_names(message: dict[str, Any]) -> list[str] | None:
+    """Tool names if ``message`` is a stored assistant tool_calls message."""
+    if message.get("role") != "assistant":
+        return None
+    content = message.get("content")
+    if not isinstance(content, str) or not content.startswith("{"):
+        return None
+    try:
+        decoded = json.loads(content)
+    except (json.JSONDecodeError, TypeError):
+        return None
+    if not isinstance(decoded, dict) or not decoded.get("tool_calls"):
+        return None
+    return [(tc.get("function") or {}).get("name") or "tool" for tc in decoded["tool_calls"]]
+
+
+def extractive_summary(previous: str | None, evicted: list[dict[str, Any]]) -> str | None:
+    """
+    Default summarizer: caller statements and tool names from evicted turns.
+
+    Purely local (no LLM call), so folding never adds latency to a turn.
+    """
+    lines = previous.splitlines()[1:] if previous else []
+    for message in evicted:
+        role = message.get("role")
+        if role == "user":
+            text = " ".join(str(message.get("content") or "").split())
+            if text:
+                if len(text) > _SUMMARY_LINE_CHARS:
+                    text = text[: _SUMMARY_LINE_CHARS - 3].rstrip() + "..."
+                lines.append(f"- Caller: {text}")
+        else:
+            names = _tool_call_names(message)
+            if names:
+                lines.append(f"- Tools used: {', '.join(names)}")
+    if not lines:
+        return previous
+    return "\n".join([SUMMARY_PREFIX, *lines])
+
+
+@dataclass(slots=True)
+class _Turn:
+    """One user turn (or the pre-first-user preamble) and its token cost."""
+
+    messages: list[dict[str, Any]] = field(default_factory=list)
+    tokens: int = 0
+    tool_spans: list[tuple[int, int]] = field(default_factory=list)
+
+    def add(self, message: dict[str, Any], tokens: int) -> None:
+        index = len(self.messages)
+        self.messages.append(message)
+        self.tokens += tokens
+        role = message.get("role")
+        if role == "tool" and self.tool_spans and self.tool_spans[-1][1] == index:
+            start, _ = self.tool_spans[-1]
+            self.tool_spans[-1] = (start, index + 1)
+        elif _tool_call_names(message) is not None:
+            self.tool_spans.append((index, index + 1))
+
+    def tool_exchanges(self) -> list[list[dict[str, Any]]]:
+        """Assistant tool_calls messages with their (contiguous) tool results."""
+        return [self.messages[s:e] for s, e in self.tool_spans if e - s > 1]
+
+
+@dataclass
+class WindowStats:
+    """Counters describing what the window has done so far."""
+
+    ingested: int = 0
+    evicted_turns: int = 0
+    resets: int = 0
+    window_tokens: int = 0
+    pinned_tokens: int = 0
+    summary_tokens: int = 0
+
+    @property
+    def total_tokens(self) -> int:
+        return self.window_tokens + self.pinned_tokens + self.summary_tokens
+
+
+class ConversationWindow:
+    """
+    Token-bounded rolling window over one agent's chat history.
+
+    Args:
+        max_tokens: Budget for everything :meth:`history` returns. The newest
+            turn is always kept, even if it alone exceeds the budget.
+        pinned_tool_tokens: Share of the budget for evicted tool exchanges.
+            0 disables pinning.
+        summary_tokens: Share of the budget for the summary slot.
+        summarize: Fold evicted turns into a summary message.
+        summarizer: ``(previous_summary, evicted_messages) -> summary``;
+            defaults to :func:`extractive_summary`.
+        low_water_ratio: After an eviction the window is trimmed to this
+            fraction of its budget so the next few turns do not evict again.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_tokens: int = DEFAULT_MAX_TOKENS,
+        pinned_tool_tokens: int = DEFAULT_PINNED_TOOL_TOKENS,
+        summary_tokens: int = DEFAULT_SUMMARY_TOKENS,
+        summarize: bool = DEFAULT_SUMMARIZE,
+        summarizer: Summarizer | None = None,
+        low_water_ratio: float = 0.75,
+    ) -> None:
+        self.max_tokens = max_tokens
+        self.pinned_tool_tokens = max(0, min(pinned_tool_tokens, max_tokens // 2))
+        self.summary_tokens = max(0, min(summary_tokens, max_tokens // 4)) if summarize else 0
+        self.summarize = summarize
+        self.summarizer = summarizer or extractive_summary
+        self.low_water_ratio = low_water_ratio
+        self.stats = WindowStats()
+        self._reset(None)
+
+    def _reset(self, source: list[dict[str, Any]] | None) -> None:
+        self._source = source
+        self._consumed = 0
+        self._last_seen: dict[str, Any] | None = None
+        self._turns: deque[_Turn] = deque()
+        self._pinned: deque[tuple[list[dict[str, Any]], int]] = deque()
+        self._summary: str | None = None
+        self._summary_message: dict[str, str] | None = None
+        self.stats.window_tokens = self.stats.pinned_tokens = self.stats.summary_tokens = 0
+
+    @property
+    def window_budget(self) -> int:
+        """Tokens available to whole turns after pinned tools and summary."""
+        return max(0, self.max_tokens - self.stats.pinned_tokens - self.stats.summary_tokens)
+
+    def sync(self, source: list[dict[str, Any]]) -> None:
+        """
+        Ingest messages appended to ``source`` since the previous call.
+
+        ``source`` is normally the live list from ``MemoManager.get_history``.
+        If it was replaced, cleared or edited in place (anything other than
+        appends), the window rebuilds from scratch once.
+        """
+        consumed = self._consumed
+        if (
+            source is not self._source
+            or len(source) < consumed
+            or (consumed and source[consumed - 1] is not self._last_seen)
+        ):
+            if self._source is not None:
+                self.stats.resets += 1
+            self._reset(source)
+            consumed = 0
+        if len(source) == consumed:
+            return
+
+        for message in source[consumed:]:
+            if message.get("role") == "user" or not self._turns:
+                self._turns.append(_Turn())
+            tokens = message_tokens(message)
+            self._turns[-1].add(message, tokens)
+            self.stats.window_tokens += tokens
+        self.stats.ingested += len(source) - consumed
+        self._consumed = len(source)
+        self._last_seen = source[-1]
+
+        if self.stats.window_tokens > self.window_budget:
+            self._evict()
+
+    def _evict(self) -> None:
+        target = int(self.window_budget * self.low_water_ratio)
+        evicted: list[_Turn] = []
+        while len(self._turns) > 1 and self.stats.window_tokens > target:
+            turn = self._turns.popleft()
+            self.stats.window_tokens -= turn.tokens
+            evicted.append(turn)
+        if not evicted:
+            return
+        self.stats.evicted_turns += len(evicted)
+
+        if self.pinned_tool_tokens:
+            for turn in evicted:
+                for exchange in turn.tool_exchanges():
+                    self._pinned.append((exchange, sum(message_tokens(m) for m in exchange)))
+            pinned_tokens = sum(tokens for _, tokens in self._pinned)
+            while self._pinned and pinned_tokens > self.pinned_tool_tokens:
+                pinned_tokens -= self._pinned.popleft()[1]
+            self.stats.pinned_tokens = pinned_tokens
+
+        if self.summarize:
+            messages = [m for turn in evicted for m in turn.messages]
+            self._summary = self._fit_summary(self.summarizer(self._summary, messages))
+            self._summary_message = (
+                {"role": "system", "content": self._summary} if self._summary else None
+            )
+            self.stats.summary_tokens = (
+                message_tokens(self._summary_message) if self._summary_message else 0
+            )
+
+        # Pinned tools / summary may have grown into the window's share
+        while len(self._turns) > 1 and self.stats.window_tokens > self.window_budget:
+            turn = self._turns.popleft()
+            self.stats.window_tokens -= turn.tokens
+            self.stats.evicted_turns += 1
+
+    def _fit_summary(self, summary: str | None) -> str | None:
+        """Drop the oldest summary lines until the summary fits its slot."""
+        if not summary or estimate_tokens(summary) <= self.summary_tokens:
+            return summary
+        header, *lines = summary.splitlines()
+        while lines and estimate_tokens("\n".join([header, *lines])) > self.summary_tokens:
+            lines.pop(0)
+        return "\n".join([header, *lines]) if lines else None
+
+    @property
+    def summary_message(self) -> dict[str, str] | None:
+        """System message folding evicted turns (first in :meth:`messages`), if any."""
+        return self._summary_message
+
+    def messages(self) -> list[dict[str, Any]]:
+        """Current bounded history (summary, pinned tool exchanges, recent turns)."""
+        result: list[dict[str, Any]] = []
+        if self._summary_message:
+            result.append(self._summary_message)
+        for exchange, _ in self._pinned:
+            result.extend(exchange)
+        for turn in self._turns:
+            result.extend(turn.messages)
+        return result
+
+    def history(self, source: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """:meth:`sync` with ``source`` and return :meth:`messages`."""
+        self.sync(source)
+        return self.messages()
+
+
+__all__ = [
+    "ConversationWindow",
+    "WindowStats",
+    "estimate_tokens",
+    "extractive_summary",
+    "message_tokens",
+]
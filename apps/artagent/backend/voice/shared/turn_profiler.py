@@ -0,0 +1,442 @@
+"""
+Turn Latency Profiler
+=====================
+
+Always-on, per-turn latency budget accounting for the voice pipelines.
+
+Stage timings for a turn are otherwise scattered across the cascade and
+VoiceLive metrics modules, core-memory latency samples and trace spans. The
+profiler records a monotonic mark for each pipeline stage a turn passes
+through, in a small preallocated per-session buffer, and when the first
+response audio reaches the caller it turns the marks into a critical-path
+breakdown: each interval between consecutive marks is attributed to the
+stage that ended it (e.g. ``LLM_REQUEST → LLM_FIRST_TOKEN`` is ``llm_ttft``).
+
+Marks are only taken while a turn is open, so greetings and announcements
+cost a single attribute check. A turn opens on the final transcript (cascade,
+starting from the last recognized speech when known) or on VAD speech end
+(VoiceLive), and is abandoned on barge-in.
+
+Completed turns feed process-wide aggregates (per-segment mean/p50/p95 and
+share of total) exposed by :meth:`LatencyBudgetProfiler.breakdown`, OTel
+histograms, and a warning for turns over ``TURN_LATENCY_BUDGET_MS``.
+
+Usage:
+    from apps.artagent.backend.voice.shared.turn_profiler import (
+        TurnStage,
+        get_turn_profiler,
+    )
+
+    profile = get_turn_profiler().session(session_id)
+    profile.begin(TurnStage.STT_FINAL)
+    profile.mark(TurnStage.LLM_REQUEST)
+    ...
+    profile.mark(TurnStage.AUDIO_OUT)  # closes the turn
+
+    get_turn_profiler().breakdown()
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from array import array
+from collections import OrderedDict, deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from enum import IntEnum
+from time import perf_counter
+from typing import Any
+
+from apps.artagent.backend.voice.shared.metrics_factory import LazyHistogram, LazyMeter
+from utils.ml_logging import get_logger
+
+logger = get_logger("voice.shared.turn_profiler")
+
+DEFAULT_BUDGET_MS = float(os.getenv("TURN_LATENCY_BUDGET_MS", "1500"))
+# Marks kept per turn; a turn with a 5-iteration tool loop needs about 25
+MARK_CAPACITY = 32
+# Completed turns kept per segment for percentiles
+SAMPLE_WINDOW = 1000
+DEFAULT_MAX_SESSIONS = 1024
+
+
+class TurnStage(IntEnum):
+    """Pipeline points a turn passes through, in nominal order."""
+
+    SPEECH_END = 0  # last recognized speech (cascade) / VAD speech stopped (VoiceLive)
+    STT_FINAL = 1  # final transcript available
+    TURN_DEQUEUED = 2  # route-turn loop picked the final transcript up
+    LLM_REQUEST = 3  # chat request sent (or speculative stream adopted)
+    LLM_FIRST_TOKEN = 4  # first content or tool-call delta
+    TOOL_START = 5
+    TOOL_END = 6
+    TTS_REQUEST = 7  # first speakable sentence handed to TTS
+    TTS_START = 8  # synthesis started (after playback lock and pool acquire)
+    TTS_FIRST_AUDIO = 9  # synthesized audio available
+    AUDIO_OUT = 10  # first audio frame written to the caller (closes the turn)
+
+
+# Critical-path segment for the interval that ends at each stage
+SEGMENTS: tuple[str, ...] = (
+    "speech_end",
+    "stt_finalization",
+    "queue_wait",
+    "turn_setup",
+    "llm_ttft",
+    "llm_stream",
+    "tool",
+    "llm_stream",
+    "tts_queue",
+    "tts_ttfb",
+    "pacing",
+)
+
+_meter = LazyMeter("voice.turn_profiler", version="1.0.0")
+
+_segment_histogram: LazyHistogram = _meter.histogram(
+    name="voice.turn.critical_path",
+    description="Critical-path time per turn segment in milliseconds",
+    unit="ms",
+)
+
+_turn_histogram: LazyHistogram = _meter.histogram(
+    name="voice.turn.time_to_first_audio",
+    description="Turn start to first response audio in milliseconds",
+    unit="ms",
+)
+
+
+@dataclass
+class TurnBreakdown:
+    """Critical-path breakdown of one completed turn."""
+
+    session_id: str
+    turn: int
+    total_ms: float
+    critical_path: list[tuple[str, float]]
+    segments: dict[str, float]
+    budget_ms: float
+
+    @property
+    def over_budget(self) -> bool:
+        return self.total_ms > self.budget_ms
+
+    @property
+    def dominant(self) -> str | None:
+        """Segment that contributed the most time."""
+        return max(self.segments, key=self.segments.__getitem__) if self.segments else None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "session_id": self.session_id,
+            "turn": self.turn,
+            "total_ms": round(self.total_ms, 2),
+            "over_budget": self.over_budget,
+            "dominant": self.dominant,
+            "critical_path": [[name, round(ms, 2)] for name, ms in self.critical_path],
+        }
+
+
+class TurnProfile:
+    """
+    Preallocated stage-mark buffer for one session.
+
+    Safe to mark from the Speech SDK callback threads and the event loop.
+    """
+
+    __slots__ = (
+        "session_id",
+        "turns",
+        "dropped",
+        "_profiler",
+        "_clock",
+        "_lock",
+        "_stages",
+        "_times",
+        "_count",
+        "_open",
+        "_last_speech",
+        "_turn_end",
+    )
+
+    def __init__(self, session_id: str, profiler: LatencyBudgetProfiler) -> None:
+        self.session_id = session_id
+        self.turns = 0
+        self.dropped = 0
+        self._profiler = profiler
+        self._clock = profiler.clock
+        self._lock = threading.Lock()
+        self._stages = bytearray(MARK_CAPACITY)
+        self._times = array("d", bytes(8 * MARK_CAPACITY))
+        self._count = 0
+        self._open = False
+        self._last_speech: float | None = None
+        self._turn_end = 0.0
+
+    @property
+    def active(self) -> bool:
+        """Whether a turn is currently being profiled."""
+        return self._open
+
+    def speech(self) -> None:
+        """Note recognized speech; the latest note before :meth:`begin` starts the turn."""
+        self._last_speech = self._clock()
+
+    def begin(self, stage: TurnStage = TurnStage.STT_FINAL, *, from_speech: bool = True) -> None:
+        """
+        Open a turn at ``stage``, abandoning any turn still open.
+
+        With ``from_speech`` the turn starts at the last :meth:`speech` note
+        (when newer than the previous turn), so STT finalization is included.
+        """
+        with self._lock:
+            now = self._clock()
+            if self._open:
+                self._profiler._abandoned += 1
+            self._open = True
+            self._count = 0
+            last_speech, self._last_speech = self._last_speech, None
+            if (
+                from_speech
+                and stage != TurnStage.SPEECH_END
+                and last_speech
+                and last_speech > self._turn_end
+            ):
+                self._append(TurnStage.SPEECH_END, last_speech)
+            self._append(stage, now)
+
+    def mark(self, stage: TurnStage) -> TurnBreakdown | None:
+        """Record ``stage`` for the open turn; ``AUDIO_OUT`` completes it."""
+        if not self._open:
+            return None
+        with self._lock:
+            if not self._open:
+                return None
+            now = self._clock()
+            self._append(stage, now)
+            if stage != TurnStage.AUDIO_OUT:
+                return None
+            marks = list(zip(self._stages[: self._count], self._times[: self._count], strict=True))
+            self._open = False
+            self._turn_end = now
+            self.turns += 1
+            turn = self.turns
+        return self._profiler._complete(self.session_id, turn, marks)
+
+    def abandon(self) -> None:
+        """Drop the open turn (barge-in, cancellation)."""
+        if not self._open:
+            return
+        with self._lock:
+            if self._open:
+                self._open = False
+                self._profiler._abandoned += 1
+
+    def _append(self, stage: int, at: float) -> None:
+        n = self._count
+        if n == MARK_CAPACITY:
+            # Keep the closing mark; overwrite the last intermediate one
+            self.dropped += 1
+            n -= 1
+        self._stages[n] = stage
+        self._times[n] = at
+        self._count = n + 1
+
+
+def critical_path(marks: list[tuple[int, float]]) -> list[tuple[str, float]]:
+    """Attribute the time between consecutive marks to the stage that ended it."""
+    ordered = sorted(marks, key=lambda mark: mark[1])
+    path: list[tuple[str, float]] = []
+    previous = ordered[0][1]
+    for stage, at in ordered[1:]:
+        name = SEGMENTS[stage]
+        elapsed = (at - previous) * 1000
+        if path and path[-1][0] == name:
+            path[-1] = (name, path[-1][1] + elapsed)
+        else:
+            path.append((name, elapsed))
+        previous = at
+    return path
+
+
+@dataclass
+class _SegmentSamples:
+    total_ms: float = 0.0
+    turns: int = 0
+    recent: deque[float] = field(default_factory=lambda: deque(maxlen=SAMPLE_WINDOW))
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    return samples[min(len(samples) - 1, int(len(samples) * pct))]
+
+
+class LatencyBudgetProfiler:
+    """
+    Per-session turn profiles plus process-wide budget aggregates.
+
+    Args:
+        budget_ms: Turns whose time to first audio exceeds this are flagged.
+        max_sessions: Least recently used session profiles beyond this are evicted.
+        clock: Monotonic time source in seconds for stage marks.
+    """
+
+    def __init__(
+        self,
+        budget_ms: float = DEFAULT_BUDGET_MS,
+        *,
+        max_sessions: int = DEFAULT_MAX_SESSIONS,
+        clock: Callable[[], float] = perf_counter,
+    ) -> None:
+        self.budget_ms = budget_ms
+        self.clock = clock
+        self._max_sessions = max_sessions
+        self._lock = threading.Lock()
+        self._sessions: OrderedDict[str, TurnProfile] = OrderedDict()
+        self._reset_aggregates()
+
+    def _reset_aggregates(self) -> None:
+        self._turns = 0
+        self._over_budget = 0
+        self._abandoned = 0
+        self._totals = _SegmentSamples()
+        self._segments: dict[str, _SegmentSamples] = {}
+        self._recent_over_budget: deque[TurnBreakdown] = deque(maxlen=20)
+
+    def session(self, session_id: str) -> TurnProfile:
+        """Return (creating if needed) the profile for ``session_id``."""
+        profile = self._sessions.get(session_id)
+        if profile is not None:
+            return profile
+        with self._lock:
+            profile = self._sessions.get(session_id)
+            if profile is None:
+                profile = self._sessions[session_id] = TurnProfile(session_id, self)
+                while len(self._sessions) > self._max_sessions:
+                    self._sessions.popitem(last=False)
+            return profile
+
+    def mark(self, session_id: str | None, stage: TurnStage) -> TurnBreakdown | None:
+        """Record ``stage`` for a session's open turn (no-op without a session)."""
+        if not session_id:
+            return None
+        return self.session(session_id).mark(stage)
+
+    def discard(self, session_id: str) -> None:
+        """Forget a finished session's profile."""
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+    def _complete(
+        self, session_id: str, turn: int, marks: list[tuple[int, float]]
+    ) -> TurnBreakdown:
+        path = critical_path(marks)
+        segments: dict[str, float] = {}
+        for name, elapsed in path:
+            segments[name] = segments.get(name, 0.0) + elapsed
+        result = TurnBreakdown(
+            session_id=session_id,
+            turn=turn,
+            total_ms=sum(segments.values()),
+            critical_path=path,
+            segments=segments,
+            budget_ms=self.budget_ms,
+        )
+
+        with self._lock:
+            self._turns += 1
+            self._add(self._totals, result.total_ms)
+            for name, elapsed in segments.items():
+                samples = self._segments.get(name)
+                if samples is None:
+                    samples = self._segments[name] = _SegmentSamples()
+                self._add(samples, elapsed)
+            if result.over_budget:
+                self._over_budget += 1
+                self._recent_over_budget.append(result)
+
+        _turn_histogram.record(result.total_ms, attributes={"session.id": session_id})
+        for name, elapsed in segments.items():
+            _segment_histogram.record(elapsed, attributes={"turn.segment": name})
+        if result.over_budget:
+            logger.warning(
+                "Turn over latency budget | session=%s turn=%d total=%.0fms budget=%.0fms "
+                "dominant=%s path=%s",
+                session_id,
+                turn,
+                result.total_ms,
+                self.budget_ms,
+                result.dominant,
+                " > ".join(f"{name}={elapsed:.0f}" for name, elapsed in path),
+            )
+        return result
+
+    @staticmethod
+    def _add(samples: _SegmentSamples, elapsed: float) -> None:
+        samples.total_ms += elapsed
+        samples.turns += 1
+        samples.recent.append(elapsed)
+
+    def breakdown(self) -> dict[str, Any]:
+        """Aggregate budget breakdown across completed turns."""
+        with self._lock:
+            totals = sorted(self._totals.recent)
+            segments = {
+                name: (samples.total_ms, samples.turns, sorted(samples.recent))
+                for name, samples in self._segments.items()
+            }
+            turns = self._turns
+            summary = {
+                "budget_ms": self.budget_ms,
+                "turns": turns,
+                "over_budget": self._over_budget,
+                "abandoned": self._abandoned,
+                "recent_over_budget": [item.to_dict() for item in self._recent_over_budget],
+            }
+            grand_total = self._totals.total_ms
+
+        if totals:
+            summary["time_to_first_audio_ms"] = {
+                "mean": round(grand_total / turns, 2),
+                "p50": round(_percentile(totals, 0.5), 2),
+                "p95": round(_percentile(totals, 0.95), 2),
+            }
+        summary["segments"] = {
+            name: {
+                "turns": count,
+                # Mean over all completed turns, so segment means add up to the turn mean
+                "mean_ms": round(total / turns, 2),
+                "p50_ms": round(_percentile(recent, 0.5), 2),
+                "p95_ms": round(_percentile(recent, 0.95), 2),
+                "share": round(total / grand_total, 4) if grand_total else 0.0,
+            }
+            for name, (total, count, recent) in sorted(
+                segments.items(), key=lambda item: item[1][0], reverse=True
+            )
+        }
+        return summary
+
+    def clear(self) -> None:
+        """Reset sessions and aggregates (for testing)."""
+        with self._lock:
+            self._sessions.clear()
+            self._reset_aggregates()
+
+
+_profiler = LatencyBudgetProfiler()
+
+
+def get_turn_profiler() -> LatencyBudgetProfiler:
+    """Return the process-wide turn latency profiler."""
+    return _profiler
+
+
+__all__ = [
+    "LatencyBudgetProfiler",
+    "SEGMENTS",
+    "TurnBreakdown",
+    "TurnProfile",
+    "TurnStage",
+    "critical_path",
+    "get_turn_profiler",
+]
@@ -52,6 +52,7 @@ _HANDLER_EXPORTS = {
     "SpeechSDKThread",
     "ThreadBridge",
     "TranscriptEmitter",
+    "TurnSpeculator",
 }
 
 
@@ -74,6 +75,7 @@ __all__ = [
     "BargeInController",
     "ResponseSender",
     "TranscriptEmitter",
+    "TurnSpeculator",
     # Orchestrator shim (direct import)
     "CascadeOrchestratorAdapter",
     "StateKeys",  # Re-export of SessionStateKeys for backward compatibility
@@ -0,0 +1,359 @@
+"""
+ACS Inbound Media Decoder
+=========================
+
+Single decoding path for ACS media WebSocket messages in MEDIA mode.
+
+ACS sends one JSON text frame per 20 ms of caller audio (50 fps per call).
+This module parses each frame exactly once, recognizes the dominant
+``AudioData`` case by string inspection instead of a full ``json.loads``,
+and coalesces small PCM frames into larger recognizer pushes.
+
+Hot-path properties:
+    - AudioData frames are never run through ``json.loads`` unless their
+      layout is unexpected (escaped payloads, missing fields).
+    - Base64 payloads are decoded once and copied into a preallocated
+      coalescing buffer; the recognizer receives one ``bytes`` object per
+      flush, not per frame.
+    - Silent frames are not decoded at all: their PCM length is derived from
+      the base64 length and zeros are copied from a preallocated buffer.
+
+With an ``InboundJitterBuffer`` attached, frames are handed to it keyed on
+their ACS ``timestamp`` instead of being coalesced here; the buffer releases
+them to its own sink at a steady cadence.
+
+Usage:
+    decoder = ACSInboundDecoder(handler.write_audio, coalesce_ms=40)
+    result = decoder.feed(msg_text)
+    if result.kind == ACSInboundDecoder.AUDIO_DATA:
+        ...  # audio already delivered to write_audio
+    elif result.message is not None:
+        ...  # non-audio message, parsed once
+    decoder.flush()  # on shutdown
+"""
+
+from __future__ import annotations
+
+import binascii
+import re
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from utils import json_codec
+from utils.ml_logging import get_logger
+
+if TYPE_CHECKING:
+    from .jitter_buffer import InboundJitterBuffer
+
+logger = get_logger("voice.speech_cascade.acs_inbound")
+
+ACS_DEFAULT_SAMPLE_RATE: int = 16000
+ACS_FRAME_MS: int = 20
+_BYTES_PER_SAMPLE: int = 2
+
+_AUDIO_KIND_TOKEN = '"AudioData"'
+# Opening of the base64 value; the closing quote is found with str.find
+_DATA_VALUE_START = re.compile(r'"data"\s*:\s*"')
+_SILENT_VALUE = re.compile(r'"silent"\s*:\s*(?:(true)|false)')
+_TIMESTAMP_VALUE = re.compile(r'"timestamp"\s*:\s*"([^"]*)"')
+
+
+class InboundResult(NamedTuple):
+    """Outcome of decoding one ACS message."""
+
+    kind: str | None
+    message: dict[str, Any] | None = None
+    silent: bool = False
+
+
+@dataclass
+class InboundStats:
+    """Counters for the inbound decoding path."""
+
+    frames: int = 0
+    silent_frames: int = 0
+    fast_path_frames: int = 0
+    fallback_parses: int = 0
+    decode_errors: int = 0
+    audio_bytes: int = 0
+    pushes: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        """Return counters as a plain dict (for telemetry)."""
+        return dict(self.__dict__)
+
+
+# Shared results for the per-frame fast path (immutable, no per-frame allocation)
+_VOICED_AUDIO = InboundResult("AudioData", None, False)
+_SILENT_AUDIO = InboundResult("AudioData", None, True)
+
+
+def _data_value_bounds(text: str) -> tuple[int, int] | None:
+    """Locate the raw (unescaped) base64 ``data`` value without parsing JSON."""
+    match = _DATA_VALUE_START.search(text)
+    if match is None:
+        return None
+    start = match.end()
+    end = text.find('"', start)
+    if end < 0:
+        return None
+    return start, end
+
+
+def _silent_value(text: str, after: int) -> bool:
+    """Read the ``silent`` flag, which ACS emits after ``data``."""
+    match = _SILENT_VALUE.search(text, after) or _SILENT_VALUE.search(text)
+    return match is not None and match.group(1) is not None
+
+
+def acs_timestamp_ms(value: Any) -> float | None:
+    """ACS ISO-8601 ``timestamp`` as epoch milliseconds (None if absent or invalid)."""
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        return datetime.fromisoformat(value).timestamp() * 1000.0
+    except ValueError:
+        return None
+
+
+def _b64_decoded_length(text: str, start: int, end: int) -> int:
+    """PCM byte count encoded by the base64 slice ``text[start:end]``."""
+    length = end - start
+    padding = 0
+    if length and text[end - 1] == "=":
+        padding = 2 if length > 1 and text[end - 2] == "=" else 1
+    return (length // 4) * 3 - padding
+
+
+class ACSInboundDecoder:
+    """
+    Parse-once decoder that feeds coalesced PCM to a recognizer sink.
+
+    Not thread-safe: feed it from the WebSocket receive loop only.
+    """
+
+    AUDIO_METADATA = "AudioMetadata"
+    AUDIO_DATA = "AudioData"
+
+    def __init__(
+        self,
+        write_audio: Callable[[bytes], None],
+        *,
+        coalesce_ms: int = ACS_FRAME_MS,
+        sample_rate: int = ACS_DEFAULT_SAMPLE_RATE,
+        jitter_buffer: InboundJitterBuffer | None = None,
+    ) -> None:
+        """
+        Create a decoder.
+
+        Args:
+            write_audio: Sink that receives PCM16LE bytes (e.g. recognizer push).
+            coalesce_ms: Audio to accumulate before each push. Values at or
+                below one ACS frame (20 ms) push every frame as it arrives.
+            sample_rate: Initial PCM sample rate; updated from AudioMetadata.
+            jitter_buffer: Optional timestamp-ordered playout buffer. When set,
+                audio frames go to it instead of the coalescing buffer and it
+                writes to its own sink.
+        """
+        self._write_audio = write_audio
+        self.jitter_buffer = jitter_buffer
+        self._coalesce_ms = max(ACS_FRAME_MS, int(coalesce_ms))
+        self.stats = InboundStats()
+        self._fill = 0
+        self._silence: dict[int, bytes] = {}
+        self._configure(sample_rate)
+
+    # ------------------------------------------------------------------
+    # Buffer management
+    # ------------------------------------------------------------------
+
+    def _configure(self, sample_rate: int) -> None:
+        """(Re)size the coalescing buffer for ``sample_rate``."""
+        self._sample_rate = int(sample_rate)
+        bytes_per_ms = self._sample_rate * _BYTES_PER_SAMPLE // 1000
+        self._flush_bytes = bytes_per_ms * self._coalesce_ms
+        # Room for one full window plus an oversized frame without reallocating
+        capacity = self._flush_bytes + bytes_per_ms * ACS_FRAME_MS * 4
+        if self._fill:
+            self.flush()
+        self._buffer = bytearray(capacity)
+        self._view = memoryview(self._buffer)
+        self._zeros = memoryview(bytes(capacity))
+
+    def _ensure_capacity(self, extra: int) -> None:
+        needed = self._fill + extra
+        if needed <= len(self._buffer):
+            return
+        grown = bytearray(max(needed, len(self._buffer) * 2))
+        grown[: self._fill] = self._view[: self._fill]
+        self._buffer = grown
+        self._view = memoryview(grown)
+        self._zeros = memoryview(bytes(len(grown)))
+
+    def _push(self, chunk: bytes) -> None:
+        self.stats.pushes += 1
+        self._write_audio(chunk)
+
+    def flush(self) -> None:
+        """Push any buffered audio to the sink."""
+        if self.jitter_buffer is not None:
+            self.jitter_buffer.flush()
+        if not self._fill:
+            return
+        chunk = bytes(self._view[: self._fill])
+        self._fill = 0
+        self._push(chunk)
+
+    def close(self) -> None:
+        """Flush buffered audio and stop the jitter buffer's pacer."""
+        if self.jitter_buffer is not None:
+            self.jitter_buffer.close()
+        self.flush()
+
+    def _silence_of(self, size: int) -> bytes:
+        silence = self._silence.get(size)
+        if silence is None:
+            if len(self._silence) >= 8:
+                self._silence.clear()
+            silence = self._silence[size] = bytes(size)
+        return silence
+
+    def _buffer_frame(self, text: str, start: int, end: int, silent: bool, timestamp: Any) -> bool:
+        """Decode (or zero-fill) one frame into the jitter buffer."""
+        if silent:
+            size = _b64_decoded_length(text, start, end)
+            if size <= 0:
+                return True
+            pcm = self._silence_of(size)
+        else:
+            try:
+                pcm = binascii.a2b_base64(text[start:end])
+            except (binascii.Error, ValueError) as exc:
+                self.stats.decode_errors += 1
+                logger.debug("ACS audio decode error: %s", exc)
+                return False
+        self.stats.audio_bytes += len(pcm)
+        self.jitter_buffer.push(acs_timestamp_ms(timestamp), pcm, silent)
+        return True
+
+    def _append_pcm(self, text: str, start: int, end: int, silent: bool) -> bool:
+        """Decode (or zero-fill) one frame into the coalescing buffer."""
+        passthrough = self._coalesce_ms == ACS_FRAME_MS and not self._fill
+
+        if silent:
+            size = _b64_decoded_length(text, start, end)
+            if size <= 0:
+                return True
+            if passthrough:
+                self.stats.audio_bytes += size
+                self._push(self._silence_of(size))
+                return True
+            self._ensure_capacity(size)
+            self._view[self._fill : self._fill + size] = self._zeros[:size]
+        else:
+            try:
+                pcm = binascii.a2b_base64(text[start:end])
+            except (binascii.Error, ValueError) as exc:
+                self.stats.decode_errors += 1
+                logger.debug("ACS audio decode error: %s", exc)
+                return False
+            size = len(pcm)
+            if not size:
+                return True
+            if passthrough:
+                self.stats.audio_bytes += size
+                self._push(pcm)
+                return True
+            self._ensure_capacity(size)
+            self._view[self._fill : self._fill + size] = pcm
+
+        self._fill += size
+        self.stats.audio_bytes += size
+        if self._fill >= self._flush_bytes:
+            self.flush()
+        return True
+
+    # ------------------------------------------------------------------
+    # Decoding
+    # ------------------------------------------------------------------
+
+    def feed(self, text: str) -> InboundResult:
+        """
+        Decode one ACS text frame.
+
+        AudioData frames are delivered to the sink (possibly after
+        coalescing) and return ``InboundResult(kind="AudioData", silent=...)``
+        with no parsed message. Every other message kind is parsed once and
+        returned in ``message``. Invalid JSON returns ``kind=None``.
+        """
+        if _AUDIO_KIND_TOKEN in text:
+            bounds = _data_value_bounds(text)
+            # Escaped payloads (e.g. "\\/") need a real JSON parser
+            if bounds is not None and text.find("\\", *bounds) < 0:
+                start, end = bounds
+                silent = _silent_value(text, end)
+                stats = self.stats
+                stats.frames += 1
+                stats.fast_path_frames += 1
+                if silent:
+                    stats.silent_frames += 1
+                if self.jitter_buffer is not None:
+                    timestamp = _TIMESTAMP_VALUE.search(text)
+                    self._buffer_frame(
+                        text, start, end, silent, timestamp.group(1) if timestamp else None
+                    )
+                else:
+                    self._append_pcm(text, start, end, silent)
+                return _SILENT_AUDIO if silent else _VOICED_AUDIO
+
+        try:
+            message = json_codec.loads(text)
+        except (json_codec.JSONDecodeError, TypeError):
+            return InboundResult(None)
+        if not isinstance(message, dict):
+            return InboundResult(None)
+
+        self.stats.fallback_parses += 1
+        return self.feed_message(message)
+
+    def feed_message(self, message: dict[str, Any]) -> InboundResult:
+        """Handle an already-parsed ACS message (compatibility path)."""
+        kind = message.get("kind")
+
+        if kind == self.AUDIO_DATA:
+            section = message.get("audioData") or message.get("AudioData") or {}
+            silent = bool(section.get("silent", False))
+            b64 = section.get("data")
+            if isinstance(b64, str) and b64:
+                self.stats.frames += 1
+                if silent:
+                    self.stats.silent_frames += 1
+                if self.jitter_buffer is not None:
+                    self._buffer_frame(b64, 0, len(b64), silent, section.get("timestamp"))
+                else:
+                    self._append_pcm(b64, 0, len(b64), silent)
+            return InboundResult(self.AUDIO_DATA, None, silent)
+
+        if kind == self.AUDIO_METADATA:
+            section = message.get("audioMetadata") or message.get("AudioMetadata") or {}
+            sample_rate = section.get("sampleRate")
+            if (
+                isinstance(sample_rate, int)
+                and sample_rate > 0
+                and sample_rate != self._sample_rate
+            ):
+                self._configure(sample_rate)
+
+        return InboundResult(kind, message)
+
+
+__all__ = [
+    "ACSInboundDecoder",
+    "ACS_DEFAULT_SAMPLE_RATE",
+    "ACS_FRAME_MS",
+    "acs_timestamp_ms",
+    "InboundResult",
+    "InboundStats",
+]
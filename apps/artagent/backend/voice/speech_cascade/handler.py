@@ -9,6 +9,7 @@ can be composed with different transport handlers (ACS, VoiceLive, WebRTC, etc.)
 🧵 Thread 1: Speech SDK Thread (Never Blocks)
 - Continuous audio recognition
 - Immediate barge-in detection via on_partial callbacks
+- Stable partials forwarded for optional speculative LLM starts
 - Cross-thread communication via run_coroutine_threadsafe
 
 🧵 Thread 2: Route Turn Thread (Blocks on Queue Only)
@@ -46,6 +47,16 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import TYPE_CHECKING, Any, Protocol
 
+from apps.artagent.backend.voice.shared.turn_profiler import (
+    TurnProfile,
+    TurnStage,
+    get_turn_profiler,
+)
+from apps.artagent.backend.voice.speech_cascade.metrics import record_barge_in
+from apps.artagent.backend.voice.speech_cascade.speculation import (
+    DEFAULT_STABLE_MS,
+    normalize_transcript,
+)
 from opentelemetry import trace
 from opentelemetry.trace import SpanKind
 from src.speech.speech_recognizer import StreamingSpeechRecognizerFromBytes
@@ -54,7 +65,7 @@ from utils.ml_logging import get_logger
 from utils.telemetry_decorators import ConversationTurnSpan
 
 if TYPE_CHECKING:
-    pass
+    from apps.artagent.backend.voice.speech_cascade.vad import StreamingVAD
 
 logger = get_logger("v1.handlers.speech_cascade_handler")
 tracer = trace.get_tracer(__name__)
@@ -122,6 +133,18 @@ class TranscriptEmitter(Protocol):
         ...
 
 
+class TurnSpeculator(Protocol):
+    """Protocol for opening a turn's LLM request before the final transcript."""
+
+    async def start(self, cm: MemoManager, transcript: str) -> bool:
+        """Start a speculative request for ``transcript`` (no audio, no tools)."""
+        ...
+
+    def cancel(self) -> None:
+        """Cancel the pending speculative request, if any."""
+        ...
+
+
 class ThreadBridge:
     """
     Cross-thread communication bridge.
@@ -216,6 +239,33 @@ class ThreadBridge:
         except Exception as e:
             logger.error(f"[{self.connection_id}] Failed to schedule barge-in: {e}")
 
+    def schedule_partial_transcript(self, text: str, language: str | None = None) -> None:
+        """
+        Forward a partial transcript to the Route Turn Thread for speculation.
+
+        Skipped while barge-in is suppressed, since greeting/handoff audio can
+        echo back as partials.
+
+        Args:
+            text: Partial transcript text.
+            language: Detected language, if any.
+        """
+        if self._suppress_barge_in.is_set():
+            return
+        route_turn_thread = (
+            self._route_turn_thread_ref() if self._route_turn_thread_ref is not None else None
+        )
+        if route_turn_thread is None or not route_turn_thread.speculation_enabled:
+            return
+        if not self.main_loop or self.main_loop.is_closed():
+            return
+        try:
+            self.main_loop.call_soon_threadsafe(
+                route_turn_thread.on_partial_transcript, text, language
+            )
+        except RuntimeError:
+            logger.debug(f"[{self.connection_id}] Loop closed; partial transcript dropped")
+
     def queue_speech_result(self, speech_queue: asyncio.Queue, event: SpeechEvent) -> None:
         """
         Queue speech recognition result for Route Turn Thread processing.
@@ -317,6 +367,8 @@ class SpeechSDKThread:
         speech_queue: asyncio.Queue,
         *,
         on_partial_transcript: Callable[[str, str, str | None], None] | None = None,
+        turn_profile: TurnProfile | None = None,
+        vad: StreamingVAD | None = None,
     ):
         """
         Initialize Speech SDK Thread.
@@ -328,6 +380,9 @@ class SpeechSDKThread:
             barge_in_handler: Handler to call on barge-in detection.
             speech_queue: Queue for final speech results.
             on_partial_transcript: Optional callback for partial transcripts.
+            turn_profile: Optional latency profile; final results open its turns.
+            vad: Optional local VAD; speech onsets during playback trigger barge-in
+                without waiting for a partial result.
         """
         self.connection_id = connection_id
         self._conn_short = connection_id[-8:] if connection_id else "unknown"
@@ -336,6 +391,8 @@ class SpeechSDKThread:
         self.barge_in_handler = barge_in_handler
         self.speech_queue = speech_queue
         self.on_partial_transcript = on_partial_transcript
+        self.turn_profile = turn_profile
+        self.vad = vad
 
         self.thread_obj: threading.Thread | None = None
         self.thread_running = False
@@ -373,12 +430,16 @@ class SpeechSDKThread:
             logger.info(
                 f"[{self._conn_short}] Partial speech: '{text}' ({lang}) len={len(text.strip())}"
             )
+            if self.turn_profile is not None:
+                self.turn_profile.speech()
             if len(text.strip()) > 3:
                 try:
                     self.thread_bridge.schedule_barge_in(self.barge_in_handler)
                 except Exception as e:
                     logger.error(f"[{self._conn_short}] Barge-in error: {e}")
 
+                self.thread_bridge.schedule_partial_transcript(text.strip(), lang)
+
                 if self.on_partial_transcript:
                     try:
                         self.on_partial_transcript(text.strip(), lang, speaker_id)
@@ -392,6 +453,8 @@ class SpeechSDKThread:
 
             if len(text.strip()) > 1:
                 logger.info(f"[{self._conn_short}] Speech: '{text}' ({lang})")
+                if self.turn_profile is not None:
+                    self.turn_profile.begin(TurnStage.STT_FINAL)
                 event = SpeechEvent(
                     event_type=SpeechEventType.FINAL,
                     text=text,
@@ -457,6 +520,34 @@ class SpeechSDKThread:
         """
         if self.recognizer:
             self.recognizer.write_bytes(audio_bytes)
+        if self.vad is not None:
+            self._detect_barge_in(audio_bytes)
+
+    def _detect_barge_in(self, audio_bytes: bytes) -> None:
+        """Barge in on a local VAD speech onset while the agent is playing."""
+        try:
+            onset = self.vad.process(audio_bytes)
+        except Exception as e:
+            logger.debug(f"[{self._conn_short}] VAD error: {e}")
+            return
+        if not onset or not self.vad.during_playback:
+            return
+        if self.thread_bridge.barge_in_suppressed:
+            return
+
+        logger.info(
+            f"[{self._conn_short}] VAD barge-in: speech onset after {self.vad.onset_ms:.0f}ms"
+        )
+        record_barge_in(
+            self.vad.onset_ms,
+            session_id=self.connection_id,
+            trigger="vad",
+            tts_was_playing=True,
+        )
+        try:
+            self.thread_bridge.schedule_barge_in(self.barge_in_handler)
+        except Exception as e:
+            logger.error(f"[{self._conn_short}] Barge-in error: {e}")
 
     def stop(self) -> None:
         """Stop speech recognition and thread."""
@@ -527,6 +618,9 @@ class RouteTurnThread:
         on_announcement: Callable[[SpeechEvent], Awaitable[None]] | None = None,
         on_user_transcript: Callable[[str], Awaitable[None]] | None = None,
         on_tts_request: Callable[[str, SpeechEventType], Awaitable[None]] | None = None,
+        speculator: TurnSpeculator | None = None,
+        speculation_stable_ms: int = DEFAULT_STABLE_MS,
+        turn_profile: TurnProfile | None = None,
     ):
         """
         Initialize Route Turn Thread.
@@ -543,6 +637,11 @@ class RouteTurnThread:
             on_user_transcript: Callback for final user transcripts (emitted to transport).
             on_tts_request: Callback for TTS playback requests. Signature:
                 (text, event_type, *, voice_name, voice_style, voice_rate) -> None
+            speculator: Optional speculative LLM starter. When set, a partial
+                transcript that stays unchanged for ``speculation_stable_ms``
+                opens the turn's LLM request before the final result.
+            speculation_stable_ms: Partial stability required to speculate.
+            turn_profile: Optional latency profile marked when turns are dequeued.
         """
         self.connection_id = connection_id
         self._conn_short = connection_id[-8:] if connection_id else "unknown"
@@ -565,6 +664,17 @@ class RouteTurnThread:
         self._turn_number: int = 0
         self._active_turn_span: ConversationTurnSpan | None = None
 
+        # Speculative LLM start on stable partial transcripts
+        self.speculator = speculator
+        self.speculation_stable_ms = speculation_stable_ms
+        self._partial_text = ""
+        self._partial_key = ""
+        self._stable_handle: asyncio.TimerHandle | None = None
+        self._speculated_key: str | None = None
+        self._speculation_task: asyncio.Task | None = None
+
+        self.turn_profile = turn_profile
+
     async def start(self) -> None:
         """Start the route turn processing loop."""
         if self.running:
@@ -584,6 +694,10 @@ class RouteTurnThread:
                         f"[{self._conn_short}] Routing speech event type={getattr(speech_event, 'event_type', 'unknown')}"
                     )
                     if speech_event.event_type == SpeechEventType.FINAL:
+                        if self.turn_profile is not None:
+                            self.turn_profile.mark(TurnStage.TURN_DEQUEUED)
+                        # Keep a matching speculative request for this turn, drop others
+                        await self._settle_speculation(speech_event.text)
                         # End previous turn if active
                         await self._end_active_turn()
                         # Start new turn
@@ -741,6 +855,86 @@ class RouteTurnThread:
                 self.current_response_task = None
                 # Do NOT clear _active_turn_span here - it stays open for TTS events
 
+    @property
+    def speculation_enabled(self) -> bool:
+        """Whether partial transcripts may start speculative LLM requests."""
+        return self.speculator is not None
+
+    def on_partial_transcript(self, text: str, language: str | None = None) -> None:
+        """
+        Track the caller's partial transcript (runs on the main loop).
+
+        Once the partial has stayed unchanged for ``speculation_stable_ms``
+        while no turn is being processed, the speculator opens the LLM
+        request. A partial that diverges from the speculated text cancels it.
+        """
+        if self.speculator is None or not self.running:
+            return
+        key = normalize_transcript(text)
+        if not key or key == self._partial_key:
+            return
+        self._partial_key = key
+        self._partial_text = text
+        self._cancel_stable_timer()
+        if self._speculated_key is not None and self._speculated_key != key:
+            self._cancel_speculation()
+        self._stable_handle = asyncio.get_running_loop().call_later(
+            self.speculation_stable_ms / 1000.0, self._on_partial_stable
+        )
+
+    def _on_partial_stable(self) -> None:
+        self._stable_handle = None
+        if (
+            self.speculator is None
+            or not self.memory_manager
+            or self.current_response_task is not None
+            or self._speculated_key == self._partial_key
+        ):
+            return
+        logger.debug(
+            f"[{self._conn_short}] Partial stable for {self.speculation_stable_ms}ms; "
+            "starting speculative LLM request"
+        )
+        self._speculated_key = self._partial_key
+        self._speculation_task = asyncio.create_task(
+            self.speculator.start(self.memory_manager, self._partial_text)
+        )
+
+    def _cancel_stable_timer(self) -> None:
+        if self._stable_handle is not None:
+            self._stable_handle.cancel()
+            self._stable_handle = None
+
+    def _cancel_speculation(self) -> None:
+        self._speculated_key = None
+        if self._speculation_task and not self._speculation_task.done():
+            self._speculation_task.cancel()
+        self._speculation_task = None
+        try:
+            self.speculator.cancel()
+        except Exception as e:
+            logger.debug(f"[{self._conn_short}] Failed to cancel speculation: {e}")
+
+    async def _settle_speculation(self, final_text: str) -> None:
+        """Keep the speculation if it matches the final transcript, cancel it otherwise."""
+        if self.speculator is None:
+            return
+        self._cancel_stable_timer()
+        speculated = self._speculated_key
+        self._partial_text = self._partial_key = ""
+        if speculated is None:
+            return
+        if speculated != normalize_transcript(final_text):
+            logger.debug(f"[{self._conn_short}] Final transcript diverged; speculation cancelled")
+            self._cancel_speculation()
+            return
+        # Let the request finish starting so the turn can adopt it
+        task = self._speculation_task
+        if task is not None and not task.done():
+            await asyncio.wait({task}, timeout=0.5)
+        self._speculated_key = None
+        self._speculation_task = None
+
     def record_llm_first_token(self) -> None:
         """Record LLM first token timing on the active turn span (call from agent)."""
         if self._active_turn_span:
@@ -779,6 +973,8 @@ class RouteTurnThread:
 
     async def cancel_current_processing(self) -> None:
         """Cancel current processing for barge-in."""
+        if self.turn_profile is not None:
+            self.turn_profile.abandon()
         try:
             # End active turn span on barge-in
             await self._end_active_turn()
@@ -814,6 +1010,9 @@ class RouteTurnThread:
 
         self._stopped = True
         self.running = False
+        if self.speculator is not None:
+            self._cancel_stable_timer()
+            self._cancel_speculation()
         await self.cancel_current_processing()
         await self._end_active_turn()
 
@@ -940,6 +1139,8 @@ class SpeechCascadeHandler:
         transcript_emitter: TranscriptEmitter | None = None,
         response_sender: ResponseSender | None = None,
         redis_mgr: Any | None = None,
+        speculator: TurnSpeculator | None = None,
+        vad: StreamingVAD | None = None,
     ):
         """
         Initialize the speech cascade handler.
@@ -958,6 +1159,8 @@ class SpeechCascadeHandler:
             transcript_emitter: Protocol implementation for emitting transcripts.
             response_sender: Protocol implementation for sending TTS responses.
             redis_mgr: Optional redis manager for session persistence.
+            speculator: Optional speculative LLM starter for stable partials.
+            vad: Optional local VAD for barge-in ahead of partial results.
         """
         self.connection_id = connection_id
         self._conn_short = connection_id[-8:] if connection_id else "unknown"
@@ -985,6 +1188,10 @@ class SpeechCascadeHandler:
         # Barge-in controller
         self.barge_in_controller = BargeInController(connection_id, on_barge_in=on_barge_in)
 
+        # Per-turn latency budget marks (final transcript → first response audio)
+        session_id = getattr(memory_manager, "session_id", None)
+        self.turn_profile = get_turn_profiler().session(session_id) if session_id else None
+
         # Route Turn Thread
         self.route_turn_thread = RouteTurnThread(
             connection_id=connection_id,
@@ -997,6 +1204,8 @@ class SpeechCascadeHandler:
             on_announcement=on_announcement,
             on_user_transcript=on_user_transcript,
             on_tts_request=on_tts_request,
+            speculator=speculator,
+            turn_profile=self.turn_profile,
         )
 
         # Speech SDK Thread
@@ -1007,6 +1216,8 @@ class SpeechCascadeHandler:
             barge_in_handler=self._handle_barge_in_with_stt_stop,
             speech_queue=self.speech_queue,
             on_partial_transcript=on_partial_transcript,
+            turn_profile=self.turn_profile,
+            vad=vad,
         )
 
         self.thread_bridge.set_route_turn_thread(self.route_turn_thread)
@@ -1215,6 +1426,8 @@ class SpeechCascadeHandler:
         Returns:
             True if successfully queued, False otherwise.
         """
+        if self.turn_profile is not None:
+            self.turn_profile.begin(TurnStage.STT_FINAL, from_speech=False)
         return self.queue_event(
             SpeechEvent(
                 event_type=SpeechEventType.FINAL,
@@ -0,0 +1,367 @@
+"""
+ACS Inbound Jitter Buffer
+=========================
+
+Per-session playout buffer between the ACS media WebSocket and the recognizer.
+
+ACS stamps every 20 ms ``AudioData`` frame with its capture time, but the
+frames reach us with network jitter: bursts after a stall, the odd frame out
+of order, occasional loss. Writing each frame to the recognizer on arrival
+passes bursts straight through as bursts and gaps as starvation, which
+skews Speech SDK endpointing and recognition latency.
+
+This buffer keys frames on their ACS timestamp and releases them to the sink
+at a steady cadence:
+
+    - Frames are slotted by timestamp, so reordered frames play in capture
+      order; frames arriving after their slot has played are dropped as late.
+    - A missing frame with later audio already buffered is concealed with
+      silence (up to ``max_conceal_ms``); longer gaps are collapsed.
+    - Playout starts (and restarts after an underrun) once the buffer holds
+      the target depth. The target adapts to the spread of recent transit
+      times (arrival minus capture time) between ``min_depth_ms`` and
+      ``max_depth_ms``.
+    - When the buffer has held more than the target for a whole window,
+      silent frames are collapsed to give the excess latency back; voiced
+      audio is only dropped when the buffer overflows ``max_depth_ms``.
+
+The pacer runs on the event loop that feeds the buffer and starts with the
+first frame. ``tick()`` can be driven directly for deterministic replay.
+
+Enabled per deployment with ``ACS_JITTER_BUFFER=true``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from utils.ml_logging import get_logger
+
+logger = get_logger("voice.speech_cascade.jitter_buffer")
+
+FRAME_MS = 20
+DEFAULT_MIN_DEPTH_MS = 40
+DEFAULT_MAX_DEPTH_MS = 200
+DEFAULT_MAX_CONCEAL_MS = 100
+# Timestamp jumps beyond this restart the timeline instead of opening a gap
+_RESYNC_MS = 2000
+# Ticks between low-water checks for collapsing excess silence (~1 s)
+_DRAIN_WINDOW_MS = 1000
+
+
+@dataclass
+class JitterStats:
+    """Counters and gauges for one jitter buffer."""
+
+    frames: int = 0
+    released_frames: int = 0
+    late_frames: int = 0
+    reordered_frames: int = 0
+    duplicate_frames: int = 0
+    concealed_frames: int = 0
+    collapsed_frames: int = 0
+    overflow_frames: int = 0
+    underruns: int = 0
+    resyncs: int = 0
+    releases: int = 0
+    depth_ms: int = 0
+    peak_depth_ms: int = 0
+    target_depth_ms: int = 0
+    jitter_ms: float = 0.0
+
+    def to_dict(self) -> dict[str, float]:
+        """Return counters as a plain dict (for telemetry)."""
+        return dict(self.__dict__)
+
+
+class InboundJitterBuffer:
+    """
+    Timestamp-ordered, adaptively deep playout buffer for PCM frames.
+
+    Not thread-safe: push and release on the same event loop.
+
+    Args:
+        write_audio: Sink that receives PCM16LE bytes (e.g. recognizer push).
+        frame_ms: Duration of one inbound frame.
+        release_ms: Audio released per pacer tick (frames are concatenated),
+            which also sets the cadence.
+        min_depth_ms: Lowest target depth; also the headroom added on top of
+            the observed transit spread.
+        max_depth_ms: Highest target depth; the buffer never holds more.
+        max_conceal_ms: Longest gap filled with silence; longer gaps collapse.
+        window_frames: Recent frames whose transit spread sets the target.
+        clock: Monotonic clock in seconds, used to time arrivals.
+        paced: Start the release pacer on the running loop with the first frame.
+    """
+
+    def __init__(
+        self,
+        write_audio: Callable[[bytes], None],
+        *,
+        frame_ms: int = FRAME_MS,
+        release_ms: int | None = None,
+        min_depth_ms: int = DEFAULT_MIN_DEPTH_MS,
+        max_depth_ms: int = DEFAULT_MAX_DEPTH_MS,
+        max_conceal_ms: int = DEFAULT_MAX_CONCEAL_MS,
+        window_frames: int = 100,
+        clock: Callable[[], float] = time.monotonic,
+        paced: bool = True,
+    ) -> None:
+        self._write_audio = write_audio
+        self._frame_ms = frame_ms
+        self._per_release = max(1, int(release_ms or frame_ms) // frame_ms)
+        self.release_ms = self._per_release * frame_ms
+        self._min_depth = max(1, math.ceil(min_depth_ms / frame_ms))
+        self._max_depth = max(self._min_depth, math.ceil(max_depth_ms / frame_ms))
+        self._max_conceal = max(0, max_conceal_ms // frame_ms)
+        self._resync = _RESYNC_MS // frame_ms
+        self._drain_window = max(1, _DRAIN_WINDOW_MS // self.release_ms)
+        self._clock = clock
+        self._paced = paced
+
+        self._frames: dict[int, tuple[bytes, bool]] = {}
+        self._base_ms: float | None = None
+        self._next_seq = 0
+        self._high_seq = -1
+        self._started = False
+        self._playing = False
+        self._target = self._min_depth
+        self._transits: deque[float] = deque(maxlen=max(2, window_frames))
+        self._last_transit: float | None = None
+        self._low_water: int | None = None
+        self._ticks = 0
+        self._drain = 0
+        self._silence = b""
+        self._task: asyncio.Task | None = None
+        self._closed = False
+
+        self.stats = JitterStats(target_depth_ms=self._target * frame_ms)
+
+    # ------------------------------------------------------------------
+    # State
+    # ------------------------------------------------------------------
+
+    @property
+    def depth(self) -> int:
+        """Buffered span in frames, holes included."""
+        return max(0, self._high_seq - self._next_seq + 1)
+
+    @property
+    def target_depth(self) -> int:
+        """Current target depth in frames."""
+        return self._target
+
+    def _update_depth(self) -> None:
+        depth_ms = self.depth * self._frame_ms
+        self.stats.depth_ms = depth_ms
+        if depth_ms > self.stats.peak_depth_ms:
+            self.stats.peak_depth_ms = depth_ms
+
+    # ------------------------------------------------------------------
+    # Ingest
+    # ------------------------------------------------------------------
+
+    def push(self, timestamp_ms: float | None, pcm: bytes, silent: bool = False) -> None:
+        """
+        Buffer one frame captured at ``timestamp_ms`` (epoch milliseconds).
+
+        Frames without a timestamp are slotted in arrival order.
+        """
+        if not pcm:
+            return
+        stats = self.stats
+        stats.frames += 1
+        if len(pcm) != len(self._silence):
+            self._silence = bytes(len(pcm))
+        if self._paced and self._task is None and not self._closed:
+            self.start()
+
+        if timestamp_ms is None:
+            seq = max(self._high_seq + 1, self._next_seq)
+        else:
+            if self._base_ms is None:
+                self._base_ms = timestamp_ms - self._next_seq * self._frame_ms
+            seq = round((timestamp_ms - self._base_ms) / self._frame_ms)
+            if seq > self._high_seq + self._resync or seq < self._next_seq - self._resync:
+                # Sender clock jumped: continue the timeline after what we hold
+                seq = max(self._high_seq + 1, self._next_seq)
+                self._base_ms = timestamp_ms - seq * self._frame_ms
+                self._transits.clear()
+                self._last_transit = None
+                stats.resyncs += 1
+            self._observe_transit(self._clock() * 1000.0 - (timestamp_ms - self._base_ms))
+
+        if seq < self._next_seq:
+            if self._started:
+                stats.late_frames += 1
+                return
+            self._next_seq = seq  # earlier than the first frame, nothing played yet
+        if seq in self._frames:
+            stats.duplicate_frames += 1
+            return
+        if seq < self._high_seq:
+            stats.reordered_frames += 1
+        else:
+            self._high_seq = seq
+        self._frames[seq] = (pcm, silent)
+
+        if self.depth > self._max_depth:
+            self._trim(self._high_seq - self._max_depth + 1)
+        self._update_depth()
+
+    def _observe_transit(self, transit: float) -> None:
+        """Track transit spread (target depth) and RFC 3550 interarrival jitter."""
+        if self._last_transit is not None:
+            self.stats.jitter_ms += (abs(transit - self._last_transit) - self.stats.jitter_ms) / 16
+        self._last_transit = transit
+        transits = self._transits
+        transits.append(transit)
+        if len(transits) < 2:
+            return
+        # 1 ms tolerance for clock and timestamp granularity
+        spread = math.ceil(max(0.0, max(transits) - min(transits) - 1.0) / self._frame_ms)
+        target = min(self._max_depth, spread + self._min_depth)
+        if target != self._target:
+            self._target = target
+            self.stats.target_depth_ms = target * self._frame_ms
+
+    def _trim(self, first_seq: int) -> None:
+        """Drop buffered frames before ``first_seq`` (overflow)."""
+        for seq in [seq for seq in self._frames if seq < first_seq]:
+            del self._frames[seq]
+            self.stats.overflow_frames += 1
+        self._next_seq = max(self._next_seq, first_seq)
+
+    # ------------------------------------------------------------------
+    # Release
+    # ------------------------------------------------------------------
+
+    def tick(self) -> int:
+        """
+        Release one cadence slot of audio to the sink.
+
+        Returns:
+            Number of frames written (real and concealed).
+        """
+        depth = self.depth
+        if not self._playing:
+            if not self._frames or depth < self._target:
+                return 0
+            self._playing = True
+        self._track_low_water(depth)
+
+        chunks = []
+        for _ in range(self._per_release):
+            pcm = self._pop()
+            if pcm is None:
+                self._playing = False
+                self.stats.underruns += 1
+                break
+            chunks.append(pcm)
+        self._update_depth()
+        if chunks:
+            self._started = True
+            self.stats.releases += 1
+            self._write_audio(chunks[0] if len(chunks) == 1 else b"".join(chunks))
+        return len(chunks)
+
+    def _pop(self) -> bytes | None:
+        """Next frame in timestamp order, silence for a short hole, None when empty."""
+        frames = self._frames
+        stats = self.stats
+        while frames:
+            seq = self._next_seq
+            entry = frames.pop(seq, None)
+            if entry is None:
+                gap = min(frames) - seq
+                if gap > self._max_conceal:
+                    self._next_seq += gap
+                    stats.collapsed_frames += gap
+                    continue
+                self._next_seq += 1
+                stats.concealed_frames += 1
+                return self._silence
+            self._next_seq += 1
+            pcm, silent = entry
+            if silent and self._drain > 0 and frames:
+                self._drain -= 1
+                stats.collapsed_frames += 1
+                continue
+            stats.released_frames += 1
+            return pcm
+        return None
+
+    def _track_low_water(self, depth: int) -> None:
+        """Allow collapsing silence when the buffer stayed above target for a window."""
+        if self._low_water is None or depth < self._low_water:
+            self._low_water = depth
+        self._ticks += 1
+        if self._ticks >= self._drain_window:
+            self._drain = max(0, self._low_water - self._target - self._per_release)
+            self._low_water = None
+            self._ticks = 0
+
+    def flush(self) -> None:
+        """Write everything buffered to the sink, in timestamp order."""
+        if not self._frames:
+            return
+        chunks = [self._frames[seq][0] for seq in sorted(self._frames)]
+        self.stats.released_frames += len(chunks)
+        self.stats.releases += 1
+        self._frames.clear()
+        self._next_seq = self._high_seq + 1
+        self._playing = False
+        self._started = True
+        self._update_depth()
+        self._write_audio(b"".join(chunks))
+
+    # ------------------------------------------------------------------
+    # Pacer
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Start the release pacer on the running event loop (no-op without one)."""
+        if self._task is not None or self._closed:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._task = loop.create_task(self._pace(), name="acs-jitter-pacer")
+
+    async def _pace(self) -> None:
+        loop = asyncio.get_running_loop()
+        interval = self.release_ms / 1000
+        deadline = loop.time()
+        while True:
+            deadline += interval
+            delay = deadline - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            elif delay < -interval:
+                # The loop stalled: keep the cadence from now rather than bursting
+                deadline = loop.time()
+                await asyncio.sleep(0)
+            try:
+                self.tick()
+            except Exception as exc:
+                logger.warning("ACS jitter buffer release error: %s", exc)
+
+    def close(self) -> None:
+        """Stop the pacer and write out whatever is still buffered."""
+        self._closed = True
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self.flush()
+
+
+__all__ = [
+    "InboundJitterBuffer",
+    "JitterStats",
+]
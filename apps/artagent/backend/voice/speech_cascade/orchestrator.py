@@ -43,6 +43,7 @@ from __future__ import annotations
 
 import asyncio
 import contextvars
+import functools
 import inspect
 import json
 import os
@@ -62,6 +63,7 @@ from apps.artagent.backend.voice.shared.config_resolver import (
     resolve_from_app_state,
     resolve_orchestrator_config,
 )
+from apps.artagent.backend.voice.shared.context_window import ConversationWindow
 from apps.artagent.backend.voice.shared.handoff_service import HandoffService
 from apps.artagent.backend.voice.shared.metrics import OrchestratorMetrics
 from apps.artagent.backend.voice.shared.session_state import (
@@ -69,6 +71,11 @@ from apps.artagent.backend.voice.shared.session_state import (
     sync_state_from_memo,
     sync_state_to_memo,
 )
+from apps.artagent.backend.voice.shared.turn_profiler import TurnStage, get_turn_profiler
+from apps.artagent.backend.voice.speech_cascade.speculation import (
+    SpeculationStats,
+    SpeculativeStream,
+)
 from apps.artagent.backend.voice.speech_cascade.tts_processor import TTSTextProcessor
 from opentelemetry import trace
 from opentelemetry.trace import SpanKind, Status, StatusCode
@@ -179,6 +186,19 @@ class CascadeSessionScope:
 DEFAULT_MODEL_NAME = os.getenv("AZURE_OPENAI_DEPLOYMENT", "gpt-4o")
 
 
+@functools.lru_cache(maxsize=1)
+def _streaming_param_manager():
+    """AzureOpenAIManager used only for its parameter/routing helpers (built once)."""
+    from src.aoai.manager import AzureOpenAIManager
+
+    return AzureOpenAIManager(enable_tracing=False)
+
+
+# Cross-agent context: recent messages scanned per agent / messages kept
+CROSS_AGENT_SCAN_MESSAGES = 50
+CROSS_AGENT_MAX_MESSAGES = 8
+
+
 @dataclass
 class CascadeConfig:
     """
@@ -244,6 +264,13 @@ class CascadeOrchestratorAdapter:
     _current_memo_manager: MemoManager | None = field(default=None, init=False)
     _session_vars: dict[str, Any] = field(default_factory=dict, init=False)
 
+    # Bounded per-agent history windows, maintained incrementally across turns
+    _windows: dict[str, ConversationWindow] = field(default_factory=dict, init=False)
+
+    # LLM stream opened ahead of the final transcript (see speculation.py)
+    _speculation: SpeculativeStream | None = field(default=None, init=False)
+    speculation_stats: SpeculationStats = field(default_factory=SpeculationStats, init=False)
+
     # Unified metrics tracking (replaces individual token/timing fields)
     _metrics: OrchestratorMetrics = field(default=None, init=False)  # type: ignore
 
@@ -744,12 +771,39 @@ class CascadeOrchestratorAdapter:
 
         return (user_recorded, assistant_recorded)
 
+    def windowed_history(self, cm: MemoManager, agent: str | None = None) -> list[dict[str, Any]]:
+        """
+        Bounded history for ``agent`` (default: active agent).
+
+        Each agent thread has a ConversationWindow that only ingests messages
+        appended since the previous turn and keeps the result within a token
+        budget (recent turns, pinned tool results, optional summary). Returns
+        a new list, safe to extend.
+
+        Args:
+            cm: MemoManager instance
+            agent: Agent whose thread to read
+
+        Returns:
+            List of message dicts for conversation history
+        """
+        agent = agent or self._active_agent
+        source = cm.get_history(agent)
+        if not source:
+            return []
+        window = self._windows.get(agent)
+        if window is None:
+            window = self._windows[agent] = ConversationWindow()
+        return window.history(source)
+
     def _get_conversation_history(self, cm: MemoManager) -> list[dict[str, str]]:
         """
         Build conversation history for the current agent.
 
         Includes context from other agents to preserve cross-agent continuity.
-        Makes a COPY to avoid mutation issues.
+        Both parts are bounded: the agent's own thread through its
+        ConversationWindow, and cross-agent context to the most recent
+        substantive user messages.
 
         Args:
             cm: MemoManager instance
@@ -757,8 +811,7 @@ class CascadeOrchestratorAdapter:
         Returns:
             List of message dicts for conversation history
         """
-        # Get current agent's history (copy to avoid reference issues)
-        agent_history = list(cm.get_history(self._active_agent) or [])
+        agent_history = self.windowed_history(cm)
 
         # Collect substantive user messages from other agents
         all_histories = cm.history.get_all()
@@ -768,7 +821,7 @@ class CascadeOrchestratorAdapter:
         for agent_name, msgs in all_histories.items():
             if agent_name == self._active_agent:
                 continue
-            for msg in msgs:
+            for msg in msgs[-CROSS_AGENT_SCAN_MESSAGES:]:
                 if msg.get("role") != "user":
                     continue
                 content = msg.get("content", "").strip()
@@ -781,8 +834,13 @@ class CascadeOrchestratorAdapter:
                     seen_content.add(key)
                     cross_agent_context.append(msg)
 
-        # Cross-agent context first, then current agent's history
-        return cross_agent_context + agent_history
+        # Summary of the agent's evicted turns, cross-agent context, then recent turns
+        summary: list[dict[str, Any]] = []
+        window = self._windows.get(self._active_agent)
+        if agent_history and window is not None and agent_history[0] is window.summary_message:
+            summary = agent_history[:1]
+            agent_history = agent_history[1:]
+        return summary + cross_agent_context[-CROSS_AGENT_MAX_MESSAGES:] + agent_history
 
     def _build_session_context(self, cm: MemoManager) -> dict[str, Any]:
         """
@@ -867,7 +925,7 @@ class CascadeOrchestratorAdapter:
                 self._current_memo_manager = memo_manager
 
                 # Get history and append current user message
-                history = list(memo_manager.get_history(self._active_agent) or [])
+                history = self.windowed_history(memo_manager)
                 if user_text:
                     memo_manager.append_to_history(self._active_agent, "user", user_text)
 
@@ -1051,8 +1109,8 @@ class CascadeOrchestratorAdapter:
                             new_agent_history = []
                             if self._current_memo_manager:
                                 try:
-                                    new_agent_history = list(
-                                        self._current_memo_manager.get_history(handoff_target) or []
+                                    new_agent_history = self.windowed_history(
+                                        self._current_memo_manager, handoff_target
                                     )
                                 except Exception:
                                     pass
@@ -1309,8 +1367,10 @@ class CascadeOrchestratorAdapter:
         Process messages through LLM with streaming TTS and tool-call loop.
 
         Uses STREAMING with async queue for low-latency TTS dispatch:
-        - OpenAI stream runs in thread, puts chunks to asyncio.Queue
+        - OpenAI stream is consumed by a task on the event loop using the shared
+          async client (pooled keep-alive connections, no worker thread)
         - Main coroutine consumes queue and dispatches to TTS immediately
+        - Barge-in (cancel_current) cancels the stream task and closes the request
         - Tool calls are aggregated during streaming
         - After stream completes, tools are executed and we recurse
 
@@ -1349,27 +1409,16 @@ class CascadeOrchestratorAdapter:
             )
             return ("", [])
 
-        # Use AzureOpenAIManager for dual-endpoint support (chat vs responses)
-        # This enables proper routing based on model_config.endpoint_preference
+        # Shared async client: pooled keep-alive connections, tokens consumed on the loop
         try:
-            from src.aoai.manager import AzureOpenAIManager
-            from src.aoai.client import get_client as get_aoai_client
+            from src.aoai.client import get_async_client as get_aoai_client
 
-            # Get the raw client for streaming (manager doesn't support streaming yet)
             client = get_aoai_client()
             if client is None:
                 logger.error("AOAI client is None - not initialized")
                 return ("I'm having trouble connecting to the AI service.", [])
-
-            # Also get manager instance for future non-streaming support
-            # Initialize manager with session context for tracing
-            manager = AzureOpenAIManager(
-                call_connection_id=self.config.call_connection_id,
-                session_id=self.config.session_id,
-                enable_tracing=True,
-            )
         except ImportError as e:
-            logger.error("Failed to import AOAI client/manager: %s", e)
+            logger.error("Failed to import AOAI client: %s", e)
             return ("I'm having trouble connecting to the AI service.", [])
 
         response_text = ""
@@ -1417,14 +1466,20 @@ class CascadeOrchestratorAdapter:
                     len(tools) if tools else 0,
                 )
 
-                # Use asyncio.Queue for thread-safe async communication
+                # Stream task produces sentence chunks; this coroutine dispatches them to TTS
                 tts_queue: asyncio.Queue[str | None] = asyncio.Queue()
                 tool_buffers: dict[str, dict[str, Any]] = {}
                 collected_text: list[str] = []
                 stream_error: list[Exception] = []
                 stream_usage: dict[str, int] = {"input_tokens": 0, "output_tokens": 0}
-                loop = asyncio.get_running_loop()
                 tool_call_detected = False  # Track if tool calls are streaming
+                first_token_seen = False
+                tts_requested = False
+                turn_profile = (
+                    get_turn_profiler().session(self.config.session_id)
+                    if self.config.session_id
+                    else None
+                )
 
                 # Sentence buffer state for sentence-based TTS streaming
                 sentence_buffer = ""
@@ -1432,23 +1487,23 @@ class CascadeOrchestratorAdapter:
                 primary_terms = ".!?"
 
                 def _put_chunk(text: str) -> None:
-                    """Thread-safe put to async queue."""
+                    """Queue a sentence for TTS."""
+                    nonlocal tts_requested
                     # Don't send text to TTS if tool calls are being made
                     # The LLM sometimes outputs explanatory text alongside tool calls
                     if tool_call_detected:
                         return
                     if text and text.strip():
-                        loop.call_soon_threadsafe(tts_queue.put_nowait, text)
-
-                # Capture current OpenTelemetry context to propagate into thread
-                from opentelemetry import context as otel_context
-                current_context = otel_context.get_current()
-
-                def _streaming_completion():
-                    """Run in thread - consumes OpenAI stream."""
-                    nonlocal sentence_buffer, tool_call_detected
-                    # Attach the parent span context in the thread
-                    token = otel_context.attach(current_context)
+                        if turn_profile is not None and not tts_requested:
+                            # Only the first sentence is on the critical path
+                            tts_requested = True
+                            turn_profile.mark(TurnStage.TTS_REQUEST)
+                        tts_queue.put_nowait(text)
+
+                async def _streaming_completion():
+                    """Consume the OpenAI stream on the event loop."""
+                    nonlocal sentence_buffer, tool_call_detected, first_token_seen
+                    stream = None
                     try:
                         # Use pre-prepared streaming parameters
                         api_params = streaming_params
@@ -1468,7 +1523,7 @@ class CascadeOrchestratorAdapter:
                         max_tokens_value = api_params.get("max_tokens") or api_params.get("max_completion_tokens")
 
                         # Detect which endpoint to use based on model config
-                        use_responses_endpoint = manager._should_use_responses_endpoint(
+                        use_responses_endpoint = _streaming_param_manager()._should_use_responses_endpoint(
                             model_config, **api_params
                         ) if model_config else False
                         endpoint_name = "responses" if use_responses_endpoint else "chat.completions"
@@ -1489,22 +1544,33 @@ class CascadeOrchestratorAdapter:
                                 "gen_ai.endpoint_type": "responses" if use_responses_endpoint else "chat",
                             },
                         ) as openai_span:
+                            if turn_profile is not None:
+                                turn_profile.mark(TurnStage.LLM_REQUEST)
+                            # The first request of a turn may adopt the stream opened
+                            # on the caller's stable partial transcript
+                            speculative = self._adopt_speculation(api_params) if _iteration == 0 else None
+                            if speculative is not None:
+                                openai_span.set_attribute("cascade.speculative", True)
+                                openai_span.set_attribute(
+                                    "cascade.speculative.buffered_chunks", speculative.buffered
+                                )
+                                stream = speculative
                             # Route to appropriate endpoint
-                            if use_responses_endpoint:
+                            elif use_responses_endpoint:
                                 # Use responses API for streaming
                                 try:
-                                    stream = client.responses.create(**api_params)
+                                    stream = await client.responses.create(**api_params)
                                 except AttributeError:
                                     # Fallback if responses endpoint not available in SDK
                                     logger.warning(
                                         "Responses endpoint not available in SDK, falling back to chat/completions"
                                     )
-                                    stream = client.chat.completions.create(**api_params)
+                                    stream = await client.chat.completions.create(**api_params)
                             else:
                                 # Use chat completions API
-                                stream = client.chat.completions.create(**api_params)
+                                stream = await client.chat.completions.create(**api_params)
 
-                            for chunk in stream:
+                            async for chunk in stream:
                                 chunk_count += 1
 
                                 # Capture usage data from final chunk (stream_options.include_usage)
@@ -1527,6 +1593,13 @@ class CascadeOrchestratorAdapter:
                                 delta = getattr(choice, "delta", None)
                                 if not delta:
                                     continue
+                                if not first_token_seen and (
+                                    getattr(delta, "content", None)
+                                    or getattr(delta, "tool_calls", None)
+                                ):
+                                    first_token_seen = True
+                                    if turn_profile is not None:
+                                        turn_profile.mark(TurnStage.LLM_FIRST_TOKEN)
 
                                 # Tool calls - aggregate streamed chunks by index
                                 # Check tool calls FIRST to detect before dispatching text
@@ -1587,55 +1660,66 @@ class CascadeOrchestratorAdapter:
                         logger.error("OpenAI stream error: %s", e)
                         stream_error.append(e)
                     finally:
-                        # Detach the context
-                        otel_context.detach(token)
+                        # Release the pooled connection (also on barge-in cancellation)
+                        close = getattr(stream, "close", None)
+                        if close is not None:
+                            try:
+                                result = close()
+                                if inspect.isawaitable(result):
+                                    await result
+                            except Exception:
+                                logger.debug("Failed to close LLM stream", exc_info=True)
                         # Signal end
-                        loop.call_soon_threadsafe(tts_queue.put_nowait, None)
+                        tts_queue.put_nowait(None)
 
-                # Start stream in thread
-                stream_future = asyncio.get_running_loop().run_in_executor(
-                    None, _streaming_completion
-                )
+                # Start stream as a task; barge-in (cancel_current) cancels it mid-stream
+                stream_task = asyncio.create_task(_streaming_completion())
+                cancel_watch = asyncio.create_task(self._cancel_event.wait())
+                cancel_watch.add_done_callback(lambda _: stream_task.cancel())
 
-                # Consume queue with timeout - don't hang forever
+                # Consume queue with an overall deadline - don't hang forever
                 llm_timeout = 90.0  # seconds
-                queue_timeout = 5.0  # per-chunk timeout
-                start_time = time.perf_counter()
+                deadline = time.perf_counter() + llm_timeout
 
-                while True:
-                    elapsed = time.perf_counter() - start_time
-                    if elapsed > llm_timeout:
-                        logger.error("LLM response timeout after %.1fs", elapsed)
-                        break
-
-                    try:
-                        chunk = await asyncio.wait_for(tts_queue.get(), timeout=queue_timeout)
-                    except TimeoutError:
-                        # Check if stream is still running
-                        if stream_future.done():
-                            # Stream finished but didn't signal - break out
-                            logger.warning("Stream finished without signaling queue end")
+                try:
+                    while True:
+                        remaining = deadline - time.perf_counter()
+                        try:
+                            chunk = await asyncio.wait_for(tts_queue.get(), timeout=max(remaining, 0))
+                        except TimeoutError:
+                            logger.error("LLM response timeout after %.1fs", llm_timeout)
+                            stream_task.cancel()
                             break
-                        # Otherwise keep waiting
-                        continue
 
-                    if chunk is None:
-                        break
-                    if on_tts_chunk:
-                        try:
-                            await on_tts_chunk(chunk)
-                        except Exception as e:
-                            logger.debug("TTS callback error: %s", e)
+                        if chunk is None:
+                            break
+                        if on_tts_chunk and not self._cancel_event.is_set():
+                            try:
+                                await on_tts_chunk(chunk)
+                            except Exception as e:
+                                logger.debug("TTS callback error: %s", e)
+                finally:
+                    cancel_watch.cancel()
+                    if not stream_task.done():
+                        stream_task.cancel()
 
-                # Wait for stream to finish with timeout
-                try:
-                    await asyncio.wait_for(stream_future, timeout=10.0)
-                except TimeoutError:
-                    logger.error("Stream thread did not complete in time")
+                # Wait for the stream task to unwind (closing its connection)
+                await asyncio.wait({stream_task}, timeout=10.0)
 
                 if stream_error:
                     raise stream_error[0]
 
+                if self._cancel_event.is_set():
+                    # Barge-in: keep what was spoken, skip tool execution
+                    span.set_attribute("cascade.interrupted", True)
+                    span.set_status(Status(StatusCode.OK))
+                    logger.info(
+                        "LLM stream cancelled by barge-in | agent=%s iteration=%d",
+                        self._active_agent,
+                        _iteration,
+                    )
+                    return "".join(collected_text).strip(), all_tool_calls
+
                 response_text = "".join(collected_text).strip()
 
                 # Filter out incomplete tool calls (empty name or malformed)
@@ -1778,6 +1862,8 @@ class CascadeOrchestratorAdapter:
                         ) as tool_span:
                             if on_tool_start:
                                 await on_tool_start(tool_name, raw_args)
+                            if turn_profile is not None:
+                                turn_profile.mark(TurnStage.TOOL_START)
 
                             result: dict[str, Any] = {"error": "Tool execution failed"}
                             if agent:
@@ -1791,7 +1877,9 @@ class CascadeOrchestratorAdapter:
                                         session_profile = cm.get_value_from_corememory("session_profile")
                                         if session_profile:
                                             args["_session_profile"] = session_profile
-                                    result = await agent.execute_tool(tool_name, args)
+                                    result = await agent.execute_tool(
+                                        tool_name, args, session_id=cm.session_id if cm else None
+                                    )
                                     logger.info(
                                         "Tool executed | name=%s result_keys=%s",
                                         tool_name,
@@ -1832,6 +1920,8 @@ class CascadeOrchestratorAdapter:
                                         },
                                     )
 
+                            if turn_profile is not None:
+                                turn_profile.mark(TurnStage.TOOL_END)
                             if on_tool_end:
                                 await on_tool_end(tool_name, result)
 
@@ -1949,10 +2039,8 @@ class CascadeOrchestratorAdapter:
             Dict of parameters for the appropriate endpoint
         """
         try:
-            from src.aoai.manager import AzureOpenAIManager
-
-            # Create a temporary manager instance to use its helper methods
-            temp_manager = AzureOpenAIManager(enable_tracing=False)
+            # Shared manager instance, used only for its helper methods
+            temp_manager = _streaming_param_manager()
 
             # Determine which endpoint to use - CRITICAL: pass stream=True
             use_responses = temp_manager._should_use_responses_endpoint(
@@ -2090,9 +2178,104 @@ class CascadeOrchestratorAdapter:
         })
 
     async def cancel_current(self) -> None:
-        """Signal cancellation for barge-in."""
+        """Signal cancellation for barge-in (aborts any in-flight LLM stream)."""
         self._cancel_event.set()
 
+    # ─────────────────────────────────────────────────────────────────
+    # Speculative Turns
+    # ─────────────────────────────────────────────────────────────────
+
+    async def speculate(
+        self,
+        context: OrchestratorContext | None = None,
+        *,
+        user_text: str | None = None,
+        memo_manager: MemoManager | None = None,
+    ) -> bool:
+        """
+        Open the LLM stream for a transcript that is not final yet.
+
+        Builds the request exactly as :meth:`process_turn` would for the same
+        arguments (either calling pattern) and starts streaming into a buffer.
+        Nothing is spoken and no tools run: the next turn adopts the stream
+        only if its final transcript and prompt match (see
+        :mod:`speculation`), otherwise the request is cancelled.
+
+        Returns:
+            True if a speculative request was started.
+        """
+        self.cancel_speculation()
+        if context is None:
+            if memo_manager is None:
+                return False
+            self.sync_from_memo_manager(memo_manager)
+            context = OrchestratorContext(
+                session_id=self.config.session_id or "",
+                websocket=None,
+                call_connection_id=self.config.call_connection_id,
+                user_text=user_text or "",
+                conversation_history=self.windowed_history(memo_manager),
+                metadata=self._build_session_context(memo_manager),
+            )
+        agent = self.current_agent_config
+        if not agent or not context.user_text:
+            return False
+
+        model_config = agent.get_model_for_mode("cascade")
+        model_name = model_config.deployment_id or self.config.model_name
+        messages = self._build_messages(context, agent)
+        tools = self._get_tools_with_handoffs(agent)
+        params = self._prepare_streaming_params(model_config, model_name, messages, tools)
+        if "messages" not in params:
+            return False  # responses endpoint: not speculated
+
+        try:
+            from src.aoai.client import get_async_client
+
+            client = get_async_client()
+        except Exception as exc:
+            logger.debug("Speculative LLM start skipped: %s", exc)
+            return False
+
+        self._speculation = SpeculativeStream(
+            context.user_text,
+            params,
+            lambda: client.chat.completions.create(**params),
+        )
+        self.speculation_stats.started += 1
+        logger.debug(
+            "Speculative LLM request started | agent=%s transcript_len=%d",
+            self._active_agent,
+            len(context.user_text),
+        )
+        return True
+
+    def cancel_speculation(self) -> None:
+        """Cancel the pending speculative request, if any."""
+        speculation, self._speculation = self._speculation, None
+        if speculation is not None:
+            speculation.cancel()
+            self.speculation_stats.discarded += 1
+
+    def _adopt_speculation(self, params: dict[str, Any]) -> SpeculativeStream | None:
+        """Take the pending speculative stream if it was built for ``params``."""
+        speculation, self._speculation = self._speculation, None
+        if speculation is None:
+            return None
+        if not speculation.matches(params):
+            speculation.cancel()
+            self.speculation_stats.discarded += 1
+            logger.debug("Speculative LLM request discarded (prompt or transcript changed)")
+            return None
+        self.speculation_stats.committed += 1
+        logger.info(
+            "Speculative LLM stream committed | agent=%s buffered_chunks=%d head_start_ms=%.0f",
+            self._active_agent,
+            speculation.buffered,
+            (time.perf_counter() - speculation.started_at) * 1000,
+        )
+        return speculation
+
     # ─────────────────────────────────────────────────────────────────
     # Handoff Management
     # ─────────────────────────────────────────────────────────────────
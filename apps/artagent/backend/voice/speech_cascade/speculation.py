@@ -0,0 +1,178 @@
+"""
+Speculative LLM Turns
+=====================
+
+Starts a turn's LLM request before the recognizer finalizes the transcript.
+
+The Speech SDK emits a final result only after the end-of-utterance silence
+timeout, so a turn normally pays that wait and the full LLM time-to-first-token
+back to back. When the caller's partial transcript has not changed for
+``CASCADE_SPECULATION_STABLE_MS`` (default 300), the route turn thread asks
+the orchestrator to open the completion stream early. Streamed chunks are
+buffered and never spoken:
+
+- final transcript matches the speculated one -> the turn adopts the stream
+  and replays the buffered chunks through the normal TTS / tool path
+- final transcript diverges, or the prompt changed -> the stream is cancelled
+
+Tool calls are only aggregated from the stream; they run after the turn is
+committed, exactly as for a non-speculative turn.
+
+Enabled per deployment with ``CASCADE_SPECULATIVE_LLM=true``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from utils.ml_logging import get_logger
+
+logger = get_logger("v1.handlers.speech_cascade_speculation")
+
+# Default partial-transcript stability before speculating
+DEFAULT_STABLE_MS = 300
+
+_PUNCTUATION = re.compile(r"[^\w\s']+")
+
+
+def normalize_transcript(text: str | None) -> str:
+    """Case, punctuation and whitespace-insensitive form used to match transcripts."""
+    if not text:
+        return ""
+    return " ".join(_PUNCTUATION.sub(" ", text.casefold()).split())
+
+
+def _prompt_key(params: dict[str, Any]) -> dict[str, Any]:
+    """Request parameters without the (speculated) final user message."""
+    return {**params, "messages": list(params.get("messages") or [])[:-1]}
+
+
+@dataclass
+class SpeculationStats:
+    """Counters describing speculative turns for one orchestrator."""
+
+    started: int = 0
+    committed: int = 0
+    discarded: int = 0
+
+
+class SpeculativeStream:
+    """
+    LLM stream opened for a not-yet-final transcript.
+
+    A background task reads the stream into a buffer as soon as it is created.
+    Iterating the object (once, after the turn is committed) yields the
+    buffered chunks first and then follows the live stream, so it can stand
+    in for the stream returned by ``chat.completions.create``.
+
+    Args:
+        transcript: Partial transcript the request was built from.
+        params: Request parameters (``messages`` ends with that transcript).
+        open_stream: Coroutine factory that starts the streaming request.
+    """
+
+    def __init__(
+        self,
+        transcript: str,
+        params: dict[str, Any],
+        open_stream: Callable[[], Awaitable[Any]],
+    ) -> None:
+        self.transcript = transcript
+        self.key = normalize_transcript(transcript)
+        self.params = params
+        self.started_at = time.perf_counter()
+        self.first_chunk_at: float | None = None
+        self._chunks: list[Any] = []
+        self._done = False
+        self._error: Exception | None = None
+        self._changed = asyncio.Event()
+        self._task = asyncio.create_task(self._fill(open_stream))
+
+    @property
+    def buffered(self) -> int:
+        """Chunks received so far."""
+        return len(self._chunks)
+
+    @property
+    def done(self) -> bool:
+        """Whether the underlying stream has ended (or failed)."""
+        return self._done
+
+    def matches(self, params: dict[str, Any]) -> bool:
+        """Whether a committed turn with ``params`` can adopt this stream."""
+        if self._error is not None or self._task.cancelled():
+            return False
+        messages = params.get("messages") or []
+        if not messages or messages[-1].get("role") != "user":
+            return False
+        if normalize_transcript(messages[-1].get("content")) != self.key:
+            return False
+        return _prompt_key(params) == _prompt_key(self.params)
+
+    async def _fill(self, open_stream: Callable[[], Awaitable[Any]]) -> None:
+        stream = None
+        try:
+            stream = await open_stream()
+            async for chunk in stream:
+                if self.first_chunk_at is None:
+                    self.first_chunk_at = time.perf_counter()
+                self._chunks.append(chunk)
+                self._changed.set()
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            logger.debug("Speculative LLM stream failed: %s", exc)
+            self._error = exc
+        finally:
+            self._done = True
+            self._changed.set()
+            close = getattr(stream, "close", None)
+            if close is not None:
+                try:
+                    result = close()
+                    if asyncio.iscoroutine(result):
+                        await result
+                except Exception:
+                    logger.debug("Failed to close speculative stream", exc_info=True)
+
+    async def _iterate(self) -> AsyncIterator[Any]:
+        index = 0
+        while True:
+            if index < len(self._chunks):
+                yield self._chunks[index]
+                index += 1
+                continue
+            if self._done:
+                if self._error is not None:
+                    raise self._error
+                return
+            self._changed.clear()
+            await self._changed.wait()
+
+    def __aiter__(self) -> AsyncIterator[Any]:
+        return self._iterate()
+
+    def cancel(self) -> None:
+        """Abort the request (safe to call from synchronous code)."""
+        self._task.cancel()
+
+    async def close(self) -> None:
+        """Abort the request if still running and wait for it to unwind."""
+        self._task.cancel()
+        try:
+            await self._task
+        except (asyncio.CancelledError, Exception):
+            pass
+
+
+__all__ = [
+    "DEFAULT_STABLE_MS",
+    "SpeculationStats",
+    "SpeculativeStream",
+    "normalize_transcript",
+]
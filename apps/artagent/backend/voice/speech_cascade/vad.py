@@ -0,0 +1,220 @@
+"""
+Streaming Barge-In VAD
+======================
+
+Local voice-activity detection on the inbound PCM feeding the recognizer.
+
+Barge-in otherwise waits for the Speech SDK's first partial hypothesis,
+which arrives several hundred milliseconds after the caller starts talking;
+the agent keeps speaking over them in the meantime. This detector runs on
+the same 16 kHz PCM16 frames written to the recognizer and reports a speech
+onset as soon as speech has been sustained for ``min_speech_ms``.
+
+Per 20 ms frame (vectorized with NumPy over each pushed chunk):
+    - energy in dBFS against an adaptive noise floor
+    - zero-crossing rate (broadband noise and hiss cross zero constantly)
+    - spectral flatness over 100 Hz - 4 kHz (noise is flat, voiced speech is not)
+
+A frame is speech-like when it clears the floor by ``margin_db`` and looks
+voiced on both spectral features. Short gaps inside a speech run are
+tolerated, and a hangover keeps the detector in speech through pauses, so a
+single utterance yields one onset.
+
+While TTS playback is active the thresholds are raised: speech must also
+clear a residual-echo estimate by ``echo_margin_db`` and last
+``echo_min_speech_ms``. Residual echo of the agent's own voice (after the
+client / carrier echo canceller) is speech-like but sits well below a caller
+talking over it. The estimate starts at ``echo_floor_db`` when playback
+starts, rises to the peak of any speech-like run too short to be an onset,
+and decays back between them.
+
+Enabled per deployment with ``CASCADE_VAD_BARGE_IN=true``.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+
+import numpy as np
+
+DEFAULT_SAMPLE_RATE = 16000
+FRAME_MS = 20
+DEFAULT_MIN_SPEECH_MS = 120
+
+_FULL_SCALE_POWER = 32768.0**2
+_EPS = 1e-10
+
+
+class StreamingVAD:
+    """
+    Frame-energy / zero-crossing / spectral-flatness VAD with hysteresis.
+
+    Args:
+        sample_rate: PCM16 mono sample rate of the pushed audio.
+        playback_active: Probe for agent audio playback; raises thresholds
+            while true. Without a probe, audio is assumed to overlap playback.
+        min_speech_ms: Sustained speech required before an onset.
+        echo_min_speech_ms: Same, while playback is active.
+        margin_db: Energy above the noise floor for a speech-like frame.
+        echo_margin_db: Energy above the residual-echo estimate while playback is active.
+        echo_floor_db: Initial residual-echo estimate (dBFS) when playback starts.
+        min_energy_db: Absolute energy floor (dBFS) for a speech-like frame.
+        max_flatness: Frames with flatter spectra are treated as noise.
+        max_zcr: Frames crossing zero more often are treated as noise.
+        max_gap_ms: Non-speech gap that still continues a speech run.
+        hangover_ms: Non-speech time that ends detected speech.
+    """
+
+    def __init__(
+        self,
+        *,
+        sample_rate: int = DEFAULT_SAMPLE_RATE,
+        playback_active: Callable[[], bool] | None = None,
+        min_speech_ms: int = DEFAULT_MIN_SPEECH_MS,
+        echo_min_speech_ms: int | None = None,
+        margin_db: float = 12.0,
+        echo_margin_db: float = 6.0,
+        echo_floor_db: float = -45.0,
+        min_energy_db: float = -50.0,
+        max_flatness: float = 0.3,
+        max_zcr: float = 0.35,
+        max_gap_ms: int = 60,
+        hangover_ms: int = 300,
+    ) -> None:
+        self.sample_rate = sample_rate
+        self.playback_active = playback_active
+        self.min_speech_ms = min_speech_ms
+        self.echo_min_speech_ms = (
+            echo_min_speech_ms if echo_min_speech_ms is not None else min_speech_ms + 60
+        )
+        self.margin_db = margin_db
+        self.echo_margin_db = echo_margin_db
+        self.echo_floor_db = echo_floor_db
+        self.min_energy_db = min_energy_db
+        self.max_flatness = max_flatness
+        self.max_zcr = max_zcr
+        self.max_gap_ms = max_gap_ms
+        self.hangover_ms = hangover_ms
+
+        self._frame_len = sample_rate * FRAME_MS // 1000
+        self._frame_bytes = self._frame_len * 2
+        self._window = np.hanning(self._frame_len).astype(np.float32)
+        freqs = np.fft.rfftfreq(self._frame_len, 1.0 / sample_rate)
+        self._band = (freqs >= 100) & (freqs <= 4000)
+        self._pending = b""
+        self._last_chunk_at: float | None = None
+
+        self.noise_floor_db: float | None = None
+        self.echo_db = echo_floor_db
+        self.speaking = False
+        self.during_playback = False
+        self.onset_ms = 0.0
+        self.frames = 0
+        self.onsets = 0
+        self._run_ms = 0
+        self._run_peak_db = -100.0
+        self._gap_ms = 0
+        self._silence_ms = 0
+
+    def reset(self) -> None:
+        """Forget the current speech run (the noise floor is kept)."""
+        self._pending = b""
+        self.speaking = False
+        self._run_ms = self._gap_ms = self._silence_ms = 0
+        self._run_peak_db = -100.0
+
+    def features(self, samples: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Energy (dBFS), zero-crossing rate and spectral flatness per frame row."""
+        power = np.mean(samples * samples, axis=1)
+        energy_db = 10.0 * np.log10(power / _FULL_SCALE_POWER + _EPS)
+        signs = np.signbit(samples)
+        zcr = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / (self._frame_len - 1)
+        spectrum = np.abs(np.fft.rfft(samples * self._window, axis=1))[:, self._band]
+        spectrum = spectrum * spectrum + _EPS
+        flatness = np.exp(np.mean(np.log(spectrum), axis=1)) / np.mean(spectrum, axis=1)
+        return energy_db, zcr, flatness
+
+    def process(self, pcm: bytes) -> bool:
+        """
+        Feed PCM16LE audio; return True when speech onset is detected in it.
+
+        Audio is framed across calls. A wall-clock gap longer than the
+        hangover (e.g. silent frames dropped upstream) ends any speech run.
+        """
+        now = time.monotonic()
+        if self._last_chunk_at is not None and (now - self._last_chunk_at) * 1000 > (
+            self.hangover_ms
+        ):
+            self.reset()
+        self._last_chunk_at = now
+
+        data = self._pending + pcm if self._pending else pcm
+        count = len(data) // self._frame_bytes
+        self._pending = data[count * self._frame_bytes :]
+        if not count:
+            return False
+
+        samples = (
+            np.frombuffer(data, dtype="<i2", count=count * self._frame_len)
+            .reshape(count, self._frame_len)
+            .astype(np.float32)
+        )
+        energy_db, zcr, flatness = self.features(samples)
+
+        playback = self.playback_active() if self.playback_active is not None else True
+        if playback and not self.during_playback:
+            self.echo_db = self.echo_floor_db
+        self.during_playback = playback
+        required_ms = self.echo_min_speech_ms if playback else self.min_speech_ms
+        voiced = (flatness < self.max_flatness) & (zcr < self.max_zcr)
+
+        onset = False
+        floor = self.noise_floor_db
+        for index in range(count):
+            energy = float(energy_db[index])
+            if floor is None:
+                floor = energy
+            threshold = max(floor + self.margin_db, self.min_energy_db)
+            if playback:
+                threshold = max(threshold, self.echo_db + self.echo_margin_db)
+            if voiced[index] and energy > threshold:
+                self._run_ms += FRAME_MS
+                self._run_peak_db = max(self._run_peak_db, energy)
+                self._gap_ms = 0
+                self._silence_ms = 0
+                if not self.speaking and self._run_ms >= required_ms:
+                    self.speaking = True
+                    self.onset_ms = float(self._run_ms)
+                    self.onsets += 1
+                    onset = True
+                continue
+
+            # Non-speech frame: track the floor (fast down, slow up)
+            floor += (energy - floor) * (0.3 if energy < floor else 0.02)
+            if playback:
+                self.echo_db = max(self.echo_floor_db, self.echo_db - 0.05)
+            self._gap_ms += FRAME_MS
+            if self._gap_ms > self.max_gap_ms and self._run_ms:
+                if playback and not self.speaking:
+                    # Too short for speech while the agent talks: treat it as echo
+                    learned = min(self._run_peak_db - self.echo_margin_db / 2, self.echo_db + 3.0)
+                    self.echo_db = max(self.echo_db, learned)
+                self._run_ms = 0
+                self._run_peak_db = -100.0
+            if self.speaking:
+                self._silence_ms += FRAME_MS
+                if self._silence_ms >= self.hangover_ms:
+                    self.speaking = False
+                    self._run_ms = 0
+                    self._run_peak_db = -100.0
+
+        self.noise_floor_db = floor
+        self.frames += count
+        return onset
+
+
+__all__ = [
+    "DEFAULT_MIN_SPEECH_MS",
+    "StreamingVAD",
+]
@@ -26,6 +26,7 @@ from collections.abc import Callable
 from functools import partial
 from typing import TYPE_CHECKING, Any
 
+from apps.artagent.backend.voice.shared.turn_profiler import TurnStage, get_turn_profiler
 from fastapi import WebSocket
 from fastapi.websockets import WebSocketState
 from utils.ml_logging import get_logger
@@ -134,6 +135,38 @@ class TTSPlayback:
         """Get cancel event from context."""
         return self._context.cancel_event
 
+    @property
+    def _conn_manager(self) -> Any:
+        """Connection manager owning this session's socket, if it is registered."""
+        if not self._context.conn_id:
+            return None
+        return getattr(self._app_state, "conn_manager", None)
+
+    async def _send_frame(self, payload: dict[str, Any]) -> None:
+        """
+        Queue an audio frame on the connection's audio lane.
+
+        Going through the connection manager lets a barge-in stop overtake audio
+        already queued for a slow socket. Sockets not registered with the manager
+        are written directly.
+        """
+        manager = self._conn_manager
+        if manager is not None and await manager.send_to_connection(
+            self._context.conn_id, payload
+        ):
+            return
+        await self._ws.send_json(payload)
+
+    async def _discard_queued_audio(self) -> None:
+        """Drop frames of a cancelled stream that are still queued for the socket."""
+        manager = self._conn_manager
+        if manager is None:
+            return
+        try:
+            await manager.flush_audio(self._context.conn_id)
+        except Exception:
+            logger.debug("[%s] Failed to discard queued audio", self._session_short, exc_info=True)
+
     def get_agent_voice(self) -> tuple[str, str | None, str | None]:
         """
         Get voice configuration from the active agent in context.
@@ -461,6 +494,8 @@ class TTSPlayback:
             sample_rate,
         )
 
+        turn_profiler = get_turn_profiler()
+        turn_profiler.mark(self._session_id, TurnStage.TTS_START)
         loop = asyncio.get_running_loop()
         executor = getattr(self._app_state, "speech_executor", None)
 
@@ -479,6 +514,7 @@ class TTSPlayback:
             result = await loop.run_in_executor(None, synth_func)
 
         if result:
+            turn_profiler.mark(self._session_id, TurnStage.TTS_FIRST_AUDIO)
             logger.info("[%s] Synthesis complete: %d bytes", self._session_short, len(result))
             add_speech_tts_metrics(
                 voice=voice,
@@ -514,6 +550,7 @@ class TTSPlayback:
         for i in range(0, len(pcm_bytes), chunk_size):
             if self._cancel_event.is_set():
                 self._cancel_event.clear()
+                await self._discard_queued_audio()
                 logger.debug("[%s] Browser stream cancelled", self._session_short)
                 return False
 
@@ -527,7 +564,7 @@ class TTSPlayback:
             frame_index = chunks_sent
             is_final = (i + chunk_size) >= len(pcm_bytes)
 
-            await self._ws.send_json(
+            await self._send_frame(
                 {
                     "type": "audio_data",
                     "data": b64_chunk,
@@ -541,6 +578,7 @@ class TTSPlayback:
 
             if not first_sent:
                 first_sent = True
+                get_turn_profiler().mark(self._session_id, TurnStage.AUDIO_OUT)
                 if on_first_audio:
                     try:
                         on_first_audio()
@@ -589,6 +627,7 @@ class TTSPlayback:
         for i in range(0, len(pcm_bytes), chunk_size):
             if self._cancel_event.is_set():
                 self._cancel_event.clear()
+                await self._discard_queued_audio()
                 logger.debug("[%s] ACS stream cancelled", self._session_short)
                 return False
 
@@ -611,7 +650,7 @@ class TTSPlayback:
             }
 
             try:
-                await self._ws.send_json(message)
+                await self._send_frame(message)
                 chunks_sent += 1
 
                 if chunks_sent == 1:
@@ -628,6 +667,7 @@ class TTSPlayback:
 
             if not first_sent:
                 first_sent = True
+                get_turn_profiler().mark(self._session_id, TurnStage.AUDIO_OUT)
                 if on_first_audio:
                     try:
                         on_first_audio()
@@ -45,6 +45,7 @@ from apps.artagent.backend.voice.shared import (
 )
 from apps.artagent.backend.src.services.session_loader import load_user_profile_by_email
 from apps.artagent.backend.src.orchestration.session_agents import get_session_agent
+from apps.artagent.backend.voice.shared.turn_profiler import TurnStage, get_turn_profiler
 
 # ─────────────────────────────────────────────────────────────────────────────
 # VoiceLive Channel Imports (local to voice_channels)
@@ -70,6 +71,7 @@ from fastapi.websockets import WebSocketState
 from opentelemetry import trace
 from opentelemetry.trace import SpanKind, Status, StatusCode
 from utils.ml_logging import get_logger
+from utils.telemetry_config import get_span_sampler
 from utils.telemetry_decorators import ConversationTurnSpan
 
 from .dtmf_processor import DTMFProcessor
@@ -738,6 +740,8 @@ class VoiceLiveSDKHandler:
         self._llm_first_token_time: float | None = None
         self._tts_first_audio_time: float | None = None
         self._current_response_id: str | None = None
+        # Critical-path marks (VAD speech end → first audio relayed to the caller)
+        self._turn_profile = get_turn_profiler().session(session_id)
 
     def _set_metadata(self, key: str, value: Any) -> None:
         if not _set_connection_metadata(self.websocket, key, value):
@@ -1275,6 +1279,7 @@ class VoiceLiveSDKHandler:
             ),
         ) as loop_span:
             event_count = 0
+            sampler = get_span_sampler()
             try:
                 async for event in self._connection:
                     if self._shutdown.is_set():
@@ -1289,14 +1294,21 @@ class VoiceLiveSDKHandler:
                     )
 
                     # Add span event for each VoiceLive event (batched, not per-event spans)
-                    # Filter out high-frequency noisy events
-                    if event_type_str not in (
+                    # Audio deltas are only counted; other types are rate-limited per type.
+                    # Skipped events are counted on the loop span when it ends.
+                    event_key = f"voicelive.event_received.{event_type_str}"
+                    if event_type_str in (
                         "response.audio_transcript.delta",
                         "response.audio.delta",
                     ):
-                        loop_span.add_event(
+                        sampler.suppress(self.session_id, event_key)
+                    else:
+                        sampler.add_event(
+                            loop_span,
+                            self.session_id,
                             "voicelive.event_received",
                             {"event_type": event_type_str, "event_index": event_count},
+                            key=event_key,
                         )
 
                     self._observe_event(event)
@@ -1326,6 +1338,7 @@ class VoiceLiveSDKHandler:
                 )
                 logger.exception("VoiceLive event loop error | session=%s", self.session_id)
             finally:
+                sampler.flush(loop_span, self.session_id)
                 self._shutdown.set()
 
     async def _forward_event_to_acs(self, event: Any) -> None:
@@ -1413,7 +1426,9 @@ class VoiceLiveSDKHandler:
             if response_id:
                 self._active_response_ids.add(response_id)
             self._stop_audio_pending = False
+            self._turn_profile.mark(TurnStage.TTS_FIRST_AUDIO)
             await self._send_audio_delta(event.delta, response_id=response_id)
+            self._turn_profile.mark(TurnStage.AUDIO_OUT)
 
         elif etype == ServerEventType.RESPONSE_DONE:
             response_id = self._extract_response_id(event)
@@ -1446,6 +1461,7 @@ class VoiceLiveSDKHandler:
 
             # Finalize previous turn if still active
             await self._finalize_turn_metrics()
+            self._turn_profile.abandon()
 
             # Start new turn tracking
             self._turn_number += 1
@@ -1474,6 +1490,7 @@ class VoiceLiveSDKHandler:
 
         elif etype == ServerEventType.INPUT_AUDIO_BUFFER_SPEECH_STOPPED:
             self._vad_end_time = time.perf_counter()
+            self._turn_profile.begin(TurnStage.SPEECH_END)
             if self._active_turn_span:
                 self._active_turn_span.record_tts_start()
             logger.debug("🎤 User paused speaking")
@@ -1806,6 +1823,12 @@ class VoiceLiveSDKHandler:
         if type_str in self._NOISY_EVENT_TYPES:
             return
 
+        # Other events are rate-limited per session and type; turn-level and error
+        # events are always kept, and sampled-out ones are counted on the loop span
+        span_name = f"voicelive.event.{type_str}" if type_str != "unknown" else "voicelive.event"
+        if not get_span_sampler().should_sample(self.session_id, span_name):
+            return
+
         logger.debug(
             "[VoiceLiveSDK] Event received | session=%s type=%s",
             self.session_id,
@@ -1826,10 +1849,8 @@ class VoiceLiveSDKHandler:
                 len(delta) if isinstance(delta, (bytes, str)) else 0
             )
 
-        # Create span with descriptive name: voicelive.event.<event_type>
+        # Span named voicelive.event.<event_type>
         # e.g., voicelive.event.session.created, voicelive.event.response.done
-        span_name = f"voicelive.event.{type_str}" if type_str != "unknown" else "voicelive.event"
-
         with tracer.start_as_current_span(
             span_name,
             kind=SpanKind.INTERNAL,
@@ -1995,6 +2016,7 @@ class VoiceLiveSDKHandler:
         """Record LLM first token timing (TTFT) for the current turn."""
         if self._turn_start_time and self._llm_first_token_time is None:
             self._llm_first_token_time = time.perf_counter()
+            self._turn_profile.mark(TurnStage.LLM_FIRST_TOKEN)
             ttft_ms = (self._llm_first_token_time - self._turn_start_time) * 1000
 
             # Record OTel metric for App Insights Performance view
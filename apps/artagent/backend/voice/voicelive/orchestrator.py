@@ -45,6 +45,7 @@ from typing import TYPE_CHECKING, Any
 # Self-contained tool registry (no legacy vlagent dependency)
 from apps.artagent.backend.registries.toolstore import (
     execute_tool,
+    get_tool_result_cache,
     initialize_tools,
 )
 from apps.artagent.backend.src.services.session_loader import load_user_profile_by_client_id
@@ -55,6 +56,7 @@ from apps.artagent.backend.voice.shared.session_state import (
     sync_state_from_memo,
     sync_state_to_memo,
 )
+from apps.artagent.backend.voice.shared.turn_profiler import TurnStage, get_turn_profiler
 from azure.ai.voicelive.models import (
     AssistantMessageItem,
     FunctionCallOutputItem,
@@ -75,6 +77,7 @@ from apps.artagent.backend.src.utils.tracing import (
     create_service_handler_attrs,
 )
 from src.enums.monitoring import GenAIOperation, GenAIProvider, SpanAttr
+from src.pools.expiry_wheel import get_expiry_wheel
 from utils.ml_logging import get_logger
 
 logger = get_logger("voicelive.orchestrator")
@@ -97,16 +100,40 @@ CALL_CENTER_TRIGGER_PHRASES = {
 
 # Module-level registry for VoiceLive orchestrators (per session)
 # This enables scenario updates to reach active VoiceLive sessions
-# Uses standard dict but includes cleanup of stale entries
+# Each entry is re-checked on the shared expiry wheel; orphaned ones are released
 _voicelive_orchestrators: dict[str, "LiveOrchestrator"] = {}
 _registry_lock = asyncio.Lock()
 
+# Interval at which a registered orchestrator is checked for being orphaned
+ORCHESTRATOR_CHECK_INTERVAL_S = 300.0
+
+
+def _is_stale_orchestrator(orchestrator: "LiveOrchestrator") -> bool:
+    """An orchestrator with no connection and no agents was orphaned by its session."""
+    return orchestrator.conn is None and orchestrator.agents == {}
+
+
+def _on_orchestrator_check(key: tuple[str, str]) -> None:
+    """Expiry callback: release an orphaned orchestrator, otherwise check again later."""
+    session_id = key[1]
+    orchestrator = _voicelive_orchestrators.get(session_id)
+    if orchestrator is None:
+        return
+    if _is_stale_orchestrator(orchestrator):
+        logger.debug("Releasing orphaned VoiceLive orchestrator | session=%s", session_id)
+        unregister_voicelive_orchestrator(session_id)
+        return
+    get_expiry_wheel().schedule(key, ORCHESTRATOR_CHECK_INTERVAL_S, _on_orchestrator_check)
+
 
 def register_voicelive_orchestrator(session_id: str, orchestrator: "LiveOrchestrator") -> None:
     """Register a VoiceLive orchestrator for scenario updates."""
-    # Clean up stale entries first (orchestrators that may have been orphaned)
-    _cleanup_stale_orchestrators()
     _voicelive_orchestrators[session_id] = orchestrator
+    get_expiry_wheel().schedule(
+        ("voicelive_orchestrator", session_id),
+        ORCHESTRATOR_CHECK_INTERVAL_S,
+        _on_orchestrator_check,
+    )
     logger.debug(
         "Registered VoiceLive orchestrator | session=%s registry_size=%d",
         session_id,
@@ -117,6 +144,9 @@ def register_voicelive_orchestrator(session_id: str, orchestrator: "LiveOrchestr
 def unregister_voicelive_orchestrator(session_id: str) -> None:
     """Unregister a VoiceLive orchestrator when session ends."""
     orchestrator = _voicelive_orchestrators.pop(session_id, None)
+    get_expiry_wheel().cancel(("voicelive_orchestrator", session_id))
+    get_tool_result_cache().clear_session(session_id)
+    get_turn_profiler().discard(session_id)
     if orchestrator:
         logger.debug(
             "Unregistered VoiceLive orchestrator | session=%s registry_size=%d",
@@ -134,17 +164,19 @@ def _cleanup_stale_orchestrators() -> int:
     """
     Clean up orchestrators that are no longer valid.
 
-    This catches cases where sessions ended without proper cleanup.
+    Full sweep for diagnostics and tests; registered orchestrators are already
+    checked individually on the expiry wheel.
     Returns the number of stale entries removed.
     """
-    stale_keys = []
-    for session_id, orchestrator in list(_voicelive_orchestrators.items()):
-        # Check if orchestrator is still valid (has connection reference)
-        if orchestrator.conn is None and orchestrator.agents == {}:
-            stale_keys.append(session_id)
+    stale_keys = [
+        session_id
+        for session_id, orchestrator in list(_voicelive_orchestrators.items())
+        if _is_stale_orchestrator(orchestrator)
+    ]
 
     for key in stale_keys:
         _voicelive_orchestrators.pop(key, None)
+        get_expiry_wheel().cancel(("voicelive_orchestrator", key))
 
     if stale_keys:
         logger.debug(
@@ -1460,7 +1492,8 @@ class LiveOrchestrator:
                     kind=trace.SpanKind.INTERNAL,
                     attributes={"tool.name": name},
                 ):
-                    result = await execute_tool(name, args)
+                    get_turn_profiler().mark(self._session_id, TurnStage.TOOL_START)
+                    result = await execute_tool(name, args, session_id=self._session_id)
             except Exception as exc:
                 notify_status = "error"
                 notify_error = str(exc)
@@ -1482,6 +1515,7 @@ class LiveOrchestrator:
                         logger.debug("Tool end messenger notification failed", exc_info=True)
                 raise
 
+            get_turn_profiler().mark(self._session_id, TurnStage.TOOL_END)
             elapsed_ms = (time.perf_counter() - start_ts) * 1000
             tool_span.set_attribute("execution.duration_ms", elapsed_ms)
             tool_span.set_attribute("voicelive.tool.elapsed_ms", elapsed_ms)
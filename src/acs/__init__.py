@@ -9,6 +9,7 @@ This package includes:
 - SmsService: For sending SMS messages via Azure Communication Services
 - EmailTemplates: Professional email templates
 - SmsTemplates: Professional SMS templates
+- NotificationDispatcher: Shared async queue for background email / SMS
 
 Example usage:
 
@@ -39,12 +40,20 @@ Example usage:
 
 from .email_service import EmailService
 from .email_templates import EmailTemplates
+from .notification_dispatcher import (
+    NotificationDispatcher,
+    NotificationPriority,
+    get_notification_dispatcher,
+)
 from .sms_service import SmsService, is_sms_configured, send_sms, send_sms_background, sms_service
 from .sms_templates import SmsTemplates
 
 __all__ = [
     "EmailService",
     "EmailTemplates",
+    "NotificationDispatcher",
+    "NotificationPriority",
+    "get_notification_dispatcher",
     "send_sms",
     "send_sms_background",
     "is_sms_configured",
@@ -16,6 +16,13 @@ from typing import Any
 from utils.azure_auth import get_credential
 from utils.ml_logging import get_logger
 
+from .notification_dispatcher import (
+    NotificationPriority,
+    get_notification_dispatcher,
+    is_transient_send_error,
+    run_blocking,
+)
+
 # Email service imports
 try:
     from azure.communication.email import EmailClient
@@ -102,9 +109,19 @@ class EmailService:
                 "content": message_content,
             }
 
-            # Send email
-            poller = self.client.begin_send(message)
-            result = poller.result()
+            # Submit the message; only a submission ACS did not accept is retried
+            try:
+                poller = await run_blocking(self.client.begin_send, message)
+            except Exception as exc:
+                logger.error("Email sending failed: %s", exc)
+                return {
+                    "success": False,
+                    "error": f"Azure Email error: {str(exc)}",
+                    "retryable": is_transient_send_error(exc),
+                }
+
+            # Accepted: wait for the send operation (the poller blocks), never resubmit
+            result = await run_blocking(poller.result)
 
             # Extract message ID
             message_id = getattr(result, "id", None) or getattr(result, "message_id", "unknown")
@@ -120,7 +137,10 @@ class EmailService:
 
         except Exception as exc:
             logger.error("Email sending failed: %s", exc)
-            return {"success": False, "error": f"Azure Email error: {str(exc)}"}
+            return {
+                "success": False,
+                "error": f"Azure Email error: {str(exc)}",
+            }
 
     def send_email_background(
         self,
@@ -129,9 +149,13 @@ class EmailService:
         plain_text_body: str,
         html_body: str | None = None,
         callback: callable | None = None,
+        priority: NotificationPriority = NotificationPriority.NORMAL,
     ) -> None:
         """
-        Send email in background thread without blocking the main response.
+        Send email in the background without blocking the main response.
+
+        Queued on the shared NotificationDispatcher when an application loop
+        is running; otherwise sent from a one-off background thread.
 
         Args:
             email_address: Recipient email address
@@ -139,7 +163,21 @@ class EmailService:
             plain_text_body: Plain text version of the email
             html_body: Optional HTML version of the email
             callback: Optional callback function to handle the result
+            priority: Queue priority (HIGH for verification codes)
         """
+        dispatcher = get_notification_dispatcher()
+        if dispatcher.submit_threadsafe(
+            dispatcher.submit_email,
+            email_address,
+            subject,
+            plain_text_body,
+            html_body,
+            priority=priority,
+            callback=callback,
+            service=self,
+        ):
+            logger.info("📧 Email queued for background delivery")
+            return
 
         def _send_email_background_task():
             try:
@@ -183,10 +221,16 @@ email_service = EmailService()
 
 # Convenience functions for easy import
 async def send_email(
-    email_address: str, subject: str, plain_text_body: str, html_body: str | None = None
+    email_address: str,
+    subject: str,
+    plain_text_body: str,
+    html_body: str | None = None,
+    priority: NotificationPriority = NotificationPriority.NORMAL,
 ) -> dict[str, Any]:
-    """Convenience function to send email."""
-    return await email_service.send_email(email_address, subject, plain_text_body, html_body)
+    """Convenience function to send email (through the shared dispatcher)."""
+    return await get_notification_dispatcher().submit_email(
+        email_address, subject, plain_text_body, html_body, priority=priority
+    )
 
 
 def send_email_background(
@@ -195,10 +239,11 @@ def send_email_background(
     plain_text_body: str,
     html_body: str | None = None,
     callback: callable | None = None,
+    priority: NotificationPriority = NotificationPriority.NORMAL,
 ) -> None:
     """Convenience function to send email in background."""
     email_service.send_email_background(
-        email_address, subject, plain_text_body, html_body, callback
+        email_address, subject, plain_text_body, html_body, callback, priority
     )
 
 
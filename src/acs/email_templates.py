@@ -6,6 +6,7 @@ Reusable email templates that can be used by any tool.
 Provides both plain text and HTML versions with consistent styling.
 """
 
+from collections.abc import Callable
 from typing import Any
 
 
@@ -674,3 +675,12 @@ Fraud Protection Team
 </html>"""
 
         return subject, plain_text_body, html_body
+
+
+# Template name -> renderer, resolved once at import for NotificationDispatcher
+EMAIL_TEMPLATES: dict[str, Callable[..., tuple[str, str, str]]] = {
+    "claim_confirmation": EmailTemplates.create_claim_confirmation_email,
+    "policy_notification": EmailTemplates.create_policy_notification_email,
+    "mfa_code": EmailTemplates.create_mfa_code_email,
+    "fraud_case": FraudEmailTemplates.create_fraud_case_email,
+}
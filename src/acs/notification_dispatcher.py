@@ -0,0 +1,552 @@
+"""
+Notification Dispatcher
+=======================
+
+Shared async dispatcher for outbound email and SMS.
+
+Background sends used to start a new OS thread and event loop per message.
+The dispatcher instead runs on the application loop:
+
+- one bounded priority queue per channel (verification codes ahead of
+  confirmations and summaries, FIFO within a priority)
+- a fixed pool of workers per channel, each reusing the channel's service
+  (and its Azure client)
+- blocking SDK calls run on a small dedicated thread pool (``run_blocking``)
+  instead of the default executor shared with speech work
+- retry with jittered exponential backoff for transient failures (timeouts,
+  429 and 5xx responses) of a send ACS has not accepted; a send is never
+  repeated once accepted, so a retry cannot deliver a message twice
+- graceful drain on shutdown
+
+Example usage:
+
+    dispatcher = get_notification_dispatcher()
+    await dispatcher.start()
+
+    # Fire and forget (optional callback gets the result dict)
+    dispatcher.submit_sms("+1234567890", "Your claim was filed")
+
+    # Or await delivery
+    result = await dispatcher.submit_email_template(
+        "customer@example.com",
+        "mfa_code",
+        {"otp_code": "123456", "client_name": "Ana", "institution_name": "Contoso"},
+        priority=NotificationPriority.HIGH,
+    )
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import inspect
+import itertools
+import random
+import threading
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from enum import Enum, IntEnum
+from typing import Any
+
+from azure.core.exceptions import ServiceRequestError
+from utils.ml_logging import get_logger
+
+from .email_templates import EMAIL_TEMPLATES
+from .sms_templates import SMS_TEMPLATES
+
+logger = get_logger("notification_dispatcher")
+
+ResultCallback = Callable[[dict[str, Any]], Any]
+
+# Threads for blocking ACS SDK calls (default email + SMS concurrency)
+SEND_THREADS = 8
+
+
+class NotificationChannel(str, Enum):
+    """Outbound notification channel."""
+
+    EMAIL = "email"
+    SMS = "sms"
+
+
+class NotificationPriority(IntEnum):
+    """Queue priority (lower is sent first)."""
+
+    HIGH = 0  # verification codes, fraud alerts
+    NORMAL = 1  # confirmations
+    LOW = 2  # summaries, reminders
+
+
+@dataclass(order=True)
+class _Notification:
+    """Queued message; ordered by (priority, submission sequence)."""
+
+    priority: int
+    seq: int
+    channel: NotificationChannel = field(compare=False)
+    send: Callable[[], Awaitable[dict[str, Any]]] = field(compare=False)
+    future: asyncio.Future = field(compare=False)
+    callback: ResultCallback | None = field(compare=False, default=None)
+    attempts: int = field(compare=False, default=0)
+    finished: bool = field(compare=False, default=False)
+
+
+class NotificationDispatcher:
+    """
+    Long-lived email / SMS dispatcher with per-channel queues and workers.
+
+    Args:
+        email_service: Email transport (``send_email`` coroutine); defaults to
+            the shared ``email_service``.
+        sms_service: SMS transport (``send_sms`` coroutine); defaults to the
+            shared ``sms_service``.
+        max_queue: Maximum queued messages per channel.
+        email_concurrency: Concurrent email sends.
+        sms_concurrency: Concurrent SMS sends.
+        max_attempts: Attempts per message for retryable failures.
+        backoff_base_s: Backoff before the first retry (doubles per retry).
+        backoff_max_s: Backoff ceiling.
+    """
+
+    def __init__(
+        self,
+        *,
+        email_service: Any | None = None,
+        sms_service: Any | None = None,
+        max_queue: int = 1000,
+        email_concurrency: int = 4,
+        sms_concurrency: int = 4,
+        max_attempts: int = 3,
+        backoff_base_s: float = 0.5,
+        backoff_max_s: float = 10.0,
+    ) -> None:
+        self._email_service = email_service
+        self._sms_service = sms_service
+        self.max_queue = max_queue
+        self.concurrency = {
+            NotificationChannel.EMAIL: email_concurrency,
+            NotificationChannel.SMS: sms_concurrency,
+        }
+        self.max_attempts = max_attempts
+        self.backoff_base_s = backoff_base_s
+        self.backoff_max_s = backoff_max_s
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._queues: dict[NotificationChannel, asyncio.PriorityQueue[_Notification]] = {}
+        self._workers: list[asyncio.Task] = []
+        self._retries: dict[asyncio.Task, _Notification] = {}
+        self._in_flight: dict[int, _Notification] = {}
+        self._seq = itertools.count()
+        self._closing = False
+        self._stats = {"sent": 0, "failed": 0, "retried": 0, "rejected": 0}
+
+    # ------------------------------------------------------------------ #
+    # Lifecycle
+    # ------------------------------------------------------------------ #
+    @property
+    def email_service(self) -> Any:
+        if self._email_service is None:
+            from .email_service import email_service
+
+            self._email_service = email_service
+        return self._email_service
+
+    @property
+    def sms_service(self) -> Any:
+        if self._sms_service is None:
+            from .sms_service import sms_service
+
+            self._sms_service = sms_service
+        return self._sms_service
+
+    @property
+    def running(self) -> bool:
+        """True while workers are running on a live event loop."""
+        return bool(self._workers) and self._loop is not None and not self._loop.is_closed()
+
+    async def start(self) -> None:
+        """Start the channel workers on the running loop (idempotent)."""
+        self._ensure_started()
+
+    def _ensure_started(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._workers and self._loop is loop:
+            return
+        if self._workers:
+            self._abandon_stopped_loop()
+        self._loop = loop
+        self._closing = False
+        self._queues = {
+            channel: asyncio.PriorityQueue(maxsize=self.max_queue)
+            for channel in NotificationChannel
+        }
+        self._workers = [
+            self._loop.create_task(self._worker(channel), name=f"notify-{channel.value}-{index}")
+            for channel, count in self.concurrency.items()
+            for index in range(count)
+        ]
+        logger.info(
+            "📨 Notification dispatcher started | email_workers=%d sms_workers=%d",
+            self.concurrency[NotificationChannel.EMAIL],
+            self.concurrency[NotificationChannel.SMS],
+        )
+
+    def _abandon_stopped_loop(self) -> None:
+        """
+        Fail everything left on the previous loop before binding to a new one.
+
+        Workers on a stopped or closed loop can never run again, so their
+        queued, retrying and in-flight messages resolve with a failure result.
+        A loop that is still running keeps its workers: shut them down there.
+        """
+        previous = self._loop
+        if previous is not None and previous.is_running():
+            raise RuntimeError(
+                "Notification dispatcher is running on another event loop; "
+                "shut it down there before using it on this one"
+            )
+        undelivered = [*self._in_flight.values(), *self._retries.values()]
+        for queue in self._queues.values():
+            while not queue.empty():
+                undelivered.append(queue.get_nowait())
+        if previous is not None and not previous.is_closed():
+            for task in [*self._workers, *self._retries]:
+                task.cancel()
+        self._workers = []
+        self._retries.clear()
+        self._in_flight.clear()
+        for notification in undelivered:
+            self._finish(notification, _failure("Notification dispatcher event loop stopped"))
+        if undelivered:
+            logger.warning(
+                "📨 Notification dispatcher moved to a new event loop | %d undelivered",
+                len(undelivered),
+            )
+
+    async def shutdown(self, timeout: float = 10.0) -> None:
+        """
+        Stop accepting messages, drain the queues, then stop the workers.
+
+        Messages still queued after ``timeout`` resolve with a failure result.
+        """
+        if not self._workers:
+            return
+        self._closing = True
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*(queue.join() for queue in self._queues.values())),
+                timeout=timeout,
+            )
+        except TimeoutError:
+            logger.warning(
+                "📨 Notification drain timed out after %.1fs | %d undelivered",
+                timeout,
+                self.queued,
+            )
+
+        tasks = [*self._workers, *self._retries]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._workers = []
+        self._retries.clear()
+
+        for queue in self._queues.values():
+            while not queue.empty():
+                self._finish(queue.get_nowait(), _failure("Notification dispatcher shut down"))
+        logger.info("📨 Notification dispatcher stopped | %s", self.stats())
+
+    # ------------------------------------------------------------------ #
+    # Submission
+    # ------------------------------------------------------------------ #
+    def submit_email(
+        self,
+        email_address: str,
+        subject: str,
+        plain_text_body: str,
+        html_body: str | None = None,
+        *,
+        priority: NotificationPriority = NotificationPriority.NORMAL,
+        callback: ResultCallback | None = None,
+        service: Any | None = None,
+    ) -> asyncio.Future:
+        """Queue an email; the returned future resolves to the send result."""
+        transport = service or self.email_service
+
+        def send() -> Awaitable[dict[str, Any]]:
+            return transport.send_email(email_address, subject, plain_text_body, html_body)
+
+        return self._submit(NotificationChannel.EMAIL, send, priority, callback)
+
+    def submit_email_template(
+        self,
+        email_address: str,
+        template: str,
+        params: dict[str, Any],
+        *,
+        priority: NotificationPriority = NotificationPriority.NORMAL,
+        callback: ResultCallback | None = None,
+        service: Any | None = None,
+    ) -> asyncio.Future:
+        """Queue an email rendered from ``EMAIL_TEMPLATES[template]`` when sent."""
+        render = _lookup(EMAIL_TEMPLATES, template, "email")
+        transport = service or self.email_service
+
+        def send() -> Awaitable[dict[str, Any]]:
+            subject, plain_text_body, html_body = render(**params)
+            return transport.send_email(email_address, subject, plain_text_body, html_body)
+
+        return self._submit(NotificationChannel.EMAIL, send, priority, callback)
+
+    def submit_sms(
+        self,
+        to_phone_numbers: str | list[str],
+        message: str,
+        enable_delivery_report: bool = True,
+        tag: str | None = None,
+        *,
+        priority: NotificationPriority = NotificationPriority.NORMAL,
+        callback: ResultCallback | None = None,
+        service: Any | None = None,
+    ) -> asyncio.Future:
+        """Queue an SMS; the returned future resolves to the send result."""
+        transport = service or self.sms_service
+
+        def send() -> Awaitable[dict[str, Any]]:
+            return transport.send_sms(to_phone_numbers, message, enable_delivery_report, tag)
+
+        return self._submit(NotificationChannel.SMS, send, priority, callback)
+
+    def submit_sms_template(
+        self,
+        to_phone_numbers: str | list[str],
+        template: str,
+        params: dict[str, Any],
+        *,
+        priority: NotificationPriority = NotificationPriority.NORMAL,
+        callback: ResultCallback | None = None,
+        service: Any | None = None,
+    ) -> asyncio.Future:
+        """Queue an SMS rendered from ``SMS_TEMPLATES[template]`` when sent."""
+        render = _lookup(SMS_TEMPLATES, template, "SMS")
+        transport = service or self.sms_service
+
+        def send() -> Awaitable[dict[str, Any]]:
+            return transport.send_sms(to_phone_numbers, render(**params), True, None)
+
+        return self._submit(NotificationChannel.SMS, send, priority, callback)
+
+    def submit_threadsafe(self, submit: Callable[..., Any], *args: Any, **kwargs: Any) -> bool:
+        """
+        Call a ``submit_*`` method from any thread.
+
+        On a thread with a running loop the dispatcher starts there if it is
+        not running yet. Returns False when there is no loop to dispatch on
+        (the caller should fall back to sending directly).
+        """
+        if self._closing:
+            return False
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is not None and (running is self._loop or not self.running):
+            submit(*args, **kwargs)
+            return True
+
+        loop = self._loop
+        if loop is None or loop.is_closed() or not loop.is_running():
+            return False
+        loop.call_soon_threadsafe(lambda: submit(*args, **kwargs))
+        return True
+
+    def _submit(
+        self,
+        channel: NotificationChannel,
+        send: Callable[[], Awaitable[dict[str, Any]]],
+        priority: NotificationPriority,
+        callback: ResultCallback | None,
+    ) -> asyncio.Future:
+        self._ensure_started()
+        notification = _Notification(
+            priority=int(priority),
+            seq=next(self._seq),
+            channel=channel,
+            send=send,
+            future=self._loop.create_future(),
+            callback=callback,
+        )
+        if self._closing:
+            self._reject(notification, "Notification dispatcher is shutting down")
+        else:
+            try:
+                self._queues[channel].put_nowait(notification)
+            except asyncio.QueueFull:
+                self._reject(notification, f"{channel.value} queue full ({self.max_queue})")
+        return notification.future
+
+    # ------------------------------------------------------------------ #
+    # Workers
+    # ------------------------------------------------------------------ #
+    async def _worker(self, channel: NotificationChannel) -> None:
+        queue = self._queues[channel]
+        while True:
+            notification = await queue.get()
+            notification.attempts += 1
+            self._in_flight[notification.seq] = notification
+            try:
+                result = await notification.send()
+            except asyncio.CancelledError:
+                self._finish(notification, _failure("Notification dispatcher shut down"))
+                raise
+            except Exception as exc:
+                result = _failure(
+                    f"{channel.value} send error: {exc}", retryable=is_transient_send_error(exc)
+                )
+            finally:
+                self._in_flight.pop(notification.seq, None)
+
+            if (
+                not result.get("success")
+                and result.get("retryable")
+                and notification.attempts < self.max_attempts
+                and not self._closing
+            ):
+                self._stats["retried"] += 1
+                task = asyncio.create_task(self._retry_later(notification))
+                self._retries[task] = notification
+                task.add_done_callback(lambda done: self._retries.pop(done, None))
+                continue
+
+            self._finish(notification, result)
+            queue.task_done()
+
+    async def _retry_later(self, notification: _Notification) -> None:
+        delay = min(self.backoff_max_s, self.backoff_base_s * 2 ** (notification.attempts - 1))
+        delay = random.uniform(delay / 2, delay)
+        logger.info(
+            "📨 Retrying %s in %.2fs (attempt %d/%d)",
+            notification.channel.value,
+            delay,
+            notification.attempts + 1,
+            self.max_attempts,
+        )
+        queue = self._queues[notification.channel]
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self._finish(notification, _failure("Notification dispatcher shut down"))
+            queue.task_done()
+            raise
+        # Re-queue before marking the previous attempt done so drain waits for it
+        queue.put_nowait(notification)
+        queue.task_done()
+
+    def _reject(self, notification: _Notification, error: str) -> None:
+        self._stats["rejected"] += 1
+        logger.warning("📨 %s rejected: %s", notification.channel.value, error)
+        self._finish(notification, _failure(error), count=False)
+
+    def _finish(
+        self, notification: _Notification, result: dict[str, Any], count: bool = True
+    ) -> None:
+        if notification.finished:
+            return
+        notification.finished = True
+        if count:
+            self._stats["sent" if result.get("success") else "failed"] += 1
+        if not notification.future.done():
+            try:
+                notification.future.set_result(result)
+            except RuntimeError:
+                pass  # Submitted on a loop that has since closed; the callback still runs
+        if notification.callback is not None:
+            try:
+                outcome = notification.callback(result)
+                if inspect.isawaitable(outcome):
+                    asyncio.ensure_future(outcome)
+            except Exception as exc:
+                logger.error("📨 Notification callback failed: %s", exc, exc_info=True)
+
+    # ------------------------------------------------------------------ #
+    # Introspection
+    # ------------------------------------------------------------------ #
+    @property
+    def queued(self) -> int:
+        """Messages waiting in the channel queues."""
+        return sum(queue.qsize() for queue in self._queues.values())
+
+    def stats(self) -> dict[str, int]:
+        """Delivery counters plus the current queue depth."""
+        return {**self._stats, "queued": self.queued}
+
+
+def is_transient_send_error(exc: BaseException) -> bool:
+    """
+    Whether a failed send request may be retried without risking a duplicate.
+
+    Transient: the request never reached ACS (connection failures and connect
+    timeouts), throttling (429) and server errors (5xx). Client errors (4xx,
+    validation) are permanent, and so is a lost response (ACS may have
+    accepted the send).
+    """
+    if isinstance(exc, ServiceRequestError):
+        return True
+    status = getattr(exc, "status_code", None)
+    return isinstance(status, int) and (status == 429 or status >= 500)
+
+
+def _failure(error: str, retryable: bool = False) -> dict[str, Any]:
+    result: dict[str, Any] = {"success": False, "error": error}
+    if retryable:
+        result["retryable"] = True
+    return result
+
+
+def _lookup(templates: dict[str, Callable[..., Any]], name: str, kind: str) -> Callable[..., Any]:
+    try:
+        return templates[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown {kind} template '{name}' (available: {', '.join(sorted(templates))})"
+        ) from None
+
+
+_dispatcher: NotificationDispatcher | None = None
+_dispatcher_lock = threading.Lock()
+_send_executor: ThreadPoolExecutor | None = None
+
+
+async def run_blocking(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking SDK call on the notification send threads."""
+    global _send_executor
+    if _send_executor is None:
+        with _dispatcher_lock:
+            if _send_executor is None:
+                _send_executor = ThreadPoolExecutor(
+                    max_workers=SEND_THREADS, thread_name_prefix="acs-notify"
+                )
+    return await asyncio.get_running_loop().run_in_executor(
+        _send_executor, functools.partial(func, *args, **kwargs)
+    )
+
+
+def get_notification_dispatcher() -> NotificationDispatcher:
+    """Process-wide dispatcher shared by the email and SMS services."""
+    global _dispatcher
+    if _dispatcher is None:
+        with _dispatcher_lock:
+            if _dispatcher is None:
+                _dispatcher = NotificationDispatcher()
+    return _dispatcher
+
+
+__all__ = [
+    "NotificationChannel",
+    "NotificationDispatcher",
+    "NotificationPriority",
+    "get_notification_dispatcher",
+    "is_transient_send_error",
+    "run_blocking",
+]
@@ -15,6 +15,13 @@ from typing import Any
 
 from utils.ml_logging import get_logger
 
+from .notification_dispatcher import (
+    NotificationPriority,
+    get_notification_dispatcher,
+    is_transient_send_error,
+    run_blocking,
+)
+
 # SMS service imports
 try:
     from azure.communication.sms import SmsClient
@@ -33,11 +40,18 @@ class SmsService:
         """Initialize the SMS service with Azure configuration."""
         self.connection_string = os.getenv("AZURE_COMMUNICATION_SMS_CONNECTION_STRING")
         self.from_phone_number = os.getenv("AZURE_SMS_FROM_PHONE_NUMBER")
+        self._client: SmsClient | None = None
 
     def is_configured(self) -> bool:
         """Check if SMS service is properly configured."""
         return AZURE_SMS_AVAILABLE and bool(self.connection_string) and bool(self.from_phone_number)
 
+    def _get_client(self) -> SmsClient:
+        """SMS client, created on first send and reused afterwards."""
+        if self._client is None:
+            self._client = SmsClient.from_connection_string(self.connection_string)
+        return self._client
+
     async def send_sms(
         self,
         to_phone_numbers: str | list[str],
@@ -69,11 +83,9 @@ class SmsService:
             if isinstance(to_phone_numbers, str):
                 to_phone_numbers = [to_phone_numbers]
 
-            # Create SMS client
-            sms_client = SmsClient.from_connection_string(self.connection_string)
-
-            # Send SMS
-            sms_responses = sms_client.send(
+            # Send SMS (blocking SDK call, kept off the event loop)
+            sms_responses = await run_blocking(
+                self._get_client().send,
                 from_=self.from_phone_number,
                 to=to_phone_numbers,
                 message=message,
@@ -132,6 +144,8 @@ class SmsService:
                 "error": f"Azure SMS error: {str(exc)}",
                 "sent_messages": [],
                 "failed_messages": [],
+                # Retried only when the send call failed before ACS accepted it
+                "retryable": is_transient_send_error(exc),
             }
 
     def send_sms_background(
@@ -141,9 +155,13 @@ class SmsService:
         enable_delivery_report: bool = True,
         tag: str | None = None,
         callback: callable | None = None,
+        priority: NotificationPriority = NotificationPriority.NORMAL,
     ) -> None:
         """
-        Send SMS in background thread without blocking the main response.
+        Send SMS in the background without blocking the main response.
+
+        Queued on the shared NotificationDispatcher when an application loop
+        is running; otherwise sent from a one-off background thread.
 
         Args:
             to_phone_numbers: Recipient phone number(s) - can be single string or list
@@ -151,7 +169,21 @@ class SmsService:
             enable_delivery_report: Whether to enable delivery reports
             tag: Optional tag for message tracking
             callback: Optional callback function to handle the result
+            priority: Queue priority (HIGH for verification codes)
         """
+        dispatcher = get_notification_dispatcher()
+        if dispatcher.submit_threadsafe(
+            dispatcher.submit_sms,
+            to_phone_numbers,
+            message,
+            enable_delivery_report,
+            tag,
+            priority=priority,
+            callback=callback,
+            service=self,
+        ):
+            logger.info("📱 SMS queued for background delivery")
+            return
 
         def _send_sms_background_task():
             try:
@@ -200,9 +232,12 @@ async def send_sms(
     message: str,
     enable_delivery_report: bool = True,
     tag: str | None = None,
+    priority: NotificationPriority = NotificationPriority.NORMAL,
 ) -> dict[str, Any]:
-    """Convenience function to send SMS."""
-    return await sms_service.send_sms(to_phone_numbers, message, enable_delivery_report, tag)
+    """Convenience function to send SMS (through the shared dispatcher)."""
+    return await get_notification_dispatcher().submit_sms(
+        to_phone_numbers, message, enable_delivery_report, tag, priority=priority
+    )
 
 
 def send_sms_background(
@@ -211,10 +246,11 @@ def send_sms_background(
     enable_delivery_report: bool = True,
     tag: str | None = None,
     callback: callable | None = None,
+    priority: NotificationPriority = NotificationPriority.NORMAL,
 ) -> None:
     """Convenience function to send SMS in background."""
     sms_service.send_sms_background(
-        to_phone_numbers, message, enable_delivery_report, tag, callback
+        to_phone_numbers, message, enable_delivery_report, tag, callback, priority
     )
 
 
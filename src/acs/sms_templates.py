@@ -6,6 +6,7 @@ Reusable SMS message templates that can be used by any tool.
 Provides consistent messaging and formatting for different use cases.
 """
 
+from collections.abc import Callable
 from typing import Any
 
 
@@ -271,3 +272,16 @@ If you didn't request this, contact us immediately.
 Reply STOP to opt out."""
 
         return message
+
+
+# Template name -> renderer, resolved once at import for NotificationDispatcher
+SMS_TEMPLATES: dict[str, Callable[..., str]] = {
+    "claim_confirmation": SmsTemplates.create_claim_confirmation_sms,
+    "appointment_reminder": SmsTemplates.create_appointment_reminder_sms,
+    "policy_notification": SmsTemplates.create_policy_notification_sms,
+    "payment_reminder": SmsTemplates.create_payment_reminder_sms,
+    "emergency_notification": SmsTemplates.create_emergency_notification_sms,
+    "service_update": SmsTemplates.create_service_update_sms,
+    "custom": SmsTemplates.create_custom_sms,
+    "mfa_code": SmsTemplates.create_mfa_code_sms,
+}
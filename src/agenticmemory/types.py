@@ -11,13 +11,24 @@ applications. It exposes four public classes:
                               components that *must not* persist to Redis.
 """
 
-import json
+import os
+import sys
 from typing import Any
 
+from utils import json_codec
 from utils.ml_logging import get_logger
 
 logger = get_logger("agenticmemory.types")
 
+HISTORY_FIELD = "chat_history"
+LOG_FIELD_PREFIX = "chat_log:"
+ARCHIVE_FIELD_PREFIX = "chat_archive:"
+# Per-agent cap on live messages (0 = unbounded)
+DEFAULT_MAX_MESSAGES = int(os.getenv("CHAT_HISTORY_MAX_MESSAGES", "0"))
+DEFAULT_APPEND_LOG = os.getenv("CHAT_HISTORY_APPEND_LOG", "false").lower() in ("true", "1", "yes")
+# Log entries kept before they are folded back into the snapshot
+DEFAULT_COMPACT_EVERY = 64
+
 
 class MemoryError(RuntimeError):
     """Raised when persistence or retrieval of memory fails."""
@@ -69,7 +80,7 @@ class CoreMemory:
 
     def to_json(self) -> str:
         """Serialise to JSON."""
-        json_str = json.dumps(self._store, ensure_ascii=False)
+        json_str = json_codec.dumps(self._store)
         logger.debug("CoreMemory.to_json – %d bytes", len(json_str))
         return json_str
 
@@ -79,23 +90,144 @@ class CoreMemory:
         Args:
             json_str: JSON string produced by :py:meth:`to_json`.
         """
-        self._store = json.loads(json_str)
+        self._store = json_codec.loads(json_str)
         logger.debug("CoreMemory.from_json – loaded %d keys", len(self._store))
 
     def __repr__(self) -> str:  # noqa: D401
         return f"CoreMemory(keys={len(self._store)})"
 
 
+class ChatRecord:
+    """One chat message in compact form (archive and append-only log entries).
+
+    Roles and agent names are interned, so a long history shares one string
+    object per distinct value. Keys other than ``role`` and ``content`` (tool
+    call ids, timestamps, ...) are kept in ``extra``.
+    """
+
+    __slots__ = ("agent", "role", "content", "extra")
+
+    def __init__(
+        self, agent: str, role: str, content: Any, extra: dict[str, Any] | None = None
+    ) -> None:
+        self.agent = sys.intern(agent)
+        self.role = sys.intern(role)
+        self.content = content
+        self.extra = extra or None
+
+    @classmethod
+    def from_message(cls, agent: str, message: dict[str, Any]) -> "ChatRecord":
+        extra = {k: v for k, v in message.items() if k != "role" and k != "content"}
+        return cls(agent, message.get("role", ""), message.get("content"), extra)
+
+    def to_message(self) -> dict[str, Any]:
+        message = {"role": self.role, "content": self.content}
+        if self.extra:
+            message.update(self.extra)
+        return message
+
+    def encode(self) -> str:
+        """``[agent, role, content(, extra)]`` as compact JSON."""
+        row = [self.agent, self.role, self.content]
+        if self.extra:
+            row.append(self.extra)
+        return json_codec.dumps(row)
+
+    @classmethod
+    def decode(cls, raw: str | list) -> "ChatRecord":
+        row = json_codec.loads(raw) if isinstance(raw, (str, bytes)) else raw
+        return cls(row[0], row[1], row[2], row[3] if len(row) > 3 else None)
+
+    def __repr__(self) -> str:  # noqa: D401
+        return f"ChatRecord(agent={self.agent!r}, role={self.role!r})"
+
+
+class _Cursor:
+    """What the last Redis write of one thread covered."""
+
+    __slots__ = ("thread", "length", "last")
+
+    def __init__(self, thread: list[dict[str, Any]]) -> None:
+        self.thread = thread
+        self.length = len(thread)
+        self.last = thread[-1] if thread else None
+
+    def pending(self, thread: list[dict[str, Any]]) -> list[dict[str, Any]] | None:
+        """Messages appended since the write, or None when the thread was edited."""
+        if thread is not self.thread or len(thread) < self.length:
+            return None
+        if self.length and thread[self.length - 1] is not self.last:
+            return None
+        return thread[self.length :]
+
+
+class HistoryWrite:
+    """Hash fields for one persist, from :py:meth:`ChatHistory.prepare_redis_write`."""
+
+    __slots__ = ("mapping", "delete", "snapshot", "_archived", "_synced")
+
+    def __init__(
+        self,
+        mapping: dict[str, str],
+        delete: list[str],
+        snapshot: bool,
+        archived: dict[str, int],
+        synced: tuple,
+    ) -> None:
+        self.mapping = mapping
+        self.delete = delete
+        self.snapshot = snapshot
+        self._archived = archived
+        # (threads, cursors, generation) as of the prepare call
+        self._synced = synced
+
+    @property
+    def is_legacy(self) -> bool:
+        """Only the ``chat_history`` snapshot, exactly what older releases wrote."""
+        return self.snapshot and not self.delete and len(self.mapping) == 1
+
+
 class ChatHistory:
     """Ordered, append‑only list of chat messages *per agent*.
 
     Backwards compatibility:
     * ``append(role, content)`` – writes to *default* agent thread.
     * ``get_all()`` – returns the entire ``dict(agent → turns)``.
+
+    Threads hold plain message dicts because they are handed as-is to the
+    model client, the transcript export and the conversation window.
+
+    Bounded storage (``max_messages``): once a thread exceeds the cap, its
+    oldest messages (a leading system prompt is kept) are evicted in one batch
+    down to three quarters of the cap and archived as :py:class:`ChatRecord`
+    until the next Redis write moves them to ``chat_archive:*`` fields.
+
+    Append-only persistence (``append_log``): the session hash keeps the
+    ``chat_history`` snapshot in the original format, and each persist only
+    adds the messages appended since the previous write as ``chat_log:*``
+    fields. Edits other than appends, evictions and every ``compact_every``
+    log entries fold the log back into a new snapshot. Log field names are
+    derived from message positions, so retrying a write is idempotent.
+    Loading needs the whole hash (:py:meth:`load_redis_fields`); hashes
+    without log fields load exactly as before.
     """
 
-    def __init__(self) -> None:  # noqa: D401
-        self._threads: dict[str, list[dict[str, str]]] = {}
+    def __init__(
+        self,
+        max_messages: int | None = None,
+        append_log: bool | None = None,
+        compact_every: int = DEFAULT_COMPACT_EVERY,
+    ) -> None:  # noqa: D401
+        self._threads: dict[str, list[dict[str, Any]]] = {}
+        self.max_messages = DEFAULT_MAX_MESSAGES if max_messages is None else max_messages
+        self.append_log = DEFAULT_APPEND_LOG if append_log is None else append_log
+        self.compact_every = max(1, compact_every)
+        self._archive: dict[str, list[ChatRecord]] = {}
+        self._archived: dict[str, int] = {}
+        self._log_fields: set[str] = set()
+        self._cursors: dict[str, _Cursor] = {}
+        self._synced_threads: dict[str, list[dict[str, Any]]] | None = None
+        self._generation = 0
         logger.debug("ChatHistory initialised with empty mapping.")
 
     # ------------------------------------------------------------------
@@ -103,12 +235,17 @@ class ChatHistory:
     # ------------------------------------------------------------------
     def append(self, role: str, content: str, agent: str = "default") -> None:
         """Append a message to *agent*'s timeline."""
-        self._threads.setdefault(agent, []).append({"role": role, "content": content})
+        thread = self._threads.get(agent)
+        if thread is None:
+            thread = self._threads[sys.intern(agent)] = []
+        thread.append({"role": sys.intern(role), "content": content})
+        if self.max_messages and len(thread) > self.max_messages:
+            self._evict(agent, thread)
         logger.debug(
             "ChatHistory.append – agent=%s, role=%s, len=%d",
             agent,
             role,
-            len(self._threads[agent]),
+            len(thread),
         )
 
     def get_agent(self, agent: str = "default") -> list[dict[str, str]]:  # noqa: D401
@@ -119,8 +256,14 @@ class ChatHistory:
         """Return the full mapping *shallow* copy."""
         return dict(self._threads)
 
+    def replace(self, threads: dict[str, list[dict[str, Any]]]) -> None:
+        """Swap in a whole new mapping (the next Redis write is a snapshot)."""
+        self._threads = threads
+        self.mark_dirty()
+
     def clear(self, agent: str | None = None) -> None:  # noqa: D401
         """Reset history – either all agents or a single thread."""
+        self.mark_dirty()
         if agent is None:
             self._threads.clear()
             logger.debug("ChatHistory.clear – all agents cleared")
@@ -128,33 +271,246 @@ class ChatHistory:
             self._threads[agent] = []
             logger.debug("ChatHistory.clear – agent=%s", agent)
 
+    def archived(self, agent: str | None = None) -> list[ChatRecord]:
+        """Evicted messages not yet written to Redis (oldest first)."""
+        if agent is not None:
+            return list(self._archive.get(agent, ()))
+        return [record for records in self._archive.values() for record in records]
+
+    def archived_count(self, agent: str) -> int:
+        """Messages evicted from *agent*'s thread so far (written or not)."""
+        return self._archived.get(agent, 0) + len(self._archive.get(agent, ()))
+
+    def _evict(self, agent: str, thread: list[dict[str, Any]]) -> None:
+        keep_system = 1 if thread[0].get("role") == "system" else 0
+        target = max(keep_system + 1, self.max_messages * 3 // 4)
+        count = len(thread) - target
+        if count <= 0:
+            return
+        evicted = thread[keep_system : keep_system + count]
+        del thread[keep_system : keep_system + count]
+        agent = sys.intern(agent)
+        self._archive.setdefault(agent, []).extend(
+            ChatRecord.from_message(agent, message) for message in evicted
+        )
+        logger.debug("ChatHistory evicted %d messages – agent=%s", count, agent)
+
     # ------------------------------------------------------------------
     # Serialisation helpers
     # ------------------------------------------------------------------
     def to_json(self) -> str:  # noqa: D401
-        blob = json.dumps(self._threads, ensure_ascii=False)
+        blob = json_codec.dumps(self._threads)
         logger.debug("ChatHistory.to_json – %d bytes", len(blob))
         return blob
 
     def from_json(self, json_str: str) -> None:  # noqa: D401
-        data = json.loads(json_str)
-        # Auto‑migrate legacy list payloads to {"default": [...]}
-        if isinstance(data, list):
-            self._threads = {"default": data}
-        elif isinstance(data, dict):
-            self._threads = data
-        else:  # pragma: no cover – corrupt data
-            raise ValueError("ChatHistory JSON must be list or dict")
+        self._threads = _parse_threads(json_str)
+        self.mark_dirty()
         logger.debug(
             "ChatHistory.from_json – %d agents, %d total msgs",
             len(self._threads),
             sum(len(t) for t in self._threads.values()),
         )
 
+    # ------------------------------------------------------------------
+    # Redis hash layout
+    # ------------------------------------------------------------------
+    def mark_dirty(self) -> None:
+        """Threads were edited in place: the next Redis write is a snapshot."""
+        self._synced_threads = None
+        self._generation += 1
+
+    def load_redis_fields(self, data: dict[str, Any], field: str = HISTORY_FIELD) -> None:
+        """Load the snapshot, log and archive bookkeeping from a session hash."""
+        threads, log_fields = _merge_log(data, field)
+        self._threads = threads
+        self._log_fields = log_fields
+        self._archive = {}
+        self._archived = _archive_counts(data)
+        self._mark_synced()
+        logger.debug(
+            "ChatHistory.load_redis_fields – %d agents, %d log entries",
+            len(threads),
+            len(log_fields),
+        )
+
+    def prepare_redis_write(self, field: str = HISTORY_FIELD) -> HistoryWrite:
+        """
+        Hash fields to write for the changes since the last write.
+
+        Nothing changes until :py:meth:`commit_redis_write` is called with the
+        result, so a failed write is simply retried by the next persist.
+        """
+        mapping: dict[str, str] = {}
+        for agent, records in self._archive.items():
+            if records:
+                start = self._archived.get(agent, 0)
+                name = f"{ARCHIVE_FIELD_PREFIX}{agent}:{start}:{len(records)}"
+                mapping[name] = "[" + ",".join(record.encode() for record in records) + "]"
+
+        entries = None if self._archive and any(self._archive.values()) else self._pending()
+        if entries is not None and len(self._log_fields) + len(entries) <= self.compact_every:
+            mapping.update(entries)
+            self._log_fields.update(entries)
+            return HistoryWrite(mapping, [], False, self._archive_sizes(), self._sync_point())
+
+        mapping[field] = self.to_json()
+        return HistoryWrite(
+            mapping, sorted(self._log_fields), True, self._archive_sizes(), self._sync_point()
+        )
+
+    def commit_redis_write(self, write: HistoryWrite) -> None:
+        """Record that *write* reached Redis."""
+        for agent, count in write._archived.items():
+            records = self._archive.get(agent)
+            if records:
+                del records[:count]
+                self._archived[agent] = self._archived.get(agent, 0) + count
+        if write.snapshot:
+            self._log_fields.difference_update(write.delete)
+        threads, cursors, generation = write._synced
+        if generation == self._generation:
+            # Messages appended while the write was in flight stay pending
+            self._synced_threads = threads
+            self._cursors = cursors
+
+    def _archive_sizes(self) -> dict[str, int]:
+        return {agent: len(records) for agent, records in self._archive.items() if records}
+
+    def _pending(self) -> dict[str, str] | None:
+        """New log fields, or None when a snapshot is required."""
+        if not self.append_log or self._synced_threads is not self._threads:
+            return None
+        if any(agent not in self._threads for agent in self._cursors):
+            return None
+        entries: dict[str, str] = {}
+        for agent, thread in self._threads.items():
+            cursor = self._cursors.get(agent)
+            if cursor is None:
+                new = thread  # thread created since the last write
+                offset = 0
+            else:
+                new = cursor.pending(thread)
+                if new is None:
+                    return None
+                offset = cursor.length
+            for index, message in enumerate(new, offset):
+                record = ChatRecord.from_message(agent, message)
+                entries[f"{LOG_FIELD_PREFIX}{agent}:{index}"] = record.encode()
+        return entries
+
+    def _sync_point(self) -> tuple:
+        cursors = {agent: _Cursor(thread) for agent, thread in self._threads.items()}
+        return self._threads, cursors, self._generation
+
+    def _mark_synced(self) -> None:
+        self._synced_threads, self._cursors, _ = self._sync_point()
+
+    @staticmethod
+    def threads_from_redis_fields(
+        data: dict[str, Any], field: str = HISTORY_FIELD
+    ) -> dict[str, list[dict[str, Any]]] | None:
+        """Threads stored in a session hash (snapshot plus log), None when absent."""
+        if field not in data:
+            return None
+        return _merge_log(data, field)[0]
+
+    @staticmethod
+    def archive_from_redis_fields(data: dict[str, Any]) -> dict[str, list[dict[str, Any]]]:
+        """Archived (evicted) messages stored in a session hash, oldest first."""
+        batches: dict[str, list[tuple[int, str]]] = {}
+        for name, value in data.items():
+            parsed = _parse_archive_field(name)
+            if parsed:
+                batches.setdefault(parsed[0], []).append((parsed[1], value))
+        archive: dict[str, list[dict[str, Any]]] = {}
+        for agent, entries in batches.items():
+            entries.sort(key=lambda entry: entry[0])
+            archive[agent] = [
+                ChatRecord.decode(row).to_message()
+                for _, value in entries
+                for row in json_codec.loads(value)
+            ]
+        return archive
+
     def __repr__(self) -> str:  # noqa: D401
         total = sum(len(t) for t in self._threads.values())
         return f"ChatHistory(agents={len(self._threads)}, messages={total})"
 
 
+def _text(value: Any) -> str:
+    return value.decode("utf-8") if isinstance(value, bytes) else value
+
+
+def _parse_threads(raw: Any) -> dict[str, list[dict[str, Any]]]:
+    data = json_codec.loads(raw) if isinstance(raw, (str, bytes)) else raw
+    # Auto‑migrate legacy list payloads to {"default": [...]}
+    if isinstance(data, list):
+        data = {"default": data}
+    elif not isinstance(data, dict):  # pragma: no cover – corrupt data
+        raise ValueError("ChatHistory JSON must be list or dict")
+    threads = {}
+    for agent, thread in data.items():
+        for message in thread:
+            role = message.get("role") if isinstance(message, dict) else None
+            if isinstance(role, str):
+                message["role"] = sys.intern(role)
+        threads[sys.intern(agent)] = thread
+    return threads
+
+
+def _parse_log_field(name: Any) -> tuple[str, int] | None:
+    name = _text(name)
+    if not isinstance(name, str) or not name.startswith(LOG_FIELD_PREFIX):
+        return None
+    agent, _, index = name[len(LOG_FIELD_PREFIX) :].rpartition(":")
+    return (agent, int(index)) if index.isdigit() else None
+
+
+def _parse_archive_field(name: Any) -> tuple[str, int, int] | None:
+    name = _text(name)
+    if not isinstance(name, str) or not name.startswith(ARCHIVE_FIELD_PREFIX):
+        return None
+    parts = name[len(ARCHIVE_FIELD_PREFIX) :].rsplit(":", 2)
+    if len(parts) != 3 or not (parts[1].isdigit() and parts[2].isdigit()):
+        return None
+    return parts[0], int(parts[1]), int(parts[2])
+
+
+def _archive_counts(data: dict[str, Any]) -> dict[str, int]:
+    counts: dict[str, int] = {}
+    for name in data:
+        parsed = _parse_archive_field(name)
+        if parsed:
+            agent, start, count = parsed
+            counts[agent] = max(counts.get(agent, 0), start + count)
+    return counts
+
+
+def _merge_log(
+    data: dict[str, Any], field: str
+) -> tuple[dict[str, list[dict[str, Any]]], set[str]]:
+    """Snapshot threads with the ``chat_log:*`` entries applied in order."""
+    raw = data.get(field)
+    threads = _parse_threads(raw) if raw else {}
+    entries: dict[str, list[tuple[int, Any]]] = {}
+    log_fields: set[str] = set()
+    for name, value in data.items():
+        parsed = _parse_log_field(name)
+        if parsed:
+            log_fields.add(_text(name))
+            entries.setdefault(parsed[0], []).append((parsed[1], value))
+    for agent, items in entries.items():
+        thread = threads.setdefault(sys.intern(agent), [])
+        for index, value in sorted(items, key=lambda item: item[0]):
+            if index < len(thread):
+                continue  # already folded into the snapshot
+            if index > len(thread):
+                logger.warning("ChatHistory log gap – agent=%s, index=%d", agent, index)
+                break
+            thread.append(ChatRecord.decode(value).to_message())
+    return threads, log_fields
+
+
 # TODO: Implement EphemeralMemoManager
 # class EphemeralMemoManager():
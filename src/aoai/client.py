@@ -4,26 +4,43 @@ services/openai_client.py
 Single shared Azure OpenAI client.  Import `client` anywhere you need
 to talk to the Chat Completion API; it will be created once at
 import-time with proper JWT token handling for APIM policy evaluation.
+
+`get_async_client()` returns the process-wide async client used on the
+voice hot path: streamed tokens are consumed on the event loop over a
+bounded, keep-alive connection pool (HTTP/2 when ``h2`` is installed).
 """
 
 import argparse
+import asyncio
+import importlib.util
 import json
 import os
 import sys
+import time
 
+import httpx
 from azure.identity import (
     DefaultAzureCredential,
     ManagedIdentityCredential,
     get_bearer_token_provider,
 )
 from dotenv import load_dotenv
-from openai import AzureOpenAI
+from openai import AsyncAzureOpenAI, AzureOpenAI
 from utils.azure_auth import get_credential
 from utils.ml_logging import logging
 
 logger = logging.getLogger(__name__)
 load_dotenv()
 
+COGNITIVE_SERVICES_SCOPE = "https://cognitiveservices.azure.com/.default"
+
+# Async client connection pool (shared by all concurrent turns in the process)
+AOAI_MAX_CONNECTIONS = int(os.getenv("AOAI_MAX_CONNECTIONS", "200"))
+AOAI_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("AOAI_MAX_KEEPALIVE_CONNECTIONS", "50"))
+AOAI_KEEPALIVE_EXPIRY_SEC = float(os.getenv("AOAI_KEEPALIVE_EXPIRY_SEC", "120"))
+AOAI_CONNECT_TIMEOUT_SEC = float(os.getenv("AOAI_CONNECT_TIMEOUT_SEC", "5"))
+AOAI_HTTP2 = os.getenv("AOAI_HTTP2", "true").lower() in ("1", "true", "yes")
+
 
 def create_azure_openai_client(
     *,
@@ -89,6 +106,110 @@ def create_azure_openai_client(
         )
 
 
+class AsyncTokenProvider:
+    """
+    Azure AD token provider for the async client that never blocks the loop.
+
+    Tokens are cached until shortly before expiry; refreshes run
+    ``credential.get_token`` on a worker thread, one at a time.
+    """
+
+    def __init__(self, credential, scope: str = COGNITIVE_SERVICES_SCOPE, refresh_margin_sec=300):
+        self._credential = credential
+        self._scope = scope
+        self._refresh_margin_sec = refresh_margin_sec
+        self._token: str | None = None
+        self._expires_on = 0.0
+        self._lock: asyncio.Lock | None = None
+
+    def _fresh(self) -> bool:
+        return self._token is not None and time.time() < self._expires_on - self._refresh_margin_sec
+
+    async def __call__(self) -> str:
+        if self._fresh():
+            return self._token
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if not self._fresh():
+                access_token = await asyncio.to_thread(self._credential.get_token, self._scope)
+                self._token = access_token.token
+                self._expires_on = float(access_token.expires_on)
+        return self._token
+
+
+def create_async_http_client(
+    *,
+    max_connections: int = AOAI_MAX_CONNECTIONS,
+    max_keepalive_connections: int = AOAI_MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry: float = AOAI_KEEPALIVE_EXPIRY_SEC,
+    http2: bool = AOAI_HTTP2,
+    transport: httpx.AsyncBaseTransport | None = None,
+) -> httpx.AsyncClient:
+    """
+    Pooled keep-alive HTTP client for the async Azure OpenAI client.
+
+    HTTP/2 is enabled only when requested and the ``h2`` package is installed;
+    otherwise requests share a bounded pool of HTTP/1.1 keep-alive connections.
+    """
+    use_http2 = http2 and transport is None and importlib.util.find_spec("h2") is not None
+    return httpx.AsyncClient(
+        http2=use_http2,
+        transport=transport,
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        ),
+        timeout=httpx.Timeout(60.0, connect=AOAI_CONNECT_TIMEOUT_SEC),
+    )
+
+
+def create_async_azure_openai_client(
+    *,
+    azure_endpoint: str | None = None,
+    azure_api_key: str | None = None,
+    azure_client_id: str | None = None,
+    credential: DefaultAzureCredential | ManagedIdentityCredential | None = None,
+    api_version: str = "2025-01-01-preview",
+    http_client: httpx.AsyncClient | None = None,
+) -> AsyncAzureOpenAI:
+    """
+    Create an async Azure OpenAI client with the same configuration rules as
+    :func:`create_azure_openai_client`, on a pooled keep-alive HTTP client.
+    """
+    azure_endpoint = azure_endpoint or os.getenv("AZURE_OPENAI_ENDPOINT", "")
+    azure_api_key = azure_api_key or os.getenv("AZURE_OPENAI_KEY")
+    azure_client_id = azure_client_id or os.getenv("AZURE_CLIENT_ID")
+
+    if not azure_endpoint:
+        raise ValueError("AZURE_OPENAI_ENDPOINT must be provided via argument or environment.")
+
+    http_client = http_client or create_async_http_client()
+    if azure_api_key:
+        logger.info("Using API key authentication for async Azure OpenAI client")
+        return AsyncAzureOpenAI(
+            api_version=api_version,
+            azure_endpoint=azure_endpoint,
+            api_key=azure_api_key,
+            http_client=http_client,
+        )
+
+    resolved_credential = credential
+    if not resolved_credential:
+        if azure_client_id:
+            resolved_credential = ManagedIdentityCredential(client_id=azure_client_id)
+        else:
+            resolved_credential = get_credential()
+    logger.info("Using Azure AD authentication for async Azure OpenAI client")
+    return AsyncAzureOpenAI(
+        api_version=api_version,
+        azure_endpoint=azure_endpoint,
+        azure_ad_token_provider=AsyncTokenProvider(resolved_credential),
+        http_client=http_client,
+    )
+
+
 def main() -> None:
     """
     Execute a synchronous smoke test to confirm Azure OpenAI access and optionally run a prompt.
@@ -197,6 +318,38 @@ def get_client():
     return _client_instance
 
 
+# The async client's connection pool belongs to the event loop that created it
+_async_client_instance: AsyncAzureOpenAI | None = None
+_async_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def get_async_client() -> AsyncAzureOpenAI:
+    """
+    Get the process-wide async Azure OpenAI client (lazy initialization).
+
+    Must be called from a running event loop. The connection pool is bound to
+    the loop that created it, so a different loop (e.g. a new test event
+    loop) gets a fresh client.
+
+    Raises:
+        ValueError: If AZURE_OPENAI_ENDPOINT is not configured.
+    """
+    global _async_client_instance, _async_client_loop
+    loop = asyncio.get_running_loop()
+    if _async_client_instance is None or _async_client_loop is not loop:
+        _async_client_instance = create_async_azure_openai_client()
+        _async_client_loop = loop
+    return _async_client_instance
+
+
+async def close_async_client() -> None:
+    """Close the shared async client and its connection pool."""
+    global _async_client_instance, _async_client_loop
+    async_client, _async_client_instance, _async_client_loop = _async_client_instance, None, None
+    if async_client is not None:
+        await async_client.close()
+
+
 # For backwards compatibility, provide 'client' as a property-like access
 # Note: Direct access to 'client' will create the client immediately.
 # Prefer using get_client() in new code.
@@ -242,8 +395,6 @@ async def warm_openai_connection(
     Latency:
         Expected ~300-500ms for first connection, near-instant on subsequent calls.
     """
-    import asyncio
-
     deployment = (
         deployment
         or os.getenv("AZURE_OPENAI_DEPLOYMENT")
@@ -253,13 +404,13 @@ async def warm_openai_connection(
         logger.warning("OpenAI warmup skipped: no deployment configured")
         return False
 
-    aoai_client = get_client()
+    # Warm the async client's pool: it serves the latency-critical cascade turns
+    aoai_client = get_async_client()
 
     try:
         # Use a tiny prompt that exercises the connection with minimal tokens
-        response = await asyncio.wait_for(
-            asyncio.to_thread(
-                aoai_client.chat.completions.create,
+        await asyncio.wait_for(
+            aoai_client.chat.completions.create(
                 model=deployment,
                 messages=[{"role": "user", "content": "hi"}],
                 max_tokens=1,
@@ -338,7 +489,11 @@ def test_responses_endpoint(deployment: str, prompt: str = "test") -> bool:
 __all__ = [
     "client",
     "get_client",
+    "get_async_client",
+    "close_async_client",
     "create_azure_openai_client",
+    "create_async_azure_openai_client",
+    "create_async_http_client",
     "_init_client",
     "warm_openai_connection",
     "test_responses_endpoint",
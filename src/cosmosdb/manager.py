@@ -1,3 +1,5 @@
+import asyncio
+import base64
 import logging
 import os
 import re
@@ -9,6 +11,7 @@ from functools import wraps
 from typing import Any, TypeVar
 
 import pymongo
+from bson import json_util
 from bson.son import SON
 from dotenv import load_dotenv
 from opentelemetry import trace
@@ -115,6 +118,7 @@ class CosmosDBMongoCoreManager:
         """
         load_dotenv()
         connection_string = connection_string or os.getenv("AZURE_COSMOS_CONNECTION_STRING")
+        self._ensured_indexes: set[tuple] = set()
 
         self.cluster_host = _extract_cluster_host(connection_string)
 
@@ -281,6 +285,164 @@ class CosmosDBMongoCoreManager:
             logger.error(f"Failed to query documents: {e}")
             return []
 
+    @_trace_cosmosdb("find_page")
+    def query_page(
+        self,
+        query: dict[str, Any],
+        *,
+        sort_field: str,
+        limit: int,
+        projection: dict[str, Any] | None = None,
+        skip: int | None = None,
+        cursor: str | None = None,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """
+        Return one page of documents ordered by ``sort_field`` descending.
+
+        The filter, projection, sort and limit all run server-side, so only the
+        page is transferred. Pass the returned cursor back for keyset
+        pagination (an index range seek, independent of page depth); ``skip``
+        is honoured only when no cursor is given. Ties on ``sort_field`` are
+        broken by ``_id``; see :meth:`ensure_index` for the matching index.
+
+        Args:
+            query: Filter used to match documents.
+            sort_field: Indexed field to order by (newest first).
+            limit: Maximum number of documents to return.
+            projection: Optional field projection to apply.
+            skip: Offset for page-number pagination.
+            cursor: Opaque cursor returned by a previous call.
+
+        Returns:
+            The page of documents and the cursor for the next page (None when
+            there are no more documents).
+
+        Raises:
+            ValueError: If ``cursor`` is malformed.
+        """
+        if cursor:
+            last_value, last_id = self.decode_page_cursor(cursor)
+            query = {
+                "$and": [
+                    query,
+                    {
+                        "$or": [
+                            {sort_field: {"$lt": last_value}},
+                            {sort_field: last_value, "_id": {"$lt": last_id}},
+                        ]
+                    },
+                ]
+            }
+            skip = None
+        if projection and any(v for k, v in projection.items() if k != "_id"):
+            # Inclusion projections must keep the sort key for the next cursor
+            projection = {**projection, sort_field: 1}
+
+        try:
+            found = self.collection.find(query, projection=projection)
+            found = found.sort([(sort_field, pymongo.DESCENDING), ("_id", pymongo.DESCENDING)])
+            if skip:
+                found = found.skip(skip)
+            documents = list(found.limit(limit + 1))
+        except PyMongoError as e:
+            logger.error(f"Failed to query document page: {e}")
+            return [], None
+
+        next_cursor = None
+        if len(documents) > limit:
+            documents = documents[:limit]
+            last = documents[-1]
+            next_cursor = self.encode_page_cursor(last.get(sort_field), last.get("_id"))
+        return documents, next_cursor
+
+    @staticmethod
+    def encode_page_cursor(value: Any, document_id: Any) -> str:
+        """Encode the last (sort value, _id) of a page, preserving BSON types."""
+        raw = json_util.dumps([value, document_id]).encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+    @staticmethod
+    def decode_page_cursor(cursor: str) -> tuple[Any, Any]:
+        """Inverse of :meth:`encode_page_cursor`; raises ValueError when malformed."""
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            value, document_id = json_util.loads(base64.urlsafe_b64decode(padded))
+        except Exception as exc:
+            raise ValueError(f"Invalid page cursor: {cursor!r}") from exc
+        return value, document_id
+
+    @_trace_cosmosdb("count")
+    def count_documents(
+        self,
+        query: dict[str, Any],
+        *,
+        limit: int | None = None,
+        max_time_ms: int | None = None,
+    ) -> int:
+        """
+        Count matching documents, cheaply where possible.
+
+        An empty filter uses collection metadata (``estimated_document_count``).
+        Otherwise the count is capped at ``limit`` and bounded by
+        ``max_time_ms`` so large histories cannot stall the caller; callers
+        should treat a result equal to ``limit`` as "at least".
+
+        Returns:
+            The (possibly capped) count, or -1 if counting failed.
+        """
+        try:
+            if not query:
+                return int(self.collection.estimated_document_count())
+            options: dict[str, Any] = {}
+            if limit:
+                options["limit"] = limit
+            if max_time_ms:
+                options["maxTimeMS"] = max_time_ms
+            return int(self.collection.count_documents(query, **options))
+        except PyMongoError as e:
+            logger.warning(f"Failed to count documents: {e}")
+            return -1
+
+    @_trace_cosmosdb("create_index")
+    def ensure_index(self, keys: Sequence[tuple[str, int]], name: str | None = None) -> bool:
+        """
+        Create an index if it has not been ensured by this manager yet.
+
+        Args:
+            keys: Index specification, e.g. ``[("timestamp", -1), ("_id", -1)]``.
+            name: Optional index name.
+
+        Returns:
+            True if the index exists or was created, False on failure.
+        """
+        spec = tuple(keys)
+        if spec in self._ensured_indexes:
+            return True
+        try:
+            options = {"name": name} if name else {}
+            self.collection.create_index(list(spec), **options)
+            self._ensured_indexes.add(spec)
+            return True
+        except PyMongoError as e:
+            logger.warning(f"Failed to ensure index {list(spec)}: {e}")
+            return False
+
+    async def query_page_async(self, query: dict[str, Any], **kwargs: Any):
+        """Run :meth:`query_page` on a worker thread."""
+        return await asyncio.to_thread(self.query_page, query, **kwargs)
+
+    async def count_documents_async(self, query: dict[str, Any], **kwargs: Any) -> int:
+        """Run :meth:`count_documents` on a worker thread."""
+        return await asyncio.to_thread(self.count_documents, query, **kwargs)
+
+    async def ensure_index_async(
+        self, keys: Sequence[tuple[str, int]], name: str | None = None
+    ) -> bool:
+        """Run :meth:`ensure_index` on a worker thread (skipped once ensured)."""
+        if tuple(keys) in self._ensured_indexes:
+            return True
+        return await asyncio.to_thread(self.ensure_index, keys, name)
+
     @_trace_cosmosdb("count")
     def document_exists(self, query: dict[str, Any]) -> bool:
         """
@@ -6,24 +6,30 @@ Simple, production-ready WebSocket connection management following FastAPI best
 
 Features:
 - Thread-safe connection registry with async locks
-- Per-connection send queues to prevent concurrent write issues
+- Per-connection send lanes (control, audio, telemetry) with their own bounds and
+  drop policies, drained in priority order by one event-driven sender task
 - Simple broadcast by session, call, topic, or all connections
+- Broadcasts serialize each envelope once and share the text frame across recipients
 - Clean lifecycle management with proper resource cleanup
+- Liveness re-checks and call-context TTLs on the shared expiry wheel (no registry scans)
 - Production logging and error handling
 """
 
 import asyncio
-import json
 import time
 import uuid
+from collections import deque
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Literal, Optional
 
 from fastapi import WebSocket
 from fastapi.websockets import WebSocketState
+from utils import json_codec
 from utils.ml_logging import get_logger
 
+from src.pools.expiry_wheel import ExpiryWheel, get_expiry_wheel
+
 if TYPE_CHECKING:
     from src.redis.manager import AzureRedisManager
 
@@ -46,55 +52,216 @@ class ConnectionMeta:
     created_at: float = field(default_factory=time.time)
 
 
+def encode_frame(payload: dict[str, Any]) -> str:
+    """Serialize an envelope once so the same text frame can go to every recipient."""
+    return json_codec.dumps(payload)
+
+
+def overlay_frame(frame: str, fields: dict[str, Any]) -> str:
+    """
+    Add top-level ``fields`` to an encoded JSON object without re-encoding it.
+
+    Only ``fields`` is serialized and spliced in before the closing brace. A key
+    already present in ``frame`` is repeated, and JSON parsers keep the last
+    occurrence, so the result decodes like ``{**payload, **fields}``.
+    """
+    if not fields:
+        return frame
+    extra = encode_frame(fields)
+    if frame == "{}":
+        return extra
+    return f"{frame[:-1]},{extra[1:]}"
+
+
+Lane = Literal["control", "audio", "telemetry"]
+
+# Drain order: a queued control frame is always sent before queued audio or telemetry
+LANES: tuple[Lane, ...] = ("control", "audio", "telemetry")
+
+_AUDIO_TYPES = frozenset({"audio", "audio_data"})
+_AUDIO_STOP_ACTIONS = frozenset({"audio_stop", "tts_cancelled"})
+
+
+@dataclass(frozen=True)
+class LanePolicy:
+    """
+    Bound and overflow policy for one outbound lane (``maxsize=0`` is unbounded).
+
+    ``drop`` picks what a full lane gives up: the oldest queued frame, the new
+    frame, or (``"disconnect"``) the connection itself, for lanes whose frames
+    must not be lost.
+    """
+
+    maxsize: int = 0
+    drop: Literal["oldest", "newest", "disconnect"] = "oldest"
+
+
+DEFAULT_LANE_POLICIES: dict[Lane, LanePolicy] = {
+    # Control frames and conversation envelopes are never dropped; a client too
+    # slow to take 100 of them is disconnected instead (so it can reconnect)
+    "control": LanePolicy(maxsize=100, drop="disconnect"),
+    # ~4 s of 20 ms frames; late audio is worth less than current audio
+    "audio": LanePolicy(maxsize=200, drop="oldest"),
+    # Dashboard and debug updates: the latest state supersedes older ones
+    "telemetry": LanePolicy(maxsize=50, drop="oldest"),
+}
+
+
+def classify_lane(payload: dict[str, Any]) -> Lane:
+    """Outbound lane for an envelope: audio frames, dashboard/debug telemetry, else control."""
+    message_type = payload.get("type")
+    if message_type in _AUDIO_TYPES or payload.get("kind") == "AudioData":
+        return "audio"
+    if payload.get("topic") == "dashboard" or message_type == "debug":
+        return "telemetry"
+    return "control"
+
+
+def stops_audio(payload: dict[str, Any]) -> bool:
+    """Whether ``payload`` tells the client to stop playback (queued audio is discarded)."""
+    if payload.get("kind") == "StopAudio":
+        return True
+    return payload.get("type") == "control" and payload.get("action") in _AUDIO_STOP_ACTIONS
+
+
+class _Lane:
+    """One bounded outbound queue with its counters."""
+
+    __slots__ = ("policy", "items", "enqueued", "sent", "dropped", "flushed", "high_water")
+
+    def __init__(self, policy: LanePolicy):
+        self.policy = policy
+        self.items: deque[str] = deque()
+        self.enqueued = 0
+        self.sent = 0
+        self.dropped = 0
+        self.flushed = 0
+        self.high_water = 0
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "depth": len(self.items),
+            "high_water": self.high_water,
+            "enqueued": self.enqueued,
+            "sent": self.sent,
+            "dropped": self.dropped,
+            "flushed": self.flushed,
+        }
+
+
 class _Connection:
-    """Internal connection wrapper with send queue and proper thread safety."""
+    """
+    Internal connection wrapper with prioritized send lanes.
+
+    Outbound frames go to a control, audio or telemetry lane, each with its own
+    bound and drop policy. A single sender task wakes when a frame is queued and
+    drains the backlog in lane priority order, so a slow socket delays audio and
+    telemetry but not a barge-in stop queued behind them.
+    """
 
     def __init__(
         self,
         websocket: WebSocket,
         meta: ConnectionMeta,
         on_send_failure: Callable[[Exception], Awaitable[None]] | None = None,
+        lane_policies: dict[Lane, LanePolicy] | None = None,
     ):
         self.ws = websocket
         self.meta = meta
-        self._queue = asyncio.Queue(maxsize=100)  # Simple queue with reasonable limit
-        self._sender_task = asyncio.create_task(self._sender_loop())
-        self._send_lock = asyncio.Lock()  # Protect send operations
+        policies = {**DEFAULT_LANE_POLICIES, **(lane_policies or {})}
+        self._lanes = {name: _Lane(policies[name]) for name in LANES}
+        self._ready = asyncio.Event()
         self._closed = False
         self._on_send_failure = on_send_failure
+        self._disconnect_task: asyncio.Task | None = None
+        self._sender_task = asyncio.create_task(self._sender_loop())
 
-    async def send_json(self, payload: dict[str, Any]) -> None:
-        """Queue JSON message for sending with thread safety."""
+    async def send_json(self, payload: dict[str, Any], lane: Lane | None = None) -> None:
+        """Queue a JSON message on its lane (classified from the payload by default)."""
         if self._closed:
             return
 
-        async with self._send_lock:  # Protect queue operations
-            try:
-                message = json.dumps(payload)
-                if self._queue.full():
-                    # Atomic drop-oldest-and-add operation
-                    try:
-                        self._queue.get_nowait()
-                    except asyncio.QueueEmpty:
-                        pass
-                await self._queue.put(message)
-            except Exception as e:
-                logger.error(
-                    f"Failed to queue message: {e}",
-                    extra={"conn_id": self.meta.connection_id},
-                )
+        try:
+            message = encode_frame(payload)
+        except (TypeError, ValueError) as e:
+            logger.error(
+                f"Failed to queue message: {e}",
+                extra={"conn_id": self.meta.connection_id},
+            )
+            return
+        self.enqueue(message, lane or classify_lane(payload), stop_audio=stops_audio(payload))
+
+    async def send_text(
+        self, message: str, lane: Lane = "control", *, stop_audio: bool = False
+    ) -> None:
+        """Queue an already-encoded text frame (shared as-is across recipients)."""
+        self.enqueue(message, lane, stop_audio=stop_audio)
+
+    def enqueue(self, message: str, lane: Lane = "control", *, stop_audio: bool = False) -> bool:
+        """
+        Queue a text frame without awaiting.
+
+        Args:
+            message: Encoded text frame.
+            lane: Lane to queue on.
+            stop_audio: Discard queued audio first (barge-in).
+
+        Returns:
+            False if the connection is closed, the lane dropped this frame or
+            the lane overflowed and the connection is being disconnected.
+        """
+        if self._closed:
+            return False
+        if stop_audio:
+            self.flush_lane("audio")
+
+        queue = self._lanes[lane]
+        policy = queue.policy
+        if policy.maxsize and len(queue.items) >= policy.maxsize:
+            queue.dropped += 1
+            if policy.drop == "disconnect":
+                self._disconnect_on_overflow(lane)
+                return False
+            if policy.drop == "newest":
+                return False
+            queue.items.popleft()
+        queue.items.append(message)
+        queue.enqueued += 1
+        if len(queue.items) > queue.high_water:
+            queue.high_water = len(queue.items)
+        self._ready.set()
+        return True
+
+    def flush_lane(self, lane: Lane) -> int:
+        """Discard every frame queued on ``lane``; returns how many were discarded."""
+        queue = self._lanes[lane]
+        count = len(queue.items)
+        queue.items.clear()
+        queue.flushed += count
+        return count
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Per-lane depth, high-water mark and enqueued / sent / dropped / flushed counters."""
+        return {name: queue.stats() for name, queue in self._lanes.items()}
+
+    def _next_frame(self) -> tuple[_Lane, str] | None:
+        for queue in self._lanes.values():
+            if queue.items:
+                return queue, queue.items.popleft()
+        return None
 
     async def _sender_loop(self) -> None:
-        """Send queued messages to WebSocket with proper error handling."""
+        """Send queued frames in lane priority order, waking only when one is queued."""
         try:
-            while not self._closed:
-                try:
-                    message = await asyncio.wait_for(self._queue.get(), timeout=1.0)
-                except TimeoutError:
-                    continue  # Check _closed flag periodically
-
-                if message is None:  # Shutdown signal
-                    return
+            while True:
+                item = self._next_frame()
+                if item is None:
+                    if self._closed:
+                        return
+                    self._ready.clear()
+                    await self._ready.wait()
+                    continue
+                queue, message = item
 
                 # Thread-safe WebSocket state check and send
                 try:
@@ -103,12 +270,13 @@ class _Connection:
                         and self.ws.application_state == WebSocketState.CONNECTED
                     ):
                         await self.ws.send_text(message)
+                        queue.sent += 1
                     else:
                         logger.debug(
                             "WebSocket no longer connected; stopping sender",
                             extra={"conn_id": self.meta.connection_id},
                         )
-                        self._closed = True
+                        self._stop_sending()
                         if self._on_send_failure:
                             asyncio.create_task(
                                 self._on_send_failure(RuntimeError("websocket_disconnected"))
@@ -124,7 +292,7 @@ class _Connection:
                         message,
                         extra={"conn_id": self.meta.connection_id},
                     )
-                    self._closed = True
+                    self._stop_sending()
                     if self._on_send_failure:
                         asyncio.create_task(self._on_send_failure(e))
                     return
@@ -134,62 +302,94 @@ class _Connection:
         except Exception as e:
             logger.error(f"Sender loop error: {e}", extra={"conn_id": self.meta.connection_id})
 
+    def _stop_sending(self) -> None:
+        self._closed = True
+        for queue in self._lanes.values():
+            queue.dropped += len(queue.items)
+            queue.items.clear()
+
+    def _disconnect_on_overflow(self, lane: Lane) -> None:
+        """Stop queueing for a client that cannot keep up and close its socket."""
+        logger.warning(
+            "Outbound %s lane full (%d frames); disconnecting slow client",
+            lane,
+            self._lanes[lane].policy.maxsize,
+            extra={"conn_id": self.meta.connection_id},
+        )
+        self._stop_sending()
+        self._ready.set()
+        self._disconnect_task = asyncio.create_task(
+            self._disconnect(RuntimeError(f"{lane}_lane_overflow"))
+        )
+
+    async def _disconnect(self, reason: Exception) -> None:
+        # The sender may be blocked on the stalled socket
+        self._sender_task.cancel()
+        try:
+            if (
+                self.ws.client_state == WebSocketState.CONNECTED
+                and self.ws.application_state == WebSocketState.CONNECTED
+            ):
+                # 1013: try again later
+                await asyncio.wait_for(self.ws.close(code=1013), timeout=2.0)
+        except Exception as e:
+            logger.debug(
+                f"Error closing WebSocket: {e}",
+                extra={"conn_id": self.meta.connection_id},
+            )
+        if self._on_send_failure:
+            await self._on_send_failure(reason)
+
     async def close(self) -> None:
         """Close connection and cleanup resources with proper thread safety."""
         if self._closed:
             return
 
+        # The sender drains what is already queued, then exits
         self._closed = True
+        self._ready.set()
 
-        async with self._send_lock:  # Ensure no concurrent send operations
-            try:
-                # Signal sender to stop via sentinel; ensure it enqueues even if full
-                try:
-                    self._queue.put_nowait(None)
-                except asyncio.QueueFull:
-                    # Drop one oldest and try again to guarantee shutdown signal
-                    try:
-                        _ = self._queue.get_nowait()
-                    except asyncio.QueueEmpty:
-                        pass
-                    try:
-                        self._queue.put_nowait(None)
-                    except asyncio.QueueFull:
-                        # As last resort, rely on timeout + _closed flag in loop
-                        logger.debug(
-                            "Queue full during close; relying on timeout/_closed to exit",
-                            extra={"conn_id": self.meta.connection_id},
-                        )
-
-                # Allow sender task to exit gracefully (sentinel or _closed flag)
-                if not self._sender_task.done():
-                    try:
-                        await asyncio.wait_for(self._sender_task, timeout=2.0)
-                    except TimeoutError:
-                        logger.debug(
-                            "Sender task timeout on close; proceeding to force close",
-                            extra={"conn_id": self.meta.connection_id},
-                        )
-
-                # Close WebSocket if still connected
+        try:
+            if not self._sender_task.done():
                 try:
-                    if (
-                        self.ws.client_state == WebSocketState.CONNECTED
-                        and self.ws.application_state == WebSocketState.CONNECTED
-                    ):
-                        await self.ws.close()
-                except Exception as e:
+                    await asyncio.wait_for(asyncio.shield(self._sender_task), timeout=2.0)
+                except TimeoutError:
                     logger.debug(
-                        f"Error closing WebSocket: {e}",
+                        "Sender task timeout on close; proceeding to force close",
                         extra={"conn_id": self.meta.connection_id},
                     )
+                    self._sender_task.cancel()
+                    self._stop_sending()
 
+            # Close WebSocket if still connected
+            try:
+                if (
+                    self.ws.client_state == WebSocketState.CONNECTED
+                    and self.ws.application_state == WebSocketState.CONNECTED
+                ):
+                    await self.ws.close()
             except Exception as e:
-                logger.error(
-                    f"Error during connection cleanup: {e}",
+                logger.debug(
+                    f"Error closing WebSocket: {e}",
                     extra={"conn_id": self.meta.connection_id},
                 )
 
+        except Exception as e:
+            logger.error(
+                f"Error during connection cleanup: {e}",
+                extra={"conn_id": self.meta.connection_id},
+            )
+
+
+def _discard_from_index(index: dict[str, set[str]], key: str, connection_id: str) -> None:
+    """Remove ``connection_id`` from ``index[key]``, dropping the key once empty."""
+    members = index.get(key)
+    if members is None:
+        return
+    members.discard(connection_id)
+    if not members:
+        del index[key]
+
 
 class ThreadSafeConnectionManager:
     """
@@ -213,8 +413,19 @@ class ThreadSafeConnectionManager:
         max_connections: int = 200,
         queue_size: int = 50,
         enable_connection_limits: bool = True,
+        lane_policies: dict[Lane, LanePolicy] | None = None,
+        liveness_check_s: float = 60.0,
+        call_context_ttl_s: float = 2 * 3600,
+        expiry: ExpiryWheel | None = None,
     ):
         self._lock = asyncio.Lock()
+        self._lane_policies = lane_policies
+
+        # Per-entry expiry instead of periodic scans of the registries below
+        self.liveness_check_s = liveness_check_s
+        self.call_context_ttl_s = call_context_ttl_s
+        self._expiry = expiry if expiry is not None else get_expiry_wheel()
+        self._expiry_ns = f"conn_manager:{id(self):x}"
         self._conns: dict[str, _Connection] = {}
 
         # Simple indexes for efficient broadcast
@@ -293,6 +504,11 @@ class ThreadSafeConnectionManager:
 
         async with self._lock:
             close_tasks = [conn.close() for conn in self._conns.values()]
+            for conn_id in self._conns:
+                self._expiry.cancel(self._connection_key(conn_id))
+            for call_id in self._call_context:
+                self._expiry.cancel(self._call_context_key(call_id))
+            self._call_context.clear()
         await asyncio.gather(*close_tasks, return_exceptions=True)
 
         async with self._lock:
@@ -418,6 +634,7 @@ class ThreadSafeConnectionManager:
             websocket=websocket,
             meta=meta,
             on_send_failure=_on_send_failure,
+            lane_policies=self._lane_policies,
         )
 
         async with self._lock:
@@ -428,6 +645,9 @@ class ThreadSafeConnectionManager:
                 self._by_call.setdefault(call_id, set()).add(conn_id)
             for topic in meta.topics:
                 self._by_topic.setdefault(topic, set()).add(conn_id)
+            self._expiry.schedule(
+                self._connection_key(conn_id), self.liveness_check_s, self._on_liveness_check
+            )
 
         logger.info(
             f"WebSocket registered: {conn_id} ({client_type}) "
@@ -475,17 +695,52 @@ class ThreadSafeConnectionManager:
                 except Exception as e:
                     logger.error(f"Error stopping handler: {e}", extra={"conn_id": connection_id})
 
-            # Remove from indexes
-            if conn.meta.session_id:
-                self._by_session.get(conn.meta.session_id, set()).discard(connection_id)
-            if conn.meta.call_id:
-                self._by_call.get(conn.meta.call_id, set()).discard(connection_id)
-            for topic in conn.meta.topics:
-                self._by_topic.get(topic, set()).discard(connection_id)
+            self._remove_from_indexes(connection_id, conn)
 
         await conn.close()
         logger.info(f"WebSocket unregistered: {connection_id}")
 
+    def _remove_from_indexes(self, connection_id: str, conn: "_Connection") -> None:
+        """Drop a connection from the routing indexes and its expiry (assumes lock is held)."""
+        self._expiry.cancel(self._connection_key(connection_id))
+        for index, key in (
+            (self._by_session, conn.meta.session_id),
+            (self._by_call, conn.meta.call_id),
+        ):
+            if key:
+                _discard_from_index(index, key, connection_id)
+        for topic in conn.meta.topics:
+            _discard_from_index(self._by_topic, topic, connection_id)
+
+    def _connection_key(self, connection_id: str) -> tuple[str, str, str]:
+        return (self._expiry_ns, "conn", connection_id)
+
+    def _call_context_key(self, call_id: str) -> tuple[str, str, str]:
+        return (self._expiry_ns, "call", call_id)
+
+    def _on_liveness_check(self, key: tuple[str, str, str]) -> Awaitable[None] | None:
+        """Expiry callback: unregister a disconnected socket, otherwise check again later."""
+        connection_id = key[2]
+        conn = self._conns.get(connection_id)
+        if conn is None:
+            return None
+        if (
+            conn.ws.client_state != WebSocketState.CONNECTED
+            or conn.ws.application_state != WebSocketState.CONNECTED
+        ):
+            logger.info(
+                "Unregistering disconnected WebSocket found by liveness check",
+                extra={"conn_id": connection_id},
+            )
+            return self.unregister(connection_id)
+        self._expiry.schedule(key, self.liveness_check_s, self._on_liveness_check)
+        return None
+
+    def _on_call_context_expired(self, key: tuple[str, str, str]) -> None:
+        call_id = key[2]
+        if self._call_context.pop(call_id, None) is not None:
+            logger.info("Expired unclaimed call context", extra={"call_id": call_id})
+
     async def unregister_by_websocket(self, websocket: WebSocket) -> None:
         """Unregister connection by WebSocket instance."""
         target_id = None
@@ -515,8 +770,22 @@ class ThreadSafeConnectionManager:
                 "by_session": {k: len(v) for k, v in self._by_session.items()},
                 "by_call": {k: len(v) for k, v in self._by_call.items()},
                 "by_topic": {k: len(v) for k, v in self._by_topic.items()},
+                "lanes": self._lane_totals(),
             }
 
+    def _lane_totals(self) -> dict[str, dict[str, int]]:
+        """Lane counters summed over connections (depth and high-water are per-connection max)."""
+        totals: dict[str, dict[str, int]] = {}
+        for conn in self._conns.values():
+            for lane, counters in conn.stats().items():
+                lane_total = totals.setdefault(lane, dict.fromkeys(counters, 0))
+                for key, value in counters.items():
+                    if key in ("depth", "high_water"):
+                        lane_total[key] = max(lane_total[key], value)
+                    else:
+                        lane_total[key] += value
+        return totals
+
     async def send_to_connection(self, connection_id: str, payload: dict[str, Any]) -> bool:
         """
         Send message to specific connection.
@@ -531,6 +800,12 @@ class ThreadSafeConnectionManager:
             return True
         return False
 
+    async def flush_audio(self, connection_id: str) -> int:
+        """Discard audio still queued for a connection (cancelled playback); returns the count."""
+        async with self._lock:
+            conn = self._conns.get(connection_id)
+        return conn.flush_lane("audio") if conn else 0
+
     async def broadcast_session(self, session_id: str, payload: dict[str, Any]) -> int:
         """
         Broadcast to all connections in a session with session-safe data filtering.
@@ -542,23 +817,38 @@ class ThreadSafeConnectionManager:
             conn_ids = list(self._by_session.get(session_id, set()))
             targets = [self._conns[i] for i in conn_ids if i in self._conns]
 
-        # Add session context to payload for frontend filtering
-        session_payload = {
-            **payload,
-            "session_context": {
-                "session_id": session_id,
-                "restricted_to_session": True,
-                "timestamp": time.time(),
-            },
-        }
+        if not targets:
+            return 0
+
+        # Encode once and add session context for frontend filtering as an overlay,
+        # so every connection in the session is queued the same immutable frame
+        try:
+            frame = overlay_frame(
+                encode_frame(payload),
+                {
+                    "session_context": {
+                        "session_id": session_id,
+                        "restricted_to_session": True,
+                        "timestamp": time.time(),
+                    }
+                },
+            )
+        except (TypeError, ValueError) as exc:
+            logger.error(
+                "Failed to serialize session broadcast: %s",
+                exc,
+                extra={"session_id": session_id},
+            )
+            return 0
 
         sent = 0
         failed_connections = []
 
         # Use asyncio.gather with return_exceptions for better error handling
+        lane, stop_audio = classify_lane(payload), stops_audio(payload)
         tasks = []
         for conn in targets:
-            tasks.append(self._safe_send_to_connection(conn, session_payload))
+            tasks.append(self._safe_send_to_connection(conn, frame, lane, stop_audio))
 
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
@@ -593,7 +883,7 @@ class ThreadSafeConnectionManager:
             return False
 
         try:
-            serialized = json.dumps(
+            serialized = json_codec.dumpb(
                 {
                     "session_id": session_id,
                     "envelope": payload,
@@ -629,10 +919,12 @@ class ThreadSafeConnectionManager:
             )
             return False
 
-    async def _safe_send_to_connection(self, conn: "_Connection", payload: dict[str, Any]) -> None:
+    async def _safe_send_to_connection(
+        self, conn: "_Connection", frame: str, lane: Lane = "control", stop_audio: bool = False
+    ) -> None:
         """Safely send to a connection with proper error handling."""
         try:
-            await conn.send_json(payload)
+            await conn.send_text(frame, lane, stop_audio=stop_audio)
         except Exception as e:
             # Re-raise for gather() to handle
             raise e
@@ -750,7 +1042,7 @@ class ThreadSafeConnectionManager:
                     continue
 
                 try:
-                    payload = json.loads(raw_data)
+                    payload = json_codec.loads(raw_data)
                 except (TypeError, ValueError):
                     logger.warning(
                         "Distributed session payload decode failed",
@@ -789,8 +1081,19 @@ class ThreadSafeConnectionManager:
         if not targets:
             return
 
+        try:
+            frame = encode_frame(payload)
+        except (TypeError, ValueError) as exc:
+            logger.error(
+                "Distributed local delivery encode failed: %s",
+                exc,
+                extra={"session_id": session_id},
+            )
+            return
+
+        lane, stop_audio = classify_lane(payload), stops_audio(payload)
         results = await asyncio.gather(
-            *(conn.send_json(payload) for conn in targets),
+            *(conn.send_text(frame, lane, stop_audio=stop_audio) for conn in targets),
             return_exceptions=True,
         )
 
@@ -811,14 +1114,7 @@ class ThreadSafeConnectionManager:
             conn_ids = list(self._by_call.get(call_id, set()))
             targets = [self._conns[i] for i in conn_ids if i in self._conns]
 
-        sent = 0
-        for conn in targets:
-            try:
-                await conn.send_json(payload)
-                sent += 1
-            except Exception as e:
-                logger.error(f"Broadcast failed: {e}", extra={"conn_id": conn.meta.connection_id})
-        return sent
+        return await self._fan_out(targets, payload)
 
     async def broadcast_topic(self, topic: str, payload: dict[str, Any]) -> int:
         """Broadcast to all connections subscribed to a topic."""
@@ -826,24 +1122,30 @@ class ThreadSafeConnectionManager:
             conn_ids = list(self._by_topic.get(topic, set()))
             targets = [self._conns[i] for i in conn_ids if i in self._conns]
 
-        sent = 0
-        for conn in targets:
-            try:
-                await conn.send_json(payload)
-                sent += 1
-            except Exception as e:
-                logger.error(f"Broadcast failed: {e}", extra={"conn_id": conn.meta.connection_id})
-        return sent
+        return await self._fan_out(targets, payload)
 
     async def broadcast_all(self, payload: dict[str, Any]) -> int:
         """Broadcast to all connections."""
         async with self._lock:
             targets = list(self._conns.values())
 
+        return await self._fan_out(targets, payload)
+
+    async def _fan_out(self, targets: list["_Connection"], payload: dict[str, Any]) -> int:
+        """Encode ``payload`` once and queue the frame on every target."""
+        if not targets:
+            return 0
+        try:
+            frame = encode_frame(payload)
+        except (TypeError, ValueError) as e:
+            logger.error(f"Broadcast encode failed: {e}")
+            return 0
+
+        lane, stop_audio = classify_lane(payload), stops_audio(payload)
         sent = 0
         for conn in targets:
             try:
-                await conn.send_json(payload)
+                await conn.send_text(frame, lane, stop_audio=stop_audio)
                 sent += 1
             except Exception as e:
                 logger.error(f"Broadcast failed: {e}", extra={"conn_id": conn.meta.connection_id})
@@ -857,18 +1159,31 @@ class ThreadSafeConnectionManager:
 
     # ---------------------- Call Context (Out-of-band) ---------------------- #
     async def set_call_context(self, call_id: str, context: dict[str, Any]) -> None:
-        """Associate arbitrary context with a call_id (thread-safe)."""
+        """
+        Associate arbitrary context with a call_id (thread-safe).
+
+        The context expires after ``call_context_ttl_s`` without a lookup.
+        """
         async with self._lock:
             self._call_context[call_id] = context
+            self._expiry.schedule(
+                self._call_context_key(call_id),
+                self.call_context_ttl_s,
+                self._on_call_context_expired,
+            )
 
     async def get_call_context(self, call_id: str) -> dict[str, Any] | None:
         """Get (without removing) context for a call_id (thread-safe)."""
         async with self._lock:
-            return self._call_context.get(call_id)
+            context = self._call_context.get(call_id)
+            if context is not None:
+                self._expiry.touch(self._call_context_key(call_id))
+            return context
 
     async def pop_call_context(self, call_id: str) -> dict[str, Any] | None:
         """Atomically retrieve and remove context for a call_id (thread-safe)."""
         async with self._lock:
+            self._expiry.cancel(self._call_context_key(call_id))
             return self._call_context.pop(call_id, None)
 
     async def get_connection_by_call_id(self, call_id: str) -> str | None:
@@ -974,13 +1289,7 @@ class ThreadSafeConnectionManager:
             except Exception as e:
                 logger.error(f"Error stopping handler: {e}", extra={"conn_id": connection_id})
 
-        # Remove from indexes
-        if conn.meta.session_id:
-            self._by_session.get(conn.meta.session_id, set()).discard(connection_id)
-        if conn.meta.call_id:
-            self._by_call.get(conn.meta.call_id, set()).discard(connection_id)
-        for topic in conn.meta.topics:
-            self._by_topic.get(topic, set()).discard(connection_id)
+        self._remove_from_indexes(connection_id, conn)
 
         await conn.close()
 
@@ -1061,10 +1370,12 @@ class ThreadSafeConnectionManager:
         sent = 0
         failed = 0
         results = []
+        frame = encode_frame(payload)
+        lane, stop_audio = classify_lane(payload), stops_audio(payload)
 
         for conn in targets:
             try:
-                await conn.send_json(payload)
+                await conn.send_text(frame, lane, stop_audio=stop_audio)
                 sent += 1
                 if include_metadata:
                     results.append(
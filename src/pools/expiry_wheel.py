@@ -0,0 +1,328 @@
+"""
+Expiry Wheel
+============
+
+Hierarchical timer wheel that expires registry entries without scanning them.
+
+Registries enroll an entry with a TTL and an eviction callback, touch it on
+activity and cancel it when they remove the entry themselves. Each tick the
+wheel only visits the slot that is due, so the cost of expiry is proportional
+to the entries that actually expire (plus an occasional cascade of one
+higher-level slot), not to the size of the registry.
+
+Layout:
+- ``levels`` wheels of ``2**slot_bits`` slots. Level 0 slots are one tick
+  wide; each level up is ``2**slot_bits`` times coarser. With the defaults
+  (1 s ticks, 64 slots, 4 levels) deadlines up to ~194 days are placed
+  exactly; longer ones park in the top level and are re-placed on cascade.
+- ``touch()`` only moves the entry's deadline. An entry found in a due slot
+  with a later deadline is re-placed, so touching is O(1) and an entry is
+  re-placed at most once per level it falls through.
+- Entries never expire early; they expire at most one tick late.
+
+A process-wide wheel (``get_expiry_wheel()``) drives itself from a task on
+the running event loop. The task sleeps on an event while the wheel is empty
+and wakes once per tick otherwise.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import math
+import time
+from collections.abc import Callable, Hashable
+from typing import Any
+
+from utils.ml_logging import get_logger
+
+logger = get_logger(__name__)
+
+ExpiryCallback = Callable[[Hashable], Any]
+
+
+class _Timer:
+    """One enrolled entry."""
+
+    __slots__ = ("key", "ttl_s", "deadline", "on_expire", "bucket")
+
+    def __init__(self, key: Hashable, ttl_s: float, on_expire: ExpiryCallback | None) -> None:
+        self.key = key
+        self.ttl_s = ttl_s
+        self.deadline = 0  # tick at or after which the entry expires
+        self.on_expire = on_expire
+        self.bucket: dict[Hashable, _Timer] | None = None
+
+
+class ExpiryWheel:
+    """
+    Hierarchical timer wheel for TTL expiry of in-process registry entries.
+
+    Args:
+        tick_s: Resolution; entries expire at most this late.
+        slot_bits: log2 of the slots per level.
+        levels: Number of wheels.
+        clock: Monotonic clock (injectable for tests).
+        autostart: Start the driver task on the running loop when an entry is
+            enrolled. Disable to drive the wheel with ``advance()`` only.
+    """
+
+    def __init__(
+        self,
+        tick_s: float = 1.0,
+        *,
+        slot_bits: int = 6,
+        levels: int = 4,
+        clock: Callable[[], float] = time.monotonic,
+        autostart: bool = True,
+    ) -> None:
+        if tick_s <= 0:
+            raise ValueError("tick_s must be positive")
+        self.tick_s = tick_s
+        self._bits = slot_bits
+        self._mask = (1 << slot_bits) - 1
+        self._levels = levels
+        self._span = 1 << (slot_bits * levels)  # ticks covered by the top level
+        self._wheels: list[list[dict[Hashable, _Timer]]] = [
+            [{} for _ in range(1 << slot_bits)] for _ in range(levels)
+        ]
+        # (slots, shift, ticks covered) per level, for placement
+        self._levels_by_range = tuple(
+            (self._wheels[level], slot_bits * level, 1 << (slot_bits * (level + 1)))
+            for level in range(levels)
+        )
+        self._timers: dict[Hashable, _Timer] = {}
+        self._clock = clock
+        self._origin = clock()
+        self._tick = 0  # last processed tick
+        self._autostart = autostart
+        self._task: asyncio.Task | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._pending: set[asyncio.Task] = set()
+        self.expired_total = 0
+        self.replaced_total = 0
+
+    # ------------------------------------------------------------------
+    # Enrollment
+    # ------------------------------------------------------------------
+
+    def schedule(
+        self, key: Hashable, ttl_s: float, on_expire: ExpiryCallback | None = None
+    ) -> None:
+        """
+        Enroll ``key`` to expire ``ttl_s`` from now, replacing any earlier enrollment.
+
+        ``on_expire(key)`` runs when the entry expires; a returned awaitable is
+        scheduled as a task on the running loop.
+        """
+        timer = self._timers.get(key)
+        if timer is None:
+            timer = self._timers[key] = _Timer(key, ttl_s, on_expire)
+        else:
+            timer.ttl_s = ttl_s
+            timer.on_expire = on_expire
+            self._unlink(timer)
+        timer.deadline = self._deadline(ttl_s)
+        self._place(timer)
+        self._ensure_driver()
+
+    def touch(self, key: Hashable, ttl_s: float | None = None) -> bool:
+        """Push ``key``'s expiry back to ``ttl_s`` (default: its TTL) from now."""
+        timer = self._timers.get(key)
+        if timer is None:
+            return False
+        if ttl_s is not None:
+            timer.ttl_s = ttl_s
+        deadline = self._deadline(timer.ttl_s)
+        if deadline < timer.deadline:
+            # Sooner than the current slot: re-place now
+            self._unlink(timer)
+            timer.deadline = deadline
+            self._place(timer)
+        else:
+            # Later: the slot that comes due re-places it
+            timer.deadline = deadline
+        return True
+
+    def cancel(self, key: Hashable) -> bool:
+        """Withdraw ``key`` without running its callback."""
+        timer = self._timers.pop(key, None)
+        if timer is None:
+            return False
+        self._unlink(timer)
+        return True
+
+    def remaining(self, key: Hashable) -> float | None:
+        """Seconds until ``key`` expires (``None`` when not enrolled)."""
+        timer = self._timers.get(key)
+        if timer is None:
+            return None
+        return max(0.0, timer.deadline * self.tick_s - (self._clock() - self._origin))
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._timers
+
+    def __len__(self) -> int:
+        return len(self._timers)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "entries": len(self._timers),
+            "tick_s": self.tick_s,
+            "expired_total": self.expired_total,
+            "replaced_total": self.replaced_total,
+            "driver_running": self._task is not None and not self._task.done(),
+        }
+
+    # ------------------------------------------------------------------
+    # Expiry
+    # ------------------------------------------------------------------
+
+    def advance(self, now: float | None = None) -> list[Hashable]:
+        """
+        Process every tick up to ``now`` (default: the clock) and return the expired keys.
+
+        Callbacks run before this returns, in expiry order.
+        """
+        target = int(((self._clock() if now is None else now) - self._origin) / self.tick_s)
+        expired: list[_Timer] = []
+        while self._tick < target:
+            if not self._timers:
+                self._tick = target
+                break
+            self._step(expired)
+        for timer in expired:
+            self._expire(timer)
+        return [timer.key for timer in expired]
+
+    def _step(self, expired: list[_Timer]) -> None:
+        self._tick += 1
+        tick = self._tick
+        # Lower level wrapped: pour the due slot of the next level down
+        for level in range(1, self._levels):
+            if tick & ((1 << (self._bits * level)) - 1):
+                break
+            self._cascade(level, (tick >> (self._bits * level)) & self._mask)
+
+        index = tick & self._mask
+        bucket = self._wheels[0][index]
+        if not bucket:
+            return
+        self._wheels[0][index] = {}
+        for timer in bucket.values():
+            timer.bucket = None
+            if timer.deadline > tick:
+                self.replaced_total += 1
+                self._place(timer)
+            else:
+                del self._timers[timer.key]
+                expired.append(timer)
+
+    def _cascade(self, level: int, index: int) -> None:
+        bucket = self._wheels[level][index]
+        if not bucket:
+            return
+        self._wheels[level][index] = {}
+        self.replaced_total += len(bucket)
+        # Most entries land in level 0; place those inline
+        tick, mask, wheel = self._tick, self._mask, self._wheels[0]
+        for key, timer in bucket.items():
+            deadline = timer.deadline
+            if deadline - tick <= mask:
+                target = wheel[deadline & mask]
+                target[key] = timer
+                timer.bucket = target
+            else:
+                self._place(timer)
+
+    def _expire(self, timer: _Timer) -> None:
+        self.expired_total += 1
+        if timer.on_expire is None:
+            return
+        try:
+            result = timer.on_expire(timer.key)
+            if inspect.isawaitable(result):
+                task = asyncio.ensure_future(result)
+                self._pending.add(task)
+                task.add_done_callback(self._pending.discard)
+        except Exception as e:
+            logger.error(f"Expiry callback failed for {timer.key!r}: {e}")
+
+    # ------------------------------------------------------------------
+    # Placement
+    # ------------------------------------------------------------------
+
+    def _deadline(self, ttl_s: float) -> int:
+        deadline = math.ceil((self._clock() - self._origin + ttl_s) / self.tick_s)
+        return max(deadline, self._tick + 1)
+
+    def _place(self, timer: _Timer) -> None:
+        deadline = timer.deadline
+        delta = deadline - self._tick
+        if delta >= self._span:
+            # Beyond the top level: park at its far edge and re-place on cascade
+            deadline = self._tick + self._span - 1
+            delta = self._span - 1
+        for slots, shift, covered in self._levels_by_range:
+            if delta < covered:
+                bucket = slots[(deadline >> shift) & self._mask]
+                bucket[timer.key] = timer
+                timer.bucket = bucket
+                return
+
+    @staticmethod
+    def _unlink(timer: _Timer) -> None:
+        if timer.bucket is not None:
+            timer.bucket.pop(timer.key, None)
+            timer.bucket = None
+
+    # ------------------------------------------------------------------
+    # Driver
+    # ------------------------------------------------------------------
+
+    def _ensure_driver(self) -> None:
+        if not self._autostart:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # Enrolled outside a loop; the next enrollment in one starts it
+        if self._task is not None and not self._task.done() and self._task.get_loop() is loop:
+            self._wakeup.set()
+            return
+        self._wakeup = asyncio.Event()
+        self._task = loop.create_task(self._run(self._wakeup))
+
+    async def _run(self, wakeup: asyncio.Event) -> None:
+        try:
+            while True:
+                if not self._timers:
+                    wakeup.clear()
+                    await wakeup.wait()
+                    continue
+                elapsed = self._clock() - self._origin
+                await asyncio.sleep(max(0.0, (self._tick + 1) * self.tick_s - elapsed))
+                self.advance()
+        except asyncio.CancelledError:
+            pass
+
+    async def stop(self) -> None:
+        """Stop the driver task (entries stay enrolled)."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+
+_expiry_wheel = ExpiryWheel()
+
+
+def get_expiry_wheel() -> ExpiryWheel:
+    """Process-wide expiry wheel shared by the in-process registries."""
+    return _expiry_wheel
+
+
+__all__ = ["ExpiryWheel", "get_expiry_wheel"]
@@ -0,0 +1,392 @@
+"""
+Session Affinity Registry
+=========================
+
+Pins each call connection (or session) to the worker that holds its live
+state, so its events are processed there.
+
+The worker serving a call's media WebSocket claims the call with a Redis
+ownership lease (see src/redis/leases.py) and attaches the session's live
+MemoManager to it. ACS callbacks for an owned call are served from that
+in-memory memo, without reloading it from Redis. A worker that receives a
+callback for a call owned elsewhere forwards the payload to the owner over
+the owner's Redis pub/sub channel (``{channel_prefix}:{node_id}``), so the
+owner applies every callback to the state it holds, in order. Callbacks for
+calls nobody owns (before the media WebSocket connects, or after it closes)
+are processed where they arrive; webhooks never claim.
+
+Failover:
+- The owner renews all of its leases in one pipelined pass every
+  ``renew_interval_s``. A crashed worker stops renewing and its leases
+  lapse after ``lease_ttl_s``; until a media WebSocket claims the call
+  again, callbacks are processed where they arrive.
+- A media WebSocket that reconnects on another worker takes the lease over;
+  the previous owner drops the key at its next renewal.
+- A forward that reaches no subscriber means the owner's listener is gone;
+  the sender handles the work itself until the lease lapses.
+- Keys without attached state idle for ``idle_timeout_s`` are released
+  rather than renewed forever; keys with state are held until released.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Any
+
+from utils import json_codec
+from utils.ml_logging import get_logger
+
+if TYPE_CHECKING:
+    from src.redis.manager import AzureRedisManager
+
+logger = get_logger(__name__)
+
+ForwardHandler = Callable[[str, Any], Awaitable[None]]
+
+
+class _Owned:
+    """A key this worker holds the lease for."""
+
+    __slots__ = ("state", "touched_at")
+
+    def __init__(self, state: Any = None) -> None:
+        self.state = state
+        self.touched_at = time.monotonic()
+
+
+class SessionAffinityRegistry:
+    """
+    Redis-leased ownership of sessions / call connections across workers.
+
+    Args:
+        redis_manager: Shared Redis manager (leases and the forward channel).
+        node_id: Identifier of this worker; generated when omitted.
+        lease_ttl_s: Lease lifetime; a dead owner is replaced after this long.
+        renew_interval_s: Renewal period (default: a third of the TTL).
+        owner_cache_s: How long a remote owner lookup is reused.
+        idle_timeout_s: Owned keys without state untouched this long are released.
+        channel_prefix: Prefix of the per-worker forward channels.
+        poll_interval_s: Listener poll timeout (bounds shutdown latency).
+    """
+
+    def __init__(
+        self,
+        redis_manager: AzureRedisManager,
+        *,
+        node_id: str | None = None,
+        lease_ttl_s: float = 30.0,
+        renew_interval_s: float | None = None,
+        owner_cache_s: float = 2.0,
+        idle_timeout_s: float = 1800.0,
+        channel_prefix: str = "affinity:node",
+        poll_interval_s: float = 1.0,
+    ) -> None:
+        self._redis = redis_manager
+        self.node_id = node_id or str(uuid.uuid4())
+        self._ttl_ms = max(1, int(lease_ttl_s * 1000))
+        self._renew_interval = renew_interval_s or lease_ttl_s / 3
+        self._owner_cache_s = owner_cache_s
+        self._idle_timeout = idle_timeout_s
+        self._channel_prefix = channel_prefix.rstrip(":")
+        self._poll_interval = poll_interval_s
+
+        self._owned: dict[str, _Owned] = {}
+        self._remote: dict[str, tuple[str, float]] = {}
+        self._handlers: dict[str, ForwardHandler] = {}
+
+        self._stop: asyncio.Event | None = None
+        self._listener_task: asyncio.Task | None = None
+        self._renew_task: asyncio.Task | None = None
+        self._pubsub = None
+
+        self._stats = {
+            "claimed": 0,
+            "forwarded": 0,
+            "received": 0,
+            "failovers": 0,
+            "lost": 0,
+            "released": 0,
+        }
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    @property
+    def running(self) -> bool:
+        return self._listener_task is not None
+
+    def channel_for(self, node_id: str) -> str:
+        """Forward channel of a worker."""
+        return f"{self._channel_prefix}:{node_id}"
+
+    async def start(self) -> None:
+        """Subscribe to this worker's forward channel and start renewing leases."""
+        if self._listener_task:
+            return
+        channel = self.channel_for(self.node_id)
+        loop = asyncio.get_running_loop()
+        try:
+            pubsub = self._redis.redis_client.pubsub(ignore_subscribe_messages=True)
+            await loop.run_in_executor(None, pubsub.subscribe, channel)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Session affinity unavailable (non-critical): %s", exc)
+            return
+        self._pubsub = pubsub
+        self._stop = asyncio.Event()
+        self._listener_task = asyncio.create_task(self._listener_loop(pubsub))
+        self._renew_task = asyncio.create_task(self._renew_loop())
+        logger.info(
+            "Session affinity started",
+            extra={"node_id": self.node_id, "channel": channel, "lease_ttl_ms": self._ttl_ms},
+        )
+
+    async def stop(self) -> None:
+        """Stop listening and release every lease this worker holds."""
+        if self._stop:
+            self._stop.set()
+        if self._renew_task:
+            self._renew_task.cancel()
+        # The listener exits within one poll interval once the stop event is set
+        for task in (self._renew_task, self._listener_task):
+            if task:
+                try:
+                    await task
+                except (asyncio.CancelledError, Exception):  # noqa: BLE001
+                    pass
+        self._renew_task = None
+        self._listener_task = None
+        if self._pubsub:
+            try:
+                self._pubsub.close()
+            except Exception as exc:  # pragma: no cover - defensive
+                logger.debug("Error closing affinity pubsub: %s", exc)
+            self._pubsub = None
+
+        keys = list(self._owned)
+        self._owned.clear()
+        self._remote.clear()
+        if keys:
+            try:
+                released = await self._redis.release_leases_async(keys, self.node_id)
+                self._stats["released"] += released
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("Failed to release affinity leases on shutdown: %s", exc)
+
+    # ------------------------------------------------------------------
+    # Ownership
+    # ------------------------------------------------------------------
+
+    def owns(self, key: str | None) -> bool:
+        """Whether this worker holds the lease for ``key`` (no Redis call)."""
+        return bool(key) and key in self._owned
+
+    def local_state(self, key: str) -> Any:
+        """State attached to an owned key (None when not owned)."""
+        owned = self._owned.get(key)
+        if owned is None:
+            return None
+        owned.touched_at = time.monotonic()
+        return owned.state
+
+    def set_local_state(self, key: str, state: Any) -> bool:
+        """Attach state to an owned key; ignored when the key is not owned here."""
+        owned = self._owned.get(key)
+        if owned is None:
+            return False
+        owned.state = state
+        owned.touched_at = time.monotonic()
+        return True
+
+    async def claim(self, key: str, state: Any = None, *, take_over: bool = False) -> bool:
+        """
+        Claim ``key`` for this worker, attaching ``state`` to it.
+
+        Args:
+            key: Call connection or session id.
+            state: Live state served to work routed here (e.g. the MemoManager).
+            take_over: Take the lease from its current owner, if any.
+
+        Returns:
+            True when this worker owns the key afterwards.
+        """
+        owned = self._owned.get(key)
+        if owned is not None:
+            owned.touched_at = time.monotonic()
+            if state is not None:
+                owned.state = state
+            return True
+        owner = await self._redis.claim_lease_async(
+            key, self.node_id, self._ttl_ms, take_over=take_over
+        )
+        if owner == self.node_id:
+            self._owned[key] = _Owned(state)
+            self._remote.pop(key, None)
+            self._stats["claimed"] += 1
+            return True
+        if owner:
+            self._remote[key] = (owner, time.monotonic())
+        return False
+
+    async def release(self, key: str, state: Any = None) -> bool:
+        """
+        Give up ownership of ``key`` (no-op when not owned here).
+
+        With ``state``, only release while that state is still attached, so a
+        closing WebSocket does not release a call its replacement re-claimed.
+        """
+        owned = self._owned.get(key)
+        if owned is None or (state is not None and owned.state is not state):
+            return False
+        del self._owned[key]
+        try:
+            released = await self._redis.release_leases_async([key], self.node_id)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Failed to release affinity lease for %s: %s", key, exc)
+            return False
+        self._stats["released"] += released
+        return bool(released)
+
+    async def route(self, key: str) -> str | None:
+        """
+        Decide where work for ``key`` runs.
+
+        Owned keys are resolved from memory. Otherwise the lease owner is
+        looked up (cached for ``owner_cache_s``); routing never claims.
+
+        Returns:
+            The remote owner's node id, or None to handle the work here.
+        """
+        if key in self._owned:
+            self._owned[key].touched_at = time.monotonic()
+            return None
+        cached = self._remote.get(key)
+        if cached and time.monotonic() - cached[1] < self._owner_cache_s:
+            return cached[0]
+        try:
+            owner = await self._redis.get_lease_owner_async(key)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Affinity lookup failed for %s, handling locally: %s", key, exc)
+            return None
+        if owner and owner != self.node_id:
+            self._remote[key] = (owner, time.monotonic())
+            return owner
+        return None
+
+    # ------------------------------------------------------------------
+    # Forwarding
+    # ------------------------------------------------------------------
+
+    def register_handler(self, kind: str, handler: ForwardHandler) -> None:
+        """Handle forwarded ``kind`` messages with ``handler(key, payload)``."""
+        self._handlers[kind] = handler
+
+    async def forward(self, owner: str, key: str, kind: str, payload: Any) -> bool:
+        """
+        Send work for ``key`` to its owner.
+
+        Returns:
+            False when no worker is listening on the owner's channel; the
+            caller should then handle the work itself.
+        """
+        message = json_codec.dumpb(
+            {"kind": kind, "key": key, "payload": payload, "origin": self.node_id}
+        )
+        try:
+            receivers = await self._redis.publish_channel_async(self.channel_for(owner), message)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Affinity forward to %s failed: %s", owner, exc)
+            receivers = 0
+        if not receivers:
+            self._remote.pop(key, None)
+            self._stats["failovers"] += 1
+            logger.info(
+                "Affinity owner unreachable, handling locally",
+                extra={"key": key, "owner": owner, "node_id": self.node_id},
+            )
+            return False
+        self._stats["forwarded"] += 1
+        return True
+
+    async def _dispatch(self, raw: Any) -> None:
+        try:
+            message = json_codec.loads(raw)
+            kind, key = message["kind"], message["key"]
+        except (TypeError, ValueError, KeyError):
+            logger.warning("Affinity message decode failed", extra={"data": raw})
+            return
+        handler = self._handlers.get(kind)
+        if handler is None:
+            logger.warning("No affinity handler for %s", kind)
+            return
+        # Forwarded on a stale owner lookup (the key was released here): handled
+        # like any unowned key, from the state in Redis
+        self._stats["received"] += 1
+        try:
+            await handler(key, message.get("payload"))
+        except Exception as exc:  # noqa: BLE001
+            logger.error("Affinity handler %s failed for %s: %s", kind, key, exc)
+
+    async def _listener_loop(self, pubsub: Any) -> None:
+        loop = asyncio.get_running_loop()
+        timeout = self._poll_interval
+        while self._stop and not self._stop.is_set():
+            try:
+                message = await loop.run_in_executor(
+                    None,
+                    lambda: pubsub.get_message(ignore_subscribe_messages=True, timeout=timeout),
+                )
+            except Exception as exc:  # noqa: BLE001
+                if "closed file" in str(exc).lower():
+                    break
+                logger.error("Affinity listener error: %s", exc)
+                await asyncio.sleep(timeout)
+                continue
+            if message and message.get("type") == "message" and message.get("data"):
+                # Handled in order: callbacks for one call must not overtake each other
+                await self._dispatch(message["data"])
+
+    # ------------------------------------------------------------------
+    # Renewal
+    # ------------------------------------------------------------------
+
+    async def renew(self) -> list[str]:
+        """Renew every owned lease in one pass; returns the keys that were lost."""
+        now = time.monotonic()
+        idle = [
+            key
+            for key, owned in self._owned.items()
+            if owned.state is None and now - owned.touched_at > self._idle_timeout
+        ]
+        for key in idle:
+            await self.release(key)
+        keys = list(self._owned)
+        if not keys:
+            return []
+        lost = await self._redis.renew_leases_async(keys, self.node_id, self._ttl_ms)
+        for key in lost:
+            self._owned.pop(key, None)
+        if lost:
+            self._stats["lost"] += len(lost)
+            logger.warning("Affinity leases lost: %d", len(lost), extra={"node_id": self.node_id})
+        return lost
+
+    async def _renew_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._renew_interval)
+            try:
+                await self.renew()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("Affinity lease renewal failed: %s", exc)
+
+    def stats(self) -> dict[str, Any]:
+        """Counters plus the number of owned keys."""
+        return {**self._stats, "owned": len(self._owned), "node_id": self.node_id}
+
+
+__all__ = ["SessionAffinityRegistry"]
@@ -3,6 +3,8 @@ Thread-safe session management for concurrent conversation sessions.
 
 Replaces the global _active_conversation_sessions dict with a thread-safe manager
 to prevent race conditions during concurrent session add/remove operations.
+Sessions left behind by a missed remove_session expire through the shared
+expiry wheel after ``idle_ttl_s`` without activity.
 """
 
 import asyncio
@@ -13,6 +15,8 @@ from typing import Any
 from fastapi import WebSocket
 from utils.ml_logging import get_logger
 
+from src.pools.expiry_wheel import ExpiryWheel, get_expiry_wheel
+
 logger = get_logger(__name__)
 
 
@@ -85,11 +89,46 @@ class ThreadSafeSessionManager:
 
     Uses asyncio.Lock to protect concurrent access to session tracking,
     preventing race conditions during concurrent session management.
+
+    Args:
+        idle_ttl_s: Sessions without activity (add, context lookup or metadata
+            write) for this long are evicted.
+        expiry: Expiry wheel to enroll sessions in (default: the shared wheel).
     """
 
-    def __init__(self):
+    def __init__(self, idle_ttl_s: float = 24 * 3600, expiry: ExpiryWheel | None = None):
         self._sessions: dict[str, SessionContext] = {}
         self._lock = asyncio.Lock()
+        self.idle_ttl_s = idle_ttl_s
+        self._expiry = expiry if expiry is not None else get_expiry_wheel()
+        self._expiry_ns = f"session:{id(self):x}"
+
+    def _expiry_key(self, session_id: str) -> tuple[str, str]:
+        return (self._expiry_ns, session_id)
+
+    def touch_session(self, session_id: str) -> bool:
+        """Record activity on a session, pushing back its idle expiry."""
+        return self._expiry.touch(self._expiry_key(session_id))
+
+    def _on_session_expired(self, key: tuple[str, str]) -> None:
+        session_id = key[1]
+        context = self._sessions.pop(session_id, None)
+        if context is None:
+            return
+        self._detach_context(context)
+        logger.info(
+            "Expired idle conversation session %s. Remaining sessions: %s",
+            session_id,
+            len(self._sessions),
+        )
+
+    @staticmethod
+    def _detach_context(context: SessionContext) -> None:
+        try:
+            if getattr(context.websocket.state, "session_context", None) is context:
+                delattr(context.websocket.state, "session_context")
+        except Exception:
+            pass
 
     async def add_session(
         self,
@@ -119,6 +158,9 @@ class ThreadSafeSessionManager:
 
         async with self._lock:
             self._sessions[session_id] = context
+            self._expiry.schedule(
+                self._expiry_key(session_id), self.idle_ttl_s, self._on_session_expired
+            )
             logger.info(
                 "Added conversation session %s. Total sessions: %s",
                 session_id,
@@ -129,12 +171,9 @@ class ThreadSafeSessionManager:
         """Remove a conversation session thread-safely. Returns True if removed."""
         async with self._lock:
             context = self._sessions.pop(session_id, None)
+            self._expiry.cancel(self._expiry_key(session_id))
             if context:
-                try:
-                    if getattr(context.websocket.state, "session_context", None) is context:
-                        delattr(context.websocket.state, "session_context")
-                except Exception:
-                    pass
+                self._detach_context(context)
                 logger.info(
                     "Removed conversation session %s. Remaining sessions: %s",
                     session_id,
@@ -156,9 +195,12 @@ class ThreadSafeSessionManager:
         }
 
     async def get_session_context(self, session_id: str) -> SessionContext | None:
-        """Return the SessionContext for an active session."""
+        """Return the SessionContext for an active session (counts as activity)."""
         async with self._lock:
-            return self._sessions.get(session_id)
+            context = self._sessions.get(session_id)
+            if context is not None:
+                self.touch_session(session_id)
+            return context
 
     async def get_session_count(self) -> int:
         """Get current session count thread-safely."""
@@ -193,6 +235,7 @@ class ThreadSafeSessionManager:
 
             for session_id in stale_sessions:
                 del self._sessions[session_id]
+                self._expiry.cancel(self._expiry_key(session_id))
                 removed_count += 1
 
             if removed_count > 0:
@@ -8,12 +8,22 @@ Allocation Tiers:
 1. DEDICATED - Per-session cached resource (0ms latency)
 2. WARM - Pre-created resource from pool (<50ms latency)
 3. COLD - On-demand factory call (~200ms latency)
+
+Autoscaling (max_warm_size > min_warm_size):
+    The warm target follows observed demand instead of staying fixed. Each
+    acquire records an arrival; the target is sized to cover the peak number
+    of arrivals seen within one creation latency (the time a refill takes),
+    jumps up immediately on COLD allocations, and steps down at most once per
+    warmup interval. Warm resources idle beyond idle_evict_sec above the
+    target are evicted.
 """
 
 from __future__ import annotations
 
 import asyncio
+import math
 import time
+from collections import deque
 from collections.abc import Awaitable, Callable
 from dataclasses import asdict, dataclass
 from typing import Any, Generic, TypeVar
@@ -42,6 +52,27 @@ class WarmablePoolMetrics:
     warmup_timeouts: int = 0
     warmup_retries: int = 0
     last_warmup_error: str | None = None
+    warm_pool_target: int = 0
+    scale_ups: int = 0
+    scale_downs: int = 0
+    idle_evictions: int = 0
+    create_latency_ms: float = 0.0
+
+
+# Autoscaling tuning
+_SCALE_HEADROOM = 1.25  # Extra warm capacity over the observed peak
+_MIN_REFILL_HORIZON_SEC = 0.05  # Floor for the refill horizon before latency is known
+_LATENCY_EWMA_ALPHA = 0.2
+_LATENCY_SAMPLES = 1024
+_MAX_ARRIVAL_SAMPLES = 4096
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, math.ceil(pct / 100.0 * len(sorted_values)) - 1)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
 
 
 class WarmableResourcePool(Generic[T]):
@@ -49,7 +80,8 @@ class WarmableResourcePool(Generic[T]):
     Resource pool with optional pre-warming and session awareness.
 
     When warm_pool_size > 0, maintains a queue of pre-warmed resources for
-    low-latency allocation. Background task replenishes the pool periodically.
+    low-latency allocation. Background task replenishes the pool periodically
+    and immediately whenever an acquire drains it below target.
 
     When warm_pool_size = 0 (default), behaves like OnDemandResourcePool.
 
@@ -68,6 +100,14 @@ class WarmableResourcePool(Generic[T]):
                  Should return True on success, False on failure.
         warmup_timeout_sec: Maximum time allowed per warmup attempt (default: 10s).
         max_warmup_retries: Number of retry attempts for failed warmups (default: 2).
+        min_warm_size: Lower bound for the autoscaled warm target
+                       (default: warm_pool_size).
+        max_warm_size: Upper bound for the autoscaled warm target. Autoscaling
+                       is enabled when this exceeds min_warm_size
+                       (default: warm_pool_size, i.e. fixed target).
+        max_concurrent_warmups: Cap on parallel factory/warmup calls during fills.
+        arrival_window_sec: Window of acquire arrivals used to size the target.
+        idle_evict_sec: Warm resources above target idle this long are evicted.
     """
 
     def __init__(
@@ -83,10 +123,22 @@ class WarmableResourcePool(Generic[T]):
         warm_fn: Callable[[T], Awaitable[bool]] | None = None,
         warmup_timeout_sec: float = 10.0,
         max_warmup_retries: int = 2,
+        min_warm_size: int | None = None,
+        max_warm_size: int | None = None,
+        max_concurrent_warmups: int = 4,
+        arrival_window_sec: float = 60.0,
+        idle_evict_sec: float = 300.0,
     ) -> None:
         self._factory = factory
         self._name = name
-        self._warm_pool_size = warm_pool_size
+        self._warm_pool_size = warm_pool_size  # Current target (moves when autoscaling)
+        self._min_warm_size = min(
+            warm_pool_size, warm_pool_size if min_warm_size is None else max(0, min_warm_size)
+        )
+        self._max_warm_size = max(warm_pool_size, max_warm_size or 0)
+        self._autoscale = self._max_warm_size > self._min_warm_size
+        self._arrival_window_sec = arrival_window_sec
+        self._idle_evict_sec = idle_evict_sec
         self._enable_background_warmup = enable_background_warmup
         self._warmup_interval_sec = warmup_interval_sec
         self._session_awareness = session_awareness
@@ -98,12 +150,25 @@ class WarmableResourcePool(Generic[T]):
         # State
         self._ready = asyncio.Event()
         self._shutdown_event = asyncio.Event()
-        self._warm_queue: asyncio.Queue[T] = asyncio.Queue(maxsize=max(1, warm_pool_size))
+        # Entries are (resource, idle_since) with idle_since from time.monotonic()
+        self._warm_queue: asyncio.Queue[tuple[T, float]] = asyncio.Queue(
+            maxsize=max(1, self._max_warm_size)
+        )
         self._session_cache: dict[str, tuple[T, float]] = {}  # session_id -> (resource, last_used)
         self._lock = asyncio.Lock()
-        self._metrics = WarmablePoolMetrics()
+        self._metrics = WarmablePoolMetrics(warm_pool_target=warm_pool_size)
         self._background_task: asyncio.Task[None] | None = None
 
+        # Fill concurrency and refill signalling
+        self._fill_semaphore = asyncio.Semaphore(max(1, max_concurrent_warmups))
+        self._fills_in_flight = 0
+        self._refill_event = asyncio.Event()
+
+        # Demand and latency tracking
+        self._arrivals: deque[float] = deque(maxlen=_MAX_ARRIVAL_SAMPLES)
+        self._acquire_latencies_ms: deque[float] = deque(maxlen=_LATENCY_SAMPLES)
+        self._cold_at_last_adjust = 0
+
     async def prepare(self) -> None:
         """
         Initialize the pool and optionally pre-warm resources.
@@ -142,7 +207,7 @@ class WarmableResourcePool(Generic[T]):
                     exc_info=True
                 )
 
-        if self._enable_background_warmup and self._warm_pool_size > 0:
+        if self._enable_background_warmup and self._max_warm_size > 0:
             self._background_task = asyncio.create_task(
                 self._background_warmup_loop(),
                 name=f"{self._name}-warmup",
@@ -203,23 +268,34 @@ class WarmableResourcePool(Generic[T]):
 
         Priority: warm pool -> cold (factory).
         """
+        resource, _ = await self._acquire_with_tier()
+        return resource
+
+    async def _acquire_with_tier(self) -> tuple[T, AllocationTier]:
+        """Acquire from the warm pool or factory, reporting which tier served it."""
+        started = time.perf_counter()
         self._metrics.allocations_total += 1
+        self._arrivals.append(time.monotonic())
 
         # Try warm pool first (non-blocking)
         try:
-            resource = self._warm_queue.get_nowait()
+            resource, _ = self._warm_queue.get_nowait()
             self._metrics.allocations_warm += 1
             self._metrics.warm_pool_size = self._warm_queue.qsize()
+            self._request_refill()
+            self._record_acquire_latency(started)
             logger.debug(f"[{self._name}] Acquired WARM resource")
-            return resource
+            return resource, AllocationTier.WARM
         except asyncio.QueueEmpty:
             pass
 
-        # Fall back to cold creation
+        # Fall back to cold creation; a COLD miss is the strongest scale-up signal
+        self._request_refill()
         resource = await self._create_warmed_resource()
         self._metrics.allocations_cold += 1
+        self._record_acquire_latency(started)
         logger.debug(f"[{self._name}] Acquired COLD resource")
-        return resource
+        return resource, AllocationTier.COLD
 
     async def release(self, resource: T | None) -> None:
         """
@@ -238,10 +314,10 @@ class WarmableResourcePool(Generic[T]):
             except Exception as e:
                 logger.warning(f"[{self._name}] Failed to clear session state on release: {e}")
 
-        # Try to return to warm pool if there's space
-        if self._warm_pool_size > 0:
+        # Try to return to warm pool if it is below target
+        if self._warm_queue.qsize() < self._warm_pool_size:
             try:
-                self._warm_queue.put_nowait(resource)
+                self._warm_queue.put_nowait((resource, time.monotonic()))
                 self._metrics.warm_pool_size = self._warm_queue.qsize()
                 return
             except asyncio.QueueFull:
@@ -258,14 +334,9 @@ class WarmableResourcePool(Generic[T]):
         Priority: session cache (DEDICATED) -> warm pool (WARM) -> factory (COLD).
         """
         if not self._session_awareness or not session_id:
-            resource = await self.acquire(timeout=timeout)
-            tier = (
-                AllocationTier.WARM
-                if self._metrics.allocations_warm > self._metrics.allocations_cold
-                else AllocationTier.COLD
-            )
-            return resource, tier
+            return await self._acquire_with_tier()
 
+        started = time.perf_counter()
         async with self._lock:
             # Check session cache first
             cached = self._session_cache.get(session_id)
@@ -276,6 +347,7 @@ class WarmableResourcePool(Generic[T]):
                     self._session_cache[session_id] = (resource, time.time())
                     self._metrics.allocations_total += 1
                     self._metrics.allocations_dedicated += 1
+                    self._record_acquire_latency(started)
                     logger.debug(
                         f"[{self._name}] Acquired DEDICATED resource for session {session_id[:8]}..."
                     )
@@ -285,20 +357,13 @@ class WarmableResourcePool(Generic[T]):
                     self._session_cache.pop(session_id, None)
 
         # Not in session cache - acquire from pool
-        resource = await self.acquire(timeout=timeout)
+        resource, tier = await self._acquire_with_tier()
 
         # Cache for session
         async with self._lock:
             self._session_cache[session_id] = (resource, time.time())
             self._metrics.active_sessions = len(self._session_cache)
 
-        # Determine tier based on where resource came from
-        # (acquire() already updated warm/cold metrics)
-        tier = (
-            AllocationTier.WARM
-            if self._warm_queue.qsize() < self._warm_pool_size
-            else AllocationTier.COLD
-        )
         return resource, tier
 
     async def release_for_session(self, session_id: str | None, resource: T | None = None) -> bool:
@@ -346,12 +411,40 @@ class WarmableResourcePool(Generic[T]):
             "ready": self._ready.is_set(),
             "warm_pool_size": self._warm_queue.qsize(),
             "warm_pool_target": self._warm_pool_size,
+            "warm_pool_min": self._min_warm_size,
+            "warm_pool_max": self._max_warm_size,
+            "autoscaling": self._autoscale,
             "session_awareness": self._session_awareness,
             "active_sessions": len(self._session_cache),
             "background_warmup": self._enable_background_warmup,
+            "arrival_rate_per_sec": round(self.arrival_rate(), 3),
+            "hit_rate": round(self.hit_rate(), 4),
+            "acquire_latency_ms": self.acquire_latency_percentiles(),
             "metrics": metrics,
         }
 
+    def hit_rate(self) -> float:
+        """Fraction of allocations served without a factory call (DEDICATED or WARM)."""
+        total = self._metrics.allocations_total
+        if not total:
+            return 0.0
+        return (self._metrics.allocations_dedicated + self._metrics.allocations_warm) / total
+
+    def arrival_rate(self) -> float:
+        """Acquire arrivals per second over the arrival window."""
+        self._prune_arrivals(time.monotonic())
+        return len(self._arrivals) / self._arrival_window_sec if self._arrival_window_sec else 0.0
+
+    def acquire_latency_percentiles(self) -> dict[str, float]:
+        """p50/p95/p99 acquire latency (ms) over recent acquisitions."""
+        values = sorted(self._acquire_latencies_ms)
+        return {
+            "p50": round(_percentile(values, 50), 3),
+            "p95": round(_percentile(values, 95), 3),
+            "p99": round(_percentile(values, 99), 3),
+            "samples": len(values),
+        }
+
     @property
     def session_awareness_enabled(self) -> bool:
         return self._session_awareness
@@ -362,7 +455,110 @@ class WarmableResourcePool(Generic[T]):
 
     # ---------- Internal Methods ----------
 
+    def _record_acquire_latency(self, started: float) -> None:
+        self._acquire_latencies_ms.append((time.perf_counter() - started) * 1000.0)
+
+    def _request_refill(self) -> None:
+        """Wake the background loop when the warm pool is below target."""
+        if self._background_task is not None and (
+            self._warm_queue.qsize() + self._fills_in_flight < self._warm_pool_size or self._autoscale
+        ):
+            self._refill_event.set()
+
+    def _prune_arrivals(self, now: float) -> None:
+        cutoff = now - self._arrival_window_sec
+        arrivals = self._arrivals
+        while arrivals and arrivals[0] < cutoff:
+            arrivals.popleft()
+
+    def _peak_arrivals(self, horizon_sec: float) -> int:
+        """Largest number of arrivals seen within any ``horizon_sec`` span of the window."""
+        arrivals = self._arrivals
+        peak = 0
+        lo = 0
+        for hi, ts in enumerate(arrivals):
+            while ts - arrivals[lo] > horizon_sec:
+                lo += 1
+            peak = max(peak, hi - lo + 1)
+        return peak
+
+    def _adjust_warm_target(self, *, allow_scale_down: bool) -> int:
+        """
+        Recompute the warm target from arrivals and COLD misses.
+
+        The target covers the peak burst that can arrive while one refill is
+        in flight (one creation latency), plus headroom. COLD misses since the
+        last adjustment raise it immediately; decreases are limited to one
+        step per call with allow_scale_down (the periodic tick).
+        """
+        self._prune_arrivals(time.monotonic())
+        horizon = max(self._metrics.create_latency_ms / 1000.0, _MIN_REFILL_HORIZON_SEC)
+        demand = math.ceil(self._peak_arrivals(horizon) * _SCALE_HEADROOM)
+
+        cold = self._metrics.allocations_cold - self._cold_at_last_adjust
+        self._cold_at_last_adjust = self._metrics.allocations_cold
+
+        current = self._warm_pool_size
+        if cold > 0:
+            desired = max(demand, current + cold)
+        elif demand < current:
+            desired = current - 1 if allow_scale_down else current
+        else:
+            desired = demand
+        desired = min(self._max_warm_size, max(self._min_warm_size, desired))
+
+        if desired != current:
+            if desired > current:
+                self._metrics.scale_ups += 1
+            else:
+                self._metrics.scale_downs += 1
+            logger.debug(f"[{self._name}] Warm target {current} -> {desired}")
+            self._warm_pool_size = desired
+            self._metrics.warm_pool_target = desired
+        return desired
+
+    def _evict_idle_excess(self) -> int:
+        """Drop warm resources above target that have been idle too long."""
+        excess = self._warm_queue.qsize() - self._warm_pool_size
+        if excess <= 0:
+            return 0
+
+        cutoff = time.monotonic() - self._idle_evict_sec
+        entries: list[tuple[T, float]] = []
+        while True:
+            try:
+                entries.append(self._warm_queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+
+        evicted = 0
+        for entry in entries:
+            # Entries are oldest-first, so the stalest excess goes first
+            if evicted < excess and entry[1] <= cutoff:
+                evicted += 1
+                continue
+            self._warm_queue.put_nowait(entry)
+
+        if evicted:
+            self._metrics.idle_evictions += evicted
+            self._metrics.warm_pool_size = self._warm_queue.qsize()
+            logger.debug(f"[{self._name}] Evicted {evicted} idle warm resources")
+        return evicted
+
     async def _create_warmed_resource(self) -> T:
+        """Create a new resource and warm it, tracking creation latency."""
+        started = time.perf_counter()
+        resource = await self._create_and_warm()
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+        previous = self._metrics.create_latency_ms
+        self._metrics.create_latency_ms = (
+            elapsed_ms
+            if not previous
+            else previous + _LATENCY_EWMA_ALPHA * (elapsed_ms - previous)
+        )
+        return resource
+
+    async def _create_and_warm(self) -> T:
         """Create a new resource and optionally warm it with timeout and retry."""
         resource = await self._factory()
 
@@ -414,49 +610,75 @@ class WarmableResourcePool(Generic[T]):
         return resource
 
     async def _fill_warm_pool(self) -> int:
-        """Fill warm pool up to target size. Returns number of resources added."""
-        added = 0
-        target = self._warm_pool_size - self._warm_queue.qsize()
+        """
+        Fill warm pool up to target size. Returns number of resources added.
+
+        Creations run concurrently, capped by max_concurrent_warmups.
+        """
+        target = self._warm_pool_size - self._warm_queue.qsize() - self._fills_in_flight
+        if target <= 0 or self._shutdown_event.is_set():
+            self._metrics.warm_pool_size = self._warm_queue.qsize()
+            return 0
+
+        self._fills_in_flight += target
+        try:
+            outcomes = await asyncio.gather(
+                *(self._fill_one(i, target) for i in range(target)), return_exceptions=True
+            )
+        finally:
+            self._fills_in_flight -= target
+        added = sum(1 for outcome in outcomes if outcome is True)
+        failed = sum(1 for outcome in outcomes if outcome is not True and outcome is not None)
 
-        for i in range(target):
+        self._metrics.warm_pool_size = self._warm_queue.qsize()
+
+        if failed:
+            logger.warning(
+                f"[{self._name}] Partial warmup: {added}/{target} resources ready. "
+                f"Pool will fall back to on-demand allocation for remaining capacity."
+            )
+
+        return added
+
+    async def _fill_one(self, index: int, target: int) -> bool | None:
+        """
+        Create one warm resource under the fill semaphore.
+
+        Returns True when added, None when no longer needed, False on failure.
+        """
+        async with self._fill_semaphore:
             if self._shutdown_event.is_set():
-                break
+                return None
             try:
                 # Add overall timeout per resource (factory + warmup)
                 resource = await asyncio.wait_for(
                     self._create_warmed_resource(),
-                    timeout=self._warmup_timeout_sec + 5.0  # Extra time for factory
+                    timeout=self._warmup_timeout_sec + 5.0,  # Extra time for factory
                 )
-                self._warm_queue.put_nowait(resource)
-                added += 1
-                logger.debug(f"[{self._name}] Warmed resource {added}/{target}")
-            except asyncio.QueueFull:
-                logger.debug(f"[{self._name}] Warm queue full, stopping fill")
-                break
             except asyncio.TimeoutError:
                 logger.error(
-                    f"[{self._name}] Resource creation timed out (resource {i+1}/{target}). "
+                    f"[{self._name}] Resource creation timed out (resource {index+1}/{target}). "
                     f"Continuing with partial pool."
                 )
-                # Continue trying to create remaining resources
-                continue
+                return False
             except Exception as e:
                 logger.error(
-                    f"[{self._name}] Failed to create warm resource {i+1}/{target}: {e}",
-                    exc_info=True
+                    f"[{self._name}] Failed to create warm resource {index+1}/{target}: {e}",
+                    exc_info=True,
                 )
-                # Continue trying to create remaining resources
-                continue
+                return False
 
-        self._metrics.warm_pool_size = self._warm_queue.qsize()
-        
-        if added < target:
-            logger.warning(
-                f"[{self._name}] Partial warmup: {added}/{target} resources ready. "
-                f"Pool will fall back to on-demand allocation for remaining capacity."
-            )
-        
-        return added
+            # Releases may have refilled the pool meanwhile
+            if self._warm_queue.qsize() >= self._warm_pool_size:
+                logger.debug(f"[{self._name}] Warm pool at target, discarding extra")
+                return None
+            try:
+                self._warm_queue.put_nowait((resource, time.monotonic()))
+            except asyncio.QueueFull:
+                logger.debug(f"[{self._name}] Warm queue full, stopping fill")
+                return None
+            logger.debug(f"[{self._name}] Warmed resource {index+1}/{target}")
+            return True
 
     async def _cleanup_stale_sessions(self) -> int:
         """Remove stale session resources. Returns number removed."""
@@ -481,25 +703,47 @@ class WarmableResourcePool(Generic[T]):
         return removed
 
     async def _background_warmup_loop(self) -> None:
-        """Background task that maintains warm pool level and cleans up stale sessions."""
+        """
+        Background task that maintains warm pool level and cleans up stale sessions.
+
+        Wakes on every warmup interval and, in between, whenever an acquire
+        drains the pool below target. Session cleanup and target decreases
+        only happen on the periodic tick.
+        """
         logger.debug(f"[{self._name}] Background warmup loop started")
+        next_tick = time.monotonic() + self._warmup_interval_sec
 
         while not self._shutdown_event.is_set():
             try:
-                await asyncio.sleep(self._warmup_interval_sec)
+                try:
+                    await asyncio.wait_for(
+                        self._refill_event.wait(),
+                        timeout=max(0.0, next_tick - time.monotonic()),
+                    )
+                except asyncio.TimeoutError:
+                    pass
+                self._refill_event.clear()
 
                 if self._shutdown_event.is_set():
                     break
 
+                periodic = time.monotonic() >= next_tick
+                if periodic:
+                    next_tick = time.monotonic() + self._warmup_interval_sec
+
+                if self._autoscale:
+                    self._adjust_warm_target(allow_scale_down=periodic)
+                self._evict_idle_excess()
+
                 # Refill warm pool
                 added = await self._fill_warm_pool()
                 if added > 0:
                     logger.debug(f"[{self._name}] Added {added} resources to warm pool")
 
-                # Cleanup stale sessions
-                await self._cleanup_stale_sessions()
-
-                self._metrics.warmup_cycles += 1
+                if periodic:
+                    # Cleanup stale sessions
+                    await self._cleanup_stale_sessions()
+                    self._metrics.warmup_cycles += 1
 
             except asyncio.CancelledError:
                 break
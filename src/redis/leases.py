@@ -0,0 +1,120 @@
+"""
+Ownership Leases
+================
+
+Expiring ``key -> owner`` records used to pin a session (or call connection)
+to the worker that holds its live state.
+
+Each lease is a plain string key ``{prefix}:{key}`` whose value is the owner
+id, written with ``SET NX PX``. Owners renew with ``PEXPIRE`` before the TTL
+runs out; a worker that dies simply stops renewing and the lease lapses, so
+the next worker to claim the key takes over.
+
+All helpers are pipelined: a claim is one round trip, and renewing every
+lease a worker holds is two round trips regardless of how many it holds.
+
+Leases are routing hints rather than locks. Renew and release compare the
+owner before acting, but not atomically; the only race is against a lease
+that is already expiring, where the worst case is extending another owner's
+lease by one TTL.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+LEASE_KEY_PREFIX = "affinity:lease"
+
+
+def lease_key(key: str, prefix: str = LEASE_KEY_PREFIX) -> str:
+    """``call-123`` -> ``affinity:lease:call-123``."""
+    return f"{prefix}:{key}"
+
+
+def _text(value: Any) -> str | None:
+    if value is None:
+        return None
+    return value.decode("utf-8") if isinstance(value, bytes) else str(value)
+
+
+def claim(
+    client: Any,
+    key: str,
+    owner: str,
+    ttl_ms: int,
+    *,
+    take_over: bool = False,
+    prefix: str = LEASE_KEY_PREFIX,
+) -> str | None:
+    """
+    Claim ``key`` for ``owner`` unless another owner holds it.
+
+    Re-claiming a lease already held by ``owner`` extends it. With
+    ``take_over`` the lease is overwritten whoever holds it; the previous
+    owner notices at its next renewal.
+
+    Returns:
+        The owner holding the lease after the call (``owner`` on success).
+    """
+    name = lease_key(key, prefix)
+    pipe = client.pipeline(transaction=False)
+    pipe.set(name, owner, nx=not take_over, px=ttl_ms)
+    pipe.get(name)
+    created, current = pipe.execute()
+    current = _text(current)
+    if not created and current == owner:
+        client.pexpire(name, ttl_ms)
+    return current
+
+
+def get_owner(client: Any, key: str, *, prefix: str = LEASE_KEY_PREFIX) -> str | None:
+    """Current owner of ``key`` (None when unowned or lapsed)."""
+    return _text(client.get(lease_key(key, prefix)))
+
+
+def renew(
+    client: Any,
+    keys: Sequence[str],
+    owner: str,
+    ttl_ms: int,
+    *,
+    prefix: str = LEASE_KEY_PREFIX,
+) -> list[str]:
+    """
+    Extend every lease in ``keys`` still held by ``owner``.
+
+    Returns:
+        The keys whose lease was lost (lapsed or taken over).
+    """
+    if not keys:
+        return []
+    names = [lease_key(key, prefix) for key in keys]
+    pipe = client.pipeline(transaction=False)
+    for name in names:
+        pipe.get(name)
+    owners = [_text(value) for value in pipe.execute()]
+
+    held = [name for name, current in zip(names, owners, strict=True) if current == owner]
+    if held:
+        pipe = client.pipeline(transaction=False)
+        for name in held:
+            pipe.pexpire(name, ttl_ms)
+        pipe.execute()
+    return [key for key, current in zip(keys, owners, strict=True) if current != owner]
+
+
+def release(client: Any, keys: Iterable[str], owner: str, *, prefix: str = LEASE_KEY_PREFIX) -> int:
+    """Delete the leases in ``keys`` held by ``owner``; returns how many were released."""
+    names = [lease_key(key, prefix) for key in keys]
+    if not names:
+        return 0
+    pipe = client.pipeline(transaction=False)
+    for name in names:
+        pipe.get(name)
+    held = [
+        name for name, current in zip(names, pipe.execute(), strict=True) if _text(current) == owner
+    ]
+    if held:
+        client.delete(*held)
+    return len(held)
@@ -2,7 +2,7 @@ import asyncio
 import os
 import threading
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from typing import Any, TypeVar
 
 from opentelemetry import trace
@@ -21,6 +21,7 @@ from utils.ml_logging import get_logger
 
 import redis
 from src.enums.monitoring import PeerService, SpanAttr
+from src.redis import leases, session_index
 
 T = TypeVar("T")
 
@@ -401,16 +402,18 @@ class AzureRedisManager:
 
         return self._execute_with_retry("GET", _get_operation)
 
-    def publish_channel(self, channel: str, message: str) -> int:
-        """Publish a message to a Redis channel."""
+    def publish_channel(self, channel: str, message: str | bytes) -> int:
+        """Publish a message (text or already-encoded bytes) to a Redis channel."""
+        if not isinstance(message, (bytes, bytearray)):
+            message = str(message)
 
         def _publish_operation():
             with self._redis_span("Redis.PUBLISH"):
-                return self.redis_client.publish(channel, str(message))
+                return self.redis_client.publish(channel, message)
 
         return self._execute_with_retry("PUBLISH", _publish_operation)
 
-    async def publish_channel_async(self, channel: str, message: str) -> int:
+    async def publish_channel_async(self, channel: str, message: str | bytes) -> int:
         """Async helper for publishing to a Redis channel."""
         loop = asyncio.get_event_loop()
         return await loop.run_in_executor(
@@ -448,15 +451,122 @@ class AzureRedisManager:
 
         return self._execute_with_retry("HSET_FIELD", _hset_field_operation)
 
+    def write_session_fields(
+        self, session_id: str, data: dict[str, Any], delete_fields: Sequence[str] = ()
+    ) -> bool:
+        """Set ``data`` and drop ``delete_fields`` of a session hash in one transaction."""
+
+        def _write_operation():
+            with self._redis_span("Redis.MULTI", op="HSET+HDEL"):
+                pipe = self.redis_client.pipeline(transaction=True)
+                if data:
+                    pipe.hset(session_id, mapping=data)
+                if delete_fields:
+                    pipe.hdel(session_id, *delete_fields)
+                pipe.execute()
+                return True
+
+        return self._execute_with_retry("HSET_HDEL", _write_operation)
+
     def delete_session(self, session_id: str) -> int:
         """Delete a session from Redis."""
 
         def _delete_operation():
             with self._redis_span("Redis.DEL"):
-                return self.redis_client.delete(session_id)
+                deleted = self.redis_client.delete(session_id)
+                if session_id.startswith(session_index.SESSION_KEY_PREFIX):
+                    session_index.remove(
+                        self.redis_client, [session_index.session_id_from_key(session_id)]
+                    )
+                return deleted
 
         return self._execute_with_retry("DEL", _delete_operation)
 
+    def record_session_activity(
+        self,
+        session_id: str,
+        *,
+        turn_count: int | None = None,
+        active: bool | None = None,
+        write_summary: bool = False,
+    ) -> None:
+        """Update the session activity index (see src/redis/session_index.py)."""
+
+        def _index_operation():
+            with self._redis_span("Redis.SESSION_INDEX", op="ZADD"):
+                session_index.record_activity(
+                    self.redis_client,
+                    session_id,
+                    turn_count=turn_count,
+                    active=active,
+                    write_summary=write_summary,
+                )
+
+        self._execute_with_retry("SESSION_INDEX", _index_operation)
+
+    def list_sessions_page(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        active_only: bool = False,
+    ) -> session_index.SessionPage:
+        """Return one page of indexed sessions, most recent activity first."""
+
+        def _page_operation():
+            with self._redis_span("Redis.SESSION_PAGE", op="ZREVRANGEBYSCORE"):
+                return session_index.list_page(
+                    self.redis_client, limit=limit, cursor=cursor, active_only=active_only
+                )
+
+        return self._execute_with_retry("SESSION_PAGE", _page_operation)
+
+    def rebuild_session_index(self) -> int:
+        """Backfill the session activity index from existing session hashes."""
+
+        def _rebuild_operation():
+            with self._redis_span("Redis.SESSION_INDEX_REBUILD", op="SCAN"):
+                return session_index.rebuild(self.redis_client)
+
+        return self._execute_with_retry("SESSION_INDEX_REBUILD", _rebuild_operation)
+
+    def claim_lease(
+        self, key: str, owner: str, ttl_ms: int, *, take_over: bool = False
+    ) -> str | None:
+        """Claim (or extend) an ownership lease; returns the owner holding it afterwards."""
+
+        def _claim_operation():
+            with self._redis_span("Redis.LEASE_CLAIM", op="SET"):
+                return leases.claim(self.redis_client, key, owner, ttl_ms, take_over=take_over)
+
+        return self._execute_with_retry("LEASE_CLAIM", _claim_operation)
+
+    def get_lease_owner(self, key: str) -> str | None:
+        """Return the current owner of an ownership lease (see src/redis/leases.py)."""
+
+        def _owner_operation():
+            with self._redis_span("Redis.LEASE_OWNER", op="GET"):
+                return leases.get_owner(self.redis_client, key)
+
+        return self._execute_with_retry("LEASE_OWNER", _owner_operation)
+
+    def renew_leases(self, keys: list[str], owner: str, ttl_ms: int) -> list[str]:
+        """Extend the leases ``owner`` still holds; returns the keys it lost."""
+
+        def _renew_operation():
+            with self._redis_span("Redis.LEASE_RENEW", op="PEXPIRE"):
+                return leases.renew(self.redis_client, keys, owner, ttl_ms)
+
+        return self._execute_with_retry("LEASE_RENEW", _renew_operation)
+
+    def release_leases(self, keys: list[str], owner: str) -> int:
+        """Release the leases ``owner`` holds among ``keys``."""
+
+        def _release_operation():
+            with self._redis_span("Redis.LEASE_RELEASE", op="DEL"):
+                return leases.release(self.redis_client, keys, owner)
+
+        return self._execute_with_retry("LEASE_RELEASE", _release_operation)
+
     def list_connected_clients(self) -> list[dict[str, str]]:
         """List currently connected clients."""
 
@@ -505,6 +615,15 @@ class AzureRedisManager:
             self.logger.error(f"Error in update_session_field_async for session {session_id}: {e}")
             return False
 
+    async def write_session_fields_async(
+        self, session_id: str, data: dict[str, Any], delete_fields: Sequence[str] = ()
+    ) -> bool:
+        """Async version of write_session_fields; errors propagate to the caller."""
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            None, self.write_session_fields, session_id, data, delete_fields
+        )
+
     async def delete_session_async(self, session_id: str) -> int:
         """Async version of delete_session using thread pool executor."""
         try:
@@ -517,6 +636,63 @@ class AzureRedisManager:
             self.logger.error(f"Error in delete_session_async for session {session_id}: {e}")
             return 0
 
+    async def record_session_activity_async(
+        self,
+        session_id: str,
+        *,
+        turn_count: int | None = None,
+        active: bool | None = None,
+    ) -> None:
+        """Async version of record_session_activity using thread pool executor."""
+        try:
+            loop = asyncio.get_event_loop()
+            await loop.run_in_executor(
+                None,
+                lambda: self.record_session_activity(
+                    session_id, turn_count=turn_count, active=active
+                ),
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.logger.warning(f"Error indexing session activity for {session_id}: {e}")
+
+    async def list_sessions_page_async(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        active_only: bool = False,
+    ) -> session_index.SessionPage:
+        """Async version of list_sessions_page using thread pool executor."""
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            None, self.list_sessions_page, limit, cursor, active_only
+        )
+
+    async def claim_lease_async(
+        self, key: str, owner: str, ttl_ms: int, *, take_over: bool = False
+    ) -> str | None:
+        """Async version of claim_lease using thread pool executor."""
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            None, lambda: self.claim_lease(key, owner, ttl_ms, take_over=take_over)
+        )
+
+    async def get_lease_owner_async(self, key: str) -> str | None:
+        """Async version of get_lease_owner using thread pool executor."""
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, self.get_lease_owner, key)
+
+    async def renew_leases_async(self, keys: list[str], owner: str, ttl_ms: int) -> list[str]:
+        """Async version of renew_leases using thread pool executor."""
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, self.renew_leases, keys, owner, ttl_ms)
+
+    async def release_leases_async(self, keys: list[str], owner: str) -> int:
+        """Async version of release_leases using thread pool executor."""
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, self.release_leases, keys, owner)
+
     async def get_value_async(self, key: str) -> str | None:
         """Async version of get_value using thread pool executor."""
         try:
@@ -0,0 +1,288 @@
+"""
+Session Activity Index
+======================
+
+Secondary index over ``session:{session_id}`` hashes so session listing never
+walks the keyspace.
+
+Two sorted sets, both scored by last-activity epoch seconds:
+
+- ``sessions:index:activity`` – every listed session; trimmed once idle past
+  ``ACTIVITY_RETENTION_SEC``, the TTL session hashes are persisted with
+- ``sessions:index:active``   – sessions with a live connection; entries
+  are removed only when the session disconnects, however long a call stays
+  quiet (a crashed worker's entries go once their hash expires, below)
+
+Listing is a keyset-paginated ``ZREVRANGEBYSCORE`` followed by one pipelined
+``HMGET`` of the summary fields for the page. Index entries whose hash has
+expired or been deleted are dropped lazily when a page encounters them.
+
+Persistence writes two small summary fields next to ``corememory`` and
+``chat_history`` so a page never has to transfer chat histories:
+
+- ``last_activity`` – epoch seconds of the last persist
+- ``turn_count``    – total messages across agent histories
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+ACTIVITY_KEY = "sessions:index:activity"
+ACTIVE_KEY = "sessions:index:active"
+SESSION_KEY_PREFIX = "session:"
+
+# Only ids matching the legacy ``session:session_*`` listing pattern are indexed
+LISTED_SESSION_PREFIX = "session_"
+
+# Session hash TTL (MemoManager.persist_to_redis_async(ttl_seconds=7200)); older
+# entries point at expired hashes and would otherwise only go when a page reads them
+ACTIVITY_RETENTION_SEC = 7200.0
+
+LAST_ACTIVITY_FIELD = "last_activity"
+TURN_COUNT_FIELD = "turn_count"
+SUMMARY_FIELDS: tuple[str, ...] = ("corememory", LAST_ACTIVITY_FIELD, TURN_COUNT_FIELD)
+
+
+@dataclass
+class SessionIndexEntry:
+    """One session on a listing page."""
+
+    session_id: str
+    last_activity: float
+    fields: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def session_key(self) -> str:
+        return f"{SESSION_KEY_PREFIX}{self.session_id}"
+
+
+@dataclass
+class SessionPage:
+    """A page of sessions, most recent first."""
+
+    entries: list[SessionIndexEntry]
+    next_cursor: str | None
+    total_count: int
+    active_count: int
+
+
+def is_listed_session(session_id: str | None) -> bool:
+    """Whether ``session_id`` belongs in the listing index."""
+    return bool(session_id) and session_id.startswith(LISTED_SESSION_PREFIX)
+
+
+def session_id_from_key(key: str) -> str:
+    """``session:session_123`` -> ``session_123``."""
+    return key[len(SESSION_KEY_PREFIX) :] if key.startswith(SESSION_KEY_PREFIX) else key
+
+
+def encode_cursor(score: float, session_id: str) -> str:
+    """Opaque keyset cursor: the last (score, member) returned."""
+    return f"{score!r}:{session_id}"
+
+
+def decode_cursor(cursor: str) -> tuple[float, str]:
+    """Inverse of :func:`encode_cursor`; raises ValueError on malformed input."""
+    score, sep, session_id = cursor.partition(":")
+    if not sep or not session_id:
+        raise ValueError(f"Invalid session cursor: {cursor!r}")
+    return float(score), session_id
+
+
+def _text(value: Any) -> str:
+    return value.decode("utf-8") if isinstance(value, bytes) else str(value)
+
+
+def record_activity(
+    client: Any,
+    session_id: str,
+    *,
+    timestamp: float | None = None,
+    turn_count: int | None = None,
+    active: bool | None = None,
+    write_summary: bool = False,
+) -> None:
+    """
+    Update the index for one session in a single round trip.
+
+    Args:
+        client: Redis or RedisCluster client.
+        session_id: Session identifier (without the ``session:`` prefix).
+        timestamp: Activity time; defaults to now.
+        turn_count: Message count to store as a summary field.
+        active: True on connect, False on disconnect, None to only refresh
+            the activity score of an already-active session.
+        write_summary: Also write summary fields into the session hash. Only
+            set this right after the hash was persisted, so the index never
+            creates a hash (without TTL) for a session that has none.
+    """
+    if not is_listed_session(session_id):
+        return
+    now = time.time() if timestamp is None else timestamp
+
+    pipe = client.pipeline(transaction=False)
+    pipe.zadd(ACTIVITY_KEY, {session_id: now})
+    if active is True:
+        pipe.zadd(ACTIVE_KEY, {session_id: now})
+    elif active is False:
+        pipe.zrem(ACTIVE_KEY, session_id)
+    else:
+        pipe.zadd(ACTIVE_KEY, {session_id: now}, xx=True)
+    pipe.zremrangebyscore(ACTIVITY_KEY, "-inf", now - ACTIVITY_RETENTION_SEC)
+    if write_summary:
+        summary: dict[str, Any] = {LAST_ACTIVITY_FIELD: repr(now)}
+        if turn_count is not None:
+            summary[TURN_COUNT_FIELD] = int(turn_count)
+        pipe.hset(f"{SESSION_KEY_PREFIX}{session_id}", mapping=summary)
+    pipe.execute()
+
+
+def remove(client: Any, session_ids: Iterable[str]) -> None:
+    """Drop sessions from both index sets."""
+    ids = list(session_ids)
+    if not ids:
+        return
+    pipe = client.pipeline(transaction=False)
+    pipe.zrem(ACTIVITY_KEY, *ids)
+    pipe.zrem(ACTIVE_KEY, *ids)
+    pipe.execute()
+
+
+def list_page(
+    client: Any,
+    *,
+    limit: int,
+    cursor: str | None = None,
+    active_only: bool = False,
+    fields: Sequence[str] = SUMMARY_FIELDS,
+) -> SessionPage:
+    """
+    Return up to ``limit`` sessions ordered by last activity (newest first).
+
+    Cost is O(log N + page) regardless of how many sessions exist: the sorted
+    set is read from the cursor position and only the page's hashes are read.
+    """
+    key = ACTIVE_KEY if active_only else ACTIVITY_KEY
+    fields = list(fields)
+    max_score: str = "+inf"
+    after: tuple[float, str] | None = None
+    if cursor:
+        after = decode_cursor(cursor)
+        max_score = repr(after[0])
+
+    entries: list[SessionIndexEntry] = []
+    stale: list[str] = []
+    has_more = False
+    # One row past the page tells whether there is more; the cursor row itself comes back too
+    batch = limit + 1 + (after is not None)
+
+    while True:
+        rows = client.zrevrangebyscore(key, max_score, "-inf", start=0, num=batch, withscores=True)
+        candidates: list[tuple[str, float]] = []
+        for member, score in rows:
+            member = _text(member)
+            score = float(score)
+            # Members sharing the cursor score sort in reverse lexical order
+            if after is not None and score == after[0] and member >= after[1]:
+                continue
+            candidates.append((member, score))
+
+        if candidates:
+            pipe = client.pipeline(transaction=False)
+            for member, _ in candidates:
+                pipe.hmget(f"{SESSION_KEY_PREFIX}{member}", fields)
+            values = pipe.execute()
+            for (member, score), row in zip(candidates, values, strict=True):
+                if row is None or all(v is None for v in row):
+                    stale.append(member)
+                    continue
+                if len(entries) == limit:
+                    has_more = True
+                    break
+                data = {f: _text(v) for f, v in zip(fields, row, strict=True) if v is not None}
+                entries.append(SessionIndexEntry(member, score, data))
+
+        exhausted = len(rows) < batch
+        if has_more or exhausted:
+            break
+        if not candidates:
+            # Every row tied with the cursor; widen the window past the ties
+            batch *= 2
+            continue
+        # Page fell short because of stale entries; continue after the last row seen
+        last_member, last_score = candidates[-1]
+        after = (last_score, last_member)
+        max_score = repr(last_score)
+
+    if stale:
+        remove(client, stale)
+
+    pipe = client.pipeline(transaction=False)
+    pipe.zcard(ACTIVITY_KEY)
+    pipe.zcard(ACTIVE_KEY)
+    total_count, active_count = pipe.execute()
+
+    next_cursor = None
+    if has_more and entries:
+        last = entries[-1]
+        next_cursor = encode_cursor(last.last_activity, last.session_id)
+    return SessionPage(entries, next_cursor, int(total_count), int(active_count))
+
+
+def rebuild(client: Any, *, batch_size: int = 500) -> int:
+    """
+    Backfill the activity index from existing session hashes with one SCAN.
+
+    Used once when the index is empty (sessions persisted before the index
+    existed). Returns the number of sessions indexed.
+    """
+    indexed = 0
+    pending: list[str] = []
+
+    def flush() -> None:
+        nonlocal indexed
+        pipe = client.pipeline(transaction=False)
+        for key in pending:
+            pipe.hget(key, LAST_ACTIVITY_FIELD)
+        values = pipe.execute()
+        now = time.time()
+        scores: dict[str, float] = {}
+        for key, value in zip(pending, values, strict=True):
+            try:
+                scores[session_id_from_key(key)] = float(value) if value else now
+            except (TypeError, ValueError):
+                scores[session_id_from_key(key)] = now
+        if scores:
+            client.zadd(ACTIVITY_KEY, scores)
+            indexed += len(scores)
+        pending.clear()
+
+    for key in client.scan_iter(
+        match=f"{SESSION_KEY_PREFIX}{LISTED_SESSION_PREFIX}*", count=batch_size
+    ):
+        pending.append(_text(key))
+        if len(pending) >= batch_size:
+            flush()
+    if pending:
+        flush()
+    return indexed
+
+
+__all__ = [
+    "ACTIVE_KEY",
+    "ACTIVITY_KEY",
+    "SUMMARY_FIELDS",
+    "SessionIndexEntry",
+    "SessionPage",
+    "decode_cursor",
+    "encode_cursor",
+    "is_listed_session",
+    "list_page",
+    "rebuild",
+    "record_activity",
+    "remove",
+]
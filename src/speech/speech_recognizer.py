@@ -20,6 +20,7 @@ from dotenv import load_dotenv
 from opentelemetry import trace
 from opentelemetry.trace import SpanKind, Status, StatusCode
 from utils.ml_logging import get_logger
+from utils.telemetry_config import get_span_sampler
 
 # Import centralized span attributes enum
 from src.speech.auth_manager import SpeechTokenManager, get_speech_token_manager
@@ -282,6 +283,7 @@ class StreamingSpeechRecognizerFromBytes:
         # Initialize tracing
         self.tracer = None
         self._session_span = None
+        self._sampling_key = f"stt:{id(self):x}"
         if self.enable_tracing:
             try:
                 # Initialize Azure Monitor if not already done
@@ -358,6 +360,7 @@ class StreamingSpeechRecognizerFromBytes:
         # End any active session span
         if self._session_span:
             try:
+                get_span_sampler().flush(self._session_span, self._sampling_key)
                 self._session_span.end()
             except Exception:
                 pass
@@ -1126,7 +1129,8 @@ class StreamingSpeechRecognizerFromBytes:
 
         Tracing:
             Adds lightweight events to the session span including:
-            - Audio chunk size for throughput monitoring
+            - Audio chunk size for throughput monitoring, rate-limited by the
+              shared span sampler; skipped chunks are counted on the session span
             - Stream health indicators
             - No per-chunk spans to maintain performance
 
@@ -1146,7 +1150,13 @@ class StreamingSpeechRecognizerFromBytes:
         if self.push_stream:
             if self.enable_tracing and self._session_span:
                 try:
-                    self._session_span.add_event("audio_chunk", {"size": len(audio_chunk)})
+                    # Rate-limited per recognizer; the rest are counted on the session span
+                    get_span_sampler().add_event(
+                        self._session_span,
+                        self._sampling_key,
+                        "audio_chunk",
+                        {"size": len(audio_chunk)},
+                    )
                 except Exception:
                     pass
             self.push_stream.write(audio_chunk)
@@ -1215,6 +1225,7 @@ class StreamingSpeechRecognizerFromBytes:
             if self._session_span:
                 self._session_span.add_event("speech_recognition_stopped")
                 self._session_span.set_status(Status(StatusCode.OK))
+                get_span_sampler().flush(self._session_span, self._sampling_key)
                 self._session_span.end()
                 self._session_span = None
 
@@ -1275,6 +1286,7 @@ class StreamingSpeechRecognizerFromBytes:
             # Final cleanup of session span if still active
             if self._session_span:
                 self._session_span.add_event("audio_stream_closed")
+                get_span_sampler().flush(self._session_span, self._sampling_key)
                 self._session_span.end()
                 self._session_span = None
 
@@ -1787,5 +1799,6 @@ class StreamingSpeechRecognizerFromBytes:
         if self._session_span:
             self._session_span.add_event("speech_session_stopped")
             self._session_span.set_status(Status(StatusCode.OK))
+            get_span_sampler().flush(self._session_span, self._sampling_key)
             self._session_span.end()
             self._session_span = None
@@ -40,12 +40,12 @@ Example:
 """
 
 import asyncio
-import json
 import time
 import uuid
 from collections import deque
 from typing import Any
 
+from utils import json_codec
 from utils.ml_logging import get_logger
 
 from src.agenticmemory.playback_queue import MessageQueue
@@ -171,7 +171,7 @@ class MemoManager:
 
     @histories.setter
     def histories(self, value: dict[str, list[dict[str, str]]]) -> None:  # noqa: D401
-        self.chatHistory._threads = value  # direct assignment
+        self.chatHistory.replace(value)
 
     @property
     def context(self) -> dict[str, Any]:  # noqa: D401
@@ -282,7 +282,7 @@ class MemoManager:
         if mm._CORE_KEY in data:
             mm.corememory.from_json(data[mm._CORE_KEY])
         if mm._HISTORY_KEY in data:
-            mm.chatHistory.from_json(data[mm._HISTORY_KEY])
+            mm.chatHistory.load_redis_fields(data, mm._HISTORY_KEY)
         return mm
 
     @classmethod
@@ -315,7 +315,7 @@ class MemoManager:
             if cls._CORE_KEY in data:
                 mm.corememory.from_json(data[cls._CORE_KEY])
             if cls._HISTORY_KEY in data:
-                mm.chatHistory.from_json(data[cls._HISTORY_KEY])
+                mm.chatHistory.load_redis_fields(data, cls._HISTORY_KEY)
         return mm
 
     async def persist(self, redis_mgr: AzureRedisManager | None = None) -> None:
@@ -386,9 +386,16 @@ class MemoManager:
             to avoid blocking the event loop.
         """
         key = self.build_redis_key(self.session_id)
-        redis_mgr.store_session_data(key, self.to_redis_dict())
+        write = self.chatHistory.prepare_redis_write(self._HISTORY_KEY)
+        mapping = {self._CORE_KEY: self.corememory.to_json(), **write.mapping}
+        if write.is_legacy:
+            redis_mgr.store_session_data(key, mapping)
+        else:
+            redis_mgr.write_session_fields(key, mapping, write.delete)
+        self.chatHistory.commit_redis_write(write)
         if ttl_seconds:
             redis_mgr.redis_client.expire(key, ttl_seconds)
+        self._index_session_activity(redis_mgr)
         logger.info(
             f"Persisted session {self.session_id} – "
             f"histories per agent: {[f'{a}: {len(h)}' for a, h in self.histories.items()]}, ctx_keys={list(self.context.keys())}"
@@ -434,10 +441,18 @@ class MemoManager:
         """
         try:
             key = self.build_redis_key(self.session_id)
-            await redis_mgr.store_session_data_async(key, self.to_redis_dict())
+            write = self.chatHistory.prepare_redis_write(self._HISTORY_KEY)
+            mapping = {self._CORE_KEY: self.corememory.to_json(), **write.mapping}
+            if write.is_legacy:
+                await redis_mgr.store_session_data_async(key, mapping)
+            else:
+                # Log entries must not be marked written unless they were
+                await redis_mgr.write_session_fields_async(key, mapping, write.delete)
+            self.chatHistory.commit_redis_write(write)
+            loop = asyncio.get_event_loop()
             if ttl_seconds:
-                loop = asyncio.get_event_loop()
                 await loop.run_in_executor(None, redis_mgr.redis_client.expire, key, ttl_seconds)
+            await loop.run_in_executor(None, self._index_session_activity, redis_mgr)
             logger.info(
                 f"Persisted session {self.session_id} async – "
                 f"histories per agent: {[f'{a}: {len(h)}' for a, h in self.histories.items()]}, ctx_keys={list(self.context.keys())}"
@@ -450,6 +465,20 @@ class MemoManager:
             logger.error(f"Error persisting session {self.session_id} to Redis: {e}")
             # Don't re-raise non-cancellation errors to avoid crashing the caller
 
+    def _index_session_activity(self, redis_mgr: AzureRedisManager) -> None:
+        """Refresh the session listing index after a persist (best effort)."""
+        record = getattr(redis_mgr, "record_session_activity", None)
+        if record is None:
+            return
+        try:
+            record(
+                self.session_id,
+                turn_count=sum(len(h) for h in self.histories.values()),
+                write_summary=True,
+            )
+        except Exception as e:
+            logger.warning(f"Failed to index session {self.session_id} activity: {e}")
+
     async def persist_background(
         self,
         redis_mgr: AzureRedisManager | None = None,
@@ -1207,12 +1236,15 @@ class MemoManager:
             This method always updates the system prompt content on each
             call, ensuring the agent operates with the most current instructions.
         """
-        history = self.histories.setdefault(agent_name, [])
+        history = self.chatHistory.get_agent(agent_name)
 
         if not history or history[0].get("role") != "system":
             history.insert(0, {"role": "system", "content": system_prompt})
+        elif history[0].get("content") == system_prompt:
+            return
         else:
             history[0]["content"] = system_prompt
+        self.chatHistory.mark_dirty()
 
     def get_value_from_corememory(self, key: str, default: Any = None) -> Any:
         """
@@ -1300,12 +1332,12 @@ class MemoManager:
                 logger.warning(f"No live data found for session {self.session_id}")
                 return False
             if "chat_history" in data:
-                new_histories = json.loads(data["chat_history"])
+                new_histories = ChatHistory.threads_from_redis_fields(data)
                 if new_histories != self.histories:
                     logger.info(f"Refreshed histories for session {self.session_id}")
-                    self.histories = new_histories
+                    self.chatHistory.load_redis_fields(data)
             if "corememory" in data:
-                new_context = json.loads(data["corememory"])
+                new_context = json_codec.loads(data["corememory"])
                 self.context = new_context
             logger.info(f"Successfully refreshed live data for session {self.session_id}")
             return True
@@ -1322,12 +1354,12 @@ class MemoManager:
                 logger.warning(f"No live data found for session {self.session_id}")
                 return False
             if "chat_history" in data:
-                new_histories = json.loads(data["chat_history"])
+                new_histories = ChatHistory.threads_from_redis_fields(data)
                 if new_histories != self.histories:
                     logger.info(f"Refreshed histories for session {self.session_id}")
-                    self.histories = new_histories
+                    self.chatHistory.load_redis_fields(data)
             if "corememory" in data:
-                new_context = json.loads(data["corememory"])
+                new_context = json_codec.loads(data["corememory"])
                 self.context = new_context
             logger.info(f"Successfully refreshed live data for session {self.session_id}")
             return True
@@ -1343,7 +1375,7 @@ class MemoManager:
             redis_key = self.build_redis_key(self.session_id)
             data = await redis_mgr.get_session_data_async(redis_key)
             if data and "corememory" in data:
-                context = json.loads(data["corememory"])
+                context = json_codec.loads(data["corememory"])
                 return context.get(key, default)
             return default
         except Exception as e:
@@ -1381,7 +1413,7 @@ class MemoManager:
             if not data:
                 return changes
             if "corememory" in data:
-                remote_context = json.loads(data["corememory"])
+                remote_context = json_codec.loads(data["corememory"])
                 local_context_clean = {
                     k: v for k, v in self.context.items() if k != "message_queue"
                 }
@@ -1394,7 +1426,7 @@ class MemoManager:
                     local_queue = list(self.message_queue.queue)
                     changes["queue"] = local_queue != remote_queue
             if "chat_history" in data:
-                remote_histories = json.loads(data["chat_history"])
+                remote_histories = ChatHistory.threads_from_redis_fields(data)
                 changes["chat_history"] = self.histories != remote_histories
         except Exception as e:
             logger.error(f"Error checking for changes in session {self.session_id}: {e}")
@@ -1415,18 +1447,18 @@ class MemoManager:
             if not data:
                 return updated
             if refresh_context and "corememory" in data:
-                new_context = json.loads(data["corememory"])
+                new_context = json_codec.loads(data["corememory"])
                 if not refresh_queue:
                     new_context.pop("message_queue", None)
                 self.context.update(new_context)
                 updated["corememory"] = True
                 logger.debug(f"Updated context for session {self.session_id}")
             if refresh_histories and "chat_history" in data:
-                self.histories = json.loads(data["chat_history"])
+                self.chatHistory.load_redis_fields(data)
                 updated["chat_history"] = True
                 logger.debug(f"Updated histories for session {self.session_id}")
             if refresh_queue and "corememory" in data:
-                context = json.loads(data["corememory"])
+                context = json_codec.loads(data["corememory"])
                 if "message_queue" in context:
                     async with self.message_queue.lock:
                         self.message_queue.queue = deque(context["message_queue"])
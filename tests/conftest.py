@@ -2,7 +2,7 @@ import os
 import sys
 from pathlib import Path
 from types import ModuleType
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 # Disable telemetry for tests
 os.environ["DISABLE_CLOUD_TELEMETRY"] = "true"
@@ -41,6 +41,18 @@ if "config" not in sys.modules:
     config_mock.ACS_ENDPOINT = "https://test.communication.azure.com"
     config_mock.ACS_SOURCE_PHONE_NUMBER = "+15551234567"
     config_mock.ACS_WEBSOCKET_PATH = "/api/v1/media/stream"
+    config_mock.ACS_INBOUND_COALESCE_MS = 40
+    config_mock.ACS_JITTER_BUFFER = False
+    config_mock.ACS_JITTER_MIN_DEPTH_MS = 40
+    config_mock.ACS_JITTER_MAX_DEPTH_MS = 200
+    config_mock.CASCADE_SPECULATIVE_LLM = False
+    config_mock.CASCADE_SPECULATION_STABLE_MS = 300
+    config_mock.CASCADE_VAD_BARGE_IN = False
+    config_mock.CASCADE_VAD_MIN_SPEECH_MS = 120
+    config_mock.UI_ENVELOPE_FRAME_MS = 150
+    config_mock.SESSION_AFFINITY_ENABLED = False
+    config_mock.SESSION_AFFINITY_LEASE_S = 30
+    config_mock.UI_COALESCED_EVENTS = ["user_transcript_partial", "voicelive_session_updated"]
     config_mock.AZURE_SPEECH_ENDPOINT = "https://test.cognitiveservices.azure.com"
     config_mock.AZURE_STORAGE_CONTAINER_URL = "https://test.blob.core.windows.net/container"
     config_mock.BASE_URL = "https://test.example.com"
@@ -63,9 +75,14 @@ aoai_client_mock.chat = MagicMock()
 aoai_client_mock.chat.completions = MagicMock()
 aoai_client_mock.chat.completions.create = MagicMock()
 
+aoai_async_client_mock = MagicMock()
+aoai_async_client_mock.chat.completions.create = AsyncMock()
+
 if "src.aoai.client" not in sys.modules:
     aoai_module = ModuleType("src.aoai.client")
     aoai_module.get_client = MagicMock(return_value=aoai_client_mock)
+    aoai_module.get_async_client = MagicMock(return_value=aoai_async_client_mock)
+    aoai_module.close_async_client = AsyncMock()
     aoai_module.create_azure_openai_client = MagicMock(return_value=aoai_client_mock)
     sys.modules["src.aoai.client"] = aoai_module
 
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+ACS Inbound Decoder Benchmark
+=============================
+
+Replays the cached caller utterances in ``tests/load/audio_cache`` as 20 ms
+ACS ``AudioData`` frames and times two ways of turning them into PCM for the
+recognizer:
+
+- reference: ``json.loads`` and ``base64.b64decode`` per frame, one push each
+- decoder: ``ACSInboundDecoder`` (string-inspection fast path, silent frames
+  zero-filled, pushes coalesced to ``coalesce_ms``)
+
+Reports frames per second for each (best of ``repeat``), the speedup, the
+recognizer pushes per path, and whether both produce identical audio.
+
+Usage:
+    python tests/load/acs_inbound_benchmark.py
+    python tests/load/acs_inbound_benchmark.py --repeat 5 --coalesce-ms 60
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import json
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+# Running as a script puts tests/load first, where ``utils`` would shadow the backend's
+_HERE = Path(__file__).resolve().parent
+sys.path[:] = [p for p in sys.path if Path(p or ".").resolve() != _HERE]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from apps.artagent.backend.voice.speech_cascade.acs_inbound import (  # noqa: E402
+    ACSInboundDecoder,
+)
+
+AUDIO_CACHE = Path(__file__).resolve().parent / "audio_cache"
+FRAME_BYTES = 640  # 20 ms @ 16 kHz PCM16 mono
+
+
+def load_messages() -> list[str]:
+    """Cached audio as serialized ACS AudioData frames."""
+    messages = []
+    for path in sorted(AUDIO_CACHE.glob("*.pcm")):
+        pcm = path.read_bytes()
+        for offset in range(0, len(pcm) - FRAME_BYTES + 1, FRAME_BYTES):
+            frame = pcm[offset : offset + FRAME_BYTES]
+            messages.append(
+                json.dumps(
+                    {
+                        "kind": "AudioData",
+                        "audioData": {
+                            "timestamp": "2026-10-18T12:00:00.000Z",
+                            "participantRawID": "8:acs:caller",
+                            "data": base64.b64encode(frame).decode("ascii"),
+                            "silent": not any(frame),
+                        },
+                    }
+                )
+            )
+    return messages
+
+
+def replay_reference(messages: list[str]) -> list[bytes]:
+    chunks = []
+    for text in messages:
+        chunks.append(base64.b64decode(json.loads(text)["audioData"]["data"]))
+    return chunks
+
+
+def replay_decoder(messages: list[str], coalesce_ms: int) -> tuple[list[bytes], ACSInboundDecoder]:
+    chunks: list[bytes] = []
+    decoder = ACSInboundDecoder(chunks.append, coalesce_ms=coalesce_ms)
+    for text in messages:
+        decoder.feed(text)
+    decoder.flush()
+    return chunks, decoder
+
+
+def run(repeat: int = 3, coalesce_ms: int = 40) -> dict:
+    """Best-of-``repeat`` throughput for the reference path and the decoder."""
+    messages = load_messages()
+    if not messages:
+        return {"frames": 0, "error": f"no cached audio in {AUDIO_CACHE}"}
+
+    reference_s = decoder_s = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        reference = replay_reference(messages)
+        reference_s = min(reference_s, time.perf_counter() - start)
+        start = time.perf_counter()
+        chunks, decoder = replay_decoder(messages, coalesce_ms)
+        decoder_s = min(decoder_s, time.perf_counter() - start)
+
+    return {
+        "frames": len(messages),
+        "coalesce_ms": coalesce_ms,
+        "reference_frames_per_s": round(len(messages) / reference_s),
+        "decoder_frames_per_s": round(len(messages) / decoder_s),
+        "speedup": round(reference_s / decoder_s, 2),
+        "reference_pushes": len(reference),
+        "decoder_pushes": decoder.stats.pushes,
+        "fallback_parses": decoder.stats.fallback_parses,
+        "identical_audio": b"".join(chunks) == b"".join(reference),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--coalesce-ms", type=int, default=40, help="decoder push size")
+    args = parser.parse_args()
+    print(json.dumps(run(repeat=args.repeat, coalesce_ms=args.coalesce_ms), indent=2))
+
+
+if __name__ == "__main__":
+    main()
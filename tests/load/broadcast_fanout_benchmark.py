@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Session Broadcast Fan-out Benchmark
+===================================
+
+Measures process CPU per ``broadcast_session`` call at several subscriber
+counts, comparing:
+
+- per_recipient: the previous path (copy the envelope with ``session_context``,
+  then ``json.dumps`` it again in every connection's ``send_json``)
+- encode_once:   ``ThreadSafeConnectionManager.broadcast_session`` (one dump,
+  session context overlaid, the same text frame queued on every connection)
+
+Both variants include draining each connection's sender loop into an
+in-memory WebSocket, so queueing and send costs are counted too.
+
+Usage:
+    python tests/load/broadcast_fanout_benchmark.py
+    python tests/load/broadcast_fanout_benchmark.py --subscribers 1 5 50 --broadcasts 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+# Running as a script puts tests/load first, where ``utils`` would shadow the backend's
+_HERE = Path(__file__).resolve().parent
+sys.path[:] = [p for p in sys.path if Path(p or ".").resolve() != _HERE]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from fastapi.websockets import WebSocketState  # noqa: E402
+from src.pools.connection_manager import ThreadSafeConnectionManager  # noqa: E402
+
+
+class _SinkWebSocket:
+    client_state = WebSocketState.CONNECTED
+    application_state = WebSocketState.CONNECTED
+
+    def __init__(self) -> None:
+        self.frames = 0
+
+    async def send_text(self, message: str) -> None:
+        self.frames += 1
+
+    async def close(self) -> None:
+        pass
+
+
+def sample_envelope(index: int) -> dict:
+    """Assistant streaming envelope shaped like the ones sent during a turn."""
+    return {
+        "type": "assistant_streaming",
+        "sender": "Concierge",
+        "session_id": "bench-session",
+        "timestamp": "2026-01-01T00:00:00Z",
+        "payload": {
+            "content": "Your checking account balance is 1,204 dollars and 17 cents. " * 2,
+            "turn_id": f"turn-{index}",
+            "response_id": f"resp-{index}",
+            "metadata": {"agent": "Concierge", "voice": "en-US-AvaMultilingualNeural"},
+        },
+    }
+
+
+async def _per_recipient(manager: ThreadSafeConnectionManager, session_id: str, payload: dict):
+    async with manager._lock:
+        targets = [manager._conns[i] for i in manager._by_session.get(session_id, set())]
+    session_payload = {
+        **payload,
+        "session_context": {
+            "session_id": session_id,
+            "restricted_to_session": True,
+            "timestamp": time.time(),
+        },
+    }
+    await asyncio.gather(*(conn.send_json(session_payload) for conn in targets))
+
+
+async def _drain(sockets: list[_SinkWebSocket], expected: int) -> None:
+    while any(ws.frames < expected for ws in sockets):
+        await asyncio.sleep(0)
+
+
+async def _measure(variant: str, subscribers: int, broadcasts: int) -> dict:
+    manager = ThreadSafeConnectionManager(enable_connection_limits=False)
+    sockets = [_SinkWebSocket() for _ in range(subscribers)]
+    for ws in sockets:
+        await manager.register(ws, client_type="dashboard", session_id="bench-session")
+
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    for index in range(broadcasts):
+        payload = sample_envelope(index)
+        if variant == "encode_once":
+            await manager.broadcast_session("bench-session", payload)
+        else:
+            await _per_recipient(manager, "bench-session", payload)
+        await _drain(sockets, index + 1)
+    cpu_s = time.process_time() - cpu_start
+    wall_s = time.perf_counter() - wall_start
+
+    await manager.stop()
+    return {
+        "variant": variant,
+        "subscribers": subscribers,
+        "broadcasts": broadcasts,
+        "frames": sum(ws.frames for ws in sockets),
+        "cpu_us_per_broadcast": round(cpu_s / broadcasts * 1e6, 1),
+        "wall_us_per_broadcast": round(wall_s / broadcasts * 1e6, 1),
+    }
+
+
+def run(subscribers: int, broadcasts: int, variant: str) -> dict:
+    """Measure one variant at one subscriber count."""
+    return asyncio.run(_measure(variant, subscribers, broadcasts))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--subscribers", type=int, nargs="+", default=[1, 5, 50])
+    parser.add_argument("--broadcasts", type=int, default=1000)
+    args = parser.parse_args()
+
+    for subscribers in args.subscribers:
+        results = {
+            variant: run(subscribers, args.broadcasts, variant)
+            for variant in ("per_recipient", "encode_once")
+        }
+        before = results["per_recipient"]["cpu_us_per_broadcast"]
+        after = results["encode_once"]["cpu_us_per_broadcast"]
+        print(
+            f"subscribers={subscribers:<4} per_recipient={before:>8.1f}us "
+            f"encode_once={after:>8.1f}us  cpu saved={(1 - after / before) * 100:5.1f}%"
+        )
+
+
+if __name__ == "__main__":
+    main()
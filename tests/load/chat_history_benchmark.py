@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Chat History Storage Benchmark
+==============================
+
+Simulates a long, tool-heavy call (user / assistant turns with a tool call
+and tool result every few turns) against ``ChatHistory`` and reports:
+
+- memory: bytes per 1,000 messages (tracemalloc) for the legacy load
+  (``json.loads`` of the snapshot), the interned load used by
+  ``ChatHistory.load_redis_fields`` and compact ``ChatRecord`` entries, plus
+  the live footprint at the end of the call with and without a per-agent cap
+- persist: bytes written to the session hash and encode time per turn when
+  every turn rewrites the whole ``chat_history`` snapshot versus the
+  append-only log (``chat_log:*`` fields, folded into a new snapshot every
+  ``compact_every`` entries)
+- round_trip: whether loading the final hash reproduces the live history
+
+Writes are applied to an in-memory dict standing in for the Redis hash, so
+the numbers isolate serialization cost from network latency.
+
+Usage:
+    python tests/load/chat_history_benchmark.py
+    python tests/load/chat_history_benchmark.py --turns 400 --max-messages 120
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+# Running as a script puts tests/load first, where ``utils`` would shadow the backend's
+_HERE = Path(__file__).resolve().parent
+sys.path[:] = [p for p in sys.path if Path(p or ".").resolve() != _HERE]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.agenticmemory.types import ChatHistory, ChatRecord  # noqa: E402
+
+AGENT = "Concierge"
+TOOL_EVERY = 3
+_SENTENCES = (
+    "I'd like to check the status of my claim from last week.",
+    "Sure, I can help with that. Could you confirm the policy number?",
+    "It's the one ending in four two seven, under my wife's name.",
+    "Thanks. I see the claim was received and is waiting on an adjuster.",
+    "How long does that usually take, and will someone call me?",
+)
+
+
+def _turn_messages(turn: int) -> list[dict]:
+    """Messages appended by one turn of the simulated call."""
+    text = _SENTENCES[turn % len(_SENTENCES)]
+    messages = [{"role": "user", "content": f"{text} ({turn})"}]
+    if turn % TOOL_EVERY == 0:
+        call_id = f"call_{turn:06d}"
+        messages.append(
+            {
+                "role": "assistant",
+                "content": None,
+                "tool_calls": [
+                    {
+                        "id": call_id,
+                        "type": "function",
+                        "function": {"name": "lookup_claim", "arguments": '{"policy":"427"}'},
+                    }
+                ],
+            }
+        )
+        messages.append(
+            {
+                "role": "tool",
+                "tool_call_id": call_id,
+                "content": json.dumps({"claim": f"CLM-{turn}", "status": "pending_adjuster"}),
+            }
+        )
+    messages.append({"role": "assistant", "content": _SENTENCES[(turn + 1) % len(_SENTENCES)]})
+    return messages
+
+
+def _build(history: ChatHistory, turns: int) -> None:
+    history.append("system", "You are a helpful insurance concierge.", AGENT)
+    thread = history.get_agent(AGENT)
+    for turn in range(turns):
+        for message in _turn_messages(turn):
+            if set(message) == {"role", "content"}:
+                history.append(message["role"], message["content"], AGENT)
+            else:
+                thread.append(message)
+
+
+def _allocated(build) -> tuple[int, object]:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    value = build()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after - before, value
+
+
+def measure_memory(turns: int, max_messages: int) -> dict:
+    """Bytes per 1,000 messages by representation, and live footprint with a cap."""
+    history = ChatHistory(max_messages=0)
+    _build(history, turns)
+    messages = len(history.get_agent(AGENT))
+    snapshot = history.to_json()
+    entries = [ChatRecord.from_message(AGENT, m).encode() for m in history.get_agent(AGENT)]
+
+    legacy, _ = _allocated(lambda: json.loads(snapshot))
+    interned, _ = _allocated(
+        lambda: ChatHistory.threads_from_redis_fields({"chat_history": snapshot})
+    )
+    records, _ = _allocated(lambda: [ChatRecord.decode(entry) for entry in entries])
+
+    def live(cap: int):
+        bounded = ChatHistory(max_messages=cap)
+        _build(bounded, turns)
+        bounded.commit_redis_write(bounded.prepare_redis_write())
+        return bounded
+
+    unbounded_bytes, _ = _allocated(lambda: live(0))
+    capped_bytes, capped = _allocated(lambda: live(max_messages))
+
+    def per_1k(total: int) -> int:
+        return round(total * 1000 / messages)
+
+    return {
+        "messages": messages,
+        "legacy_dict_bytes_per_1k": per_1k(legacy),
+        "interned_dict_bytes_per_1k": per_1k(interned),
+        "record_bytes_per_1k": per_1k(records),
+        "live_unbounded_bytes": unbounded_bytes,
+        "live_capped_bytes": capped_bytes,
+        "live_capped_messages": len(capped.get_agent(AGENT)),
+        "archived_messages": capped.archived_count(AGENT),
+    }
+
+
+def _apply(store: dict[str, str], mapping: dict[str, str], delete: list[str]) -> None:
+    store.update(mapping)
+    for field in delete:
+        store.pop(field, None)
+
+
+def measure_persist(turns: int, *, append_log: bool, max_messages: int, compact_every: int) -> dict:
+    """Persist after every turn; bytes written and encode time per turn."""
+    history = ChatHistory(
+        max_messages=max_messages, append_log=append_log, compact_every=compact_every
+    )
+    store: dict[str, str] = {}
+    history.append("system", "You are a helpful insurance concierge.", AGENT)
+    thread = history.get_agent(AGENT)
+    written: list[int] = []
+    encode_s = 0.0
+    snapshots = 0
+    for turn in range(turns):
+        for message in _turn_messages(turn):
+            if set(message) == {"role", "content"}:
+                history.append(message["role"], message["content"], AGENT)
+            else:
+                thread.append(message)
+        start = time.perf_counter()
+        write = history.prepare_redis_write()
+        encode_s += time.perf_counter() - start
+        _apply(store, write.mapping, write.delete)
+        history.commit_redis_write(write)
+        written.append(sum(len(value) for value in write.mapping.values()))
+        snapshots += write.snapshot
+
+    loaded = ChatHistory()
+    loaded.load_redis_fields(store)
+    archive = ChatHistory.archive_from_redis_fields(store).get(AGENT, [])
+    live = history.get_agent(AGENT)
+    full = live[:1] + archive + live[1:] if archive else live
+    expected = [m for t in range(turns) for m in _turn_messages(t)]
+    return {
+        "bytes_per_turn_avg": round(sum(written) / turns),
+        "bytes_last_turn": written[-1],
+        "bytes_total": sum(written),
+        "encode_us_per_turn": round(encode_s / turns * 1e6, 1),
+        "snapshots": snapshots,
+        "hash_fields": len(store),
+        "round_trip": loaded.get_agent(AGENT) == live and full[1:] == expected,
+    }
+
+
+def run(turns: int = 200, max_messages: int = 0, compact_every: int = 64) -> dict:
+    """Memory and persist-cost comparison for one simulated call."""
+    return {
+        "turns": turns,
+        "memory": measure_memory(turns, max_messages or 120),
+        "persist": {
+            "snapshot": measure_persist(
+                turns, append_log=False, max_messages=max_messages, compact_every=compact_every
+            ),
+            "append_log": measure_persist(
+                turns, append_log=True, max_messages=max_messages, compact_every=compact_every
+            ),
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--turns", type=int, default=200)
+    parser.add_argument(
+        "--max-messages", type=int, default=0, help="per-agent cap for the persist runs"
+    )
+    parser.add_argument("--compact-every", type=int, default=64)
+    args = parser.parse_args()
+    print(
+        json.dumps(
+            run(turns=args.turns, max_messages=args.max_messages, compact_every=args.compact_every),
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Conversation Window Benchmark
+=============================
+
+Times per-turn history assembly in the cascade orchestrator as a call grows:
+the bounded ``ConversationWindow`` (only messages appended since the previous
+turn are ingested) against the previous approach of copying and measuring the
+agent's full thread every turn. Every fifth turn carries a tool exchange.
+
+Reports microseconds per turn (best of ``repeat`` turns) for a short and a
+long call, and whether window assembly stays flat as the call grows.
+
+Usage:
+    python tests/load/context_window_benchmark.py
+    python tests/load/context_window_benchmark.py --short 20 --long 5000 --max-tokens 6000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+# Running as a script puts tests/load first, where ``utils`` would shadow the backend's
+_HERE = Path(__file__).resolve().parent
+sys.path[:] = [p for p in sys.path if Path(p or ".").resolve() != _HERE]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from apps.artagent.backend.voice.shared.context_window import (  # noqa: E402
+    ConversationWindow,
+    message_tokens,
+)
+
+
+def _append_turn(history: list[dict], turn: int, *, tools: bool = False) -> None:
+    history.append({"role": "user", "content": f"Question {turn}: " + "details " * 20})
+    if tools:
+        call_id = f"call_{turn}"
+        call = {
+            "role": "assistant",
+            "content": None,
+            "tool_calls": [
+                {
+                    "id": call_id,
+                    "type": "function",
+                    "function": {"name": "get_balance", "arguments": "{}"},
+                }
+            ],
+        }
+        result = {
+            "tool_call_id": call_id,
+            "role": "tool",
+            "name": "get_balance",
+            "content": json.dumps({"balance": turn * 10}),
+        }
+        history.append({"role": "assistant", "content": json.dumps(call)})
+        history.append({"role": "tool", "content": json.dumps(result)})
+    history.append({"role": "assistant", "content": f"Answer {turn}. " + "words " * 30})
+
+
+def _turn_us(turns: int, max_tokens: int, repeat: int) -> tuple[float, float]:
+    """Best per-turn microseconds after ``turns`` turns: (window, full thread)."""
+    history: list[dict] = []
+    window = ConversationWindow(max_tokens=max_tokens)
+    for turn in range(turns):
+        _append_turn(history, turn, tools=turn % 5 == 0)
+        window.history(history)
+
+    best_window = best_full = float("inf")
+    for turn in range(turns, turns + repeat):
+        _append_turn(history, turn)
+        start = time.perf_counter()
+        window.history(history)
+        best_window = min(best_window, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        list(history)  # previous approach: copy and measure the full thread every turn
+        [message_tokens(m) for m in history]
+        best_full = min(best_full, time.perf_counter() - start)
+    return best_window * 1e6, best_full * 1e6
+
+
+def run(short: int = 20, long: int = 2_000, max_tokens: int = 2_000, repeat: int = 20) -> dict:
+    """Per-turn assembly cost for a short and a long call."""
+    short_us, short_full_us = _turn_us(short, max_tokens, repeat)
+    long_us, long_full_us = _turn_us(long, max_tokens, repeat)
+    return {
+        "max_tokens": max_tokens,
+        "short_turns": short,
+        "long_turns": long,
+        "window_turn_us": {"short": round(short_us, 1), "long": round(long_us, 1)},
+        "full_history_turn_us": {"short": round(short_full_us, 1), "long": round(long_full_us, 1)},
+        "flat": long_us < short_us * 3 + 200,
+        "window_faster_on_long_call": long_us < long_full_us,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--short", type=int, default=20, help="turns in the short call")
+    parser.add_argument("--long", type=int, default=2_000, help="turns in the long call")
+    parser.add_argument("--max-tokens", type=int, default=2_000, help="window token budget")
+    parser.add_argument("--repeat", type=int, default=20, help="timed turns per call")
+    args = parser.parse_args()
+    result = run(short=args.short, long=args.long, max_tokens=args.max_tokens, repeat=args.repeat)
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+UI Envelope Coalescing Benchmark
+================================
+
+Replays partial/final transcript streams for many concurrent sessions through
+``send_user_partial_transcript`` / ``send_user_transcript`` against a
+recording connection manager, once with coalescing disabled and once with a
+frame window, and reports:
+
+- submitted:  partial and final transcripts handed to the helpers
+- sends:      envelopes delivered to local session connections
+- publishes:  envelopes published to the distributed (Redis) session bus
+- finals:     final transcripts delivered (must be identical)
+- order_violations: envelopes delivered after one submitted later
+- final_delay_ms_max: extra delay added to finals by flushing pending partials
+
+Streams are either loaded from a JSONL recording (one object per line with
+``session``, ``t_ms``, ``kind`` = partial|final and ``text``, e.g. captured
+from the "Partial speech" / "Speech" handler logs) or synthesized with a
+partial per recognized word.
+
+Usage:
+    python tests/load/envelope_coalescing_benchmark.py --sessions 50
+    python tests/load/envelope_coalescing_benchmark.py --recording partials.jsonl --frame-ms 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+from types import SimpleNamespace
+
+ROOT = Path(__file__).resolve().parents[2]
+# Running as a script puts tests/load first, where ``utils`` would shadow the backend's
+_HERE = Path(__file__).resolve().parent
+sys.path[:] = [p for p in sys.path if Path(p or ".").resolve() != _HERE]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+UTTERANCES = [
+    "i would like to check the balance on my checking account please",
+    "can you tell me whether my claim for the rear bumper has been approved",
+    "yes that is correct my date of birth is march fourth nineteen eighty",
+    "i think there is a charge on my card that i did not make",
+    "please transfer me to someone who can help with my policy renewal",
+]
+
+Stream = list[tuple[float, str, str]]
+
+
+def synthetic_streams(
+    sessions: int = 50,
+    utterances: int = 3,
+    *,
+    word_ms: tuple[float, float] = (60.0, 160.0),
+    revision_rate: float = 0.3,
+    silence_ms: float = 600.0,
+    pause_ms: float = 1500.0,
+    seed: int = 0,
+) -> dict[str, Stream]:
+    """Partial per recognized word (plus occasional revisions), then the final."""
+    rng = random.Random(seed)
+    streams: dict[str, Stream] = {}
+    for index in range(sessions):
+        events: Stream = []
+        t_ms = rng.uniform(0, 500)
+        for _ in range(utterances):
+            words = rng.choice(UTTERANCES).split()
+            for count in range(1, len(words) + 1):
+                t_ms += rng.uniform(*word_ms)
+                events.append((t_ms, "partial", " ".join(words[:count])))
+                if rng.random() < revision_rate:
+                    t_ms += rng.uniform(10, 40)
+                    events.append((t_ms, "partial", " ".join(words[:count])))
+            t_ms += silence_ms
+            events.append((t_ms, "final", " ".join(words).capitalize() + "."))
+            t_ms += pause_ms
+        streams[f"session-{index}"] = events
+    return streams
+
+
+def load_recording(path: Path) -> dict[str, Stream]:
+    """Read a JSONL recording into per-session streams."""
+    streams: dict[str, Stream] = defaultdict(list)
+    for line in path.read_text().splitlines():
+        if line.strip():
+            row = json.loads(line)
+            streams[row["session"]].append((float(row["t_ms"]), row["kind"], row["text"]))
+    return {session: sorted(events) for session, events in streams.items()}
+
+
+class _RecordingManager:
+    def __init__(self) -> None:
+        self.sends = 0
+        self.publishes = 0
+        self.delivered: dict[str, list[tuple[int, str, float]]] = defaultdict(list)
+
+    async def broadcast_session(self, session_id: str, envelope: dict) -> int:
+        self.sends += 1
+        data = envelope["payload"].get("data") or envelope["payload"]
+        seq = data.get("speaker_id") or data.get("turn_id")
+        kind = "partial" if envelope["sender"] == "STT" else "final"
+        self.delivered[session_id].append((int(seq), kind, time.perf_counter()))
+        return 1
+
+    async def publish_session_envelope(self, session_id: str, envelope: dict, **_: object) -> None:
+        self.publishes += 1
+
+
+async def _replay_session(ws, session_id: str, events: Stream, speed: float, submitted: dict):
+    from apps.artagent.backend.src.ws_helpers.shared_ws import (
+        send_user_partial_transcript,
+        send_user_transcript,
+    )
+
+    start = time.perf_counter()
+    for seq, (t_ms, kind, text) in enumerate(events):
+        delay = start + t_ms / 1000.0 / speed - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        submitted[(session_id, seq)] = time.perf_counter()
+        if kind == "partial":
+            await send_user_partial_transcript(ws, text, speaker_id=str(seq), session_id=session_id)
+        else:
+            await send_user_transcript(
+                ws, text, session_id=session_id, broadcast_only=True, turn_id=str(seq)
+            )
+
+
+async def _replay(streams: dict[str, Stream], frame_ms: float, speed: float) -> dict:
+    from apps.artagent.backend.src.ws_helpers import shared_ws
+    from apps.artagent.backend.src.ws_helpers.coalescer import EnvelopeCoalescer
+
+    manager = _RecordingManager()
+    labels = ["user_transcript_partial"]
+    previous = shared_ws._envelope_coalescer
+    shared_ws._envelope_coalescer = EnvelopeCoalescer(int(frame_ms / speed), labels)
+    submitted: dict[tuple[str, int], float] = {}
+    try:
+        tasks = []
+        for session_id, events in streams.items():
+            state = SimpleNamespace(conn_manager=manager)
+            ws = SimpleNamespace(
+                app=SimpleNamespace(state=state),
+                state=SimpleNamespace(session_id=session_id, conn_id=None),
+            )
+            tasks.append(_replay_session(ws, session_id, events, speed, submitted))
+        await asyncio.gather(*tasks)
+        await asyncio.sleep(2 * frame_ms / 1000.0 / speed + 0.05)
+    finally:
+        shared_ws._envelope_coalescer = previous
+
+    violations = 0
+    finals = 0
+    final_delays: list[float] = []
+    for session_id, delivered in manager.delivered.items():
+        highest = -1
+        for seq, kind, at in delivered:
+            if seq < highest:
+                violations += 1
+            highest = max(highest, seq)
+            if kind == "final":
+                finals += 1
+                final_delays.append((at - submitted[(session_id, seq)]) * 1000.0 * speed)
+    return {
+        "submitted": sum(len(events) for events in streams.values()),
+        "sends": manager.sends,
+        "publishes": manager.publishes,
+        "finals": finals,
+        "order_violations": violations,
+        "final_delay_ms_max": round(max(final_delays, default=0.0), 1),
+    }
+
+
+def replay(streams: dict[str, Stream], *, frame_ms: float, speed: float = 8.0) -> dict:
+    """Replay ``streams`` (time-compressed by ``speed``) and summarise deliveries."""
+    return asyncio.run(_replay(streams, frame_ms, speed))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sessions", type=int, default=50)
+    parser.add_argument("--utterances", type=int, default=3)
+    parser.add_argument("--frame-ms", type=float, default=150.0)
+    parser.add_argument("--speed", type=float, default=4.0, help="Replay time compression")
+    parser.add_argument("--recording", type=Path, help="JSONL partial/final recording")
+    args = parser.parse_args()
+
+    if args.recording:
+        streams = load_recording(args.recording)
+    else:
+        streams = synthetic_streams(args.sessions, args.utterances)
+    for label, frame_ms in (("baseline", 0.0), ("coalesced", args.frame_ms)):
+        result = replay(streams, frame_ms=frame_ms, speed=args.speed)
+        print(
+            f"{label:<10} submitted={result['submitted']:<6} sends={result['sends']:<6} "
+            f"publishes={result['publishes']:<6} finals={result['finals']:<4} "
+            f"order_violations={result['order_violations']} "
+            f"final_delay_max={result['final_delay_ms_max']}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Evaluation Sweep Concurrency Benchmark
+======================================
+
+Runs a model comparison sweep through ``ComparisonRunner`` with a fake
+orchestrator whose turns take a fixed time (standing in for LLM and tool
+latency), once serially (``max_concurrency=1``) and once with every variant
+in flight, and reports wall-clock seconds and the speedup.
+
+It also runs ``EvaluationScheduler`` over independent scenarios at a global
+concurrency cap and reports the elapsed time in conversation lengths. With
+``--scenarios 8 --cap 4`` that should be about two waves.
+
+Usage:
+    python tests/load/evaluation_scheduler_benchmark.py
+    python tests/load/evaluation_scheduler_benchmark.py --variants 8 --turns 5 --turn-ms 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import yaml
+
+ROOT = Path(__file__).resolve().parents[2]
+# Running as a script puts tests/load first, where ``utils`` would shadow the backend's
+_HERE = Path(__file__).resolve().parent
+sys.path[:] = [p for p in sys.path if Path(p or ".").resolve() != _HERE]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from apps.artagent.backend.evaluation import (  # noqa: E402
+    ComparisonRunner,
+    EvaluationScheduler,
+    ScenarioRunner,
+)
+
+
+class _FixedLatencyOrchestrator:
+    """One tool call and a fixed delay per turn."""
+
+    def __init__(self, agent_name: str, model_override: dict | None, turn_s: float):
+        deployment = (model_override or {}).get("deployment_id", "unknown")
+        self._active_agent = agent_name
+        self.agents = {agent_name: SimpleNamespace(model=SimpleNamespace(deployment_id=deployment))}
+        self.deployment = deployment
+        self.turn_s = turn_s
+
+    async def process_turn(self, context, on_tts_chunk=None, on_tool_start=None, on_tool_end=None):
+        await on_tool_start("lookup_account", {"turn": context.turn_id})
+        await asyncio.sleep(self.turn_s)
+        await on_tool_end("lookup_account", {"balance": 1200, "turn": context.turn_id})
+        return SimpleNamespace(response_text=f"{self.deployment} {context.turn_id}", error=None)
+
+
+def _turns(prefix: str, turns: int) -> list[dict]:
+    return [
+        {"turn_id": f"turn_{i}", "user_input": f"{prefix} question {i}"}
+        for i in range(1, turns + 1)
+    ]
+
+
+async def _comparison_s(workdir: Path, variants: int, turns: int, turn_s: float, cap) -> float:
+    name = "serial" if cap == 1 else "parallel"
+    path = workdir / f"{name}.yaml"
+    path.write_text(
+        yaml.dump(
+            {
+                "comparison_name": "sweep",
+                "variants": [
+                    {
+                        "variant_id": f"model-{i}",
+                        "agent": "FraudAgent",
+                        "model_override": {"deployment_id": f"model-{i}"},
+                    }
+                    for i in range(variants)
+                ],
+                "turns": _turns("sweep", turns),
+            }
+        )
+    )
+    runner = ComparisonRunner(
+        path,
+        output_dir=workdir / name,
+        orchestrator_factory=lambda agent, override: _FixedLatencyOrchestrator(
+            agent, override, turn_s
+        ),
+        max_concurrency=cap,
+    )
+    start = time.perf_counter()
+    await runner.run()
+    return time.perf_counter() - start
+
+
+async def _scheduler_s(workdir: Path, scenarios: int, cap: int, turns: int, turn_s: float) -> float:
+    runners = {}
+    for i in range(scenarios):
+        name = f"scenario_{i}"
+        path = workdir / f"{name}.yaml"
+        path.write_text(
+            yaml.dump(
+                {
+                    "scenario_name": name,
+                    "agent": "FraudAgent",
+                    "model_override": {"deployment_id": f"model-{i}"},
+                    "metadata": {"session_id": name},
+                    "turns": _turns(name, turns),
+                }
+            )
+        )
+        runners[name] = ScenarioRunner(
+            path,
+            output_dir=workdir / "runs",
+            orchestrator_factory=lambda agent, override: _FixedLatencyOrchestrator(
+                agent, override, turn_s
+            ),
+            run_id=name,
+        )
+    start = time.perf_counter()
+    await EvaluationScheduler(max_concurrency=cap).run(runners)
+    return time.perf_counter() - start
+
+
+async def _measure(variants: int, scenarios: int, cap: int, turns: int, turn_s: float) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        serial_s = await _comparison_s(workdir, variants, turns, turn_s, 1)
+        parallel_s = await _comparison_s(workdir, variants, turns, turn_s, None)
+        scheduled_s = await _scheduler_s(workdir, scenarios, cap, turns, turn_s)
+    conversation_s = turns * turn_s
+    return {
+        "variants": variants,
+        "turns": turns,
+        "turn_ms": round(turn_s * 1000, 1),
+        "comparison_serial_s": round(serial_s, 3),
+        "comparison_parallel_s": round(parallel_s, 3),
+        "speedup": round(serial_s / parallel_s, 2),
+        "scheduler": {
+            "scenarios": scenarios,
+            "cap": cap,
+            "elapsed_s": round(scheduled_s, 3),
+            "conversations": round(scheduled_s / conversation_s, 2),
+            "expected_waves": -(-scenarios // cap),
+        },
+    }
+
+
+def run(
+    variants: int = 4, scenarios: int = 8, cap: int = 4, turns: int = 3, turn_ms: float = 50.0
+) -> dict:
+    """Serial vs concurrent comparison sweep, and a capped scheduler run."""
+    return asyncio.run(_measure(variants, scenarios, cap, turns, turn_ms / 1000))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--variants", type=int, default=4, help="comparison variants")
+    parser.add_argument("--scenarios", type=int, default=8, help="scheduler scenarios")
+    parser.add_argument("--cap", type=int, default=4, help="scheduler max_concurrency")
+    parser.add_argument("--turns", type=int, default=3, help="turns per conversation")
+    parser.add_argument("--turn-ms", type=float, default=50.0, help="fake latency per turn")
+    args = parser.parse_args()
+    result = run(
+        variants=args.variants,
+        scenarios=args.scenarios,
+        cap=args.cap,
+        turns=args.turns,
+        turn_ms=args.turn_ms,
+    )
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Expiry Wheel Benchmark
+======================
+
+Replays a steady-state registry of ``--entries`` sessions with an idle TTL
+through both expiry strategies on a simulated clock:
+
+- scan: the previous approach (``cleanup_stale_sessions``, the pool's
+  ``_cleanup_stale_sessions``): a last-activity timestamp per entry and a
+  periodic pass over every entry, every ``--scan-interval`` seconds
+- wheel: ``ExpiryWheel`` entries touched on activity, advanced once per
+  second by its driver
+
+Half of the entries are abandoned (never touched again); the other half see
+activity about once a minute. Both strategies see the same activity and must
+expire the same entries. Each cleanup pass (or wheel advance) is timed with
+``perf_counter``, since it runs on the event loop and blocks it.
+
+Reports the longest and mean loop-blocking time per pass, the total expiry
+time per simulated minute, how late entries were expired on average, and the
+per-activity bookkeeping cost.
+
+Usage:
+    python tests/load/expiry_wheel_benchmark.py
+    python tests/load/expiry_wheel_benchmark.py --entries 100000 --minutes 30
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+# Running as a script puts tests/load first, where ``utils`` would shadow the backend's
+_HERE = Path(__file__).resolve().parent
+sys.path[:] = [p for p in sys.path if Path(p or ".").resolve() != _HERE]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.pools.expiry_wheel import ExpiryWheel  # noqa: E402
+
+TTL_S = 1800
+ACTIVITY_S = 60
+
+
+class _Clock:
+    now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def workload(entries: int, minutes: float, seed: int = 7) -> tuple[dict, list[list[str]]]:
+    """
+    Initial idle seconds per key and, for each simulated second, the keys that see activity.
+    """
+    rng = random.Random(seed)
+    seconds = int(minutes * 60)
+    idle = {f"session-{i}": rng.randrange(TTL_S) for i in range(entries)}
+    activity: list[list[str]] = [[] for _ in range(seconds + 1)]
+    for i, key in enumerate(idle):
+        if i % 2:
+            continue  # abandoned
+        at = rng.randrange(1, ACTIVITY_S)
+        while at <= seconds:
+            activity[at].append(key)
+            at += rng.randrange(ACTIVITY_S // 2, ACTIVITY_S * 3 // 2)
+    return idle, activity
+
+
+def _scan(idle: dict, activity: list[list[str]], scan_interval_s: int) -> dict:
+    last_activity = {key: -age for key, age in idle.items()}
+    blocks: list[float] = []
+    lag = 0.0
+    expired = 0
+    touch_s = 0.0
+    for now in range(1, len(activity)):
+        start = time.perf_counter()
+        for key in activity[now]:
+            # Expired entries are only gone once a pass has run
+            last = last_activity.get(key)
+            if last is not None and now - last < TTL_S:
+                last_activity[key] = now
+        touch_s += time.perf_counter() - start
+
+        if now % scan_interval_s:
+            continue
+        start = time.perf_counter()
+        stale = [key for key, last in last_activity.items() if now - last >= TTL_S]
+        for key in stale:
+            lag += now - (last_activity.pop(key) + TTL_S)
+        blocks.append(time.perf_counter() - start)
+        expired += len(stale)
+    return _row(blocks, expired, lag, touch_s, activity, len(last_activity))
+
+
+def _wheel(idle: dict, activity: list[list[str]]) -> dict:
+    clock = _Clock()
+    wheel = ExpiryWheel(tick_s=1.0, clock=clock, autostart=False)
+    deadlines = {}
+    for key, age in idle.items():
+        wheel.schedule(key, TTL_S - age)
+        deadlines[key] = TTL_S - age
+    blocks: list[float] = []
+    lag = 0.0
+    expired = 0
+    touch_s = 0.0
+    for now in range(1, len(activity)):
+        clock.now = now
+        start = time.perf_counter()
+        gone = wheel.advance()
+        blocks.append(time.perf_counter() - start)
+        for key in gone:
+            lag += now - deadlines.pop(key)
+        expired += len(gone)
+
+        start = time.perf_counter()
+        for key in activity[now]:
+            if wheel.touch(key, TTL_S):
+                deadlines[key] = now + TTL_S
+        touch_s += time.perf_counter() - start
+    return _row(blocks, expired, lag, touch_s, activity, len(wheel))
+
+
+def _row(blocks, expired, lag, touch_s, activity, resident) -> dict:
+    minutes = (len(activity) - 1) / 60
+    touches = sum(len(keys) for keys in activity)
+    return {
+        "passes": len(blocks),
+        "max_block_ms": round(max(blocks) * 1000, 3),
+        "mean_block_ms": round(sum(blocks) / len(blocks) * 1000, 3),
+        "expiry_ms_per_min": round(sum(blocks) * 1000 / minutes, 2),
+        "expired": expired,
+        "mean_expiry_lag_s": round(lag / expired, 2) if expired else 0.0,
+        "touch_us": round(touch_s / touches * 1e6, 3) if touches else 0.0,
+        "resident_after": resident,
+    }
+
+
+def run(
+    entries: int = 50_000, minutes: float = 10.0, scan_interval_s: int = 60, repeat: int = 3
+) -> dict:
+    """Loop-blocking time of periodic full scans against the expiry wheel (best of ``repeat``)."""
+    idle, activity = workload(entries, minutes)
+    report: dict = {
+        "entries": entries,
+        "minutes": minutes,
+        "ttl_s": TTL_S,
+        "scan_interval_s": scan_interval_s,
+    }
+    for name, measure in (
+        ("scan", lambda: _scan(idle, activity, scan_interval_s)),
+        ("wheel", lambda: _wheel(idle, activity)),
+    ):
+        runs = [measure() for _ in range(repeat)]
+        report[name] = min(runs, key=lambda row: row["max_block_ms"])
+    report["max_block_reduction_pct"] = round(
+        100 * (1 - report["wheel"]["max_block_ms"] / report["scan"]["max_block_ms"]), 1
+    )
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--entries", type=int, default=50_000)
+    parser.add_argument("--minutes", type=float, default=10.0, help="simulated minutes")
+    parser.add_argument("--scan-interval", type=int, default=60, help="seconds between scans")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    report = run(
+        entries=args.entries,
+        minutes=args.minutes,
+        scan_interval_s=args.scan_interval,
+        repeat=args.repeat,
+    )
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
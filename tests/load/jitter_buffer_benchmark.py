@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+ACS Inbound Jitter Buffer Benchmark
+===================================
+
+Replays the cached caller utterances in ``tests/load/audio_cache`` as a
+stream of 20 ms ACS frames over a simulated network with jitter, stalls
+(bursty delivery), loss and reordering, in virtual time. The same arrival
+schedule is fed two ways:
+
+- direct: every frame written to the recognizer on arrival (no buffer)
+- buffered: through ``InboundJitterBuffer`` keyed on the ACS timestamps
+
+and reports, per path:
+
+- gap_std_ms / gap_max_ms: spread and worst case of the time between
+  recognizer writes (starvation shows up as large gaps)
+- burst_max_ms: most audio written within any single 20 ms window
+- misordered: frames written after a frame captured later
+- added_latency_p50/p95/max_ms: buffered only, write time minus arrival
+- the buffer's own counters (late, concealed, collapsed, underruns, ...)
+
+Usage:
+    python tests/load/jitter_buffer_benchmark.py
+    python tests/load/jitter_buffer_benchmark.py --stall-rate 0.03 --loss 0.02 --reorder 0.05
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[2]
+# Running as a script puts tests/load first, where ``utils`` would shadow the backend's
+_HERE = Path(__file__).resolve().parent
+sys.path[:] = [p for p in sys.path if Path(p or ".").resolve() != _HERE]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from apps.artagent.backend.voice.speech_cascade.jitter_buffer import (  # noqa: E402
+    DEFAULT_MAX_DEPTH_MS,
+    DEFAULT_MIN_DEPTH_MS,
+    InboundJitterBuffer,
+)
+
+AUDIO_CACHE = _HERE / "audio_cache"
+FRAME_MS = 20
+FRAME_BYTES = 640  # 20 ms @ 16 kHz PCM16 mono
+SILENCE_DBFS = -50.0
+# Capture timestamps start here (epoch ms), like ACS wall-clock timestamps
+EPOCH_MS = 1_792_324_800_000.0
+
+
+def load_frames() -> list[tuple[bytes, bool]]:
+    """Cached utterances as consecutive ``(pcm, silent)`` ACS frames."""
+    frames: list[tuple[bytes, bool]] = []
+    for line in (AUDIO_CACHE / "manifest.jsonl").read_text().splitlines():
+        if not line.strip():
+            continue
+        entry = json.loads(line)
+        pcm = (AUDIO_CACHE / entry["filename"]).read_bytes()
+        for offset in range(0, len(pcm) - FRAME_BYTES + 1, FRAME_BYTES):
+            chunk = pcm[offset : offset + FRAME_BYTES]
+            samples = np.frombuffer(chunk, dtype="<i2").astype(np.float64)
+            level = 10 * np.log10(np.mean(samples**2) / 32768.0**2 + 1e-12)
+            # ACS sends zeroed payloads flagged silent when the caller is quiet
+            silent = level < SILENCE_DBFS
+            frames.append((bytes(FRAME_BYTES) if silent else chunk, silent))
+    return frames
+
+
+def network_schedule(
+    count: int,
+    rng: np.random.Generator,
+    *,
+    base_ms: float = 40.0,
+    jitter_ms: float = 6.0,
+    stall_rate: float = 0.02,
+    stall_ms: tuple[float, float] = (60.0, 160.0),
+    loss: float = 0.01,
+    reorder: float = 0.03,
+) -> list[tuple[float, int]]:
+    """
+    Arrival ``(time_ms, frame_index)`` pairs sorted by arrival.
+
+    Frames leave every 20 ms and take ``base_ms`` plus exponential jitter.
+    A stall holds every frame sent during it until it ends, so they arrive
+    as one burst. Reordered frames are delayed past their successor; lost
+    frames never arrive.
+    """
+    arrivals: list[tuple[float, int]] = []
+    stall_until = -1.0
+    for index in range(count):
+        sent = index * FRAME_MS
+        if sent >= stall_until and rng.random() < stall_rate:
+            stall_until = sent + rng.uniform(*stall_ms)
+        if rng.random() < loss:
+            continue
+        arrival = sent + base_ms + rng.exponential(jitter_ms)
+        if sent < stall_until:
+            arrival = max(arrival, stall_until + base_ms + rng.uniform(0.0, 2.0))
+        if rng.random() < reorder:
+            arrival += FRAME_MS + rng.uniform(1.0, 10.0)
+        arrivals.append((arrival, index))
+    arrivals.sort()
+    return arrivals
+
+
+def _timing(writes: list[tuple[float, int]]) -> dict:
+    """Write-gap spread and burst size for ``(time_ms, audio_ms)`` writes."""
+    times = [t for t, _ in writes]
+    gaps = [b - a for a, b in zip(times, times[1:], strict=False)] or [0.0]
+    bursts: dict[int, int] = {}
+    for t, audio_ms in writes:
+        bursts[int(t // FRAME_MS)] = bursts.get(int(t // FRAME_MS), 0) + audio_ms
+    return {
+        "writes": len(writes),
+        "gap_std_ms": round(statistics.pstdev(gaps), 2),
+        "gap_max_ms": round(max(gaps), 1),
+        "burst_max_ms": max(bursts.values(), default=0),
+    }
+
+
+def _misordered(indices: list[int]) -> int:
+    latest = -1
+    count = 0
+    for index in indices:
+        if index < latest:
+            count += 1
+        latest = max(latest, index)
+    return count
+
+
+def replay_direct(frames: list[tuple[bytes, bool]], arrivals: list[tuple[float, int]]) -> dict:
+    """Every frame written on arrival (the unbuffered recognizer feed)."""
+    return {
+        **_timing([(t, FRAME_MS) for t, _ in arrivals]),
+        "misordered": _misordered([index for _, index in arrivals]),
+    }
+
+
+def replay_buffered(
+    frames: list[tuple[bytes, bool]],
+    arrivals: list[tuple[float, int]],
+    *,
+    min_depth_ms: int = DEFAULT_MIN_DEPTH_MS,
+    max_depth_ms: int = DEFAULT_MAX_DEPTH_MS,
+) -> dict:
+    """Frames pushed into the jitter buffer, released by a virtual 20 ms pacer."""
+    now = [0.0]
+    writes: list[tuple[float, int]] = []
+    released: list[tuple[float, int]] = []
+    by_id = {id(pcm): index for index, (pcm, _) in enumerate(frames)}
+
+    def sink(pcm: bytes) -> None:
+        writes.append((now[0], len(pcm) // FRAME_BYTES * FRAME_MS))
+        index = by_id.get(id(pcm))
+        if index is not None:
+            released.append((now[0], index))
+
+    buffer = InboundJitterBuffer(
+        sink,
+        min_depth_ms=min_depth_ms,
+        max_depth_ms=max_depth_ms,
+        clock=lambda: now[0] / 1000.0,
+        paced=False,
+    )
+    arrived_at = {index: t for t, index in arrivals}
+    next_tick = arrivals[0][0] if arrivals else 0.0
+    for t, index in arrivals:
+        while next_tick <= t:
+            now[0] = next_tick
+            buffer.tick()
+            next_tick += buffer.release_ms
+        now[0] = t
+        pcm, silent = frames[index]
+        buffer.push(EPOCH_MS + index * FRAME_MS, pcm, silent)
+    while buffer.depth:
+        now[0] = next_tick
+        if not buffer.tick():
+            buffer.flush()
+        next_tick += buffer.release_ms
+
+    added = sorted(t - arrived_at[index] for t, index in released if not frames[index][1])
+    added = added or [0.0]
+    return {
+        **_timing(writes),
+        "misordered": _misordered([index for _, index in released]),
+        "added_latency_p50_ms": round(added[len(added) // 2], 1),
+        "added_latency_p95_ms": round(added[min(len(added) - 1, int(len(added) * 0.95))], 1),
+        "added_latency_max_ms": round(added[-1], 1),
+        **{
+            key: value
+            for key, value in buffer.stats.to_dict().items()
+            if key not in ("depth_ms", "releases")
+        },
+    }
+
+
+def run(
+    *,
+    seed: int = 0,
+    repeat: int = 3,
+    jitter_ms: float = 6.0,
+    stall_rate: float = 0.02,
+    loss: float = 0.01,
+    reorder: float = 0.03,
+    min_depth_ms: int = DEFAULT_MIN_DEPTH_MS,
+    max_depth_ms: int = DEFAULT_MAX_DEPTH_MS,
+) -> dict:
+    """Replay the cached audio ``repeat`` times over one simulated network."""
+    rng = np.random.default_rng(seed)
+    frames = load_frames() * repeat
+    # Fresh objects per frame so released audio maps back to its capture slot
+    frames = [(bytes(bytearray(pcm)), silent) for pcm, silent in frames]
+    arrivals = network_schedule(
+        len(frames),
+        rng,
+        jitter_ms=jitter_ms,
+        stall_rate=stall_rate,
+        loss=loss,
+        reorder=reorder,
+    )
+    return {
+        "frames": len(frames),
+        "audio_s": round(len(frames) * FRAME_MS / 1000, 1),
+        "lost": len(frames) - len(arrivals),
+        "direct": replay_direct(frames, arrivals),
+        "buffered": replay_buffered(
+            frames, arrivals, min_depth_ms=min_depth_ms, max_depth_ms=max_depth_ms
+        ),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--jitter-ms", type=float, default=6.0)
+    parser.add_argument("--stall-rate", type=float, default=0.02)
+    parser.add_argument("--loss", type=float, default=0.01)
+    parser.add_argument("--reorder", type=float, default=0.03)
+    parser.add_argument("--min-depth-ms", type=int, default=DEFAULT_MIN_DEPTH_MS)
+    parser.add_argument("--max-depth-ms", type=int, default=DEFAULT_MAX_DEPTH_MS)
+    args = parser.parse_args()
+    print(
+        json.dumps(
+            run(
+                seed=args.seed,
+                repeat=args.repeat,
+                jitter_ms=args.jitter_ms,
+                stall_rate=args.stall_rate,
+                loss=args.loss,
+                reorder=args.reorder,
+                min_depth_ms=args.min_depth_ms,
+                max_depth_ms=args.max_depth_ms,
+            ),
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+JSON Codec Benchmark
+====================
+
+Times the JSON hot paths with the stdlib defaults they used before
+(``json.dumps`` / ``json.loads``, str in and out) against ``utils.json_codec``
+on each available backend:
+
+- acs_frame_decode: parse an ACS ``AudioData`` frame (the decoder's fallback
+  path, and the whole message for the VoiceLive / browser handlers)
+- envelope_encode: one WebSocket frame per envelope type (send_json and
+  session broadcasts)
+- bus_publish: the distributed envelope published to Redis, as bytes
+  (legacy: ``json.dumps`` then UTF-8 encode by the Redis client)
+- bus_listen: the same payload decoded from the bytes Redis delivers
+- session_persist / session_load: core memory and chat history of a session
+  hash (``MemoManager`` persist and ``from_redis``)
+
+Reports microseconds per operation and the saving relative to the legacy
+path, and checks that every path decodes to the same values.
+
+Usage:
+    python tests/load/json_codec_benchmark.py
+    python tests/load/json_codec_benchmark.py --repeat 7 --turns 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import json
+import sys
+import timeit
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+# Running as a script puts tests/load first, where ``utils`` would shadow the backend's
+_HERE = Path(__file__).resolve().parent
+sys.path[:] = [p for p in sys.path if Path(p or ".").resolve() != _HERE]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from apps.artagent.backend.src.ws_helpers.envelopes import (  # noqa: E402
+    make_assistant_envelope,
+    make_assistant_streaming_envelope,
+    make_envelope,
+    make_error_envelope,
+    make_event_envelope,
+    make_status_envelope,
+)
+from utils import json_codec  # noqa: E402
+
+SESSION = "5f0c1d2e"
+CALL = "call-8a1b2c3d"
+
+
+def sample_envelopes() -> dict[str, dict]:
+    """One envelope of every type the backend sends to the UI."""
+    ids = {"session_id": SESSION, "call_id": CALL}
+    return {
+        "status": make_status_envelope("Call connected", label="acs", **ids),
+        "assistant": make_assistant_envelope("Your claim is waiting on an adjuster.", **ids),
+        "assistant_streaming": make_assistant_streaming_envelope("Your claim is", **ids),
+        "event": make_event_envelope(
+            "agent_change",
+            {"agent": "Concierge", "previous": "AuthAgent", "voice": "en-US-Ava:DragonHD"},
+            **ids,
+        ),
+        "error": make_error_envelope("Speech recognizer failed", "stt_error", **ids),
+        "exit": make_envelope(
+            etype="exit",
+            sender="System",
+            payload={"message": "Call ended", "reason": "hangup"},
+            topic="session",
+            **ids,
+        ),
+        "debug": make_envelope(
+            etype="debug",
+            sender="System",
+            payload={"latency_ms": {"stt": 182.5, "llm_ttfb": 412.0, "tts_ttfb": 95.25}},
+            topic="dashboard",
+            **ids,
+        ),
+    }
+
+
+def sample_acs_frame() -> str:
+    return json.dumps(
+        {
+            "kind": "AudioData",
+            "audioData": {
+                "timestamp": "2026-10-19T12:00:00.020Z",
+                "participantRawID": "8:acs:caller",
+                "data": base64.b64encode(bytes(range(256)) * 2 + bytes(128)).decode(),
+                "silent": False,
+            },
+        }
+    )
+
+
+def sample_session(turns: int) -> tuple[dict, dict]:
+    """Core memory and chat history of a session after ``turns`` turns."""
+    core = {
+        "created_at": 1792400000.0,
+        "session_info": {"created_at": 1792400000.0, "last_activity": 1792400100.0},
+        "active_agent": "Concierge",
+        "caller_name": "José Álvarez",
+        "slots": {"policy": "427", "claim": "CLM-1", "verified": True},
+        "latency": {"stt": [0.18] * 20, "llm": [0.41] * 20, "tts": [0.09] * 20},
+    }
+    thread = [{"role": "system", "content": "You are a helpful insurance concierge."}]
+    for turn in range(turns):
+        thread.append({"role": "user", "content": f"Can you check claim {turn}, por favor?"})
+        thread.append({"role": "assistant", "content": "Sure — it is waiting on an adjuster."})
+    return core, {"Concierge": thread}
+
+
+def _per_op_us(fn, repeat: int, number: int | None) -> float:
+    timer = timeit.Timer(fn)
+    if number is None:
+        number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e6
+
+
+def _paths(turns: int) -> dict[str, tuple]:
+    """``name -> (legacy, codec)`` callables for each hot path."""
+    frame = sample_acs_frame()
+    envelopes = list(sample_envelopes().values())
+    wrapper = {
+        "session_id": SESSION,
+        "envelope": envelopes[3],
+        "origin": "node-1",
+        "event": "agent_change",
+        "published_at": 1792400000.0,
+    }
+    wire = json.dumps(wrapper).encode("utf-8")
+    core, threads = sample_session(turns)
+    stored = {
+        "corememory": json.dumps(core, ensure_ascii=False),
+        "chat_history": json.dumps(threads),
+    }
+    return {
+        "acs_frame_decode": (
+            lambda: json.loads(frame),
+            lambda: json_codec.loads(frame),
+        ),
+        "envelope_encode": (
+            lambda: [json.dumps(envelope) for envelope in envelopes],
+            lambda: [json_codec.dumps(envelope) for envelope in envelopes],
+        ),
+        "bus_publish": (
+            lambda: json.dumps(wrapper).encode("utf-8"),
+            lambda: json_codec.dumpb(wrapper),
+        ),
+        "bus_listen": (
+            lambda: json.loads(wire),
+            lambda: json_codec.loads(wire),
+        ),
+        "session_persist": (
+            lambda: (json.dumps(core, ensure_ascii=False), json.dumps(threads)),
+            lambda: (json_codec.dumps(core), json_codec.dumps(threads)),
+        ),
+        "session_load": (
+            lambda: (json.loads(stored["corememory"]), json.loads(stored["chat_history"])),
+            lambda: (
+                json_codec.loads(stored["corememory"]),
+                json_codec.loads(stored["chat_history"]),
+            ),
+        ),
+    }
+
+
+def _decoded(value):
+    """Values an encoded result stands for (decoded results are returned as-is)."""
+    if isinstance(value, (str, bytes)):
+        return json.loads(value)
+    if isinstance(value, (list, tuple)):
+        return [_decoded(item) for item in value]
+    return value
+
+
+def available_backends() -> list[str]:
+    backends = ["json"]
+    if json_codec.orjson is not None:
+        backends.append("orjson")
+    return backends
+
+
+def run(repeat: int = 5, turns: int = 50, number: int | None = None) -> dict:
+    """
+    Per-path timings for the legacy path and each codec backend.
+
+    ``number`` fixes the calls per timing run (default: calibrated by timeit).
+    """
+    previous = json_codec.BACKEND
+    paths = _paths(turns)
+    report: dict = {"backends": available_backends(), "default_backend": previous, "paths": {}}
+    try:
+        for name, (legacy, codec) in paths.items():
+            expected = _decoded(legacy())
+            row = {"legacy_us": round(_per_op_us(legacy, repeat, number), 2)}
+            for backend in report["backends"]:
+                json_codec.use_backend(backend)
+                row[f"{backend}_us"] = round(_per_op_us(codec, repeat, number), 2)
+                row[f"{backend}_equivalent"] = _decoded(codec()) == expected
+                row[f"{backend}_saving_pct"] = round(
+                    100 * (1 - row[f"{backend}_us"] / row["legacy_us"]), 1
+                )
+            report["paths"][name] = row
+    finally:
+        json_codec.use_backend(previous)
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--turns", type=int, default=50, help="chat turns in the session state")
+    args = parser.parse_args()
+    print(json.dumps(run(repeat=args.repeat, turns=args.turns), indent=2))
+
+
+if __name__ == "__main__":
+    main()
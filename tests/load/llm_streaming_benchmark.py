@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+LLM Streaming Client Benchmark
+==============================
+
+Compares the two ways the cascade has consumed streamed chat completions,
+against a local fake Azure OpenAI endpoint that streams SSE tokens with a
+fixed server-side time-to-first-token:
+
+- threaded: sync ``AzureOpenAI`` client iterated on a worker thread, tokens
+  hopped back to the loop with ``call_soon_threadsafe`` (previous design)
+- async:    shared ``AsyncAzureOpenAI`` client on a pooled keep-alive
+  connection, tokens consumed natively on the event loop
+
+For each mode it reports client-observed TTFT minus the server's TTFT
+(overhead added by the client path) and the peak number of threads.
+
+Usage:
+    python tests/load/llm_streaming_benchmark.py --turns 200
+    python tests/load/llm_streaming_benchmark.py --turns 200 --ttft-ms 300 --tokens 40
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+from aiohttp import web
+
+ROOT = Path(__file__).resolve().parents[2]
+# Running as a script puts tests/load first, where ``utils`` would shadow the backend's
+_HERE = Path(__file__).resolve().parent
+sys.path[:] = [p for p in sys.path if Path(p or ".").resolve() != _HERE]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+API_VERSION = "2024-10-21"
+DEPLOYMENT = "gpt-4o"
+
+
+@dataclass
+class StreamTiming:
+    """Server-side pacing of the fake stream."""
+
+    ttft_ms: float = 100.0
+    tokens: int = 30
+    token_interval_ms: float = 10.0
+
+
+class FakeStreamingServer:
+    """Local HTTP server streaming chat completion chunks (SSE) on its own thread."""
+
+    def __init__(self, timing: StreamTiming | None = None) -> None:
+        self.timing = timing or StreamTiming()
+        self.port = 0
+        self.requests = 0
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._runner: web.AppRunner | None = None
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="fake-aoai", daemon=True)
+
+    @property
+    def endpoint(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def _chunk(self, delta: dict, finish: str | None = None) -> bytes:
+        body = {
+            "id": "chatcmpl-bench",
+            "object": "chat.completion.chunk",
+            "created": int(time.time()),
+            "model": DEPLOYMENT,
+            "choices": [{"index": 0, "delta": delta, "finish_reason": finish}],
+        }
+        return f"data: {json.dumps(body)}\n\n".encode()
+
+    async def _completions(self, request: web.Request) -> web.StreamResponse:
+        self.requests += 1
+        await request.read()
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await response.prepare(request)
+        await asyncio.sleep(self.timing.ttft_ms / 1000.0)
+        await response.write(self._chunk({"role": "assistant", "content": ""}))
+        for index in range(self.timing.tokens):
+            if index:
+                await asyncio.sleep(self.timing.token_interval_ms / 1000.0)
+            await response.write(self._chunk({"content": f"tok{index} "}))
+        await response.write(self._chunk({}, "stop"))
+        await response.write(b"data: [DONE]\n\n")
+        await response.write_eof()
+        return response
+
+    def _run(self) -> None:
+        self._loop = asyncio.new_event_loop()
+        app = web.Application()
+        app.router.add_post("/openai/deployments/{deployment}/chat/completions", self._completions)
+        self._runner = web.AppRunner(app, access_log=None)
+        self._loop.run_until_complete(self._runner.setup())
+        site = web.TCPSite(self._runner, "127.0.0.1", 0, backlog=1024)
+        self._loop.run_until_complete(site.start())
+        self.port = site._server.sockets[0].getsockname()[1]
+        self._ready.set()
+        self._loop.run_forever()
+        self._loop.run_until_complete(self._runner.cleanup())
+        self._loop.close()
+
+    def __enter__(self) -> FakeStreamingServer:
+        self._thread.start()
+        self._ready.wait(10)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(10)
+
+
+def _request() -> dict:
+    return {
+        "model": DEPLOYMENT,
+        "messages": [{"role": "user", "content": "hello"}],
+        "stream": True,
+    }
+
+
+async def _sample_threads(peak: list[int], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        peak[0] = max(peak[0], threading.active_count())
+        await asyncio.sleep(0.005)
+
+
+async def _threaded_turn(client, ttfts: list[float]) -> None:
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue[float | None] = asyncio.Queue()
+    start = time.perf_counter()
+
+    def consume() -> None:
+        try:
+            for chunk in client.chat.completions.create(**_request()):
+                if chunk.choices and chunk.choices[0].delta.content:
+                    loop.call_soon_threadsafe(queue.put_nowait, time.perf_counter())
+        finally:
+            loop.call_soon_threadsafe(queue.put_nowait, None)
+
+    future = loop.run_in_executor(None, consume)
+    first = await queue.get()
+    while await queue.get() is not None:
+        pass
+    await future
+    if first is not None:
+        ttfts.append(first - start)
+
+
+async def _async_turn(client, ttfts: list[float]) -> None:
+    start = time.perf_counter()
+    first = None
+    stream = await client.chat.completions.create(**_request())
+    async for chunk in stream:
+        if first is None and chunk.choices and chunk.choices[0].delta.content:
+            first = time.perf_counter()
+    if first is not None:
+        ttfts.append(first - start)
+
+
+async def _run_turns(mode: str, endpoint: str, turns: int) -> dict:
+    if mode == "threaded":
+        from openai import AzureOpenAI
+
+        client = AzureOpenAI(
+            azure_endpoint=endpoint, api_key="bench", api_version=API_VERSION, max_retries=0
+        )
+        turn = _threaded_turn
+    else:
+        from src.aoai.client import create_async_azure_openai_client
+
+        client = create_async_azure_openai_client(
+            azure_endpoint=endpoint, azure_api_key="bench", api_version=API_VERSION
+        )
+        client = client.with_options(max_retries=0)
+        turn = _async_turn
+
+    baseline = threading.active_count()
+    peak = [baseline]
+    stop = asyncio.Event()
+    sampler = asyncio.create_task(_sample_threads(peak, stop))
+    ttfts: list[float] = []
+    start = time.perf_counter()
+    await asyncio.gather(*(turn(client, ttfts) for _ in range(turns)))
+    wall = time.perf_counter() - start
+    stop.set()
+    await sampler
+    client.close() if mode == "threaded" else await client.close()
+    return {"ttfts": ttfts, "baseline_threads": baseline, "peak_threads": peak[0], "wall": wall}
+
+
+def run_mode(mode: str, server: FakeStreamingServer, turns: int) -> dict:
+    """Run ``turns`` concurrent streamed completions and summarise them."""
+    raw = asyncio.run(_run_turns(mode, server.endpoint, turns))
+    overhead_ms = (np.array(raw["ttfts"]) * 1000.0) - server.timing.ttft_ms
+    return {
+        "mode": mode,
+        "turns": len(raw["ttfts"]),
+        "ttft_overhead_p50_ms": round(float(np.percentile(overhead_ms, 50)), 1),
+        "ttft_overhead_p95_ms": round(float(np.percentile(overhead_ms, 95)), 1),
+        "added_threads": raw["peak_threads"] - raw["baseline_threads"],
+        "wall_s": round(raw["wall"], 2),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--turns", type=int, default=200)
+    parser.add_argument("--ttft-ms", type=float, default=100.0)
+    parser.add_argument("--tokens", type=int, default=30)
+    parser.add_argument("--token-ms", type=float, default=10.0)
+    parser.add_argument("--modes", nargs="+", default=["threaded", "async"])
+    args = parser.parse_args()
+
+    timing = StreamTiming(args.ttft_ms, args.tokens, args.token_ms)
+    with FakeStreamingServer(timing) as server:
+        for mode in args.modes:
+            result = run_mode(mode, server, args.turns)
+            print(
+                f"{mode:<9} turns={result['turns']:<4} "
+                f"ttft_overhead p50={result['ttft_overhead_p50_ms']:>8.1f}ms "
+                f"p95={result['ttft_overhead_p95_ms']:>8.1f}ms "
+                f"added_threads={result['added_threads']:<3} wall={result['wall_s']}s"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,557 @@
+#!/usr/bin/env python3
+"""
+Offline End-to-End Harness
+==========================
+
+Boots the real FastAPI backend in-process with offline stand-ins for Azure
+Speech (STT/TTS), Azure OpenAI (streaming, configurable token timing) and
+Redis (fakeredis), then drives concurrent ACS media WebSocket calls using the
+cached caller audio in ``tests/load/audio_cache``.
+
+Everything between the WebSocket and the service SDK boundaries is the
+production code path: media endpoint, ACS inbound decoding, speech cascade
+threads, orchestrator, LLM stream parsing, TTS playback and outbound framing.
+
+Reported per run:
+    - Per-stage latency percentiles for every caller turn
+      (stt_finalize, dispatch_to_llm, llm_ttft, llm_stream, llm_to_tts,
+      tts_synthesis, tts_to_wire, e2e)
+    - Event-loop lag percentiles on the server loop
+    - Process CPU time per call (client thread excluded)
+
+Usage:
+    python tests/load/offline_harness.py --calls 20 --concurrency 10
+    python tests/load/offline_harness.py --calls 4 --llm-ttft-ms 600 --output results.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import base64
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[2]
+BACKEND = ROOT / "apps" / "artagent" / "backend"
+AUDIO_CACHE = Path(__file__).resolve().parent / "audio_cache"
+
+SAMPLE_RATE = 16000
+FRAME_MS = 20
+FRAME_BYTES = SAMPLE_RATE * 2 * FRAME_MS // 1000
+
+OFFLINE_ENV = {
+    "DISABLE_CLOUD_TELEMETRY": "true",
+    "AZURE_OPENAI_ENDPOINT": "https://offline.openai.azure.com",
+    "AZURE_OPENAI_KEY": "offline",
+    "AZURE_OPENAI_API_KEY": "offline",
+    "AZURE_SPEECH_KEY": "offline",
+    "AZURE_SPEECH_REGION": "eastus",
+    "REDIS_HOST": "offline-redis",
+    "REDIS_ACCESS_KEY": "offline",
+    "REDIS_PORT": "6379",
+}
+
+# (name, start mark, end mark) computed per turn from StageRecorder marks
+STAGES = (
+    ("stt_finalize", "speech_end", "stt_final"),
+    ("dispatch_to_llm", "stt_final", "llm_request"),
+    ("llm_ttft", "llm_request", "llm_first_token"),
+    ("llm_stream", "llm_first_token", "llm_done"),
+    ("llm_to_tts", "llm_first_token", "tts_request"),
+    ("tts_synthesis", "tts_request", "tts_done"),
+    ("tts_to_wire", "tts_done", "first_audio"),
+    ("e2e", "speech_end", "first_audio"),
+)
+
+
+def percentiles(values: list[float]) -> dict[str, float]:
+    """Summary statistics used throughout the report (milliseconds)."""
+    if not values:
+        return {"count": 0}
+    arr = np.asarray(values, dtype=np.float64)
+    return {
+        "count": int(arr.size),
+        "mean": round(float(arr.mean()), 2),
+        "p50": round(float(np.percentile(arr, 50)), 2),
+        "p90": round(float(np.percentile(arr, 90)), 2),
+        "p95": round(float(np.percentile(arr, 95)), 2),
+        "p99": round(float(np.percentile(arr, 99)), 2),
+        "max": round(float(arr.max()), 2),
+    }
+
+
+def stage_latencies(marks: dict[str, dict[str, float]]) -> dict[str, list[float]]:
+    """Per-stage durations in ms across all turns that reached both marks."""
+    result: dict[str, list[float]] = {name: [] for name, _, _ in STAGES}
+    for turn in marks.values():
+        for name, start, end in STAGES:
+            if start in turn and end in turn:
+                result[name].append((turn[end] - turn[start]) * 1000.0)
+    return result
+
+
+# ---------------------------------------------------------------------------
+# Scripts
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class Utterance:
+    text: str
+    pcm: bytes
+
+
+def load_scenarios(cache_dir: Path = AUDIO_CACHE) -> dict[str, list[Utterance]]:
+    """Load cached caller turns grouped by scenario, in turn order."""
+    manifest = cache_dir / "manifest.jsonl"
+    if not manifest.exists():
+        raise FileNotFoundError(
+            f"{manifest} not found; generate audio with tests/load/utils/audio_generator.py"
+        )
+    entries: dict[str, list[tuple[int, Utterance]]] = {}
+    for line in manifest.read_text().splitlines():
+        if not line.strip():
+            continue
+        entry = json.loads(line)
+        path = cache_dir / entry["filename"]
+        if not path.exists():
+            continue
+        utterance = Utterance(text=entry["text"], pcm=path.read_bytes())
+        entries.setdefault(entry["scenario"], []).append((entry["turn_index"], utterance))
+    return {
+        name: [u for _, u in sorted(turns, key=lambda t: t[0])] for name, turns in entries.items()
+    }
+
+
+# ---------------------------------------------------------------------------
+# Event loop monitoring
+# ---------------------------------------------------------------------------
+
+
+class LoopLagMonitor:
+    """Measures how late a periodic timer wakes up on the server loop."""
+
+    def __init__(self, interval_ms: float = 10.0) -> None:
+        self.interval = interval_ms / 1000.0
+        self.samples: list[float] = []
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(0.0, (time.perf_counter() - started - self.interval) * 1000))
+
+    def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+
+
+# ---------------------------------------------------------------------------
+# Server
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class OfflineStack:
+    """Handles to the fakes shared by the server and the report."""
+
+    recorder: Any
+    scripts: Any
+    scheduler: Any
+    transport: Any
+
+
+def install_offline_services(args: argparse.Namespace) -> tuple[Any, OfflineStack]:
+    """Import the backend with every external service replaced by a fake."""
+    for key, value in OFFLINE_ENV.items():
+        os.environ.setdefault(key, value)
+    # Running as a script puts tests/load first, where ``utils`` would shadow the backend's
+    here = Path(__file__).resolve().parent
+    sys.path[:] = [p for p in sys.path if Path(p or ".").resolve() != here]
+    for path in (str(ROOT), str(BACKEND)):
+        if path not in sys.path:
+            sys.path.insert(0, path)
+
+    import fakeredis
+
+    from tests.load.utils import offline_services as fakes
+
+    recorder = fakes.StageRecorder()
+    scripts = fakes.CallScripts()
+    scheduler = fakes.CallbackScheduler()
+    transport = fakes.FakeOpenAITransport(
+        recorder,
+        fakes.LLMTiming(
+            ttft_ms=args.llm_ttft_ms,
+            token_interval_ms=args.llm_token_ms,
+            reply_sentences=args.reply_sentences,
+        ),
+    )
+    stt_timing = fakes.STTTiming(
+        end_silence_ms=args.stt_end_silence_ms, final_delay_ms=args.stt_final_delay_ms
+    )
+    tts_timing = fakes.TTSTiming(
+        base_latency_ms=args.tts_base_ms, latency_ms_per_char=args.tts_ms_per_char
+    )
+
+    import main as backend_main
+    import src.aoai.client as aoai_client
+    from apps.artagent.backend.src import services
+
+    fake_client = fakes.create_fake_openai_client(transport, OFFLINE_ENV["AZURE_OPENAI_ENDPOINT"])
+    aoai_client._client_instance = fake_client
+    aoai_client.client = fake_client
+    # The cascade streams through the async client; build it on the server's loop
+    aoai_client.create_async_azure_openai_client = lambda **_: (
+        fakes.create_fake_async_openai_client(transport, OFFLINE_ENV["AZURE_OPENAI_ENDPOINT"])
+    )
+
+    services.AzureRedisManager = fakes.create_offline_redis_manager_class(fakeredis.FakeServer())
+    services.CosmosDBMongoCoreManager = fakes.OfflineCosmosManager
+    services.SpeechSynthesizer = lambda *a, **kw: fakes.FakeSpeechSynthesizer(recorder, tts_timing)
+    services.StreamingSpeechRecognizerFromBytes = lambda *a, **kw: fakes.FakeSpeechRecognizer(
+        recorder, scripts, scheduler, stt_timing
+    )
+
+    stack = OfflineStack(
+        recorder=recorder, scripts=scripts, scheduler=scheduler, transport=transport
+    )
+    return backend_main.app, stack
+
+
+class ServerThread(threading.Thread):
+    """Runs uvicorn on an ephemeral port with a loop-lag monitor."""
+
+    def __init__(self, app: Any, log_level: str) -> None:
+        super().__init__(name="offline-server", daemon=True)
+        import uvicorn
+
+        self.config = uvicorn.Config(
+            app, host="127.0.0.1", port=0, log_level=log_level, ws="websockets", lifespan="on"
+        )
+        self.server = uvicorn.Server(self.config)
+        self.monitor = LoopLagMonitor()
+        self.port: int | None = None
+        self.ready = threading.Event()
+
+    def run(self) -> None:
+        asyncio.run(self._serve())
+
+    async def _serve(self) -> None:
+        serve = asyncio.create_task(self.server.serve())
+        while not self.server.started:
+            if serve.done():
+                self.ready.set()
+                await serve
+                return
+            await asyncio.sleep(0.05)
+        self.port = self.server.servers[0].sockets[0].getsockname()[1]
+        self.monitor.start()
+        self.ready.set()
+        await serve
+        self.monitor.stop()
+
+    def stop(self) -> None:
+        self.server.should_exit = True
+        self.join(timeout=15)
+
+
+# ---------------------------------------------------------------------------
+# Client
+# ---------------------------------------------------------------------------
+
+
+def _audio_frame(pcm: bytes) -> str:
+    return json.dumps(
+        {
+            "kind": "AudioData",
+            "audioData": {
+                "timestamp": None,
+                "participantRawID": "8:acs:offline-caller",
+                "data": base64.b64encode(pcm).decode("ascii"),
+                "silent": not any(pcm),
+            },
+        }
+    )
+
+
+@dataclass
+class CallResult:
+    call_id: str
+    turns_sent: int = 0
+    turns_answered: int = 0
+    outbound_frames: int = 0
+    errors: list[str] = field(default_factory=list)
+
+
+class OfflineCaller:
+    """One simulated ACS call: streams turns and timestamps the first reply audio."""
+
+    def __init__(
+        self,
+        port: int,
+        call_id: str,
+        turns: list[Utterance],
+        stack: OfflineStack,
+        speedup: float,
+        response_timeout: float,
+    ) -> None:
+        self.url = f"ws://127.0.0.1:{port}/api/v1/media/stream?call_connection_id={call_id}"
+        self.call_id = call_id
+        self.turns = turns
+        self.stack = stack
+        self.pace = FRAME_MS / 1000.0 / max(speedup, 0.01)
+        self.response_timeout = response_timeout
+        self.result = CallResult(call_id)
+        self._last_audio_at = 0.0
+        self._awaiting_tag: str | None = None
+        self._answered = asyncio.Event()
+
+    async def _stream(self, ws: Any, pcm: bytes) -> None:
+        next_at = time.perf_counter()
+        for offset in range(0, len(pcm), FRAME_BYTES):
+            frame = pcm[offset : offset + FRAME_BYTES].ljust(FRAME_BYTES, b"\x00")
+            await ws.send(_audio_frame(frame))
+            next_at += self.pace
+            delay = next_at - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+    async def _receive(self, ws: Any) -> None:
+        async for raw in ws:
+            if not isinstance(raw, str) or '"AudioData"' not in raw:
+                continue
+            now = time.perf_counter()
+            self.result.outbound_frames += 1
+            self._last_audio_at = now
+            tag = self._awaiting_tag
+            if tag and self.stack.recorder.marks.get(tag, {}).get("tts_done"):
+                self.stack.recorder.mark(tag, "first_audio", now)
+                self._awaiting_tag = None
+                self._answered.set()
+
+    async def _wait_quiet(self, quiet_s: float, limit_s: float) -> None:
+        deadline = time.perf_counter() + limit_s
+        while time.perf_counter() < deadline:
+            if time.perf_counter() - self._last_audio_at >= quiet_s:
+                return
+            await asyncio.sleep(0.05)
+
+    def _tag_for_turn(self, index: int) -> str | None:
+        tags = self.stack.recorder.call_tags.get(self.call_id, [])
+        return tags[index] if index < len(tags) else None
+
+    async def run(self) -> CallResult:
+        import websockets
+
+        self.stack.scripts.set(self.call_id, [turn.text for turn in self.turns])
+        silence = bytes(FRAME_BYTES * 40)  # 800 ms of trailing silence per turn
+        try:
+            async with websockets.connect(self.url, max_size=None, open_timeout=15) as ws:
+                metadata = {
+                    "kind": "AudioMetadata",
+                    "audioMetadata": {"encoding": "PCM", "sampleRate": SAMPLE_RATE, "channels": 1},
+                }
+                await ws.send(json.dumps(metadata))
+                receiver = asyncio.create_task(self._receive(ws))
+                # Let the greeting play out before the caller speaks
+                await asyncio.sleep(0.3)
+                await self._wait_quiet(0.5, 10.0)
+
+                for index, turn in enumerate(self.turns):
+                    self._answered.clear()
+                    self.result.turns_sent += 1
+                    await self._stream(ws, turn.pcm + silence)
+                    tag = self._tag_for_turn(index)
+                    if tag is None:
+                        self.result.errors.append(f"turn {index}: no utterance detected")
+                        continue
+                    self._awaiting_tag = tag
+                    if self.stack.recorder.marks.get(tag, {}).get("first_audio"):
+                        self._answered.set()
+                    try:
+                        await asyncio.wait_for(self._answered.wait(), self.response_timeout)
+                        self.result.turns_answered += 1
+                    except asyncio.TimeoutError:
+                        self.result.errors.append(f"turn {index}: no response audio")
+                        self._awaiting_tag = None
+                    await self._wait_quiet(0.4, self.response_timeout)
+
+                receiver.cancel()
+                await ws.close()
+        except Exception as exc:  # noqa: BLE001 - reported per call
+            self.result.errors.append(f"{type(exc).__name__}: {exc}")
+        return self.result
+
+
+async def run_calls(
+    port: int,
+    stack: OfflineStack,
+    scenarios: dict[str, list[Utterance]],
+    args: argparse.Namespace,
+) -> list[CallResult]:
+    names = sorted(scenarios) if args.scenario == "all" else [args.scenario]
+    limit = asyncio.Semaphore(args.concurrency)
+
+    async def one(index: int) -> CallResult:
+        async with limit:
+            turns = scenarios[names[index % len(names)]][: args.max_turns or None]
+            caller = OfflineCaller(
+                port,
+                f"offline-{index:04d}",
+                turns,
+                stack,
+                args.speedup,
+                args.response_timeout,
+            )
+            return await caller.run()
+
+    return await asyncio.gather(*(one(i) for i in range(args.calls)))
+
+
+# ---------------------------------------------------------------------------
+# Entry point
+# ---------------------------------------------------------------------------
+
+
+def build_report(
+    stack: OfflineStack,
+    results: list[CallResult],
+    loop_lag: list[float],
+    server_cpu_s: float,
+    wall_s: float,
+    args: argparse.Namespace,
+) -> dict[str, Any]:
+    latencies = stage_latencies(stack.recorder.marks)
+    calls = len(results) or 1
+    return {
+        "config": {
+            "calls": args.calls,
+            "concurrency": args.concurrency,
+            "speedup": args.speedup,
+            "llm_ttft_ms": args.llm_ttft_ms,
+            "llm_token_ms": args.llm_token_ms,
+            "tts_base_ms": args.tts_base_ms,
+            "stt_final_delay_ms": args.stt_final_delay_ms,
+        },
+        "wall_time_s": round(wall_s, 2),
+        "turns": {
+            "sent": sum(r.turns_sent for r in results),
+            "answered": sum(r.turns_answered for r in results),
+            "llm_requests": stack.transport.requests,
+        },
+        "stages_ms": {name: percentiles(values) for name, values in latencies.items()},
+        "event_loop_lag_ms": percentiles(loop_lag),
+        "cpu": {
+            "server_cpu_s": round(server_cpu_s, 3),
+            "cpu_ms_per_call": round(server_cpu_s * 1000.0 / calls, 1),
+            "cpu_utilization": round(server_cpu_s / wall_s, 3) if wall_s else 0.0,
+        },
+        "errors": [f"{r.call_id}: {e}" for r in results for e in r.errors],
+    }
+
+
+def print_report(report: dict[str, Any]) -> None:
+    turns = report["turns"]
+    print(f"\nOffline harness: {report['config']['calls']} calls in {report['wall_time_s']}s")
+    print(
+        f"Turns answered: {turns['answered']}/{turns['sent']} (LLM requests {turns['llm_requests']})"
+    )
+    print(f"\n{'stage':<18}{'n':>6}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}")
+    rows = list(report["stages_ms"].items()) + [("loop_lag", report["event_loop_lag_ms"])]
+    for name, stats in rows:
+        if not stats.get("count"):
+            print(f"{name:<18}{0:>6}")
+            continue
+        print(
+            f"{name:<18}{stats['count']:>6}{stats['p50']:>10.1f}{stats['p95']:>10.1f}"
+            f"{stats['p99']:>10.1f}{stats['max']:>10.1f}"
+        )
+    cpu = report["cpu"]
+    print(f"\nCPU: {cpu['cpu_ms_per_call']} ms/call, utilization {cpu['cpu_utilization']:.0%}")
+    for error in report["errors"][:10]:
+        print(f"  error: {error}")
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Offline end-to-end voice pipeline harness")
+    parser.add_argument("--calls", type=int, default=4, help="Total calls to run")
+    parser.add_argument("--concurrency", type=int, default=4, help="Concurrent calls")
+    parser.add_argument("--scenario", default="all", help="Scenario name or 'all'")
+    parser.add_argument("--max-turns", type=int, default=0, help="Turns per call (0 = all)")
+    parser.add_argument("--speedup", type=float, default=1.0, help="Audio send rate multiplier")
+    parser.add_argument("--response-timeout", type=float, default=15.0)
+    parser.add_argument("--llm-ttft-ms", type=float, default=250.0)
+    parser.add_argument("--llm-token-ms", type=float, default=15.0)
+    parser.add_argument("--reply-sentences", type=int, default=2)
+    parser.add_argument("--stt-end-silence-ms", type=int, default=500)
+    parser.add_argument("--stt-final-delay-ms", type=int, default=120)
+    parser.add_argument("--tts-base-ms", type=float, default=80.0)
+    parser.add_argument("--tts-ms-per-char", type=float, default=0.5)
+    parser.add_argument("--output", type=Path, help="Write the JSON report to this path")
+    parser.add_argument("--log-level", default="warning")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> dict[str, Any]:
+    args = parse_args(argv)
+    # Backend loggers pin themselves to INFO; disable everything below the requested level
+    logging.disable(getattr(logging, args.log_level.upper(), logging.WARNING) - 1)
+    scenarios = load_scenarios()
+    if args.scenario != "all" and args.scenario not in scenarios:
+        raise SystemExit(f"Unknown scenario {args.scenario!r}; available: {sorted(scenarios)}")
+
+    app, stack = install_offline_services(args)
+    server = ServerThread(app, args.log_level)
+    server.start()
+    if not server.ready.wait(60) or server.port is None:
+        raise SystemExit("Backend failed to start")
+
+    client_cpu: list[float] = []
+
+    def client_main() -> list[CallResult]:
+        try:
+            return asyncio.run(run_calls(server.port, stack, scenarios, args))
+        finally:
+            client_cpu.append(time.thread_time())
+
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    outcome: list[list[CallResult]] = []
+    client = threading.Thread(
+        target=lambda: outcome.append(client_main()), name="offline-client", daemon=True
+    )
+    client.start()
+    client.join()
+    wall_s = time.perf_counter() - wall_start
+    server_cpu_s = time.process_time() - cpu_start - sum(client_cpu)
+
+    server.stop()
+    stack.scheduler.stop()
+
+    report = build_report(
+        stack, outcome[0] if outcome else [], server.monitor.samples, server_cpu_s, wall_s, args
+    )
+    print_report(report)
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2))
+        print(f"\nReport written to {args.output}")
+    return report
+
+
+if __name__ == "__main__":
+    main()
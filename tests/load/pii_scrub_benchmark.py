@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+PII Scrub Benchmark
+===================
+
+Times ``PIIScrubber.scrub_string`` (lead-character and per-pattern prefilters)
+against the previous algorithm, every active pattern substituted over the full
+string, on a realistic mix of log and transcript lines where most lines carry
+no PII.
+
+Reports lines per second for both paths, the speedup, and whether every line
+scrubbed to the same output.
+
+Usage:
+    python tests/load/pii_scrub_benchmark.py
+    python tests/load/pii_scrub_benchmark.py --copies 200 --repeat 7
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import timeit
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+# Running as a script puts tests/load first, where ``utils`` would shadow the backend's
+_HERE = Path(__file__).resolve().parent
+sys.path[:] = [p for p in sys.path if Path(p or ".").resolve() != _HERE]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from utils.pii_filter import PIIScrubber, PIIScrubberConfig  # noqa: E402
+
+LOG_LINES = [
+    "Found %d results from local vector index",
+    "🔍 Searching knowledge base: '%s' in %s",
+    "Session session_4f36a724 started for call 9a1b2c3d-4e5f-6789-abcd-ef0123456789",
+    "TTS synthesis completed in 123.45ms (voice=en-US-JennyNeural)",
+    "[2026-10-18 21:44:19,313] INFO - websocket closed code=1000",
+    "Calling +1 (555) 123-4567 from +18165019907",
+    "Customer email is jane.doe@example.com, please confirm",
+    "SSN on file: 123-45-6789",
+    "Card ending 4111 1111 1111 1111 was declined",
+    "Peer 192.168.10.24 connected via 2001:0db8:85a3:0000:0000:8a2e:0370:7334",
+    "Agent handoff: Concierge -> FraudAgent",
+]
+
+TRANSCRIPT_LINES = [
+    "Hi, I'd like to check the status of my claim please.",
+    "Sure, my policy number is POL-2024-000123.",
+    "You can reach me at 555.867.5309 or at caller@contoso.org.",
+    "I think someone used my card for a purchase I didn't make.",
+    "Yes that's right, thank you so much for your help today.",
+]
+
+
+def reference_scrub(scrubber: PIIScrubber, value: str) -> str:
+    """Previous algorithm: apply every active pattern in order over the full string."""
+    if not scrubber.config.enabled or not value:
+        return value
+    result = value
+    for pattern, replacement in scrubber._active_patterns:
+        result = pattern.sub(replacement, result)
+    return result
+
+
+def corpus(scrubber: PIIScrubber, copies: int) -> list[str]:
+    """Realistic mix: clean lines outnumber lines with PII about nine to one."""
+    lines = LOG_LINES + TRANSCRIPT_LINES
+    clean = [line for line in lines if reference_scrub(scrubber, line) == line]
+    return (clean * 9 + lines) * copies
+
+
+def run(copies: int = 40, repeat: int = 5) -> dict:
+    """Lines per second of the prefiltered scrubber against the reference (best of ``repeat``)."""
+    scrubber = PIIScrubber(PIIScrubberConfig(scrub_ip_addresses=True))
+    lines = corpus(scrubber, copies)
+
+    def reference():
+        for line in lines:
+            reference_scrub(scrubber, line)
+
+    def prefiltered():
+        for line in lines:
+            scrubber.scrub_string(line)
+
+    reference_s = min(timeit.repeat(reference, repeat=repeat, number=1))
+    prefiltered_s = min(timeit.repeat(prefiltered, repeat=repeat, number=1))
+    return {
+        "lines": len(lines),
+        "reference_lines_per_s": round(len(lines) / reference_s),
+        "prefiltered_lines_per_s": round(len(lines) / prefiltered_s),
+        "speedup": round(reference_s / prefiltered_s, 2),
+        "equivalent": all(
+            scrubber.scrub_string(line) == reference_scrub(scrubber, line) for line in lines
+        ),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--copies", type=int, default=40, help="copies of the line mix")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    print(json.dumps(run(copies=args.copies, repeat=args.repeat), indent=2))
+
+
+if __name__ == "__main__":
+    main()
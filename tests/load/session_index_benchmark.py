@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Session Listing Benchmark
+=========================
+
+Compares GET /api/v1/sessions data access strategies on a Redis holding many
+sessions:
+
+- legacy: keyspace SCAN for ``session:session_*`` + HGETALL per session
+- index:  ZREVRANGEBYSCORE page from the activity index + pipelined HMGET
+
+Usage:
+    # Local Redis (docker run -p 6379:6379 redis:7)
+    python tests/load/session_index_benchmark.py --redis-url redis://localhost:6379/15
+
+    # In-process fakeredis (no server, smaller default)
+    python tests/load/session_index_benchmark.py --sessions 20000
+
+The target database is flushed before seeding; never point it at a shared Redis.
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.redis import session_index  # noqa: E402
+
+
+def _client(url: str | None):
+    if url:
+        import redis
+
+        return redis.Redis.from_url(url, decode_responses=True)
+    import fakeredis
+
+    return fakeredis.FakeRedis(decode_responses=True)
+
+
+def seed(client, count: int, batch: int = 5000) -> None:
+    corememory = json.dumps({"session_info": {"user_email": "caller@example.com"}})
+    history = json.dumps({"Concierge": [{"role": "user", "content": "hello"}] * 20})
+    now = time.time()
+    for offset in range(0, count, batch):
+        pipe = client.pipeline(transaction=False)
+        scores = {}
+        for i in range(offset, min(offset + batch, count)):
+            sid = f"session_{i:07d}"
+            ts = now - i
+            pipe.hset(
+                f"session:{sid}",
+                mapping={
+                    "corememory": corememory,
+                    "chat_history": history,
+                    "turn_count": 20,
+                    "last_activity": repr(ts),
+                },
+            )
+            scores[sid] = ts
+        pipe.zadd(session_index.ACTIVITY_KEY, scores)
+        pipe.execute()
+
+
+def legacy_page(client, limit: int) -> list[dict]:
+    keys = list(client.scan_iter(match="session:session_*", count=100))
+    return [client.hgetall(key) for key in keys[:limit]]
+
+
+def timed(fn, runs: int) -> dict[str, float]:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return {
+        "p50_ms": round(float(np.percentile(samples, 50)), 2),
+        "p99_ms": round(float(np.percentile(samples, 99)), 2),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--redis-url", help="Redis URL (default: in-process fakeredis)")
+    parser.add_argument("--sessions", type=int, help="Sessions to seed (100k with --redis-url)")
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+    count = args.sessions or (100_000 if args.redis_url else 20_000)
+
+    client = _client(args.redis_url)
+    client.flushdb()
+    start = time.perf_counter()
+    seed(client, count)
+    print(f"Seeded {count:,} sessions in {time.perf_counter() - start:.1f}s")
+
+    first = session_index.list_page(client, limit=args.limit)
+    deep_cursor = session_index.encode_cursor(
+        first.entries[-1].last_activity - count // 2, "session_9999999"
+    )
+    results = {
+        "index_first_page": timed(
+            lambda: session_index.list_page(client, limit=args.limit), args.runs
+        ),
+        "index_deep_page": timed(
+            lambda: session_index.list_page(client, limit=args.limit, cursor=deep_cursor),
+            args.runs,
+        ),
+        "legacy_scan": timed(lambda: legacy_page(client, args.limit), max(1, args.runs // 10)),
+    }
+    for name, stats in results.items():
+        print(f"{name:<18} p50={stats['p50_ms']:>9.2f}ms  p99={stats['p99_ms']:>9.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Telemetry Sampling Benchmark
+============================
+
+Replays one call minute of per-frame and per-event tracing through an
+OpenTelemetry SDK pipeline (``FilteringSpanProcessor`` in front of an
+in-memory exporter), with the sampler disabled (every record created, as
+before) and with the per-session ``AdaptiveSampler``:
+
+- stt_audio_chunks: ``StreamingSpeechRecognizerFromBytes.write_bytes`` span
+  events, one per 20 ms audio frame, on the recognizer session span
+- voicelive_events: ``VoiceLiveSDKHandler._event_loop`` span events and
+  ``_observe_event`` spans for a realtime event stream (audio and transcript
+  deltas while the agent speaks, turn and response lifecycle events)
+- per_message_handler: a high-frequency ``trace_acs_operation`` span per
+  message, as the ACS callbacks endpoint opens per webhook, driven at frame
+  rate as a worst case, with an occasional failing message
+
+Reports exported spans, span events and CPU milliseconds per call minute,
+the suppressed counts attached to parent spans, and whether every error span
+and turn-level span was kept. The sampler runs on simulated time so a
+minute of traffic replays in milliseconds with the production rate budget.
+
+Usage:
+    python tests/load/telemetry_sampling_benchmark.py
+    python tests/load/telemetry_sampling_benchmark.py --minutes 5 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+ROOT = Path(__file__).resolve().parents[2]
+# Running as a script puts tests/load first, where ``utils`` would shadow the backend's
+_HERE = Path(__file__).resolve().parent
+sys.path[:] = [p for p in sys.path if Path(p or ".").resolve() != _HERE]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from apps.artagent.backend.src.utils import tracing  # noqa: E402
+from apps.artagent.backend.voice.voicelive import handler as voicelive_handler  # noqa: E402
+from opentelemetry.sdk.trace import TracerProvider  # noqa: E402
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor  # noqa: E402
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (  # noqa: E402
+    InMemorySpanExporter,
+)
+from opentelemetry.trace import SpanKind, StatusCode  # noqa: E402
+from src.speech.speech_recognizer import StreamingSpeechRecognizerFromBytes  # noqa: E402
+from utils import telemetry_config  # noqa: E402
+from utils.telemetry_config import AdaptiveSampler, FilteringSpanProcessor  # noqa: E402
+
+SESSION = "5f0c1d2e"
+FRAME_S = 0.02
+FRAME = bytes(640)
+TURN_S = 6.0
+ERROR_EVERY = 500
+_quiet = logging.getLogger("telemetry_sampling_benchmark")
+_quiet.disabled = True
+
+# One agent turn of VoiceLive events: (offset seconds, type, repeats spread over 1.5 s)
+_TURN_EVENTS = (
+    (0.0, "input_audio_buffer.speech_started", 1),
+    (1.5, "input_audio_buffer.speech_stopped", 1),
+    (1.5, "input_audio_buffer.committed", 1),
+    (1.5, "conversation.item.created", 1),
+    (1.6, "conversation.item.input_audio_transcription.delta", 20),
+    (1.9, "conversation.item.input_audio_transcription.completed", 1),
+    (1.7, "response.created", 1),
+    (1.7, "response.output_item.added", 1),
+    (1.7, "response.content_part.added", 1),
+    (1.8, "response.audio.delta", 75),
+    (1.8, "response.audio_transcript.delta", 40),
+    (3.4, "response.audio_transcript.done", 1),
+    (3.4, "response.audio.done", 1),
+    (3.4, "response.content_part.done", 1),
+    (3.4, "response.output_item.done", 1),
+    (3.4, "response.done", 1),
+    (3.4, "rate_limits.updated", 1),
+)
+
+
+def voicelive_stream(minutes: float) -> list[tuple[float, str]]:
+    """``(time, event type)`` pairs for ``minutes`` of conversation."""
+    events = []
+    turn_start = 0.0
+    while turn_start < minutes * 60:
+        for offset, etype, repeats in _TURN_EVENTS:
+            for i in range(repeats):
+                events.append((turn_start + offset + 1.5 * i / repeats, etype))
+        turn_start += TURN_S
+    events.sort()
+    return events
+
+
+class _Clock:
+    now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _pipeline() -> tuple[TracerProvider, InMemorySpanExporter]:
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(
+        FilteringSpanProcessor(SimpleSpanProcessor(exporter), enable_pii_scrubbing=False)
+    )
+    return provider, exporter
+
+
+# ---------------------------------------------------------------------------
+# Workloads, through the production code
+# ---------------------------------------------------------------------------
+
+
+def _stt(tracer, frames: int, clock: _Clock) -> None:
+    recognizer = StreamingSpeechRecognizerFromBytes.__new__(StreamingSpeechRecognizerFromBytes)
+    recognizer.push_stream = SimpleNamespace(write=lambda chunk: None, close=lambda: None)
+    recognizer.enable_tracing = True
+    recognizer._sampling_key = f"stt:{id(recognizer):x}"
+    recognizer._session_span = tracer.start_span("speech_recognition_session", kind=SpanKind.CLIENT)
+    for i in range(frames):
+        clock.now = i * FRAME_S
+        recognizer.write_bytes(FRAME)
+    recognizer.close_stream()
+
+
+class _EventSource:
+    def __init__(self, stream, clock: _Clock):
+        self._stream = stream
+        self._clock = clock
+
+    async def __aiter__(self):
+        for at, etype in self._stream:
+            self._clock.now = at
+            yield SimpleNamespace(type=etype)
+
+
+class _VoiceLiveLoop:
+    """The handler's event loop and event observer, without a live connection."""
+
+    _NOISY_EVENT_TYPES = voicelive_handler.VoiceLiveSDKHandler._NOISY_EVENT_TYPES
+    _event_loop = voicelive_handler.VoiceLiveSDKHandler._event_loop
+    _observe_event = voicelive_handler.VoiceLiveSDKHandler._observe_event
+
+    def __init__(self, stream, clock: _Clock):
+        self._connection = _EventSource(stream, clock)
+        self._shutdown = asyncio.Event()
+        self._orchestrator = None
+        self.session_id = SESSION
+        self.call_connection_id = SESSION
+
+    async def _forward_event_to_acs(self, event) -> None:
+        return None
+
+
+def _voicelive(tracer, stream, clock: _Clock) -> None:
+    previous = voicelive_handler.tracer
+    voicelive_handler.tracer = tracer
+    try:
+        asyncio.run(_VoiceLiveLoop(stream, clock)._event_loop())
+    finally:
+        voicelive_handler.tracer = previous
+
+
+def _handler_messages(tracer, frames: int, clock: _Clock) -> None:
+    for i in range(frames):
+        clock.now = i * FRAME_S
+        try:
+            with tracing.trace_acs_operation(
+                tracer,
+                _quiet,
+                "media_message",
+                session_id=SESSION,
+                high_frequency=True,
+            ):
+                if i % ERROR_EVERY == ERROR_EVERY - 1:
+                    raise ValueError("malformed media message")
+        except ValueError:
+            pass
+
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+
+
+def _workloads(minutes: float) -> dict:
+    frames = int(minutes * 60 / FRAME_S)
+    stream = voicelive_stream(minutes)
+    return {
+        "stt_audio_chunks": lambda tracer, clock: _stt(tracer, frames, clock),
+        "voicelive_events": lambda tracer, clock: _voicelive(tracer, stream, clock),
+        "per_message_handler": lambda tracer, clock: _handler_messages(tracer, frames, clock),
+    }
+
+
+def _is_turn_level(span) -> bool:
+    return any(
+        token in span.name for token in ("response.done", "transcription.completed", "created")
+    )
+
+
+def _measure(workload, minutes: float, repeat: int, sampled: bool) -> dict:
+    cpu: list[float] = []
+    spans: list = []
+    for _ in range(repeat):
+        clock = _Clock()
+        previous = telemetry_config._span_sampler
+        telemetry_config._span_sampler = AdaptiveSampler(enabled=sampled, clock=clock)
+        provider, exporter = _pipeline()
+        try:
+            start = time.process_time()
+            workload(provider.get_tracer("telemetry_sampling_benchmark"), clock)
+            cpu.append(time.process_time() - start)
+        finally:
+            telemetry_config._span_sampler = previous
+        spans = exporter.get_finished_spans()
+    suppressed = {}
+    for span in spans:
+        for key, value in (span.attributes or {}).items():
+            if key.startswith("telemetry.suppressed."):
+                suppressed[key.removeprefix("telemetry.suppressed.")] = value
+    return {
+        "spans_per_min": round(len(spans) / minutes, 1),
+        # Events past the SDK's per-span limit are dropped after being built
+        "events_per_min": round(
+            sum(len(span.events) + span.dropped_events for span in spans) / minutes, 1
+        ),
+        "cpu_ms_per_min": round(min(cpu) * 1000 / minutes, 2),
+        "error_spans": sum(span.status.status_code is StatusCode.ERROR for span in spans),
+        "turn_level_spans": sum(_is_turn_level(span) for span in spans),
+        "suppressed": suppressed,
+        # Sampled-out operations represented by the kept span that followed them
+        "suppressed_on_kept_spans": sum(
+            (span.attributes or {}).get("telemetry.sampling.suppressed", 0) for span in spans
+        ),
+    }
+
+
+def run(minutes: float = 1.0, repeat: int = 3) -> dict:
+    """
+    Span, event and CPU cost per call minute with sampling off ("before",
+    ``TELEMETRY_SAMPLING_ENABLED=false``) and on ("after").
+    """
+    report: dict = {"minutes": minutes, "paths": {}}
+    for name, workload in _workloads(minutes).items():
+        before = _measure(workload, minutes, repeat, sampled=False)
+        after = _measure(workload, minutes, repeat, sampled=True)
+        report["paths"][name] = {
+            "before": before,
+            "after": after,
+            "span_reduction_pct": _reduction(before["spans_per_min"], after["spans_per_min"]),
+            "event_reduction_pct": _reduction(before["events_per_min"], after["events_per_min"]),
+            "cpu_reduction_pct": _reduction(before["cpu_ms_per_min"], after["cpu_ms_per_min"]),
+        }
+    return report
+
+
+def _reduction(before: float, after: float) -> float:
+    return round(100 * (1 - after / before), 1) if before else 0.0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--minutes", type=float, default=1.0, help="call minutes to replay")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    print(json.dumps(run(minutes=args.minutes, repeat=args.repeat), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Turn Profiler Overhead Benchmark
+================================
+
+Times ``TurnProfile.mark`` from the per-turn latency budget profiler on the
+voice hot path: a mark while a turn is open (lock, clock read and buffer
+append), a mark with no turn open (greetings and announcements, a single
+attribute check), and a complete cascade turn from ``begin`` to the closing
+``AUDIO_OUT`` mark, including the critical-path breakdown and aggregation.
+
+Reports microseconds per operation (best of ``repeat``) and whether marks
+stay within the budget the profiler was designed for: under 5 us while a
+turn is open and under 1 us otherwise.
+
+Usage:
+    python tests/load/turn_profiler_benchmark.py
+    python tests/load/turn_profiler_benchmark.py --iterations 500000 --repeat 7
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import timeit
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+# Running as a script puts tests/load first, where ``utils`` would shadow the backend's
+_HERE = Path(__file__).resolve().parent
+sys.path[:] = [p for p in sys.path if Path(p or ".").resolve() != _HERE]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from apps.artagent.backend.voice.shared.turn_profiler import (  # noqa: E402
+    LatencyBudgetProfiler,
+    TurnStage,
+)
+
+ACTIVE_MARK_BUDGET_US = 5.0
+IDLE_MARK_BUDGET_US = 1.0
+
+# Stages a cascade turn without tool calls passes through after STT_FINAL
+CASCADE_TURN = (
+    TurnStage.TURN_DEQUEUED,
+    TurnStage.LLM_REQUEST,
+    TurnStage.LLM_FIRST_TOKEN,
+    TurnStage.TTS_REQUEST,
+    TurnStage.TTS_START,
+    TurnStage.TTS_FIRST_AUDIO,
+    TurnStage.AUDIO_OUT,
+)
+
+
+def _per_call_us(fn, iterations: int, repeat: int) -> float:
+    return min(timeit.repeat(fn, repeat=repeat, number=1)) / iterations * 1e6
+
+
+def run(iterations: int = 100_000, repeat: int = 5) -> dict:
+    """Microseconds per mark and per complete turn (best of ``repeat``)."""
+    profiler = LatencyBudgetProfiler(budget_ms=float("inf"))
+    profile = profiler.session("bench")
+    stage = TurnStage.TTS_REQUEST
+
+    def active():
+        profile.begin()
+        for _ in range(iterations):
+            profile.mark(stage)
+        profile.abandon()
+
+    def idle():
+        for _ in range(iterations):
+            profile.mark(stage)
+
+    turns = max(1, iterations // 10)
+
+    def turn():
+        for _ in range(turns):
+            profile.begin()
+            for turn_stage in CASCADE_TURN:
+                profile.mark(turn_stage)
+
+    active_us = _per_call_us(active, iterations, repeat)
+    idle_us = _per_call_us(idle, iterations, repeat)
+    turn_us = _per_call_us(turn, turns, repeat)
+    return {
+        "iterations": iterations,
+        "active_mark_us": round(active_us, 3),
+        "idle_mark_us": round(idle_us, 3),
+        "cascade_turn_us": round(turn_us, 2),
+        "within_budget": active_us < ACTIVE_MARK_BUDGET_US and idle_us < IDLE_MARK_BUDGET_US,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--iterations", type=int, default=100_000, help="marks per timing")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    print(json.dumps(run(iterations=args.iterations, repeat=args.repeat), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,675 @@
+"""
+Offline Service Stand-ins
+=========================
+
+Deterministic, in-process replacements for the external services the voice
+pipeline talks to, used by ``tests/load/offline_harness.py``:
+
+- ``FakeSpeechRecognizer``: energy-based utterance detection over pushed PCM,
+  partial and final callbacks from a background "SDK" thread, transcripts
+  taken from a per-call script.
+- ``FakeSpeechSynthesizer``: fixed-latency synthesis returning a tone whose
+  length scales with the text.
+- ``FakeOpenAITransport``: httpx transport (sync and async) that serves Azure
+  OpenAI chat completions (streaming SSE and non-streaming) with configurable
+  token timing, so the real ``openai`` SDK parsing path is exercised.
+- ``OfflineRedisManager``: ``AzureRedisManager`` backed by fakeredis.
+- ``OfflineCosmosManager``: empty document store for startup hydration.
+
+Turn attribution: every detected utterance gets a tag (``utt0001``) that the
+recognizer appends to the final transcript. The fake LLM echoes the tag in
+its first sentence and the fake synthesizer reads it back, so the
+``StageRecorder`` can time each stage of each turn exactly, even though the
+stages run on different threads and event-loop tasks.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import json
+import re
+import threading
+import time
+import uuid
+from collections import defaultdict
+from collections.abc import AsyncIterator, Callable, Iterator
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+import numpy as np
+
+TAG_PATTERN = re.compile(r"\butt\d{4,}\b")
+
+# Ordered pipeline marks for one turn (all time.perf_counter() seconds)
+TURN_MARKS = (
+    "speech_end",  # Last voiced audio reached the recognizer
+    "stt_final",  # Final transcript callback fired
+    "llm_request",  # Chat completion request received by the fake endpoint
+    "llm_first_token",  # First content token written to the stream
+    "llm_done",  # Stream finished
+    "tts_request",  # Synthesis of the first tagged sentence started
+    "tts_done",  # Synthesis returned PCM
+    "first_audio",  # Client received the first outbound audio frame
+)
+
+
+def find_tag(text: str | None) -> str | None:
+    """Return the utterance tag embedded in ``text``, if any."""
+    if not text:
+        return None
+    match = TAG_PATTERN.search(text)
+    return match.group(0) if match else None
+
+
+# ---------------------------------------------------------------------------
+# Stage recording
+# ---------------------------------------------------------------------------
+
+
+class StageRecorder:
+    """Thread-safe per-turn timestamps keyed by utterance tag."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counter = itertools.count(1)
+        self.marks: dict[str, dict[str, float]] = {}
+        self.tag_call: dict[str, str] = {}
+        self.call_tags: dict[str, list[str]] = defaultdict(list)
+        self.samples: dict[str, list[float]] = defaultdict(list)
+
+    def new_tag(self, call_id: str) -> str:
+        """Allocate the next utterance tag for ``call_id``."""
+        with self._lock:
+            tag = f"utt{next(self._counter):04d}"
+            self.marks[tag] = {}
+            self.tag_call[tag] = call_id
+            self.call_tags[call_id].append(tag)
+        return tag
+
+    def mark(self, tag: str | None, stage: str, ts: float | None = None) -> None:
+        """Record the first occurrence of ``stage`` for ``tag``."""
+        if not tag:
+            return
+        ts = time.perf_counter() if ts is None else ts
+        with self._lock:
+            self.marks.setdefault(tag, {}).setdefault(stage, ts)
+
+    def sample(self, name: str, value_ms: float) -> None:
+        """Record an unattributed latency sample (e.g. greeting synthesis)."""
+        with self._lock:
+            self.samples[name].append(value_ms)
+
+
+# ---------------------------------------------------------------------------
+# SDK-style callback thread
+# ---------------------------------------------------------------------------
+
+
+class CallbackScheduler:
+    """Single background thread that runs delayed callbacks in due order."""
+
+    def __init__(self, name: str = "fake-speech-sdk") -> None:
+        self._heap: list[tuple[float, int, Callable[[], None]]] = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def call_later(self, delay_s: float, fn: Callable[[], None]) -> None:
+        with self._cond:
+            heapq.heappush(self._heap, (time.perf_counter() + delay_s, next(self._seq), fn))
+            self._cond.notify()
+
+    def stop(self) -> None:
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+        self._thread.join(timeout=2.0)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._stopped:
+                    if self._heap:
+                        wait = self._heap[0][0] - time.perf_counter()
+                        if wait <= 0:
+                            break
+                        self._cond.wait(wait)
+                    else:
+                        self._cond.wait()
+                if self._stopped:
+                    return
+                _, _, fn = heapq.heappop(self._heap)
+            try:
+                fn()
+            except Exception:  # noqa: BLE001 - a bad callback must not kill the thread
+                pass
+
+
+# ---------------------------------------------------------------------------
+# Speech-to-text
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class STTTiming:
+    """Recognizer behaviour knobs."""
+
+    end_silence_ms: int = 500
+    final_delay_ms: int = 120
+    partial_interval_ms: int = 300
+    voice_threshold: int = 400
+    sample_rate: int = 16000
+
+
+class CallScripts:
+    """Expected caller transcripts per call, in turn order."""
+
+    DEFAULT_TEXT = "I have a question about my account"
+
+    def __init__(self) -> None:
+        self._scripts: dict[str, list[str]] = {}
+        self._lock = threading.Lock()
+
+    def set(self, call_id: str, texts: list[str]) -> None:
+        with self._lock:
+            self._scripts[call_id] = list(texts)
+
+    def text_for(self, call_id: str | None, index: int) -> str:
+        with self._lock:
+            texts = self._scripts.get(call_id or "", [])
+        return texts[index] if index < len(texts) else self.DEFAULT_TEXT
+
+
+def _current_call_id() -> str | None:
+    try:
+        from utils.session_context import get_session_correlation
+    except ImportError:
+        return None
+    correlation = get_session_correlation()
+    return correlation.call_connection_id if correlation else None
+
+
+class FakeSpeechRecognizer:
+    """
+    Push-stream recognizer stand-in with the StreamingSpeechRecognizerFromBytes surface.
+
+    Utterances are detected from 10 ms block energy; a final result fires
+    ``final_delay_ms`` after ``end_silence_ms`` of trailing silence.
+    """
+
+    def __init__(
+        self,
+        recorder: StageRecorder,
+        scripts: CallScripts,
+        scheduler: CallbackScheduler,
+        timing: STTTiming | None = None,
+        **_: Any,
+    ) -> None:
+        self._recorder = recorder
+        self._scripts = scripts
+        self._scheduler = scheduler
+        self._timing = timing or STTTiming()
+        self._block = self._timing.sample_rate // 100
+        self.push_stream: object | None = None
+        self.call_connection_id: str | None = None
+        self.is_ready = True
+        self._partial_cb: Callable[..., None] | None = None
+        self._final_cb: Callable[..., None] | None = None
+        self._cancel_cb: Callable[..., None] | None = None
+        self._running = False
+        self._reset_utterances()
+
+    def _reset_utterances(self) -> None:
+        self._carry = b""
+        self._speaking = False
+        self._utterances = 0
+        self._tag: str | None = None
+        self._voiced_samples = 0
+        self._silence_samples = 0
+        self._since_partial = 0
+        self._last_voice_at = 0.0
+
+    # -- SDK surface ---------------------------------------------------------
+
+    def set_partial_result_callback(self, callback: Callable[..., None]) -> None:
+        self._partial_cb = callback
+
+    def set_final_result_callback(self, callback: Callable[..., None]) -> None:
+        self._final_cb = callback
+
+    def set_cancel_callback(self, callback: Callable[..., None]) -> None:
+        self._cancel_cb = callback
+
+    def create_push_stream(self) -> None:
+        self.push_stream = object()
+
+    prepare_stream = create_push_stream
+
+    def prepare_start(self) -> None:
+        if self.push_stream is None:
+            self.create_push_stream()
+
+    def start(self) -> None:
+        self.prepare_start()
+        self._running = True
+
+    def stop(self) -> None:
+        self._running = False
+
+    def close_stream(self) -> None:
+        self.push_stream = None
+
+    def warm_connection(self) -> bool:
+        return True
+
+    def set_call_connection_id(self, call_connection_id: str) -> None:
+        self.call_connection_id = call_connection_id
+
+    def clear_session_state(self) -> None:
+        self.call_connection_id = None
+        self.push_stream = None
+        self._running = False
+        self._reset_utterances()
+
+    def add_phrase(self, phrase: str) -> None:
+        pass
+
+    def add_phrases(self, phrases: Any) -> None:
+        pass
+
+    def clear_phrase_list(self) -> None:
+        pass
+
+    def set_phrase_list_weight(self, weight: float | None) -> None:
+        pass
+
+    # -- Audio ---------------------------------------------------------------
+
+    def write_bytes(self, audio_chunk: bytes) -> None:
+        if self.call_connection_id is None:
+            self.call_connection_id = _current_call_id()
+
+        data = self._carry + audio_chunk
+        usable = len(data) - (len(data) % (self._block * 2))
+        self._carry = data[usable:]
+        if not usable:
+            return
+
+        now = time.perf_counter()
+        samples = np.frombuffer(data[:usable], dtype="<i2").reshape(-1, self._block)
+        voiced = np.abs(samples).max(axis=1) > self._timing.voice_threshold
+        rate = self._timing.sample_rate
+
+        for is_voiced in voiced:
+            if is_voiced:
+                if not self._speaking:
+                    self._begin_utterance()
+                self._voiced_samples += self._block
+                self._since_partial += self._block
+                self._silence_samples = 0
+                self._last_voice_at = now
+                if self._since_partial * 1000 >= self._timing.partial_interval_ms * rate:
+                    self._since_partial = 0
+                    self._emit_partial()
+            elif self._speaking:
+                self._silence_samples += self._block
+                if self._silence_samples * 1000 >= self._timing.end_silence_ms * rate:
+                    self._end_utterance()
+
+    def _begin_utterance(self) -> None:
+        self._speaking = True
+        self._voiced_samples = 0
+        self._since_partial = 0
+        self._tag = self._recorder.new_tag(self.call_connection_id or "unknown")
+        self._text = self._scripts.text_for(self.call_connection_id, self._utterances)
+        self._utterances += 1
+
+    def _emit_partial(self) -> None:
+        callback = self._partial_cb
+        if callback is None:
+            return
+        words = self._text.split()
+        # Reveal words proportionally to ~2.5 words per second of speech
+        count = max(1, min(len(words), int(self._voiced_samples / self._timing.sample_rate * 2.5)))
+        text = " ".join(words[:count])
+        self._scheduler.call_later(0.0, lambda: callback(text, "en-US", None))
+
+    def _end_utterance(self) -> None:
+        self._speaking = False
+        tag = self._tag
+        text = f"{self._text} {tag}"
+        self._recorder.mark(tag, "speech_end", self._last_voice_at)
+        callback = self._final_cb
+        if callback is None or not self._running:
+            return
+
+        def fire() -> None:
+            self._recorder.mark(tag, "stt_final")
+            callback(text, "en-US", None)
+
+        self._scheduler.call_later(self._timing.final_delay_ms / 1000.0, fire)
+
+
+# ---------------------------------------------------------------------------
+# Text-to-speech
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class TTSTiming:
+    """Synthesizer behaviour knobs."""
+
+    base_latency_ms: float = 80.0
+    latency_ms_per_char: float = 0.5
+    audio_ms_per_char: float = 20.0
+
+
+class FakeSpeechSynthesizer:
+    """SpeechSynthesizer stand-in that returns a tone after a fixed latency."""
+
+    _tone_cache: dict[int, np.ndarray] = {}
+
+    def __init__(self, recorder: StageRecorder, timing: TTSTiming | None = None, **_: Any):
+        self._recorder = recorder
+        self._timing = timing or TTSTiming()
+        self.voice = "en-US-FakeNeural"
+        self.call_connection_id: str | None = None
+        self.is_ready = True
+
+    def warm_connection(self) -> bool:
+        return True
+
+    def set_call_connection_id(self, call_connection_id: str) -> None:
+        self.call_connection_id = call_connection_id
+
+    def clear_session_state(self) -> None:
+        self.call_connection_id = None
+
+    @classmethod
+    def _tone(cls, sample_rate: int) -> np.ndarray:
+        tone = cls._tone_cache.get(sample_rate)
+        if tone is None:
+            t = np.arange(sample_rate * 10) / sample_rate
+            tone = (np.sin(2 * np.pi * 440.0 * t) * 3000).astype("<i2")
+            cls._tone_cache[sample_rate] = tone
+        return tone
+
+    def synthesize_to_pcm(
+        self,
+        text: str,
+        voice: str | None = None,
+        sample_rate: int = 16000,
+        style: str | None = None,
+        rate: str | None = None,
+    ) -> bytes:
+        started = time.perf_counter()
+        tag = find_tag(text)
+        self._recorder.mark(tag, "tts_request", started)
+
+        timing = self._timing
+        time.sleep((timing.base_latency_ms + timing.latency_ms_per_char * len(text)) / 1000.0)
+
+        tone = self._tone(sample_rate)
+        samples = int(sample_rate * timing.audio_ms_per_char * max(1, len(text)) / 1000.0)
+        pcm = tone[: min(samples, len(tone))].tobytes()
+
+        if tag:
+            self._recorder.mark(tag, "tts_done")
+        else:
+            self._recorder.sample("tts_untagged_ms", (time.perf_counter() - started) * 1000.0)
+        return pcm
+
+
+# ---------------------------------------------------------------------------
+# Azure OpenAI
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class LLMTiming:
+    """Streaming completion knobs."""
+
+    ttft_ms: float = 250.0
+    token_interval_ms: float = 15.0
+    reply_sentences: int = 2
+
+
+_REPLY_SENTENCES = (
+    "I can help you with that right away.",
+    "Let me pull up the details on your account.",
+    "Is there anything else you would like me to check while I am here?",
+)
+
+
+def _last_user_text(messages: list[dict[str, Any]]) -> str:
+    for message in reversed(messages or []):
+        if message.get("role") != "user":
+            continue
+        content = message.get("content")
+        if isinstance(content, list):
+            return " ".join(part.get("text", "") for part in content if isinstance(part, dict))
+        return str(content or "")
+    return ""
+
+
+class _SSEStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """Server-sent event body that paces tokens in real time (sync or async)."""
+
+    def __init__(
+        self,
+        recorder: StageRecorder,
+        tag: str | None,
+        model: str,
+        tokens: list[str],
+        timing: LLMTiming,
+        include_usage: bool,
+    ) -> None:
+        self._recorder = recorder
+        self._tag = tag
+        self._model = model
+        self._tokens = tokens
+        self._timing = timing
+        self._include_usage = include_usage
+
+    def _event(self, completion_id: str, delta: dict[str, Any], finish: str | None) -> bytes:
+        chunk = {
+            "id": completion_id,
+            "object": "chat.completion.chunk",
+            "created": int(time.time()),
+            "model": self._model,
+            "choices": [{"index": 0, "delta": delta, "finish_reason": finish}],
+        }
+        return f"data: {json.dumps(chunk)}\n\n".encode()
+
+    def _events(self) -> Iterator[tuple[float, bytes, str | None]]:
+        """(delay before sending in seconds, payload, mark to record once sent)."""
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:12]}"
+        role = self._event(completion_id, {"role": "assistant", "content": ""}, None)
+        yield self._timing.ttft_ms / 1000.0, role, None
+        for index, token in enumerate(self._tokens):
+            delay = self._timing.token_interval_ms / 1000.0 if index else 0.0
+            mark = None if index else "llm_first_token"
+            yield delay, self._event(completion_id, {"content": token}, None), mark
+        yield 0.0, self._event(completion_id, {}, "stop"), None
+        if self._include_usage:
+            usage = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": int(time.time()),
+                "model": self._model,
+                "choices": [],
+                "usage": {
+                    "prompt_tokens": 100,
+                    "completion_tokens": len(self._tokens),
+                    "total_tokens": 100 + len(self._tokens),
+                },
+            }
+            yield 0.0, f"data: {json.dumps(usage)}\n\n".encode(), None
+        yield 0.0, b"data: [DONE]\n\n", "llm_done"
+
+    def __iter__(self) -> Iterator[bytes]:
+        for delay, payload, mark in self._events():
+            if delay:
+                time.sleep(delay)
+            if mark:
+                self._recorder.mark(self._tag, mark)
+            yield payload
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for delay, payload, mark in self._events():
+            if delay:
+                await asyncio.sleep(delay)
+            if mark:
+                self._recorder.mark(self._tag, mark)
+            yield payload
+
+
+class FakeOpenAITransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """httpx transport (sync and async) serving Azure OpenAI chat completions offline."""
+
+    def __init__(self, recorder: StageRecorder, timing: LLMTiming | None = None) -> None:
+        self._recorder = recorder
+        self._timing = timing or LLMTiming()
+        self.requests = 0
+
+    def reply_for(self, tag: str | None) -> str:
+        count = max(1, self._timing.reply_sentences)
+        first = f"Thanks for the details {tag}." if tag else "Thanks for the details."
+        rest = [_REPLY_SENTENCES[i % len(_REPLY_SENTENCES)] for i in range(count - 1)]
+        return " ".join([first, *rest])
+
+    def _respond(self, request: httpx.Request) -> tuple[httpx.Response | None, str, str]:
+        """Streaming/error response, or (None, model, text) for a plain completion."""
+        self.requests += 1
+        received = time.perf_counter()
+        if not request.url.path.endswith("/chat/completions"):
+            response = httpx.Response(404, json={"error": {"message": "not available offline"}})
+            return response, "", ""
+
+        body = json.loads(request.content or b"{}")
+        tag = find_tag(_last_user_text(body.get("messages", [])))
+        self._recorder.mark(tag, "llm_request", received)
+        model = body.get("model") or "offline-model"
+        text = self.reply_for(tag)
+
+        if body.get("stream"):
+            tokens = [word + " " for word in text.split(" ")]
+            include_usage = bool((body.get("stream_options") or {}).get("include_usage"))
+            stream = _SSEStream(self._recorder, tag, model, tokens, self._timing, include_usage)
+            response = httpx.Response(
+                200, headers={"content-type": "text/event-stream"}, stream=stream
+            )
+            return response, model, text
+        return None, model, text
+
+    @staticmethod
+    def _completion(model: str, text: str) -> httpx.Response:
+        return httpx.Response(
+            200,
+            json={
+                "id": f"chatcmpl-{uuid.uuid4().hex[:12]}",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": text},
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": {"prompt_tokens": 100, "completion_tokens": 20, "total_tokens": 120},
+            },
+        )
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        response, model, text = self._respond(request)
+        if response is not None:
+            return response
+        time.sleep(self._timing.ttft_ms / 1000.0)
+        return self._completion(model, text)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await request.aread()
+        response, model, text = self._respond(request)
+        if response is not None:
+            return response
+        await asyncio.sleep(self._timing.ttft_ms / 1000.0)
+        return self._completion(model, text)
+
+
+def create_fake_openai_client(transport: FakeOpenAITransport, endpoint: str):
+    """Real AzureOpenAI SDK client whose HTTP layer is the fake transport."""
+    from openai import AzureOpenAI
+
+    return AzureOpenAI(
+        azure_endpoint=endpoint,
+        api_key="offline",
+        api_version="2024-10-21",
+        http_client=httpx.Client(transport=transport),
+        max_retries=0,
+    )
+
+
+def create_fake_async_openai_client(transport: FakeOpenAITransport, endpoint: str):
+    """Real AsyncAzureOpenAI SDK client whose HTTP layer is the fake transport."""
+    from openai import AsyncAzureOpenAI
+
+    return AsyncAzureOpenAI(
+        azure_endpoint=endpoint,
+        api_key="offline",
+        api_version="2024-10-21",
+        http_client=httpx.AsyncClient(transport=transport),
+        max_retries=0,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Redis and Cosmos
+# ---------------------------------------------------------------------------
+
+
+def create_offline_redis_manager_class(server: Any):
+    """Build an AzureRedisManager subclass bound to a shared fakeredis server."""
+    import fakeredis
+    from src.redis.manager import AzureRedisManager
+
+    class OfflineRedisManager(AzureRedisManager):
+        """AzureRedisManager backed by an in-process fakeredis server."""
+
+        def __init__(self, *args: Any, **kwargs: Any) -> None:
+            super().__init__(
+                host="offline-redis",
+                access_key="offline",
+                port=6379,
+                ssl=False,
+                credential=object(),
+                use_cluster=False,
+            )
+
+        def _create_client(self) -> None:
+            self.redis_client = fakeredis.FakeRedis(server=server, decode_responses=True)
+
+    return OfflineRedisManager
+
+
+class OfflineCosmosManager:
+    """Empty Cosmos document store; the offline pipeline never calls tools."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        self.documents: list[dict[str, Any]] = []
+
+    def query_documents(self, query: dict[str, Any], projection=None, limit=None, **_: Any):
+        return []
+
+    def read_document(self, query: dict[str, Any], **_: Any):
+        return None
+
+    def upsert_document(self, document: dict[str, Any], query: dict[str, Any] | None = None):
+        self.documents.append(document)
+        return None
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Barge-In VAD Benchmark
+======================
+
+Mixes the cached caller utterances in ``tests/load/audio_cache`` with
+background noise and agent echo, streams the mixes through
+``StreamingVAD`` in 20 ms ACS-sized chunks, and reports:
+
+- detection latency: true speech onset (first frame above -45 dBFS in the
+  clean clip) to the VAD onset, p50 / p95 / max, overall and while the agent
+  is playing (where barge-in applies)
+- missed: speech trials without an onset
+- early: speech trials with an onset before the caller started
+- false_trigger_rate: onsets in trials with no caller speech at all
+  (noise, hum, clicks, noise level steps, agent echo during playback)
+
+Echo is another cached utterance attenuated by ``--echo-db`` and played
+while the playback probe reports active TTS.
+
+Usage:
+    python tests/load/vad_barge_in_benchmark.py
+    python tests/load/vad_barge_in_benchmark.py --min-speech-ms 100 --echo-db -18
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[2]
+# Running as a script puts tests/load first, where ``utils`` would shadow the backend's
+_HERE = Path(__file__).resolve().parent
+sys.path[:] = [p for p in sys.path if Path(p or ".").resolve() != _HERE]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from apps.artagent.backend.voice.speech_cascade.vad import (  # noqa: E402
+    DEFAULT_MIN_SPEECH_MS,
+    StreamingVAD,
+)
+
+AUDIO_CACHE = _HERE / "audio_cache"
+SAMPLE_RATE = 16000
+CHUNK_MS = 20
+LEAD_IN_S = 1.5
+NOISE_ONLY_S = 5.0
+BACKGROUNDS = ("quiet", "white", "brown", "hum")
+
+
+def load_clips() -> list[np.ndarray]:
+    """Cached caller utterances (16 kHz PCM16) as float arrays."""
+    clips = []
+    for line in (AUDIO_CACHE / "manifest.jsonl").read_text().splitlines():
+        if not line.strip():
+            continue
+        entry = json.loads(line)
+        pcm = (AUDIO_CACHE / entry["filename"]).read_bytes()
+        clips.append(np.frombuffer(pcm, dtype="<i2").astype(np.float64))
+    return clips
+
+
+def speech_onset_s(clip: np.ndarray, threshold_db: float = -45.0) -> float:
+    """First 10 ms frame of a clean clip above ``threshold_db``."""
+    frames = clip[: len(clip) // 160 * 160].reshape(-1, 160)
+    energy = 10 * np.log10(np.mean(frames**2, axis=1) / 32768.0**2 + 1e-12)
+    return int(np.argmax(energy > threshold_db)) * 0.01
+
+
+def _scaled(signal: np.ndarray, level_dbfs: float) -> np.ndarray:
+    rms = np.sqrt(np.mean(signal**2)) or 1.0
+    return signal * (32768.0 * 10 ** (level_dbfs / 20) / rms)
+
+
+def background(kind: str, samples: int, rng: np.random.Generator) -> np.ndarray:
+    """Stationary background noise of ``kind``."""
+    if kind == "quiet":
+        return _scaled(rng.standard_normal(samples), -65)
+    if kind == "white":
+        return _scaled(rng.standard_normal(samples), -42)
+    if kind == "brown":
+        walk = np.cumsum(rng.standard_normal(samples))
+        walk -= np.convolve(walk, np.ones(801) / 801, mode="same")
+        return _scaled(walk, -38)
+    if kind == "hum":
+        t = np.arange(samples) / SAMPLE_RATE
+        hum = sum(np.sin(2 * np.pi * 60 * h * t) / h for h in (1, 2, 3, 5))
+        return _scaled(hum, -40) + _scaled(rng.standard_normal(samples), -62)
+    raise ValueError(kind)
+
+
+def clicks(samples: int, rng: np.random.Generator) -> np.ndarray:
+    """Keyboard-like 10 ms broadband clicks every ~300 ms over a quiet floor."""
+    out = background("quiet", samples, rng)
+    burst = 160
+    for start in range(4000, samples - burst, 4800):
+        out[start : start + burst] += _scaled(rng.standard_normal(burst), -20) * np.hanning(burst)
+    return out
+
+
+def noise_step(samples: int, rng: np.random.Generator) -> np.ndarray:
+    """White noise that jumps by 15 dB halfway through (caller walks outside)."""
+    out = background("white", samples, rng) * 0.4
+    out[samples // 2 :] *= 10 ** (15 / 20)
+    return out
+
+
+def _echo(clips: list[np.ndarray], index: int, samples: int, echo_db: float) -> np.ndarray:
+    """Agent speech looped to ``samples``, ``echo_db`` below the caller clip level."""
+    clip = clips[index % len(clips)]
+    echo = np.resize(clip, samples) * 10 ** (echo_db / 20)
+    return echo
+
+
+def stream(mix: np.ndarray, vad: StreamingVAD) -> list[float]:
+    """Feed ``mix`` in 20 ms chunks; return onset times (end of detecting chunk)."""
+    pcm = np.clip(mix, -32768, 32767).astype("<i2").tobytes()
+    chunk = SAMPLE_RATE * CHUNK_MS // 1000 * 2
+    onsets = []
+    for offset in range(0, len(pcm), chunk):
+        if vad.process(pcm[offset : offset + chunk]):
+            onsets.append((offset + chunk) / 2 / SAMPLE_RATE)
+    return onsets
+
+
+def _latency_summary(prefix: str, latencies: list[float]) -> dict[str, float]:
+    ordered = sorted(latencies) or [0.0]
+    return {
+        f"{prefix}_p50": round(ordered[len(ordered) // 2], 1),
+        f"{prefix}_p95": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 1),
+        f"{prefix}_max": round(ordered[-1], 1),
+    }
+
+
+def run(
+    *,
+    min_speech_ms: int = DEFAULT_MIN_SPEECH_MS,
+    echo_db: float = -30.0,
+    seed: int = 0,
+) -> dict:
+    """Run every speech and non-speech mix; summarise latency and false triggers."""
+    rng = np.random.default_rng(seed)
+    clips = load_clips()
+    latencies: list[float] = []
+    playback_latencies: list[float] = []
+    missed = early = 0
+    speech_trials = 0
+
+    for index, clip in enumerate(clips):
+        lead = int(LEAD_IN_S * SAMPLE_RATE)
+        samples = lead + len(clip)
+        caller = np.concatenate([np.zeros(lead), clip])
+        onset_s = LEAD_IN_S + speech_onset_s(clip)
+        for kind in BACKGROUNDS:
+            for with_echo in (False, True):
+                mix = caller + background(kind, samples, rng)
+                if with_echo:
+                    mix += _echo(clips, index + 1, samples, echo_db)
+                vad = StreamingVAD(
+                    min_speech_ms=min_speech_ms, playback_active=lambda e=with_echo: e
+                )
+                onsets = stream(mix, vad)
+                speech_trials += 1
+                if not onsets:
+                    missed += 1
+                    continue
+                if onsets[0] < onset_s:
+                    early += 1
+                    continue
+                latencies.append((onsets[0] - onset_s) * 1000)
+                if with_echo:
+                    playback_latencies.append(latencies[-1])
+
+    noise_trials = 0
+    false_triggers = 0
+    samples = int(NOISE_ONLY_S * SAMPLE_RATE)
+    for trial in range(len(clips)):
+        mixes = [(background(kind, samples, rng), False) for kind in BACKGROUNDS]
+        mixes += [(clicks(samples, rng), False), (noise_step(samples, rng), False)]
+        mixes += [
+            (background(kind, samples, rng) + _echo(clips, trial, samples, echo_db), True)
+            for kind in BACKGROUNDS
+        ]
+        for mix, playback in mixes:
+            vad = StreamingVAD(min_speech_ms=min_speech_ms, playback_active=lambda p=playback: p)
+            noise_trials += 1
+            if stream(mix, vad):
+                false_triggers += 1
+
+    return {
+        "speech_trials": speech_trials,
+        "missed": missed,
+        "early": early,
+        **_latency_summary("latency_ms", latencies),
+        **_latency_summary("playback_latency_ms", playback_latencies),
+        "noise_trials": noise_trials,
+        "false_triggers": false_triggers,
+        "false_trigger_rate": round(false_triggers / noise_trials, 4),
+    }
+
+
+def cpu_per_chunk_us(chunks: int = 2000, seed: int = 0) -> float:
+    """Process CPU per 20 ms chunk of noisy speech."""
+    import time
+
+    rng = np.random.default_rng(seed)
+    clip = load_clips()[0]
+    mix = np.resize(clip, chunks * SAMPLE_RATE * CHUNK_MS // 1000)
+    mix = mix + background("white", len(mix), rng)
+    pcm = np.clip(mix, -32768, 32767).astype("<i2").tobytes()
+    chunk = SAMPLE_RATE * CHUNK_MS // 1000 * 2
+    vad = StreamingVAD(playback_active=lambda: True)
+    start = time.process_time()
+    for offset in range(0, len(pcm), chunk):
+        vad.process(pcm[offset : offset + chunk])
+    return (time.process_time() - start) / chunks * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--min-speech-ms", type=int, default=DEFAULT_MIN_SPEECH_MS)
+    parser.add_argument("--echo-db", type=float, default=-30.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    result = run(min_speech_ms=args.min_speech_ms, echo_db=args.echo_db, seed=args.seed)
+    for key, value in result.items():
+        print(f"{key:<20} {value}")
+    print(f"{'cpu_us_per_chunk':<20} {cpu_per_chunk_us():.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""
+Tests for the ACS inbound media decoder.
+
+Covers:
+- String-inspection fast path for AudioData (compact and pretty JSON)
+- json.loads fallback for escaped payloads and non-audio kinds
+- Silent frames zero-filled without decoding
+- Coalescing, flush and metadata-driven reconfiguration
+- Replay of cached load-test audio against the per-frame json + b64 path
+  (throughput lives in tests/load/acs_inbound_benchmark.py)
+"""
+
+import base64
+import json
+from pathlib import Path
+
+import pytest
+from apps.artagent.backend.voice.speech_cascade.acs_inbound import ACSInboundDecoder
+
+AUDIO_CACHE = Path(__file__).parent / "load" / "audio_cache"
+FRAME_BYTES = 640  # 20 ms @ 16 kHz PCM16 mono
+
+
+def _audio_msg(pcm: bytes, *, silent: bool = False, indent: int | None = None) -> str:
+    return json.dumps(
+        {
+            "kind": "AudioData",
+            "audioData": {
+                "timestamp": "2026-10-18T12:00:00.000Z",
+                "participantRawID": "8:acs:caller",
+                "data": base64.b64encode(pcm).decode("ascii"),
+                "silent": silent,
+            },
+        },
+        indent=indent,
+    )
+
+
+class _Sink:
+    def __init__(self):
+        self.chunks: list[bytes] = []
+
+    def __call__(self, chunk: bytes) -> None:
+        self.chunks.append(chunk)
+
+    @property
+    def data(self) -> bytes:
+        return b"".join(self.chunks)
+
+
+@pytest.fixture
+def sink():
+    return _Sink()
+
+
+class TestFastPath:
+    @pytest.mark.parametrize("indent", [None, 2])
+    def test_audio_frame_bypasses_json(self, sink, indent):
+        decoder = ACSInboundDecoder(sink)
+        pcm = bytes(range(256)) * 2 + b"\x01" * 128
+
+        result = decoder.feed(_audio_msg(pcm, indent=indent))
+
+        assert result.kind == "AudioData"
+        assert result.message is None and result.silent is False
+        assert sink.data == pcm
+        assert decoder.stats.fast_path_frames == 1
+        assert decoder.stats.fallback_parses == 0
+
+    def test_escaped_payload_falls_back_to_json(self, sink):
+        decoder = ACSInboundDecoder(sink)
+        pcm = b"\xff\xfe" * 320
+        text = _audio_msg(pcm).replace("/", "\\/")
+        assert "\\/" in text
+
+        result = decoder.feed(text)
+
+        assert result.kind == "AudioData"
+        assert sink.data == pcm
+        assert decoder.stats.fallback_parses == 1
+
+    def test_silent_frame_is_zero_filled_without_decoding(self, sink):
+        decoder = ACSInboundDecoder(sink)
+        # Payload is not valid audio; silent frames must not be decoded
+        text = _audio_msg(b"\x07" * FRAME_BYTES, silent=True)
+
+        result = decoder.feed(text)
+
+        assert result.silent is True
+        assert sink.data == bytes(FRAME_BYTES)
+        assert decoder.stats.silent_frames == 1
+
+    def test_non_audio_messages_are_parsed_once(self, sink):
+        decoder = ACSInboundDecoder(sink)
+        result = decoder.feed(json.dumps({"kind": "DtmfData", "dtmfData": {"tone": "5"}}))
+        assert result.kind == "DtmfData"
+        assert result.message["dtmfData"]["tone"] == "5"
+        assert sink.chunks == []
+
+    def test_invalid_json(self, sink):
+        decoder = ACSInboundDecoder(sink)
+        assert decoder.feed("{not json").kind is None
+        assert decoder.feed("[1, 2]").kind is None
+
+    def test_bad_base64_counts_decode_error(self, sink):
+        decoder = ACSInboundDecoder(sink)
+        decoder.feed('{"kind": "AudioData", "audioData": {"data": "abc"}}')
+        assert decoder.stats.decode_errors == 1
+        assert sink.chunks == []
+
+
+class TestCoalescing:
+    def test_pushes_once_per_window(self, sink):
+        decoder = ACSInboundDecoder(sink, coalesce_ms=60)
+        frames = [bytes([i]) * FRAME_BYTES for i in range(7)]
+        for frame in frames:
+            decoder.feed(_audio_msg(frame))
+
+        assert len(sink.chunks) == 2
+        assert all(len(chunk) == 3 * FRAME_BYTES for chunk in sink.chunks)
+
+        decoder.flush()
+        assert len(sink.chunks) == 3
+        assert sink.data == b"".join(frames)
+
+    def test_silent_and_voiced_frames_keep_order(self, sink):
+        decoder = ACSInboundDecoder(sink, coalesce_ms=40)
+        voiced = b"\x11" * FRAME_BYTES
+        decoder.feed(_audio_msg(voiced, silent=True))
+        decoder.feed(_audio_msg(voiced))
+        assert sink.data == bytes(FRAME_BYTES) + voiced
+
+    def test_feed_message_compat_path(self, sink):
+        decoder = ACSInboundDecoder(sink)
+        pcm = b"\x22" * FRAME_BYTES
+        message = json.loads(_audio_msg(pcm))
+        assert decoder.feed_message(message).kind == "AudioData"
+        assert sink.data == pcm
+
+    def test_metadata_reconfigures_sample_rate(self, sink):
+        decoder = ACSInboundDecoder(sink, coalesce_ms=40)
+        decoder.feed(_audio_msg(b"\x01" * FRAME_BYTES))
+        metadata = {"kind": "AudioMetadata", "audioMetadata": {"sampleRate": 24000}}
+
+        result = decoder.feed(json.dumps(metadata))
+
+        assert result.kind == "AudioMetadata"
+        # Pending 16 kHz audio is flushed before the buffer is resized
+        assert sink.data == b"\x01" * FRAME_BYTES
+        frame_24k = b"\x02" * 960
+        decoder.feed(_audio_msg(frame_24k))
+        decoder.feed(_audio_msg(frame_24k))
+        assert sink.chunks[-1] == frame_24k * 2
+
+
+class TestInboundReplay:
+    """Replay cached caller audio as ACS frames against the per-frame json + b64 path."""
+
+    @staticmethod
+    def _frames() -> list[str]:
+        messages = []
+        for path in sorted(AUDIO_CACHE.glob("*.pcm")):
+            pcm = path.read_bytes()
+            for offset in range(0, len(pcm) - FRAME_BYTES + 1, FRAME_BYTES):
+                frame = pcm[offset : offset + FRAME_BYTES]
+                messages.append(_audio_msg(frame, silent=not any(frame)))
+        return messages
+
+    def test_replay_matches_reference_with_fewer_pushes(self):
+        messages = self._frames()
+        if not messages:
+            pytest.skip("no cached load-test audio")
+
+        reference = _Sink()
+        for text in messages:
+            message = json.loads(text)
+            reference(base64.b64decode(message["audioData"]["data"]))
+
+        sink = _Sink()
+        decoder = ACSInboundDecoder(sink, coalesce_ms=40)
+        for text in messages:
+            decoder.feed(text)
+        decoder.flush()
+
+        assert sink.data == reference.data
+        assert decoder.stats.fallback_parses == 0
+        assert decoder.stats.pushes <= len(reference.chunks) // 2 + 1
@@ -0,0 +1,184 @@
+"""
+Tests for the shared async Azure OpenAI streaming client.
+
+Covers:
+- AsyncTokenProvider caching and single refresh under concurrency
+- get_async_client rebinding per event loop and closing
+- Pooled keep-alive HTTP client limits
+- Cascade barge-in cancelling an in-flight stream
+- Thread count against a local fake streaming server (TTFT overhead is
+  reported by tests/load/llm_streaming_benchmark.py)
+"""
+
+import asyncio
+import importlib.util
+import sys
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+@pytest.fixture(scope="module")
+def aoai_client():
+    """The real ``src/aoai/client.py`` (conftest stubs the package import)."""
+    spec = importlib.util.spec_from_file_location(
+        "_aoai_client_under_test", ROOT / "src" / "aoai" / "client.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class _Credential:
+    def __init__(self, lifetime: float = 3600.0):
+        self.lifetime = lifetime
+        self.calls = 0
+        self.threads: set[str] = set()
+
+    def get_token(self, scope):
+        self.calls += 1
+        self.threads.add(threading.current_thread().name)
+        time.sleep(0.02)
+        return SimpleNamespace(token=f"token-{self.calls}", expires_on=time.time() + self.lifetime)
+
+
+class TestAsyncTokenProvider:
+    async def test_token_is_fetched_once_off_the_loop(self, aoai_client):
+        credential = _Credential()
+        provider = aoai_client.AsyncTokenProvider(credential)
+
+        tokens = await asyncio.gather(*(provider() for _ in range(20)))
+
+        assert set(tokens) == {"token-1"}
+        assert credential.calls == 1
+        assert threading.current_thread().name not in credential.threads
+
+    async def test_token_is_refreshed_inside_margin(self, aoai_client):
+        credential = _Credential(lifetime=60.0)
+        provider = aoai_client.AsyncTokenProvider(credential, refresh_margin_sec=300)
+
+        assert await provider() == "token-1"
+        assert await provider() == "token-2"
+
+
+class TestSharedAsyncClient:
+    def test_client_is_rebound_per_loop_and_closed(self, aoai_client, monkeypatch):
+        monkeypatch.setenv("AZURE_OPENAI_ENDPOINT", "https://example.openai.azure.com")
+        monkeypatch.setenv("AZURE_OPENAI_KEY", "test-key")
+
+        async def same_loop():
+            first = aoai_client.get_async_client()
+            assert aoai_client.get_async_client() is first
+            return first
+
+        first = asyncio.run(same_loop())
+        second = asyncio.run(same_loop())
+        assert second is not first
+
+        asyncio.run(aoai_client.close_async_client())
+        assert aoai_client._async_client_instance is None
+
+    async def test_http_client_pool_limits(self, aoai_client):
+        http_client = aoai_client.create_async_http_client(
+            max_connections=64, max_keepalive_connections=16, keepalive_expiry=30.0
+        )
+        try:
+            pool = http_client._transport._pool
+            assert pool._max_connections == 64
+            assert pool._max_keepalive_connections == 16
+            assert pool._keepalive_expiry == 30.0
+            assert http_client.timeout.connect == aoai_client.AOAI_CONNECT_TIMEOUT_SEC
+        finally:
+            await http_client.aclose()
+
+
+class _BlockingStream:
+    """Async stream that yields one sentence and then stalls until cancelled."""
+
+    def __init__(self):
+        self.closed = False
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        delta = SimpleNamespace(content="Let me check that. ", tool_calls=None)
+        yield SimpleNamespace(choices=[SimpleNamespace(delta=delta)], usage=None)
+        await asyncio.Event().wait()
+
+    async def close(self):
+        self.closed = True
+
+
+class TestCascadeBargeIn:
+    @pytest.fixture
+    def adapter(self):
+        from apps.artagent.backend.registries.agentstore.base import ModelConfig, UnifiedAgent
+        from apps.artagent.backend.voice.speech_cascade.orchestrator import (
+            CascadeConfig,
+            CascadeOrchestratorAdapter,
+        )
+
+        agent = UnifiedAgent(
+            name="TestAgent",
+            description="test",
+            model=ModelConfig(deployment_id="gpt-4o"),
+            prompt_template="You are a test agent.",
+        )
+        adapter = CascadeOrchestratorAdapter(
+            config=CascadeConfig(start_agent="TestAgent", session_id="s1"),
+            agents={"TestAgent": agent},
+        )
+        adapter._current_memo_manager = MagicMock()
+        return adapter
+
+    async def test_cancel_current_aborts_stream(self, adapter):
+        stream = _BlockingStream()
+        spoken: list[str] = []
+
+        async def on_tts_chunk(text):
+            spoken.append(text)
+            await adapter.cancel_current()
+
+        with patch("src.aoai.client.get_async_client") as get_client:
+            get_client.return_value.chat.completions.create = AsyncMock(return_value=stream)
+            text, tool_calls = await asyncio.wait_for(
+                adapter._process_llm(
+                    messages=[{"role": "user", "content": "hi"}],
+                    tools=[],
+                    on_tts_chunk=on_tts_chunk,
+                ),
+                timeout=5.0,
+            )
+
+        assert spoken == ["Let me check that. "]
+        assert text == "Let me check that."
+        assert tool_calls == []
+        assert stream.closed
+
+
+class TestStreamingBenchmark:
+    """Shared async client vs. threaded sync client; TTFT overhead is reported by the load run."""
+
+    TURNS = 50
+
+    def test_threads_stay_flat_as_turns_grow(self, aoai_client, monkeypatch):
+        pytest.importorskip("aiohttp")
+        from tests.load import llm_streaming_benchmark as bench
+
+        monkeypatch.setitem(sys.modules, "src.aoai.client", aoai_client)
+        timing = bench.StreamTiming(ttft_ms=50.0, tokens=10, token_interval_ms=5.0)
+        with bench.FakeStreamingServer(timing) as server:
+            threaded = bench.run_mode("threaded", server, self.TURNS)
+            small = bench.run_mode("async", server, self.TURNS // 5)
+            pooled = bench.run_mode("async", server, self.TURNS)
+
+        assert threaded["turns"] == pooled["turns"] == self.TURNS
+        # Thread count does not grow with concurrent turns
+        assert pooled["added_threads"] <= small["added_threads"] + 2
@@ -0,0 +1,165 @@
+"""
+Tests for non-blocking App Configuration reads.
+
+Covers:
+- Bootstrap load published as an immutable snapshot; reads served from it
+- Reads never blocking: a slow reload, a held writer lock, a failing reload
+- Stale-while-revalidate: a stale snapshot keeps serving while a reload runs
+- Failed reloads keep the last snapshot and back off
+- Change notification with the changed keys
+"""
+
+import threading
+import time
+
+import azure.appconfiguration.provider as appconfig_sdk
+import pytest
+from apps.artagent.backend.config import appconfig_provider as provider
+
+
+class _FakeAppConfig:
+    """Stands in for the provider's ``load()``; ``release`` holds a reload in flight."""
+
+    def __init__(self, values: dict):
+        self.values = dict(values)
+        self.failures = 0
+        self.calls = 0
+        self.release = threading.Event()
+        self.release.set()
+
+    def load(self, **kwargs):
+        self.calls += 1
+        self.release.wait(5)
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("App Configuration unavailable")
+        return dict(self.values)
+
+
+@pytest.fixture
+def appconfig(monkeypatch):
+    fake = _FakeAppConfig(
+        {
+            "azure/openai/endpoint": "https://v1.openai.azure.com",
+            ".appconfig.featureflag/warm-pool": {"enabled": True},
+        }
+    )
+    monkeypatch.setattr(appconfig_sdk, "load", fake.load)
+    monkeypatch.setattr(provider, "_get_credential", lambda: None)
+    monkeypatch.setattr(provider, "APPCONFIG_ENABLED", True)
+    monkeypatch.setattr(provider, "APPCONFIG_ENDPOINT", "https://test.azconfig.io")
+    monkeypatch.setattr(provider, "APPCONFIG_REFRESH_INTERVAL_S", 0.0)
+    monkeypatch.setattr(provider, "_dotenv_local_keys_cache", set())
+    monkeypatch.setattr(provider, "_snapshot", None)
+    monkeypatch.setattr(provider, "_retry_at", 0.0)
+    monkeypatch.setattr(provider, "_consecutive_failures", 0)
+    monkeypatch.setattr(provider, "_last_refresh_error", None)
+    monkeypatch.setattr(provider, "_listeners", ())
+    assert provider._load_config_from_appconfig() is not None
+    yield fake
+    fake.release.set()
+    thread = provider._refresh_thread
+    if thread is not None:
+        thread.join(5)
+
+
+def _reads(count: int = 1000) -> set:
+    return {provider.get_config_value("azure/openai/endpoint") for _ in range(count)}
+
+
+class TestSnapshotReads:
+    def test_bootstrap_publishes_snapshot(self, appconfig):
+        snapshot = provider.get_config_snapshot()
+
+        assert snapshot.version == 1
+        assert provider.get_config_value("azure/openai/endpoint") == "https://v1.openai.azure.com"
+        assert provider.get_feature_flag("warm-pool") is True
+        with pytest.raises(TypeError):
+            snapshot.values["azure/openai/endpoint"] = "mutated"
+
+    def test_reads_do_not_wait_for_a_slow_reload(self, appconfig):
+        appconfig.values["azure/openai/endpoint"] = "https://v2.openai.azure.com"
+        appconfig.release.clear()  # hold the reload in flight
+
+        assert provider.refresh_cache()
+        assert provider.get_provider_status()["refreshing"]
+        assert _reads() == {"https://v1.openai.azure.com"}
+        assert provider.get_provider_status()["refreshing"]
+
+        appconfig.release.set()
+        provider._refresh_thread.join(5)
+        assert provider.get_config_value("azure/openai/endpoint") == "https://v2.openai.azure.com"
+        assert provider.get_config_snapshot().version == 2
+
+    def test_reads_do_not_take_the_writer_lock(self, appconfig):
+        with provider._config_lock:
+            result: list = []
+            reader = threading.Thread(target=lambda: result.append(_reads(100)))
+            reader.start()
+            reader.join(1)
+
+        assert not reader.is_alive()
+        assert result[0] == {"https://v1.openai.azure.com"}
+
+
+class TestRevalidation:
+    def test_stale_snapshot_revalidates_in_the_background(self, appconfig, monkeypatch):
+        monkeypatch.setattr(provider, "APPCONFIG_REFRESH_INTERVAL_S", 0.01)
+        appconfig.values["azure/openai/endpoint"] = "https://v2.openai.azure.com"
+        appconfig.release.clear()  # hold the reload in flight
+        time.sleep(0.02)
+
+        assert _reads() == {"https://v1.openai.azure.com"}
+        assert provider.get_provider_status()["refreshing"]
+        assert appconfig.calls == 2  # one bootstrap load, one reload for all the stale reads
+
+        appconfig.release.set()
+        provider._refresh_thread.join(5)
+        assert provider.get_config_value("azure/openai/endpoint") == "https://v2.openai.azure.com"
+
+    def test_failed_reload_keeps_snapshot_and_backs_off(self, appconfig, monkeypatch):
+        monkeypatch.setattr(provider, "APPCONFIG_REFRESH_INTERVAL_S", 0.01)
+        appconfig.failures = 1
+        time.sleep(0.02)
+
+        provider.get_config_value("azure/openai/endpoint")
+        provider._refresh_thread.join(5)
+
+        status = provider.get_provider_status()
+        assert status["consecutive_failures"] == 1
+        assert "unavailable" in status["last_refresh_error"]
+        assert provider.get_config_value("azure/openai/endpoint") == "https://v1.openai.azure.com"
+        # Still stale, but within the backoff window: no new reload
+        assert provider._refresh_thread is None
+        assert appconfig.calls == 2
+
+        assert provider.refresh_cache(wait_seconds=5)  # an explicit refresh skips the backoff
+        assert provider.get_provider_status()["consecutive_failures"] == 0
+
+    def test_bootstrap_retries_then_falls_back(self, appconfig, monkeypatch):
+        sleeps: list = []
+        monkeypatch.setattr(provider.time, "sleep", sleeps.append)
+        monkeypatch.setattr(provider, "_snapshot", None)
+        appconfig.failures = 3
+
+        assert provider._load_config_from_appconfig() is None
+        assert sleeps == [2, 4]
+        assert provider.get_provider_status()["consecutive_failures"] == 1
+
+
+class TestChangeNotification:
+    def test_subscribers_receive_changed_keys(self, appconfig):
+        events: list = []
+        unsubscribe = provider.subscribe_config_changes(
+            lambda changed, snapshot: events.append((changed, snapshot.version))
+        )
+
+        provider.refresh_cache(wait_seconds=5)  # nothing changed
+        appconfig.values["azure/openai/endpoint"] = "https://v2.openai.azure.com"
+        appconfig.values["app/pools/tts-size"] = "8"
+        provider.refresh_cache(wait_seconds=5)
+        unsubscribe()
+        appconfig.values["app/pools/tts-size"] = "16"
+        provider.refresh_cache(wait_seconds=5)
+
+        assert events == [(frozenset({"azure/openai/endpoint", "app/pools/tts-size"}), 3)]
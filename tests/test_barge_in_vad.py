@@ -0,0 +1,179 @@
+"""
+Tests for the local streaming VAD that triggers cascade barge-in.
+
+Covers:
+- Speech onset on cached caller utterances, one onset per utterance
+- No onsets on stationary noise, hum, clicks and residual agent echo
+- Framing independent of chunk size, wall-clock gaps ending speech runs
+- SpeechSDKThread barging in on VAD onsets only during playback, honoring
+  suppress_barge_in
+- Detection latency and false-trigger rate on noise / echo mixes (benchmark)
+"""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pytest
+from apps.artagent.backend.voice.speech_cascade.handler import SpeechSDKThread, ThreadBridge
+from apps.artagent.backend.voice.speech_cascade.vad import StreamingVAD
+
+from tests.load import vad_barge_in_benchmark as bench
+
+CHUNK = 640  # 20 ms at 16 kHz PCM16
+
+
+@pytest.fixture(scope="module")
+def clips():
+    return bench.load_clips()
+
+
+def _pcm(signal):
+    return np.clip(signal, -32768, 32767).astype("<i2").tobytes()
+
+
+def _with_lead_in(clip, rng, kind="quiet", seconds=1.0):
+    lead = np.zeros(int(seconds * bench.SAMPLE_RATE))
+    caller = np.concatenate([lead, clip])
+    return caller + bench.background(kind, len(caller), rng), seconds + bench.speech_onset_s(clip)
+
+
+class TestStreamingVAD:
+    def test_detects_caller_speech_once_per_utterance(self, clips):
+        rng = np.random.default_rng(1)
+        for clip in clips[:3]:
+            mix, onset_s = _with_lead_in(clip, rng, "white")
+            vad = StreamingVAD(playback_active=lambda: False)
+
+            onsets = bench.stream(mix, vad)
+
+            assert len(onsets) == 1
+            assert 0 <= onsets[0] - onset_s <= 0.25
+            assert vad.onset_ms >= vad.min_speech_ms
+
+    @pytest.mark.parametrize("kind", bench.BACKGROUNDS)
+    def test_stationary_noise_does_not_trigger(self, kind):
+        rng = np.random.default_rng(2)
+        vad = StreamingVAD(playback_active=lambda: False)
+
+        assert bench.stream(bench.background(kind, 5 * bench.SAMPLE_RATE, rng), vad) == []
+        assert vad.frames == 250
+
+    def test_clicks_and_noise_steps_do_not_trigger(self):
+        rng = np.random.default_rng(3)
+        samples = 5 * bench.SAMPLE_RATE
+
+        assert bench.stream(bench.clicks(samples, rng), StreamingVAD()) == []
+        assert bench.stream(bench.noise_step(samples, rng), StreamingVAD()) == []
+
+    def test_residual_echo_is_ignored_but_caller_over_echo_is_not(self, clips):
+        rng = np.random.default_rng(4)
+        samples = 5 * bench.SAMPLE_RATE
+        echo = bench._echo(clips, 0, samples, -30)
+
+        echo_only = StreamingVAD(playback_active=lambda: True)
+        assert bench.stream(echo + bench.background("quiet", samples, rng), echo_only) == []
+        # The same echo with playback reported inactive looks like speech
+        assert bench.stream(echo * 10, StreamingVAD(playback_active=lambda: False))
+
+        mix, onset_s = _with_lead_in(clips[1], rng)
+        mix = mix + bench._echo(clips, 2, len(mix), -30)
+        onsets = bench.stream(mix, StreamingVAD(playback_active=lambda: True))
+        assert len(onsets) == 1
+        assert onsets[0] >= onset_s
+
+    def test_onsets_do_not_depend_on_chunk_size(self, clips):
+        mix, _ = _with_lead_in(clips[0], np.random.default_rng(5))
+        pcm = _pcm(mix)
+
+        def detect(chunk):
+            vad = StreamingVAD(playback_active=lambda: False)
+            for offset in range(0, len(pcm), chunk):
+                vad.process(pcm[offset : offset + chunk])
+            return vad.onsets, vad.onset_ms, vad.frames, round(vad.noise_floor_db, 6)
+
+        assert detect(CHUNK) == detect(1277) == detect(CHUNK * 2)
+
+    def test_wall_clock_gap_ends_speech_run(self, clips):
+        silence = bytes(CHUNK * 10)
+        speech = _pcm(clips[0][24000:28000])  # 250 ms of voiced speech
+
+        def detect(gap_s):
+            vad = StreamingVAD(playback_active=lambda: False, min_speech_ms=120)
+            vad.process(silence)
+            assert not vad.process(speech[: CHUNK * 5])
+            vad._last_chunk_at -= gap_s  # e.g. silent frames dropped upstream
+            return vad.process(speech[CHUNK * 5 : CHUNK * 7])
+
+        assert detect(0.0)
+        assert not detect(1.0)
+
+
+class _FakeRecognizer:
+    push_stream = object()
+
+    def __init__(self):
+        self.written = 0
+
+    def set_partial_result_callback(self, callback):
+        self.on_partial = callback
+
+    def set_final_result_callback(self, callback):
+        self.on_final = callback
+
+    def set_cancel_callback(self, callback):
+        self.on_cancel = callback
+
+    def write_bytes(self, audio):
+        self.written += len(audio)
+
+
+class TestSpeechSDKThreadBargeIn:
+    async def _speak(self, clip, *, playing=True, suppressed=False):
+        bridge = ThreadBridge()
+        bridge.set_main_loop(asyncio.get_running_loop(), "call-1")
+        if suppressed:
+            bridge.suppress_barge_in()
+        barge_in = AsyncMock()
+        recognizer = _FakeRecognizer()
+        thread = SpeechSDKThread(
+            "call-1",
+            recognizer,
+            bridge,
+            barge_in,
+            asyncio.Queue(),
+            vad=StreamingVAD(playback_active=lambda: playing),
+        )
+        mix, _ = _with_lead_in(clip, np.random.default_rng(6))
+        pcm = _pcm(mix)
+        for offset in range(0, len(pcm), CHUNK):
+            thread.write_audio(pcm[offset : offset + CHUNK])
+        await asyncio.sleep(0.05)
+        assert recognizer.written == len(pcm)
+        return barge_in
+
+    async def test_onset_during_playback_barges_in(self, clips):
+        barge_in = await self._speak(clips[0])
+        barge_in.assert_awaited_once()
+
+    async def test_no_barge_in_when_agent_is_silent(self, clips):
+        barge_in = await self._speak(clips[0], playing=False)
+        barge_in.assert_not_awaited()
+
+    async def test_suppressed_barge_in_is_respected(self, clips):
+        barge_in = await self._speak(clips[0], suppressed=True)
+        barge_in.assert_not_awaited()
+
+
+class TestBargeInVADBenchmark:
+    """Cached utterances mixed with noise and residual echo."""
+
+    def test_latency_and_false_triggers(self):
+        result = bench.run(echo_db=-30)
+        print(f"\nbarge-in VAD: {result}")
+
+        assert result["missed"] == 0
+        assert result["early"] == 0
+        assert result["false_triggers"] == 0
+        assert result["latency_ms_p50"] <= 250
+        assert result["playback_latency_ms_p95"] <= 500
@@ -0,0 +1,154 @@
+"""
+Tests for encode-once fan-out in the WebSocket connection manager.
+
+Covers:
+- One serialization per session/topic broadcast, whatever the subscriber count
+- The same immutable text frame queued on every recipient
+- Session context overlay decoding like the previous merged payload
+- Unserializable payloads rejected without queueing anything
+- Serializations per broadcast at 1, 5 and 50 subscribers
+"""
+
+import asyncio
+import json
+
+import pytest
+from fastapi.websockets import WebSocketState
+from src.pools import connection_manager
+from src.pools.connection_manager import (
+    ThreadSafeConnectionManager,
+    encode_frame,
+    overlay_frame,
+)
+
+
+class _FakeWebSocket:
+    client_state = WebSocketState.CONNECTED
+    application_state = WebSocketState.CONNECTED
+
+    def __init__(self):
+        self.sent: list[str] = []
+
+    async def send_text(self, message):
+        self.sent.append(message)
+
+    async def close(self):
+        pass
+
+
+@pytest.fixture
+async def manager():
+    manager = ThreadSafeConnectionManager(enable_connection_limits=False)
+    yield manager
+    await manager.stop()
+
+
+@pytest.fixture
+def dumps_calls(monkeypatch):
+    calls = []
+    real_dumps = connection_manager.json_codec.dumps
+
+    def counting_dumps(obj, *args, **kwargs):
+        calls.append(obj)
+        return real_dumps(obj, *args, **kwargs)
+
+    monkeypatch.setattr(connection_manager.json_codec, "dumps", counting_dumps)
+    return calls
+
+
+async def _register(manager, count, **kwargs):
+    sockets = [_FakeWebSocket() for _ in range(count)]
+    for ws in sockets:
+        await manager.register(ws, **kwargs)
+    return sockets
+
+
+async def _drain(sockets, expected=1):
+    for _ in range(200):
+        if all(len(ws.sent) >= expected for ws in sockets):
+            return
+        await asyncio.sleep(0)
+    raise AssertionError("sender loops did not deliver")
+
+
+class TestOverlayFrame:
+    def test_overlay_decodes_like_merged_payload(self):
+        payload = {"type": "event", "payload": {"text": "hi"}, "session_context": {"old": 1}}
+        overlay = {"session_context": {"session_id": "s1"}, "seq": 3}
+
+        frame = overlay_frame(encode_frame(payload), overlay)
+
+        assert json.loads(frame) == {**payload, **overlay}
+
+    def test_empty_payload_and_empty_overlay(self):
+        assert json.loads(overlay_frame("{}", {"a": 1})) == {"a": 1}
+        frame = encode_frame({"a": 1})
+        assert overlay_frame(frame, {}) is frame
+
+
+class TestEncodeOnceFanOut:
+    async def test_session_broadcast_encodes_once_and_shares_the_frame(self, manager, dumps_calls):
+        sockets = await _register(manager, 5, client_type="dashboard", session_id="s1")
+        await _register(manager, 2, client_type="dashboard", session_id="other")
+        payload = {"type": "assistant_streaming", "payload": {"content": "Hello"}}
+
+        sent = await manager.broadcast_session("s1", payload)
+        await _drain(sockets)
+
+        assert sent == 5
+        # The envelope and the session context overlay, independent of recipient count
+        assert len(dumps_calls) == 2
+        frames = {id(ws.sent[0]) for ws in sockets}
+        assert len(frames) == 1
+        decoded = json.loads(sockets[0].sent[0])
+        assert decoded["payload"] == {"content": "Hello"}
+        assert decoded["session_context"]["session_id"] == "s1"
+        assert decoded["session_context"]["restricted_to_session"] is True
+        assert "session_context" not in payload
+
+    async def test_topic_call_and_all_broadcasts_encode_once(self, manager, dumps_calls):
+        sockets = await _register(
+            manager, 4, client_type="dashboard", call_id="call-1", topics={"dashboard"}
+        )
+
+        assert await manager.broadcast_topic("dashboard", {"n": 1}) == 4
+        assert await manager.broadcast_call("call-1", {"n": 2}) == 4
+        assert await manager.broadcast_all({"n": 3}) == 4
+        await _drain(sockets, expected=3)
+
+        assert len(dumps_calls) == 3
+        assert [json.loads(m)["n"] for m in sockets[0].sent] == [1, 2, 3]
+
+    async def test_distributed_delivery_encodes_once(self, manager, dumps_calls):
+        sockets = await _register(manager, 3, client_type="dashboard", session_id="s1")
+
+        await manager._deliver_session_envelope_local("s1", {"type": "event"})
+        await _drain(sockets)
+
+        assert len(dumps_calls) == 1
+        assert all(json.loads(ws.sent[0]) == {"type": "event"} for ws in sockets)
+
+    async def test_unserializable_payload_queues_nothing(self, manager):
+        sockets = await _register(manager, 2, client_type="dashboard", session_id="s1")
+
+        assert await manager.broadcast_session("s1", {"bad": object()}) == 0
+        assert await manager.broadcast_session("s1", {"ok": True}) == 2
+        await _drain(sockets)
+
+        assert all(len(ws.sent) == 1 for ws in sockets)
+        assert all(json.loads(ws.sent[0])["ok"] is True for ws in sockets)
+
+
+class TestFanOutScaling:
+    """Serialization work per broadcast does not grow with subscribers (CPU: tests/load)."""
+
+    @pytest.mark.parametrize("subscribers", [1, 5, 50])
+    async def test_dumps_per_broadcast(self, manager, dumps_calls, subscribers):
+        sockets = await _register(manager, subscribers, client_type="dashboard", session_id="s1")
+
+        for n in range(3):
+            assert await manager.broadcast_session("s1", {"type": "event", "n": n}) == subscribers
+        await _drain(sockets, expected=3)
+
+        assert len(dumps_calls) == 3 * 2
+        assert sum(len(ws.sent) for ws in sockets) == 3 * subscribers
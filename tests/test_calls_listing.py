@@ -0,0 +1,267 @@
+"""
+Tests for server-side paginated call listing.
+
+Covers:
+- CosmosDBMongoCoreManager.query_page ordering, keyset cursors and ties
+- Capped counts and one-time index creation
+- GET /api/v1/calls paging, status filter and cursor validation
+- Docs examined per page independent of collection size (100k documents)
+"""
+
+from bisect import bisect_left
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from apps.artagent.backend.api.v1.endpoints import calls as calls_api
+from bson import ObjectId
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from src.cosmosdb.manager import CosmosDBMongoCoreManager
+
+
+def _matches(query: dict, doc: dict) -> bool:
+    for key, cond in query.items():
+        if key == "$and":
+            if not all(_matches(q, doc) for q in cond):
+                return False
+        elif key == "$or":
+            if not any(_matches(q, doc) for q in cond):
+                return False
+        elif isinstance(cond, dict):
+            for op, operand in cond.items():
+                if op == "$exists" and (key in doc) != operand:
+                    return False
+                if op == "$lt" and not (key in doc and doc[key] < operand):
+                    return False
+        elif doc.get(key) != cond:
+            return False
+    return True
+
+
+class _IndexedCollection:
+    """
+    In-memory stand-in for a collection with a (timestamp, _id) index.
+
+    Sorted finds seek to the keyset bound with bisect and walk the index
+    backwards, so ``examined`` counts what a real index scan would touch.
+    Unsorted finds are collection scans.
+    """
+
+    def __init__(self, docs: list[dict]):
+        self._docs = sorted(docs, key=lambda d: (d["timestamp"], d["_id"]))
+        self._keys = [(d["timestamp"], d["_id"]) for d in self._docs]
+        self.examined = 0
+        self.indexes: list[list] = []
+        self.count_options: dict = {}
+
+    def create_index(self, keys, **_):
+        self.indexes.append(keys)
+
+    def find(self, query=None, projection=None):
+        return _Cursor(self, query or {}, projection)
+
+    def count_documents(self, query, **options):
+        self.count_options = options
+        cap = options.get("limit")
+        total = 0
+        for doc in self._docs:
+            if _matches(query, doc):
+                total += 1
+                if cap and total >= cap:
+                    break
+        return total
+
+    def estimated_document_count(self):
+        return len(self._docs)
+
+
+class _Cursor:
+    def __init__(self, collection, query, projection):
+        self._collection = collection
+        self._query = query
+        self._projection = projection
+        self._sorted = False
+        self._skip = 0
+        self._limit = 0
+
+    def sort(self, spec):
+        self._sorted = True
+        return self
+
+    def skip(self, count):
+        self._skip = count
+        return self
+
+    def limit(self, count):
+        self._limit = count
+        return self
+
+    def _start(self) -> int:
+        for clause in self._query.get("$and", []):
+            for branch in clause.get("$or", []):
+                if "_id" in branch:
+                    bound = (branch["timestamp"], branch["_id"]["$lt"])
+                    return bisect_left(self._collection._keys, bound) - 1
+        return len(self._collection._docs) - 1
+
+    def _project(self, doc):
+        if not self._projection:
+            return dict(doc)
+        return {k: v for k, v in doc.items() if k == "_id" or self._projection.get(k)}
+
+    def __iter__(self):
+        docs = self._collection._docs
+        order = range(self._start(), -1, -1) if self._sorted else range(len(docs))
+        skipped = returned = 0
+        for index in order:
+            doc = docs[index]
+            self._collection.examined += 1
+            if not _matches(self._query, doc):
+                continue
+            if skipped < self._skip:
+                skipped += 1
+                continue
+            yield self._project(doc)
+            returned += 1
+            if self._limit and returned >= self._limit:
+                return
+
+
+def _docs(count: int, *, start: datetime | None = None) -> list[dict]:
+    # Naive UTC, as pymongo returns BSON datetimes by default
+    start = start or datetime(2025, 1, 1)
+    docs = []
+    for i in range(count):
+        docs.append(
+            {
+                "_id": f"doc-{i:07d}",
+                "call_id": f"call-{i:07d}",
+                "status": "connected" if i % 2 else "disconnected",
+                "timestamp": start + timedelta(seconds=i),
+                "participants": [],
+                "events": [],
+            }
+        )
+    # Session documents without call_id share the collection
+    docs.extend({"_id": f"session-{i}", "timestamp": start} for i in range(count // 10))
+    return docs
+
+
+def _manager(docs: list[dict]) -> CosmosDBMongoCoreManager:
+    manager = CosmosDBMongoCoreManager.__new__(CosmosDBMongoCoreManager)
+    manager.collection = _IndexedCollection(docs)
+    manager._ensured_indexes = set()
+    return manager
+
+
+CALLS = {"call_id": {"$exists": True}}
+
+
+class TestQueryPage:
+    def test_cursor_walk_is_newest_first_and_complete(self):
+        manager = _manager(_docs(23))
+        seen, cursor = [], None
+        while True:
+            page, cursor = manager.query_page(CALLS, sort_field="timestamp", limit=5, cursor=cursor)
+            seen.extend(doc["call_id"] for doc in page)
+            if cursor is None:
+                break
+        assert seen == [f"call-{i:07d}" for i in reversed(range(23))]
+
+    def test_ties_on_sort_field_are_broken_by_id(self):
+        same = datetime(2025, 1, 1)
+        docs = [{"_id": name, "call_id": name, "timestamp": same} for name in "abcd"]
+        manager = _manager(docs)
+        first, cursor = manager.query_page(CALLS, sort_field="timestamp", limit=3)
+        second, end = manager.query_page(CALLS, sort_field="timestamp", limit=3, cursor=cursor)
+        assert [d["_id"] for d in first] == ["d", "c", "b"]
+        assert [d["_id"] for d in second] == ["a"] and end is None
+
+    def test_inclusion_projection_keeps_sort_field(self):
+        manager = _manager(_docs(3))
+        page, _ = manager.query_page(
+            CALLS, sort_field="timestamp", limit=2, projection={"call_id": 1}
+        )
+        assert set(page[0]) == {"_id", "call_id", "timestamp"}
+
+    def test_cursor_round_trip_preserves_bson_types(self):
+        when, oid = datetime(2025, 5, 1, 12, 0, tzinfo=UTC), ObjectId()
+        cursor = CosmosDBMongoCoreManager.encode_page_cursor(when, oid)
+        value, document_id = CosmosDBMongoCoreManager.decode_page_cursor(cursor)
+        assert value.replace(tzinfo=UTC) == when and document_id == oid
+        with pytest.raises(ValueError):
+            CosmosDBMongoCoreManager.decode_page_cursor("not-a-cursor")
+
+    def test_count_is_capped_and_empty_filter_uses_metadata(self):
+        manager = _manager(_docs(50))
+        assert manager.count_documents(CALLS, limit=10, max_time_ms=250) == 10
+        assert manager.collection.count_options == {"limit": 10, "maxTimeMS": 250}
+        assert manager.count_documents({}) == 55
+
+    async def test_indexes_are_created_once(self):
+        manager = _manager(_docs(1))
+        keys = [("timestamp", -1), ("_id", -1)]
+        assert await manager.ensure_index_async(keys)
+        assert await manager.ensure_index_async(keys)
+        assert manager.collection.indexes == [keys]
+
+
+class TestListEndpoint:
+    @pytest.fixture
+    def api(self):
+        manager = _manager(_docs(12))
+        app = FastAPI()
+        app.include_router(calls_api.router, prefix="/api/v1/calls")
+        app.state.cosmos = manager
+        return TestClient(app), manager
+
+    def test_pages_with_cursor_and_filter(self, api):
+        client, manager = api
+        first = client.get("/api/v1/calls/", params={"limit": 4}).json()
+        second = client.get(
+            "/api/v1/calls/", params={"limit": 4, "cursor": first["next_cursor"]}
+        ).json()
+
+        assert [c["call_id"] for c in first["calls"]] == [f"call-{i:07d}" for i in (11, 10, 9, 8)]
+        assert [c["call_id"] for c in second["calls"]] == [f"call-{i:07d}" for i in (7, 6, 5, 4)]
+        assert first["total"] == 12
+        assert len(manager.collection.indexes) == len(calls_api._CALL_LIST_INDEXES)
+
+        connected = client.get(
+            "/api/v1/calls/", params={"status_filter": "connected", "page": 2, "limit": 2}
+        ).json()
+        assert [c["call_id"] for c in connected["calls"]] == ["call-0000007", "call-0000005"]
+        assert connected["total"] == 6
+
+    def test_bad_cursor_is_400(self, api):
+        client, _ = api
+        assert client.get("/api/v1/calls/", params={"cursor": "%%%"}).status_code == 400
+
+
+class TestListingCost:
+    """Docs examined per page must not grow with collection size."""
+
+    LIMIT = 50
+
+    def _deep_page(self, manager) -> int:
+        middle = manager.collection._docs[len(manager.collection._docs) // 2]
+        cursor = manager.encode_page_cursor(middle["timestamp"], middle["_id"])
+        manager.collection.examined = 0
+        page, _ = manager.query_page(CALLS, sort_field="timestamp", limit=self.LIMIT, cursor=cursor)
+        assert len(page) == self.LIMIT
+        return manager.collection.examined
+
+    def test_page_cost_is_independent_of_collection_size(self):
+        small = _manager(_docs(1_000))
+        large = _manager(_docs(100_000))
+
+        small_examined = self._deep_page(small)
+        large_examined = self._deep_page(large)
+
+        large.collection.examined = 0
+        legacy = [doc for doc in large.query_documents({}) if "call_id" in doc][: self.LIMIT]
+
+        assert len(legacy) == self.LIMIT
+        assert small_examined == large_examined
+        assert large_examined <= self.LIMIT + 1
+        assert large.collection.examined == len(large.collection._docs)
@@ -30,6 +30,24 @@ if TYPE_CHECKING:
 # ═══════════════════════════════════════════════════════════════════════════════
 
 
+class _AsyncStream:
+    """Async iterator standing in for an openai AsyncStream."""
+
+    def __init__(self, chunks):
+        self._chunks = list(chunks)
+        self.closed = False
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for chunk in self._chunks:
+            yield chunk
+
+    async def close(self):
+        self.closed = True
+
+
 @pytest.fixture
 def mock_memo_manager():
     """Create a mock MemoManager for testing."""
@@ -60,7 +78,7 @@ def mock_agent():
     )
 
     # Mock tool execution
-    async def mock_execute_tool(name: str, args: dict):
+    async def mock_execute_tool(name: str, args: dict, session_id: str | None = None):
         if name == "get_weather":
             return {"weather": "sunny", "temperature": 72}
         elif name == "handoff_test":
@@ -130,10 +148,10 @@ class TestProcessLLMBaseline:
         mock_chunk.choices[0].delta.content = "Hello! How can I help you?"
         mock_chunk.choices[0].delta.tool_calls = None
 
-        with patch("src.aoai.client.get_client") as mock_get_client:
+        with patch("src.aoai.client.get_async_client") as mock_get_client:
             mock_client = MagicMock()
-            mock_stream = iter([mock_chunk])
-            mock_client.chat.completions.create = MagicMock(return_value=mock_stream)
+            mock_stream = _AsyncStream([mock_chunk])
+            mock_client.chat.completions.create = AsyncMock(return_value=mock_stream)
             mock_get_client.return_value = mock_client
 
             response_text, tool_calls = await cascade_adapter._process_llm(
@@ -172,10 +190,10 @@ class TestProcessLLMBaseline:
 
         tts_callback = AsyncMock()
 
-        with patch("src.aoai.client.get_client") as mock_get_client:
+        with patch("src.aoai.client.get_async_client") as mock_get_client:
             mock_client = MagicMock()
-            mock_stream = iter(mock_chunks)
-            mock_client.chat.completions.create = MagicMock(return_value=mock_stream)
+            mock_stream = _AsyncStream(mock_chunks)
+            mock_client.chat.completions.create = AsyncMock(return_value=mock_stream)
             mock_get_client.return_value = mock_client
 
             response_text, tool_calls = await cascade_adapter._process_llm(
@@ -228,7 +246,7 @@ class TestProcessLLMBaseline:
         followup_chunk.choices[0].delta.content = "The weather is sunny!"
         followup_chunk.choices[0].delta.tool_calls = None
 
-        with patch("src.aoai.client.get_client") as mock_get_client:
+        with patch("src.aoai.client.get_async_client") as mock_get_client:
             mock_client = MagicMock()
 
             # First call returns tool call, second call returns followup
@@ -236,11 +254,11 @@ class TestProcessLLMBaseline:
             def create_stream(**kwargs):
                 call_count[0] += 1
                 if call_count[0] == 1:
-                    return iter([tool_call_chunk])
+                    return _AsyncStream([tool_call_chunk])
                 else:
-                    return iter([followup_chunk])
+                    return _AsyncStream([followup_chunk])
 
-            mock_client.chat.completions.create = MagicMock(side_effect=create_stream)
+            mock_client.chat.completions.create = AsyncMock(side_effect=create_stream)
             mock_get_client.return_value = mock_client
 
             response_text, tool_calls = await cascade_adapter._process_llm(
@@ -288,10 +306,10 @@ class TestProcessLLMBaseline:
 
         tool_call_chunk.choices[0].delta.tool_calls = [mock_tc]
 
-        with patch("src.aoai.client.get_client") as mock_get_client:
+        with patch("src.aoai.client.get_async_client") as mock_get_client:
             mock_client = MagicMock()
-            mock_stream = iter([tool_call_chunk])
-            mock_client.chat.completions.create = MagicMock(return_value=mock_stream)
+            mock_stream = _AsyncStream([tool_call_chunk])
+            mock_client.chat.completions.create = AsyncMock(return_value=mock_stream)
             mock_get_client.return_value = mock_client
 
             response_text, tool_calls = await cascade_adapter._process_llm(
@@ -341,11 +359,11 @@ class TestProcessLLMBaseline:
 
         tool_call_chunk.choices[0].delta.tool_calls = [mock_tc]
 
-        with patch("src.aoai.client.get_client") as mock_get_client:
+        with patch("src.aoai.client.get_async_client") as mock_get_client:
             mock_client = MagicMock()
             # Always return tool call (would loop forever without max_iterations)
-            mock_client.chat.completions.create = MagicMock(
-                return_value=iter([tool_call_chunk])
+            mock_client.chat.completions.create = AsyncMock(
+                return_value=_AsyncStream([tool_call_chunk])
             )
             mock_get_client.return_value = mock_client
 
@@ -454,18 +472,18 @@ class TestLLMProcessingIntegration:
         tool_start_callback = AsyncMock()
         tool_end_callback = AsyncMock()
 
-        with patch("src.aoai.client.get_client") as mock_get_client:
+        with patch("src.aoai.client.get_async_client") as mock_get_client:
             mock_client = MagicMock()
 
             call_count = [0]
             def create_stream(**kwargs):
                 call_count[0] += 1
                 if call_count[0] == 1:
-                    return iter([tool_chunk])
+                    return _AsyncStream([tool_chunk])
                 else:
-                    return iter([final_chunk])
+                    return _AsyncStream([final_chunk])
 
-            mock_client.chat.completions.create = MagicMock(side_effect=create_stream)
+            mock_client.chat.completions.create = AsyncMock(side_effect=create_stream)
             mock_get_client.return_value = mock_client
 
             response_text, tool_calls = await cascade_adapter._process_llm(
@@ -0,0 +1,263 @@
+"""
+Tests for compact, bounded ChatHistory storage.
+
+Covers:
+- ChatRecord encoding and interned roles / agent names
+- Per-agent cap: batched eviction, kept system prompt, archive fields
+- Append-only persistence: only new messages written, snapshot fallback on
+  edits, compaction, idempotent retries, appends during an in-flight write
+- MemoManager round trips through Redis, including stored legacy sessions
+- Storage benchmark (memory per 1,000 messages, persist cost per turn)
+"""
+
+import json
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+from src.agenticmemory.types import ChatHistory, ChatRecord
+from src.stateful.state_managment import MemoManager
+
+from tests.load import chat_history_benchmark as bench
+
+fakeredis = pytest.importorskip("fakeredis")
+
+from src.redis.manager import AzureRedisManager  # noqa: E402
+
+
+class _FakeRedisManager(AzureRedisManager):
+    def __init__(self):
+        self._client = fakeredis.FakeRedis(decode_responses=True)
+        super().__init__(host="fake", access_key="fake", ssl=False, credential=object())
+
+    def _create_client(self):
+        self.redis_client = self._client
+
+
+def _persist(history: ChatHistory, store: dict) -> object:
+    write = history.prepare_redis_write()
+    store.update(write.mapping)
+    for field in write.delete:
+        store.pop(field, None)
+    history.commit_redis_write(write)
+    return write
+
+
+class TestRecords:
+    def test_record_round_trip_keeps_extra_keys(self):
+        message = {"role": "tool", "content": '{"ok":true}', "tool_call_id": "call_1"}
+        record = ChatRecord.decode(ChatRecord.from_message("Auth", message).encode())
+
+        assert record.to_message() == message
+        assert record.role is ChatRecord("x", "".join(["to", "ol"]), "").role
+        assert json.loads(ChatRecord("a", "user", "hi").encode()) == ["a", "user", "hi"]
+
+    def test_roles_and_agents_are_interned(self):
+        history = ChatHistory()
+        history.append("".join(["us", "er"]), "a", "".join(["Au", "th"]))
+        history.from_json(json.dumps({"Auth": [{"role": "user", "content": "b"}]}))
+
+        (agent,) = history.get_all()
+        assert agent is sys.intern("Auth")
+        assert history.get_agent("Auth")[0]["role"] is sys.intern("user")
+
+    def test_legacy_list_payload_is_migrated(self):
+        history = ChatHistory()
+        history.from_json('[{"role": "user", "content": "hi"}]')
+
+        assert history.get_all() == {"default": [{"role": "user", "content": "hi"}]}
+        assert json.loads(history.to_json()) == history.get_all()
+
+
+class TestCap:
+    def test_eviction_is_batched_and_keeps_the_system_prompt(self):
+        history = ChatHistory(max_messages=8)
+        history.append("system", "prompt", "A")
+        for i in range(8):
+            history.append("user", str(i), "A")
+
+        thread = history.get_agent("A")
+        assert thread[0] == {"role": "system", "content": "prompt"}
+        assert [m["content"] for m in thread[1:]] == ["3", "4", "5", "6", "7"]
+        assert [r.content for r in history.archived("A")] == ["0", "1", "2"]
+        assert history.archived_count("A") == 3
+
+    def test_archive_is_written_once_and_read_back_in_order(self):
+        history = ChatHistory(max_messages=4)
+        store: dict[str, str] = {}
+        for i in range(10):
+            history.append("user", str(i), "A")
+            _persist(history, store)
+
+        archive = ChatHistory.archive_from_redis_fields(store)["A"]
+        live = ChatHistory.threads_from_redis_fields(store)["A"]
+        assert [m["content"] for m in archive + live] == [str(i) for i in range(10)]
+        assert history.archived("A") == []
+        assert history.archived_count("A") == len(archive)
+
+        # A reloaded history continues the archive numbering
+        reloaded = ChatHistory(max_messages=4)
+        reloaded.load_redis_fields(store)
+        for i in range(10, 14):
+            reloaded.append("user", str(i), "A")
+            _persist(reloaded, store)
+        archive = ChatHistory.archive_from_redis_fields(store)["A"]
+        live = ChatHistory.threads_from_redis_fields(store)["A"]
+        assert [m["content"] for m in archive + live] == [str(i) for i in range(14)]
+
+
+class TestAppendLog:
+    def test_only_new_messages_are_written(self):
+        history = ChatHistory(append_log=True)
+        store: dict[str, str] = {}
+        history.append("user", "hello", "A")
+        assert _persist(history, store).snapshot
+
+        history.append("assistant", "hi", "A")
+        history.append("user", "other", "B")
+        write = _persist(history, store)
+
+        assert not write.snapshot
+        assert set(write.mapping) == {"chat_log:A:1", "chat_log:B:0"}
+        assert ChatHistory.threads_from_redis_fields(store) == history.get_all()
+        assert _persist(history, store).mapping == {}
+
+    def test_in_place_edit_writes_a_snapshot_and_drops_the_log(self):
+        history = ChatHistory(append_log=True)
+        store: dict[str, str] = {}
+        history.append("user", "a", "A")
+        _persist(history, store)
+        history.append("user", "b", "A")
+        _persist(history, store)
+
+        history.get_agent("A")[0]["content"] = "edited"
+        history.mark_dirty()
+        write = _persist(history, store)
+
+        assert write.snapshot
+        assert write.delete == ["chat_log:A:1"]
+        assert set(store) == {"chat_history"}
+        assert ChatHistory.threads_from_redis_fields(store) == history.get_all()
+
+    def test_replaced_thread_is_detected_without_mark_dirty(self):
+        history = ChatHistory(append_log=True)
+        store: dict[str, str] = {}
+        history.append("user", "a", "A")
+        _persist(history, store)
+
+        history.clear("A")
+        history.append("user", "b", "A")
+        assert _persist(history, store).snapshot
+        assert ChatHistory.threads_from_redis_fields(store) == {
+            "A": [{"role": "user", "content": "b"}]
+        }
+
+    def test_log_is_compacted(self):
+        history = ChatHistory(append_log=True, compact_every=3)
+        store: dict[str, str] = {}
+        kinds = []
+        for i in range(8):
+            history.append("user", str(i), "A")
+            kinds.append(_persist(history, store).snapshot)
+
+        assert kinds == [True, False, False, False, True, False, False, False]
+        assert ChatHistory.threads_from_redis_fields(store) == history.get_all()
+
+    def test_retried_write_is_idempotent(self):
+        history = ChatHistory(append_log=True)
+        store: dict[str, str] = {}
+        history.append("user", "a", "A")
+        _persist(history, store)
+        history.append("user", "b", "A")
+
+        failed = history.prepare_redis_write()
+        store.update(failed.mapping)  # reached Redis, but the caller never saw it
+        retried = _persist(history, store)
+
+        assert retried.mapping == failed.mapping
+        assert ChatHistory.threads_from_redis_fields(store)["A"] == history.get_agent("A")
+
+    def test_append_during_write_stays_pending(self):
+        history = ChatHistory(append_log=True)
+        store: dict[str, str] = {}
+        history.append("user", "a", "A")
+        _persist(history, store)
+
+        history.append("user", "b", "A")
+        write = history.prepare_redis_write()
+        history.append("user", "c", "A")
+        store.update(write.mapping)
+        history.commit_redis_write(write)
+
+        assert set(_persist(history, store).mapping) == {"chat_log:A:2"}
+        assert len(ChatHistory.threads_from_redis_fields(store)["A"]) == 3
+
+
+class TestMemoManagerRoundTrip:
+    async def test_append_log_round_trip_through_redis(self):
+        redis_mgr = _FakeRedisManager()
+        memo = MemoManager(session_id="s1")
+        memo.chatHistory.append_log = True
+        memo.ensure_system_prompt("A", "prompt")
+        memo.append_to_history("A", "user", "hello")
+        await memo.persist_to_redis_async(redis_mgr)
+        memo.append_to_history("A", "assistant", "hi")
+        await memo.persist_to_redis_async(redis_mgr)
+        memo.ensure_system_prompt("A", "new prompt")
+        memo.append_to_history("A", "user", "bye")
+        memo.persist_to_redis(redis_mgr)
+
+        stored = redis_mgr.redis_client.hgetall("session:s1")
+        assert not [field for field in stored if field.startswith("chat_log:")]
+        loaded = MemoManager.from_redis("s1", redis_mgr)
+        assert loaded.histories == memo.histories
+        assert loaded.get_history("A")[0]["content"] == "new prompt"
+
+        memo.append_to_history("A", "assistant", "goodbye")
+        await memo.persist_to_redis_async(redis_mgr)
+        assert "chat_log:A:4" in redis_mgr.redis_client.hgetall("session:s1")
+        assert MemoManager.from_redis("s1", redis_mgr).histories == memo.histories
+
+    def test_stored_legacy_session_loads_and_writes_unchanged(self):
+        legacy = {"A": [{"role": "user", "content": "hi", "timestamp": "t"}]}
+        redis_mgr = MagicMock()
+        redis_mgr.get_session_data.return_value = {
+            "corememory": "{}",
+            "chat_history": json.dumps(legacy),
+        }
+
+        memo = MemoManager.from_redis("s1", redis_mgr)
+        memo.persist_to_redis(redis_mgr)
+
+        assert memo.histories == legacy
+        _, mapping = redis_mgr.store_session_data.call_args.args
+        assert set(mapping) == {"corememory", "chat_history"}
+        assert json.loads(mapping["chat_history"]) == legacy
+        redis_mgr.write_session_fields.assert_not_called()
+
+
+class TestBenchmark:
+    @pytest.fixture(scope="class")
+    def report(self):
+        return bench.run(turns=120)
+
+    def test_append_log_writes_a_fraction_of_the_snapshot(self, report):
+        snapshot, log = report["persist"]["snapshot"], report["persist"]["append_log"]
+
+        assert snapshot["round_trip"] and log["round_trip"]
+        assert log["bytes_per_turn_avg"] < snapshot["bytes_per_turn_avg"] / 5
+        assert log["bytes_last_turn"] < snapshot["bytes_last_turn"] / 20
+
+    def test_compact_storage_uses_less_memory(self, report):
+        memory = report["memory"]
+
+        assert memory["interned_dict_bytes_per_1k"] < memory["legacy_dict_bytes_per_1k"]
+        assert memory["record_bytes_per_1k"] < memory["legacy_dict_bytes_per_1k"]
+        assert memory["live_capped_messages"] <= 120
+        assert memory["live_capped_bytes"] < memory["live_unbounded_bytes"] / 2
+
+    def test_capped_persist_round_trips_with_archive(self):
+        report = bench.run(turns=80, max_messages=40)
+
+        assert report["persist"]["snapshot"]["round_trip"]
+        assert report["persist"]["append_log"]["round_trip"]
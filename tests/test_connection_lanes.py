@@ -0,0 +1,304 @@
+"""
+Tests for prioritized send lanes in the WebSocket connection manager.
+
+Covers:
+- Lane classification of audio, dashboard/debug and control envelopes
+- Per-lane bounds and drop policies, with drop and queue-depth counters
+- Control frames never dropped under an audio flood on a slow socket
+- A client that stalls on control frames is disconnected, not queued for forever
+- Barge-in stop latency behind queued audio, and queued audio discarded on stop
+- Event-driven sender: backlog drained on close, lane stats in manager stats
+- TTS playback frames queued on the audio lane, so stops overtake them and
+  cancelled playback discards what is still queued
+"""
+
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+
+import pytest
+from apps.artagent.backend.voice.shared.context import TransportType, VoiceSessionContext
+from apps.artagent.backend.voice.tts.playback import TTSPlayback
+from fastapi.websockets import WebSocketState
+from src.pools.connection_manager import (
+    ConnectionMeta,
+    LanePolicy,
+    ThreadSafeConnectionManager,
+    _Connection,
+    classify_lane,
+    encode_frame,
+    stops_audio,
+)
+
+STOP = {"type": "control", "action": "audio_stop", "reason": "barge_in", "session_id": "s1"}
+
+
+class _SlowWebSocket:
+    client_state = WebSocketState.CONNECTED
+    application_state = WebSocketState.CONNECTED
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.sent: list[tuple[float, dict]] = []
+        self.close_code: int | None = None
+
+    async def send_text(self, message):
+        await asyncio.sleep(self.delay)
+        self.sent.append((time.perf_counter(), json.loads(message)))
+
+    async def close(self, code: int = 1000):
+        self.close_code = code
+
+    def types(self) -> list[str]:
+        return [message.get("type") for _, message in self.sent]
+
+
+def _audio(i: int) -> dict:
+    return {"type": "audio_data", "data": "AAAA", "frame_index": i}
+
+
+async def _connection(ws, **kwargs) -> _Connection:
+    return _Connection(ws, ConnectionMeta(connection_id="c1"), **kwargs)
+
+
+async def _wait_for(predicate, timeout: float = 5.0):
+    deadline = time.perf_counter() + timeout
+    while not predicate():
+        if time.perf_counter() > deadline:
+            raise AssertionError("condition not reached")
+        await asyncio.sleep(0.001)
+
+
+class TestClassification:
+    @pytest.mark.parametrize(
+        "payload, lane",
+        [
+            (_audio(0), "audio"),
+            ({"kind": "AudioData", "audioData": {}}, "audio"),
+            ({"type": "event", "topic": "dashboard", "payload": {}}, "telemetry"),
+            ({"type": "debug", "topic": "session"}, "telemetry"),
+            (STOP, "control"),
+            ({"kind": "StopAudio"}, "control"),
+            ({"type": "assistant", "topic": "session"}, "control"),
+        ],
+    )
+    def test_lanes(self, payload, lane):
+        assert classify_lane(payload) == lane
+
+    def test_stop_messages(self):
+        assert stops_audio(STOP)
+        assert stops_audio({"kind": "StopAudio", "stopAudio": {}})
+        assert stops_audio({"type": "control", "action": "tts_cancelled"})
+        assert not stops_audio({"type": "control", "action": "mute"})
+        assert not stops_audio(_audio(0))
+
+
+class TestLanePolicies:
+    async def test_bounds_and_drop_policies(self):
+        ws = _SlowWebSocket()
+        conn = await _connection(
+            ws,
+            lane_policies={
+                "audio": LanePolicy(maxsize=3, drop="oldest"),
+                "telemetry": LanePolicy(maxsize=2, drop="newest"),
+            },
+        )
+        await asyncio.sleep(0)
+        for i in range(10):
+            conn.enqueue(encode_frame(_audio(i)), "audio")
+        accepted = [conn.enqueue("{}", "telemetry") for _ in range(4)]
+
+        stats = conn.stats()
+        assert [json.loads(m)["frame_index"] for m in conn._lanes["audio"].items] == [7, 8, 9]
+        assert stats["audio"]["dropped"] == 7
+        assert stats["audio"]["high_water"] == 3
+        assert stats["telemetry"] == {
+            "depth": 2,
+            "high_water": 2,
+            "enqueued": 2,
+            "sent": 0,
+            "dropped": 2,
+            "flushed": 0,
+        }
+        assert accepted == [True, True, False, False]
+        await conn.close()
+
+    async def test_control_is_never_dropped_under_audio_flood(self):
+        ws = _SlowWebSocket(delay=0.0005)
+        conn = await _connection(ws)
+
+        for i in range(1000):
+            await conn.send_json(_audio(i))
+            if i % 20 == 0:
+                await conn.send_json({"type": "status", "seq": i // 20})
+        await _wait_for(lambda: not any(lane.items for lane in conn._lanes.values()))
+        await conn.close()
+
+        statuses = [m["seq"] for _, m in ws.sent if m.get("type") == "status"]
+        assert statuses == list(range(50))
+        stats = conn.stats()
+        assert stats["control"]["dropped"] == 0
+        assert stats["control"]["sent"] == 50
+        assert stats["audio"]["dropped"] > 0
+        assert stats["audio"]["sent"] + stats["audio"]["dropped"] == 1000
+
+    async def test_stalled_client_is_disconnected_when_control_lane_fills(self):
+        manager = ThreadSafeConnectionManager(enable_connection_limits=False)
+        ws = _SlowWebSocket(delay=3600)
+        conn_id = await manager.register(ws, client_type="dashboard", session_id="s1")
+        conn = manager._conns[conn_id]
+        conn.enqueue(encode_frame({"type": "status", "seq": -1}))
+        await _wait_for(lambda: conn.stats()["control"]["depth"] == 0)  # sender stalls on it
+
+        accepted = [conn.enqueue(encode_frame({"type": "status", "seq": i})) for i in range(101)]
+
+        assert accepted == [True] * 100 + [False]
+        await _wait_for(lambda: conn_id not in manager._conns)
+        assert ws.close_code == 1013
+        assert conn._sender_task.done()
+        assert conn.stats()["control"]["depth"] == 0
+        assert not conn.enqueue(encode_frame({"type": "status"}))
+        await manager.stop()
+
+
+class TestBargeIn:
+    async def _stop_latency(self, fifo: bool) -> tuple[float, _SlowWebSocket]:
+        ws = _SlowWebSocket(delay=0.002)
+        conn = await _connection(ws)
+        for i in range(100):
+            await conn.send_json(_audio(i))
+        await asyncio.sleep(0)
+
+        queued_at = time.perf_counter()
+        if fifo:
+            # A single FIFO queue (the previous design): the stop waits behind every frame
+            await conn.send_text(encode_frame(STOP), "audio")
+        else:
+            await conn.send_json(STOP)
+        await _wait_for(lambda: "control" in ws.types())
+        sent_at = next(at for at, message in ws.sent if message.get("type") == "control")
+        await conn.close()
+        return sent_at - queued_at, ws
+
+    async def test_stop_skips_queued_audio(self):
+        fifo_latency, _ = await self._stop_latency(fifo=True)
+        lane_latency, ws = await self._stop_latency(fifo=False)
+
+        assert lane_latency < fifo_latency / 5
+        # At most the frame already on the wire goes out before the stop; none after it
+        assert ws.types().index("control") <= 1
+        assert ws.types()[-1] == "control"
+
+    async def test_stop_discards_queued_audio(self):
+        ws = _SlowWebSocket(delay=0.002)
+        conn = await _connection(ws)
+        for i in range(50):
+            await conn.send_json(_audio(i))
+        await asyncio.sleep(0)
+        await conn.send_json(STOP)
+        await conn.send_json(_audio(99))  # next response's audio is still delivered
+        await _wait_for(lambda: len(ws.sent) >= 3 and ws.types()[-1] == "audio_data")
+        await conn.close()
+
+        assert conn.stats()["audio"]["flushed"] >= 48
+        assert [m["frame_index"] for _, m in ws.sent if m["type"] == "audio_data"][-1] == 99
+
+
+class TestSender:
+    async def test_close_drains_queued_frames_then_stops(self):
+        ws = _SlowWebSocket(delay=0.001)
+        conn = await _connection(ws)
+        for seq in range(5):
+            await conn.send_json({"type": "status", "seq": seq})
+
+        await conn.close()
+
+        assert [m["seq"] for _, m in ws.sent] == [0, 1, 2, 3, 4]
+        assert conn._sender_task.done()
+        await conn.send_json({"type": "status", "seq": 5})
+        assert conn.stats()["control"]["enqueued"] == 5
+
+    async def test_idle_sender_waits_without_polling(self):
+        ws = _SlowWebSocket()
+        conn = await _connection(ws)
+        await asyncio.sleep(0.01)
+
+        # Parked on the ready event, not on a timed queue get
+        assert conn._ready._waiters
+        await conn.send_json({"type": "status"})
+        await _wait_for(lambda: ws.sent)
+        await conn.close()
+
+    async def test_manager_routes_and_reports_lanes(self):
+        manager = ThreadSafeConnectionManager(enable_connection_limits=False)
+        ws = _SlowWebSocket()
+        conn_id = await manager.register(
+            ws, client_type="dashboard", session_id="s1", topics={"dashboard"}
+        )
+
+        await manager.broadcast_topic("dashboard", {"type": "event", "topic": "dashboard"})
+        await manager.broadcast_session("s1", _audio(0))
+        await manager.send_to_connection(conn_id, STOP)
+        await _wait_for(lambda: len(ws.sent) == 3)
+
+        lanes = (await manager.stats())["lanes"]
+        assert lanes["telemetry"]["sent"] == 1
+        assert lanes["audio"]["sent"] == 1
+        assert lanes["control"]["sent"] == 1
+        await manager.stop()
+
+
+class _GatedWebSocket(_SlowWebSocket):
+    """Socket whose sends block until ``gate`` is set, like a stalled client."""
+
+    def __init__(self):
+        super().__init__()
+        self.gate = asyncio.Event()
+
+    async def send_text(self, message):
+        await self.gate.wait()
+        await super().send_text(message)
+
+
+class TestPlaybackLanes:
+    async def _playback(self, ws) -> tuple[TTSPlayback, ThreadSafeConnectionManager, str]:
+        manager = ThreadSafeConnectionManager(enable_connection_limits=False)
+        conn_id = await manager.register(ws, client_type="media", session_id="s1")
+        context = VoiceSessionContext(
+            session_id="s1", transport=TransportType.ACS, conn_id=conn_id, _websocket=ws
+        )
+        return TTSPlayback(context, SimpleNamespace(conn_manager=manager)), manager, conn_id
+
+    async def test_acs_audio_is_queued_on_the_audio_lane(self):
+        ws = _GatedWebSocket()
+        playback, manager, conn_id = await self._playback(ws)
+
+        finished = await playback._stream_to_acs(bytes(1280 * 20), False, None, "run-1")
+        await manager.send_to_connection(conn_id, {"kind": "StopAudio", "stopAudio": {}})
+        ws.gate.set()
+        await _wait_for(lambda: len(ws.sent) == 2)
+
+        # The stop went out right after the frame already on the wire
+        assert finished is True
+        assert [m.get("kind") for _, m in ws.sent] == ["AudioData", "StopAudio"]
+        assert manager._conns[conn_id].stats()["audio"]["flushed"] == 19
+        await manager.stop()
+
+    async def test_cancelled_playback_discards_queued_audio(self):
+        ws = _GatedWebSocket()
+        playback, manager, conn_id = await self._playback(ws)
+        for i in range(10):
+            await manager.send_to_connection(conn_id, _audio(i))
+        await asyncio.sleep(0)
+
+        playback.cancel()
+        finished = await playback._stream_to_browser(bytes(4800 * 5), None, "run-2")
+        ws.gate.set()
+        await manager.send_to_connection(conn_id, STOP)
+        await _wait_for(lambda: len(ws.sent) == 2)
+
+        assert finished is False
+        assert [m["type"] for _, m in ws.sent] == ["audio_data", "control"]
+        assert manager._conns[conn_id].stats()["audio"]["flushed"] == 9
+        await manager.stop()
@@ -0,0 +1,246 @@
+"""
+Tests for the bounded conversation window used by the cascade orchestrator.
+
+Covers:
+- Token budget, whole-turn eviction and tool_call/tool pairing
+- Pinned tool exchanges and the summary slot
+- Incremental sync and rebuild when the source list is replaced
+- CascadeOrchestratorAdapter history over 200-turn conversations
+- Per-turn assembly work independent of call length
+"""
+
+import json
+
+import pytest
+from apps.artagent.backend.voice.shared import context_window
+from apps.artagent.backend.voice.shared.context_window import (
+    SUMMARY_PREFIX,
+    ConversationWindow,
+    message_tokens,
+)
+from src.stateful.state_managment import MemoManager
+
+
+def _tool_exchange(turn: int) -> list[dict]:
+    call_id = f"call_{turn}"
+    assistant = {
+        "role": "assistant",
+        "content": None,
+        "tool_calls": [
+            {
+                "id": call_id,
+                "type": "function",
+                "function": {"name": "get_balance", "arguments": "{}"},
+            }
+        ],
+    }
+    tool = {
+        "tool_call_id": call_id,
+        "role": "tool",
+        "name": "get_balance",
+        "content": json.dumps({"balance": turn * 10}),
+    }
+    return [
+        {"role": "assistant", "content": json.dumps(assistant)},
+        {"role": "tool", "content": json.dumps(tool)},
+    ]
+
+
+def _append_turn(history: list[dict], turn: int, *, tools: bool = False) -> None:
+    history.append({"role": "user", "content": f"Question {turn}: " + "details " * 20})
+    if tools:
+        history.extend(_tool_exchange(turn))
+    history.append({"role": "assistant", "content": f"Answer {turn}. " + "words " * 30})
+
+
+def _tokens(messages: list[dict]) -> int:
+    return sum(message_tokens(m) for m in messages)
+
+
+def _assert_tool_pairing(messages: list[dict]) -> None:
+    """Every stored tool result directly follows its assistant tool_calls message."""
+    open_ids: set[str] = set()
+    for message in messages:
+        content = message.get("content") or ""
+        if message["role"] == "tool":
+            assert json.loads(content)["tool_call_id"] in open_ids
+        elif message["role"] == "assistant" and content.startswith("{"):
+            open_ids = {tc["id"] for tc in json.loads(content)["tool_calls"]}
+        else:
+            open_ids = set()
+
+
+class TestConversationWindow:
+    def test_short_history_is_returned_unchanged(self):
+        history: list[dict] = []
+        for turn in range(3):
+            _append_turn(history, turn, tools=turn == 1)
+        window = ConversationWindow(max_tokens=10_000)
+        assert window.history(history) == history
+
+    def test_prompt_is_bounded_over_200_turns(self):
+        history: list[dict] = []
+        window = ConversationWindow(max_tokens=1_500, pinned_tool_tokens=300, summary_tokens=200)
+        prefixes = set()
+        for turn in range(200):
+            _append_turn(history, turn, tools=turn % 5 == 0)
+            messages = window.history(history)
+            assert _tokens(messages) <= 1_500
+            assert messages[-1] is history[-1]
+            _assert_tool_pairing(messages)
+            prefixes.add(json.dumps(messages[:2]))
+
+        assert window.stats.ingested == len(history)
+        assert window.stats.evicted_turns > 150
+        # Low-water eviction keeps the prefix stable for several turns at a time
+        assert len(prefixes) < 200 // 2
+
+    def test_evicted_tool_results_are_pinned(self):
+        history: list[dict] = []
+        window = ConversationWindow(max_tokens=1_000, pinned_tool_tokens=300, summarize=False)
+        _append_turn(history, 0, tools=True)
+        for turn in range(1, 40):
+            _append_turn(history, turn)
+        messages = window.history(history)
+
+        assert history[0] not in messages
+        assert history[1] in messages and history[2] in messages
+        _assert_tool_pairing(messages)
+
+    def test_summary_folds_evicted_turns(self):
+        history: list[dict] = [{"role": "user", "content": "My account number is 12345"}]
+        history.append({"role": "assistant", "content": "Thanks"})
+        for turn in range(1, 40):
+            _append_turn(history, turn)
+        window = ConversationWindow(max_tokens=1_000, summary_tokens=200)
+        messages = window.history(history)
+
+        summary = messages[0]
+        assert summary["role"] == "system" and summary["content"].startswith(SUMMARY_PREFIX)
+        assert message_tokens(summary) <= 200
+        # Older lines are dropped first once the slot is full
+        assert "Question 1:" not in summary["content"]
+        assert "Question" in summary["content"]
+
+    def test_custom_summarizer(self):
+        history: list[dict] = []
+        for turn in range(30):
+            _append_turn(history, turn)
+        seen: list[int] = []
+
+        def summarizer(previous, evicted):
+            seen.append(len(evicted))
+            return "condensed"
+
+        window = ConversationWindow(max_tokens=800, summarizer=summarizer)
+        assert window.history(history)[0]["content"] == "condensed"
+        assert seen and seen[0] % 2 == 0
+
+    def test_only_new_messages_are_ingested(self):
+        history: list[dict] = []
+        window = ConversationWindow(max_tokens=100_000)
+        for turn in range(10):
+            _append_turn(history, turn)
+            window.sync(history)
+        assert window.stats.ingested == 20
+        assert window.stats.resets == 0
+
+    def test_replaced_or_edited_source_rebuilds(self):
+        history: list[dict] = []
+        _append_turn(history, 0)
+        window = ConversationWindow(max_tokens=100_000)
+        window.sync(history)
+
+        reloaded = [dict(m) for m in history]
+        assert window.history(reloaded) == reloaded
+        reloaded[-1] = {"role": "assistant", "content": "edited"}
+        assert window.history(reloaded)[-1]["content"] == "edited"
+        assert window.stats.resets == 2
+
+    def test_newest_turn_is_kept_even_if_oversized(self):
+        history = [{"role": "user", "content": "x" * 20_000}]
+        window = ConversationWindow(max_tokens=500)
+        assert window.history(history) == history
+
+
+class TestAdapterHistory:
+    @pytest.fixture
+    def adapter(self):
+        from apps.artagent.backend.registries.agentstore.base import ModelConfig, UnifiedAgent
+        from apps.artagent.backend.voice.speech_cascade.orchestrator import (
+            CascadeConfig,
+            CascadeOrchestratorAdapter,
+        )
+
+        agents = {
+            name: UnifiedAgent(
+                name=name,
+                description="test",
+                model=ModelConfig(deployment_id="gpt-4o"),
+                prompt_template="You are a test agent.",
+            )
+            for name in ("Concierge", "Billing")
+        }
+        return CascadeOrchestratorAdapter(
+            config=CascadeConfig(start_agent="Concierge", session_id="s1"), agents=agents
+        )
+
+    def test_history_is_bounded_and_includes_cross_agent_context(self, adapter):
+        cm = MemoManager(session_id="s1")
+        cm.append_to_history("Billing", "user", "I was double charged on my last invoice")
+        for turn in range(200):
+            cm.append_to_history("Concierge", "user", f"Question {turn}: " + "details " * 20)
+            cm.append_to_history("Concierge", "assistant", f"Answer {turn}. " + "words " * 30)
+            history = adapter._get_conversation_history(cm)
+
+        window = adapter._windows["Concierge"]
+        # The summary of evicted turns leads, ahead of the cross-agent context
+        assert history[0] is window.summary_message
+        assert history[0]["content"].startswith(SUMMARY_PREFIX)
+        assert history[1]["content"].startswith("I was double charged")
+        assert _tokens(history[:1] + history[2:]) <= window.max_tokens
+        assert history[-1]["content"].startswith("Answer 199.")
+        assert window.stats.ingested == 400
+
+    def test_windowed_history_reads_any_agent_thread(self, adapter):
+        cm = MemoManager(session_id="s1")
+        cm.append_to_history("Billing", "user", "I was double charged on my last invoice")
+
+        assert adapter.windowed_history(cm, "Billing") == cm.get_history("Billing")
+        assert adapter.windowed_history(cm) == []
+
+
+class TestWindowCost:
+    """Per-turn work must stay flat as the call grows (timings: tests/load)."""
+
+    @staticmethod
+    def _turn_work(monkeypatch, turns: int) -> tuple[int, int]:
+        measured = 0
+        counted = context_window.message_tokens
+
+        def counting(message):
+            nonlocal measured
+            measured += 1
+            return counted(message)
+
+        history: list[dict] = []
+        window = ConversationWindow(max_tokens=2_000)
+        for turn in range(turns):
+            _append_turn(history, turn, tools=turn % 5 == 0)
+            window.history(history)
+
+        monkeypatch.setattr(context_window, "message_tokens", counting)
+        ingested = window.stats.ingested
+        for turn in range(turns, turns + 20):
+            _append_turn(history, turn)
+            window.history(history)
+        monkeypatch.setattr(context_window, "message_tokens", counted)
+        return window.stats.ingested - ingested, measured
+
+    def test_assembly_work_is_flat(self, monkeypatch):
+        short_ingested, short_measured = self._turn_work(monkeypatch, 20)
+        long_ingested, long_measured = self._turn_work(monkeypatch, 2_000)
+
+        # Only the two new messages per turn are read, however long the call
+        assert short_ingested == long_ingested == 40
+        assert short_measured <= 60 and long_measured <= 60
@@ -0,0 +1,236 @@
+"""
+Tests for coalescing high-frequency UI envelopes per session.
+
+Covers:
+- Leading send plus latest-only trailing send within a frame
+- Finals, tool and control envelopes never dropped or overtaken by partials
+- Per-session isolation and direct (non-broadcast) delivery paths
+- Frame-close tasks held until done and cancelled on discard
+- Disabled coalescing (frame of 0 ms)
+"""
+
+import asyncio
+import random
+from types import SimpleNamespace
+
+import pytest
+from apps.artagent.backend.src.ws_helpers import shared_ws
+from apps.artagent.backend.src.ws_helpers.coalescer import EnvelopeCoalescer
+from apps.artagent.backend.src.ws_helpers.envelopes import make_event_envelope
+
+FRAME_MS = 40
+LABELS = ["user_transcript_partial", "voicelive_session_updated"]
+
+
+class _RecordingManager:
+    """Connection manager stand-in recording every delivery and publish."""
+
+    def __init__(self):
+        self.delivered: list[tuple[str, dict]] = []
+        self.published: list[tuple[str, str]] = []
+
+    async def broadcast_session(self, session_id, envelope):
+        self.delivered.append((session_id, envelope))
+        return 1
+
+    async def send_to_connection(self, conn_id, envelope):
+        self.delivered.append((envelope["session_id"], envelope))
+        return True
+
+    async def publish_session_envelope(self, session_id, envelope, *, event_label):
+        self.published.append((session_id, event_label))
+
+    def labels(self, session_id="s1"):
+        return [env["label"] for sid, env in self.delivered if sid == session_id]
+
+
+def _websocket(manager, session_id="s1", conn_id=None):
+    app = SimpleNamespace(state=SimpleNamespace(conn_manager=manager))
+    return SimpleNamespace(app=app, state=SimpleNamespace(session_id=session_id, conn_id=conn_id))
+
+
+def _envelope(label, session_id="s1"):
+    return {"type": "event", "session_id": session_id, "label": label}
+
+
+@pytest.fixture
+def coalescer(monkeypatch):
+    coalescer = EnvelopeCoalescer(FRAME_MS, LABELS)
+    monkeypatch.setattr(shared_ws, "_envelope_coalescer", coalescer)
+    return coalescer
+
+
+async def _partial(ws, label, session_id="s1"):
+    return await shared_ws.send_session_envelope(
+        ws,
+        _envelope(label, session_id),
+        session_id=session_id,
+        event_label="user_transcript_partial",
+        broadcast_only=True,
+    )
+
+
+async def _final(ws, label, session_id="s1", event_label="user_transcript"):
+    return await shared_ws.send_session_envelope(
+        ws,
+        _envelope(label, session_id),
+        session_id=session_id,
+        event_label=event_label,
+        broadcast_only=True,
+    )
+
+
+class TestEnvelopeCoalescer:
+    async def test_burst_sends_first_and_latest_only(self, coalescer):
+        manager = _RecordingManager()
+        ws = _websocket(manager)
+
+        for index in range(10):
+            assert await _partial(ws, f"p{index}")
+        assert manager.labels() == ["p0"]
+
+        await asyncio.sleep(FRAME_MS / 1000 * 1.5)
+        assert manager.labels() == ["p0", "p9"]
+        assert len(manager.published) == 2
+        assert coalescer.stats.replaced == 8
+
+    async def test_final_flushes_pending_partial_first_without_waiting(self, coalescer):
+        manager = _RecordingManager()
+        ws = _websocket(manager)
+
+        await _partial(ws, "p0")
+        await _partial(ws, "p1")
+        await _partial(ws, "p2")
+        await _final(ws, "final")
+
+        # Delivered before this test yields, so the frame timer cannot have sent p2
+        assert manager.labels() == ["p0", "p2", "final"]
+        await asyncio.sleep(FRAME_MS / 1000 * 2.5)
+        # Nothing trails after the final
+        assert manager.labels() == ["p0", "p2", "final"]
+
+    async def test_barrier_envelopes_are_never_dropped_or_reordered(self, coalescer):
+        manager = _RecordingManager()
+        ws = _websocket(manager)
+        rng = random.Random(7)
+        submitted: list[tuple[str, str]] = []
+
+        for index in range(200):
+            if rng.random() < 0.15:
+                kind = rng.choice(["tool_start", "tool_end", "barge_in_cancel", "user_transcript"])
+                await _final(ws, f"{kind}-{index}", event_label=kind)
+                submitted.append(("barrier", f"{kind}-{index}"))
+            else:
+                await _partial(ws, f"p{index}")
+                submitted.append(("partial", f"p{index}"))
+            await asyncio.sleep(rng.choice([0, 0, 0.005, 0.015]))
+        await asyncio.sleep(FRAME_MS / 1000 * 2.5)
+
+        delivered = manager.labels()
+        barriers = [label for kind, label in submitted if kind == "barrier"]
+        assert [label for label in delivered if not label.startswith("p")] == barriers
+
+        position = {label: index for index, (_, label) in enumerate(submitted)}
+        order = [position[label] for label in delivered]
+        assert order == sorted(order), "an envelope overtook one submitted earlier"
+
+        # The partial submitted last before each barrier is delivered before it
+        last_partial = None
+        for kind, label in submitted:
+            if kind == "partial":
+                last_partial = label
+            elif last_partial is not None:
+                assert delivered.index(last_partial) < delivered.index(label)
+                last_partial = None
+        assert delivered[-1] == submitted[-1][1] or submitted[-1][0] == "barrier"
+
+    async def test_sessions_are_coalesced_independently(self, coalescer):
+        manager = _RecordingManager()
+        ws_a = _websocket(manager, "a")
+        ws_b = _websocket(manager, "b")
+
+        await _partial(ws_a, "a0", "a")
+        await _partial(ws_a, "a1", "a")
+        await _partial(ws_b, "b0", "b")
+        await _final(ws_b, "b-final", "b")
+
+        assert manager.labels("a") == ["a0"]
+        assert manager.labels("b") == ["b0", "b-final"]
+        await asyncio.sleep(FRAME_MS / 1000 * 1.5)
+        assert manager.labels("a") == ["a0", "a1"]
+
+    async def test_direct_and_broadcast_paths_share_frames(self, coalescer):
+        manager = _RecordingManager()
+        ws = _websocket(manager, conn_id="conn-1")
+        app_state = ws.app.state
+
+        for index in range(3):
+            await shared_ws.send_session_envelope(
+                ws,
+                _envelope(f"u{index}"),
+                session_id="s1",
+                event_label="voicelive_session_updated",
+            )
+        sent = await shared_ws.broadcast_session_envelope(
+            app_state,
+            make_event_envelope("call_connected", {}, session_id="s1") | {"label": "connected"},
+            session_id="s1",
+            event_label="call_connected_event",
+        )
+
+        assert sent == 1
+        assert manager.labels() == ["u0", "u2", "connected"]
+
+    async def test_frame_close_tasks_are_held_and_cancelled_on_discard(self, coalescer):
+        gate = asyncio.Event()
+        sent: list[str] = []
+
+        def send(label):
+            async def deliver():
+                await gate.wait()
+                sent.append(label)
+
+            return deliver
+
+        first = asyncio.create_task(coalescer.submit("s1", LABELS[0], send("p0")))
+        await asyncio.sleep(0)
+        await coalescer.submit("s1", LABELS[0], send("p1"))
+        gate.set()
+        await first
+        gate.clear()
+        await coalescer.submit("s1", LABELS[0], send("p2"))
+
+        await asyncio.sleep(FRAME_MS / 1000 * 1.5)
+        frames = coalescer._sessions["s1"]
+        (task,) = frames.tasks  # frame close is blocked in send, strongly referenced
+        coalescer.discard("s1")
+        await asyncio.gather(task, return_exceptions=True)
+
+        assert task.cancelled()
+        assert not frames.tasks
+        assert sent == ["p0"]
+
+    async def test_repeated_partial_hypothesis_is_skipped(self, monkeypatch):
+        monkeypatch.setattr(shared_ws, "_envelope_coalescer", EnvelopeCoalescer(0, LABELS))
+        manager = _RecordingManager()
+        ws = _websocket(manager)
+
+        for text in ["yes", "yes", "yes that", "yes that"]:
+            await shared_ws.send_user_partial_transcript(ws, text)
+        await shared_ws.send_user_transcript(ws, "Yes that.", broadcast_only=True)
+        await shared_ws.send_user_partial_transcript(ws, "yes")
+
+        contents = [
+            env["payload"].get("data", env["payload"])["content"] for _, env in manager.delivered
+        ]
+        assert contents == ["yes", "yes that", "Yes that.", "yes"]
+
+    async def test_zero_frame_disables_coalescing(self, monkeypatch):
+        monkeypatch.setattr(shared_ws, "_envelope_coalescer", EnvelopeCoalescer(0, LABELS))
+        manager = _RecordingManager()
+        ws = _websocket(manager)
+
+        for index in range(5):
+            await _partial(ws, f"p{index}")
+
+        assert manager.labels() == [f"p{index}" for index in range(5)]
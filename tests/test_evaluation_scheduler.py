@@ -0,0 +1,275 @@
+"""
+Tests for concurrent scenario / variant execution in the evaluation harness.
+
+Covers:
+- ComparisonRunner running variants concurrently (peak in-flight turns)
+- Merged event shards and scores identical to a serial sweep
+- Turn order within each conversation
+- Global concurrency cap, per-model in-flight and per-minute limits
+- First failure stopping the sweep, shard merging
+"""
+
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+
+import pytest
+import yaml
+from apps.artagent.backend.evaluation import (
+    ComparisonRunner,
+    EvaluationScheduler,
+    EventRecorder,
+    MetricsScorer,
+    ScenarioRunner,
+)
+
+TURN_DELAY_S = 0.05
+TURNS = 3
+
+# Wall-clock values that legitimately differ between two executions
+_TIMING_FIELDS = {
+    "user_end_ts",
+    "agent_first_output_ts",
+    "agent_last_output_ts",
+    "e2e_ms",
+    "ttft_ms",
+    "start_ts",
+    "end_ts",
+    "duration_ms",
+}
+
+
+class FakeOrchestrator:
+    """Fixed per-turn delay, one deterministic tool call per turn."""
+
+    def __init__(self, agent_name, model_override, probe):
+        deployment = (model_override or {}).get("deployment_id", "unknown")
+        self._active_agent = agent_name
+        self.agents = {agent_name: SimpleNamespace(model=SimpleNamespace(deployment_id=deployment))}
+        self.deployment = deployment
+        self.probe = probe
+
+    async def process_turn(self, context, on_tts_chunk=None, on_tool_start=None, on_tool_end=None):
+        self.probe.enter(self.deployment, context)
+        try:
+            await on_tool_start("lookup_account", {"turn": context.turn_id})
+            await asyncio.sleep(TURN_DELAY_S)
+            await on_tool_end("lookup_account", {"balance": 1200, "turn": context.turn_id})
+        finally:
+            self.probe.exit(self.deployment)
+        history = len(context.conversation_history)
+        return SimpleNamespace(
+            response_text=f"{self.deployment} {context.turn_id}: balance is $1200 ({history})",
+            error=None,
+        )
+
+
+class Probe:
+    """Tracks in-flight turns per model and the history each turn saw."""
+
+    def __init__(self):
+        self.in_flight: dict[str, int] = {}
+        self.peak: dict[str, int] = {}
+        self.total_in_flight = 0
+        self.total_peak = 0
+        self.starts: dict[str, list[float]] = {}
+        self.history_lengths: dict[str, list[int]] = {}
+
+    def enter(self, deployment, context):
+        self.in_flight[deployment] = self.in_flight.get(deployment, 0) + 1
+        self.peak[deployment] = max(self.peak.get(deployment, 0), self.in_flight[deployment])
+        self.total_in_flight += 1
+        self.total_peak = max(self.total_peak, self.total_in_flight)
+        self.starts.setdefault(deployment, []).append(time.monotonic())
+        self.history_lengths.setdefault(context.session_id, []).append(
+            len(context.conversation_history)
+        )
+
+    def exit(self, deployment):
+        self.in_flight[deployment] -= 1
+        self.total_in_flight -= 1
+
+    def factory(self, agent_name, model_override):
+        return FakeOrchestrator(agent_name, model_override, self)
+
+
+def _write_comparison(path, variants):
+    comparison = {
+        "comparison_name": "sweep",
+        "variants": [
+            {"variant_id": v, "agent": "FraudAgent", "model_override": {"deployment_id": v}}
+            for v in variants
+        ],
+        "turns": [
+            {"turn_id": f"turn_{i}", "user_input": f"Question {i} about my account"}
+            for i in range(1, TURNS + 1)
+        ],
+    }
+    path.write_text(yaml.dump(comparison))
+    return path
+
+
+def _write_scenario(path, name, deployment):
+    scenario = {
+        "scenario_name": name,
+        "agent": "FraudAgent",
+        "model_override": {"deployment_id": deployment},
+        "metadata": {"session_id": name},
+        "turns": [
+            {"turn_id": f"turn_{i}", "user_input": f"{name} question {i}"}
+            for i in range(1, TURNS + 1)
+        ],
+    }
+    path.write_text(yaml.dump(scenario))
+    return path
+
+
+def _without_timing(value):
+    if isinstance(value, dict):
+        return {k: _without_timing(v) for k, v in value.items() if k not in _TIMING_FIELDS}
+    if isinstance(value, list):
+        return [_without_timing(v) for v in value]
+    return value
+
+
+def _normalized_events(path):
+    events = []
+    for line in path.read_text().splitlines():
+        event = _without_timing(json.loads(line))
+        event["session_id"] = event["session_id"].rsplit("_", 1)[0]  # drop the run timestamp
+        events.append(event)
+    return events
+
+
+def _comparable(summary):
+    return summary.model_dump(exclude={"run_id", "timestamp", "latency_metrics"})
+
+
+async def _run_comparison(tmp_path, name, variants, max_concurrency):
+    probe = Probe()
+    runner = ComparisonRunner(
+        _write_comparison(tmp_path / f"{name}.yaml", variants),
+        output_dir=tmp_path / name,
+        orchestrator_factory=probe.factory,
+        max_concurrency=max_concurrency,
+    )
+    results = await runner.run()
+    return results, probe, tmp_path / name / "sweep"
+
+
+class TestComparisonRunner:
+    async def test_variants_run_concurrently_with_identical_results(self, tmp_path):
+        variants = ["gpt-4o", "gpt-4o-mini", "o3-mini", "gpt-4.1"]
+
+        serial, serial_probe, serial_dir = await _run_comparison(tmp_path, "serial", variants, 1)
+        parallel, parallel_probe, parallel_dir = await _run_comparison(
+            tmp_path, "parallel", variants, None
+        )
+
+        # Every variant's conversation was in flight at once (speedup: tests/load)
+        assert serial_probe.total_peak == 1
+        assert parallel_probe.total_peak == len(variants)
+
+        assert list(parallel) == list(serial) == variants
+        for variant in variants:
+            assert _comparable(parallel[variant]) == _comparable(serial[variant])
+
+        merged = _normalized_events(parallel_dir / "events.jsonl")
+        assert merged == _normalized_events(serial_dir / "events.jsonl")
+        assert [(e["session_id"], e["turn_id"]) for e in merged] == [
+            (f"sweep_{v}", f"turn_{i}") for v in variants for i in range(1, TURNS + 1)
+        ]
+        assert (parallel_dir / "comparison.json").exists()
+
+
+class TestEvaluationScheduler:
+    def _runners(self, tmp_path, probe, deployments):
+        return {
+            f"scenario_{i}": ScenarioRunner(
+                _write_scenario(tmp_path / f"scenario_{i}.yaml", f"scenario_{i}", deployment),
+                output_dir=tmp_path / "runs",
+                orchestrator_factory=probe.factory,
+                run_id=f"scenario_{i}",
+            )
+            for i, deployment in enumerate(deployments)
+        }
+
+    async def test_global_cap_and_turn_order(self, tmp_path):
+        probe = Probe()
+        runners = self._runners(tmp_path, probe, [f"model-{i}" for i in range(8)])
+        scheduler = EvaluationScheduler(max_concurrency=4)
+
+        summaries = await scheduler.run(runners, merged_path=tmp_path / "merged.jsonl")
+
+        # 8 conversations, 4 at a time: the cap is reached and never exceeded
+        assert probe.total_peak == 4
+        assert list(summaries) == list(runners)
+        # Every conversation saw its own history grow turn by turn
+        assert all(lengths == [0, 2, 4] for lengths in probe.history_lengths.values())
+
+        scorer = MetricsScorer()
+        shards = [runner.events_path for runner in runners.values()]
+        merged = scorer.load_events(tmp_path / "merged.jsonl")
+        assert [e.model_dump() for e in merged] == [
+            e.model_dump() for e in scorer.load_shards(shards)
+        ]
+        aggregate = scorer.aggregate_shards(shards, scenario_name="sweep")
+        assert aggregate.total_turns == 8 * TURNS
+        assert aggregate.tool_metrics["total_calls"] == 8 * TURNS
+
+    async def test_per_model_in_flight_limit(self, tmp_path):
+        probe = Probe()
+        runners = self._runners(tmp_path, probe, ["gpt-4o"] * 4 + ["o3-mini"] * 2)
+        scheduler = EvaluationScheduler(max_concurrency=6, model_limits={"gpt-4o": 2})
+
+        await scheduler.run(runners)
+
+        assert probe.peak["gpt-4o"] == 2
+        assert probe.peak["o3-mini"] == 2
+
+    async def test_per_model_rate_limit(self, tmp_path):
+        probe = Probe()
+        runners = self._runners(tmp_path, probe, ["gpt-4o"] * 3)
+        scheduler = EvaluationScheduler(max_concurrency=3, model_rpm={"gpt-4o": 600})
+
+        await scheduler.run(runners)
+
+        starts = sorted(probe.starts["gpt-4o"])
+        gaps = [b - a for a, b in zip(starts, starts[1:], strict=False)]
+        assert len(starts) == 3 * TURNS
+        assert min(gaps) >= 0.1 * 0.9
+
+    async def test_first_failure_stops_sweep(self, tmp_path):
+        probe = Probe()
+        runners = self._runners(tmp_path, probe, ["gpt-4o", "o3-mini"])
+
+        def failing_factory(agent_name, model_override):
+            if model_override["deployment_id"] == "o3-mini":
+                raise RuntimeError("deployment unavailable")
+            return probe.factory(agent_name, model_override)
+
+        runners["scenario_1"].orchestrator_factory = failing_factory
+
+        with pytest.raises(RuntimeError, match="deployment unavailable"):
+            await EvaluationScheduler(max_concurrency=2).run(runners)
+        await asyncio.sleep(0)
+        assert probe.in_flight["gpt-4o"] == 0
+
+    def test_rejects_invalid_concurrency(self):
+        with pytest.raises(ValueError):
+            EvaluationScheduler(max_concurrency=0)
+
+
+def test_merge_shards_is_ordered_and_skips_missing(tmp_path):
+    first = tmp_path / "a_events.jsonl"
+    second = tmp_path / "b_events.jsonl"
+    first.write_text('{"n": 1}\n{"n": 2}\n')
+    second.write_text('{"n": 3}')
+
+    count = EventRecorder.merge_shards(
+        [second, tmp_path / "missing.jsonl", first], tmp_path / "merged.jsonl"
+    )
+
+    assert count == 3
+    assert (tmp_path / "merged.jsonl").read_text() == '{"n": 3}\n{"n": 1}\n{"n": 2}\n'
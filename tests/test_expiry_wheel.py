@@ -0,0 +1,206 @@
+"""
+Tests for the hierarchical expiry wheel and the registries enrolled in it.
+
+Covers:
+- ExpiryWheel: TTL expiry within one tick, touch / re-schedule / cancel,
+  deadlines cascading from higher levels and past the top level, async callbacks
+- ThreadSafeSessionManager: idle sessions evicted, activity pushing expiry back
+- VoiceLive orchestrator registry: orphaned orchestrators released, live ones re-checked
+- ConnectionManager: disconnected sockets unregistered, call-context TTL, empty indexes dropped
+- Expiry benchmark parity (wheel and full scan expire the same entries;
+  loop-blocking time is reported by tests/load/expiry_wheel_benchmark.py)
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.websockets import WebSocketState
+from src.pools.connection_manager import ThreadSafeConnectionManager
+from src.pools.expiry_wheel import ExpiryWheel
+from src.pools.session_manager import ThreadSafeSessionManager
+
+from tests.load import expiry_wheel_benchmark as bench
+
+
+class _Clock:
+    now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return _Clock()
+
+
+@pytest.fixture
+def wheel(clock):
+    return ExpiryWheel(tick_s=1.0, clock=clock, autostart=False)
+
+
+def _advance(wheel: ExpiryWheel, clock: _Clock, seconds: float) -> list:
+    clock.now += seconds
+    return wheel.advance()
+
+
+class TestExpiryWheel:
+    def test_expires_within_one_tick_and_never_early(self, wheel, clock):
+        expired = []
+        wheel.schedule("a", 10, expired.append)
+        wheel.schedule("b", 2.5, expired.append)
+
+        assert _advance(wheel, clock, 2) == []
+        assert _advance(wheel, clock, 1) == ["b"]
+        assert _advance(wheel, clock, 6.9) == []
+        assert _advance(wheel, clock, 0.1) == ["a"]
+        assert expired == ["b", "a"]
+        assert len(wheel) == 0
+
+    def test_touch_reschedule_and_cancel(self, wheel, clock):
+        wheel.schedule("idle", 5)
+        wheel.schedule("busy", 5)
+        wheel.schedule("gone", 5)
+        wheel.cancel("gone")
+
+        for _ in range(4):
+            _advance(wheel, clock, 1)
+            wheel.touch("busy")
+        assert _advance(wheel, clock, 1) == ["idle"]
+        assert wheel.touch("busy", ttl_s=1)  # shorter TTL takes effect immediately
+        assert _advance(wheel, clock, 1) == ["busy"]
+        assert not wheel.touch("gone")
+        assert wheel.stats()["expired_total"] == 2
+
+    @pytest.mark.parametrize("ttl_s", [63, 64, 65, 4095, 4097, 300_000])
+    def test_long_deadlines_cascade_to_the_right_tick(self, clock, ttl_s):
+        wheel = ExpiryWheel(tick_s=1.0, levels=3, clock=clock, autostart=False)
+        _advance(wheel, clock, 17)  # start off a level boundary
+        wheel.schedule("k", ttl_s)
+        wheel.schedule("anchor", 10 * ttl_s)  # keeps the wheel from jumping idle stretches
+
+        assert _advance(wheel, clock, ttl_s - 1) == []
+        assert _advance(wheel, clock, 1) == ["k"]
+
+    def test_async_callbacks_are_scheduled(self, clock):
+        wheel = ExpiryWheel(clock=clock, autostart=False)
+        released = []
+
+        async def release(key):
+            released.append(key)
+
+        async def scenario():
+            wheel.schedule("s1", 1, release)
+            _advance(wheel, clock, 1)
+            await asyncio.sleep(0)
+
+        asyncio.run(scenario())
+        assert released == ["s1"]
+
+    async def test_driver_expires_on_the_running_loop(self):
+        wheel = ExpiryWheel(tick_s=0.01)
+        expired = asyncio.Event()
+        wheel.schedule("k", 0.02, lambda key: expired.set())
+
+        await asyncio.wait_for(expired.wait(), timeout=2)
+        assert wheel.stats()["driver_running"]
+        await wheel.stop()
+
+
+def _websocket(state=WebSocketState.CONNECTED):
+    return SimpleNamespace(
+        state=SimpleNamespace(),
+        client_state=state,
+        application_state=state,
+        send_text=_noop,
+        close=_noop,
+    )
+
+
+async def _noop(*args, **kwargs):
+    return None
+
+
+class TestRegistries:
+    async def test_idle_sessions_expire_and_activity_extends_them(self, wheel, clock):
+        manager = ThreadSafeSessionManager(idle_ttl_s=60, expiry=wheel)
+        ws = _websocket()
+        await manager.add_session("idle", MagicMock(), ws)
+        await manager.add_session("active", MagicMock(), _websocket())
+
+        _advance(wheel, clock, 45)
+        await manager.set_metadata("active", "turn", 3)
+        _advance(wheel, clock, 15)
+
+        assert await manager.get_session_context("idle") is None
+        assert not hasattr(ws.state, "session_context")
+        assert await manager.get_session_count() == 1
+        _advance(wheel, clock, 60)
+        assert await manager.get_session_count() == 0
+
+        await manager.add_session("removed", MagicMock(), _websocket())
+        await manager.remove_session("removed")
+        assert len(wheel) == 0
+
+    def test_orphaned_orchestrators_are_released(self, wheel, clock, monkeypatch):
+        from apps.artagent.backend.voice.voicelive import orchestrator as module
+
+        monkeypatch.setattr(module, "get_expiry_wheel", lambda: wheel)
+        module._voicelive_orchestrators.clear()
+        live = SimpleNamespace(conn=MagicMock(), agents={"Concierge": MagicMock()})
+        orphan = SimpleNamespace(conn=MagicMock(), agents={"Concierge": MagicMock()})
+        module.register_voicelive_orchestrator("live", live)
+        module.register_voicelive_orchestrator("orphan", orphan)
+
+        orphan.conn, orphan.agents = None, {}
+        _advance(wheel, clock, module.ORCHESTRATOR_CHECK_INTERVAL_S)
+
+        assert module.get_voicelive_orchestrator("orphan") is None
+        assert module.get_voicelive_orchestrator("live") is live
+        assert ("voicelive_orchestrator", "live") in wheel
+        module.unregister_voicelive_orchestrator("live")
+        assert len(wheel) == 0
+
+    async def test_disconnected_sockets_and_unclaimed_call_contexts(self, wheel, clock):
+        manager = ThreadSafeConnectionManager(
+            enable_connection_limits=False,
+            liveness_check_s=30,
+            call_context_ttl_s=600,
+            expiry=wheel,
+        )
+        dropped = _websocket()
+        await manager.register(dropped, session_id="s1", topics={"dashboard"})
+        kept = await manager.register(_websocket(), session_id="s2")
+        await manager.set_call_context("call-1", {"session_id": "s1"})
+        await manager.set_call_context("call-2", {"session_id": "s2"})
+
+        dropped.client_state = WebSocketState.DISCONNECTED
+        _advance(wheel, clock, 30)
+        await asyncio.sleep(0)
+
+        stats = await manager.stats()
+        assert stats["connections"] == 1
+        assert stats["by_session"] == {"s2": 1}
+        assert "dashboard" not in stats["by_topic"]
+        assert await manager.get_connection_meta(kept) is not None
+
+        _advance(wheel, clock, 500)
+        assert await manager.get_call_context("call-1") is not None  # lookup extends it
+        await manager.pop_call_context("call-2")
+        _advance(wheel, clock, 100)
+        assert await manager.get_call_context("call-1") is not None
+        _advance(wheel, clock, 600)
+        assert await manager.get_call_context("call-1") is None
+
+        await manager.stop()
+        assert len(wheel) == 0
+
+
+class TestBenchmark:
+    def test_wheel_expires_the_same_entries_as_a_full_scan(self):
+        report = bench.run(entries=20_000, minutes=2, repeat=2)
+
+        assert report["wheel"]["expired"] == report["scan"]["expired"]
+        assert report["wheel"]["resident_after"] == report["scan"]["resident_after"]
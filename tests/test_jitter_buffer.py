@@ -0,0 +1,340 @@
+"""
+Tests for the ACS inbound jitter buffer.
+
+Covers:
+- Timestamp ordering, late and duplicate frames
+- Silence concealment of short gaps, collapse of long gaps and excess silence
+- Adaptive target depth, overflow bound, underrun and rebuffering
+- ACSInboundDecoder routing (fast path and json fallback) by ACS timestamp
+- Real-time pacer on the event loop
+- Replay of cached load-test audio over a jittery, lossy, reordering network
+"""
+
+import asyncio
+import base64
+import json
+import time
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from apps.artagent.backend.voice.speech_cascade.acs_inbound import (
+    ACSInboundDecoder,
+    acs_timestamp_ms,
+)
+from apps.artagent.backend.voice.speech_cascade.jitter_buffer import InboundJitterBuffer
+
+from tests.load import jitter_buffer_benchmark as bench
+
+FRAME_BYTES = 640
+START = datetime(2026, 10, 18, 12, 0, tzinfo=UTC)
+START_MS = START.timestamp() * 1000
+
+
+def _frame(n: int) -> bytes:
+    return (n + 1).to_bytes(2, "little") * (FRAME_BYTES // 2)
+
+
+def _index(pcm: bytes) -> int | None:
+    """Frame number encoded by ``_frame`` (None for silence)."""
+    return int.from_bytes(pcm[:2], "little") - 1 if any(pcm) else None
+
+
+class Harness:
+    """Virtual clock + sink recording which frame indices were written."""
+
+    def __init__(self, **kwargs):
+        self.now = 0.0
+        self.writes: list[tuple[float, bytes]] = []
+        kwargs.setdefault("paced", False)
+        self.buffer = InboundJitterBuffer(
+            lambda pcm: self.writes.append((self.now, pcm)), clock=lambda: self.now, **kwargs
+        )
+
+    def push(self, n, at=None, silent=False):
+        # Default: the frame arrives on time, or now if it is already overdue
+        self.now = at if at is not None else max(self.now, n * 0.02)
+        pcm = bytes(FRAME_BYTES) if silent else _frame(n)
+        self.buffer.push(START_MS + n * 20, pcm, silent)
+
+    def tick(self, count=1):
+        for _ in range(count):
+            self.buffer.tick()
+            self.now += self.buffer.release_ms / 1000
+
+    @property
+    def frames(self) -> list[int | None]:
+        out = []
+        for _, pcm in self.writes:
+            out += [_index(pcm[i : i + FRAME_BYTES]) for i in range(0, len(pcm), FRAME_BYTES)]
+        return out
+
+
+class TestOrdering:
+    def test_reorders_by_timestamp(self):
+        h = Harness()
+        for n in (0, 2, 1, 3):
+            h.push(n)
+        h.tick(4)
+
+        assert h.frames == [0, 1, 2, 3]
+        assert h.buffer.stats.reordered_frames == 1
+        assert h.buffer.stats.released_frames == 4
+
+    def test_late_and_duplicate_frames_are_dropped(self):
+        h = Harness(min_depth_ms=20)
+        h.push(0)
+        h.push(1)
+        h.tick(2)
+        h.push(0)
+        h.push(2)
+        h.push(2)
+        h.tick(2)
+
+        assert h.frames == [0, 1, 2]
+        assert h.buffer.stats.late_frames == 1
+        assert h.buffer.stats.duplicate_frames == 1
+
+    def test_earlier_frame_before_playout_is_kept(self):
+        h = Harness()
+        h.push(1)
+        h.push(0)
+        h.push(2)
+        h.tick(3)
+
+        assert h.frames == [0, 1, 2]
+        assert h.buffer.stats.late_frames == 0
+
+    def test_frames_without_timestamp_keep_arrival_order(self):
+        h = Harness()
+        for n in range(3):
+            h.buffer.push(None, _frame(n))
+        h.tick(3)
+
+        assert h.frames == [0, 1, 2]
+
+
+class TestGaps:
+    def test_short_gap_is_concealed_with_silence(self):
+        h = Harness(max_conceal_ms=60)
+        for n in (0, 1, 4, 5):
+            h.push(n)
+        h.tick(6)
+
+        assert h.frames == [0, 1, None, None, 4, 5]
+        assert h.buffer.stats.concealed_frames == 2
+
+    def test_long_gap_is_collapsed(self):
+        h = Harness(max_conceal_ms=40, max_depth_ms=400)
+        for n in (0, 1, 9, 10):
+            h.push(n)
+        h.tick(4)
+
+        assert h.frames == [0, 1, 9, 10]
+        assert h.buffer.stats.collapsed_frames == 7
+        assert h.buffer.stats.concealed_frames == 0
+
+    def test_timestamp_jump_resyncs_without_gap(self):
+        h = Harness()
+        h.push(0)
+        h.push(1)
+        h.buffer.push(START_MS + 3_600_000, _frame(2))
+        h.tick(3)
+
+        assert h.frames == [0, 1, 2]
+        assert h.buffer.stats.resyncs == 1
+
+
+class TestDepth:
+    def test_steady_arrivals_stay_at_min_depth(self):
+        h = Harness(min_depth_ms=40)
+        for n in range(200):
+            h.push(n, at=n * 0.02)
+            h.tick()
+
+        assert h.buffer.target_depth == 2
+        assert h.buffer.stats.underruns == 0
+        # Playout starts once two frames are held: one frame of added delay
+        assert h.writes[0][0] == pytest.approx(0.02)
+
+    def test_target_grows_with_bursty_arrivals(self):
+        h = Harness(min_depth_ms=40, max_depth_ms=400)
+        for n in range(60):
+            # Frames arrive five at a time every 100 ms
+            h.push(n, at=(n // 5 + 1) * 0.1)
+
+        assert h.buffer.target_depth == 4 + 2
+        assert h.buffer.stats.target_depth_ms == 120
+        assert h.buffer.stats.jitter_ms > 5
+
+    def test_overflow_bounds_depth(self):
+        h = Harness(max_depth_ms=100)
+        for n in range(12):
+            h.push(n)
+
+        assert h.buffer.depth == 5
+        assert h.buffer.stats.overflow_frames == 7
+        h.tick(5)
+        assert h.frames == [7, 8, 9, 10, 11]
+
+    def test_underrun_rebuffers_to_raised_target(self):
+        h = Harness(min_depth_ms=40)
+        h.push(0)
+        h.push(1)
+        h.tick(3)
+        assert h.buffer.stats.underruns == 1
+
+        h.push(2)  # 40 ms late
+        h.tick()
+        assert h.buffer.target_depth == 4
+        assert h.frames == [0, 1]
+        for n in (3, 4, 5):
+            h.push(n)
+        h.tick(4)
+        assert h.frames == [0, 1, 2, 3, 4, 5]
+
+    def test_excess_silence_is_collapsed_after_a_stall(self):
+        h = Harness(min_depth_ms=40, max_depth_ms=400, window_frames=25)
+        # A 300 ms stall delivered as one burst, then steady silence
+        for n in range(16):
+            h.push(n, at=0.3, silent=True)
+        for n in range(16, 216):
+            h.push(n, at=0.3 + (n - 15) * 0.02, silent=True)
+            h.tick()
+
+        assert h.buffer.stats.collapsed_frames > 0
+        assert h.buffer.depth <= h.buffer.target_depth + 1
+        assert h.buffer.stats.overflow_frames == 0
+
+    def test_release_window_concatenates_frames(self):
+        h = Harness(release_ms=40)
+        for n in range(4):
+            h.push(n)
+        h.tick(2)
+
+        assert [len(pcm) for _, pcm in h.writes] == [2 * FRAME_BYTES] * 2
+        assert h.frames == [0, 1, 2, 3]
+
+    def test_flush_writes_everything_in_order(self):
+        h = Harness(min_depth_ms=200)
+        for n in (2, 0, 1):
+            h.push(n)
+        h.buffer.flush()
+
+        assert h.frames == [0, 1, 2]
+        assert h.buffer.depth == 0
+
+
+def _acs_msg(n: int, *, silent: bool = False, indent: int | None = None) -> str:
+    timestamp = (START + timedelta(milliseconds=20 * n)).isoformat().replace("+00:00", "Z")
+    return json.dumps(
+        {
+            "kind": "AudioData",
+            "audioData": {
+                "timestamp": timestamp,
+                "participantRawID": "8:acs:caller",
+                "data": base64.b64encode(bytes(FRAME_BYTES) if silent else _frame(n)).decode(),
+                "silent": silent,
+            },
+        },
+        indent=indent,
+    )
+
+
+class TestDecoderRouting:
+    def test_acs_timestamp_parsing(self):
+        assert acs_timestamp_ms("2026-10-18T12:00:00.020Z") == START_MS + 20
+        assert acs_timestamp_ms("2026-10-18T12:00:00.0200000Z") == START_MS + 20
+        assert acs_timestamp_ms("not a time") is None
+        assert acs_timestamp_ms(None) is None
+
+    def test_frames_are_ordered_by_acs_timestamp(self):
+        h = Harness()
+        direct = []
+        decoder = ACSInboundDecoder(direct.append, jitter_buffer=h.buffer)
+
+        for n, indent in ((0, None), (2, 2), (1, None), (3, None)):
+            h.now = max(h.now, n * 0.02)
+            assert decoder.feed(_acs_msg(n, indent=indent)).kind == "AudioData"
+        h.now = 0.08
+        decoder.feed(_acs_msg(4).replace("/", "\\/"))  # forces the json fallback
+        h.now = 0.1
+        decoder.feed_message(json.loads(_acs_msg(5, silent=True)))
+        h.tick(6)
+
+        assert h.frames == [0, 1, 2, 3, 4, None]
+        assert direct == []
+        assert decoder.stats.frames == 6
+        assert decoder.stats.audio_bytes == 6 * FRAME_BYTES
+
+    def test_close_flushes_the_buffer(self):
+        h = Harness(min_depth_ms=200)
+        decoder = ACSInboundDecoder(lambda _: None, jitter_buffer=h.buffer)
+        decoder.feed(_acs_msg(1))
+        decoder.feed(_acs_msg(0))
+
+        decoder.close()
+        assert h.frames == [0, 1]
+
+
+class TestPacer:
+    async def test_releases_at_steady_cadence(self):
+        writes: list[float] = []
+        buffer = InboundJitterBuffer(lambda _: writes.append(time.monotonic()))
+
+        # 400 ms of audio delivered in four 100 ms bursts
+        for burst in range(4):
+            for n in range(burst * 5, burst * 5 + 5):
+                buffer.push(START_MS + n * 20, _frame(n))
+            await asyncio.sleep(0.1)
+        await asyncio.sleep(0.2)
+        buffer.close()
+
+        assert buffer.stats.released_frames == 20
+        gaps = [b - a for a, b in zip(writes, writes[1:], strict=False)]
+        # Paced writes (20 ms apart) rather than four bursts of five
+        assert len(writes) >= 15
+        assert sorted(gaps)[len(gaps) // 2] == pytest.approx(0.02, abs=0.008)
+
+    async def test_close_stops_the_pacer(self):
+        buffer = InboundJitterBuffer(lambda _: None)
+        buffer.push(START_MS, _frame(0))
+        task = buffer._task
+        assert task is not None
+
+        buffer.close()
+        await asyncio.sleep(0)
+        assert task.cancelled()
+        buffer.push(START_MS + 20, _frame(1))
+        assert buffer._task is None
+
+
+class TestReplay:
+    @pytest.fixture(scope="class")
+    def report(self):
+        return bench.run(seed=7, repeat=1)
+
+    def test_feed_is_steadier_than_arrivals(self, report):
+        direct, buffered = report["direct"], report["buffered"]
+
+        assert buffered["gap_std_ms"] < direct["gap_std_ms"] / 3
+        assert buffered["burst_max_ms"] == 20
+        assert direct["burst_max_ms"] >= 60
+
+    def test_capture_order_is_restored(self, report):
+        assert report["direct"]["misordered"] > 0
+        assert report["buffered"]["misordered"] == 0
+        assert report["buffered"]["late_frames"] <= report["buffered"]["frames"] * 0.01
+        assert report["buffered"]["concealed_frames"] > 0
+
+    def test_added_latency_is_bounded(self, report):
+        buffered = report["buffered"]
+
+        assert buffered["added_latency_max_ms"] <= bench.DEFAULT_MAX_DEPTH_MS + 20
+        assert buffered["peak_depth_ms"] <= bench.DEFAULT_MAX_DEPTH_MS
+
+    def test_clean_network_adds_little_latency(self):
+        report = bench.run(seed=7, repeat=1, stall_rate=0, loss=0, reorder=0, jitter_ms=1)
+
+        assert report["buffered"]["added_latency_p95_ms"] <= 80
+        assert report["buffered"]["underruns"] == 0
+        assert report["buffered"]["gap_max_ms"] == 20
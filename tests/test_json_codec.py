@@ -0,0 +1,201 @@
+"""
+Tests for the pluggable JSON codec.
+
+Covers:
+- Every WebSocket envelope type encoding identically on each backend
+- Stdlib-compatible semantics: non-string keys, UTF-8 text, ``default``,
+  sort_keys, big integers and ``NaN`` input, decode and encode errors
+- Identical output on every backend for ``Enum`` members and non-finite floats
+- Bytes in / bytes out, backend selection without orjson
+- Hot paths using the codec: session state, Redis envelope bus, ACS frames
+- Codec benchmark equivalence on every path
+"""
+
+import datetime
+import json
+from dataclasses import dataclass
+from enum import Enum
+from unittest.mock import AsyncMock
+
+import pytest
+from apps.artagent.backend.voice.speech_cascade.acs_inbound import ACSInboundDecoder
+from src.pools.connection_manager import ThreadSafeConnectionManager
+from src.stateful.state_managment import MemoManager
+from utils import json_codec
+
+from tests.load import json_codec_benchmark as bench
+
+BACKENDS = bench.available_backends()
+ENVELOPES = bench.sample_envelopes()
+
+
+class Lane(Enum):
+    AUDIO = "audio"
+    CONTROL = 2
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request):
+    previous = json_codec.BACKEND
+    yield json_codec.use_backend(request.param)
+    json_codec.use_backend(previous)
+
+
+def _stdlib(obj, **kwargs):
+    """What the stdlib backend writes (the reference output)."""
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), **kwargs)
+
+
+class TestEnvelopes:
+    @pytest.mark.parametrize("etype", sorted(ENVELOPES))
+    def test_every_envelope_type_encodes_identically(self, backend, etype):
+        envelope = ENVELOPES[etype]
+
+        text = json_codec.dumps(envelope)
+        assert text == _stdlib(envelope)
+        assert json_codec.dumpb(envelope) == text.encode("utf-8")
+        assert json_codec.loads(text) == envelope
+        assert json.loads(text) == envelope
+
+    def test_all_envelope_types_are_covered(self):
+        assert set(ENVELOPES) == {
+            "event",
+            "status",
+            "assistant",
+            "assistant_streaming",
+            "exit",
+            "error",
+            "debug",
+        }
+
+
+class TestSemantics:
+    def test_keys_and_text_match_the_stdlib(self, backend):
+        value = {"a": 1, 2: "é", None: [1.5, True], "emoji": "🎙️", "nested": {"x": [None]}}
+
+        assert json_codec.dumps(value) == _stdlib(value)
+        unsorted = {"b": 1, "a": {"d": 2, "c": 3}}
+        assert json_codec.dumps(unsorted, sort_keys=True) == _stdlib(unsorted, sort_keys=True)
+
+    def test_default_handles_what_the_stdlib_cannot(self, backend):
+        @dataclass
+        class Point:
+            x: int
+
+        value = {"at": datetime.datetime(2026, 10, 19, 12, 0), "p": Point(1)}
+
+        assert json_codec.dumps(value, default=str) == _stdlib(value, default=str)
+        with pytest.raises(TypeError):
+            json_codec.dumps(value)
+        with pytest.raises(TypeError):
+            json_codec.dumpb(object())
+
+    def test_values_only_the_stdlib_handles_fall_back(self, backend):
+        assert json_codec.dumps([2**70]) == "[1180591620717411303424]"
+        assert json_codec.loads('{"x": 1180591620717411303424}') == {"x": 2**70}
+        assert json_codec.loads('{"x": NaN}')["x"] != json_codec.loads('{"x": NaN}')["x"]
+
+    @pytest.mark.parametrize(
+        "value, kwargs, expected",
+        [
+            ({"lane": Lane.AUDIO, "n": [Lane.CONTROL]}, {}, '{"lane":"audio","n":[2]}'),
+            ({"b": Lane.AUDIO, "a": 1}, {"sort_keys": True}, '{"a":1,"b":"audio"}'),
+            ([Lane.CONTROL, datetime.date(2026, 10, 19)], {"default": str}, '[2,"2026-10-19"]'),
+            ([float("nan"), float("inf"), -float("inf"), 1.5], {}, "[null,null,null,1.5]"),
+            ({"x": {"y": (float("nan"),)}}, {"sort_keys": True}, '{"x":{"y":[null]}}'),
+            ({"nan": float("nan"), "big": 2**70}, {}, '{"nan":null,"big":1180591620717411303424}'),
+            ([datetime.date(2026, 10, 19)], {"default": lambda d: float("nan")}, "[null]"),
+        ],
+    )
+    def test_enums_and_non_finite_floats_match_on_every_backend(
+        self, backend, value, kwargs, expected
+    ):
+        assert json_codec.dumps(value, **kwargs) == expected
+        assert json_codec.dumpb(value, **kwargs) == expected.encode("utf-8")
+
+    def test_backends_agree_on_enums_and_non_finite_floats(self):
+        value = {"lane": Lane.AUDIO, "score": float("nan"), "ok": [Lane.CONTROL, -float("inf")]}
+        previous = json_codec.BACKEND
+        try:
+            outputs = {json_codec.use_backend(name): json_codec.dumps(value) for name in BACKENDS}
+        finally:
+            json_codec.use_backend(previous)
+
+        assert set(outputs.values()) == {'{"lane":"audio","score":null,"ok":[2,null]}'}
+
+    def test_invalid_input_raises_like_the_stdlib(self, backend):
+        with pytest.raises(json_codec.JSONDecodeError):
+            json_codec.loads("{not json")
+        with pytest.raises(ValueError):
+            json_codec.loads(b"")
+        with pytest.raises(TypeError):
+            json_codec.loads(None)
+
+    def test_bytes_input(self, backend):
+        raw = '{"k":"ü"}'.encode()
+
+        assert json_codec.loads(raw) == {"k": "ü"}
+        assert json_codec.loads(bytearray(raw)) == {"k": "ü"}
+        assert json_codec.loads(memoryview(raw)) == {"k": "ü"}
+
+    def test_stdlib_backend_without_orjson(self, monkeypatch):
+        previous = json_codec.BACKEND
+        monkeypatch.setattr(json_codec, "orjson", None)
+        try:
+            assert json_codec.use_backend("orjson") == "json"
+            assert json_codec.dumps({"a": [1, "é"]}) == '{"a":[1,"é"]}'
+            assert json_codec.loads(b'{"a":1}') == {"a": 1}
+        finally:
+            monkeypatch.undo()
+            json_codec.use_backend(previous)
+
+
+class TestHotPaths:
+    def test_session_state_round_trip(self, backend):
+        memo = MemoManager(session_id="s1")
+        memo.set_context("caller", "José")
+        memo.append_to_history("A", "user", "¿hola?")
+        stored = memo.to_redis_dict()
+
+        redis_mgr = AsyncMock()
+        redis_mgr.get_session_data = lambda key: stored
+        loaded = MemoManager.from_redis("s1", redis_mgr)
+
+        assert loaded.get_context("caller") == "José"
+        assert loaded.histories == memo.histories
+        assert json.loads(stored["corememory"]) == memo.context
+
+    async def test_envelope_bus_publishes_bytes_and_decodes_them(self, backend):
+        redis_mgr = AsyncMock()
+        manager = ThreadSafeConnectionManager(enable_connection_limits=False)
+        manager._redis_mgr = redis_mgr
+        envelope = ENVELOPES["event"]
+
+        assert await manager.publish_session_envelope("s1", envelope, event_label="agent_change")
+
+        _, payload = redis_mgr.publish_channel_async.call_args.args
+        assert isinstance(payload, bytes)
+        decoded = json_codec.loads(payload)
+        assert decoded["envelope"] == envelope
+        assert decoded["session_id"] == "s1"
+        await manager.stop()
+
+    def test_acs_fallback_frames_parse(self, backend):
+        decoder = ACSInboundDecoder(lambda pcm: None)
+        message = {"kind": "DtmfData", "dtmfData": {"data": "5"}}
+
+        result = decoder.feed(json.dumps(message, indent=2))
+
+        assert result.message == message
+        assert decoder.stats.fallback_parses == 1
+
+
+class TestBenchmark:
+    def test_every_path_is_equivalent_on_every_backend(self):
+        report = bench.run(repeat=1, turns=5, number=5)
+
+        assert report["default_backend"] == json_codec.BACKEND
+        for name, row in report["paths"].items():
+            for backend in report["backends"]:
+                assert row[f"{backend}_equivalent"], (name, backend)
+                assert row[f"{backend}_us"] > 0
@@ -0,0 +1,481 @@
+"""
+Tests for the shared email / SMS notification dispatcher.
+
+Covers:
+- Throughput with blocking fake transports under per-channel concurrency caps
+- Bounded threads (no thread per message) and bounded queues
+- Delivery ordering by priority, FIFO within a priority
+- Retry with backoff for retryable failures only: transient errors before
+  ACS accepted the send, never a send it already accepted
+- Rebinding to a new event loop fails what the stopped loop left behind
+- Precompiled templates rendered on the dispatcher
+- Graceful drain on shutdown, background API on and off the loop
+- SMS client reuse across sends
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+import src.acs  # noqa: F401  (the package re-exports instances over module names)
+from azure.core.exceptions import HttpResponseError, ServiceRequestError
+from src.acs.notification_dispatcher import (
+    SEND_THREADS,
+    NotificationDispatcher,
+    NotificationPriority,
+    run_blocking,
+)
+
+sms_module = sys.modules["src.acs.sms_service"]
+email_module = sys.modules["src.acs.email_service"]
+dispatcher_module = sys.modules["src.acs.notification_dispatcher"]
+
+SEND_S = 0.02
+
+
+class FakeTransport:
+    """Email + SMS transport with a blocking SDK call, like the Azure services."""
+
+    def __init__(self, send_s=SEND_S, failures=0, error=None, gate=None):
+        self.send_s = send_s
+        self.gate = gate
+        self.failures = failures
+        self.error = error
+        self.delivered: list[str] = []
+        self.attempts = 0
+        self.in_flight = 0
+        self.peak = 0
+        self.threads: set[int] = set()
+
+    def _blocking_send(self):
+        self.threads.add(threading.get_ident())
+        if self.gate is not None:
+            self.gate.wait()
+        time.sleep(self.send_s)
+
+    async def _send(self, key):
+        self.attempts += 1
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await run_blocking(self._blocking_send)
+        finally:
+            self.in_flight -= 1
+        if self.error is not None:
+            raise self.error
+        if self.failures:
+            self.failures -= 1
+            return {"success": False, "error": "throttled", "retryable": True}
+        self.delivered.append(key)
+        return {"success": True, "message_id": key}
+
+    async def send_email(self, email_address, subject, plain_text_body, html_body=None):
+        return await self._send(subject)
+
+    async def send_sms(self, to_phone_numbers, message, enable_delivery_report=True, tag=None):
+        return await self._send(message)
+
+
+def _dispatcher(transport, **kwargs):
+    kwargs.setdefault("backoff_base_s", 0.005)
+    return NotificationDispatcher(email_service=transport, sms_service=transport, **kwargs)
+
+
+class TestThroughput:
+    async def test_burst_runs_concurrently_on_bounded_threads(self):
+        transport = FakeTransport()
+        dispatcher = _dispatcher(transport, email_concurrency=6, sms_concurrency=2)
+        threads_before = threading.active_count()
+
+        futures = [
+            dispatcher.submit_email("a@example.com", f"email-{i}", "body") for i in range(160)
+        ]
+        futures += [dispatcher.submit_sms("+15550100", f"sms-{i}") for i in range(40)]
+        peak_threads = threading.active_count()
+        results = await asyncio.gather(*futures)
+        await dispatcher.shutdown()
+
+        assert all(r["success"] for r in results)
+        assert len(transport.delivered) == 200
+        # Every worker on both channels sends at once, and never more than that
+        assert transport.peak == 8
+        assert len(transport.threads) <= SEND_THREADS
+        assert peak_threads == threads_before  # submitting starts no threads
+        assert threading.active_count() <= threads_before + SEND_THREADS
+        assert dispatcher.stats()["sent"] == 200
+
+
+class TestOrdering:
+    async def test_priority_then_submission_order(self):
+        transport = FakeTransport(send_s=0.001)
+        dispatcher = _dispatcher(transport, email_concurrency=1)
+
+        futures = [
+            dispatcher.submit_email(
+                "a@example.com", "summary", "", priority=NotificationPriority.LOW
+            ),
+            dispatcher.submit_email("a@example.com", "confirm-1", ""),
+            dispatcher.submit_email("a@example.com", "otp", "", priority=NotificationPriority.HIGH),
+            dispatcher.submit_email("a@example.com", "confirm-2", ""),
+            dispatcher.submit_email("a@example.com", "confirm-3", ""),
+        ]
+        await asyncio.gather(*futures)
+        await dispatcher.shutdown()
+
+        assert transport.delivered == ["otp", "confirm-1", "confirm-2", "confirm-3", "summary"]
+
+    async def test_channels_do_not_block_each_other(self):
+        held = threading.Event()
+        email = FakeTransport(send_s=0.001, gate=held)
+        sms = FakeTransport(send_s=0.001)
+        dispatcher = NotificationDispatcher(
+            email_service=email, sms_service=sms, email_concurrency=1, sms_concurrency=1
+        )
+
+        slow = dispatcher.submit_email("a@example.com", "slow", "")
+        try:
+            result = await dispatcher.submit_sms("+15550100", "fast")
+
+            # The SMS went out while the only email worker was still stuck sending
+            assert result["success"] is True
+            assert email.in_flight == 1 and not slow.done()
+        finally:
+            held.set()
+        await slow
+        await dispatcher.shutdown()
+
+
+class TestRetryAndLimits:
+    async def test_retryable_failures_are_retried_with_backoff(self):
+        transport = FakeTransport(send_s=0.001, failures=2)
+        dispatcher = _dispatcher(transport, max_attempts=3)
+
+        result = await dispatcher.submit_sms("+15550100", "code")
+        await dispatcher.shutdown()
+
+        assert result["success"] is True
+        assert transport.attempts == 3
+        assert dispatcher.stats()["retried"] == 2
+
+    async def test_gives_up_after_max_attempts_and_retries_exceptions(self):
+        transport = FakeTransport(send_s=0.001, error=ServiceRequestError("connection reset"))
+        dispatcher = _dispatcher(transport, max_attempts=2)
+
+        result = await dispatcher.submit_email("a@example.com", "subject", "body")
+        await dispatcher.shutdown()
+
+        assert result["success"] is False
+        assert "reset" in result["error"]
+        assert transport.attempts == 2
+
+    async def test_non_transient_exceptions_are_not_retried(self):
+        transport = FakeTransport(send_s=0.001, error=ValueError("bad recipient"))
+        dispatcher = _dispatcher(transport, max_attempts=3)
+
+        result = await dispatcher.submit_email("a@example.com", "subject", "body")
+        await dispatcher.shutdown()
+
+        assert result["success"] is False
+        assert transport.attempts == 1
+
+    async def test_permanent_failures_are_not_retried(self):
+        class NotConfigured(FakeTransport):
+            async def send_email(self, *args, **kwargs):
+                self.attempts += 1
+                return {"success": False, "error": "not configured"}
+
+        transport = NotConfigured()
+        dispatcher = _dispatcher(transport)
+
+        result = await dispatcher.submit_email("a@example.com", "subject", "body")
+        await dispatcher.shutdown()
+
+        assert result == {"success": False, "error": "not configured"}
+        assert transport.attempts == 1
+
+    async def test_full_queue_rejects_instead_of_growing(self):
+        transport = FakeTransport(send_s=0.001)
+        dispatcher = _dispatcher(transport, max_queue=2, email_concurrency=1)
+        callback = MagicMock()
+
+        futures = [
+            dispatcher.submit_email("a@example.com", f"m{i}", "", callback=callback)
+            for i in range(4)
+        ]
+        results = await asyncio.gather(*futures)
+        await dispatcher.shutdown()
+
+        assert [r["success"] for r in results] == [True, True, False, False]
+        assert "queue full" in results[2]["error"]
+        assert callback.call_count == 4
+        assert dispatcher.stats()["rejected"] == 2
+
+
+def _http_error(status: int) -> HttpResponseError:
+    error = HttpResponseError(message=f"HTTP {status}")
+    error.status_code = status
+    return error
+
+
+@pytest.fixture
+def email_service(monkeypatch):
+    monkeypatch.setattr(email_module, "AZURE_EMAIL_AVAILABLE", True)
+    service = email_module.EmailService.__new__(email_module.EmailService)
+    service.sender_address = "noreply@contoso.com"
+    service.client = MagicMock()
+    return service
+
+
+@pytest.fixture
+def sms_service(monkeypatch):
+    monkeypatch.setattr(sms_module, "AZURE_SMS_AVAILABLE", True)
+    service = sms_module.SmsService.__new__(sms_module.SmsService)
+    service.from_phone_number = "+15550199"
+    service.client = MagicMock()
+    service.is_configured = lambda: True
+    service._get_client = lambda: service.client
+    return service
+
+
+class TestServiceRetryability:
+    @pytest.mark.parametrize(
+        "error, retryable",
+        [
+            (ServiceRequestError("connect timeout"), True),
+            (_http_error(429), True),
+            (_http_error(503), True),
+            (_http_error(400), False),
+            (ValueError("invalid recipient"), False),
+        ],
+    )
+    async def test_failed_submission(self, email_service, sms_service, error, retryable):
+        email_service.client.begin_send.side_effect = error
+        sms_service.client.send.side_effect = error
+
+        email = await email_service.send_email("a@example.com", "subject", "body")
+        sms = await sms_service.send_sms("+15550100", "body")
+
+        assert email["success"] is sms["success"] is False
+        assert email["retryable"] is sms["retryable"] is retryable
+
+    async def test_accepted_email_is_never_resent(self, email_service):
+        poller = MagicMock()
+        poller.result.side_effect = _http_error(503)
+        email_service.client.begin_send.return_value = poller
+        dispatcher = NotificationDispatcher(email_service=email_service, max_attempts=3)
+
+        result = await dispatcher.submit_email("a@example.com", "subject", "body")
+        await dispatcher.shutdown()
+
+        assert result["success"] is False
+        assert not result.get("retryable")
+        email_service.client.begin_send.assert_called_once()
+
+    async def test_throttled_submission_is_retried(self, email_service):
+        poller = MagicMock()
+        poller.result.return_value = SimpleNamespace(id="msg-1")
+        email_service.client.begin_send.side_effect = [_http_error(429), poller]
+        dispatcher = NotificationDispatcher(
+            email_service=email_service, max_attempts=3, backoff_base_s=0.001
+        )
+
+        result = await dispatcher.submit_email("a@example.com", "subject", "body")
+        await dispatcher.shutdown()
+
+        assert result == {
+            "success": True,
+            "message_id": "msg-1",
+            "service": "Azure Communication Services Email",
+        }
+        assert email_service.client.begin_send.call_count == 2
+
+
+class TestTemplates:
+    async def test_templates_render_on_the_dispatcher(self):
+        sent = []
+
+        class Capture(FakeTransport):
+            async def send_email(self, email_address, subject, plain_text_body, html_body=None):
+                sent.append((subject, plain_text_body, html_body))
+                return {"success": True}
+
+            async def send_sms(self, to, message, enable_delivery_report=True, tag=None):
+                sent.append(message)
+                return {"success": True}
+
+        dispatcher = _dispatcher(Capture())
+        await dispatcher.submit_email_template(
+            "a@example.com",
+            "mfa_code",
+            {"otp_code": "482913", "client_name": "Ana", "institution_name": "Contoso"},
+            priority=NotificationPriority.HIGH,
+        )
+        await dispatcher.submit_sms_template(
+            "+15550100", "claim_confirmation", {"claim_id": "CLM-9", "caller_name": "Ana"}
+        )
+        await dispatcher.shutdown()
+
+        subject, plain_text, html = sent[0]
+        assert subject == "Financial Services - Verification Code Required"
+        assert "482913" in plain_text and "482913" in html
+        assert "CLM-9" in sent[1]
+
+        with pytest.raises(ValueError, match="Unknown email template"):
+            dispatcher.submit_email_template("a@example.com", "nope", {})
+
+
+class TestShutdown:
+    async def test_drains_queued_messages(self):
+        transport = FakeTransport(send_s=0.01)
+        dispatcher = _dispatcher(transport, email_concurrency=2)
+
+        futures = [dispatcher.submit_email("a@example.com", f"m{i}", "") for i in range(20)]
+        await dispatcher.shutdown(timeout=5)
+
+        assert all(f.done() and f.result()["success"] for f in futures)
+        assert len(transport.delivered) == 20
+        assert not dispatcher.running
+
+    async def test_drain_timeout_resolves_undelivered(self):
+        transport = FakeTransport(send_s=0.2)
+        dispatcher = _dispatcher(transport, email_concurrency=1)
+
+        futures = [dispatcher.submit_email("a@example.com", f"m{i}", "") for i in range(5)]
+        await asyncio.sleep(0)
+        await dispatcher.shutdown(timeout=0.05)
+
+        results = [f.result() for f in futures]
+        assert all(
+            r == {"success": False, "error": "Notification dispatcher shut down"} for r in results
+        )
+
+    async def test_rejects_while_shutting_down(self):
+        transport = FakeTransport(send_s=0.05)
+        dispatcher = _dispatcher(transport)
+        dispatcher.submit_email("a@example.com", "first", "")
+
+        shutdown = asyncio.create_task(dispatcher.shutdown())
+        await asyncio.sleep(0)
+        late = await dispatcher.submit_email("a@example.com", "late", "")
+        await shutdown
+
+        assert late["success"] is False
+        assert transport.delivered == ["first"]
+
+
+class TestEventLoops:
+    def test_rebinding_fails_what_the_stopped_loop_left(self):
+        transport = FakeTransport(send_s=0.001)
+        dispatcher = _dispatcher(transport, email_concurrency=1)
+        results: list[dict] = []
+
+        async def submit(names):
+            for name in names:
+                dispatcher.submit_email("a@example.com", name, "", callback=results.append)
+
+        stopped = asyncio.new_event_loop()
+        stopped.run_until_complete(submit(["m0", "m1", "m2"]))
+        stopped.close()
+
+        async def submit_and_drain():
+            await submit(["m3"])
+            await dispatcher.shutdown()
+
+        asyncio.run(submit_and_drain())
+
+        assert transport.delivered == ["m3"]
+        assert [r["success"] for r in results] == [False, False, False, True]
+        assert dispatcher.stats()["failed"] == 3
+
+    async def test_refuses_a_second_running_loop(self):
+        transport = FakeTransport(send_s=0.001)
+        dispatcher = _dispatcher(transport)
+        other = asyncio.new_event_loop()
+        thread = threading.Thread(target=other.run_forever, daemon=True)
+        thread.start()
+        try:
+            asyncio.run_coroutine_threadsafe(dispatcher.start(), other).result(1)
+
+            with pytest.raises(RuntimeError, match="another event loop"):
+                dispatcher.submit_email("a@example.com", "subject", "")
+
+            asyncio.run_coroutine_threadsafe(dispatcher.shutdown(), other).result(1)
+        finally:
+            other.call_soon_threadsafe(other.stop)
+            thread.join(1)
+            other.close()
+
+
+class TestBackgroundApi:
+    @pytest.fixture
+    def dispatcher(self, monkeypatch):
+        dispatcher = NotificationDispatcher()
+        monkeypatch.setattr(dispatcher_module, "_dispatcher", dispatcher)
+        return dispatcher
+
+    @pytest.fixture
+    def service(self):
+        service = sms_module.SmsService()
+        transport = FakeTransport(send_s=0.001)
+        service.send_sms = transport.send_sms
+        service.transport = transport
+        return service
+
+    async def test_background_send_uses_dispatcher_not_a_thread(self, dispatcher, service):
+        done = asyncio.Event()
+        results = []
+
+        def callback(result):
+            results.append(result)
+            done.set()
+
+        threads_before = threading.active_count()
+        service.send_sms_background("+15550100", "hello", callback=callback)
+        assert threading.active_count() == threads_before
+
+        await asyncio.wait_for(done.wait(), 1)
+        await dispatcher.shutdown()
+        assert results[0]["success"] is True
+        assert service.transport.delivered == ["hello"]
+
+    async def test_background_send_from_worker_thread(self, dispatcher, service):
+        await dispatcher.start()
+        done = asyncio.Event()
+        loop = asyncio.get_running_loop()
+
+        def send_from_thread():
+            service.send_sms_background(
+                "+15550100", "from-thread", callback=lambda _: loop.call_soon(done.set)
+            )
+
+        await asyncio.to_thread(send_from_thread)
+        await asyncio.wait_for(done.wait(), 1)
+        await dispatcher.shutdown()
+        assert service.transport.delivered == ["from-thread"]
+
+
+async def test_sms_client_is_reused(monkeypatch):
+    client = MagicMock()
+    client.send.return_value = [
+        SimpleNamespace(to="+15550100", message_id="m1", http_status_code=202, successful=True)
+    ]
+    from_connection_string = MagicMock(return_value=client)
+    monkeypatch.setattr(
+        sms_module, "SmsClient", SimpleNamespace(from_connection_string=from_connection_string)
+    )
+    monkeypatch.setenv(
+        "AZURE_COMMUNICATION_SMS_CONNECTION_STRING", "endpoint=https://x;accesskey=y"
+    )
+    monkeypatch.setenv("AZURE_SMS_FROM_PHONE_NUMBER", "+15550199")
+    monkeypatch.setattr(sms_module, "AZURE_SMS_AVAILABLE", True)
+    service = sms_module.SmsService()
+
+    for _ in range(3):
+        assert (await service.send_sms("+15550100", "hi"))["success"] is True
+
+    from_connection_string.assert_called_once()
+    assert client.send.call_count == 3
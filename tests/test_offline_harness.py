@@ -0,0 +1,182 @@
+"""
+Tests for the offline end-to-end harness and its service stand-ins.
+
+Covers:
+- Energy-based utterance detection and tagged final transcripts
+- Streaming completions parsed by the real openai SDK through the fake transport
+- fakeredis-backed AzureRedisManager
+- Stage latency math and the report
+- A one-call end-to-end run of the harness in a subprocess
+"""
+
+import json
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+
+from tests.load import offline_harness  # noqa: E402
+from tests.load.utils import offline_services as fakes  # noqa: E402
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _tone(ms: int, amplitude: int = 4000) -> bytes:
+    samples = 16 * ms
+    t = np.arange(samples) / 16000
+    return (np.sin(2 * np.pi * 300 * t) * amplitude).astype("<i2").tobytes()
+
+
+def _silence(ms: int) -> bytes:
+    return bytes(32 * ms)
+
+
+@pytest.fixture
+def scheduler():
+    scheduler = fakes.CallbackScheduler()
+    yield scheduler
+    scheduler.stop()
+
+
+class TestFakeSpeechRecognizer:
+    def test_segments_utterances_and_tags_finals(self, scheduler):
+        recorder = fakes.StageRecorder()
+        scripts = fakes.CallScripts()
+        scripts.set("call-1", ["first question", "second question"])
+        timing = fakes.STTTiming(end_silence_ms=200, final_delay_ms=0, partial_interval_ms=100)
+        recognizer = fakes.FakeSpeechRecognizer(recorder, scripts, scheduler, timing)
+        recognizer.set_call_connection_id("call-1")
+
+        finals: list[str] = []
+        partials: list[str] = []
+        done = threading.Event()
+
+        def on_final(text, lang, speaker):
+            finals.append(text)
+            if len(finals) == 2:
+                done.set()
+
+        recognizer.set_partial_result_callback(lambda text, lang, speaker: partials.append(text))
+        recognizer.set_final_result_callback(on_final)
+        recognizer.start()
+
+        audio = _tone(400) + _silence(300) + _tone(300) + _silence(300)
+        # Odd chunk sizes exercise the block carry-over
+        for offset in range(0, len(audio), 1234):
+            recognizer.write_bytes(audio[offset : offset + 1234])
+
+        assert done.wait(2.0)
+        tags = recorder.call_tags["call-1"]
+        assert finals == [f"first question {tags[0]}", f"second question {tags[1]}"]
+        assert partials and all(fakes.find_tag(p) is None for p in partials)
+        assert all("speech_end" in recorder.marks[tag] for tag in tags)
+
+    def test_silence_only_produces_nothing(self, scheduler):
+        recorder = fakes.StageRecorder()
+        recognizer = fakes.FakeSpeechRecognizer(recorder, fakes.CallScripts(), scheduler)
+        recognizer.start()
+        recognizer.write_bytes(_silence(2000))
+        assert recorder.marks == {}
+
+
+class TestFakeOpenAI:
+    def test_streaming_through_real_sdk(self):
+        recorder = fakes.StageRecorder()
+        tag = recorder.new_tag("call-1")
+        transport = fakes.FakeOpenAITransport(
+            recorder, fakes.LLMTiming(ttft_ms=0, token_interval_ms=0)
+        )
+        client = fakes.create_fake_openai_client(transport, "https://offline.openai.azure.com")
+
+        stream = client.chat.completions.create(
+            model="gpt-4o",
+            messages=[{"role": "user", "content": f"hello {tag}"}],
+            stream=True,
+            stream_options={"include_usage": True},
+        )
+        text = ""
+        usage = None
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                text += chunk.choices[0].delta.content
+            if chunk.usage:
+                usage = chunk.usage
+
+        assert tag in text
+        assert usage is not None and usage.completion_tokens > 0
+        assert {"llm_request", "llm_first_token", "llm_done"} <= set(recorder.marks[tag])
+
+    def test_non_streaming_completion(self):
+        transport = fakes.FakeOpenAITransport(fakes.StageRecorder(), fakes.LLMTiming(ttft_ms=0))
+        client = fakes.create_fake_openai_client(transport, "https://offline.openai.azure.com")
+        response = client.chat.completions.create(
+            model="gpt-4o", messages=[{"role": "user", "content": "hi"}]
+        )
+        assert response.choices[0].message.content.startswith("Thanks")
+
+
+class TestOfflineBackends:
+    def test_redis_manager_uses_shared_fake_server(self):
+        manager_cls = fakes.create_offline_redis_manager_class(fakeredis.FakeServer())
+        first, second = manager_cls(), manager_cls()
+        first.redis_client.set("k", "v")
+        assert second.redis_client.get("k") == "v"
+
+    def test_synthesizer_marks_tagged_text(self):
+        recorder = fakes.StageRecorder()
+        tag = recorder.new_tag("call-1")
+        synth = fakes.FakeSpeechSynthesizer(recorder, fakes.TTSTiming(base_latency_ms=0))
+        pcm = synth.synthesize_to_pcm(f"Thanks {tag}.", sample_rate=16000)
+        assert len(pcm) > 0 and len(pcm) % 2 == 0
+        assert {"tts_request", "tts_done"} <= set(recorder.marks[tag])
+
+
+class TestReport:
+    def test_stage_latencies_skip_incomplete_turns(self):
+        marks = {
+            "utt0001": {"speech_end": 1.0, "stt_final": 1.2, "first_audio": 2.0},
+            "utt0002": {"speech_end": 5.0},
+        }
+        latencies = offline_harness.stage_latencies(marks)
+        assert latencies["stt_finalize"] == pytest.approx([200.0])
+        assert latencies["e2e"] == pytest.approx([1000.0])
+        assert latencies["llm_ttft"] == []
+
+    def test_percentiles(self):
+        stats = offline_harness.percentiles([float(v) for v in range(1, 101)])
+        assert stats["count"] == 100
+        assert stats["p50"] == pytest.approx(50.5)
+        assert offline_harness.percentiles([]) == {"count": 0}
+
+
+def test_end_to_end_single_call(tmp_path):
+    """Boot the backend offline and answer one caller turn."""
+    if not (ROOT / "tests" / "load" / "audio_cache" / "manifest.jsonl").exists():
+        pytest.skip("no cached load-test audio")
+    output = tmp_path / "report.json"
+    proc = subprocess.run(
+        [
+            sys.executable,
+            str(ROOT / "tests" / "load" / "offline_harness.py"),
+            "--calls=1",
+            "--max-turns=1",
+            "--speedup=4",
+            "--llm-ttft-ms=20",
+            "--log-level=error",
+            f"--output={output}",
+        ],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        timeout=180,
+    )
+    assert proc.returncode == 0, proc.stderr[-2000:]
+    report = json.loads(output.read_text())
+    assert report["turns"]["answered"] == 1
+    assert report["stages_ms"]["e2e"]["count"] == 1
+    assert report["errors"] == []
@@ -0,0 +1,128 @@
+"""
+Tests for PIIScrubber.
+
+Covers:
+- Redaction of each built-in PII type
+- Lead-character and per-pattern prefilter fast path
+- Byte-for-byte equivalence with sequential per-pattern substitution
+- Equivalence on the load benchmark's log and transcript mix
+"""
+
+import random
+import re
+
+import pytest
+from utils.pii_filter import _PII_PATTERNS, _PII_PREFILTERS, PIIScrubber, PIIScrubberConfig
+
+from tests.load import pii_scrub_benchmark as bench
+
+
+def _reference_scrub(scrubber: PIIScrubber, value: str) -> str:
+    """Original algorithm: apply every active pattern in order over the full string."""
+    if not scrubber.config.enabled or not value:
+        return value
+    result = value
+    for pattern, replacement in scrubber._active_patterns:
+        result = pattern.sub(replacement, result)
+    return result
+
+
+LOG_LINES = [
+    "Found %d results from local vector index",
+    "🔍 Searching knowledge base: '%s' in %s",
+    "Session session_4f36a724 started for call 9a1b2c3d-4e5f-6789-abcd-ef0123456789",
+    "TTS synthesis completed in 123.45ms (voice=en-US-JennyNeural)",
+    "[2026-10-18 21:44:19,313] INFO - websocket closed code=1000",
+    "Calling +1 (555) 123-4567 from +18165019907",
+    "Customer email is jane.doe@example.com, please confirm",
+    "SSN on file: 123-45-6789",
+    "Card ending 4111 1111 1111 1111 was declined",
+    "Peer 192.168.10.24 connected via 2001:0db8:85a3:0000:0000:8a2e:0370:7334",
+    "Correlation id 12345678901234567 with trailing 45(555)",
+    "Agent handoff: Concierge -> FraudAgent",
+    "",
+]
+
+TRANSCRIPT_LINES = [
+    "Hi, I'd like to check the status of my claim please.",
+    "Sure, my policy number is POL-2024-000123.",
+    "You can reach me at 555.867.5309 or at caller@contoso.org.",
+    "I think someone used my card for a purchase I didn't make.",
+    "Yes that's right, thank you so much for your help today.",
+]
+
+
+def _fuzz_corpus(n: int, seed: int = 1) -> list[str]:
+    frags = [
+        "+1", "1", "(555)", "555", "1234", "123", "45", "6789", "4111", "0000",
+        "192.168.", "10", "a@b.com", "x.y@ex.co", "abcd:", "ef01:", "::", "-", ".",
+        " ", "@", "foo", "\t", "12345678901234567", "2001:db8:0:0:0:0:2:1",
+    ]  # fmt: skip
+    rng = random.Random(seed)
+    return ["".join(rng.choice(frags) for _ in range(rng.randint(1, 12))) for _ in range(n)]
+
+
+@pytest.fixture
+def scrubber() -> PIIScrubber:
+    return PIIScrubber(PIIScrubberConfig(scrub_ip_addresses=True))
+
+
+class TestScrubString:
+    def test_redacts_builtin_types(self, scrubber):
+        assert "[PHONE_REDACTED]" in scrubber.scrub_string("call 555-123-4567")
+        assert scrubber.scrub_string("mail a@b.com") == "mail [EMAIL_REDACTED]"
+        assert scrubber.scrub_string("ssn 123-45-6789") == "ssn [SSN_REDACTED]"
+        assert "[CARD_REDACTED]" in scrubber.scrub_string("card 4111-1111-1111-1111")
+        assert "[IP_REDACTED]" in scrubber.scrub_string("ip 10.0.0.1")
+
+    def test_text_without_trigger_chars_is_returned_as_is(self, scrubber):
+        value = "No personal data in here at all"
+        assert scrubber.scrub_string(value) is value
+
+    def test_disabled_scrubber_is_noop(self):
+        disabled = PIIScrubber(PIIScrubberConfig(enabled=False))
+        assert disabled.scrub_string("a@b.com") == "a@b.com"
+
+    def test_ip_scrubbing_disabled_by_default(self):
+        default = PIIScrubber(PIIScrubberConfig())
+        assert default.scrub_string("ip 10.0.0.1") == "ip 10.0.0.1"
+
+    def test_custom_patterns_bypass_prefilter(self):
+        config = PIIScrubberConfig(custom_patterns=[(re.compile(r"POL-\w+-\w+"), "[POLICY]")])
+        custom = PIIScrubber(config)
+        assert custom.scrub_string("policy POL-2024-abc") == "policy [POLICY]"
+
+    def test_custom_pattern_without_digits_is_applied(self):
+        config = PIIScrubberConfig(custom_patterns=[(re.compile(r"secret", re.IGNORECASE), "[X]")])
+        custom = PIIScrubber(config)
+        assert custom.scrub_string("my SECRET") == "my [X]"
+
+    def test_prefilters_are_necessary_conditions(self):
+        for line in LOG_LINES + TRANSCRIPT_LINES + _fuzz_corpus(5_000, seed=3):
+            for (pattern, _, _), prefilter in zip(_PII_PATTERNS, _PII_PREFILTERS, strict=True):
+                if pattern.search(line):
+                    assert prefilter.search(line), (pattern.pattern, line)
+
+
+class TestEquivalence:
+    @pytest.mark.parametrize("ip", [True, False])
+    def test_matches_reference_on_corpus(self, ip):
+        scrubber = PIIScrubber(PIIScrubberConfig(scrub_ip_addresses=ip))
+        corpus = LOG_LINES + TRANSCRIPT_LINES + _fuzz_corpus(20_000)
+        for line in corpus:
+            assert scrubber.scrub_string(line) == _reference_scrub(scrubber, line), line
+
+    def test_matches_reference_with_types_disabled(self):
+        config = PIIScrubberConfig(scrub_phone_numbers=False, scrub_ssn=False)
+        scrubber = PIIScrubber(config)
+        assert len(scrubber._active_patterns) == len(_PII_PATTERNS) - 4
+        for line in LOG_LINES + _fuzz_corpus(5_000, seed=2):
+            assert scrubber.scrub_string(line) == _reference_scrub(scrubber, line), line
+
+
+class TestBenchmarkCorpus:
+    """Timing lives in tests/load/pii_scrub_benchmark.py; here only the output must agree."""
+
+    def test_benchmark_mix_matches_reference(self, scrubber):
+        for line in bench.corpus(scrubber, copies=1):
+            assert scrubber.scrub_string(line) == _reference_scrub(scrubber, line), line
@@ -0,0 +1,370 @@
+"""
+Tests for session-affinity routing of ACS callbacks across workers.
+
+Covers:
+- Ownership leases: claim, conflict, extension, take-over, pipelined renew
+  and release
+- Several in-process app instances sharing one Redis: the worker serving the
+  media WebSocket owns the call, the others forward its callbacks to it
+- Callbacks on the owner served from the media handler's live memo, with
+  fewer Redis operations than stateless processing
+- Unowned calls: webhooks never claim, the memo is reloaded per callback
+- Failover when the owner stops, when its listener is gone, when the lease
+  lapses and when the media stream reconnects elsewhere; release on close
+"""
+
+import asyncio
+from collections import Counter
+from types import SimpleNamespace
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+
+import apps.artagent.backend.api.v1.events as events_pkg  # noqa: E402
+import httpx  # noqa: E402
+from apps.artagent.backend.api.v1.endpoints import calls as calls_api  # noqa: E402
+from apps.artagent.backend.api.v1.endpoints import media as media_api  # noqa: E402
+from apps.artagent.backend.api.v1.events import (  # noqa: E402
+    ACSEventTypes,
+    CallEventProcessor,
+)
+from fastapi import FastAPI  # noqa: E402
+from src.pools.session_affinity import SessionAffinityRegistry  # noqa: E402
+from src.redis import leases  # noqa: E402
+from src.redis.manager import AzureRedisManager  # noqa: E402
+from src.stateful.state_managment import MemoManager  # noqa: E402
+
+CALL_ID = "call-0001"
+
+
+class _CountingRedis(fakeredis.FakeRedis):
+    """FakeRedis that counts round trips (single commands and pipeline executions)."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.round_trips = 0
+        self.commands: Counter[str] = Counter()
+
+    def execute_command(self, *args, **options):
+        self.round_trips += 1
+        self.commands[str(args[0]).upper()] += 1
+        return super().execute_command(*args, **options)
+
+    def pipeline(self, transaction=True, shard_hint=None):
+        pipe = super().pipeline(transaction, shard_hint)
+        execute = pipe.execute
+
+        def counted(*args, **kwargs):
+            self.round_trips += 1
+            return execute(*args, **kwargs)
+
+        pipe.execute = counted
+        return pipe
+
+
+class _FakeRedisManager(AzureRedisManager):
+    def __init__(self, client):
+        self._client = client
+        super().__init__(host="fake", access_key="fake", ssl=False, credential=object())
+
+    def _create_client(self):
+        self.redis_client = self._client
+
+
+class Worker:
+    """One app instance: its own Redis connection, affinity registry and routes."""
+
+    def __init__(self, server, name: str, processed: list, *, affinity: bool = True, **kwargs):
+        self.name = name
+        self.client = _CountingRedis(server=server, decode_responses=True)
+        self.redis = _FakeRedisManager(self.client)
+        self.affinity = (
+            SessionAffinityRegistry(self.redis, node_id=name, poll_interval_s=0.02, **kwargs)
+            if affinity
+            else None
+        )
+        self.app = FastAPI()
+        self.app.include_router(calls_api.router, prefix="/api/v1/calls")
+        self.app.state.name = name
+        self.app.state.redis = self.redis
+        self.app.state.acs_caller = object()
+        self.app.state.session_affinity = self.affinity
+        self.processed = processed
+
+    async def start(self, processor: CallEventProcessor) -> None:
+        if self.affinity:
+            await self.affinity.start()
+
+            async def process_forwarded(call_connection_id, events_data):
+                await processor.process_payload(events_data, self.app.state)
+
+            self.affinity.register_handler("acs_callback", process_forwarded)
+
+    def media_socket(self, memo: MemoManager | None = None) -> SimpleNamespace:
+        """A media WebSocket as the media endpoint sees it once its handler is created."""
+        memo = memo or MemoManager.from_redis(CALL_ID, self.redis)
+        return SimpleNamespace(
+            app=SimpleNamespace(state=self.app.state), state=SimpleNamespace(memo_manager=memo)
+        )
+
+    async def connect_media(self, memo: MemoManager | None = None) -> SimpleNamespace:
+        ws = self.media_socket(memo)
+        await media_api._claim_call(ws, CALL_ID)
+        return ws
+
+    async def callback(self, event_type: str, **data) -> dict:
+        transport = httpx.ASGITransport(app=self.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.post(
+                "/api/v1/calls/callbacks",
+                json=[{"type": event_type, "data": {"callConnectionId": CALL_ID, **data}}],
+            )
+        assert response.status_code == 200
+        return response.json()
+
+
+@pytest.fixture
+def server():
+    return fakeredis.FakeServer()
+
+
+@pytest.fixture
+async def cluster(server, monkeypatch):
+    """Factory for workers sharing one Redis and one recording event processor."""
+    processed: list[tuple[str, str]] = []
+    processor = CallEventProcessor()
+
+    async def record(context):
+        # Like the default handlers: update the call memo and persist it
+        memo = context.memo_manager
+        memo.update_context("last_webhook_event", context.event_type)
+        await memo.persist_to_redis_async(context.redis_mgr)
+        processed.append((context.app_state.name, context.event_type))
+
+    for event_type in (
+        ACSEventTypes.CALL_CONNECTED,
+        ACSEventTypes.PARTICIPANTS_UPDATED,
+        ACSEventTypes.CALL_DISCONNECTED,
+    ):
+        processor.register_handler(event_type, record)
+    monkeypatch.setattr(events_pkg, "get_call_event_processor", lambda: processor)
+    monkeypatch.setattr(events_pkg, "register_default_handlers", lambda: None)
+
+    workers: list[Worker] = []
+
+    async def make(name: str, *, start: bool = True, **kwargs) -> Worker:
+        worker = Worker(server, name, processed, **kwargs)
+        if start:
+            await worker.start(processor)
+        workers.append(worker)
+        return worker
+
+    make.processed = processed
+    yield make
+    for worker in workers:
+        if worker.affinity and worker.affinity.running:
+            await worker.affinity.stop()
+
+
+async def _settle(processed: list, count: int, timeout: float = 2.0) -> None:
+    """Wait until forwarded callbacks have been processed."""
+    deadline = asyncio.get_running_loop().time() + timeout
+    while len(processed) < count and asyncio.get_running_loop().time() < deadline:
+        await asyncio.sleep(0.01)
+
+
+class TestLeases:
+    def test_claim_conflict_and_extension(self):
+        client = fakeredis.FakeRedis(decode_responses=True)
+
+        assert leases.claim(client, "k", "a", 1000) == "a"
+        assert leases.claim(client, "k", "b", 1000) == "a"
+        client.pexpire(leases.lease_key("k"), 10)
+        assert leases.claim(client, "k", "a", 5000) == "a"
+        assert client.pttl(leases.lease_key("k")) > 1000
+        assert leases.get_owner(client, "k") == "a"
+
+    def test_take_over_replaces_the_owner(self):
+        client = fakeredis.FakeRedis(decode_responses=True)
+        leases.claim(client, "k", "a", 1000)
+
+        assert leases.claim(client, "k", "b", 5000, take_over=True) == "b"
+        assert client.pttl(leases.lease_key("k")) > 1000
+        assert leases.renew(client, ["k"], "a", 1000) == ["k"]
+
+    def test_renew_and_release_only_touch_own_leases(self):
+        client = fakeredis.FakeRedis(decode_responses=True)
+        for key in ("k1", "k2"):
+            leases.claim(client, key, "a", 1000)
+        leases.claim(client, "k3", "b", 1000)
+
+        assert leases.renew(client, ["k1", "k2", "k3"], "a", 60_000) == ["k3"]
+        assert client.pttl(leases.lease_key("k1")) > 1000
+        assert client.pttl(leases.lease_key("k3")) <= 1000
+        assert leases.release(client, ["k1", "k3"], "a") == 1
+        assert leases.get_owner(client, "k1") is None
+        assert leases.get_owner(client, "k3") == "b"
+
+
+class TestRouting:
+    async def test_callbacks_are_processed_by_the_media_worker(self, cluster):
+        workers = [await cluster(f"w{i}") for i in range(3)]
+        await workers[1].connect_media()
+
+        responses = [
+            await workers[i % 3].callback(ACSEventTypes.PARTICIPANTS_UPDATED) for i in range(9)
+        ]
+        await _settle(cluster.processed, 9)
+
+        assert [name for name, _ in cluster.processed] == ["w1"] * 9
+        assert sum(r.get("forwarded_to") == "w1" for r in responses) == 6
+        assert workers[1].affinity.owns(CALL_ID)
+        assert not workers[0].affinity.owns(CALL_ID)
+
+    async def test_callbacks_share_the_live_memo(self, cluster):
+        owner = await cluster("w0")
+        other = await cluster("w1")
+        ws = await owner.connect_media()
+        live = ws.state.memo_manager
+
+        # The media handler keeps writing to its memo between callbacks
+        live.append_to_history("Concierge", "user", "I need to file a claim")
+        await other.callback(ACSEventTypes.PARTICIPANTS_UPDATED)
+        await _settle(cluster.processed, 1)
+        live.update_context("caller_name", "Alice")
+        await owner.callback(ACSEventTypes.CALL_CONNECTED)
+
+        assert [name for name, _ in cluster.processed] == ["w0", "w0"]
+        assert live.get_context("last_webhook_event") == ACSEventTypes.CALL_CONNECTED
+        stored = MemoManager.from_redis(CALL_ID, other.redis)
+        assert stored.get_context("caller_name") == "Alice"
+        assert stored.get_history("Concierge")[-1]["content"] == "I need to file a claim"
+
+    async def test_fewer_redis_operations_than_stateless_processing(self, cluster):
+        async def run_call(prefix: str, affinity: bool) -> tuple[int, int]:
+            workers = [await cluster(f"{prefix}{i}", affinity=affinity) for i in range(2)]
+            if affinity:
+                await workers[0].connect_media()
+            for worker in workers:
+                worker.client.round_trips = 0
+                worker.client.commands.clear()
+            start = len(cluster.processed)
+            for i in range(20):
+                await workers[i % 2].callback(ACSEventTypes.PARTICIPANTS_UPDATED)
+            await _settle(cluster.processed, start + 20)
+            assert len(cluster.processed) == start + 20
+            round_trips = sum(worker.client.round_trips for worker in workers)
+            reloads = sum(worker.client.commands["HGETALL"] for worker in workers)
+            return round_trips, reloads
+
+        baseline, baseline_reloads = await run_call("stateless", affinity=False)
+        pinned, pinned_reloads = await run_call("pinned", affinity=True)
+
+        # Stateless workers reload the call memo from Redis on every callback
+        assert baseline_reloads == 20
+        assert pinned_reloads == 0
+        assert pinned < baseline
+
+    async def test_unowned_calls_reload_the_memo_per_callback(self, cluster):
+        first = await cluster("w0")
+        second = await cluster("w1")
+        await first.callback(ACSEventTypes.CALL_CONNECTED)
+
+        # Another writer persists the session between callbacks
+        voice = MemoManager.from_redis(CALL_ID, second.redis)
+        voice.append_to_history("Concierge", "user", "I need to file a claim")
+        await voice.persist_to_redis_async(second.redis)
+
+        response = await second.callback(ACSEventTypes.PARTICIPANTS_UPDATED)
+
+        assert "forwarded_to" not in response
+        assert [name for name, _ in cluster.processed] == ["w0", "w1"]
+        assert not first.affinity.owns(CALL_ID) and not second.affinity.owns(CALL_ID)
+        memo = MemoManager.from_redis(CALL_ID, first.redis)
+        assert memo.get_context("last_webhook_event") == ACSEventTypes.PARTICIPANTS_UPDATED
+        assert memo.get_history("Concierge")[-1]["content"] == "I need to file a claim"
+
+
+class TestFailover:
+    async def test_owner_shutdown_hands_over(self, cluster):
+        first = await cluster("w0")
+        second = await cluster("w1")
+        await first.connect_media()
+
+        await first.affinity.stop()
+        response = await second.callback(ACSEventTypes.PARTICIPANTS_UPDATED)
+
+        assert "forwarded_to" not in response
+        assert [name for name, _ in cluster.processed] == ["w1"]
+
+    async def test_dead_owner_is_bypassed_until_its_lease_lapses(self, cluster):
+        # Crashed worker: holds the lease but neither listens nor renews
+        crashed = await cluster("w0", start=False, lease_ttl_s=0.2)
+        await crashed.connect_media()
+        survivor = await cluster("w1", lease_ttl_s=0.2)
+
+        response = await survivor.callback(ACSEventTypes.PARTICIPANTS_UPDATED)
+        assert "forwarded_to" not in response
+        assert survivor.affinity.stats()["failovers"] == 1
+
+        await asyncio.sleep(0.25)
+        await survivor.callback(ACSEventTypes.PARTICIPANTS_UPDATED)
+        assert survivor.affinity.stats()["failovers"] == 1
+        assert [name for name, _ in cluster.processed] == ["w1", "w1"]
+
+    async def test_reconnected_media_stream_takes_the_call_over(self, cluster):
+        old = await cluster("w0", renew_interval_s=0.05)
+        new = await cluster("w1")
+        other = await cluster("w2")
+        old_ws = await old.connect_media()
+        await new.connect_media()
+
+        response = await other.callback(ACSEventTypes.PARTICIPANTS_UPDATED)
+        await _settle(cluster.processed, 1)
+        await asyncio.sleep(0.1)
+        await media_api._release_call(old_ws, CALL_ID)
+
+        assert response["forwarded_to"] == "w1"
+        assert [name for name, _ in cluster.processed] == ["w1"]
+        assert not old.affinity.owns(CALL_ID)
+        assert leases.get_owner(new.client, CALL_ID) == "w1"
+
+    async def test_renewal_keeps_leases_and_drops_lost_ones(self, cluster, server):
+        worker = await cluster("w0", lease_ttl_s=0.3, renew_interval_s=0.05)
+        assert await worker.affinity.claim(CALL_ID)
+        assert await worker.affinity.claim("call-0002")
+
+        await asyncio.sleep(0.5)
+        assert worker.affinity.owns(CALL_ID)
+
+        other = fakeredis.FakeRedis(server=server, decode_responses=True)
+        other.set(leases.lease_key("call-0002"), "w9")
+        await asyncio.sleep(0.1)
+
+        assert worker.affinity.owns(CALL_ID)
+        assert not worker.affinity.owns("call-0002")
+        assert worker.affinity.stats()["lost"] == 1
+
+    async def test_idle_release_skips_calls_held_by_a_media_stream(self, cluster):
+        worker = await cluster("w0", idle_timeout_s=0.0)
+        await worker.connect_media()
+        assert await worker.affinity.claim("call-0002")
+
+        await worker.affinity.renew()
+
+        assert worker.affinity.owns(CALL_ID)
+        assert not worker.affinity.owns("call-0002")
+
+    async def test_media_close_releases_the_call(self, cluster):
+        worker = await cluster("w0")
+        ws = await worker.connect_media()
+
+        # A stream re-claiming the call on the same worker keeps it
+        replacement = await worker.connect_media()
+        await media_api._release_call(ws, CALL_ID)
+        assert worker.affinity.owns(CALL_ID)
+
+        await media_api._release_call(replacement, CALL_ID)
+        assert not worker.affinity.owns(CALL_ID)
+        assert leases.get_owner(worker.client, CALL_ID) is None
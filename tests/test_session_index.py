@@ -0,0 +1,272 @@
+"""
+Tests for the Redis session activity index and the sessions listing endpoint.
+
+Covers:
+- Ordering, keyset cursors (including score ties) and active-set transitions
+- Lazy pruning of expired sessions and one-shot backfill from SCAN
+- MemoManager persistence writing summary fields and index entries
+- GET /api/v1/sessions paging through the index
+- Redis work per page independent of the number of stored sessions
+"""
+
+import json
+import time
+from collections import Counter
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+
+from apps.artagent.backend.api.v1.endpoints import sessions as sessions_api  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from src.redis import session_index  # noqa: E402
+from src.redis.manager import AzureRedisManager  # noqa: E402
+from src.stateful.state_managment import MemoManager  # noqa: E402
+
+
+class _CountingRedis(fakeredis.FakeRedis):
+    """FakeRedis that counts round trips and the commands sent, pipelined or not."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.round_trips = 0
+        self.commands: Counter[str] = Counter()
+
+    def execute_command(self, *args, **options):
+        self.round_trips += 1
+        self.commands[str(args[0]).upper()] += 1
+        return super().execute_command(*args, **options)
+
+    def pipeline(self, transaction=True, shard_hint=None):
+        pipe = super().pipeline(transaction, shard_hint)
+        execute = pipe.execute
+
+        def counted(*args, **kwargs):
+            self.round_trips += 1
+            self.commands.update(str(command[0][0]).upper() for command in pipe.command_stack)
+            return execute(*args, **kwargs)
+
+        pipe.execute = counted
+        return pipe
+
+
+class _FakeRedisManager(AzureRedisManager):
+    def __init__(self, client):
+        self._client = client
+        super().__init__(host="fake", access_key="fake", ssl=False, credential=object())
+
+    def _create_client(self):
+        self.redis_client = self._client
+
+
+@pytest.fixture
+def client():
+    return fakeredis.FakeRedis(decode_responses=True)
+
+
+def _seed(client, count: int, *, start: float = 1_000_000.0, corememory: str = "{}") -> None:
+    pipe = client.pipeline(transaction=False)
+    scores = {}
+    for i in range(count):
+        sid = f"session_{i:06d}"
+        pipe.hset(
+            f"session:{sid}",
+            mapping={"corememory": corememory, "turn_count": i % 7, "last_activity": start + i},
+        )
+        scores[sid] = start + i
+    pipe.execute()
+    client.zadd(session_index.ACTIVITY_KEY, scores)
+
+
+def _ids(page) -> list[str]:
+    return [entry.session_id for entry in page.entries]
+
+
+class TestIndexOperations:
+    def test_pages_are_newest_first_and_cover_everything(self, client):
+        _seed(client, 23)
+        seen, cursor = [], None
+        while True:
+            page = session_index.list_page(client, limit=5, cursor=cursor)
+            seen.extend(_ids(page))
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+        assert seen == [f"session_{i:06d}" for i in reversed(range(23))]
+        assert page.total_count == 23
+
+    def test_cursor_handles_score_ties(self, client):
+        for name in ("session_a", "session_b", "session_c", "session_d"):
+            client.hset(f"session:{name}", "turn_count", 1)
+        client.zadd(
+            session_index.ACTIVITY_KEY,
+            {"session_a": 5.0, "session_b": 5.0, "session_c": 5.0, "session_d": 4.0},
+        )
+        first = session_index.list_page(client, limit=2)
+        second = session_index.list_page(client, limit=2, cursor=first.next_cursor)
+        assert _ids(first) == ["session_c", "session_b"]
+        assert _ids(second) == ["session_a", "session_d"]
+        assert second.next_cursor is None
+
+    def test_active_set_follows_connect_and_disconnect(self, client):
+        client.hset("session:session_live", "turn_count", 0)
+        session_index.record_activity(client, "session_live", active=True)
+        assert _ids(session_index.list_page(client, limit=10, active_only=True)) == ["session_live"]
+
+        session_index.record_activity(client, "session_live", active=False)
+        page = session_index.list_page(client, limit=10, active_only=True)
+        assert page.entries == [] and page.active_count == 0
+        assert page.total_count == 1
+
+    def test_quiet_active_sessions_stay_active(self, client):
+        now = time.time()
+        for sid in ("session_quiet", "session_busy"):
+            client.hset(f"session:{sid}", "turn_count", 0)
+        session_index.record_activity(
+            client, "session_quiet", active=True, timestamp=now - 2 * 3600
+        )
+        session_index.record_activity(client, "session_busy", active=True, timestamp=now)
+
+        page = session_index.list_page(client, limit=10, active_only=True)
+        assert _ids(page) == ["session_busy", "session_quiet"]
+        assert page.active_count == 2
+
+    def test_active_sessions_of_a_crashed_worker_go_with_their_hash(self, client):
+        session_index.record_activity(client, "session_orphan", active=True)
+
+        page = session_index.list_page(client, limit=10, active_only=True)
+        assert page.entries == [] and page.active_count == 0
+
+    def test_sessions_past_the_hash_ttl_are_trimmed(self, client):
+        now = time.time()
+        retention = session_index.ACTIVITY_RETENTION_SEC
+        for i in range(5):
+            session_index.record_activity(client, f"session_gone{i}", timestamp=now - retention - i)
+        client.hset("session:session_live", "turn_count", 0)
+        session_index.record_activity(client, "session_live", timestamp=now)
+
+        assert client.zrange(session_index.ACTIVITY_KEY, 0, -1) == ["session_live"]
+        assert session_index.list_page(client, limit=10).total_count == 1
+
+    def test_unlisted_ids_are_ignored(self, client):
+        session_index.record_activity(client, "media_call-1", active=True)
+        assert client.zcard(session_index.ACTIVITY_KEY) == 0
+
+    def test_expired_sessions_are_pruned_and_page_is_filled(self, client):
+        _seed(client, 10)
+        for i in (9, 8, 6):
+            client.delete(f"session:session_{i:06d}")
+        page = session_index.list_page(client, limit=3)
+        assert _ids(page) == ["session_000007", "session_000005", "session_000004"]
+        assert page.total_count == 7
+
+    def test_invalid_cursor(self, client):
+        with pytest.raises(ValueError):
+            session_index.list_page(client, limit=5, cursor="garbage")
+
+    def test_rebuild_backfills_from_existing_hashes(self, client):
+        client.hset("session:session_1", mapping={"corememory": "{}", "last_activity": "50.0"})
+        client.hset("session:session_2", mapping={"corememory": "{}"})
+        client.hset("session:media_x", mapping={"corememory": "{}"})
+        assert session_index.rebuild(client) == 2
+        assert client.zscore(session_index.ACTIVITY_KEY, "session_1") == 50.0
+        assert client.zscore(session_index.ACTIVITY_KEY, "media_x") is None
+
+
+class TestPersistenceHooks:
+    def test_persist_writes_summary_and_index(self, client):
+        mgr = _FakeRedisManager(client)
+        memo = MemoManager(session_id="session_persist")
+        memo.append_to_history("Concierge", "user", "hi")
+        memo.append_to_history("Concierge", "assistant", "hello")
+
+        memo.persist_to_redis(mgr)
+
+        stored = client.hgetall("session:session_persist")
+        assert stored["turn_count"] == "2"
+        assert "chat_history" in stored
+        assert client.zscore(session_index.ACTIVITY_KEY, "session_persist") is not None
+
+    def test_delete_session_removes_index_entries(self, client):
+        mgr = _FakeRedisManager(client)
+        client.hset("session:session_gone", "turn_count", 1)
+        mgr.record_session_activity("session_gone", active=True)
+
+        mgr.delete_session("session:session_gone")
+
+        assert client.zcard(session_index.ACTIVITY_KEY) == 0
+        assert client.zcard(session_index.ACTIVE_KEY) == 0
+
+
+class TestListEndpoint:
+    @pytest.fixture
+    def api(self, client, monkeypatch):
+        monkeypatch.setattr(sessions_api, "_session_index_backfilled", False)
+        app = FastAPI()
+        app.include_router(sessions_api.router, prefix="/api/v1/sessions")
+        app.state.redis = _FakeRedisManager(client)
+        return TestClient(app)
+
+    def test_paginates_with_cursor(self, api, client):
+        core = json.dumps({"session_info": {"user_email": "a@b.com", "streaming_mode": "voice"}})
+        _seed(client, 7, start=time.time() - 100, corememory=core)
+
+        first = api.get("/api/v1/sessions", params={"limit": 4}).json()
+        second = api.get(
+            "/api/v1/sessions", params={"limit": 4, "cursor": first["next_cursor"]}
+        ).json()
+
+        assert [s["session_id"] for s in first["sessions"]] == [
+            f"session_{i:06d}" for i in (6, 5, 4, 3)
+        ]
+        assert len(second["sessions"]) == 3 and second["next_cursor"] is None
+        assert first["total_count"] == 7
+        session = first["sessions"][0]
+        assert session["user_email"] == "a@b.com"
+        assert session["turn_count"] == 6
+        assert session["connection_status"] == "active"
+
+    def test_legacy_sessions_are_backfilled_and_read_in_full(self, api, client):
+        history = {"Concierge": [{"role": "user", "content": "hi", "timestamp": time.time()}]}
+        client.hset(
+            "session:session_legacy",
+            mapping={"corememory": "{}", "chat_history": json.dumps(history)},
+        )
+        body = api.get("/api/v1/sessions").json()
+        assert [s["session_id"] for s in body["sessions"]] == ["session_legacy"]
+        assert body["sessions"][0]["turn_count"] == 1
+
+    def test_bad_cursor_is_400(self, api):
+        assert api.get("/api/v1/sessions", params={"cursor": "nope"}).status_code == 400
+
+
+class TestIndexCost:
+    """Redis work per page must not grow with stored sessions (timings: tests/load)."""
+
+    @staticmethod
+    def _page_commands(client, pages: int = 10) -> tuple[int, Counter]:
+        client.round_trips = 0
+        client.commands.clear()
+        cursor = None
+        for _ in range(pages):
+            page = session_index.list_page(client, limit=50, cursor=cursor)
+            cursor = page.next_cursor
+        assert cursor is not None
+        return client.round_trips, client.commands.copy()
+
+    def test_page_cost_is_independent_of_index_size(self):
+        small = _CountingRedis(decode_responses=True)
+        large = _CountingRedis(decode_responses=True)
+        _seed(small, 1_000)
+        _seed(large, 10_000)
+
+        small_trips, small_commands = self._page_commands(small)
+        large_trips, large_commands = self._page_commands(large)
+
+        assert large_trips == small_trips
+        assert large_commands == small_commands
+        # One range read, the page's hashes (plus one to detect more) and the counts
+        assert large_commands["HMGET"] == 10 * 51
+        assert large_commands["ZREVRANGEBYSCORE"] == 10
+        assert not {"SCAN", "KEYS", "HGETALL"} & set(large_commands)
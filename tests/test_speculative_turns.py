@@ -0,0 +1,351 @@
+"""
+Tests for speculative LLM turn start on stable partial transcripts.
+
+Covers:
+- SpeculativeStream buffering, replay and prompt/transcript matching
+- Partial transcripts routed through ThreadBridge to RouteTurnThread
+- Committed speculation streaming the reply during the silence timeout
+- Divergent final transcripts cancelling the speculation
+- No speculative audio and no tool execution before the turn commits
+- RouteTurnSpeculator delegating to the session adapter
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from apps.artagent.backend.voice.speech_cascade.handler import (
+    RouteTurnThread,
+    SpeechSDKThread,
+    ThreadBridge,
+)
+from apps.artagent.backend.voice.speech_cascade.speculation import (
+    SpeculativeStream,
+    normalize_transcript,
+)
+from src.stateful.state_managment import MemoManager
+
+TTFT_S = 0.3
+TOKEN_S = 0.01
+STABLE_MS = 100
+SILENCE_S = 0.6
+
+
+def _text_chunk(text):
+    delta = SimpleNamespace(content=text, tool_calls=None)
+    return SimpleNamespace(choices=[SimpleNamespace(delta=delta)], usage=None)
+
+
+def _tool_chunk(name):
+    function = SimpleNamespace(name=name, arguments="{}")
+    call = SimpleNamespace(index=0, id="call_1", function=function)
+    delta = SimpleNamespace(content=None, tool_calls=[call])
+    return SimpleNamespace(choices=[SimpleNamespace(delta=delta)], usage=None)
+
+
+class _Stream:
+    def __init__(self, chunks, llm):
+        self._chunks = chunks
+        self._llm = llm
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for chunk in self._chunks:
+            await asyncio.sleep(TOKEN_S)
+            self._llm.chunks.append(time.perf_counter())
+            yield chunk
+        self._llm.streamed.set()
+
+    async def close(self):
+        self._llm.closed += 1
+
+
+class _FakeLLM:
+    """Chat completions stand-in with a fixed time-to-first-token."""
+
+    def __init__(self, *, tool_name=None):
+        self.tool_name = tool_name
+        self.requests: list[tuple[float, str]] = []
+        self.chunks: list[float] = []
+        self.streamed = asyncio.Event()
+        self.closed = 0
+
+    async def create(self, **params):
+        last = params["messages"][-1]
+        self.requests.append((time.perf_counter(), last.get("content") or ""))
+        await asyncio.sleep(TTFT_S)
+        if self.tool_name and last["role"] == "user":
+            return _Stream([_tool_chunk(self.tool_name)], self)
+        if last["role"] == "tool":
+            return _Stream([_text_chunk("Your balance is 100 dollars.")], self)
+        return _Stream([_text_chunk("You said "), _text_chunk(f"{last['content']}.")], self)
+
+
+class _GatedStream:
+    """LLM stream that yields a chunk each time the test releases one (``None`` ends it)."""
+
+    def __init__(self, llm):
+        self._llm = llm
+        self.released: asyncio.Queue = asyncio.Queue()
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        while (chunk := await self.released.get()) is not None:
+            yield chunk
+
+    async def close(self):
+        self._llm.closed += 1
+
+
+async def _settle(predicate, limit: int = 100):
+    """Let other tasks run until ``predicate`` holds (no wall-clock wait)."""
+    for _ in range(limit):
+        if predicate():
+            return
+        await asyncio.sleep(0)
+    raise AssertionError("condition not reached")
+
+
+class _FakeRecognizer:
+    push_stream = object()
+
+    def set_partial_result_callback(self, callback):
+        self.on_partial = callback
+
+    def set_final_result_callback(self, callback):
+        self.on_final = callback
+
+    def set_cancel_callback(self, callback):
+        self.on_cancel = callback
+
+    def write_bytes(self, audio):
+        pass
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+
+class _AdapterSpeculator:
+    def __init__(self, adapter):
+        self.adapter = adapter
+
+    async def start(self, cm, transcript):
+        return await self.adapter.speculate(user_text=transcript, memo_manager=cm)
+
+    def cancel(self):
+        self.adapter.cancel_speculation()
+
+
+class _Call:
+    """Recognizer → ThreadBridge → RouteTurnThread → adapter, with a fake LLM."""
+
+    def __init__(self, *, speculative: bool, tool_name=None):
+        from apps.artagent.backend.registries.agentstore.base import ModelConfig, UnifiedAgent
+        from apps.artagent.backend.voice.speech_cascade.orchestrator import (
+            CascadeConfig,
+            CascadeOrchestratorAdapter,
+        )
+
+        agent = UnifiedAgent(
+            name="Concierge",
+            description="test",
+            model=ModelConfig(deployment_id="gpt-4o"),
+            prompt_template="You are a test agent.",
+        )
+        self.tool_calls: list[float] = []
+        self.speculative = speculative
+
+        async def execute_tool(name, args, session_id=None):
+            self.tool_calls.append(time.perf_counter())
+            return {"balance": 100}
+
+        agent.execute_tool = execute_tool
+        if tool_name:
+            tool = {"type": "function", "function": {"name": tool_name, "parameters": {}}}
+            agent.get_tools = MagicMock(return_value=[tool])
+        self.adapter = CascadeOrchestratorAdapter(
+            config=CascadeConfig(start_agent="Concierge", session_id="s1"),
+            agents={"Concierge": agent},
+        )
+        self.llm = _FakeLLM(tool_name=tool_name)
+        self.spoken: list[tuple[float, str]] = []
+        self.cm = MemoManager(session_id="s1")
+        self.recognizer = _FakeRecognizer()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=50)
+        self.bridge = ThreadBridge()
+        self.route_turn_thread = RouteTurnThread(
+            "call-1",
+            queue,
+            self._orchestrate,
+            self.cm,
+            speculator=_AdapterSpeculator(self.adapter) if speculative else None,
+            speculation_stable_ms=STABLE_MS,
+        )
+        self.bridge.set_route_turn_thread(self.route_turn_thread)
+        SpeechSDKThread("call-1", self.recognizer, self.bridge, AsyncMock(), queue)
+
+    async def _on_tts(self, text):
+        self.spoken.append((time.perf_counter(), text))
+
+    async def _orchestrate(self, cm, transcript):
+        return await self.adapter.process_turn(
+            user_text=transcript, memo_manager=cm, on_tts_chunk=self._on_tts
+        )
+
+    async def speak(self, partials: list[str], final: str, *, speculation: bool = True) -> float:
+        """
+        Feed partials from a worker thread, wait out the silence, then finalize.
+
+        With speculation enabled the silence lasts until the speculative reply
+        has streamed, so the final result always arrives after it.
+        """
+        self.bridge.set_main_loop(asyncio.get_running_loop(), "call-1")
+        await self.route_turn_thread.start()
+        with patch("src.aoai.client.get_async_client") as get_client:
+            get_client.return_value.chat.completions.create = self.llm.create
+            for text in partials:
+                await asyncio.to_thread(self.recognizer.on_partial, text, "en-US")
+                await asyncio.sleep(0.05)
+            if self.speculative and speculation:
+                await asyncio.wait_for(self.llm.streamed.wait(), timeout=10)
+            else:
+                await asyncio.sleep(SILENCE_S)
+            final_at = time.perf_counter()
+            await asyncio.to_thread(self.recognizer.on_final, final, "en-US")
+            for _ in range(200):
+                if self.cm.get_history("Concierge")[-1:] and (
+                    self.cm.get_history("Concierge")[-1]["role"] == "assistant"
+                ):
+                    break
+                await asyncio.sleep(0.01)
+        await self.route_turn_thread.stop()
+        return final_at
+
+
+PARTIALS = ["what is", "what is my", "what is my balance"]
+
+
+class TestSpeculativeStream:
+    async def test_replays_buffer_then_follows_live_stream(self):
+        llm = _FakeLLM()
+        live = _GatedStream(llm)
+        params = {"model": "m", "messages": [{"role": "user", "content": "hello there"}]}
+        stream = SpeculativeStream("hello there", params, AsyncMock(return_value=live))
+        live.released.put_nowait(_text_chunk("You said "))
+        await _settle(lambda: stream.buffered == 1)
+        assert not stream.done
+
+        live.released.put_nowait(_text_chunk("hello there."))
+        live.released.put_nowait(None)
+        texts = [chunk.choices[0].delta.content async for chunk in stream]
+        assert "".join(texts) == "You said hello there."
+        await stream.close()
+        assert llm.closed == 1
+
+    async def test_matches_final_transcript_and_prompt(self):
+        history = [{"role": "system", "content": "sys"}]
+        params = {"model": "m", "messages": [*history, {"role": "user", "content": "what is my"}]}
+        stream = SpeculativeStream("what is my", params, AsyncMock(return_value=[]))
+
+        def final(text, **extra):
+            return {**params, **extra, "messages": [*history, {"role": "user", "content": text}]}
+
+        assert stream.matches(final("What is my?"))
+        assert not stream.matches(final("what is my balance"))
+        assert not stream.matches(final("what is my", temperature=0.1))
+        await stream.close()
+
+    def test_normalize_transcript(self):
+        assert normalize_transcript("  What's my   BALANCE? ") == "what's my balance"
+        assert normalize_transcript(None) == ""
+
+
+class TestSpeculativeTurns:
+    async def test_matching_final_commits_speculation_and_hides_ttft(self):
+        baseline = _Call(speculative=False)
+        baseline_final = await baseline.speak(PARTIALS, "What is my balance?")
+        speculative = _Call(speculative=True)
+        speculative_final = await speculative.speak(PARTIALS, "What is my balance?")
+
+        assert speculative.adapter.speculation_stats.committed == 1
+        assert len(speculative.llm.requests) == 1
+        # The request went out and the reply streamed during the silence timeout,
+        # while without speculation the request waits for the final result
+        assert speculative.llm.requests[0][0] < speculative_final
+        assert max(speculative.llm.chunks) < speculative_final
+        assert baseline.llm.requests[0][0] >= baseline_final
+        # Nothing was spoken before the turn was committed
+        assert all(at >= speculative_final for at, _ in speculative.spoken)
+        assert "".join(t for _, t in speculative.spoken) == "You said what is my balance."
+        history = speculative.cm.get_history("Concierge")
+        assert history[-2]["content"] == "What is my balance?"
+
+    async def test_divergent_final_cancels_speculation(self):
+        call = _Call(speculative=True)
+        final_at = await call.speak(PARTIALS, "What is my balance sheet?")
+
+        assert call.adapter.speculation_stats.discarded == 1
+        assert call.adapter.speculation_stats.committed == 0
+        assert [text for _, text in call.llm.requests] == [
+            "what is my balance",
+            "What is my balance sheet?",
+        ]
+        assert call.llm.closed >= 1
+        spoken = "".join(t for _, t in call.spoken)
+        assert spoken == "You said What is my balance sheet?."
+        assert all(at >= final_at for at, _ in call.spoken)
+
+    async def test_changed_partial_restarts_speculation(self):
+        call = _Call(speculative=True)
+        await call.speak(["what is my", "what is my balance"], "What is my balance?")
+        assert call.adapter.speculation_stats.committed == 1
+
+    async def test_tools_only_run_after_commit(self):
+        call = _Call(speculative=True, tool_name="get_balance")
+        final_at = await call.speak(PARTIALS, "What is my balance?")
+
+        assert call.adapter.speculation_stats.committed == 1
+        assert len(call.tool_calls) == 1
+        assert call.tool_calls[0] >= final_at
+        assert "".join(t for _, t in call.spoken) == "Your balance is 100 dollars."
+
+    async def test_suppressed_barge_in_skips_speculation(self):
+        call = _Call(speculative=True)
+        call.bridge.suppress_barge_in()
+        await call.speak(PARTIALS, "What is my balance?", speculation=False)
+        assert call.adapter.speculation_stats.started == 0
+        assert len(call.llm.requests) == 1
+
+
+class TestRouteTurnSpeculator:
+    async def test_delegates_to_session_adapter(self, monkeypatch):
+        from apps.artagent.backend.src.orchestration import unified
+
+        adapter = MagicMock()
+        adapter.current_agent = "Concierge"
+        adapter.speculate = AsyncMock(return_value=True)
+        adapter._windows = {}
+        monkeypatch.setattr(unified, "_adapters", {"s1": adapter})
+        monkeypatch.setattr(unified, "_get_conversation_history", lambda cm, adapter: [])
+        ws = SimpleNamespace(
+            state=SimpleNamespace(call_connection_id="call-1"),
+            app=SimpleNamespace(state=SimpleNamespace()),
+        )
+        cm = MemoManager(session_id="s1")
+
+        speculator = unified.RouteTurnSpeculator(ws, is_acs=True)
+        assert await speculator.start(cm, "what is my balance")
+        context = adapter.speculate.await_args.args[0]
+        assert context.user_text == "what is my balance"
+        assert context.metadata["is_acs"] is True
+
+        speculator.cancel()
+        adapter.cancel_speculation.assert_called_once()
@@ -0,0 +1,263 @@
+"""
+Tests for adaptive span sampling and event rate limiting.
+
+Covers:
+- AdaptiveSampler: per-session rate budget, always-kept turn and error
+  names, keep ratio past the budget, counters flushed to the parent span
+- FilteringSpanProcessor keeping error spans that match noisy patterns
+- Hot paths: recognizer audio-chunk events, VoiceLive event spans,
+  high-frequency trace_acs_operation and TraceContext spans (errors always kept),
+  ACS callback spans
+- Sampling benchmark (span, event and CPU cost per call minute)
+"""
+
+from types import SimpleNamespace
+
+import apps.artagent.backend.api.v1.events as events_pkg
+import httpx
+import pytest
+from apps.artagent.backend.api.v1.endpoints import calls as calls_api
+from apps.artagent.backend.src.utils.tracing import trace_acs_operation
+from apps.artagent.backend.voice.voicelive.handler import VoiceLiveSDKHandler
+from fastapi import FastAPI
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.trace import StatusCode
+from src.speech.speech_recognizer import StreamingSpeechRecognizerFromBytes
+from utils import telemetry_config, trace_context
+from utils.telemetry_config import AdaptiveSampler, FilteringSpanProcessor
+
+from tests.load import telemetry_sampling_benchmark as bench
+
+
+class _Clock:
+    now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return _Clock()
+
+
+@pytest.fixture
+def sampler(clock, monkeypatch):
+    sampler = AdaptiveSampler(rate_per_second=2.0, burst=5, clock=clock)
+    monkeypatch.setattr(telemetry_config, "_span_sampler", sampler)
+    return sampler
+
+
+@pytest.fixture
+def exporter():
+    return InMemorySpanExporter()
+
+
+@pytest.fixture
+def tracer(exporter):
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    return provider.get_tracer(__name__)
+
+
+class TestAdaptiveSampler:
+    def test_rate_budget_per_session_and_name(self, sampler, clock):
+        kept = []
+        for i in range(500):  # 10 s of 20 ms frames
+            clock.now = i * 0.02
+            kept.append(sampler.should_sample("s1", "audio_chunk"))
+
+        assert sum(kept) == 5 + 19  # burst, then 2/s
+        assert all(kept[:5])
+        assert sampler.should_sample("s2", "audio_chunk")
+        assert sampler.should_sample("s1", "other_event")
+
+    def test_turn_level_and_error_names_are_always_kept(self, sampler):
+        names = ["response.done", "voicelive.event.error", "stt_turn", "tts_timeout"]
+        for name in names:
+            assert all(sampler.should_sample("s1", name) for _ in range(50))
+        assert sum(sampler.should_sample("s1", "audio_chunk") for _ in range(50)) == 5
+        assert sampler.should_sample("s1", "audio_chunk", force=True)
+
+    def test_ratio_past_the_budget(self, clock):
+        sampler = AdaptiveSampler(rate_per_second=0.0, burst=1, ratio=1.0, clock=clock)
+        assert all(sampler.should_sample("s1", "frame") for _ in range(20))
+        assert not sampler.should_sample("s1", "frame", ratio=0.0)
+
+    def test_flush_attaches_counts_and_releases_the_session(self, sampler, tracer, exporter):
+        span = tracer.start_span("parent")
+        for _ in range(20):
+            sampler.add_event(span, "s1", "audio_chunk", {"size": 640})
+        sampler.suppress("s1", "response.audio.delta")
+
+        assert sampler.flush(span, "s1") == {"audio_chunk": 15, "response.audio.delta": 1}
+        span.end()
+
+        (finished,) = exporter.get_finished_spans()
+        assert len(finished.events) == 5
+        assert finished.attributes["telemetry.suppressed.audio_chunk"] == 15
+        assert finished.attributes["telemetry.suppressed_total"] == 16
+        assert sampler.flush(span, "s1") == {}
+
+    def test_unflushed_sessions_are_bounded(self, clock):
+        sampler = AdaptiveSampler(max_sessions=3, clock=clock)
+        for session in range(10):
+            sampler.suppress(str(session), "frame")
+
+        assert len(sampler._sessions) == 3
+        assert sampler.suppressed_total == 10
+
+    def test_disabled_sampler_keeps_everything(self, clock):
+        sampler = AdaptiveSampler(enabled=False, clock=clock)
+        assert all(sampler.should_sample("s1", "audio_chunk") for _ in range(100))
+        assert sampler.suppressed_total == 0
+
+
+class TestFilteringSpanProcessor:
+    def test_noisy_spans_are_dropped_unless_they_failed(self, exporter):
+        provider = TracerProvider()
+        provider.add_span_processor(
+            FilteringSpanProcessor(SimpleSpanProcessor(exporter), enable_pii_scrubbing=False)
+        )
+        tracer = provider.get_tracer(__name__)
+
+        with tracer.start_as_current_span("acs.audio_frame"):
+            pass
+        with tracer.start_as_current_span("acs.audio_frame") as span:
+            span.set_status(StatusCode.ERROR)
+
+        (kept,) = exporter.get_finished_spans()
+        assert kept.status.status_code is StatusCode.ERROR
+
+
+class TestHotPaths:
+    def test_recognizer_audio_chunks_are_counted_on_the_session_span(
+        self, sampler, tracer, exporter
+    ):
+        recognizer = StreamingSpeechRecognizerFromBytes.__new__(StreamingSpeechRecognizerFromBytes)
+        recognizer.push_stream = SimpleNamespace(write=lambda chunk: None, close=lambda: None)
+        recognizer.enable_tracing = True
+        recognizer._sampling_key = "stt:test"
+        recognizer._session_span = tracer.start_span("speech_recognition_session")
+
+        for _ in range(100):
+            recognizer.write_bytes(bytes(640))
+        recognizer.close_stream()
+
+        (span,) = exporter.get_finished_spans()
+        assert sum(event.name == "audio_chunk" for event in span.events) == 5
+        assert span.attributes["telemetry.suppressed.audio_chunk"] == 95
+
+    def test_voicelive_event_spans_keep_turn_events(self, sampler, tracer, exporter, monkeypatch):
+        from apps.artagent.backend.voice.voicelive import handler as handler_module
+
+        monkeypatch.setattr(handler_module, "tracer", tracer)
+        stub = SimpleNamespace(session_id="s1", call_connection_id="c1")
+        stub._NOISY_EVENT_TYPES = VoiceLiveSDKHandler._NOISY_EVENT_TYPES
+
+        for _ in range(30):
+            for etype in ("conversation.item.input_audio_transcription.delta", "response.done"):
+                VoiceLiveSDKHandler._observe_event(stub, SimpleNamespace(type=etype))
+        VoiceLiveSDKHandler._observe_event(stub, SimpleNamespace(type="response.audio.delta"))
+
+        names = [span.name for span in exporter.get_finished_spans()]
+        assert names.count("voicelive.event.response.done") == 30
+        assert names.count("voicelive.event.conversation.item.input_audio_transcription.delta") == 5
+        assert "voicelive.event.response.audio.delta" not in names
+
+    def test_high_frequency_operation_spans(self, sampler, tracer, exporter):
+        def message(fail: bool = False):
+            with trace_acs_operation(
+                tracer, None, "media_message", session_id="s1", high_frequency=True
+            ):
+                if fail:
+                    raise ValueError("bad frame")
+
+        for _ in range(10):
+            message()
+        with pytest.raises(ValueError):
+            message(fail=True)
+        spans = exporter.get_finished_spans()
+
+        assert len(spans) == 6
+        assert spans[-1].status.status_code is StatusCode.ERROR
+        assert spans[-1].start_time <= spans[-1].end_time
+        assert spans[-1].attributes["telemetry.sampling.suppressed"] == 5
+
+        sampler._clock.now = 10.0
+        message()
+        message()
+        assert sampler.take_suppressed("s1", "acs_events.media_message") == 0
+        assert len(exporter.get_finished_spans()) == 8
+
+    async def test_acs_callback_spans_are_sampled_per_call(
+        self, sampler, tracer, exporter, monkeypatch
+    ):
+        class _Processor:
+            async def process_payload(self, events_data, app_state):
+                if events_data[0]["type"] == "Broken":
+                    raise RuntimeError("handler failed")
+                return {"processed": 1, "failed": 0}
+
+        monkeypatch.setattr(calls_api, "tracer", tracer)
+        monkeypatch.setattr(events_pkg, "get_call_event_processor", _Processor)
+        monkeypatch.setattr(events_pkg, "register_default_handlers", lambda: None)
+        app = FastAPI()
+        app.include_router(calls_api.router, prefix="/api/v1/calls")
+        app.state.acs_caller = object()
+
+        async def callback(call_id: str, event_type: str = "PlayCompleted") -> int:
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                body = [{"type": event_type, "data": {"callConnectionId": call_id}}]
+                response = await client.post("/api/v1/calls/callbacks", json=body)
+            return response.status_code
+
+        for _ in range(20):
+            assert await callback("call-1") == 200
+        assert await callback("call-1", "Broken") == 500
+        assert await callback("call-2") == 200
+
+        spans = [
+            span
+            for span in exporter.get_finished_spans()
+            if span.name == "acs_events.process_callbacks"
+        ]
+        assert len(spans) == 5 + 1 + 1  # burst for call-1, its failure, call-2
+        assert spans[5].status.status_code is StatusCode.ERROR
+        assert spans[5].attributes["telemetry.sampling.suppressed"] == 15
+
+    def test_trace_context_samples_and_keeps_errors(self, sampler, tracer, exporter, monkeypatch):
+        monkeypatch.setattr(trace_context, "_TRACING_ENABLED", True)
+        monkeypatch.setattr(trace_context, "_HIGH_FREQ_SAMPLING", 0.0)
+        monkeypatch.setattr(trace_context.trace, "get_tracer", lambda name: tracer)
+
+        for _ in range(10):
+            with trace_context.TraceContext("acs.frame", session_id="s1", high_frequency=True):
+                pass
+        with pytest.raises(RuntimeError):
+            with trace_context.TraceContext("acs.frame", session_id="s1", high_frequency=True):
+                raise RuntimeError("decode failed")
+        with trace_context.TraceContext("acs.call_connected", session_id="s1"):
+            pass
+
+        spans = exporter.get_finished_spans()
+        assert [span.name for span in spans] == ["acs.frame"] * 6 + ["acs.call_connected"]
+        assert spans[5].status.status_code is StatusCode.ERROR
+        assert spans[5].attributes["duration_ms"] >= 0
+
+
+class TestBenchmark:
+    def test_sampling_cuts_records_and_keeps_errors_and_turns(self):
+        report = bench.run(minutes=0.5, repeat=1)
+        paths = report["paths"]
+
+        for row in paths.values():
+            assert row["after"]["error_spans"] == row["before"]["error_spans"]
+            assert row["after"]["turn_level_spans"] == row["before"]["turn_level_spans"]
+        assert paths["stt_audio_chunks"]["event_reduction_pct"] > 80
+        assert paths["per_message_handler"]["span_reduction_pct"] > 80
+        assert paths["voicelive_events"]["span_reduction_pct"] > 0
+        assert paths["stt_audio_chunks"]["after"]["suppressed"]["audio_chunk"] > 0
@@ -0,0 +1,224 @@
+"""
+Tests for per-session memoization of cacheable tool results.
+
+Covers:
+- Repeated identical calls served from cache within a session
+- Argument canonicalization and per-session isolation
+- TTL expiry and failed results not being cached
+- In-flight deduplication of concurrent identical calls
+- Invalidation by mutating tools (and not by handoffs)
+- Hit and saved-latency statistics
+"""
+
+import asyncio
+
+import pytest
+from apps.artagent.backend.registries.toolstore import registry
+from apps.artagent.backend.registries.toolstore.result_cache import (
+    ToolResultCache,
+    canonical_arguments,
+    get_tool_result_cache,
+)
+
+
+class _CountingTool:
+    """Stub tool executor that counts invocations."""
+
+    def __init__(self, *, delay: float = 0.0, result=None):
+        self.calls = 0
+        self.delay = delay
+        self.result = result
+
+    async def run(self, args):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.result is not None:
+            return dict(self.result)
+        return {"success": True, "call": self.calls, "args": dict(args)}
+
+
+def _schema(name):
+    return {"name": name, "description": name, "parameters": {"type": "object"}}
+
+
+@pytest.fixture
+def tools():
+    """Register stub tools and remove them afterwards."""
+    registered: dict[str, _CountingTool] = {}
+
+    def add(name, *, cache_ttl=None, is_handoff=False, **kwargs):
+        tool = _CountingTool(**kwargs)
+        registry.register_tool(
+            name,
+            _schema(name),
+            tool.run,
+            cache_ttl=cache_ttl,
+            is_handoff=is_handoff,
+            override=True,
+        )
+        registered[name] = tool
+        return tool
+
+    get_tool_result_cache().clear()
+    yield add
+    for name in registered:
+        registry._TOOL_DEFINITIONS.pop(name, None)
+    get_tool_result_cache().clear()
+
+
+class TestToolResultCache:
+    async def test_repeated_lookup_is_served_from_cache(self, tools):
+        lookup = tools("stub_get_profile", cache_ttl=60)
+
+        first = await registry.execute_tool(
+            "stub_get_profile", {"client_id": "c1"}, session_id="s1"
+        )
+        second = await registry.execute_tool(
+            "stub_get_profile", {"client_id": "c1"}, session_id="s1"
+        )
+
+        assert lookup.calls == 1
+        assert first == second
+        # Callers get their own copy of the cached result
+        second["args"]["client_id"] = "changed"
+        third = await registry.execute_tool(
+            "stub_get_profile", {"client_id": "c1"}, session_id="s1"
+        )
+        assert third["args"]["client_id"] == "c1"
+
+    async def test_cache_is_per_session_and_per_arguments(self, tools):
+        lookup = tools("stub_get_policy", cache_ttl=60)
+
+        await registry.execute_tool("stub_get_policy", {"a": 1, "b": 2}, session_id="s1")
+        await registry.execute_tool("stub_get_policy", {"b": 2, "a": 1}, session_id="s1")
+        await registry.execute_tool("stub_get_policy", {"a": 1, "b": 3}, session_id="s1")
+        await registry.execute_tool("stub_get_policy", {"a": 1, "b": 2}, session_id="s2")
+        await registry.execute_tool("stub_get_policy", {"a": 1, "b": 2})
+
+        assert lookup.calls == 4
+        assert canonical_arguments({"a": 1, "b": 2}) == canonical_arguments({"b": 2, "a": 1})
+
+    async def test_uncacheable_tools_always_run(self, tools):
+        search = tools("stub_search")
+
+        for _ in range(3):
+            await registry.execute_tool("stub_search", {"q": "x"}, session_id="s1")
+
+        assert search.calls == 3
+
+    async def test_failed_results_are_not_cached(self, tools):
+        lookup = tools("stub_get_claim", cache_ttl=60, result={"success": False, "message": "x"})
+
+        await registry.execute_tool("stub_get_claim", {"claim": "1"}, session_id="s1")
+        await registry.execute_tool("stub_get_claim", {"claim": "1"}, session_id="s1")
+
+        assert lookup.calls == 2
+
+    async def test_entries_expire_after_ttl(self):
+        now = [100.0]
+        cache = ToolResultCache(clock=lambda: now[0])
+        tool = _CountingTool()
+
+        await cache.run("s1", "lookup", {}, 10, lambda: tool.run({}))
+        now[0] += 5
+        await cache.run("s1", "lookup", {}, 10, lambda: tool.run({}))
+        now[0] += 10
+        await cache.run("s1", "lookup", {}, 10, lambda: tool.run({}))
+
+        assert tool.calls == 2
+
+    async def test_concurrent_identical_calls_share_one_execution(self, tools):
+        lookup = tools("stub_get_slow", cache_ttl=60, delay=0.05)
+
+        results = await asyncio.gather(
+            *(
+                registry.execute_tool("stub_get_slow", {"client_id": "c1"}, session_id="s1")
+                for _ in range(5)
+            )
+        )
+
+        assert lookup.calls == 1
+        assert all(result == results[0] for result in results)
+        stats = get_tool_result_cache().stats("s1")
+        assert stats.misses == 1
+        assert stats.inflight_joins == 4
+
+    async def test_mutating_tool_invalidates_session_cache(self, tools):
+        lookup = tools("stub_get_account", cache_ttl=60)
+        tools("stub_update_address")
+        tools("stub_handoff", is_handoff=True)
+
+        await registry.execute_tool("stub_get_account", {"id": 1}, session_id="s1")
+        await registry.execute_tool("stub_get_account", {"id": 1}, session_id="s2")
+        await registry.execute_tool("stub_handoff", {}, session_id="s1")
+        await registry.execute_tool("stub_get_account", {"id": 1}, session_id="s1")
+        assert lookup.calls == 2
+
+        await registry.execute_tool("stub_update_address", {"id": 1}, session_id="s1")
+        await registry.execute_tool("stub_get_account", {"id": 1}, session_id="s1")
+        await registry.execute_tool("stub_get_account", {"id": 1}, session_id="s2")
+
+        assert lookup.calls == 3
+        assert get_tool_result_cache().stats("s1").invalidations == 1
+
+    async def test_result_racing_a_write_is_not_cached(self, tools):
+        lookup = tools("stub_get_balance", cache_ttl=60, delay=0.05)
+        tools("stub_transfer_funds")
+
+        await asyncio.gather(
+            registry.execute_tool("stub_get_balance", {}, session_id="s1"),
+            registry.execute_tool("stub_transfer_funds", {}, session_id="s1"),
+        )
+        await registry.execute_tool("stub_get_balance", {}, session_id="s1")
+
+        assert lookup.calls == 2
+
+    async def test_cancelled_owner_lets_waiter_run_the_tool(self):
+        cache = ToolResultCache()
+        tool = _CountingTool(delay=0.05)
+
+        owner = asyncio.create_task(cache.run("s1", "lookup", {}, 60, lambda: tool.run({})))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(cache.run("s1", "lookup", {}, 60, lambda: tool.run({})))
+        await asyncio.sleep(0.01)
+        owner.cancel()
+
+        assert (await waiter)["success"] is True
+        assert tool.calls == 2
+
+    async def test_stats_record_hits_and_saved_latency(self, tools):
+        tools("stub_get_customer", cache_ttl=60, delay=0.02)
+
+        for _ in range(4):
+            await registry.execute_tool("stub_get_customer", {"id": 1}, session_id="s1")
+
+        stats = get_tool_result_cache().stats("s1")
+        assert (stats.hits, stats.misses) == (3, 1)
+        assert stats.hit_rate == pytest.approx(0.75)
+        assert stats.saved_ms >= 3 * 15
+        assert get_tool_result_cache().stats().hits >= 3
+        assert stats.to_dict()["hits"] == 3
+
+    async def test_clear_session_and_session_bound(self):
+        cache = ToolResultCache(max_sessions=2)
+        tool = _CountingTool()
+
+        for session in ("s1", "s2", "s3"):
+            await cache.run(session, "lookup", {}, 60, lambda: tool.run({}))
+        cache.clear_session("s3")
+        for session in ("s1", "s2", "s3"):
+            await cache.run(session, "lookup", {}, 60, lambda: tool.run({}))
+
+        # s1 was evicted by s3, s3 was cleared; only s2 hits
+        assert tool.calls == 5
+
+    async def test_unified_agent_passes_session_id(self, tools):
+        from apps.artagent.backend.registries.agentstore.base import UnifiedAgent
+
+        lookup = tools("stub_get_policy_details", cache_ttl=60)
+        agent = UnifiedAgent(name="PolicyAdvisor", tool_names=["stub_get_policy_details"])
+
+        for _ in range(2):
+            await agent.execute_tool("stub_get_policy_details", {"policy": "P1"}, session_id="s1")
+
+        assert lookup.calls == 1
@@ -0,0 +1,366 @@
+"""
+Tests for the per-turn latency budget profiler.
+
+Covers:
+- Critical-path attribution of the intervals between stage marks
+- Turns starting at the last recognized speech, abandonment on barge-in
+- Over-budget flagging and the aggregate breakdown
+- Session eviction, discard and mark buffer overflow
+- End-to-end cascade turn with fake STT, LLM, tool and TTS services
+  advancing a fake clock (mark overhead: tests/load/turn_profiler_benchmark.py)
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from apps.artagent.backend.voice.shared.turn_profiler import (
+    MARK_CAPACITY,
+    LatencyBudgetProfiler,
+    TurnStage,
+    critical_path,
+    get_turn_profiler,
+)
+from fastapi.websockets import WebSocketState
+
+TTFT_S = 0.12
+TOOL_S = 0.08
+SYNTH_S = 0.1
+
+
+class _FakeClock:
+    """Monotonic clock that only moves when a test or fake service advances it."""
+
+    def __init__(self, start: float = 100.0):
+        self.now = start
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture(autouse=True)
+def _clear_profiler():
+    get_turn_profiler().clear()
+    yield
+    get_turn_profiler().clear()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _FakeClock()
+    # Profiles take the clock when created; the autouse fixture cleared them
+    monkeypatch.setattr(get_turn_profiler(), "clock", clock)
+    return clock
+
+
+class TestCriticalPath:
+    def test_intervals_are_attributed_to_the_stage_that_ended_them(self):
+        marks = [
+            (TurnStage.STT_FINAL, 1.000),
+            (TurnStage.LLM_REQUEST, 1.010),
+            (TurnStage.LLM_FIRST_TOKEN, 1.310),
+            (TurnStage.TOOL_START, 1.320),
+            (TurnStage.TOOL_END, 1.420),
+            (TurnStage.LLM_REQUEST, 1.425),
+            (TurnStage.LLM_FIRST_TOKEN, 1.625),
+            (TurnStage.TTS_REQUEST, 1.700),
+            (TurnStage.TTS_START, 1.705),
+            (TurnStage.TTS_FIRST_AUDIO, 1.905),
+            (TurnStage.AUDIO_OUT, 1.910),
+        ]
+
+        path = [(name, round(ms)) for name, ms in critical_path(marks)]
+
+        assert path == [
+            ("turn_setup", 10),
+            ("llm_ttft", 300),
+            ("llm_stream", 10),
+            ("tool", 100),
+            ("turn_setup", 5),
+            ("llm_ttft", 200),
+            ("llm_stream", 75),
+            ("tts_queue", 5),
+            ("tts_ttfb", 200),
+            ("pacing", 5),
+        ]
+
+    def test_out_of_order_marks_are_sorted_and_repeats_merged(self):
+        marks = [
+            (TurnStage.STT_FINAL, 0.0),
+            (TurnStage.TTS_REQUEST, 0.3),
+            (TurnStage.LLM_FIRST_TOKEN, 0.1),
+            (TurnStage.TOOL_START, 0.2),
+        ]
+
+        assert [name for name, _ in critical_path(marks)] == ["llm_ttft", "llm_stream"]
+
+
+class TestTurnProfile:
+    def test_turn_starts_at_last_recognized_speech(self):
+        clock = _FakeClock()
+        profiler = LatencyBudgetProfiler(budget_ms=10_000, clock=clock)
+        profile = profiler.session("s1")
+
+        profile.speech()
+        clock.advance(0.02)
+        profile.begin(TurnStage.STT_FINAL)
+        profile.mark(TurnStage.LLM_REQUEST)
+        result = profile.mark(TurnStage.AUDIO_OUT)
+
+        assert result.critical_path[0][0] == "stt_finalization"
+        assert result.segments["stt_finalization"] == pytest.approx(20)
+        assert not profile.active
+        assert profile.turns == 1
+
+    def test_typed_input_and_stale_speech_skip_stt_segment(self):
+        profiler = LatencyBudgetProfiler()
+        profile = profiler.session("s1")
+
+        profile.speech()
+        profile.begin(TurnStage.STT_FINAL, from_speech=False)
+        result = profile.mark(TurnStage.AUDIO_OUT)
+        assert "stt_finalization" not in result.segments
+
+        # Speech noted before the previous turn finished does not start the next one
+        profile.speech()
+        profile.begin(TurnStage.STT_FINAL)
+        profile.mark(TurnStage.AUDIO_OUT)
+        profile.begin(TurnStage.STT_FINAL)
+        result = profile.mark(TurnStage.AUDIO_OUT)
+        assert "stt_finalization" not in result.segments
+
+    def test_marks_outside_a_turn_are_ignored(self):
+        profiler = LatencyBudgetProfiler()
+        profile = profiler.session("s1")
+
+        assert profile.mark(TurnStage.TTS_START) is None
+        assert profile.mark(TurnStage.AUDIO_OUT) is None
+        assert profiler.mark(None, TurnStage.AUDIO_OUT) is None
+        assert profiler.breakdown()["turns"] == 0
+
+    def test_barge_in_abandons_the_turn(self):
+        profiler = LatencyBudgetProfiler()
+        profile = profiler.session("s1")
+
+        profile.begin()
+        profile.mark(TurnStage.LLM_REQUEST)
+        profile.abandon()
+        assert profile.mark(TurnStage.AUDIO_OUT) is None
+
+        profile.begin()
+        profile.begin()  # a new final before audio also abandons the open turn
+        profile.mark(TurnStage.AUDIO_OUT)
+
+        summary = profiler.breakdown()
+        assert summary["abandoned"] == 2
+        assert summary["turns"] == 1
+
+    def test_mark_buffer_overflow_keeps_closing_mark(self):
+        profile = LatencyBudgetProfiler().session("s1")
+
+        profile.begin()
+        for _ in range(MARK_CAPACITY + 10):
+            profile.mark(TurnStage.TOOL_START)
+        result = profile.mark(TurnStage.AUDIO_OUT)
+
+        assert profile.dropped == 12
+        assert result.critical_path[-1][0] == "pacing"
+
+
+class TestLatencyBudgetProfiler:
+    def test_over_budget_turns_are_flagged_and_aggregated(self):
+        clock = _FakeClock()
+        profiler = LatencyBudgetProfiler(budget_ms=20, clock=clock)
+        profile = profiler.session("s1")
+
+        for delay in (0.0, 0.03):
+            profile.begin()
+            profile.mark(TurnStage.LLM_REQUEST)
+            clock.advance(delay)
+            profile.mark(TurnStage.LLM_FIRST_TOKEN)
+            result = profile.mark(TurnStage.AUDIO_OUT)
+
+        assert result.over_budget
+        assert result.dominant == "llm_ttft"
+        summary = profiler.breakdown()
+        assert summary["turns"] == 2
+        assert summary["over_budget"] == 1
+        assert summary["recent_over_budget"][0]["dominant"] == "llm_ttft"
+        assert next(iter(summary["segments"])) == "llm_ttft"
+        assert sum(s["share"] for s in summary["segments"].values()) == pytest.approx(1, abs=1e-3)
+        assert sum(s["mean_ms"] for s in summary["segments"].values()) == pytest.approx(
+            summary["time_to_first_audio_ms"]["mean"], abs=0.05
+        )
+
+    def test_sessions_are_evicted_and_discarded(self):
+        profiler = LatencyBudgetProfiler(max_sessions=2)
+
+        first = profiler.session("a")
+        profiler.session("b")
+        profiler.session("c")
+        assert profiler.session("a") is not first
+
+        profile = profiler.session("d")
+        profiler.discard("d")
+        assert profiler.session("d") is not profile
+
+
+class _FakeSynth:
+    is_ready = True
+
+    def __init__(self, clock: _FakeClock):
+        self.clock = clock
+
+    def synthesize_to_pcm(self, **kwargs):
+        self.clock.advance(SYNTH_S)
+        return b"\x00" * 9600
+
+
+class _FakeBrowserSocket:
+    client_state = WebSocketState.CONNECTED
+    application_state = WebSocketState.CONNECTED
+
+    def __init__(self):
+        self.frames: list[dict] = []
+
+    async def send_json(self, payload):
+        self.frames.append(payload)
+
+
+class _FakeRecognizer:
+    push_stream = object()
+
+    def set_partial_result_callback(self, callback):
+        self.on_partial = callback
+
+    def set_final_result_callback(self, callback):
+        self.on_final = callback
+
+    def set_cancel_callback(self, callback):
+        self.on_cancel = callback
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+
+def _chunk(content=None, tool_calls=None):
+    delta = SimpleNamespace(content=content, tool_calls=tool_calls)
+    return SimpleNamespace(choices=[SimpleNamespace(delta=delta)], usage=None)
+
+
+async def _stream(chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+def _fake_create(clock: _FakeClock):
+    async def create(**params):
+        clock.advance(TTFT_S)
+        if params["messages"][-1]["role"] == "user":
+            function = SimpleNamespace(name="get_balance", arguments="{}")
+            call = SimpleNamespace(index=0, id="call_1", function=function)
+            return _stream([_chunk(tool_calls=[call])])
+        return _stream([_chunk("Your balance "), _chunk("is 100 dollars.")])
+
+    return create
+
+
+class TestCascadeTurnBreakdown:
+    """Fake recognizer → route turn → cascade adapter (LLM + tool) → browser TTS."""
+
+    async def test_breakdown_matches_injected_delays(self, clock):
+        from apps.artagent.backend.registries.agentstore.base import ModelConfig, UnifiedAgent
+        from apps.artagent.backend.voice.shared.context import TransportType, VoiceSessionContext
+        from apps.artagent.backend.voice.speech_cascade.handler import (
+            RouteTurnThread,
+            SpeechSDKThread,
+            ThreadBridge,
+        )
+        from apps.artagent.backend.voice.speech_cascade.orchestrator import (
+            CascadeConfig,
+            CascadeOrchestratorAdapter,
+        )
+        from apps.artagent.backend.voice.tts.playback import TTSPlayback
+        from src.stateful.state_managment import MemoManager
+
+        agent = UnifiedAgent(
+            name="Concierge",
+            description="test",
+            model=ModelConfig(deployment_id="gpt-4o"),
+            prompt_template="You are a test agent.",
+        )
+
+        async def execute_tool(name, args, session_id=None):
+            clock.advance(TOOL_S)
+            return {"balance": 100}
+
+        agent.execute_tool = execute_tool
+        tool = {"type": "function", "function": {"name": "get_balance", "parameters": {}}}
+        agent.get_tools = MagicMock(return_value=[tool])
+        adapter = CascadeOrchestratorAdapter(
+            config=CascadeConfig(start_agent="Concierge", session_id="s1"),
+            agents={"Concierge": agent},
+        )
+
+        ws = _FakeBrowserSocket()
+        tts_pool = SimpleNamespace(
+            acquire_for_session=AsyncMock(return_value=(_FakeSynth(clock), "x"))
+        )
+        playback = TTSPlayback(
+            VoiceSessionContext(session_id="s1", transport=TransportType.BROWSER, _websocket=ws),
+            SimpleNamespace(tts_pool=tts_pool),
+        )
+
+        async def on_tts(text):
+            await playback.play_to_browser(text, voice_name="en-US-AvaMultilingualNeural")
+
+        async def orchestrate(cm, transcript):
+            return await adapter.process_turn(
+                user_text=transcript, memo_manager=cm, on_tts_chunk=on_tts
+            )
+
+        profile = get_turn_profiler().session("s1")
+        cm = MemoManager(session_id="s1")
+        recognizer = _FakeRecognizer()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=10)
+        bridge = ThreadBridge()
+        route_turn = RouteTurnThread("call-1", queue, orchestrate, cm, turn_profile=profile)
+        bridge.set_route_turn_thread(route_turn)
+        SpeechSDKThread("call-1", recognizer, bridge, AsyncMock(), queue, turn_profile=profile)
+        bridge.set_main_loop(asyncio.get_running_loop(), "call-1")
+
+        await route_turn.start()
+        with patch("src.aoai.client.get_async_client") as get_client:
+            get_client.return_value.chat.completions.create = _fake_create(clock)
+            await asyncio.to_thread(recognizer.on_partial, "what is my balance", "en-US")
+            clock.advance(0.05)
+            await asyncio.to_thread(recognizer.on_final, "What is my balance?", "en-US")
+            for _ in range(300):
+                if ws.frames and not profile.active:
+                    break
+                await asyncio.sleep(0.01)
+        await route_turn.stop()
+
+        summary = get_turn_profiler().breakdown()
+        segments = {name: data["mean_ms"] for name, data in summary["segments"].items()}
+
+        assert summary["turns"] == 1
+        # Two LLM calls (tool call, then the answer), each with the injected TTFT
+        assert segments["llm_ttft"] == pytest.approx(2 * TTFT_S * 1000)
+        assert segments["tool"] == pytest.approx(TOOL_S * 1000)
+        assert segments["tts_ttfb"] == pytest.approx(SYNTH_S * 1000)
+        assert segments["stt_finalization"] == pytest.approx(50)
+        # Nothing else advanced the clock
+        assert sum(segments.values()) == pytest.approx(
+            2 * TTFT_S * 1000 + TOOL_S * 1000 + SYNTH_S * 1000 + 50
+        )
+        assert sum(segments.values()) == pytest.approx(
+            summary["time_to_first_audio_ms"]["mean"], abs=0.1
+        )
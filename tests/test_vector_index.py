@@ -0,0 +1,160 @@
+"""
+Tests for the local memory-mapped vector index used by knowledge-base retrieval.
+
+Covers:
+- Deterministic offline embeddings
+- Top-k ordering and metadata filters
+- Persistence and incremental refresh across index handles
+- search_knowledge_base integration
+- Memory and filtered search at tens of thousands of chunks
+"""
+
+import numpy as np
+import pytest
+from apps.artagent.backend.registries.toolstore import knowledge_base
+from apps.artagent.backend.registries.toolstore.rag_retrieval import LocalVectorRetriever
+from apps.artagent.backend.registries.toolstore.vector_index import (
+    LocalVectorIndex,
+    hash_embedding,
+)
+
+DOCS = [
+    ("Zero liability for unauthorized transactions reported within 60 days.", "policies"),
+    ("First-time courtesy refund available for most fees.", "policies"),
+    ("Earn 3% cash back on travel and dining.", "products"),
+    ("Call our 24/7 line to lock a lost card and order a replacement.", "faq"),
+]
+
+
+@pytest.fixture
+def small_index():
+    index = LocalVectorIndex(dim=128, initial_capacity=2)
+    index.add(
+        [text for text, _ in DOCS],
+        metadata=[{"collection": coll} for _, coll in DOCS],
+        ids=[f"doc-{i}" for i in range(len(DOCS))],
+    )
+    return index
+
+
+class TestHashEmbedding:
+    def test_deterministic_and_normalized(self):
+        a = hash_embedding("Report a lost card", dim=64)
+        b = hash_embedding("Report a lost card", dim=64)
+        assert np.array_equal(a, b)
+        assert a.dtype == np.float32
+        assert np.isclose(np.linalg.norm(a), 1.0)
+
+    def test_empty_text_is_zero_vector(self):
+        assert not hash_embedding("", dim=32).any()
+
+
+class TestLocalVectorIndex:
+    def test_top_hit_is_most_similar(self, small_index):
+        hits = small_index.search_text("lost card replacement", top_k=2)
+        assert hits[0].record.id == "doc-3"
+        assert hits[0].score >= hits[1].score
+
+    def test_grows_past_initial_capacity(self, small_index):
+        assert len(small_index) == len(DOCS)
+        assert small_index.memory_bytes() >= len(DOCS) * 128 * 4
+
+    def test_metadata_filter(self, small_index):
+        hits = small_index.search_text("card", top_k=10, filters={"collection": "policies"})
+        assert {h.record.metadata["collection"] for h in hits} == {"policies"}
+
+    def test_filter_any_of_and_unknown_value(self, small_index):
+        hits = small_index.search_text(
+            "card", top_k=10, filters={"collection": ["faq", "products"]}
+        )
+        assert {h.record.id for h in hits} == {"doc-2", "doc-3"}
+        assert small_index.search_text("card", filters={"collection": "missing"}) == []
+
+    def test_min_score_and_zero_query(self, small_index):
+        assert small_index.search(np.zeros(128, dtype=np.float32)) == []
+        hits = small_index.search_text("lost card", top_k=10, min_score=0.99)
+        assert hits == []
+
+    def test_rejects_mismatched_embeddings(self, small_index):
+        with pytest.raises(ValueError):
+            small_index.add(["a"], embeddings=np.ones((1, 3), dtype=np.float32))
+
+    def test_persistence_and_incremental_refresh(self, tmp_path):
+        writer = LocalVectorIndex(dim=64, path=tmp_path, initial_capacity=1)
+        writer.add(["alpha beta"], metadata=[{"collection": "general"}])
+
+        reader = LocalVectorIndex.open(tmp_path)
+        assert len(reader) == 1
+
+        writer.add(["gamma delta", "epsilon zeta"], metadata=[{}, {}])
+        assert reader.refresh() == 2
+        assert reader.refresh() == 0
+        assert reader.search_text("epsilon zeta", top_k=1)[0].record.content == "epsilon zeta"
+        assert reader.search_text("alpha", filters={"collection": "general"})[0].row == 0
+
+    def test_open_missing_index_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            LocalVectorIndex.open(tmp_path / "nope")
+
+
+class TestRetrieverIntegration:
+    def test_local_retriever_applies_collection(self, small_index):
+        retriever = LocalVectorRetriever(small_index, collection="faq")
+        results = retriever.search("card", top_k=5)
+        assert len(results) == 1
+        assert "lost card" in results[0].content
+
+    @pytest.mark.asyncio
+    async def test_search_knowledge_base_uses_local_index(self, monkeypatch):
+        monkeypatch.setattr(knowledge_base, "_local_index", None)
+        monkeypatch.setattr(knowledge_base, "_get_retriever", lambda collection: None)
+
+        result = await knowledge_base.search_knowledge_base(
+            {"query": "how do I report a lost card", "collection": "faq"}
+        )
+
+        assert result["success"] is True
+        assert result["source"] == "local_vector"
+        assert result["results"][0]["title"] == "How do I report a lost card?"
+
+    @pytest.mark.asyncio
+    async def test_search_knowledge_base_falls_back_to_mock(self, monkeypatch):
+        monkeypatch.setattr(knowledge_base, "_get_local_index", lambda: None)
+        monkeypatch.setattr(knowledge_base, "_get_retriever", lambda collection: None)
+
+        result = await knowledge_base.search_knowledge_base(
+            {"query": "fraud", "collection": "policies"}
+        )
+
+        assert result["source"] == "mock"
+
+
+class TestVectorIndexScale:
+    """Tens of thousands of chunks stay compact and searchable (timings: tests/load)."""
+
+    N_CHUNKS = 20_000
+    DIM = 256
+
+    def test_memory_and_filtered_search_at_scale(self, tmp_path):
+        rng = np.random.default_rng(7)
+        vectors = rng.standard_normal((self.N_CHUNKS, self.DIM)).astype(np.float32)
+        texts = [f"chunk {i}" for i in range(self.N_CHUNKS)]
+        metadata = [{"collection": f"c{i % 4}"} for i in range(self.N_CHUNKS)]
+
+        index = LocalVectorIndex(dim=self.DIM, path=tmp_path)
+        for offset in range(0, self.N_CHUNKS, 1000):
+            index.add(
+                texts[offset : offset + 1000],
+                metadata=metadata[offset : offset + 1000],
+                embeddings=vectors[offset : offset + 1000],
+            )
+
+        assert len(index) == self.N_CHUNKS
+        assert index.memory_bytes() <= 2 * self.N_CHUNKS * self.DIM * 4
+
+        # A stored vector finds itself first, with and without a filter
+        hits = index.search(vectors[4321], top_k=5)
+        filtered = index.search(vectors[4321], top_k=5, filters={"collection": "c1"})
+        assert len(hits) == len(filtered) == 5
+        assert hits[0].record.content == filtered[0].record.content == "chunk 4321"
+        assert all(hit.record.metadata["collection"] == "c1" for hit in filtered)
@@ -10,6 +10,7 @@ Tests cover:
 - Metrics tracking
 - Lifecycle management (prepare/shutdown)
 - Edge cases and error handling
+- Arrival-driven autoscaling, concurrent fills and idle eviction
 """
 
 import asyncio
@@ -655,3 +656,213 @@ async def test_concurrent_session_acquires():
     assert tiers == {AllocationTier.DEDICATED}
 
     await pool.shutdown()
+
+
+# ---------- Autoscaling ----------
+
+
+def make_slow_factory(delay: float, tracker: dict | None = None):
+    """Factory with realistic creation latency that tracks concurrency."""
+
+    async def factory() -> MockResource:
+        if tracker is not None:
+            tracker["active"] += 1
+            tracker["peak"] = max(tracker["peak"], tracker["active"])
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            if tracker is not None:
+                tracker["active"] -= 1
+        return MockResource("slow")
+
+    return factory
+
+
+@pytest.mark.asyncio
+async def test_fill_runs_concurrently_with_cap():
+    """Test warm pool fill creates resources in parallel up to the cap."""
+    tracker = {"active": 0, "peak": 0}
+    pool = WarmableResourcePool(
+        factory=make_slow_factory(0.05, tracker),
+        name="test-pool",
+        warm_pool_size=6,
+        max_concurrent_warmups=3,
+    )
+
+    start = asyncio.get_running_loop().time()
+    await pool.prepare()
+    elapsed = asyncio.get_running_loop().time() - start
+
+    assert pool._warm_queue.qsize() == 6
+    assert tracker["peak"] == 3
+    assert elapsed < 6 * 0.05  # Faster than serial creation
+
+    await pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_fixed_pool_does_not_autoscale():
+    """Test target stays fixed when max_warm_size is not above the minimum."""
+    pool = WarmableResourcePool(factory=mock_factory, name="test-pool", warm_pool_size=2)
+    await pool.prepare()
+
+    for _ in range(5):
+        await pool.acquire()
+
+    snapshot = pool.snapshot()
+    assert snapshot["autoscaling"] is False
+    assert snapshot["warm_pool_target"] == 2
+    assert snapshot["warm_pool_max"] == 2
+
+    await pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_cold_misses_raise_target_within_bounds():
+    """Test COLD allocations raise the warm target, clamped to max_warm_size."""
+    pool = WarmableResourcePool(
+        factory=mock_factory,
+        name="test-pool",
+        warm_pool_size=1,
+        max_warm_size=4,
+    )
+    await pool.prepare()
+
+    for _ in range(6):
+        await pool.acquire()
+    assert pool._metrics.allocations_cold == 5
+
+    assert pool._adjust_warm_target(allow_scale_down=False) == 4
+    assert pool._metrics.scale_ups == 1
+
+    await pool._fill_warm_pool()
+    assert pool._warm_queue.qsize() == 4
+
+    await pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_target_steps_down_only_on_periodic_tick():
+    """Test the target decreases one step at a time when demand falls."""
+    pool = WarmableResourcePool(
+        factory=mock_factory,
+        name="test-pool",
+        warm_pool_size=1,
+        max_warm_size=5,
+        arrival_window_sec=0.05,
+    )
+    pool._warm_pool_size = 5
+    await asyncio.sleep(0.06)  # Arrival window drains
+
+    assert pool._adjust_warm_target(allow_scale_down=False) == 5
+    assert pool._adjust_warm_target(allow_scale_down=True) == 4
+    assert pool._adjust_warm_target(allow_scale_down=True) == 3
+    assert pool._metrics.scale_downs == 2
+
+
+@pytest.mark.asyncio
+async def test_idle_excess_is_evicted():
+    """Test warm resources above target are evicted once idle long enough."""
+    pool = WarmableResourcePool(
+        factory=mock_factory,
+        name="test-pool",
+        warm_pool_size=1,
+        max_warm_size=4,
+        idle_evict_sec=0.02,
+    )
+    pool._warm_pool_size = 4
+    await pool.prepare()
+    assert pool._warm_queue.qsize() == 4
+
+    pool._warm_pool_size = 1
+    assert pool._evict_idle_excess() == 0  # Not idle long enough yet
+
+    await asyncio.sleep(0.03)
+    assert pool._evict_idle_excess() == 3
+    assert pool._warm_queue.qsize() == 1
+    assert pool._metrics.idle_evictions == 3
+
+    await pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_snapshot_reports_hit_rate_and_latency_percentiles():
+    """Test snapshot exposes hit rate, arrival rate and acquire latency percentiles."""
+    pool = WarmableResourcePool(
+        factory=mock_factory,
+        name="test-pool",
+        warm_pool_size=2,
+        session_awareness=True,
+    )
+    await pool.prepare()
+
+    await pool.acquire_for_session("session-1")  # WARM
+    await pool.acquire_for_session("session-1")  # DEDICATED
+    await pool.acquire()  # WARM
+    await pool.acquire()  # COLD
+
+    snapshot = pool.snapshot()
+    assert snapshot["hit_rate"] == 0.75
+    assert snapshot["arrival_rate_per_sec"] > 0
+    latency = snapshot["acquire_latency_ms"]
+    assert latency["samples"] == 4
+    assert 0 <= latency["p50"] <= latency["p95"] <= latency["p99"]
+    assert snapshot["metrics"]["create_latency_ms"] > 0
+
+    await pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_acquire_for_session_reports_actual_tier():
+    """Test non-dedicated session acquires report the tier that served them."""
+    pool = WarmableResourcePool(
+        factory=mock_factory,
+        name="test-pool",
+        warm_pool_size=1,
+        session_awareness=True,
+    )
+    await pool.prepare()
+
+    _, tier1 = await pool.acquire_for_session("session-1")
+    _, tier2 = await pool.acquire_for_session("session-2")
+
+    assert tier1 == AllocationTier.WARM
+    assert tier2 == AllocationTier.COLD
+
+    await pool.shutdown()
+
+
+async def _replay_bursty_trace(pool: WarmableResourcePool) -> int:
+    """Replay bursts of simultaneous call arrivals; returns COLD allocations."""
+    await pool.prepare()
+    for _ in range(6):
+        # Six calls arrive together, then the line is quiet
+        await asyncio.gather(*[pool.acquire() for _ in range(6)])
+        await asyncio.sleep(0.15)
+    cold = pool._metrics.allocations_cold
+    await pool.shutdown()
+    return cold
+
+
+@pytest.mark.asyncio
+async def test_bursty_trace_fewer_cold_than_fixed_policy():
+    """Test autoscaling absorbs repeated bursts that a fixed warm target cannot."""
+    common = dict(
+        name="test-pool",
+        warm_pool_size=2,
+        enable_background_warmup=True,
+        warmup_interval_sec=0.05,
+        max_concurrent_warmups=4,
+    )
+    fixed = WarmableResourcePool(factory=make_slow_factory(0.02), **common)
+    adaptive = WarmableResourcePool(
+        factory=make_slow_factory(0.02), max_warm_size=8, **common
+    )
+
+    fixed_cold = await _replay_bursty_trace(fixed)
+    adaptive_cold = await _replay_bursty_trace(adaptive)
+
+    # Fixed target of 2 misses 4 of every 6 arrivals; autoscaling only the first burst
+    assert fixed_cold == 6 * 4
+    assert adaptive_cold <= 4 + 2
+    assert adaptive_cold < fixed_cold
@@ -0,0 +1,168 @@
+"""
+JSON Codec
+==========
+
+One JSON encoder/decoder for the hot paths: WebSocket envelopes, Redis
+pub/sub payloads, session state and ACS media frames.
+
+The backend is picked at import time: ``orjson`` when installed (the
+``speedups`` extra), otherwise the stdlib ``json`` module. ``JSON_CODEC=json``
+forces the stdlib backend.
+
+Both backends produce the same output: compact separators, UTF-8 text
+(no ``\\uXXXX`` escaping of non-ASCII), non-string dict keys converted
+to strings, ``Enum`` members encoded as their value and non-finite floats
+as ``null`` (orjson's rules, which the stdlib backend follows). Datetimes,
+dataclasses and numpy values go to ``default`` on both, as with the
+stdlib. Values orjson cannot handle (integers beyond 64 bits, input that
+only the stdlib accepts such as ``NaN``) are retried with the stdlib.
+
+``dumpb`` / ``loads`` work on bytes so Redis payloads skip the
+str <-> bytes round trip. WebSocket text frames still need ``str``, which
+``dumps`` returns.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+from collections.abc import Callable
+from enum import Enum
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+JSONDecodeError = json.JSONDecodeError
+
+_STDLIB_OPTIONS = {"ensure_ascii": False, "separators": (",", ":"), "allow_nan": False}
+_NON_FINITE_ERROR = "Out of range float values are not JSON compliant"
+
+
+def _enum_value(obj: Any) -> Any:
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Object of type {obj.__class__.__name__} is not JSON serializable")
+
+
+# Reused like json.dumps reuses its default encoder (building one per call is slow)
+_stdlib_encoder = json.JSONEncoder(default=_enum_value, **_STDLIB_OPTIONS)
+_ORJSON_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+    if orjson is not None
+    else 0
+)
+
+
+def _finite(obj: Any) -> Any:
+    """Copy of ``obj`` with non-finite floats replaced by ``None``."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite(value) for value in obj]
+    return obj
+
+
+def _stdlib_encode(obj: Any, default: Callable[[Any], Any] | None, sort_keys: bool) -> str:
+    if default is None and not sort_keys:
+        return _stdlib_encoder.encode(obj)
+
+    fallback = _enum_value
+    if default is not None:
+
+        def fallback(value: Any) -> Any:
+            return value.value if isinstance(value, Enum) else default(value)
+
+    return json.dumps(obj, default=fallback, sort_keys=sort_keys, **_STDLIB_OPTIONS)
+
+
+def _stdlib_dumps(obj: Any, default: Callable[[Any], Any] | None, sort_keys: bool) -> str:
+    try:
+        return _stdlib_encode(obj, default, sort_keys)
+    except ValueError as e:
+        if not str(e).startswith(_NON_FINITE_ERROR):
+            raise
+    # Rare: NaN / Infinity written as null, as orjson does
+    finite_default = None if default is None else (lambda value: _finite(default(value)))
+    return _stdlib_encode(_finite(obj), finite_default, sort_keys)
+
+
+def _select_backend() -> str:
+    requested = os.getenv("JSON_CODEC", "auto").lower()
+    if requested == "json" or orjson is None:
+        return "json"
+    return "orjson"
+
+
+BACKEND = _select_backend()
+_use_orjson = BACKEND == "orjson"
+
+
+def use_backend(name: str) -> str:
+    """
+    Switch the backend at runtime (``"orjson"``, ``"json"`` or ``"auto"``).
+
+    Returns:
+        The backend in use afterwards; ``"json"`` when orjson is unavailable.
+    """
+    global BACKEND, _use_orjson
+    BACKEND = "json" if name == "json" or orjson is None else "orjson"
+    _use_orjson = BACKEND == "orjson"
+    return BACKEND
+
+
+def dumpb(
+    obj: Any, *, default: Callable[[Any], Any] | None = None, sort_keys: bool = False
+) -> bytes:
+    """Serialize ``obj`` to UTF-8 JSON bytes."""
+    if _use_orjson:
+        option = _ORJSON_OPTIONS | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        try:
+            return orjson.dumps(obj, default=default, option=option)
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits: let the stdlib decide
+    return _stdlib_dumps(obj, default, sort_keys).encode("utf-8")
+
+
+def dumps(obj: Any, *, default: Callable[[Any], Any] | None = None, sort_keys: bool = False) -> str:
+    """Serialize ``obj`` to a JSON string."""
+    if _use_orjson:
+        option = _ORJSON_OPTIONS | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        try:
+            return orjson.dumps(obj, default=default, option=option).decode("utf-8")
+        except TypeError:
+            pass
+    return _stdlib_dumps(obj, default, sort_keys)
+
+
+def loads(data: str | bytes | bytearray | memoryview) -> Any:
+    """
+    Parse JSON from text or UTF-8 bytes.
+
+    Raises:
+        JSONDecodeError: ``data`` is not valid JSON (a ``ValueError``).
+        TypeError: ``data`` is not text or bytes.
+    """
+    if _use_orjson:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # invalid, or only valid for the stdlib (NaN, huge integers)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+__all__ = [
+    "BACKEND",
+    "JSONDecodeError",
+    "dumpb",
+    "dumps",
+    "loads",
+    "use_backend",
+]
@@ -78,6 +78,22 @@ _PII_PATTERNS: list[tuple[Pattern[str], str, str]] = [
     ),
 ]
 
+# Cheap necessary conditions for each entry in _PII_PATTERNS (same order).
+# Every match of a PII pattern contains a match of its prefilter, and each
+# prefilter starts with a literal or a single character class, which lets the
+# regex engine skip ahead instead of trying optional prefixes at every offset.
+_PII_PREFILTERS: list[Pattern[str]] = [
+    re.compile(r"\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}"),  # phone_number
+    re.compile(r"@[A-Za-z0-9.-]+\.[A-Z|a-z]{2}"),  # email
+    re.compile(r"\d{3}-\d{2}-\d{4}"),  # ssn
+    re.compile(r"\d{4}[-\s]?\d{4}[-\s]?\d{4}"),  # credit_card
+    re.compile(r"\d\.\d{1,3}\.\d{1,3}\.\d"),  # ip_address (v4)
+    re.compile(r":(?:[0-9a-fA-F]{1,4}:){6}"),  # ip_address (v6)
+]
+
+# Every built-in prefilter starts with one of these characters.
+_PII_LEAD_CHARS = re.compile(r"[0-9@:]")
+
 # Attribute names that commonly contain PII and should be scrubbed
 PII_ATTRIBUTE_NAMES = frozenset(
     [
@@ -175,18 +191,24 @@ class PIIScrubber:
     Scrubs PII from strings, dictionaries, and telemetry attributes.
 
     Thread-safe and designed for high-throughput telemetry pipelines.
+
+    Most log lines and transcripts contain no PII, so ``scrub_string`` first
+    rejects text without any character a built-in pattern could start from,
+    then skips each pattern whose cheap prefilter does not match. Patterns
+    that do run are applied in their original order, so output is identical
+    to substituting every pattern in sequence.
     """
 
     def __init__(self, config: PIIScrubberConfig | None = None):
         self.config = config or PIIScrubberConfig.from_env()
         self._active_patterns = self._build_active_patterns()
+        self._prefilters = self._build_prefilters()
+        # Custom patterns can match arbitrary text, so the lead-char check only
+        # applies when every active pattern is built in.
+        self._lead_chars = None if self.config.custom_patterns else _PII_LEAD_CHARS
 
-    def _build_active_patterns(self) -> list[tuple[Pattern[str], str]]:
-        """Build list of active patterns based on configuration."""
-        if not self.config.enabled:
-            return []
-
-        patterns = []
+    def _pattern_enabled(self, pii_type: str) -> bool:
+        """Whether a built-in PII type is enabled by configuration."""
         pattern_flags = {
             "phone_number": self.config.scrub_phone_numbers,
             "email": self.config.scrub_emails,
@@ -194,9 +216,16 @@ class PIIScrubber:
             "credit_card": self.config.scrub_credit_cards,
             "ip_address": self.config.scrub_ip_addresses,
         }
+        return pattern_flags.get(pii_type, True)
+
+    def _build_active_patterns(self) -> list[tuple[Pattern[str], str]]:
+        """Build list of active patterns based on configuration."""
+        if not self.config.enabled:
+            return []
 
+        patterns = []
         for pattern, replacement, pii_type in _PII_PATTERNS:
-            if pattern_flags.get(pii_type, True):
+            if self._pattern_enabled(pii_type):
                 patterns.append((pattern, replacement))
 
         # Add custom patterns
@@ -204,6 +233,19 @@ class PIIScrubber:
 
         return patterns
 
+    def _build_prefilters(self) -> list[Pattern[str] | None]:
+        """Build per-pattern prefilters aligned with ``_active_patterns``."""
+        if not self.config.enabled:
+            return []
+
+        prefilters: list[Pattern[str] | None] = [
+            prefilter
+            for (_, _, pii_type), prefilter in zip(_PII_PATTERNS, _PII_PREFILTERS, strict=True)
+            if self._pattern_enabled(pii_type)
+        ]
+        prefilters.extend(None for _ in self.config.custom_patterns)
+        return prefilters
+
     def scrub_string(self, value: str) -> str:
         """
         Scrub PII from a string value.
@@ -217,8 +259,15 @@ class PIIScrubber:
         if not self.config.enabled or not value:
             return value
 
+        if self._lead_chars is not None and self._lead_chars.search(value) is None:
+            return value
+
         result = value
-        for pattern, replacement in self._active_patterns:
+        for (pattern, replacement), prefilter in zip(
+            self._active_patterns, self._prefilters, strict=True
+        ):
+            if prefilter is not None and prefilter.search(result) is None:
+                continue
             result = pattern.sub(replacement, result)
 
         return result
@@ -13,6 +13,10 @@ Configuration via environment variables:
 - DISABLE_CLOUD_TELEMETRY: Set to "true" to disable all cloud telemetry
 - AZURE_MONITOR_DISABLE_LIVE_METRICS: Disable live metrics stream (auto-disabled for local dev)
 - TELEMETRY_PII_SCRUBBING_ENABLED: Enable PII scrubbing (default: true)
+- TELEMETRY_SAMPLING_ENABLED: Rate-limit high-rate spans and span events (default: true)
+- TELEMETRY_EVENT_RATE_PER_SEC / TELEMETRY_EVENT_BURST: Per-session budget per
+  span or event name (default: 2/s, burst 5)
+- TELEMETRY_EVENT_SAMPLE_RATIO: Keep probability past the budget (default: 0)
 
 See utils/pii_filter.py for PII scrubbing configuration options.
 """
@@ -21,10 +25,14 @@ from __future__ import annotations
 
 import logging
 import os
+import random
 import re
 import socket
+import threading
+import time
 import uuid
 import warnings
+from collections.abc import Callable
 from re import Pattern
 
 # Suppress OpenTelemetry deprecation warnings
@@ -121,6 +129,7 @@ NOISY_SPAN_PATTERNS: list[Pattern[str]] = [
 # ═══════════════════════════════════════════════════════════════════════════════
 
 from opentelemetry.sdk.trace import ReadableSpan, SpanProcessor
+from opentelemetry.trace import StatusCode
 
 
 class FilteringSpanProcessor(SpanProcessor):
@@ -148,10 +157,11 @@ class FilteringSpanProcessor(SpanProcessor):
         self._next.on_start(span, parent_context)
 
     def on_end(self, span: ReadableSpan) -> None:
-        # Filter noisy spans
-        for pattern in NOISY_SPAN_PATTERNS:
-            if pattern.match(span.name):
-                return  # Drop span
+        # Filter noisy spans (error spans are always exported)
+        if span.status.status_code is not StatusCode.ERROR:
+            for pattern in NOISY_SPAN_PATTERNS:
+                if pattern.match(span.name):
+                    return  # Drop span
 
         # PII scrubbing is handled at attribute level during span creation
         # and in the log exporter filter - we pass through here
@@ -164,6 +174,200 @@ class FilteringSpanProcessor(SpanProcessor):
         return self._next.force_flush(timeout_millis)
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# ADAPTIVE SAMPLING FOR HIGH-RATE SPANS AND EVENTS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+# Turn-level and error names are never sampled out
+ALWAYS_SAMPLED_PATTERN: Pattern[str] = re.compile(
+    r"(error|fail|exception|cancel|timeout|turn|\.done$|\.completed$|\.created$)",
+    re.IGNORECASE,
+)
+
+
+class _SessionSampling:
+    """Token buckets and suppressed-event counters for one session."""
+
+    __slots__ = ("buckets", "suppressed")
+
+    def __init__(self) -> None:
+        self.buckets: dict[str, list[float]] = {}
+        self.suppressed: dict[str, int] = {}
+
+
+class AdaptiveSampler:
+    """
+    Per-session rate limiter for high-rate spans and span events.
+
+    Each ``(session, name)`` pair gets a token bucket of ``burst`` records
+    refilled at ``rate_per_second``, so a name firing once per turn is always
+    kept while a per-frame name is cut down to the rate budget. Past the
+    budget a record is kept with probability ``ratio``. Names matching
+    ``ALWAYS_SAMPLED_PATTERN`` (errors, turn boundaries) are always kept.
+
+    Records that are not kept are counted per name; ``flush`` attaches the
+    counts to the parent span as ``telemetry.suppressed.<name>`` attributes.
+    """
+
+    def __init__(
+        self,
+        rate_per_second: float = 2.0,
+        burst: int = 5,
+        ratio: float = 0.0,
+        *,
+        enabled: bool = True,
+        max_sessions: int = 4096,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.rate_per_second = rate_per_second
+        self.burst = float(max(burst, 1))
+        self.ratio = ratio
+        self.enabled = enabled
+        self.max_sessions = max_sessions
+        self.sampled_total = 0
+        self.suppressed_total = 0
+        self._sessions: dict[str, _SessionSampling] = {}
+        self._always: dict[str, bool] = {}
+        self._lock = threading.Lock()
+        self._clock = clock
+
+    @classmethod
+    def from_env(cls) -> AdaptiveSampler:
+        """Build a sampler from the ``TELEMETRY_*`` sampling environment variables."""
+        return cls(
+            rate_per_second=float(os.getenv("TELEMETRY_EVENT_RATE_PER_SEC", "2")),
+            burst=int(os.getenv("TELEMETRY_EVENT_BURST", "5")),
+            ratio=float(os.getenv("TELEMETRY_EVENT_SAMPLE_RATIO", "0")),
+            enabled=os.getenv("TELEMETRY_SAMPLING_ENABLED", "true").lower() == "true",
+        )
+
+    def always_sampled(self, name: str) -> bool:
+        """Return True if ``name`` is a turn-level or error record."""
+        keep = self._always.get(name)
+        if keep is None:
+            keep = self._always[name] = bool(ALWAYS_SAMPLED_PATTERN.search(name))
+        return keep
+
+    def should_sample(
+        self,
+        session_id: str | None,
+        name: str,
+        *,
+        force: bool = False,
+        ratio: float | None = None,
+    ) -> bool:
+        """
+        Decide whether to record ``name`` for ``session_id``.
+
+        Args:
+            session_id: Session the record belongs to (budgets are per session).
+            name: Span or event name; budgets and counters are per name.
+            force: Keep the record regardless of budget.
+            ratio: Keep probability past the budget (defaults to ``self.ratio``).
+
+        Returns:
+            True if the record should be created; otherwise it is counted.
+        """
+        if force or not self.enabled or self.always_sampled(name):
+            self.sampled_total += 1
+            return True
+
+        now = self._clock()
+        with self._lock:
+            state = self._session(session_id or "")
+            bucket = state.buckets.get(name)
+            if bucket is None:
+                bucket = state.buckets[name] = [self.burst, now]
+            else:
+                bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate_per_second)
+                bucket[1] = now
+            keep_ratio = self.ratio if ratio is None else ratio
+            if bucket[0] >= 1.0:
+                bucket[0] -= 1.0
+            elif not (keep_ratio and random.random() < keep_ratio):
+                state.suppressed[name] = state.suppressed.get(name, 0) + 1
+                self.suppressed_total += 1
+                return False
+        self.sampled_total += 1
+        return True
+
+    def suppress(self, session_id: str | None, name: str) -> None:
+        """Count a record that is never created (filtered rather than sampled)."""
+        with self._lock:
+            state = self._session(session_id or "")
+            state.suppressed[name] = state.suppressed.get(name, 0) + 1
+            self.suppressed_total += 1
+
+    def add_event(
+        self,
+        span,
+        session_id: str | None,
+        name: str,
+        attributes: dict | None = None,
+        *,
+        key: str | None = None,
+    ) -> bool:
+        """
+        Add a span event if it is sampled, otherwise count it.
+
+        ``key`` sets the budget and counter name (defaults to ``name``), for
+        events that share a name but differ by type.
+        """
+        if span is None:
+            return False
+        if not self.should_sample(session_id, key or name):
+            return False
+        span.add_event(name, attributes or {})
+        return True
+
+    def take_suppressed(self, session_id: str | None, name: str) -> int:
+        """Return and reset the suppressed count for one name (the weight of a kept span)."""
+        with self._lock:
+            state = self._sessions.get(session_id or "")
+            if state is None:
+                return 0
+            return state.suppressed.pop(name, 0)
+
+    def flush(self, span, session_id: str | None) -> dict[str, int]:
+        """
+        Attach a session's suppressed counts to ``span`` and release its state.
+
+        Call when the parent span (event loop, recognizer session) ends.
+        """
+        with self._lock:
+            state = self._sessions.pop(session_id or "", None)
+        if state is None or not state.suppressed:
+            return {}
+        if span is not None:
+            try:
+                for name, count in state.suppressed.items():
+                    span.set_attribute(f"telemetry.suppressed.{name}", count)
+                span.set_attribute("telemetry.suppressed_total", sum(state.suppressed.values()))
+            except Exception:
+                logger.debug("Could not attach suppressed telemetry counts", exc_info=True)
+        return state.suppressed
+
+    def _session(self, session_id: str) -> _SessionSampling:
+        state = self._sessions.get(session_id)
+        if state is None:
+            if len(self._sessions) >= self.max_sessions:
+                # Sessions that were never flushed: drop the oldest
+                self._sessions.pop(next(iter(self._sessions)))
+            state = self._sessions[session_id] = _SessionSampling()
+        return state
+
+
+_span_sampler: AdaptiveSampler | None = None
+
+
+def get_span_sampler() -> AdaptiveSampler:
+    """Return the process-wide sampler for high-rate spans and events."""
+    global _span_sampler
+    if _span_sampler is None:
+        _span_sampler = AdaptiveSampler.from_env()
+    return _span_sampler
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # UTILITY FUNCTIONS
 # ═══════════════════════════════════════════════════════════════════════════════
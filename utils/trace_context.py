@@ -1,5 +1,4 @@
 import os
-import random
 import time
 
 from opentelemetry import trace
@@ -7,13 +6,15 @@ from opentelemetry.trace import Span, SpanKind
 from opentelemetry.trace.status import Status, StatusCode
 from src.enums.monitoring import SpanAttr
 
+from utils.telemetry_config import get_span_sampler
+
 # Performance optimization: Cache tracing configuration
 _TRACING_ENABLED = os.getenv("ENABLE_TRACING", "false").lower() == "true"
 _ORCHESTRATOR_TRACING = os.getenv("ORCHESTRATOR_TRACING", "true").lower() == "true"
 _GPT_FLOW_TRACING = os.getenv("GPT_FLOW_TRACING", "true").lower() == "true"
 _HIGH_FREQ_SAMPLING = float(
     os.getenv("HIGH_FREQ_SAMPLING", "0.1")
-)  # 10% sampling for high-frequency ops
+)  # 10% sampling for high-frequency ops past the per-session rate budget
 
 
 class TraceContext:
@@ -59,20 +60,38 @@ class TraceContext:
         if not _TRACING_ENABLED:
             return False
 
-        # Apply sampling for high-frequency operations
-        if self.high_frequency and self.sampling_rate < 1.0:
-            return random.random() < self.sampling_rate
+        # High-frequency operations: per-session rate budget, then sampling_rate
+        if self.high_frequency:
+            return get_span_sampler().should_sample(
+                self.session_id or self.call_connection_id, self.name, ratio=self.sampling_rate
+            )
 
         return True
 
     def __enter__(self):
         if not self._should_trace:
+            if self.high_frequency and _TRACING_ENABLED:
+                # Kept so a failing unsampled operation can still report its span
+                self._start_time = time.time()
             return self
 
         self._start_time = time.time()
+        self._start_span()
+        return self
 
+    def _start_span(self, start_time: int | None = None) -> None:
         # Create span with proper kind for Application Insights correlation
-        self._span = self._tracer.start_span(name=self.name, kind=self.span_kind)
+        self._span = self._tracer.start_span(
+            name=self.name, kind=self.span_kind, start_time=start_time
+        )
+        if self.high_frequency:
+            # Operations sampled out since the last kept span (a late error span
+            # was counted as sampled out itself)
+            suppressed = get_span_sampler().take_suppressed(
+                self.session_id or self.call_connection_id, self.name
+            ) - (start_time is not None)
+            if suppressed > 0:
+                self._span.set_attribute("telemetry.sampling.suppressed", suppressed)
 
         # Set essential correlation attributes using the correct format for Application Insights
         if self.call_connection_id:
@@ -94,9 +113,11 @@ class TraceContext:
                 attr_name = f"{component_name}.{k}" if not k.startswith(component_name) else k
                 self._span.set_attribute(attr_name, v)
 
-        return self
-
     def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type and not self._span and self._start_time:
+            # Errors are never sampled out: open the span retroactively
+            self._start_span(start_time=int(self._start_time * 1e9))
+            self._should_trace = True
         if not self._should_trace or not self._span:
             return
 
@@ -219,7 +240,8 @@ def create_trace_context(
         call_connection_id: ACS call connection ID for correlation
         session_id: Session ID for correlation
         metadata: Additional span attributes
-        high_frequency: Whether this is a high-frequency operation (applies sampling)
+        high_frequency: Whether this is a high-frequency operation (rate-limited per
+            session and sampled; errors are always traced)
         span_kind: OpenTelemetry span kind for Application Insights correlation
 
     Returns: